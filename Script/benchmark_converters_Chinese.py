@@ -0,0 +1,582 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: 在生成的语料上对 csv 格式转换脚本进行基准测试，并与基线比较输出
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import contextlib
+import csv
+import hashlib
+import importlib
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    # Windows 上不可用，此时不测量峰值内存
+    resource = None
+
+# 被测试的转换脚本模块，从脚本所在文件夹加载
+UI_CONVERTER = "ui_csv_format_convert_Chinese"
+LYRIC_CONVERTER = "lyric_csv_format_convert_Chinese"
+
+# 测试的转换模式，见 run_mode
+BENCHMARK_MODES = ('ui_single', 'ui_folder', 'ui_jobs', 'ui_languages', 'ui_merge', 'ui_zip', 'ui_incremental',
+                   'lyric_single', 'lyric_folder', 'lyric_jobs', 'lyric_incremental')
+
+# ui_languages 模式写入的语言
+BENCHMARK_LANGUAGES = ['English', 'Chinese (Simplified)', 'Chinese (Traditional)']
+
+# 语料描述文件，用于复用以相同参数生成的语料文件夹
+CORPUS_INFO_FILENAME = "corpus.json"
+
+# generate_corpus 写入的文件夹，重新生成保留的语料时只删除这些文件夹
+CORPUS_FOLDERS = ('ui', 'lyric', 'single')
+
+# 增量运行的清单，记录了文件时间，因此不计入输出摘要
+MANIFEST_FILENAME = ".convert_manifest.jsonl"
+
+UI_FIELDNAMES = ['Key', 'Type', 'Desc', 'Japanese', 'English', 'Chinese (Simplified)', 'Chinese (Traditional)']
+
+# 用于生成字段值的词语，包含需要CSV引号的字符
+JAPANESE_WORDS = ['メイド', 'ご主人様', '夜伽', '衣装', '設定', '保存', 'ロード', '「はい」', '、', '。']
+ENGLISH_WORDS = ['Maid', 'Master', 'Night', 'Costume', 'Settings', 'Save', 'Load', '"Yes"', ',', 'line\nbreak']
+CHINESE_WORDS = ['女仆', '主人', '夜伽', '服装', '设置', '保存', '读取', '“是”', '，', '。']
+LYRIC_WORDS = ['愛', '夢', '星', '空', 'ラ,ラ', '"Love"', '♪', ' ']
+
+def random_text(rng, words, count):
+    """
+    用随机词语生成字段值
+
+    Args:
+        rng (random.Random): 随机数生成器
+        words (list): 可选的词语
+        count (int): 最大词语数
+
+    Returns:
+        str: 字段值
+    """
+
+    return ' '.join(rng.choice(words) for _ in range(rng.randint(1, count)))
+
+def write_corpus_file(output_file, rows, bom=False, lineterminator='\r\n'):
+    """
+    写入生成的CSV文件
+
+    Args:
+        output_file (Path): 输出文件路径
+        rows (iterable): 行列表，如有表头也包含表头行
+        bom (bool): 是否写入 UTF-8 BOM
+        lineterminator (str): 换行符
+
+    Returns:
+        int: 写入的行数
+    """
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    row_count = 0
+    with open(output_file, 'w', encoding='utf-8-sig' if bom else 'utf-8', newline='') as outfile:
+        writer = csv.writer(outfile, lineterminator=lineterminator)
+        for row in rows:
+            writer.writerow(row)
+            row_count += 1
+    return row_count
+
+def generate_ui_rows(rng, file_index, row_count):
+    """
+    生成多语言UI CSV的行
+
+    与真实导出文件一样，约 2% 的行 Key 为空，5% 的行 English 列为空。
+
+    Args:
+        rng (random.Random): 随机数生成器
+        file_index (int): 文件序号，用于生成 Key
+        row_count (int): 数据行数
+
+    Yields:
+        list: 表头行，然后是数据行
+    """
+
+    yield UI_FIELDNAMES
+    for row_index in range(row_count):
+        key = "" if rng.random() < 0.02 else f"Menu/Item_{file_index}_{row_index}"
+        english = "" if rng.random() < 0.05 else random_text(rng, ENGLISH_WORDS, 6)
+        yield [key, 'Text', rng.choice(['', 'desc']), random_text(rng, JAPANESE_WORDS, 6), english,
+               random_text(rng, CHINESE_WORDS, 6), random_text(rng, CHINESE_WORDS, 6)]
+
+def generate_lyric_rows(rng, file_format, row_count, header=True):
+    """
+    生成格式1或格式2的歌词时间轴CSV的行
+
+    约 2% 的行时间无效，会被转换脚本跳过。
+
+    Args:
+        rng (random.Random): 随机数生成器
+        file_format (str): 'format1' 或 'format2'
+        row_count (int): 数据行数
+        header (bool): 是否以表头行开始
+
+    Yields:
+        list: 行
+    """
+
+    if header:
+        yield ['開始時間(秒)', '結束時間(秒)', '歌詞'] if file_format == 'format1' else ['ID', '開始時間', '終了時間', 'ローカライズ用キー名']
+
+    start_time = 0.0
+    for row_index in range(row_count):
+        end_time = start_time + rng.uniform(0.5, 4.0)
+        start_field = "-" if rng.random() < 0.02 else f"{start_time:.2f}"
+        lyric = random_text(rng, LYRIC_WORDS, 8)
+        if file_format == 'format1':
+            yield [start_field, f"{end_time:.2f}", lyric]
+        else:
+            yield [row_index + 1, start_field, f"{end_time:.2f}", lyric]
+        start_time = end_time
+
+def generate_corpus(corpus_path, files=200, rows=200, seed=1):
+    """
+    生成确定性的基准测试语料
+
+    相同的参数总是生成逐字节相同的文件：
+    - ui/<文件夹>/ui_<n>.csv: files 个 rows 行的多语言UI CSV，分布在 10 个子文件夹中，有的带 BOM
+    - lyric/song_<n>/song.csv: files 个 rows 行的歌词CSV，格式1和格式2交替，有的带 BOM 和表头
+    - single/ui.csv 和 single/lyric.csv: 每种各一个 files x rows 行的文件
+
+    Args:
+        corpus_path (Path): 语料文件夹
+        files (int): 每种文件的数量
+        rows (int): 每个文件的行数
+        seed (int): 随机种子
+
+    Returns:
+        dict: 语料描述，同时写入 corpus.json
+    """
+
+    rng = random.Random(seed)
+    ui_rows = 0
+    lyric_rows = 0
+
+    for file_index in range(files):
+        ui_file = corpus_path / 'ui' / f"folder_{file_index % 10}" / f"ui_{file_index:05d}.csv"
+        ui_rows += write_corpus_file(ui_file, generate_ui_rows(rng, file_index, rows), bom=file_index % 2 == 0,
+                                     lineterminator='\r\n' if file_index % 3 else '\n') - 1
+
+        file_format = 'format1' if file_index % 2 == 0 else 'format2'
+        header = file_index % 4 < 2
+        lyric_file = corpus_path / 'lyric' / f"song_{file_index:05d}" / "song.csv"
+        lyric_rows += write_corpus_file(lyric_file, generate_lyric_rows(rng, file_format, rows, header),
+                                        bom=file_index % 3 == 0) - header
+
+    write_corpus_file(corpus_path / 'single' / 'ui.csv', generate_ui_rows(rng, files, files * rows), bom=True)
+    write_corpus_file(corpus_path / 'single' / 'lyric.csv', generate_lyric_rows(rng, 'format2', files * rows), bom=True)
+
+    corpus_info = {
+        'files': files,
+        'rows': rows,
+        'seed': seed,
+        'ui_rows': ui_rows,
+        'lyric_rows': lyric_rows,
+        'single_rows': files * rows
+    }
+    with open(corpus_path / CORPUS_INFO_FILENAME, 'w', encoding='utf-8') as outfile:
+        json.dump(corpus_info, outfile, indent=2)
+    return corpus_info
+
+def hash_output(output_path):
+    """
+    计算一次运行所有输出文件的哈希
+
+    zip 压缩包按条目名称和内容计算哈希，因为压缩包字节中包含写入时间。
+    出于同样的原因，增量清单不计入哈希。
+
+    Args:
+        output_path (Path): 输出文件夹
+
+    Returns:
+        str: SHA-256 十六进制摘要
+    """
+
+    digest = hashlib.sha256()
+
+    def add(name, data):
+        digest.update(f"{name}\0{len(data)}\0".encode('utf-8'))
+        digest.update(data)
+
+    output_files = sorted((path for path in output_path.rglob('*') if path.is_file()),
+                          key=lambda path: path.relative_to(output_path).as_posix())
+    for output_file in output_files:
+        relative_name = output_file.relative_to(output_path).as_posix()
+        if output_file.name == MANIFEST_FILENAME:
+            continue
+        if output_file.suffix == '.zip':
+            with zipfile.ZipFile(output_file) as archive:
+                for info in archive.infolist():
+                    add(f"{relative_name}!{info.filename}", archive.read(info))
+        else:
+            add(relative_name, output_file.read_bytes())
+
+    return digest.hexdigest()
+
+def get_peak_rss_mb():
+    """
+    获取当前进程及其已结束的工作进程的峰值常驻内存
+
+    Returns:
+        float: 峰值常驻内存（MB），resource 模块不可用时为 None
+    """
+
+    if resource is None:
+        return None
+    # ru_maxrss 在 macOS 上以字节为单位，其他系统以 KB 为单位
+    unit = 1 if sys.platform == 'darwin' else 1024
+    peak_rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                   resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return round(peak_rss * unit / (1024 * 1024), 1)
+
+def run_mode(mode, corpus_path, output_path, jobs=2, script_dir=None):
+    """
+    在当前进程中运行一个转换模式并进行测量
+
+    Args:
+        mode (str): BENCHMARK_MODES 中的模式名
+        corpus_path (Path): 语料文件夹
+        output_path (Path): 空的输出文件夹
+        jobs (int): *_jobs 模式的工作进程数
+        script_dir (str): 转换脚本所在文件夹（可选，默认为本脚本所在文件夹）
+
+    Returns:
+        dict: 运行的耗时、峰值内存和输出摘要
+    """
+
+    sys.path.insert(0, str(Path(script_dir or Path(__file__).resolve().parent).resolve()))
+    ui_converter = importlib.import_module(UI_CONVERTER)
+    lyric_converter = importlib.import_module(LYRIC_CONVERTER)
+
+    ui_path = corpus_path / 'ui'
+    lyric_path = corpus_path / 'lyric'
+    runs = {
+        'ui_single': lambda: ui_converter.convert_single_csv(corpus_path / 'single' / 'ui.csv', output_path / 'ui.csv'),
+        'ui_folder': lambda: ui_converter.process_folder(ui_path, output_path),
+        'ui_jobs': lambda: ui_converter.process_folder(ui_path, output_path, jobs=jobs),
+        'ui_languages': lambda: ui_converter.process_folder(ui_path, output_path, languages=BENCHMARK_LANGUAGES),
+        'ui_merge': lambda: ui_converter.process_folder(ui_path, output_path, merge=True),
+        'ui_zip': lambda: ui_converter.process_folder(ui_path, output_path, zip_file=output_path / 'ui.zip'),
+        'ui_incremental': lambda: ui_converter.process_folder(ui_path, output_path, incremental=True),
+        'lyric_single': lambda: lyric_converter.convert_lyric_csv(corpus_path / 'single' / 'lyric.csv',
+                                                                  output_path / 'lyric.csv'),
+        'lyric_folder': lambda: lyric_converter.process_folder(lyric_path, output_path),
+        'lyric_jobs': lambda: lyric_converter.process_folder(lyric_path, output_path, jobs=jobs),
+        'lyric_incremental': lambda: lyric_converter.process_folder(lyric_path, output_path, incremental=True)
+    }
+    run = runs[mode]
+
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        # 增量模式测量的是首次完整运行之后无事可做的一次运行
+        if mode.endswith('_incremental'):
+            run()
+        start_time = time.perf_counter()
+        run()
+        wall_time = time.perf_counter() - start_time
+
+    return {
+        'wall_time': wall_time,
+        'peak_rss_mb': get_peak_rss_mb(),
+        'output_sha256': hash_output(output_path)
+    }
+
+def benchmark_mode(mode, corpus_path, corpus_info, work_path, jobs=2, repeat=3, script_dir=None):
+    """
+    对一个转换模式进行基准测试，每次运行都在新的 Python 进程中进行
+
+    Args:
+        mode (str): BENCHMARK_MODES 中的模式名
+        corpus_path (Path): 语料文件夹
+        corpus_info (dict): 语料描述
+        work_path (Path): 运行输出的文件夹
+        jobs (int): *_jobs 模式的工作进程数
+        repeat (int): 运行次数，报告最快的一次
+        script_dir (str): 转换脚本所在文件夹（可选）
+
+    Returns:
+        dict: 模式结果，运行失败时包含 'error'
+    """
+
+    output_path = work_path / mode
+    runs = []
+    for _ in range(repeat):
+        shutil.rmtree(output_path, ignore_errors=True)
+        output_path.mkdir(parents=True)
+        command = [sys.executable, str(Path(__file__).resolve()), "--run-mode", mode, str(corpus_path),
+                   str(output_path), "--jobs", str(jobs)]
+        if script_dir is not None:
+            command += ["--script-dir", str(script_dir)]
+        process = subprocess.run(command, capture_output=True, text=True, encoding='utf-8')
+        if process.returncode != 0:
+            error_lines = process.stderr.strip().splitlines()
+            return {'error': error_lines[-1] if error_lines else f"exit code {process.returncode}"}
+        runs.append(json.loads(process.stdout.strip().splitlines()[-1]))
+
+    if mode.endswith('_single'):
+        files = 1
+        rows = corpus_info['single_rows']
+    else:
+        files = corpus_info['files']
+        rows = corpus_info['ui_rows'] if mode.startswith('ui_') else corpus_info['lyric_rows']
+
+    wall_time = min(run['wall_time'] for run in runs)
+    peak_rss = [run['peak_rss_mb'] for run in runs if run['peak_rss_mb'] is not None]
+    digests = {run['output_sha256'] for run in runs}
+    return {
+        'wall_time': round(wall_time, 4),
+        'rows_per_sec': round(rows / wall_time, 1),
+        'files_per_sec': round(files / wall_time, 1),
+        'peak_rss_mb': max(peak_rss) if peak_rss else None,
+        'files': files,
+        'rows': rows,
+        'output_sha256': digests.pop() if len(digests) == 1 else None
+    }
+
+def compare_results(results, baseline):
+    """
+    打印每个模式相对基线的速度变化，并检查输出是否未改变
+
+    Args:
+        results (dict): 本次运行的结果
+        baseline (dict): 基线运行的结果
+
+    Returns:
+        bool: 两份结果中都存在的每个模式的输出都逐字节相同时为 True
+    """
+
+    same_corpus = results['corpus'] == baseline.get('corpus')
+    if not same_corpus:
+        print("警告：基线是在不同的语料上测量的，不比较输出")
+
+    outputs_identical = True
+    print()
+    print(f"{'模式':<18}{'基线 (秒)':>12}{'当前 (秒)':>12}{'加速比':>7}  输出")
+    for mode, result in results['modes'].items():
+        baseline_result = baseline.get('modes', {}).get(mode)
+        if baseline_result is None or 'error' in baseline_result or 'error' in result:
+            print(f"{mode:<20}{'-':>14}{'-':>14}{'-':>10}  未比较")
+            continue
+
+        speedup = baseline_result['wall_time'] / result['wall_time']
+        if not same_corpus:
+            output_status = "未比较"
+        elif result['output_sha256'] is not None and result['output_sha256'] == baseline_result['output_sha256']:
+            output_status = "相同"
+        else:
+            output_status = "不同"
+            outputs_identical = False
+        print(f"{mode:<20}{baseline_result['wall_time']:>14.3f}{result['wall_time']:>14.3f}{speedup:>9.2f}x  {output_status}")
+
+    return outputs_identical
+
+def confirm(question):
+    """
+    在控制台询问是或否的问题
+
+    Args:
+        question (str): 问题，不含 [y/N] 后缀
+
+    Returns:
+        bool: 仅当回答为 y 或 yes 时为 True，没有控制台输入时为 False
+    """
+
+    try:
+        answer = input(f"{question} [y/N] ")
+    except EOFError:
+        print()
+        return False
+    return answer.strip().lower() in ('y', 'yes')
+
+def pop_option(args, name, default=None):
+    """
+    从参数列表中移除带值的选项
+
+    同时支持 "--name value" 和 "--name=value"
+
+    Args:
+        args (list): 参数列表，会被原地修改
+        name (str): 选项名
+        default (str): 选项不存在时返回的值
+
+    Returns:
+        str: 选项值，选项没有值时为 None
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """打印命令行用法"""
+
+    print("转换脚本基准测试")
+    print("在生成的语料上运行 csv 格式转换脚本，记录速度和输出")
+    print()
+    print("使用方法:")
+    print("  python script.py <结果文件> [--files N] [--rows N] [--seed N] [--jobs N] [--repeat N]")
+    print("                   [--modes 列表] [--corpus 文件夹] [--baseline 文件] [--script-dir 文件夹]")
+    print()
+    print("示例:")
+    print("  python script.py baseline.json")
+    print("  python script.py results.json --baseline baseline.json")
+    print("  python script.py results.json --files 1000 --rows 500 --modes ui_folder,ui_jobs --jobs 8")
+    print("  python script.py baseline.json --script-dir ../old_checkout/Script")
+    print()
+    print("参数说明:")
+    print("  结果文件: 写入结果的 JSON 文件")
+    print("  --files N: (可选) 每种生成文件的数量（默认为 200）")
+    print("  --rows N: (可选) 每个生成文件的行数（默认为 200）")
+    print("  --seed N: (可选) 语料生成器的随机种子（默认为 1）")
+    print("  --jobs N: (可选) *_jobs 模式的工作进程数（默认为 2）")
+    print("  --repeat N: (可选) 每个模式的运行次数，报告最快的一次（默认为 3）")
+    print(f"  --modes 列表: (可选) 以逗号分隔的要运行的模式（默认为全部: {', '.join(BENCHMARK_MODES)}）")
+    print("  --corpus 文件夹: (可选) 将语料保留在该文件夹中，参数相同时复用，")
+    print(f"                  该文件夹必须是新的、空的，或是带有 {CORPUS_INFO_FILENAME} 的语料")
+    print("  --baseline 文件: (可选) 与之前的结果文件比较，任何输出不同时以退出码 1 退出")
+    print("  --script-dir 文件夹: (可选) 要测试的转换脚本所在文件夹（默认为本脚本所在文件夹）")
+    print()
+    print("注意:")
+    print("  - 以其他参数生成的保留语料只在确认后重新生成，")
+    print("    且只删除其生成的文件夹")
+    print()
+
+def main():
+    """主函数，处理命令行参数"""
+
+    args = sys.argv.copy()
+
+    if "--help" in args or "-h" in args:
+        print_usage()
+        return 0
+
+    # 运行单个模式的子进程，见 benchmark_mode
+    run_mode_name = pop_option(args, "--run-mode")
+    script_dir = pop_option(args, "--script-dir")
+    jobs = pop_option(args, "--jobs", "2")
+    if run_mode_name is not None:
+        result = run_mode(run_mode_name, Path(args[1]), Path(args[2]), jobs=int(jobs), script_dir=script_dir)
+        print(json.dumps(result))
+        return 0
+
+    options = {}
+    for name, default in (("--files", "200"), ("--rows", "200"), ("--seed", "1"), ("--repeat", "3")):
+        value = pop_option(args, name, default)
+        if value is None or not value.isdigit():
+            print(f"错误：{name} 需要一个非负整数")
+            return 2
+        options[name] = int(value)
+    if jobs is None or not jobs.isdigit():
+        print("错误：--jobs 需要一个非负整数")
+        return 2
+    jobs = int(jobs) or os.cpu_count() or 1
+
+    modes = pop_option(args, "--modes", ",".join(BENCHMARK_MODES))
+    modes = [mode.strip() for mode in (modes or "").split(",") if mode.strip()]
+    unknown_modes = [mode for mode in modes if mode not in BENCHMARK_MODES]
+    if not modes or unknown_modes:
+        print(f"错误：--modes 需要以逗号分隔的以下模式列表: {', '.join(BENCHMARK_MODES)}")
+        return 2
+
+    corpus_folder = pop_option(args, "--corpus")
+    baseline_file = pop_option(args, "--baseline")
+    if len(args) < 2:
+        print_usage()
+        return 2
+    results_file = Path(args[1])
+
+    baseline = None
+    if baseline_file is not None:
+        with open(baseline_file, 'r', encoding='utf-8') as infile:
+            baseline = json.load(infile)
+
+    corpus_info = None
+    if corpus_folder is not None:
+        # 复用以相同参数生成的保留语料。从不删除其他文件夹，其他参数的语料只在询问后删除。
+        corpus_path = Path(corpus_folder)
+        corpus_info_file = corpus_path / CORPUS_INFO_FILENAME
+        if corpus_info_file.is_file():
+            with open(corpus_info_file, 'r', encoding='utf-8') as infile:
+                corpus_info = json.load(infile)
+            if [corpus_info.get(key) for key in ('files', 'rows', 'seed')] != \
+                    [options["--files"], options["--rows"], options["--seed"]]:
+                if not confirm(f"语料 {corpus_path} 是以其他参数生成的，是否删除并重新生成？"):
+                    print(f"错误：已保留语料 {corpus_path}，请为 --corpus 使用其他文件夹，或使用相同的 --files、--rows 和 --seed")
+                    return 2
+                for name in CORPUS_FOLDERS:
+                    shutil.rmtree(corpus_path / name, ignore_errors=True)
+                corpus_info_file.unlink()
+                corpus_info = None
+        elif corpus_path.exists() and (not corpus_path.is_dir() or any(corpus_path.iterdir())):
+            print(f"错误：{corpus_path} 不为空且没有 {CORPUS_INFO_FILENAME}，请为 --corpus 使用新的或空的文件夹")
+            return 2
+
+    work_path = Path(tempfile.mkdtemp(prefix="converter_benchmark_"))
+    try:
+        # 生成语料，除非复用保留的语料
+        corpus_path = Path(corpus_folder) if corpus_folder is not None else work_path / 'corpus'
+        if corpus_info is None:
+            print(f"生成语料: {options['--files']} 个文件 x {options['--rows']} 行，种子 {options['--seed']}...")
+            corpus_info = generate_corpus(corpus_path, options["--files"], options["--rows"], options["--seed"])
+        else:
+            print(f"复用语料 {corpus_path}")
+
+        results = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'jobs': jobs,
+            'repeat': options["--repeat"],
+            'corpus': corpus_info,
+            'modes': {}
+        }
+
+        print("-" * 50)
+        for mode in modes:
+            print(f"运行模式: {mode}")
+            result = benchmark_mode(mode, corpus_path, corpus_info, work_path / 'output', jobs=jobs,
+                                    repeat=max(1, options["--repeat"]), script_dir=script_dir)
+            results['modes'][mode] = result
+            if 'error' in result:
+                print(f"  ✗ 失败: {result['error']}")
+            else:
+                peak_rss = f"{result['peak_rss_mb']} MB" if result['peak_rss_mb'] is not None else "不可用"
+                print(f"  ✓ {result['wall_time']:.3f} 秒，{result['rows_per_sec']:,.0f} 行/秒，"
+                      f"{result['files_per_sec']:,.1f} 文件/秒，峰值内存 {peak_rss}")
+    finally:
+        shutil.rmtree(work_path, ignore_errors=True)
+
+    with open(results_file, 'w', encoding='utf-8') as outfile:
+        json.dump(results, outfile, indent=2)
+    print("-" * 50)
+    print(f"结果已写入 {results_file}")
+
+    if baseline is not None and not compare_results(results, baseline):
+        print()
+        print("✗ 输出与基线不同")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
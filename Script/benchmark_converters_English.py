@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Benchmark the csv format converters on a generated corpus and check their output against a baseline
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import contextlib
+import csv
+import hashlib
+import importlib
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, peak memory is not measured there
+    resource = None
+
+# Converter modules benchmarked, loaded from the script folder
+UI_CONVERTER = "ui_csv_format_convert_English"
+LYRIC_CONVERTER = "lyric_csv_format_convert_English"
+
+# Benchmarked converter modes, see run_mode
+BENCHMARK_MODES = ('ui_single', 'ui_folder', 'ui_jobs', 'ui_languages', 'ui_merge', 'ui_zip', 'ui_incremental',
+                   'lyric_single', 'lyric_folder', 'lyric_jobs', 'lyric_incremental')
+
+# Languages written by the ui_languages mode
+BENCHMARK_LANGUAGES = ['English', 'Chinese (Simplified)', 'Chinese (Traditional)']
+
+# Corpus description file, used to reuse a corpus folder generated with the same parameters
+CORPUS_INFO_FILENAME = "corpus.json"
+
+# Folders written by generate_corpus, the only ones deleted to regenerate a kept corpus
+CORPUS_FOLDERS = ('ui', 'lyric', 'single')
+
+# Manifest of incremental runs, left out of the output digest because it records file times
+MANIFEST_FILENAME = ".convert_manifest.jsonl"
+
+UI_FIELDNAMES = ['Key', 'Type', 'Desc', 'Japanese', 'English', 'Chinese (Simplified)', 'Chinese (Traditional)']
+
+# Words used to build field values, with characters that need CSV quoting
+JAPANESE_WORDS = ['メイド', 'ご主人様', '夜伽', '衣装', '設定', '保存', 'ロード', '「はい」', '、', '。']
+ENGLISH_WORDS = ['Maid', 'Master', 'Night', 'Costume', 'Settings', 'Save', 'Load', '"Yes"', ',', 'line\nbreak']
+CHINESE_WORDS = ['女仆', '主人', '夜伽', '服装', '设置', '保存', '读取', '“是”', '，', '。']
+LYRIC_WORDS = ['愛', '夢', '星', '空', 'ラ,ラ', '"Love"', '♪', ' ']
+
+def random_text(rng, words, count):
+    """
+    Build a field value from random words
+
+    Args:
+        rng (random.Random): Random generator
+        words (list): Words to choose from
+        count (int): Maximum number of words
+
+    Returns:
+        str: Field value
+    """
+
+    return ' '.join(rng.choice(words) for _ in range(rng.randint(1, count)))
+
+def write_corpus_file(output_file, rows, bom=False, lineterminator='\r\n'):
+    """
+    Write a generated CSV file
+
+    Args:
+        output_file (Path): Output file path
+        rows (iterable): Row lists, including the header row if any
+        bom (bool): Whether to write a UTF-8 BOM
+        lineterminator (str): Line ending
+
+    Returns:
+        int: Number of rows written
+    """
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    row_count = 0
+    with open(output_file, 'w', encoding='utf-8-sig' if bom else 'utf-8', newline='') as outfile:
+        writer = csv.writer(outfile, lineterminator=lineterminator)
+        for row in rows:
+            writer.writerow(row)
+            row_count += 1
+    return row_count
+
+def generate_ui_rows(rng, file_index, row_count):
+    """
+    Generate rows of a multilingual UI CSV
+
+    About 2% of the rows have an empty Key and 5% an empty English column, like real dumps.
+
+    Args:
+        rng (random.Random): Random generator
+        file_index (int): Index of the file, used in the keys
+        row_count (int): Number of data rows
+
+    Yields:
+        list: Header row, then data rows
+    """
+
+    yield UI_FIELDNAMES
+    for row_index in range(row_count):
+        key = "" if rng.random() < 0.02 else f"Menu/Item_{file_index}_{row_index}"
+        english = "" if rng.random() < 0.05 else random_text(rng, ENGLISH_WORDS, 6)
+        yield [key, 'Text', rng.choice(['', 'desc']), random_text(rng, JAPANESE_WORDS, 6), english,
+               random_text(rng, CHINESE_WORDS, 6), random_text(rng, CHINESE_WORDS, 6)]
+
+def generate_lyric_rows(rng, file_format, row_count, header=True):
+    """
+    Generate rows of a lyric timeline CSV in format1 or format2
+
+    About 2% of the rows have an invalid time and are skipped by the converter.
+
+    Args:
+        rng (random.Random): Random generator
+        file_format (str): 'format1' or 'format2'
+        row_count (int): Number of data rows
+        header (bool): Whether to start with a header row
+
+    Yields:
+        list: Rows
+    """
+
+    if header:
+        yield ['開始時間(秒)', '結束時間(秒)', '歌詞'] if file_format == 'format1' else ['ID', '開始時間', '終了時間', 'ローカライズ用キー名']
+
+    start_time = 0.0
+    for row_index in range(row_count):
+        end_time = start_time + rng.uniform(0.5, 4.0)
+        start_field = "-" if rng.random() < 0.02 else f"{start_time:.2f}"
+        lyric = random_text(rng, LYRIC_WORDS, 8)
+        if file_format == 'format1':
+            yield [start_field, f"{end_time:.2f}", lyric]
+        else:
+            yield [row_index + 1, start_field, f"{end_time:.2f}", lyric]
+        start_time = end_time
+
+def generate_corpus(corpus_path, files=200, rows=200, seed=1):
+    """
+    Generate a deterministic benchmark corpus
+
+    The same parameters always give byte-identical files:
+    - ui/<folder>/ui_<n>.csv: files multilingual UI CSVs of rows rows in 10 subfolders, with and without BOM
+    - lyric/song_<n>/song.csv: files lyric CSVs of rows rows, alternating format1 and format2,
+      with and without BOM and header
+    - single/ui.csv and single/lyric.csv: one file of files x rows rows of each kind
+
+    Args:
+        corpus_path (Path): Corpus folder
+        files (int): Number of files of each kind
+        rows (int): Number of rows per file
+        seed (int): Random seed
+
+    Returns:
+        dict: Corpus description, also written to corpus.json
+    """
+
+    rng = random.Random(seed)
+    ui_rows = 0
+    lyric_rows = 0
+
+    for file_index in range(files):
+        ui_file = corpus_path / 'ui' / f"folder_{file_index % 10}" / f"ui_{file_index:05d}.csv"
+        ui_rows += write_corpus_file(ui_file, generate_ui_rows(rng, file_index, rows), bom=file_index % 2 == 0,
+                                     lineterminator='\r\n' if file_index % 3 else '\n') - 1
+
+        file_format = 'format1' if file_index % 2 == 0 else 'format2'
+        header = file_index % 4 < 2
+        lyric_file = corpus_path / 'lyric' / f"song_{file_index:05d}" / "song.csv"
+        lyric_rows += write_corpus_file(lyric_file, generate_lyric_rows(rng, file_format, rows, header),
+                                        bom=file_index % 3 == 0) - header
+
+    write_corpus_file(corpus_path / 'single' / 'ui.csv', generate_ui_rows(rng, files, files * rows), bom=True)
+    write_corpus_file(corpus_path / 'single' / 'lyric.csv', generate_lyric_rows(rng, 'format2', files * rows), bom=True)
+
+    corpus_info = {
+        'files': files,
+        'rows': rows,
+        'seed': seed,
+        'ui_rows': ui_rows,
+        'lyric_rows': lyric_rows,
+        'single_rows': files * rows
+    }
+    with open(corpus_path / CORPUS_INFO_FILENAME, 'w', encoding='utf-8') as outfile:
+        json.dump(corpus_info, outfile, indent=2)
+    return corpus_info
+
+def hash_output(output_path):
+    """
+    Hash all output files of a run
+
+    Zip archives are hashed by entry names and contents, since the archive bytes contain write times.
+    The incremental manifest is left out for the same reason.
+
+    Args:
+        output_path (Path): Output folder
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+
+    digest = hashlib.sha256()
+
+    def add(name, data):
+        digest.update(f"{name}\0{len(data)}\0".encode('utf-8'))
+        digest.update(data)
+
+    output_files = sorted((path for path in output_path.rglob('*') if path.is_file()),
+                          key=lambda path: path.relative_to(output_path).as_posix())
+    for output_file in output_files:
+        relative_name = output_file.relative_to(output_path).as_posix()
+        if output_file.name == MANIFEST_FILENAME:
+            continue
+        if output_file.suffix == '.zip':
+            with zipfile.ZipFile(output_file) as archive:
+                for info in archive.infolist():
+                    add(f"{relative_name}!{info.filename}", archive.read(info))
+        else:
+            add(relative_name, output_file.read_bytes())
+
+    return digest.hexdigest()
+
+def get_peak_rss_mb():
+    """
+    Get the peak resident memory of this process and its finished worker processes
+
+    Returns:
+        float: Peak resident memory in MB, None where the resource module is not available
+    """
+
+    if resource is None:
+        return None
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    unit = 1 if sys.platform == 'darwin' else 1024
+    peak_rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                   resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return round(peak_rss * unit / (1024 * 1024), 1)
+
+def run_mode(mode, corpus_path, output_path, jobs=2, script_dir=None):
+    """
+    Run one converter mode in this process and measure it
+
+    Args:
+        mode (str): Mode name from BENCHMARK_MODES
+        corpus_path (Path): Corpus folder
+        output_path (Path): Empty output folder
+        jobs (int): Number of worker processes for the *_jobs modes
+        script_dir (str): Folder containing the converter scripts (optional, defaults to this script's folder)
+
+    Returns:
+        dict: Wall time, peak memory and output digest of the run
+    """
+
+    sys.path.insert(0, str(Path(script_dir or Path(__file__).resolve().parent).resolve()))
+    ui_converter = importlib.import_module(UI_CONVERTER)
+    lyric_converter = importlib.import_module(LYRIC_CONVERTER)
+
+    ui_path = corpus_path / 'ui'
+    lyric_path = corpus_path / 'lyric'
+    runs = {
+        'ui_single': lambda: ui_converter.convert_single_csv(corpus_path / 'single' / 'ui.csv', output_path / 'ui.csv'),
+        'ui_folder': lambda: ui_converter.process_folder(ui_path, output_path),
+        'ui_jobs': lambda: ui_converter.process_folder(ui_path, output_path, jobs=jobs),
+        'ui_languages': lambda: ui_converter.process_folder(ui_path, output_path, languages=BENCHMARK_LANGUAGES),
+        'ui_merge': lambda: ui_converter.process_folder(ui_path, output_path, merge=True),
+        'ui_zip': lambda: ui_converter.process_folder(ui_path, output_path, zip_file=output_path / 'ui.zip'),
+        'ui_incremental': lambda: ui_converter.process_folder(ui_path, output_path, incremental=True),
+        'lyric_single': lambda: lyric_converter.convert_lyric_csv(corpus_path / 'single' / 'lyric.csv',
+                                                                  output_path / 'lyric.csv'),
+        'lyric_folder': lambda: lyric_converter.process_folder(lyric_path, output_path),
+        'lyric_jobs': lambda: lyric_converter.process_folder(lyric_path, output_path, jobs=jobs),
+        'lyric_incremental': lambda: lyric_converter.process_folder(lyric_path, output_path, incremental=True)
+    }
+    run = runs[mode]
+
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        # Incremental modes measure a run with nothing to do, after a first full run
+        if mode.endswith('_incremental'):
+            run()
+        start_time = time.perf_counter()
+        run()
+        wall_time = time.perf_counter() - start_time
+
+    return {
+        'wall_time': wall_time,
+        'peak_rss_mb': get_peak_rss_mb(),
+        'output_sha256': hash_output(output_path)
+    }
+
+def benchmark_mode(mode, corpus_path, corpus_info, work_path, jobs=2, repeat=3, script_dir=None):
+    """
+    Benchmark one converter mode, each run in a new Python process
+
+    Args:
+        mode (str): Mode name from BENCHMARK_MODES
+        corpus_path (Path): Corpus folder
+        corpus_info (dict): Corpus description
+        work_path (Path): Folder for run outputs
+        jobs (int): Number of worker processes for the *_jobs modes
+        repeat (int): Number of runs, the fastest is reported
+        script_dir (str): Folder containing the converter scripts (optional)
+
+    Returns:
+        dict: Mode results, with 'error' set if a run failed
+    """
+
+    output_path = work_path / mode
+    runs = []
+    for _ in range(repeat):
+        shutil.rmtree(output_path, ignore_errors=True)
+        output_path.mkdir(parents=True)
+        command = [sys.executable, str(Path(__file__).resolve()), "--run-mode", mode, str(corpus_path),
+                   str(output_path), "--jobs", str(jobs)]
+        if script_dir is not None:
+            command += ["--script-dir", str(script_dir)]
+        process = subprocess.run(command, capture_output=True, text=True, encoding='utf-8')
+        if process.returncode != 0:
+            error_lines = process.stderr.strip().splitlines()
+            return {'error': error_lines[-1] if error_lines else f"exit code {process.returncode}"}
+        runs.append(json.loads(process.stdout.strip().splitlines()[-1]))
+
+    if mode.endswith('_single'):
+        files = 1
+        rows = corpus_info['single_rows']
+    else:
+        files = corpus_info['files']
+        rows = corpus_info['ui_rows'] if mode.startswith('ui_') else corpus_info['lyric_rows']
+
+    wall_time = min(run['wall_time'] for run in runs)
+    peak_rss = [run['peak_rss_mb'] for run in runs if run['peak_rss_mb'] is not None]
+    digests = {run['output_sha256'] for run in runs}
+    return {
+        'wall_time': round(wall_time, 4),
+        'rows_per_sec': round(rows / wall_time, 1),
+        'files_per_sec': round(files / wall_time, 1),
+        'peak_rss_mb': max(peak_rss) if peak_rss else None,
+        'files': files,
+        'rows': rows,
+        'output_sha256': digests.pop() if len(digests) == 1 else None
+    }
+
+def compare_results(results, baseline):
+    """
+    Print the speed change of every mode against a baseline and check the outputs are unchanged
+
+    Args:
+        results (dict): Results of this run
+        baseline (dict): Results of the baseline run
+
+    Returns:
+        bool: True if every mode present in both results produced byte-identical output
+    """
+
+    same_corpus = results['corpus'] == baseline.get('corpus')
+    if not same_corpus:
+        print("Warning: The baseline was measured on a different corpus, outputs are not compared")
+
+    outputs_identical = True
+    print()
+    print(f"{'Mode':<20}{'Baseline (s)':>14}{'Current (s)':>14}{'Speedup':>10}  Output")
+    for mode, result in results['modes'].items():
+        baseline_result = baseline.get('modes', {}).get(mode)
+        if baseline_result is None or 'error' in baseline_result or 'error' in result:
+            print(f"{mode:<20}{'-':>14}{'-':>14}{'-':>10}  not compared")
+            continue
+
+        speedup = baseline_result['wall_time'] / result['wall_time']
+        if not same_corpus:
+            output_status = "not compared"
+        elif result['output_sha256'] is not None and result['output_sha256'] == baseline_result['output_sha256']:
+            output_status = "identical"
+        else:
+            output_status = "DIFFERENT"
+            outputs_identical = False
+        print(f"{mode:<20}{baseline_result['wall_time']:>14.3f}{result['wall_time']:>14.3f}{speedup:>9.2f}x  {output_status}")
+
+    return outputs_identical
+
+def confirm(question):
+    """
+    Ask a yes or no question on the console
+
+    Args:
+        question (str): Question, without the [y/N] suffix
+
+    Returns:
+        bool: True only if the answer is y or yes, False when there is no console input
+    """
+
+    try:
+        answer = input(f"{question} [y/N] ")
+    except EOFError:
+        print()
+        return False
+    return answer.strip().lower() in ('y', 'yes')
+
+def pop_option(args, name, default=None):
+    """
+    Remove an option with a value from the argument list
+
+    Supports both "--name value" and "--name=value"
+
+    Args:
+        args (list): Argument list, modified in place
+        name (str): Option name
+        default (str): Value returned when the option is not present
+
+    Returns:
+        str: Option value, None if the option has no value
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """Print command line usage"""
+
+    print("Converter Benchmark")
+    print("Run the csv format converters on a generated corpus and record their speed and output")
+    print()
+    print("Usage:")
+    print("  python script.py [results_file] [--files N] [--rows N] [--seed N] [--jobs N] [--repeat N]")
+    print("                   [--modes LIST] [--corpus FOLDER] [--baseline FILE] [--script-dir FOLDER]")
+    print()
+    print("Examples:")
+    print("  python script.py baseline.json")
+    print("  python script.py results.json --baseline baseline.json")
+    print("  python script.py results.json --files 1000 --rows 500 --modes ui_folder,ui_jobs --jobs 8")
+    print("  python script.py baseline.json --script-dir ../old_checkout/Script")
+    print()
+    print("Parameters:")
+    print("  results_file: JSON file the results are written to")
+    print("  --files N: (optional) Number of generated files of each kind (defaults to 200)")
+    print("  --rows N: (optional) Number of rows per generated file (defaults to 200)")
+    print("  --seed N: (optional) Random seed of the corpus generator (defaults to 1)")
+    print("  --jobs N: (optional) Number of worker processes for the *_jobs modes (defaults to 2)")
+    print("  --repeat N: (optional) Runs per mode, the fastest is reported (defaults to 3)")
+    print(f"  --modes LIST: (optional) Comma separated modes to run (defaults to all: {', '.join(BENCHMARK_MODES)})")
+    print("  --corpus FOLDER: (optional) Keep the corpus in FOLDER and reuse it when generated with the same parameters,")
+    print(f"                   the folder must be new, empty or hold a corpus with its {CORPUS_INFO_FILENAME}")
+    print("  --baseline FILE: (optional) Compare with an earlier results file, exits with code 1 if any output differs")
+    print("  --script-dir FOLDER: (optional) Folder containing the converter scripts to benchmark (defaults to this folder)")
+    print()
+    print("Notes:")
+    print("  - A kept corpus generated with other parameters is only regenerated after confirmation,")
+    print("    and only its generated folders are deleted")
+    print()
+
+def main():
+    """Main function to handle command line arguments"""
+
+    args = sys.argv.copy()
+
+    if "--help" in args or "-h" in args:
+        print_usage()
+        return 0
+
+    # Child process running a single mode, see benchmark_mode
+    run_mode_name = pop_option(args, "--run-mode")
+    script_dir = pop_option(args, "--script-dir")
+    jobs = pop_option(args, "--jobs", "2")
+    if run_mode_name is not None:
+        result = run_mode(run_mode_name, Path(args[1]), Path(args[2]), jobs=int(jobs), script_dir=script_dir)
+        print(json.dumps(result))
+        return 0
+
+    options = {}
+    for name, default in (("--files", "200"), ("--rows", "200"), ("--seed", "1"), ("--repeat", "3")):
+        value = pop_option(args, name, default)
+        if value is None or not value.isdigit():
+            print(f"Error: {name} requires a non-negative integer")
+            return 2
+        options[name] = int(value)
+    if jobs is None or not jobs.isdigit():
+        print("Error: --jobs requires a non-negative integer")
+        return 2
+    jobs = int(jobs) or os.cpu_count() or 1
+
+    modes = pop_option(args, "--modes", ",".join(BENCHMARK_MODES))
+    modes = [mode.strip() for mode in (modes or "").split(",") if mode.strip()]
+    unknown_modes = [mode for mode in modes if mode not in BENCHMARK_MODES]
+    if not modes or unknown_modes:
+        print(f"Error: --modes requires a comma separated list of: {', '.join(BENCHMARK_MODES)}")
+        return 2
+
+    corpus_folder = pop_option(args, "--corpus")
+    baseline_file = pop_option(args, "--baseline")
+    if len(args) < 2:
+        print_usage()
+        return 2
+    results_file = Path(args[1])
+
+    baseline = None
+    if baseline_file is not None:
+        with open(baseline_file, 'r', encoding='utf-8') as infile:
+            baseline = json.load(infile)
+
+    corpus_info = None
+    if corpus_folder is not None:
+        # A kept corpus is reused when generated with the same parameters. Other folders are never
+        # deleted, and a corpus of other parameters only after asking.
+        corpus_path = Path(corpus_folder)
+        corpus_info_file = corpus_path / CORPUS_INFO_FILENAME
+        if corpus_info_file.is_file():
+            with open(corpus_info_file, 'r', encoding='utf-8') as infile:
+                corpus_info = json.load(infile)
+            if [corpus_info.get(key) for key in ('files', 'rows', 'seed')] != \
+                    [options["--files"], options["--rows"], options["--seed"]]:
+                if not confirm(f"Corpus {corpus_path} was generated with other parameters, delete it and generate it again?"):
+                    print(f"Error: Corpus {corpus_path} was kept, use another folder for --corpus or the same --files, --rows and --seed")
+                    return 2
+                for name in CORPUS_FOLDERS:
+                    shutil.rmtree(corpus_path / name, ignore_errors=True)
+                corpus_info_file.unlink()
+                corpus_info = None
+        elif corpus_path.exists() and (not corpus_path.is_dir() or any(corpus_path.iterdir())):
+            print(f"Error: {corpus_path} is not empty and has no {CORPUS_INFO_FILENAME}, use a new or empty folder for --corpus")
+            return 2
+
+    work_path = Path(tempfile.mkdtemp(prefix="converter_benchmark_"))
+    try:
+        # Generate the corpus unless a kept one is reused
+        corpus_path = Path(corpus_folder) if corpus_folder is not None else work_path / 'corpus'
+        if corpus_info is None:
+            print(f"Generating corpus: {options['--files']} files x {options['--rows']} rows, seed {options['--seed']}...")
+            corpus_info = generate_corpus(corpus_path, options["--files"], options["--rows"], options["--seed"])
+        else:
+            print(f"Reusing corpus {corpus_path}")
+
+        results = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'jobs': jobs,
+            'repeat': options["--repeat"],
+            'corpus': corpus_info,
+            'modes': {}
+        }
+
+        print("-" * 50)
+        for mode in modes:
+            print(f"Running mode: {mode}")
+            result = benchmark_mode(mode, corpus_path, corpus_info, work_path / 'output', jobs=jobs,
+                                    repeat=max(1, options["--repeat"]), script_dir=script_dir)
+            results['modes'][mode] = result
+            if 'error' in result:
+                print(f"  ✗ Failed: {result['error']}")
+            else:
+                peak_rss = f"{result['peak_rss_mb']} MB" if result['peak_rss_mb'] is not None else "n/a"
+                print(f"  ✓ {result['wall_time']:.3f} s, {result['rows_per_sec']:,.0f} rows/s, "
+                      f"{result['files_per_sec']:,.1f} files/s, peak memory {peak_rss}")
+    finally:
+        shutil.rmtree(work_path, ignore_errors=True)
+
+    with open(results_file, 'w', encoding='utf-8') as outfile:
+        json.dump(results, outfile, indent=2)
+    print("-" * 50)
+    print(f"Results written to {results_file}")
+
+    if baseline is not None and not compare_results(results, baseline):
+        print()
+        print("✗ Output differs from the baseline")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,956 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: 将多次会话的未翻译文本和术语导出合并为可直接翻译的 .txt 和 .csv 文件
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import csv
+import heapq
+import io
+import json
+import mmap
+import re
+import struct
+import sys
+import tempfile
+import time
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+# dotnet_regex_to_python 改写的 .NET 正则分组：命名分组、平衡分组和内联选项
+DOTNET_GROUP = re.compile(r"\(\?(?:<(?![=!])([^>]*)>|'([^']*)'|([imnsx-]+)([:)]))")
+
+# StringTool.NormalizeText 修剪的空白字符
+WHITESPACE_CHARS = ('\t\n\v\f\r \u0085\u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008'
+                    '\u2009\u200a\u200b\u2028\u2029\u3000\ufeff')
+
+# 文件头：魔数、版本、类型、标志、源文件数、条目数、正则规则数、
+# 字符串池字节数、文件头之后全部内容的 CRC-32
+HEADER = struct.Struct('<8sIIIIIIII')
+
+# 键表和正则规则表的条目：键（或模式）在字符串池中的字节偏移和长度，
+# 然后是译文（或模板）的字节偏移和长度
+ENTRY = struct.Struct('<IIII')
+
+# 字符串池的编码，即 .NET 字符串的编码，插件无需解码即可用序数比较二分查找键表
+POOL_ENCODING = 'utf-16-le'
+
+KIND_SUFFIXES = ('.txt', '.csv')
+
+# UTF-8 BOM，只在文件开头被跳过
+BYTE_ORDER_MARK = '\ufeff'
+
+# TxtTranslationFileProcessor 会从译文中移除此字符，见 XUAT RedirectedResourceDetectionStrategy
+MONGOLIAN_VOWEL_SEPARATOR = '\u180e'
+
+# StreamReader.ReadLine 的换行符
+LINE_BREAK = re.compile(r'\r\n|\r|\n')
+
+# StringExtensions.Unescape 支持的转义序列，其他序列保持原样
+ESCAPES = {
+    '0': '\0',
+    'a': '\a',
+    'b': '\b',
+    't': '\t',
+    'n': '\n',
+    'v': '\v',
+    'f': '\f',
+    'r': '\r',
+    "'": "'",
+    '"': '"',
+    '\\': '\\'
+}
+
+# 索引文件的起始字节
+INDEX_MAGIC = b'JATINDEX'
+
+# 格式版本，布局每次发生不兼容的变化时递增
+INDEX_VERSION = 1
+
+# 索引类型、其替代的加载器，以及该加载器读取的文件后缀
+INDEX_KINDS = ('Text', 'UI')
+
+# TextTranslateManger 和 UITranslateManager 写入的导出文件后缀，_normalized 文本导出
+# 重复了 _untranslate.txt 导出中的文本，因此不读取
+TEXT_DUMP_SUFFIX = '_untranslate.txt'
+TERM_DUMP_SUFFIX = '_untranslate_term.csv'
+
+# 导出文件名开头的会话时间，由 DateTime.Now.ToString("yyyy-MM-dd-HH-mm") 写入
+SESSION_TIME = re.compile(r'^(\d{4}-\d{2}-\d{2}-\d{2}-\d{2})_')
+SESSION_TIME_FORMAT = '%Y-%m-%d-%H-%M'
+
+# .txt 行原文中需要转义的字符，由 StringExtensions.Unescape 还原
+TXT_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\r': '\\r', '\n': '\\n'})
+
+# 输出文件名
+TEXT_OUTPUT_NAME = 'untranslated.txt'
+TERM_OUTPUT_NAME = 'untranslated_term.csv'
+TERM_OUTPUT_FIELDNAMES = ('Term', 'Original', 'Translation', 'FirstSeen', 'Sessions')
+
+# 排序段写入磁盘之前内存中缓存记录的默认内存预算，单位 MB
+DEFAULT_MEMORY_MB = 256
+
+# 每条缓存记录除字符串外的估计字节数：字典槽、列表和整数
+RECORD_OVERHEAD = 200
+
+# 一次合并的排序段数，更多的排序段分多轮合并，以免超出打开文件数限制
+MERGE_FAN_IN = 64
+
+def dotnet_regex_to_python(pattern):
+    """
+    将 .NET 特有的正则语法改写为 Python re 语法，以便编译检查
+
+    只保留语法：\\p{L} 等 Unicode 类别变为 \\w，平衡分组变为非捕获分组，内联选项被删除。
+
+    Args:
+        pattern (str): .NET 正则
+
+    Returns:
+        str: Python 正则
+    """
+
+    result = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\' and index + 1 < len(pattern):
+            escape = pattern[index + 1]
+            close = -1
+            if escape in 'pP' and pattern.startswith('{', index + 2):
+                close = pattern.find('}', index + 3)
+                replacement = '\\w' if escape == 'p' else '\\W'
+            elif escape == 'c' and index + 2 < len(pattern):
+                close = index + 2
+                replacement = '\\x00'
+            elif escape == 'k' and pattern[index + 2:index + 3] in ('<', "'"):
+                close = pattern.find('>' if pattern[index + 2] == '<' else "'", index + 3)
+                name = pattern[index + 3:close]
+                replacement = f'\\{name}' if name.isdigit() else f'(?P={name})'
+            if close > 0:
+                result.append(replacement)
+                index = close + 1
+                continue
+            result.append({'z': '\\Z', 'G': '', 'e': '\\x1b'}.get(escape, pattern[index:index + 2]))
+            index += 2
+            continue
+
+        match = DOTNET_GROUP.match(pattern, index) if char == '(' else None
+        if match is None:
+            result.append(char)
+            index += 1
+            continue
+        name = match.group(1) if match.group(1) is not None else match.group(2)
+        if name is not None:
+            result.append(f'(?P<{name}>' if name.isidentifier() else '(?:')
+        elif match.group(4) == ':':
+            result.append('(?:')
+        index = match.end()
+    return ''.join(result)
+
+def normalize_text(text):
+    """
+    与插件中的 StringTool.NormalizeText 相同的方式规范化文本
+
+    Args:
+        text (str): 文本
+
+    Returns:
+        str: 去除 \\r、\\n 和 \\t，修剪空白并转为大写的文本
+    """
+
+    return text.replace('\r', '').replace('\n', '').replace('\t', '').strip(WHITESPACE_CHARS).upper()
+
+def read_entry(index, table_offset, position):
+    """
+    读取键表或正则规则表中的一个条目
+
+    Args:
+        index (dict): open_index 返回的索引
+        table_offset (int): 表的字节偏移
+        position (int): 条目在表中的序号
+
+    Returns:
+        tuple: (键或模式, 译文或模板)
+    """
+
+    index_map = index['map']
+    pool_offset = index['pool_offset']
+    key_offset, key_length, value_offset, value_length = ENTRY.unpack_from(index_map, table_offset + position * ENTRY.size)
+    key_start = pool_offset + key_offset
+    value_start = pool_offset + value_offset
+    return (index_map[key_start:key_start + key_length].decode(POOL_ENCODING, 'surrogatepass'),
+            index_map[value_start:value_start + value_length].decode(POOL_ENCODING, 'surrogatepass'))
+
+def iter_translations(index):
+    """
+    按键的顺序产出索引中的翻译
+
+    Args:
+        index (dict): open_index 返回的索引
+
+    Yields:
+        tuple: (键, 译文)
+    """
+
+    for position in range(index['entry_count']):
+        yield read_entry(index, HEADER.size, position)
+
+def is_member_path_unsafe(member_name):
+    """
+    与插件中的 FileTool.IsZipPathUnsafe 相同的方式检查压缩包成员名
+
+    拒绝空名称、上级目录引用以及绝对路径或带根路径。
+
+    Args:
+        member_name (str): 压缩包中的成员名
+
+    Returns:
+        bool: 成员不可使用时为 True
+    """
+
+    if not member_name:
+        return True
+
+    # 统一路径分隔符
+    normalized_path = member_name.replace('\\', '/')
+
+    # 拒绝 "../"
+    if '../' in normalized_path:
+        return True
+
+    # 拒绝绝对路径，包括 Windows 盘符路径
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def ordinal_key(text):
+    """
+    与 .NET StringComparer.Ordinal 一致的排序键，按 UTF-16 码元比较
+
+    Args:
+        text (str): 要排序的文本
+
+    Returns:
+        bytes: 文本的 UTF-16 大端编码
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def unescape(text, unknown_escapes=None):
+    """
+    与插件中的 StringExtensions.Unescape 相同的方式替换转义序列
+
+    未知序列连同反斜杠保持原样，文本末尾的反斜杠也保留。
+
+    Args:
+        text (str): 含转义序列的文本
+        unknown_escapes (list): 可选，接收未知序列，例如 "\\x"
+
+    Returns:
+        str: 反转义后的文本
+    """
+
+    index = text.find('\\')
+    if index < 0:
+        return text
+
+    parts = []
+    start = 0
+    while 0 <= index < len(text) - 1:
+        parts.append(text[start:index])
+        char = text[index + 1]
+        escaped = ESCAPES.get(char)
+        if escaped is None:
+            parts.append('\\' + char)
+            if unknown_escapes is not None:
+                unknown_escapes.append('\\' + char)
+        else:
+            parts.append(escaped)
+        start = index + 2
+        index = text.find('\\', start)
+    parts.append(text[start:])
+    return ''.join(parts)
+
+def add_translation_lines(data, source, translations, rules):
+    """
+    与 TxtTranslationFileProcessor 相同的方式解析 .txt 翻译文件的行
+
+    Args:
+        data (bytes): 文件内容
+        source (str): 报告中显示的文件名
+        translations (dict): 精确翻译，会被原地修改
+        rules (list): 正则规则，会被原地修改
+    """
+
+    text = data.decode('utf-8', 'replace')
+    if text.startswith(BYTE_ORDER_MARK):
+        text = text[1:]
+
+    for line_number, line in enumerate(LINE_BREAK.split(text), 1):
+        if not line or line[0] == ';':
+            continue
+        original, tab, translation = line.partition('\t')
+        if not tab:
+            continue
+        original = unescape(original)
+        translation = unescape(translation).replace(MONGOLIAN_VOWEL_SEPARATOR, '')
+        if not original or not translation:
+            continue
+        if line[0] == '$':
+            rules.append({'source': f"{source}:{line_number}", 'pattern': original[1:], 'template': translation})
+        else:
+            translations[original] = translation
+
+def loader_order_key(relative_path):
+    """
+    插件加载翻译文件顺序的排序键
+
+    插件先加载翻译文件夹根目录中的文件，再加载各子文件夹中的文件，
+    文件夹和文件都按序数路径排序 (FileTool.GetAllTranslationFiles)。
+
+    Args:
+        relative_path (Path): 相对于翻译文件夹的文件路径
+
+    Returns:
+        tuple: 排序键
+    """
+
+    folder = relative_path.parent.parts
+    return len(folder) > 0, ordinal_key('\\'.join(folder)), ordinal_key(relative_path.name)
+
+def find_source_files(input_path, suffix):
+    """
+    按插件的加载顺序查找文件夹中的翻译文件
+
+    Args:
+        input_path (Path): 翻译文件夹，或单个翻译文件或 .zip 文件
+        suffix (str): 翻译文件后缀
+
+    Returns:
+        list: (文件路径, 报告中显示的名称) 元组
+    """
+
+    if input_path.is_file():
+        return [(input_path, input_path.name)]
+    files = [file for file in input_path.rglob('*')
+             if file.is_file() and file.name.lower().endswith((suffix, '.zip'))]
+    files.sort(key=lambda file: loader_order_key(file.relative_to(input_path)))
+    return [(file, file.relative_to(input_path).as_posix()) for file in files]
+
+def iter_csv_lines(text):
+    """
+    逐行产出 CSV 文本，跳过 CsvHelper 忽略的注释行（AllowComments）
+
+    以 # 开头的行只有在引号字段之外才是注释，引号数量可以判断之前的行是否留下了未闭合的字段。
+
+    Args:
+        text (str): CSV 文本
+
+    Yields:
+        str: 带换行符的行
+    """
+
+    in_quotes = False
+    for line in io.StringIO(text, newline=''):
+        if not in_quotes and line.startswith('#'):
+            continue
+        if line.count('"') % 2:
+            in_quotes = not in_quotes
+        yield line
+
+def add_csv_rows(data, translations):
+    """
+    与 CsvTranslationFileProcessor 相同的方式解析 .csv 翻译文件
+
+    表头去除首尾空白后不区分大小写匹配，空行和只含空白的记录会被跳过，
+    没有 Term 或 Translation 的行会被忽略。
+
+    Args:
+        data (bytes): 文件内容
+        translations (dict): 翻译，会被原地修改
+    """
+
+    columns = None
+    for row in csv.reader(iter_csv_lines(data.decode('utf-8-sig', 'replace'))):
+        if all(not field or field.isspace() for field in row):
+            continue
+        if columns is None:
+            columns = {name.strip().lower(): index for index, name in reversed(list(enumerate(row)))}
+            continue
+        term_index = columns.get('term')
+        translation_index = columns.get('translation')
+        term = row[term_index] if term_index is not None and term_index < len(row) else None
+        translation = row[translation_index] if translation_index is not None and translation_index < len(row) else None
+        if term and translation:
+            translations[term] = translation
+
+def load_sources(input_path, kind, zip_in_order=False):
+    """
+    按 AsyncTranslationLoader 的方式加载翻译文件夹
+
+    后加载的文件会替换之前文件的翻译。.txt 文件的每个 $ 行都是一条独立的正则规则，
+    插件以 Regex 实例为键，因此相同的模式也都会保留。
+
+    Args:
+        input_path (Path): 翻译文件夹，或单个翻译文件或 .zip 文件
+        kind (int): 加载器在 INDEX_KINDS 中的序号
+        zip_in_order (bool): 按名称排序加载 zip 成员，而不是按存储顺序
+
+    Returns:
+        tuple: (翻译, (模式, 模板) 规则列表, 文件数)
+    """
+
+    suffix = KIND_SUFFIXES[kind]
+    translations = {}
+    rules = []
+
+    def add_file(data, name):
+        if suffix == '.csv':
+            add_csv_rows(data, translations)
+            return
+        file_rules = []
+        add_translation_lines(data, name, translations, file_rules)
+        rules.extend((rule['pattern'], rule['template']) for rule in file_rules)
+
+    files = find_source_files(input_path, suffix)
+    for file_path, name in files:
+        try:
+            if not file_path.name.lower().endswith('.zip'):
+                add_file(file_path.read_bytes(), name)
+                continue
+            with zipfile.ZipFile(file_path) as archive:
+                members = [info for info in archive.infolist()
+                           if not info.is_dir() and info.filename.lower().endswith(suffix)
+                           and not is_member_path_unsafe(info.filename)]
+                if zip_in_order:
+                    members.sort(key=lambda info: ordinal_key(info.filename))
+                for info in members:
+                    try:
+                        add_file(archive.read(info), f"{name}/{info.filename}")
+                    except (OSError, zipfile.BadZipFile, csv.Error) as e:
+                        print(f"✗ 读取 {name}/{info.filename} 时发生错误: {e}")
+        except (OSError, zipfile.BadZipFile, csv.Error) as e:
+            print(f"✗ 读取 {name} 时发生错误: {e}")
+    return translations, rules, len(files)
+
+def open_index(index_file):
+    """
+    内存映射索引文件并检查文件头
+
+    Args:
+        index_file (Path): 索引文件
+
+    Returns:
+        dict: 文件头字段、各表偏移，以及使用后需要关闭的 'map'
+
+    Raises:
+        ValueError: 文件不是受支持版本的索引
+    """
+
+    with open(index_file, 'rb') as file:
+        index_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(index_map) < HEADER.size:
+            raise ValueError("文件比索引文件头还短")
+        magic, version, kind, flags, file_count, entry_count, rule_count, pool_size, checksum = \
+            HEADER.unpack_from(index_map, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError("不是翻译索引文件")
+        if version != INDEX_VERSION:
+            raise ValueError(f"不支持索引版本 {version}，需要版本 {INDEX_VERSION}")
+        if kind >= len(INDEX_KINDS):
+            raise ValueError(f"未知的索引类型 {kind}")
+        pool_offset = HEADER.size + (entry_count + rule_count) * ENTRY.size
+        if pool_offset + pool_size != len(index_map):
+            raise ValueError("文件大小与文件头不符，索引已被截断或损坏")
+    except ValueError:
+        index_map.close()
+        raise
+
+    return {
+        'map': index_map,
+        'kind': kind,
+        'flags': flags,
+        'file_count': file_count,
+        'entry_count': entry_count,
+        'rule_count': rule_count,
+        'checksum': checksum,
+        'rules_offset': HEADER.size + entry_count * ENTRY.size,
+        'pool_offset': pool_offset
+    }
+
+def read_rules(index):
+    """
+    读取索引中的正则规则
+
+    Args:
+        index (dict): open_index 返回的索引
+
+    Returns:
+        list: 按加载顺序排列的 (模式, 模板) 规则
+    """
+
+    return [read_entry(index, index['rules_offset'], position) for position in range(index['rule_count'])]
+
+def session_time(dump_file):
+    """
+    从导出文件名获取会话时间，或使用文件修改时间
+
+    Args:
+        dump_file (Path): 导出文件
+
+    Returns:
+        str: yyyy-MM-dd-HH-mm 格式的时间，按字符串排序即为时间顺序
+    """
+
+    match = SESSION_TIME.match(dump_file.name)
+    if match:
+        return match.group(1)
+    return datetime.fromtimestamp(dump_file.stat().st_mtime).strftime(SESSION_TIME_FORMAT)
+
+def find_dumps(dump_path, suffix):
+    """
+    查找某一类导出文件
+
+    Args:
+        dump_path (Path): 递归搜索的文件夹，或单个导出文件
+        suffix (str): TEXT_DUMP_SUFFIX 或 TERM_DUMP_SUFFIX
+
+    Returns:
+        list: 按路径排序的导出文件
+    """
+
+    if dump_path.is_file():
+        return [dump_path] if dump_path.name.endswith(suffix) else []
+    return sorted(file for file in dump_path.rglob('*') if file.is_file() and file.name.endswith(suffix))
+
+def iter_text_records(dump_files):
+    """
+    读取未翻译文本导出，每行一条文本
+
+    Args:
+        dump_files (list): *_untranslate.txt 文件
+
+    Yields:
+        list: [文本, 会话时间, 1, None] 记录
+    """
+
+    for dump_file in dump_files:
+        seen = session_time(dump_file)
+        with open(dump_file, 'r', encoding='utf-8-sig', errors='replace') as infile:
+            for line in infile:
+                text = line.rstrip('\n')
+                if text:
+                    yield [text, seen, 1, None]
+
+def iter_term_records(dump_files):
+    """
+    读取未翻译术语导出，由 CsvWriter 写入，表头为 Term,Original,Translation
+
+    Args:
+        dump_files (list): *_untranslate_term.csv 文件
+
+    Yields:
+        list: [术语, 会话时间, 1, 原文] 记录
+    """
+
+    for dump_file in dump_files:
+        seen = session_time(dump_file)
+        with open(dump_file, 'r', encoding='utf-8-sig', errors='replace', newline='') as infile:
+            columns = None
+            for row in csv.reader(infile):
+                if all(not field or field.isspace() for field in row):
+                    continue
+                if columns is None:
+                    columns = {name.strip().lower(): index for index, name in reversed(list(enumerate(row)))}
+                    continue
+                term_index = columns.get('term')
+                original_index = columns.get('original')
+                term = row[term_index] if term_index is not None and term_index < len(row) else ''
+                original = row[original_index] if original_index is not None and original_index < len(row) else ''
+                if term and not term.isspace():
+                    yield [term, seen, 1, original]
+
+def combine_records(record, other):
+    """
+    合并同一文本的两条记录，保留首次出现的会话及其原文
+
+    Args:
+        record (list): 记录，会被原地修改
+        other (list): 同一文本的另一条记录
+    """
+
+    if other[1] < record[1]:
+        record[1] = other[1]
+        record[3] = other[3]
+    record[2] += other[2]
+
+def write_run(records, temp_dir, run_number):
+    """
+    将已排序的记录写入排序段文件，每行一个 JSON 数组
+
+    Args:
+        records (iterable): 已排序的记录
+        temp_dir (Path): 排序段文件所在文件夹
+        run_number (int): 文件名中使用的编号
+
+    Returns:
+        Path: 排序段文件
+    """
+
+    run_file = temp_dir / f"run_{run_number:06d}.jsonl"
+    with open(run_file, 'w', encoding='utf-8', newline='\n') as outfile:
+        for record in records:
+            outfile.write(json.dumps(record, ensure_ascii=False))
+            outfile.write('\n')
+    return run_file
+
+def read_run(run_file):
+    """
+    读取排序段文件中的记录
+
+    Args:
+        run_file (Path): 排序段文件
+
+    Yields:
+        list: 记录
+    """
+
+    with open(run_file, 'r', encoding='utf-8', newline='\n') as infile:
+        for line in infile:
+            yield json.loads(line)
+
+def merge_sorted(iterables, key, combine):
+    """
+    合并已排序的记录流，需要时合并相邻的同一文本记录
+
+    Args:
+        iterables (list): 按键排序的记录流
+        key (callable): 记录的排序键
+        combine (bool): 是否用 combine_records 合并同一文本的记录
+
+    Yields:
+        list: 记录
+    """
+
+    merged = heapq.merge(*iterables, key=key)
+    if not combine:
+        yield from merged
+        return
+    current = None
+    for record in merged:
+        if current is not None and record[0] == current[0]:
+            combine_records(current, record)
+            continue
+        if current is not None:
+            yield current
+        current = record
+    if current is not None:
+        yield current
+
+def external_sort(records, key, memory_budget, temp_dir, combine=False, stats=None):
+    """
+    对可能无法全部放入内存的记录排序
+
+    记录在估计大小达到内存预算之前缓存在内存中，然后写入一个已排序的排序段。
+    排序段每轮最多合并 MERGE_FAN_IN 个文件。输入在预算之内时不写入磁盘。
+
+    Args:
+        records (iterable): [文本, 首次出现时间, 次数, 原文] 记录
+        key (callable): 记录的排序键
+        memory_budget (int): 内存中缓存记录的字节数
+        temp_dir (Path): 排序段文件所在文件夹
+        combine (bool): 是否合并同一文本的记录，排序键必须让它们相邻
+        stats (dict): 接收 'records' 和 'runs' 计数（可选）
+
+    Yields:
+        list: 按键排序的记录
+    """
+
+    buffer = {} if combine else []
+    buffer_size = 0
+    runs = []
+    record_count = 0
+
+    for record in records:
+        record_count += 1
+        if combine:
+            existing = buffer.get(record[0])
+            if existing is not None:
+                combine_records(existing, record)
+                continue
+            buffer[record[0]] = record
+        else:
+            buffer.append(record)
+        buffer_size += RECORD_OVERHEAD + sys.getsizeof(record[0]) + (sys.getsizeof(record[3]) if record[3] else 0)
+        if buffer_size >= memory_budget:
+            values = buffer.values() if combine else buffer
+            runs.append(write_run(sorted(values, key=key), temp_dir, len(runs)))
+            buffer = {} if combine else []
+            buffer_size = 0
+
+    values = sorted(buffer.values() if combine else buffer, key=key)
+    del buffer
+    if runs:
+        runs.append(write_run(values, temp_dir, len(runs)))
+        values = None
+    if stats is not None:
+        stats['records'] = record_count
+        stats['runs'] = len(runs)
+    if not runs:
+        yield from values
+        return
+
+    # 每一轮合并相邻的排序段，键相同的记录保持输入顺序
+    run_number = len(runs)
+    while len(runs) > MERGE_FAN_IN:
+        merged_runs = []
+        for start in range(0, len(runs), MERGE_FAN_IN):
+            group = runs[start:start + MERGE_FAN_IN]
+            if len(group) == 1:
+                merged_runs.append(group[0])
+                continue
+            merged_runs.append(write_run(merge_sorted([read_run(run) for run in group], key, combine),
+                                         temp_dir, run_number))
+            run_number += 1
+            for run in group:
+                run.unlink()
+        runs = merged_runs
+
+    yield from merge_sorted([read_run(run) for run in runs], key, combine)
+    for run in runs:
+        run.unlink()
+
+def load_tree(tree_path, kind, zip_in_order):
+    """
+    加载翻译文件夹或由 translation_index 构建的索引中的翻译
+
+    Args:
+        tree_path (Path): 翻译文件夹、翻译文件或 .zip 文件，或 .jatidx 索引
+        kind (int): 0 表示 Text 加载器，1 表示 UI 加载器
+        zip_in_order (bool): 按名称排序加载 zip 成员
+
+    Returns:
+        tuple: (翻译, (模式, 模板) 正则规则列表)
+    """
+
+    if tree_path.is_file() and tree_path.name.lower().endswith('.jatidx'):
+        index = open_index(tree_path)
+        try:
+            return dict(iter_translations(index)), read_rules(index)
+        finally:
+            index['map'].close()
+    translations, rules, _ = load_sources(tree_path, kind, zip_in_order)
+    return translations, rules
+
+def is_text_translated(text, translations, regexes):
+    """
+    检查插件是否有某个文本的翻译，与 TextTranslateManger.IsInTranslateDict 相同
+
+    Args:
+        text (str): 文本
+        translations (dict): 精确翻译
+        regexes (list): 已编译的正则规则
+
+    Returns:
+        bool: 文本已有翻译时为 True
+    """
+
+    if text in translations:
+        return True
+    normalized = normalize_text(text)
+    if normalized in translations:
+        return True
+    for regex in regexes:
+        match = regex.search(text)
+        if match and match.end() > match.start():
+            return True
+        if normalized != text and normalized:
+            match = regex.search(normalized)
+            if match and match.end() > match.start():
+                return True
+    return False
+
+def pop_option(args, name, default=None):
+    """
+    从参数列表中移除带值的选项
+
+    支持 "--name value" 和 "--name=value" 两种写法
+
+    Args:
+        args (list): 参数列表，会被原地修改
+        name (str): 选项名
+        default (str): 选项不存在时返回的值
+
+    Returns:
+        str: 选项值，选项没有值时为 None
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """打印命令行用法"""
+
+    print("未翻译导出合并工具")
+    print("在固定内存预算内，将多次会话的 _untranslate 导出合并为可直接翻译的文件")
+    print()
+    print("用法:")
+    print("  python script.py <导出文件夹> <输出文件夹> [--text <文本翻译>] [--ui <UI 翻译>]")
+    print("                   [--memory MB] [--temp <folder>] [--zip-in-order]")
+    print()
+    print("示例:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Dump ./ToTranslate")
+    print("  python script.py ./Dump ./ToTranslate --text ./Chinese/Text --ui ./Chinese/UI --memory 64")
+    print("  python script.py ./Dump ./ToTranslate --text ./Text.jatidx")
+    print()
+    print("参数说明:")
+    print("  导出文件夹: 递归查找 *_untranslate.txt 和 *_untranslate_term.csv 导出文件的文件夹")
+    print("  输出文件夹: 写入 untranslated.txt 和 untranslated_term.csv")
+    print("  --text: （可选）文本翻译文件夹或 .jatidx 索引，已有翻译的文本不输出")
+    print("  --ui: （可选）UI 翻译文件夹或 .jatidx 索引，已有翻译的术语不输出")
+    print(f"  --memory MB: （可选）排序段写入磁盘之前缓存记录使用的内存（默认为 {DEFAULT_MEMORY_MB}）")
+    print("  --temp: （可选）排序段所在文件夹（默认为系统临时文件夹）")
+    print("  --zip-in-order: （可选）按名称排序加载 zip 成员，与 AllowFilesInZipLoadInOrder 相同")
+    print()
+    print("注意事项:")
+    print("  - 文本按导出它的会话数排列，其次按首次出现的会话排列")
+    print("  - 每个 .txt 条目前有一行 ; 注释，记录首次出现的会话和会话数")
+    print("  - 以 ; 或 $ 开头的文本无法作为 .txt 的键，只计数")
+    print()
+
+def main():
+    """主函数，处理命令行参数"""
+
+    args = sys.argv.copy()
+    if len(args) < 3 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    trees = {}
+    for option in ("--text", "--ui"):
+        value = pop_option(args, option)
+        if option in sys.argv and value is None:
+            print(f"错误：{option} 需要一个翻译文件夹或索引")
+            return 2
+        if value is not None:
+            trees[option] = Path(value)
+
+    memory = pop_option(args, "--memory", str(DEFAULT_MEMORY_MB))
+    if memory is None or not memory.isdigit() or int(memory) == 0:
+        print("错误：--memory 需要一个正整数")
+        return 2
+    memory_budget = int(memory) * 1024 * 1024
+
+    temp_root = pop_option(args, "--temp")
+    if "--temp" in sys.argv and temp_root is None:
+        print("错误：--temp 需要一个文件夹")
+        return 2
+
+    zip_in_order = "--zip-in-order" in args
+    args = [arg for arg in args if arg != "--zip-in-order"]
+
+    dump_path = Path(args[1])
+    output_folder = Path(args[2])
+    for path in (dump_path, *trees.values()):
+        if not path.exists():
+            print(f"错误：路径 {path} 不存在")
+            return 2
+
+    start_time = time.perf_counter()
+    text_dumps = find_dumps(dump_path, TEXT_DUMP_SUFFIX)
+    term_dumps = find_dumps(dump_path, TERM_DUMP_SUFFIX)
+    if not text_dumps and not term_dumps:
+        print(f"在 {dump_path} 中未找到 {TEXT_DUMP_SUFFIX} 或 {TERM_DUMP_SUFFIX} 导出文件")
+        return 0
+    print(f"找到 {len(text_dumps)} 个文本导出和 {len(term_dumps)} 个术语导出")
+
+    text_translations, regexes = {}, []
+    if "--text" in trees:
+        text_translations, rules = load_tree(trees["--text"], 0, zip_in_order)
+        for pattern, _ in rules:
+            try:
+                regexes.append(re.compile(dotnet_regex_to_python(pattern)))
+            except re.error:
+                pass
+        print(f"已加载 {len(text_translations):,} 条文本翻译和 {len(regexes):,} 条正则规则")
+    term_translations = {}
+    if "--ui" in trees:
+        term_translations, _ = load_tree(trees["--ui"], 1, zip_in_order)
+        print(f"已加载 {len(term_translations):,} 条术语翻译")
+
+    output_folder.mkdir(parents=True, exist_ok=True)
+    if temp_root is not None:
+        Path(temp_root).mkdir(parents=True, exist_ok=True)
+
+    def output_key(record):
+        return -record[2], record[1], record[0]
+
+    with tempfile.TemporaryDirectory(prefix='jat_dumps_', dir=temp_root) as temp_dir:
+        temp_dir = Path(temp_dir)
+
+        for kind, label, dump_files in (('text', "文本导出", text_dumps), ('term', "术语导出", term_dumps)):
+            if not dump_files:
+                continue
+            stats = {}
+            output_stats = {}
+            records = iter_text_records(dump_files) if kind == 'text' else iter_term_records(dump_files)
+            unique = external_sort(records, lambda record: record[0], memory_budget, temp_dir, combine=True, stats=stats)
+
+            counts = {'unique': 0, 'translated': 0, 'unwritable': 0}
+
+            def untranslated(unique_records):
+                for record in unique_records:
+                    counts['unique'] += 1
+                    if kind == 'text':
+                        if is_text_translated(record[0], text_translations, regexes):
+                            counts['translated'] += 1
+                            continue
+                        if record[0][0] in ';$':
+                            counts['unwritable'] += 1
+                            continue
+                    elif record[0] in term_translations:
+                        counts['translated'] += 1
+                        continue
+                    yield record
+
+            ordered = external_sort(untranslated(unique), output_key, memory_budget, temp_dir, stats=output_stats)
+            written = 0
+            if kind == 'text':
+                output_file = output_folder / TEXT_OUTPUT_NAME
+                with open(output_file, 'w', encoding='utf-8', newline='\n') as outfile:
+                    for text, first_seen, count, _ in ordered:
+                        outfile.write(f"; {first_seen}，{count} 次会话\n{text.translate(TXT_ESCAPES)}\t\n")
+                        written += 1
+            else:
+                output_file = output_folder / TERM_OUTPUT_NAME
+                with open(output_file, 'w', encoding='utf-8-sig', newline='') as outfile:
+                    writer = csv.writer(outfile)
+                    writer.writerow(TERM_OUTPUT_FIELDNAMES)
+                    for term, first_seen, count, original in ordered:
+                        writer.writerow((term, original, '', first_seen, count))
+                        written += 1
+
+            print(f"✓ {label}：{stats['records']:,} 行，{counts['unique']:,} 条不重复，"
+                  f"{counts['translated']:,} 条已有翻译，{written:,} 条写入 {output_file}")
+            if counts['unwritable']:
+                print(f"  {counts['unwritable']:,} 条以 ; 或 $ 开头的文本无法作为 .txt 的键，未输出")
+            if stats['runs'] or output_stats['runs']:
+                print(f"  在磁盘上排序：合并导出用了 {stats['runs']} 个排序段，排列输出用了 {output_stats['runs']} 个排序段")
+
+    print(f"完成，耗时 {time.perf_counter() - start_time:.2f} 秒")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,960 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Merge the untranslated text and term dumps of many sessions into ready-to-translate .txt and .csv files
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import csv
+import heapq
+import io
+import json
+import mmap
+import re
+import struct
+import sys
+import tempfile
+import time
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+# .NET regex groups rewritten by dotnet_regex_to_python: named and balancing groups, inline options
+DOTNET_GROUP = re.compile(r"\(\?(?:<(?![=!])([^>]*)>|'([^']*)'|([imnsx-]+)([:)]))")
+
+# Whitespace trimmed by StringTool.NormalizeText
+WHITESPACE_CHARS = ('\t\n\v\f\r \u0085\u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008'
+                    '\u2009\u200a\u200b\u2028\u2029\u3000\ufeff')
+
+# Header: magic, version, kind, flags, number of source files, number of entries, number of regex rules,
+# size of the string pool in bytes, CRC-32 of everything after the header
+HEADER = struct.Struct('<8sIIIIIIII')
+
+# Entry of the key table and of the regex rule table: byte offset and length in the string pool of
+# the key (or pattern), then of the translation (or template)
+ENTRY = struct.Struct('<IIII')
+
+# Encoding of the string pool, the strings of a .NET string, so the plugin can binary search the
+# key table with an ordinal comparison without decoding
+POOL_ENCODING = 'utf-16-le'
+
+KIND_SUFFIXES = ('.txt', '.csv')
+
+# UTF-8 byte order mark, only skipped at the start of a file
+BYTE_ORDER_MARK = '\ufeff'
+
+# Removed from the translation by TxtTranslationFileProcessor, see XUAT RedirectedResourceDetectionStrategy
+MONGOLIAN_VOWEL_SEPARATOR = '\u180e'
+
+# Line breaks of StreamReader.ReadLine
+LINE_BREAK = re.compile(r'\r\n|\r|\n')
+
+# Escape sequences of StringExtensions.Unescape, any other sequence is kept as is
+ESCAPES = {
+    '0': '\0',
+    'a': '\a',
+    'b': '\b',
+    't': '\t',
+    'n': '\n',
+    'v': '\v',
+    'f': '\f',
+    'r': '\r',
+    "'": "'",
+    '"': '"',
+    '\\': '\\'
+}
+
+# First bytes of an index file
+INDEX_MAGIC = b'JATINDEX'
+
+# Format version, increased on every incompatible change of the layout
+INDEX_VERSION = 1
+
+# Index kinds, the loader they replace and the suffix of the files read by that loader
+INDEX_KINDS = ('Text', 'UI')
+
+# Suffixes of the dumps written by TextTranslateManger and UITranslateManager, the _normalized
+# text dumps repeat the texts of the _untranslate.txt dumps and are not read
+TEXT_DUMP_SUFFIX = '_untranslate.txt'
+TERM_DUMP_SUFFIX = '_untranslate_term.csv'
+
+# Session time at the start of a dump file name, written by DateTime.Now.ToString("yyyy-MM-dd-HH-mm")
+SESSION_TIME = re.compile(r'^(\d{4}-\d{2}-\d{2}-\d{2}-\d{2})_')
+SESSION_TIME_FORMAT = '%Y-%m-%d-%H-%M'
+
+# Characters escaped in the original of a .txt line, reversed by StringExtensions.Unescape
+TXT_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\r': '\\r', '\n': '\\n'})
+
+# Output file names
+TEXT_OUTPUT_NAME = 'untranslated.txt'
+TERM_OUTPUT_NAME = 'untranslated_term.csv'
+TERM_OUTPUT_FIELDNAMES = ('Term', 'Original', 'Translation', 'FirstSeen', 'Sessions')
+
+# Default memory budget for the records held before a sorted run is written to disk, in MB
+DEFAULT_MEMORY_MB = 256
+
+# Estimated bytes per buffered record on top of its strings: dict slot, list and integer
+RECORD_OVERHEAD = 200
+
+# Runs merged at once, more runs are merged in several passes to stay below the open file limit
+MERGE_FAN_IN = 64
+
+def dotnet_regex_to_python(pattern):
+    """
+    Rewrite .NET-only regex syntax to Python re syntax, so the pattern can be compiled to check it
+
+    Only the syntax is kept: Unicode categories such as \\p{L} become \\w, balancing groups become
+    non-capturing groups and inline options are dropped.
+
+    Args:
+        pattern (str): .NET regex
+
+    Returns:
+        str: Python regex
+    """
+
+    result = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\' and index + 1 < len(pattern):
+            escape = pattern[index + 1]
+            close = -1
+            if escape in 'pP' and pattern.startswith('{', index + 2):
+                close = pattern.find('}', index + 3)
+                replacement = '\\w' if escape == 'p' else '\\W'
+            elif escape == 'c' and index + 2 < len(pattern):
+                close = index + 2
+                replacement = '\\x00'
+            elif escape == 'k' and pattern[index + 2:index + 3] in ('<', "'"):
+                close = pattern.find('>' if pattern[index + 2] == '<' else "'", index + 3)
+                name = pattern[index + 3:close]
+                replacement = f'\\{name}' if name.isdigit() else f'(?P={name})'
+            if close > 0:
+                result.append(replacement)
+                index = close + 1
+                continue
+            result.append({'z': '\\Z', 'G': '', 'e': '\\x1b'}.get(escape, pattern[index:index + 2]))
+            index += 2
+            continue
+
+        match = DOTNET_GROUP.match(pattern, index) if char == '(' else None
+        if match is None:
+            result.append(char)
+            index += 1
+            continue
+        name = match.group(1) if match.group(1) is not None else match.group(2)
+        if name is not None:
+            result.append(f'(?P<{name}>' if name.isidentifier() else '(?:')
+        elif match.group(4) == ':':
+            result.append('(?:')
+        index = match.end()
+    return ''.join(result)
+
+def normalize_text(text):
+    """
+    Normalize text the same way as StringTool.NormalizeText in the plugin
+
+    Args:
+        text (str): Text
+
+    Returns:
+        str: Text without \\r, \\n and \\t, trimmed and in upper case
+    """
+
+    return text.replace('\r', '').replace('\n', '').replace('\t', '').strip(WHITESPACE_CHARS).upper()
+
+def read_entry(index, table_offset, position):
+    """
+    Read an entry of the key table or of the regex rule table
+
+    Args:
+        index (dict): Index returned by open_index
+        table_offset (int): Byte offset of the table
+        position (int): Entry number in the table
+
+    Returns:
+        tuple: (key or pattern, translation or template)
+    """
+
+    index_map = index['map']
+    pool_offset = index['pool_offset']
+    key_offset, key_length, value_offset, value_length = ENTRY.unpack_from(index_map, table_offset + position * ENTRY.size)
+    key_start = pool_offset + key_offset
+    value_start = pool_offset + value_offset
+    return (index_map[key_start:key_start + key_length].decode(POOL_ENCODING, 'surrogatepass'),
+            index_map[value_start:value_start + value_length].decode(POOL_ENCODING, 'surrogatepass'))
+
+def iter_translations(index):
+    """
+    Yield the translations of an index in key order
+
+    Args:
+        index (dict): Index returned by open_index
+
+    Yields:
+        tuple: (key, translation)
+    """
+
+    for position in range(index['entry_count']):
+        yield read_entry(index, HEADER.size, position)
+
+def is_member_path_unsafe(member_name):
+    """
+    Check an archive member name the same way as FileTool.IsZipPathUnsafe in the plugin
+
+    Rejects empty names, parent folder references and absolute or rooted paths.
+
+    Args:
+        member_name (str): Member name in the archive
+
+    Returns:
+        bool: True if the member must not be used
+    """
+
+    if not member_name:
+        return True
+
+    # Unify path separators
+    normalized_path = member_name.replace('\\', '/')
+
+    # Reject "../"
+    if '../' in normalized_path:
+        return True
+
+    # Reject absolute paths, including Windows drive paths
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def ordinal_key(text):
+    """
+    Sort key matching .NET StringComparer.Ordinal, which compares UTF-16 code units
+
+    Args:
+        text (str): Text to sort
+
+    Returns:
+        bytes: UTF-16 big-endian encoding of the text
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def unescape(text, unknown_escapes=None):
+    """
+    Replace escape sequences the same way as StringExtensions.Unescape in the plugin
+
+    Unknown sequences are kept with their backslash, and so is a backslash at the end of the text.
+
+    Args:
+        text (str): Text with escape sequences
+        unknown_escapes (list): Optional, receives the unknown sequences such as "\\x"
+
+    Returns:
+        str: Unescaped text
+    """
+
+    index = text.find('\\')
+    if index < 0:
+        return text
+
+    parts = []
+    start = 0
+    while 0 <= index < len(text) - 1:
+        parts.append(text[start:index])
+        char = text[index + 1]
+        escaped = ESCAPES.get(char)
+        if escaped is None:
+            parts.append('\\' + char)
+            if unknown_escapes is not None:
+                unknown_escapes.append('\\' + char)
+        else:
+            parts.append(escaped)
+        start = index + 2
+        index = text.find('\\', start)
+    parts.append(text[start:])
+    return ''.join(parts)
+
+def add_translation_lines(data, source, translations, rules):
+    """
+    Parse the lines of a .txt translation file the same way as TxtTranslationFileProcessor
+
+    Args:
+        data (bytes): File content
+        source (str): File name shown in reports
+        translations (dict): Exact translations, modified in place
+        rules (list): Regex rules, modified in place
+    """
+
+    text = data.decode('utf-8', 'replace')
+    if text.startswith(BYTE_ORDER_MARK):
+        text = text[1:]
+
+    for line_number, line in enumerate(LINE_BREAK.split(text), 1):
+        if not line or line[0] == ';':
+            continue
+        original, tab, translation = line.partition('\t')
+        if not tab:
+            continue
+        original = unescape(original)
+        translation = unescape(translation).replace(MONGOLIAN_VOWEL_SEPARATOR, '')
+        if not original or not translation:
+            continue
+        if line[0] == '$':
+            rules.append({'source': f"{source}:{line_number}", 'pattern': original[1:], 'template': translation})
+        else:
+            translations[original] = translation
+
+def loader_order_key(relative_path):
+    """
+    Sort key for the order in which the plugin loads translation files
+
+    The plugin loads the files in the root of the translation folder first, then the files of
+    every subfolder, with folders and files each sorted by ordinal path (FileTool.GetAllTranslationFiles).
+
+    Args:
+        relative_path (Path): File path relative to the translation folder
+
+    Returns:
+        tuple: Sort key
+    """
+
+    folder = relative_path.parent.parts
+    return len(folder) > 0, ordinal_key('\\'.join(folder)), ordinal_key(relative_path.name)
+
+def find_source_files(input_path, suffix):
+    """
+    Find the translation files of a folder in the order the plugin loads them
+
+    Args:
+        input_path (Path): Translation folder, or a single translation or .zip file
+        suffix (str): Suffix of the translation files
+
+    Returns:
+        list: (file path, name shown in reports) tuples
+    """
+
+    if input_path.is_file():
+        return [(input_path, input_path.name)]
+    files = [file for file in input_path.rglob('*')
+             if file.is_file() and file.name.lower().endswith((suffix, '.zip'))]
+    files.sort(key=lambda file: loader_order_key(file.relative_to(input_path)))
+    return [(file, file.relative_to(input_path).as_posix()) for file in files]
+
+def iter_csv_lines(text):
+    """
+    Yield the lines of a CSV text except the comment lines skipped by CsvHelper (AllowComments)
+
+    A line starting with # is only a comment outside a quoted field, the quote count tells
+    whether the previous lines left a field open.
+
+    Args:
+        text (str): CSV text
+
+    Yields:
+        str: Line with its line break
+    """
+
+    in_quotes = False
+    for line in io.StringIO(text, newline=''):
+        if not in_quotes and line.startswith('#'):
+            continue
+        if line.count('"') % 2:
+            in_quotes = not in_quotes
+        yield line
+
+def add_csv_rows(data, translations):
+    """
+    Parse a .csv translation file the same way as CsvTranslationFileProcessor
+
+    The header is matched trimmed and case-insensitive, blank and whitespace-only records are
+    skipped and rows without a Term or a Translation are ignored.
+
+    Args:
+        data (bytes): File content
+        translations (dict): Translations, modified in place
+    """
+
+    columns = None
+    for row in csv.reader(iter_csv_lines(data.decode('utf-8-sig', 'replace'))):
+        if all(not field or field.isspace() for field in row):
+            continue
+        if columns is None:
+            columns = {name.strip().lower(): index for index, name in reversed(list(enumerate(row)))}
+            continue
+        term_index = columns.get('term')
+        translation_index = columns.get('translation')
+        term = row[term_index] if term_index is not None and term_index < len(row) else None
+        translation = row[translation_index] if translation_index is not None and translation_index < len(row) else None
+        if term and translation:
+            translations[term] = translation
+
+def load_sources(input_path, kind, zip_in_order=False):
+    """
+    Load a translation folder the way AsyncTranslationLoader does
+
+    Later files replace the translations of earlier ones. Every $ line of a .txt file becomes its
+    own regex rule, the plugin keys them by Regex instance so identical patterns are all kept.
+
+    Args:
+        input_path (Path): Translation folder, or a single translation or .zip file
+        kind (int): Index of the loader in INDEX_KINDS
+        zip_in_order (bool): Load zip members sorted by name instead of in storage order
+
+    Returns:
+        tuple: (translations, list of (pattern, template) rules, number of files)
+    """
+
+    suffix = KIND_SUFFIXES[kind]
+    translations = {}
+    rules = []
+
+    def add_file(data, name):
+        if suffix == '.csv':
+            add_csv_rows(data, translations)
+            return
+        file_rules = []
+        add_translation_lines(data, name, translations, file_rules)
+        rules.extend((rule['pattern'], rule['template']) for rule in file_rules)
+
+    files = find_source_files(input_path, suffix)
+    for file_path, name in files:
+        try:
+            if not file_path.name.lower().endswith('.zip'):
+                add_file(file_path.read_bytes(), name)
+                continue
+            with zipfile.ZipFile(file_path) as archive:
+                members = [info for info in archive.infolist()
+                           if not info.is_dir() and info.filename.lower().endswith(suffix)
+                           and not is_member_path_unsafe(info.filename)]
+                if zip_in_order:
+                    members.sort(key=lambda info: ordinal_key(info.filename))
+                for info in members:
+                    try:
+                        add_file(archive.read(info), f"{name}/{info.filename}")
+                    except (OSError, zipfile.BadZipFile, csv.Error) as e:
+                        print(f"✗ Error reading {name}/{info.filename}: {e}")
+        except (OSError, zipfile.BadZipFile, csv.Error) as e:
+            print(f"✗ Error reading {name}: {e}")
+    return translations, rules, len(files)
+
+def open_index(index_file):
+    """
+    Memory-map an index file and check its header
+
+    Args:
+        index_file (Path): Index file
+
+    Returns:
+        dict: Header fields, table offsets and the 'map' to close after use
+
+    Raises:
+        ValueError: The file is not an index of a supported version
+    """
+
+    with open(index_file, 'rb') as file:
+        index_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(index_map) < HEADER.size:
+            raise ValueError("file is shorter than the index header")
+        magic, version, kind, flags, file_count, entry_count, rule_count, pool_size, checksum = \
+            HEADER.unpack_from(index_map, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError("not a translation index file")
+        if version != INDEX_VERSION:
+            raise ValueError(f"index version {version} is not supported, expected {INDEX_VERSION}")
+        if kind >= len(INDEX_KINDS):
+            raise ValueError(f"unknown index kind {kind}")
+        pool_offset = HEADER.size + (entry_count + rule_count) * ENTRY.size
+        if pool_offset + pool_size != len(index_map):
+            raise ValueError("file size does not match the header, the index is truncated or damaged")
+    except ValueError:
+        index_map.close()
+        raise
+
+    return {
+        'map': index_map,
+        'kind': kind,
+        'flags': flags,
+        'file_count': file_count,
+        'entry_count': entry_count,
+        'rule_count': rule_count,
+        'checksum': checksum,
+        'rules_offset': HEADER.size + entry_count * ENTRY.size,
+        'pool_offset': pool_offset
+    }
+
+def read_rules(index):
+    """
+    Read the regex rules of an index
+
+    Args:
+        index (dict): Index returned by open_index
+
+    Returns:
+        list: (pattern, template) rules in load order
+    """
+
+    return [read_entry(index, index['rules_offset'], position) for position in range(index['rule_count'])]
+
+def session_time(dump_file):
+    """
+    Get the session time of a dump file from its name, or from its modification time
+
+    Args:
+        dump_file (Path): Dump file
+
+    Returns:
+        str: Time as yyyy-MM-dd-HH-mm, which sorts chronologically
+    """
+
+    match = SESSION_TIME.match(dump_file.name)
+    if match:
+        return match.group(1)
+    return datetime.fromtimestamp(dump_file.stat().st_mtime).strftime(SESSION_TIME_FORMAT)
+
+def find_dumps(dump_path, suffix):
+    """
+    Find the dump files of a kind
+
+    Args:
+        dump_path (Path): Folder searched recursively, or a single dump file
+        suffix (str): TEXT_DUMP_SUFFIX or TERM_DUMP_SUFFIX
+
+    Returns:
+        list: Dump files sorted by path
+    """
+
+    if dump_path.is_file():
+        return [dump_path] if dump_path.name.endswith(suffix) else []
+    return sorted(file for file in dump_path.rglob('*') if file.is_file() and file.name.endswith(suffix))
+
+def iter_text_records(dump_files):
+    """
+    Read untranslated text dumps, one text per line
+
+    Args:
+        dump_files (list): *_untranslate.txt files
+
+    Yields:
+        list: [text, session time, 1, None] record
+    """
+
+    for dump_file in dump_files:
+        seen = session_time(dump_file)
+        with open(dump_file, 'r', encoding='utf-8-sig', errors='replace') as infile:
+            for line in infile:
+                text = line.rstrip('\n')
+                if text:
+                    yield [text, seen, 1, None]
+
+def iter_term_records(dump_files):
+    """
+    Read untranslated term dumps, written by CsvWriter with a Term,Original,Translation header
+
+    Args:
+        dump_files (list): *_untranslate_term.csv files
+
+    Yields:
+        list: [term, session time, 1, original] record
+    """
+
+    for dump_file in dump_files:
+        seen = session_time(dump_file)
+        with open(dump_file, 'r', encoding='utf-8-sig', errors='replace', newline='') as infile:
+            columns = None
+            for row in csv.reader(infile):
+                if all(not field or field.isspace() for field in row):
+                    continue
+                if columns is None:
+                    columns = {name.strip().lower(): index for index, name in reversed(list(enumerate(row)))}
+                    continue
+                term_index = columns.get('term')
+                original_index = columns.get('original')
+                term = row[term_index] if term_index is not None and term_index < len(row) else ''
+                original = row[original_index] if original_index is not None and original_index < len(row) else ''
+                if term and not term.isspace():
+                    yield [term, seen, 1, original]
+
+def combine_records(record, other):
+    """
+    Merge two records of the same text, keeping the first-seen session and its original
+
+    Args:
+        record (list): Record, modified in place
+        other (list): Record of the same text
+    """
+
+    if other[1] < record[1]:
+        record[1] = other[1]
+        record[3] = other[3]
+    record[2] += other[2]
+
+def write_run(records, temp_dir, run_number):
+    """
+    Write sorted records to a run file, one JSON array per line
+
+    Args:
+        records (iterable): Sorted records
+        temp_dir (Path): Folder for run files
+        run_number (int): Number used in the file name
+
+    Returns:
+        Path: Run file
+    """
+
+    run_file = temp_dir / f"run_{run_number:06d}.jsonl"
+    with open(run_file, 'w', encoding='utf-8', newline='\n') as outfile:
+        for record in records:
+            outfile.write(json.dumps(record, ensure_ascii=False))
+            outfile.write('\n')
+    return run_file
+
+def read_run(run_file):
+    """
+    Read the records of a run file
+
+    Args:
+        run_file (Path): Run file
+
+    Yields:
+        list: Record
+    """
+
+    with open(run_file, 'r', encoding='utf-8', newline='\n') as infile:
+        for line in infile:
+            yield json.loads(line)
+
+def merge_sorted(iterables, key, combine):
+    """
+    Merge sorted record streams, combining consecutive records of the same text when asked
+
+    Args:
+        iterables (list): Record streams sorted by key
+        key (callable): Sort key of a record
+        combine (bool): Combine records with the same text with combine_records
+
+    Yields:
+        list: Record
+    """
+
+    merged = heapq.merge(*iterables, key=key)
+    if not combine:
+        yield from merged
+        return
+    current = None
+    for record in merged:
+        if current is not None and record[0] == current[0]:
+            combine_records(current, record)
+            continue
+        if current is not None:
+            yield current
+        current = record
+    if current is not None:
+        yield current
+
+def external_sort(records, key, memory_budget, temp_dir, combine=False, stats=None):
+    """
+    Sort records that may not fit in memory
+
+    Records are buffered until their estimated size reaches the memory budget, then written as a
+    sorted run. The runs are merged in passes of at most MERGE_FAN_IN files. When the input fits
+    the budget nothing is written to disk.
+
+    Args:
+        records (iterable): [text, first seen, count, original] records
+        key (callable): Sort key of a record
+        memory_budget (int): Bytes of records held in memory
+        temp_dir (Path): Folder for run files
+        combine (bool): Combine records with the same text, the key must keep them together
+        stats (dict): Receives 'records' and 'runs' counts (optional)
+
+    Yields:
+        list: Record in key order
+    """
+
+    buffer = {} if combine else []
+    buffer_size = 0
+    runs = []
+    record_count = 0
+
+    for record in records:
+        record_count += 1
+        if combine:
+            existing = buffer.get(record[0])
+            if existing is not None:
+                combine_records(existing, record)
+                continue
+            buffer[record[0]] = record
+        else:
+            buffer.append(record)
+        buffer_size += RECORD_OVERHEAD + sys.getsizeof(record[0]) + (sys.getsizeof(record[3]) if record[3] else 0)
+        if buffer_size >= memory_budget:
+            values = buffer.values() if combine else buffer
+            runs.append(write_run(sorted(values, key=key), temp_dir, len(runs)))
+            buffer = {} if combine else []
+            buffer_size = 0
+
+    values = sorted(buffer.values() if combine else buffer, key=key)
+    del buffer
+    if runs:
+        runs.append(write_run(values, temp_dir, len(runs)))
+        values = None
+    if stats is not None:
+        stats['records'] = record_count
+        stats['runs'] = len(runs)
+    if not runs:
+        yield from values
+        return
+
+    # Each pass merges neighbouring runs, so records with equal keys keep their input order
+    run_number = len(runs)
+    while len(runs) > MERGE_FAN_IN:
+        merged_runs = []
+        for start in range(0, len(runs), MERGE_FAN_IN):
+            group = runs[start:start + MERGE_FAN_IN]
+            if len(group) == 1:
+                merged_runs.append(group[0])
+                continue
+            merged_runs.append(write_run(merge_sorted([read_run(run) for run in group], key, combine),
+                                         temp_dir, run_number))
+            run_number += 1
+            for run in group:
+                run.unlink()
+        runs = merged_runs
+
+    yield from merge_sorted([read_run(run) for run in runs], key, combine)
+    for run in runs:
+        run.unlink()
+
+def load_tree(tree_path, kind, zip_in_order):
+    """
+    Load the translations of a translation folder or of an index built by translation_index
+
+    Args:
+        tree_path (Path): Translation folder, translation or .zip file, or .jatidx index
+        kind (int): 0 for the Text loader, 1 for the UI loader
+        zip_in_order (bool): Load zip members sorted by name
+
+    Returns:
+        tuple: (translations, list of (pattern, template) regex rules)
+    """
+
+    if tree_path.is_file() and tree_path.name.lower().endswith('.jatidx'):
+        index = open_index(tree_path)
+        try:
+            return dict(iter_translations(index)), read_rules(index)
+        finally:
+            index['map'].close()
+    translations, rules, _ = load_sources(tree_path, kind, zip_in_order)
+    return translations, rules
+
+def is_text_translated(text, translations, regexes):
+    """
+    Check whether the plugin has a translation for a text, like TextTranslateManger.IsInTranslateDict
+
+    Args:
+        text (str): Text
+        translations (dict): Exact translations
+        regexes (list): Compiled regex rules
+
+    Returns:
+        bool: True if the text is translated
+    """
+
+    if text in translations:
+        return True
+    normalized = normalize_text(text)
+    if normalized in translations:
+        return True
+    for regex in regexes:
+        match = regex.search(text)
+        if match and match.end() > match.start():
+            return True
+        if normalized != text and normalized:
+            match = regex.search(normalized)
+            if match and match.end() > match.start():
+                return True
+    return False
+
+def pop_option(args, name, default=None):
+    """
+    Remove an option with a value from the argument list
+
+    Supports both "--name value" and "--name=value"
+
+    Args:
+        args (list): Argument list, modified in place
+        name (str): Option name
+        default (str): Value returned when the option is not present
+
+    Returns:
+        str: Option value, None if the option has no value
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """Print command line usage"""
+
+    print("Untranslated Dump Consolidator")
+    print("Merge the _untranslate dumps of many sessions into ready-to-translate files under a fixed memory budget")
+    print()
+    print("Usage:")
+    print("  python script.py <dump_folder> <output_folder> [--text <text_translations>] [--ui <ui_translations>]")
+    print("                   [--memory MB] [--temp <folder>] [--zip-in-order]")
+    print()
+    print("Examples:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Dump ./ToTranslate")
+    print("  python script.py ./Dump ./ToTranslate --text ./Chinese/Text --ui ./Chinese/UI --memory 64")
+    print("  python script.py ./Dump ./ToTranslate --text ./Text.jatidx")
+    print()
+    print("Parameters:")
+    print("  dump_folder: Folder searched recursively for *_untranslate.txt and *_untranslate_term.csv dumps")
+    print("  output_folder: Receives untranslated.txt and untranslated_term.csv")
+    print("  --text: (optional) Text translation folder or .jatidx index, translated texts are left out")
+    print("  --ui: (optional) UI translation folder or .jatidx index, translated terms are left out")
+    print(f"  --memory MB: (optional) Memory for buffered records before sorted runs go to disk (defaults to {DEFAULT_MEMORY_MB})")
+    print("  --temp: (optional) Folder for the sorted runs (defaults to the system temporary folder)")
+    print("  --zip-in-order: (optional) Load zip members sorted by name, like AllowFilesInZipLoadInOrder")
+    print()
+    print("Notes:")
+    print("  - Texts are listed by the number of sessions that dumped them, then by first-seen session")
+    print("  - Each .txt entry is preceded by a ; comment with its first-seen session and session count")
+    print("  - Texts starting with ; or $ cannot be .txt keys and are only counted")
+    print()
+
+def main():
+    """Main function to handle command line arguments"""
+
+    args = sys.argv.copy()
+    if len(args) < 3 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    trees = {}
+    for option in ("--text", "--ui"):
+        value = pop_option(args, option)
+        if option in sys.argv and value is None:
+            print(f"Error: {option} requires a translation folder or index")
+            return 2
+        if value is not None:
+            trees[option] = Path(value)
+
+    memory = pop_option(args, "--memory", str(DEFAULT_MEMORY_MB))
+    if memory is None or not memory.isdigit() or int(memory) == 0:
+        print("Error: --memory requires a positive integer")
+        return 2
+    memory_budget = int(memory) * 1024 * 1024
+
+    temp_root = pop_option(args, "--temp")
+    if "--temp" in sys.argv and temp_root is None:
+        print("Error: --temp requires a folder")
+        return 2
+
+    zip_in_order = "--zip-in-order" in args
+    args = [arg for arg in args if arg != "--zip-in-order"]
+
+    dump_path = Path(args[1])
+    output_folder = Path(args[2])
+    for path in (dump_path, *trees.values()):
+        if not path.exists():
+            print(f"Error: Path {path} does not exist")
+            return 2
+
+    start_time = time.perf_counter()
+    text_dumps = find_dumps(dump_path, TEXT_DUMP_SUFFIX)
+    term_dumps = find_dumps(dump_path, TERM_DUMP_SUFFIX)
+    if not text_dumps and not term_dumps:
+        print(f"No {TEXT_DUMP_SUFFIX} or {TERM_DUMP_SUFFIX} dumps found in {dump_path}")
+        return 0
+    print(f"Found {len(text_dumps)} text dumps and {len(term_dumps)} term dumps")
+
+    text_translations, regexes = {}, []
+    if "--text" in trees:
+        text_translations, rules = load_tree(trees["--text"], 0, zip_in_order)
+        for pattern, _ in rules:
+            try:
+                regexes.append(re.compile(dotnet_regex_to_python(pattern)))
+            except re.error:
+                pass
+        print(f"Loaded {len(text_translations):,} text translations and {len(regexes):,} regex rules")
+    term_translations = {}
+    if "--ui" in trees:
+        term_translations, _ = load_tree(trees["--ui"], 1, zip_in_order)
+        print(f"Loaded {len(term_translations):,} term translations")
+
+    output_folder.mkdir(parents=True, exist_ok=True)
+    if temp_root is not None:
+        Path(temp_root).mkdir(parents=True, exist_ok=True)
+
+    def output_key(record):
+        return -record[2], record[1], record[0]
+
+    with tempfile.TemporaryDirectory(prefix='jat_dumps_', dir=temp_root) as temp_dir:
+        temp_dir = Path(temp_dir)
+
+        for kind, label, dump_files in (('text', "Text dumps", text_dumps), ('term', "Term dumps", term_dumps)):
+            if not dump_files:
+                continue
+            stats = {}
+            output_stats = {}
+            records = iter_text_records(dump_files) if kind == 'text' else iter_term_records(dump_files)
+            unique = external_sort(records, lambda record: record[0], memory_budget, temp_dir, combine=True, stats=stats)
+
+            counts = {'unique': 0, 'translated': 0, 'unwritable': 0}
+
+            def untranslated(unique_records):
+                for record in unique_records:
+                    counts['unique'] += 1
+                    if kind == 'text':
+                        if is_text_translated(record[0], text_translations, regexes):
+                            counts['translated'] += 1
+                            continue
+                        if record[0][0] in ';$':
+                            counts['unwritable'] += 1
+                            continue
+                    elif record[0] in term_translations:
+                        counts['translated'] += 1
+                        continue
+                    yield record
+
+            ordered = external_sort(untranslated(unique), output_key, memory_budget, temp_dir, stats=output_stats)
+            written = 0
+            if kind == 'text':
+                output_file = output_folder / TEXT_OUTPUT_NAME
+                with open(output_file, 'w', encoding='utf-8', newline='\n') as outfile:
+                    for text, first_seen, count, _ in ordered:
+                        outfile.write(f"; {first_seen}, {count} sessions\n{text.translate(TXT_ESCAPES)}\t\n")
+                        written += 1
+            else:
+                output_file = output_folder / TERM_OUTPUT_NAME
+                with open(output_file, 'w', encoding='utf-8-sig', newline='') as outfile:
+                    writer = csv.writer(outfile)
+                    writer.writerow(TERM_OUTPUT_FIELDNAMES)
+                    for term, first_seen, count, original in ordered:
+                        writer.writerow((term, original, '', first_seen, count))
+                        written += 1
+
+            print(f"✓ {label}: {stats['records']:,} lines, {counts['unique']:,} unique, "
+                  f"{counts['translated']:,} already translated, {written:,} written to {output_file}")
+            if counts['unwritable']:
+                print(f"  {counts['unwritable']:,} texts starting with ; or $ cannot be .txt keys and were left out")
+            if stats['runs'] or output_stats['runs']:
+                print(f"  Sorted on disk: {stats['runs']} runs to merge the dumps, {output_stats['runs']} runs to order the output")
+
+    print(f"Done in {time.perf_counter() - start_time:.2f} s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
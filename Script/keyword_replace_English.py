@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Apply, benchmark and trim the keyword replacement dictionary with an Aho-Corasick automaton
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import json
+import re
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+# UTF-8 byte order mark, only skipped at the start of a file
+BYTE_ORDER_MARK = '\ufeff'
+
+# Keys listed per report section by default
+REPORT_TOP_KEYS = 10
+
+# Mismatches between the automaton and the regex listed by --benchmark
+REPORT_MISMATCHES = 5
+
+# Keywords from which --apply uses the automaton, with fewer the alternation regex, run in C, is faster.
+# --benchmark on game translations put the crossover between 100 and 300 keywords.
+AUTOMATON_MIN_KEYWORDS = 200
+
+def load_keywords(keyword_file):
+    """
+    Load KeywordReplaceText.json and build the replacement regex like UpdateKeywordReplaceRegex
+
+    Args:
+        keyword_file (Path): JSON object of keyword -> replacement
+
+    Returns:
+        tuple: (keyword dict, compiled regex or None when there are no keywords)
+    """
+
+    keywords = json.loads(keyword_file.read_text(encoding='utf-8-sig')) or {}
+    # Longest keyword first, OrderByDescending keeps the file order of keywords of the same length
+    keys = sorted((key for key in keywords if key), key=lambda key: -len(key.encode('utf-16-le', 'surrogatepass')))
+    if not keys:
+        return keywords, None
+    return keywords, re.compile('|'.join(re.escape(key) for key in keys))
+
+def replace_keywords(text, keywords, keyword_regex):
+    """
+    Replace keywords in a translation like TextTranslateManger.ReplaceKeyword
+
+    Args:
+        text (str): Translation
+        keywords (dict): Keyword -> replacement
+        keyword_regex (re.Pattern): Regex from load_keywords, None to keep the text
+
+    Returns:
+        str: Translation with the keywords replaced
+    """
+
+    if not text or keyword_regex is None:
+        return text
+    return keyword_regex.sub(lambda match: keywords.get(match.group(), match.group()), text)
+
+def shorten(text, length=40):
+    """
+    Shorten text for a report line
+
+    Args:
+        text (str): Text
+        length (int): Maximum length
+
+    Returns:
+        str: Text, cut with "..." if longer than length
+    """
+
+    return text if len(text) <= length else text[:length] + "..."
+
+def read_keyword_pairs(keyword_file):
+    """
+    Read the key/replacement pairs of KeywordReplaceText.json in file order, duplicates included
+
+    Args:
+        keyword_file (Path): JSON object of keyword -> replacement
+
+    Returns:
+        list: (keyword, replacement) tuples
+
+    Raises:
+        ValueError: The file is not a JSON object of strings
+    """
+
+    pairs = json.loads(keyword_file.read_text(encoding='utf-8-sig'), object_pairs_hook=list)
+    if not isinstance(pairs, list) or not all(isinstance(key, str) and isinstance(value, str) for key, value in pairs):
+        raise ValueError("expected a JSON object of strings")
+    return pairs
+
+def build_automaton(keywords):
+    """
+    Build an Aho-Corasick automaton of the keywords
+
+    Each state keeps the lengths of every keyword ending there, longest first, so a scan finds
+    all occurrences. 'through' keeps, for each state, one keyword continuing past it.
+
+    Args:
+        keywords (dict): Keyword -> replacement, empty keywords are ignored like the plugin does
+
+    Returns:
+        dict: 'goto', 'fail', 'depth', 'outputs', 'through', 'first_chars' and the 'keywords'
+    """
+
+    goto = [{}]
+    depth = [0]
+    ends = [False]
+    through = [None]
+    for key in keywords:
+        if not key:
+            continue
+        state = 0
+        for char in key:
+            if through[state] is None and len(key) > depth[state]:
+                through[state] = key
+            next_state = goto[state].get(char)
+            if next_state is None:
+                next_state = len(goto)
+                goto.append({})
+                depth.append(depth[state] + 1)
+                ends.append(False)
+                through.append(None)
+                goto[state][char] = next_state
+            state = next_state
+        ends[state] = True
+
+    # Breadth-first, so the failure state of a state is always done before it
+    fail = [0] * len(goto)
+    outputs = [()] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        outputs[state] = ((depth[state],) if ends[state] else ()) + outputs[fail[state]]
+        for char, next_state in goto[state].items():
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[next_state] = goto[fallback].get(char, 0) if state else 0
+            queue.append(next_state)
+
+    return {
+        'goto': goto,
+        'fail': fail,
+        'depth': depth,
+        'outputs': outputs,
+        'through': through,
+        'first_chars': frozenset(goto[0]),
+        'keywords': keywords
+    }
+
+def find_matches(automaton, text, ignored=None, skip_whole=False):
+    """
+    Find the longest keyword starting at each position of a text
+
+    Args:
+        automaton (dict): Result of build_automaton
+        text (str): Text
+        ignored (set): Keywords to leave out (optional)
+        skip_whole (bool): Leave out a keyword covering the whole text
+
+    Returns:
+        dict: Start position -> keyword length
+    """
+
+    goto = automaton['goto']
+    fail = automaton['fail']
+    outputs = automaton['outputs']
+    longest = {}
+    state = 0
+    for end, char in enumerate(text, 1):
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        # Lengths are longest first, each one belongs to a different start. A later end can only
+        # give a start a longer keyword, so the last write is the longest.
+        for length in outputs[state]:
+            if skip_whole and length == len(text):
+                continue
+            if ignored and text[end - length:end] in ignored:
+                continue
+            longest[end - length] = length
+    return longest
+
+def apply_matches(text, matches, keywords):
+    """
+    Replace the leftmost, then longest, keywords without overlaps, like the alternation regex of the plugin
+
+    Args:
+        text (str): Text
+        matches (dict): Result of find_matches
+        keywords (dict): Keyword -> replacement
+
+    Returns:
+        tuple: (replaced text, number of replacements)
+    """
+
+    parts = []
+    position = 0
+    count = 0
+    for start in sorted(matches):
+        if start < position:
+            continue
+        end = start + matches[start]
+        parts.append(text[position:start])
+        parts.append(keywords[text[start:end]])
+        position = end
+        count += 1
+    parts.append(text[position:])
+    return ''.join(parts), count
+
+def replace_text(automaton, text):
+    """
+    Replace the keywords of a text, same result as TextTranslateManger.ReplaceKeyword
+
+    Args:
+        automaton (dict): Result of build_automaton
+        text (str): Text
+
+    Returns:
+        tuple: (replaced text, number of replacements)
+    """
+
+    # Most texts hold no keyword at all, a set test in C skips them
+    if not text or automaton['first_chars'].isdisjoint(text):
+        return text, 0
+    matches = find_matches(automaton, text)
+    if not matches:
+        return text, 0
+    return apply_matches(text, matches, automaton['keywords'])
+
+def replace_text_regex(text, keywords, keyword_regex):
+    """
+    Replace the keywords of a text with the alternation regex, same result as replace_text
+
+    Args:
+        text (str): Text
+        keywords (dict): Keyword -> replacement
+        keyword_regex (re.Pattern): Regex from load_keywords, None to keep the text
+
+    Returns:
+        tuple: (replaced text, number of replacements)
+    """
+
+    if not text or keyword_regex is None:
+        return text, 0
+    return keyword_regex.subn(lambda match: keywords[match.group()], text)
+
+def find_right_overlap(automaton, key):
+    """
+    Find a keyword starting inside a key and continuing past its end
+
+    Where both occur that way, only the key is replaced.
+
+    Args:
+        automaton (dict): Result of build_automaton
+        key (str): Keyword of the automaton
+
+    Returns:
+        tuple: (overlapping keyword, length of the shared text), None if there is none
+    """
+
+    goto = automaton['goto']
+    state = 0
+    for char in key:
+        state = goto[state][char]
+    state = automaton['fail'][state]
+    while state:
+        if goto[state]:
+            return automaton['through'][state], automaton['depth'][state]
+        state = automaton['fail'][state]
+    return None
+
+def analyze_keywords(pairs):
+    """
+    Find keywords the plugin ignores, shadows or does not need
+
+    A keyword is removable when the other keywords already give its replacement on its own text
+    and no keyword starts inside it and continues past its end: in every text the result is then
+    the same without it. Keywords are checked shortest first against those still kept.
+
+    Args:
+        pairs (list): Result of read_keyword_pairs
+
+    Returns:
+        dict: 'keywords' (last value wins, like JsonConvert), 'duplicates', 'empty', 'contained',
+            'overlaps' and 'removable' lists
+    """
+
+    keywords = dict(pairs)
+    seen = set()
+    duplicates = []
+    for key, _ in pairs:
+        if key in seen:
+            duplicates.append(key)
+        seen.add(key)
+
+    automaton = build_automaton(keywords)
+    contained = []
+    overlaps = []
+    removable = []
+    removed = set()
+    for key in sorted((key for key in keywords if key), key=len):
+        matches = find_matches(automaton, key, removed, skip_whole=True)
+        if matches:
+            inner = key[min(matches):min(matches) + matches[min(matches)]]
+            contained.append((key, inner, len(matches)))
+        overlap = find_right_overlap(automaton, key)
+        if overlap is not None:
+            overlaps.append((key, *overlap))
+        elif apply_matches(key, matches, keywords)[0] == keywords[key]:
+            removable.append(key)
+            removed.add(key)
+
+    return {
+        'keywords': keywords,
+        'duplicates': duplicates,
+        'empty': [key for key in keywords if not key],
+        'contained': contained,
+        'overlaps': overlaps,
+        'removable': removable
+    }
+
+def iter_text_files(input_path):
+    """
+    Find the .txt files of a folder
+
+    Args:
+        input_path (Path): Folder searched recursively, or a single file
+
+    Returns:
+        list: (file path, path relative to input_path) tuples sorted by path
+    """
+
+    if input_path.is_file():
+        return [(input_path, Path(input_path.name))]
+    return [(file, file.relative_to(input_path)) for file in sorted(input_path.rglob('*'))
+            if file.is_file() and file.name.lower().endswith('.txt')]
+
+def split_line(line):
+    """
+    Split a line of a .txt translation file or dump into the kept part and the part the plugin replaces keywords in
+
+    Args:
+        line (str): Line without its line break
+
+    Returns:
+        tuple: (kept prefix, text to replace in), text is None for comments and $ regex rules
+    """
+
+    if not line or line[0] == ';':
+        return line, None
+    original, tab, translation = line.partition('\t')
+    if not tab:
+        # Dump line, the whole line is a text
+        return '', line
+    if line[0] == '$':
+        # The plugin replaces keywords after filling the template, captured text included
+        return line, None
+    return original + tab, translation
+
+def read_texts(input_path):
+    """
+    Read the texts keywords are replaced in: translations of .txt translation files and dump lines
+
+    Args:
+        input_path (Path): Folder searched recursively for .txt files, or a single file
+
+    Returns:
+        list: Texts
+    """
+
+    texts = []
+    for file_path, _ in iter_text_files(input_path):
+        for line in file_path.read_text(encoding='utf-8-sig', errors='replace').splitlines():
+            text = split_line(line)[1]
+            if text:
+                texts.append(text)
+    return texts
+
+def pop_option(args, name, default=None):
+    """
+    Remove an option with a value from the argument list
+
+    Supports both "--name value" and "--name=value"
+
+    Args:
+        args (list): Argument list, modified in place
+        name (str): Option name
+        default (str): Value returned when the option is not present
+
+    Returns:
+        str: Option value, None if the option has no value
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """Print command line usage"""
+
+    print("Keyword Replacement Tool")
+    print("Check, trim, benchmark and pre-apply KeywordReplaceText.json with an Aho-Corasick automaton")
+    print()
+    print("Usage:")
+    print("  python script.py <KeywordReplaceText.json> [--top N] [--lean lean.json]")
+    print("                   [--benchmark <texts>] [--apply <input> --output <output_folder>]")
+    print()
+    print("Examples:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/KeywordReplaceText.json --lean lean.json")
+    print("  python script.py KeywordReplaceText.json --benchmark ./Chinese/Text")
+    print("  python script.py KeywordReplaceText.json --apply ./Chinese/Text --output ./Text_replaced")
+    print()
+    print("Parameters:")
+    print("  --top N: (optional) Number of keys listed per section, 0 lists all (defaults to 10)")
+    print("  --lean: (optional) Write the dictionary without the keys that change no result")
+    print("  --benchmark: (optional) Time the automaton against the plugin's alternation regex on the")
+    print("               translations of .txt translation files and the lines of dumps")
+    print("  --apply: (optional) Replace keywords in the translations of .txt files and in dump lines,")
+    print("           the files are written to --output with the same relative paths")
+    print()
+    print("Notes:")
+    print("  - The longest keyword at the leftmost position wins and replaced text is not searched again,")
+    print("    the same as the plugin's regex")
+    print("  - $ regex rules are not changed by --apply, the plugin replaces keywords after filling the template")
+    print(f"  - --apply uses the automaton from {AUTOMATON_MIN_KEYWORDS} keywords on, with fewer the regex is faster")
+    print()
+
+def main():
+    """Main function to handle command line arguments"""
+
+    args = sys.argv.copy()
+    if len(args) < 2 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    top = pop_option(args, "--top", str(REPORT_TOP_KEYS))
+    if top is None or not top.isdigit():
+        print("Error: --top requires a non-negative integer")
+        return 2
+    top = int(top) or None
+
+    paths = {}
+    for option in ("--lean", "--benchmark", "--apply", "--output"):
+        value = pop_option(args, option)
+        if option in sys.argv and value is None:
+            print(f"Error: {option} requires a path")
+            return 2
+        paths[option] = Path(value) if value is not None else None
+    if (paths["--apply"] is None) != (paths["--output"] is None):
+        print("Error: --apply and --output must be used together")
+        return 2
+
+    keyword_file = Path(args[1])
+    for path in (keyword_file, paths["--benchmark"], paths["--apply"]):
+        if path is not None and not path.exists():
+            print(f"Error: Path {path} does not exist")
+            return 2
+
+    try:
+        pairs = read_keyword_pairs(keyword_file)
+    except (OSError, ValueError) as e:
+        print(f"✗ Cannot read {keyword_file}: {e}")
+        return 1
+
+    start_time = time.perf_counter()
+    report = analyze_keywords(pairs)
+    keywords = report['keywords']
+    print(f"Loaded {len(keywords):,} keywords from {keyword_file}, checked in {time.perf_counter() - start_time:.3f} s")
+
+    def print_section(title, items, describe):
+        if not items:
+            return
+        print()
+        print(f"{title} ({len(items)}):")
+        for item in items[:top]:
+            print(f"  {describe(item)}")
+        if top is not None and len(items) > top:
+            print(f"  ... {len(items) - top} more")
+
+    print_section("Duplicate keys, the plugin keeps the last value", report['duplicates'],
+                  lambda key: f"\"{shorten(key)}\"")
+    print_section("Empty keys, ignored by the plugin", report['empty'], lambda key: "\"\"")
+    print_section("Keys containing other keys, which are not replaced inside them", report['contained'],
+                  lambda item: f"\"{shorten(item[0])}\" contains \"{shorten(item[1])}\""
+                  + (f" and {item[2] - 1} more" if item[2] > 1 else ""))
+    print_section("Keys overlapping a following key, text spanning both only replaces the first", report['overlaps'],
+                  lambda item: f"\"{shorten(item[0])}\" shares \"{shorten(item[0][len(item[0]) - item[2]:])}\" "
+                  f"with \"{shorten(item[1])}\"")
+    print_section("Keys that change no result, the other keys give the same text", report['removable'],
+                  lambda key: f"\"{shorten(key)}\" -> \"{shorten(keywords[key])}\"")
+
+    if paths["--lean"] is not None:
+        removed = set(report['removable']) | set(report['empty'])
+        lean = {key: value for key, value in keywords.items() if key not in removed}
+        paths["--lean"].parent.mkdir(parents=True, exist_ok=True)
+        with open(paths["--lean"], 'w', encoding='utf-8') as outfile:
+            json.dump(lean, outfile, ensure_ascii=False, indent=2)
+        print()
+        print(f"✓ Wrote {len(lean):,} of {len(keywords):,} keywords to {paths['--lean']}")
+
+    if paths["--benchmark"] is not None:
+        texts = read_texts(paths["--benchmark"])
+        char_count = sum(len(text) for text in texts)
+        print()
+        print(f"Benchmark on {len(texts):,} texts ({char_count:,} characters):")
+
+        start_time = time.perf_counter()
+        _, keyword_regex = load_keywords(keyword_file)
+        regex_build = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        expected = [replace_keywords(text, keywords, keyword_regex) for text in texts]
+        regex_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        automaton = build_automaton(keywords)
+        automaton_build = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        results = [replace_text(automaton, text)[0] for text in texts]
+        automaton_time = time.perf_counter() - start_time
+
+        for label, build_time, replace_time in (("Alternation regex", regex_build, regex_time),
+                                                ("Aho-Corasick", automaton_build, automaton_time)):
+            print(f"  {label}: built in {build_time:.3f} s, replaced in {replace_time:.3f} s"
+                  + (f" ({char_count / replace_time / 1e6:.2f} M characters/s)" if replace_time > 0 else ""))
+        if automaton_time > 0:
+            print(f"  Speedup: {regex_time / automaton_time:.2f}x")
+        mismatches = [(text, want, got) for text, want, got in zip(texts, expected, results) if want != got]
+        if mismatches:
+            print(f"✗ {len(mismatches):,} texts differ from the regex:")
+            for text, want, got in mismatches[:REPORT_MISMATCHES]:
+                print(f"  \"{shorten(text)}\": regex \"{shorten(want)}\", automaton \"{shorten(got)}\"")
+        else:
+            print(f"  ✓ Same result as the regex on every text, {sum(want != text for text, want in zip(texts, expected)):,} changed")
+
+    if paths["--apply"] is not None:
+        input_path = paths["--apply"]
+        output_folder = paths["--output"]
+        changed_lines = 0
+        replacements = 0
+        files = iter_text_files(input_path)
+        if len(keywords) >= AUTOMATON_MIN_KEYWORDS:
+            automaton = build_automaton(keywords)
+            replace = lambda text: replace_text(automaton, text)
+        else:
+            keyword_regex = load_keywords(keyword_file)[1]
+            replace = lambda text: replace_text_regex(text, keywords, keyword_regex)
+        for file_path, relative_path in files:
+            data = file_path.read_bytes()
+            has_bom = data.startswith(BYTE_ORDER_MARK.encode('utf-8'))
+            lines = []
+            for line in data.decode('utf-8-sig', 'replace').splitlines(keepends=True):
+                content = line.rstrip('\r\n')
+                prefix, text = split_line(content)
+                if text:
+                    replaced, count = replace(text)
+                    replacements += count
+                    if replaced != text:
+                        changed_lines += 1
+                        line = prefix + replaced + line[len(content):]
+                lines.append(line)
+            output_file = output_folder / relative_path
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_file, 'w', encoding='utf-8-sig' if has_bom else 'utf-8', newline='') as outfile:
+                outfile.writelines(lines)
+        print()
+        print(f"✓ Replaced {replacements:,} keywords, changed {changed_lines:,} lines of {len(files)} files, written to {output_folder}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
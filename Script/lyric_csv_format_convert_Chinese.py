@@ -3,174 +3,1283 @@
 # Function: 将歌词时间轴CSV格式转换为包含翻译字段的格式 Convert lyric timeline CSV format to format with translation fields
 # Author: claude 4 & 90135
 # Creation date: 2025-07-19
-# Version: 2025-08-02_01
+# Version: 2026-10-17_10
 # License: Bsd-3
 
+import codecs
+import contextlib
+import cProfile
 import csv
+import ctypes
+import errno
+import hashlib
+import io
+import itertools
+import json
 import os
+import select
+import struct
 import sys
-from pathlib import Path
+import tarfile
+import time
+import tracemalloc
+import zipfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
 
-def detect_csv_format(input_file):
+# 格式检测时从文件开头读取的行数
+FORMAT_SAMPLE_ROWS = 20
+
+# 表头行的得分，匹配的表头比少量有歧义的数据行更可信
+HEADER_SCORE = 3
+
+def score_csv_row(row):
+    """
+    计算单行与各格式的匹配得分
+
+    Args:
+        row (list): 解析后的CSV行
+
+    Returns:
+        tuple: (格式1得分, 格式2得分)
+    """
+
+    if not row:
+        return 0, 0
+
+    # 检查是否为格式2表头 (包含ID和日文列名)
+    if (len(row) >= 4 and
+        'ID' in row[0] and
+        ('開始時間' in row[1] or '終了時間' in row[2] or 'ローカライズ用キー名' in row[3])):
+        return 0, HEADER_SCORE
+
+    # 检查是否为格式1表头 (原始格式)
+    if (len(row) >= 3 and
+        (row[0].strip() in ['開始時間(秒)', '開始時間', 'StartTime', 'Start Time', 'start_time'] or
+         row[1].strip() in ['結束時間(秒)', '結束時間', 'EndTime', 'End Time', 'end_time'] or
+         row[2].strip() in ['歌詞', 'Lyric', 'Lyrics', 'OriginalLyric', 'Original Lyric'])):
+        return HEADER_SCORE, 0
+
+    # 格式2数据行为数字ID加两个时间
+    if len(row) >= 4:
+        try:
+            int(row[0])
+            float(row[1])
+            float(row[2])
+            return 0, 1
+        except ValueError:
+            pass
+
+    # 格式1数据行直接以两个时间开始
+    if len(row) >= 3:
+        try:
+            float(row[0])
+            float(row[1])
+            return 1, 0
+        except ValueError:
+            pass
+
+    return 0, 0
+
+def sniff_csv_format(sample):
+    """
+    根据样本行检测格式类型
+
+    Args:
+        sample (list): 文件开头的若干行
+
+    Returns:
+        str: 格式类型 ('format1', 'format2', 'unknown')
+    """
+
+    format1_score = 0
+    format2_score = 0
+    for row in sample:
+        row_format1_score, row_format2_score = score_csv_row(row)
+        format1_score += row_format1_score
+        format2_score += row_format2_score
+
+    if format1_score == 0 and format2_score == 0:
+        return 'unknown'
+    return 'format2' if format2_score > format1_score else 'format1'
+
+# 歌词文件输出列顺序
+OUTPUT_FIELDNAMES = ('StartTime', 'EndTime', 'OriginalLyric', 'TranslatedLyric')
+
+# 本次运行的性能分析数据，由 --profile 设置；为 None 时转换过程中不执行计时代码
+PROFILE = None
+
+# 性能分析摘要中列出的最慢文件数
+PROFILE_TOP_FILES = 10
+
+def start_profile(use_cprofile=False):
+    """
+    开始收集本次运行各阶段的耗时、跟踪的内存和每个文件的耗时
+
+    Args:
+        use_cprofile (bool): 同时运行 cProfile，用于生成 pstats 可读取的转储
+    """
+
+    global PROFILE
+    PROFILE = {'stages': {}, 'nested': [], 'files': [], 'start_time': time.perf_counter(), 'cprofile': None}
+    tracemalloc.start()
+    if use_cprofile:
+        PROFILE['cprofile'] = cProfile.Profile()
+        PROFILE['cprofile'].enable()
+
+@contextlib.contextmanager
+def profile_stage(stage):
+    """
+    性能分析时将代码块作为一个阶段计时，嵌套在其内部的阶段的耗时不会重复计算
+
+    Args:
+        stage (str): 阶段名称
+    """
+
+    if PROFILE is None:
+        yield
+        return
+    PROFILE['nested'].append(0.0)
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start_time
+        PROFILE['stages'][stage] = PROFILE['stages'].get(stage, 0.0) + elapsed - PROFILE['nested'].pop()
+        if PROFILE['nested']:
+            PROFILE['nested'][-1] += elapsed
+
+def profile_iter(stage, iterable):
+    """
+    包装可迭代对象，使生成每一项的耗时计入一个阶段
+
+    Args:
+        stage (str): 阶段名称
+        iterable (iterable): 被包装的可迭代对象
+
+    Yields:
+        可迭代对象中的项
+    """
+
+    iterator = iter(iterable)
+    while True:
+        with profile_stage(stage):
+            item = next(iterator, iterator)
+        if item is iterator:
+            return
+        yield item
+
+def profile_file(file_name, convert):
+    """
+    转换单个文件，性能分析时记录其耗时和行数
+
+    转换过程中未计入其进入的阶段的耗时计入 write。
+
+    Args:
+        file_name (str): 摘要中显示的文件名
+        convert (callable): 转换函数，返回记录数
+
+    Returns:
+        convert 的返回值
+    """
+
+    if PROFILE is None:
+        return convert()
+
+    result = -1
+    start_time = time.perf_counter()
+    try:
+        with profile_stage('write'):
+            result = convert()
+    finally:
+        PROFILE['files'].append((str(file_name), time.perf_counter() - start_time,
+                                 result if result is not None else -1))
+    return result
+
+def finish_profile(top_files=PROFILE_TOP_FILES, output_file=None):
+    """
+    停止性能分析，打印摘要，并可选地写入文件
+
+    Args:
+        top_files (int): 列出的最慢文件数
+        output_file (str): 写入 JSON 摘要（.json）或 cProfile 转储（其他扩展名）（可选）
+    """
+
+    global PROFILE
+    profile, PROFILE = PROFILE, None
+    if profile['cprofile'] is not None:
+        profile['cprofile'].disable()
+    total_time = time.perf_counter() - profile['start_time']
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stages = dict(profile['stages'])
+    stages['other'] = max(0.0, total_time - sum(stages.values()))
+    slowest_files = sorted(profile['files'], key=lambda file: file[1], reverse=True)[:top_files]
+
+    print()
+    print("=" * 50)
+    print("性能分析摘要")
+    print(f"  总耗时: {total_time:.3f} 秒，文件数: {len(profile['files'])}")
+    print(f"  {'阶段':<10}{'耗时 (秒)':>11}{'占比':>7}")
+    for stage, stage_time in stages.items():
+        share = stage_time / total_time if total_time else 0
+        print(f"  {stage:<12}{stage_time:>12.3f}{share:>9.1%}")
+    print(f"  跟踪的内存峰值: {peak_memory / (1024 * 1024):.1f} MB (tracemalloc)")
+    if slowest_files:
+        print(f"  最慢的 {len(slowest_files)} 个文件:")
+        for file_name, file_time, rows in slowest_files:
+            rows_text = f"{rows:>10,} 行" if rows >= 0 else f"{'失败':>10}"
+            print(f"    {file_time:>9.3f} 秒 {rows_text}  {file_name}")
+    print("  注意：耗时包含性能分析本身的开销，请比较各阶段的占比而不是绝对耗时")
+
+    if output_file is None:
+        return
+
+    if output_file.lower().endswith('.json'):
+        with open(output_file, 'w', encoding='utf-8') as outfile:
+            json.dump({
+                'total_time': total_time,
+                'stages': stages,
+                'peak_traced_memory': peak_memory,
+                'slowest_files': [{'file': file_name, 'time': file_time, 'rows': rows}
+                                  for file_name, file_time, rows in slowest_files]
+            }, outfile, ensure_ascii=False, indent=2)
+    elif profile['cprofile'] is not None:
+        profile['cprofile'].dump_stats(output_file)
+    print(f"  性能分析结果已写入 {output_file}")
+
+# 本次运行的进度输出，由 --quiet 或 --progress=jsonl 设置；为 None 时打印通常的控制台文本
+PROGRESS = None
+
+# --progress 可选的进度输出模式，"text" 为通常的控制台文本
+PROGRESS_MODES = ('text', 'jsonl')
+
+# JSON lines 进度模式下吞吐量事件之间的最小间隔秒数
+PROGRESS_INTERVAL = 1.0
+
+# 进度输出写入器的缓冲区大小（字节）
+PROGRESS_BUFFER_SIZE = 64 * 1024
+
+@contextlib.contextmanager
+def progress_output(mode=None):
+    """
+    通过带缓冲的写入器输出进度，而不是逐行打印控制台文本
+
+    本次运行的其他控制台文本保存在内存中，如果运行在输出摘要之前结束，则写入 stderr，以免丢失错误信息。
+
+    Args:
+        mode (str): "jsonl" 每行写入一个 JSON 事件，"quiet" 只写入最终摘要，None 打印通常的控制台文本
+    """
+
+    global PROGRESS
+    if mode is None:
+        yield
+        return
+
+    sys.stdout.flush()
+    writer = open(sys.stdout.fileno(), 'w', encoding='utf-8', buffering=PROGRESS_BUFFER_SIZE, closefd=False)
+    start_time = time.perf_counter()
+    PROGRESS = {'mode': mode, 'writer': writer, 'start_time': start_time, 'last_event_time': start_time,
+                'total_files': 0, 'done_files': 0, 'rows': 0, 'summary': False}
+    console_output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(console_output):
+            yield
+    finally:
+        progress, PROGRESS = PROGRESS, None
+        progress['writer'].close()
+        if not progress['summary']:
+            sys.stderr.write(console_output.getvalue())
+
+def write_progress_event(event):
+    """
+    写入一个 JSON lines 事件
+
+    Args:
+        event (dict): 事件字段
+    """
+
+    PROGRESS['writer'].write(json.dumps(event, ensure_ascii=False) + '\n')
+
+def run_file(file_name, convert):
+    """
+    转换单个文件，启用进度输出时捕获其控制台输出
+
+    Args:
+        file_name (str): 性能分析摘要中显示的文件名
+        convert (callable): 转换函数，返回记录数
+
+    Returns:
+        tuple: (convert 的返回值, 捕获的控制台输出，已直接打印时为 None, 耗时秒数)
+    """
+
+    start_time = time.perf_counter()
+    if PROGRESS is None:
+        return profile_file(file_name, convert), None, time.perf_counter() - start_time
+
+    console_output = io.StringIO()
+    with contextlib.redirect_stdout(console_output):
+        result = profile_file(file_name, convert)
+    return result, console_output.getvalue(), time.perf_counter() - start_time
+
+def report_file(file_name, record_count, console_output=None, **fields):
+    """
+    在进度模式下报告一个已转换的文件
+
+    失败文件的控制台输出会被保留，JSON lines 模式下作为事件的 message，quiet 模式下写入 stderr。
+
+    Args:
+        file_name (str): 相对于输入文件夹的文件名
+        record_count (int): 转换的记录数，无有效数据时为 0，出错时为 -1，跳过时为 None
+        console_output (str): 转换过程的控制台输出（可选）
+        **fields: 其他事件字段，例如 format、bytes 和 duration，值为 None 的字段不写入
+    """
+
+    status = ('skipped' if record_count is None else 'ok' if record_count > 0
+              else 'empty' if record_count == 0 else 'failed')
+    PROGRESS['done_files'] += 1
+    PROGRESS['rows'] += max(record_count or 0, 0)
+
+    if PROGRESS['mode'] == 'quiet':
+        if status == 'failed' and console_output:
+            sys.stderr.write(console_output)
+        return
+
+    event = {'event': 'file', 'path': Path(file_name).as_posix(), 'status': status, 'rows': record_count, **fields}
+    event = {key: round(value, 6) if isinstance(value, float) else value
+             for key, value in event.items() if value is not None}
+    if status == 'failed' and console_output:
+        event['message'] = console_output.strip()
+    write_progress_event(event)
+
+    now = time.perf_counter()
+    if now - PROGRESS['last_event_time'] < PROGRESS_INTERVAL:
+        return
+    PROGRESS['last_event_time'] = now
+    elapsed = now - PROGRESS['start_time']
+    done_files, total_files = PROGRESS['done_files'], PROGRESS['total_files']
+    write_progress_event({
+        'event': 'progress',
+        'done_files': done_files,
+        'total_files': total_files,
+        'rows': PROGRESS['rows'],
+        'elapsed': round(elapsed, 3),
+        'files_per_second': round(done_files / elapsed, 1),
+        'rows_per_second': round(PROGRESS['rows'] / elapsed, 1),
+        'eta': round(max(total_files - done_files, 0) * elapsed / done_files, 1) if total_files else None
+    })
+
+def print_summary(successful_files, total_files, total_processed, skipped_files=None):
+    """
+    打印批量处理的最终摘要，输出为控制台文本或摘要事件
+
+    Args:
+        successful_files (int): 有转换记录的文件数
+        total_files (int): 输入文件数
+        total_processed (int): 转换的记录总数
+        skipped_files (int): 增量模式下跳过的未改变文件数（可选）
+    """
+
+    lines = [
+        "批量处理完成！",
+        f"成功处理文件: {successful_files}/{total_files}",
+        f"总共转换记录: {total_processed} 条"
+    ]
+    if skipped_files is not None:
+        lines.append(f"跳过未改变的文件: {skipped_files}")
+
+    if PROGRESS is None:
+        for line in lines:
+            print(line)
+        return
+
+    PROGRESS['summary'] = True
+    if PROGRESS['mode'] == 'quiet':
+        PROGRESS['writer'].write('\n'.join(lines) + '\n')
+        return
+
+    event = {'event': 'summary', 'successful_files': successful_files, 'total_files': total_files,
+             'records': total_processed, 'elapsed': round(time.perf_counter() - PROGRESS['start_time'], 3)}
+    if skipped_files is not None:
+        event['skipped_files'] = skipped_files
+    write_progress_event(event)
+
+# 所有输入文件的编码，由 --force-encoding 设置；None 时逐个文件检测编码
+FORCE_ENCODING = None
+
+# 通过字节顺序标记识别的编码
+BOM_ENCODINGS = ((codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF16_LE, 'utf-16'), (codecs.BOM_UTF16_BE, 'utf-16'))
+
+# 对没有字节顺序标记的文件依次尝试的编码，cp932 即带 Windows 扩展的 Shift_JIS
+DETECT_ENCODINGS = ('utf-8', 'cp932')
+
+# 为检测编码从文件开头读取的字节数
+ENCODING_SAMPLE_SIZE = 256 * 1024
+
+def set_force_encoding(encoding):
+    """
+    设置所有输入文件的编码，同时也是工作进程的初始化函数
+
+    Args:
+        encoding (str): 编码名称，None 时逐个文件检测编码
+    """
+
+    global FORCE_ENCODING
+    FORCE_ENCODING = encoding
+
+def detect_encoding(input_stream):
+    """
+    根据字节顺序标记或内容开头检测二进制流的编码
+
+    没有字节顺序标记时，将样本依次交给 DETECT_ENCODINGS 中每种编码的增量解码器，
+    因此样本末尾被截断的字符不算错误。
+
+    Args:
+        input_stream (file): 二进制流，从当前位置读取 ENCODING_SAMPLE_SIZE 字节
+
+    Returns:
+        str: 编码名称，没有编码能解码样本时返回 None
+    """
+
+    sample = input_stream.read(ENCODING_SAMPLE_SIZE)
+    for bom, encoding in BOM_ENCODINGS:
+        if sample.startswith(bom):
+            return encoding
+
+    for encoding in DETECT_ENCODINGS:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(sample, final=len(sample) < ENCODING_SAMPLE_SIZE)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    return None
+
+def open_input(input_file, input_stream=None):
+    """
+    以文本方式打开输入CSV文件，或包装已打开的二进制流（例如压缩包成员）
+
+    编码为 FORCE_ENCODING 或由 detect_encoding 检测，文本在读取时分块解码，因此不会整个载入文件。
+
+    Args:
+        input_file (str): 输入CSV文件路径
+        input_stream (file): 输入文件的可定位二进制流（可选）
+
+    Returns:
+        file: 文本流
+
+    Raises:
+        ValueError: 无法检测编码
+    """
+
+    binary_stream = open(input_file, 'rb') if input_stream is None else input_stream
+    try:
+        encoding = FORCE_ENCODING
+        if encoding is None:
+            with profile_stage('encoding'):
+                start = binary_stream.tell()
+                encoding = detect_encoding(binary_stream)
+                binary_stream.seek(start)
+            if encoding is None:
+                raise ValueError(f"无法检测编码（已尝试 {', '.join(DETECT_ENCODINGS)}），"
+                                 f"请用 --force-encoding 指定编码")
+            if encoding not in ('utf-8', 'utf-8-sig'):
+                print(f"  检测到编码: {encoding}")
+        return io.TextIOWrapper(binary_stream, encoding=encoding)
+    except BaseException:
+        if input_stream is None:
+            binary_stream.close()
+        raise
+
+def read_lyric_rows(input_file, file_info=None, sample_rows=FORMAT_SAMPLE_ROWS, input_stream=None):
+    """
+    逐行读取并转换歌词时间轴CSV
+
+    格式根据流开头的若干行检测，这些行保留在内存中，随后与流的其余部分一起解析，
+    因此文件只需打开和解码一次。
+
+    Args:
+        input_file (str): 输入CSV文件路径
+        file_info (dict): 可选，检测到的格式会写入其 'format' 键
+        sample_rows (int): 用于格式检测的行数
+        input_stream (file): 代替打开 input_file 读取的二进制流（可选）
+
+    Yields:
+        tuple: (StartTime, EndTime, OriginalLyric, TranslatedLyric)
+    """
+
+    with open_input(input_file, input_stream) as infile:
+        if PROFILE is None:
+            reader = csv.reader(infile)
+        else:
+            reader = profile_iter('parse', csv.reader(profile_iter('decode', infile)))
+
+        # 检测文件格式
+        sample = list(itertools.islice(reader, sample_rows))
+        with profile_stage('detect'):
+            file_format = sniff_csv_format(sample)
+        print(f"  检测到文件格式: {file_format}")
+        if file_info is not None:
+            file_info['format'] = file_format
+
+        for row in itertools.chain(sample, reader):
+            # 跳过空行
+            if not row or len(row) < 3:
+                continue
+
+            # 根据格式处理数据
+            if file_format == 'format2':
+                # 格式2: ID,開始時間,終了時間,ローカライズ用キー名
+                if len(row) < 4:
+                    continue
+
+                id_field = row[0].strip()
+                start_time = row[1].strip()
+                end_time = row[2].strip()
+                original_lyric = row[3].strip()
+
+                # 跳过表头行
+                if (id_field in ['ID', 'id'] or
+                    start_time in ['開始時間', 'StartTime', 'Start Time'] or
+                    end_time in ['終了時間', 'EndTime', 'End Time'] or
+                    original_lyric in ['ローカライズ用キー名', 'OriginalLyric', 'Lyric']):
+                    continue
+
+                # 验证ID是否为数字（可选验证）
+                try:
+                    int(id_field)
+                except ValueError:
+                    # ID不是数字，可能是表头或无效行，跳过
+                    continue
+
+            else:
+                # 格式1: 开始时间(秒),结束时间(秒),歌词
+                start_time = row[0].strip()
+                end_time = row[1].strip()
+                original_lyric = row[2].strip() if len(row) > 2 else ""
+
+                # 跳过表头行
+                if (start_time in ['開始時間(秒)', '開始時間', 'StartTime', 'Start Time', 'start_time'] or
+                    end_time in ['結束時間(秒)', '結束時間', 'EndTime', 'End Time', 'end_time'] or
+                    original_lyric in ['歌詞', 'Lyric', 'Lyrics', 'OriginalLyric', 'Original Lyric']):
+                    continue
+
+            # 共同验证：检查时间格式
+            try:
+                # 尝试将开始时间和结束时间转换为浮点数
+                float(start_time)
+                float(end_time)
+            except ValueError:
+                # 如果不能转换为数字，跳过这一行
+                continue
+
+            # 跳过空歌词
+            if not original_lyric:
+                continue
+
+            # 创建新的行数据（翻译字段留空）
+            yield (start_time, end_time, original_lyric, '')
+
+def write_csv_rows(output_file, fieldnames, rows):
+    """
+    边产生边写入输出文件
+
+    数据先写入输出文件旁的临时文件，输入读取完毕后再替换输出文件。
+    因此原地转换（输出文件即输入文件）仍然安全，失败时也不会留下写了一半的输出。
+
+    Args:
+        output_file (str): 输出CSV文件路径
+        fieldnames (tuple): 表头，仅在至少有一行数据时写入
+        rows (iterable): 行元组
+
+    Returns:
+        int: 写入的行数
+    """
+
+    output_file = Path(output_file)
+    temp_file = output_file.with_name(output_file.name + '.tmp')
+    row_count = 0
+
+    try:
+        with open(temp_file, 'w', encoding='utf-8-sig', newline='') as outfile:
+            writer = csv.writer(outfile)
+            for row in rows:
+                if row_count == 0:
+                    writer.writerow(fieldnames)
+                writer.writerow(row)
+                row_count += 1
+        os.replace(temp_file, output_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+    return row_count
+
+# normalize_lyric_rows 检测的时间轴问题及其报告名称
+TIMELINE_ISSUES = {
+    'unsorted': "顺序错误",
+    'negative': "时长为负",
+    'zero_length': "时长为零",
+    'duplicate': "重复",
+    'overlap': "时间重叠"
+}
+
+def normalize_lyric_rows(rows, fix=False, report=None):
+    """
+    按开始时间排序歌词行并检测时间轴问题，可选择修复
+
+    LyricManger 按 StartTime 排序歌词行，播放时只有当前行结束后才会移到下一行，
+    时间与插件一样按32位浮点数比较。因此与前一行重叠的行会延迟显示或不显示，
+    时长为零或为负的行永远不会显示。
+    修复时：
+    - 时长为负的行交换开始和结束时间
+    - 删除时长为零的行，插件从不显示它们
+    - 删除重复行（时间和 OriginalLyric 相同），保留 TranslatedLyric
+    - 被重叠的行截断到下一行开始时结束，两行开始时间相同时则合并为一行，每段文本一行
+
+    Args:
+        rows (iterable): 时间为数值的 (StartTime, EndTime, OriginalLyric, TranslatedLyric) 元组
+        fix (bool): 修复问题而不只是报告
+        report (dict): 可选，写入 TIMELINE_ISSUES 中每种问题的行数，
+            以及读取的行数 'lines' 和写入的行数 'written'
+
+    Returns:
+        list: 按开始时间排序的行
+    """
+
+    rows = [list(row) for row in rows]
+    starts = array('f', (float(row[0]) for row in rows))
+    ends = array('f', (float(row[1]) for row in rows))
+    issues = dict.fromkeys(TIMELINE_ISSUES, 0)
+
+    for index, row in enumerate(rows):
+        if ends[index] < starts[index]:
+            issues['negative'] += 1
+            if fix:
+                row[0], row[1] = row[1], row[0]
+                starts[index], ends[index] = ends[index], starts[index]
+
+    # 只排序一次，稳定排序使开始时间相同的行保持文件中的顺序
+    issues['unsorted'] = sum(1 for index in range(1, len(rows)) if starts[index] < starts[index - 1])
+    order = sorted(range(len(rows)), key=starts.__getitem__)
+
+    # 保留的行 [row, start, end]、目前最晚的结束时间和已出现的 (start, end, OriginalLyric)
+    normalized = []
+    max_end = float('-inf')
+    seen_lines = set()
+
+    for index in order:
+        row, start, end = rows[index], starts[index], ends[index]
+
+        # 每行只计入它的第一个问题，修复不会改变计数
+        if end == start:
+            issues['zero_length'] += 1
+            if not fix:
+                normalized.append([row, start, end])
+            continue
+
+        line = (start, end, row[2])
+        if line in seen_lines:
+            issues['duplicate'] += 1
+            if not fix:
+                normalized.append([row, start, end])
+            elif not normalized[-1][0][3]:
+                # 开始时间相同的行已合并，因此被重复的行是最后保留的行
+                normalized[-1][0][3] = row[3]
+            continue
+        seen_lines.add(line)
+
+        if start < max_end:
+            issues['overlap'] += 1
+            if fix:
+                # 更早的行已在前一行开始前结束，因此只有前一行重叠
+                previous = normalized[-1]
+                if start == previous[1]:
+                    previous[0][2] += '\n' + row[2]
+                    if previous[0][3] or row[3]:
+                        previous[0][3] += '\n' + row[3]
+                    if end > previous[2]:
+                        previous[0][1], previous[2] = row[1], end
+                    max_end = max(max_end, end)
+                    continue
+                previous[0][1], previous[2] = row[0], start
+                max_end = start
+
+        normalized.append([row, start, end])
+        max_end = max(max_end, end)
+
+    if report is not None:
+        report.update(issues)
+        report['lines'] = len(rows)
+        report['written'] = len(normalized)
+    return [tuple(row) for row, _, _ in normalized]
+
+def describe_timeline(report, fix=False):
+    """
+    用一行描述 normalize_lyric_rows 报告中的时间轴问题
+
+    Args:
+        report (dict): normalize_lyric_rows 的报告，或多个报告的总和
+        fix (bool): 问题是否已修复
+
+    Returns:
+        str: 报告行
+    """
+
+    problems = [f"{report[issue]} 行{label}" for issue, label in TIMELINE_ISSUES.items() if report.get(issue)]
+    if not problems:
+        return f"✓ 时间轴：已排序 {report.get('lines', 0)} 行，没有问题"
+    if fix:
+        return f"✓ 时间轴已修复：{'，'.join(problems)}，写入 {report.get('written', 0)}/{report.get('lines', 0)} 行"
+    return f"⚠ 时间轴问题：{'，'.join(problems)}（仅排序，使用 --fix-timeline 修复）"
+
+def add_report(total, report):
+    """
+    将单个文件的报告（时间轴或翻译）累加到批处理的总计中
+
+    Args:
+        total (dict): 总计报告，原地修改
+        report (dict): 单个文件的报告，文件没有该报告时为 None
+    """
+
+    if report is None:
+        return
+    for key, value in report.items():
+        total[key] = total.get(key, 0) + value
+
+# 保留翻译时每个文件列出的未使用已翻译行数
+ORPHAN_PREVIEW_LINES = 5
+
+def load_lyric_translations(lyric_file):
+    """
+    读取已有歌词文件中的行，以便沿用其翻译
+
+    同一文件夹中的所有CSV文件都写入同一个歌词文件，因此在其中第一个文件替换它之前只读取一次，
+    每个文件都与相同的行匹配。
+
+    Args:
+        lyric_file (str): 已有歌词文件路径
+
+    Returns:
+        list: (StartTime, EndTime, OriginalLyric, TranslatedLyric) 元组，文件不存在或不是歌词文件时为 None
+    """
+
+    lyric_file = Path(lyric_file)
+    if not lyric_file.is_file():
+        return None
+
+    lines = []
+    with open(lyric_file, 'r', encoding='utf-8-sig', newline='') as infile:
+        reader = csv.reader(infile)
+        # 与插件一样不区分大小写匹配表头名称
+        header = [name.strip().lower() for name in next(reader, [])]
+        try:
+            columns = [header.index(name.lower()) for name in OUTPUT_FIELDNAMES]
+        except ValueError:
+            return None
+
+        for row in reader:
+            if len(row) <= max(columns):
+                continue
+            start_time, end_time, original_lyric, translated_lyric = (row[column] for column in columns)
+            try:
+                float(start_time), float(end_time)
+            except ValueError:
+                continue
+            lines.append((start_time, end_time, original_lyric.strip(), translated_lyric))
+    return lines
+
+def index_lyric_translations(lines):
+    """
+    为 carry_translations 索引已有歌词文件中的行
+
+    行按 (StartTime, EndTime, OriginalLyric) 和仅按 OriginalLyric 建立索引。
+    索引列表按文件顺序倒序保存，从末尾取出的即为文件中第一个未使用的行。
+
+    Args:
+        lines (list): load_lyric_translations 读取的行
+
+    Returns:
+        dict: 'lines'、'exact' 和 'text' 索引以及每行的 'used' 标记
+    """
+
+    exact = {}
+    text = {}
+    for number, (start_time, end_time, original_lyric, _) in enumerate(lines):
+        exact.setdefault((float(start_time), float(end_time), original_lyric), []).append(number)
+        text.setdefault(original_lyric, []).append(number)
+
+    for indexes in itertools.chain(exact.values(), text.values()):
+        indexes.reverse()
+    return {'lines': lines, 'exact': exact, 'text': text, 'used': bytearray(len(lines))}
+
+def take_lyric_line(index, key, used):
+    """
+    取出第一个与键匹配的未使用已有行
+
+    Args:
+        index (dict): index_lyric_translations 的索引
+        key: 索引键
+        used (bytearray): 每个已有行的使用标记，原地修改
+
+    Returns:
+        int: 已有文件中的行号，没有匹配的未使用行时为 None
+    """
+
+    indexes = index.get(key)
+    while indexes:
+        line = indexes.pop()
+        if not used[line]:
+            used[line] = 1
+            return line
+    return None
+
+def carry_translations(rows, existing, report=None):
+    """
+    将已有歌词文件的翻译沿用到转换后的行
+
+    行优先使用时间和 OriginalLyric 都相同的已有行的 TranslatedLyric，否则使用 OriginalLyric 相同但
+    时间改变的行。每个已有行最多使用一次，因此重复的歌词按顺序保留各自的翻译。
+
+    Args:
+        rows (iterable): (StartTime, EndTime, OriginalLyric, TranslatedLyric) 元组
+        existing (dict): index_lyric_translations 索引的已有行
+        report (dict): 可选，读取完所有行后写入 'kept'（保留）、'changed'（时间改变）和 'new'（新增）的行数
+
+    Yields:
+        tuple: (StartTime, EndTime, OriginalLyric, TranslatedLyric)
+    """
+
+    counts = {'kept': 0, 'changed': 0, 'new': 0}
+    lines, used = existing['lines'], existing['used']
+
+    for row in rows:
+        line = take_lyric_line(existing['exact'], (float(row[0]), float(row[1]), row[2]), used)
+        if line is not None:
+            counts['kept'] += 1
+        else:
+            line = take_lyric_line(existing['text'], row[2], used)
+            if line is None:
+                counts['new'] += 1
+                yield row
+                continue
+            counts['changed'] += 1
+        yield row[:3] + (lines[line][3],)
+
+    if report is not None:
+        report.update(counts)
+
+def describe_translations(report):
+    """
+    用一行描述 carry_translations 的报告
+
+    Args:
+        report (dict): 已加入 'orphaned' 的报告，或多个报告的总和
+
+    Returns:
+        str: 报告行
+    """
+
+    line = (f"翻译：保留 {report.get('kept', 0)} 行，时间改变 {report.get('changed', 0)} 行，"
+            f"新增 {report.get('new', 0)} 行")
+    if report.get('orphaned'):
+        return f"⚠ {line}，{report['orphaned']} 行已翻译但未使用"
+    return f"✓ {line}"
+
+def convert_lyric_csv(input_file, output_file, file_info=None, sample_rows=FORMAT_SAMPLE_ROWS, input_stream=None,
+                      normalize=None, existing_lines=None):
+    """
+    将歌词时间轴CSV格式转换为包含翻译字段的格式
+    支持多种输入格式：
+    - 格式1: 开始时间(秒),结束时间(秒),歌词
+    - 格式2: ID,開始時間,終了時間,ローカライズ用キー名
+
+    输出格式: StartTime,EndTime,OriginalLyric,TranslatedLyric
+
+    Args:
+        input_file (str): 输入CSV文件路径
+        output_file (str): 输出CSV文件路径
+        file_info (dict): 可选，检测到的格式会写入其 'format' 键，normalize_lyric_rows 的报告写入 'timeline' 键，
+            保留翻译的报告写入 'translations' 键
+        sample_rows (int): 用于格式检测的行数
+        input_stream (file): 代替打开 input_file 读取的二进制流（可选）
+        normalize (str): "report" 按开始时间排序歌词行并报告时间轴问题，"fix" 同时修复问题，
+            None 保持输入顺序（默认为 None）
+        existing_lines (list): load_lyric_translations 读取的已有输出文件的行，保留其中的翻译（可选）
+
+    Returns:
+        int: 转换的记录数，无有效数据时为 0，出错时为 -1
+    """
+
+    try:
+        # 逐行从输入流式写入输出，内存占用不随文件大小增长
+        rows = read_lyric_rows(input_file, file_info, sample_rows, input_stream)
+        if PROFILE is not None:
+            rows = profile_iter('transform', rows)
+
+        # 共用输出文件的每个文件都与相同的已有行匹配
+        existing = None
+        if existing_lines is not None:
+            with profile_stage('merge'):
+                existing = index_lyric_translations(existing_lines)
+        if existing is not None:
+            translations = {}
+            rows = carry_translations(rows, existing, translations)
+            if PROFILE is not None:
+                rows = profile_iter('merge', rows)
+
+        # 规范化需要排序整个文件，因此其所有行保存在内存中
+        if normalize is not None:
+            timeline = {}
+            with profile_stage('normalize'):
+                rows = normalize_lyric_rows(rows, fix=normalize == 'fix', report=timeline)
+
+        record_count = write_csv_rows(output_file, OUTPUT_FIELDNAMES, rows)
+        if normalize is not None and timeline['lines'] > 0:
+            print("  " + describe_timeline(timeline, normalize == 'fix'))
+            if file_info is not None:
+                file_info['timeline'] = timeline
+        if existing is not None:
+            orphaned = [line for line, used in zip(existing['lines'], existing['used']) if not used and line[3]]
+            translations['orphaned'] = len(orphaned)
+            print("  " + describe_translations(translations))
+            for start_time, end_time, original_lyric, translated_lyric in orphaned[:ORPHAN_PREVIEW_LINES]:
+                print(f"    未使用: {start_time}-{end_time} {original_lyric} → {translated_lyric}")
+            if len(orphaned) > ORPHAN_PREVIEW_LINES:
+                print(f"    ……另有 {len(orphaned) - ORPHAN_PREVIEW_LINES} 行")
+            if file_info is not None:
+                file_info['translations'] = translations
+        return record_count
+
+    except UnicodeDecodeError as e:
+        print(f"处理文件 {input_file} 时发生错误: 不是有效的 {e.encoding} 编码（{e.reason}），请用 --force-encoding 指定编码")
+        return -1
+
+    except Exception as e:
+        print(f"处理文件 {input_file} 时发生错误: {e}")
+        return -1
+
+# 可代替文件夹作为输入的压缩包类型
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+
+def is_archive(input_path):
+    """
+    检查路径是否为支持的 zip 或 tar 压缩包
+
+    Args:
+        input_path (Path): 输入路径
+
+    Returns:
+        bool: .zip 和 .tar(.gz/.bz2/.xz) 文件返回 True
+    """
+
+    return input_path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+def is_member_path_unsafe(member_name):
+    """
+    使用与插件中 FileTool.IsZipPathUnsafe 相同的规则检查压缩包成员名称
+
+    拒绝空名称、上级目录引用以及绝对路径或根路径。
+
+    Args:
+        member_name (str): 压缩包中的成员名称
+
+    Returns:
+        bool: 成员不可使用时返回 True
+    """
+
+    if not member_name:
+        return True
+
+    # 统一路径分隔符
+    normalized_path = member_name.replace('\\', '/')
+
+    # 拒绝包含 "../"
+    if '../' in normalized_path:
+        return True
+
+    # 拒绝绝对路径，包括 Windows 盘符路径
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def iter_archive_csv_files(input_archive, recursive=True):
+    """
+    不解压地遍历 zip 或 tar 压缩包中的CSV成员
+
+    成员按压缩包中的顺序逐个打开，因此压缩的 tar 包只需向前解压一遍。
+
+    Args:
+        input_archive (Path): 压缩包路径
+        recursive (bool): 是否包含子文件夹中的成员
+
+    Yields:
+        tuple: (成员的相对路径, 成员的二进制流)
+    """
+
+    def get_relative_path(member_name):
+        if is_member_path_unsafe(member_name):
+            print(f"跳过不安全的压缩包成员: {member_name}")
+            return None
+        relative_path = PurePosixPath(member_name.replace('\\', '/'))
+        if relative_path.suffix != '.csv' or (not recursive and len(relative_path.parts) > 1):
+            return None
+        return relative_path
+
+    if zipfile.is_zipfile(input_archive):
+        with zipfile.ZipFile(input_archive) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                relative_path = get_relative_path(info.filename)
+                if relative_path is not None:
+                    with archive.open(info) as member_file:
+                        yield relative_path, member_file
+    else:
+        with tarfile.open(input_archive, 'r:*') as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                relative_path = get_relative_path(member.name)
+                if relative_path is not None:
+                    with archive.extractfile(member) as member_file:
+                        yield relative_path, member_file
+
+# 增量转换清单文件名，保存在输出文件夹中
+MANIFEST_FILENAME = ".convert_manifest.jsonl"
+
+def hash_file(input_file):
+    """
+    计算文件内容的 SHA-256 哈希
+
+    Args:
+        input_file (str): 文件路径
+
+    Returns:
+        str: 十六进制摘要
+    """
+
+    digest = hashlib.sha256()
+    with open(input_file, 'rb') as infile:
+        for chunk in iter(lambda: infile.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def get_file_state(input_file, entry=None):
+    """
+    获取输入文件的大小、修改时间和内容哈希
+
+    大小和修改时间未变时直接沿用清单条目中的哈希，因此不会读取未改变的文件。
+
+    Args:
+        input_file (str): 输入文件路径
+        entry (dict): 该文件的清单条目（可选）
+
+    Returns:
+        dict: {'size', 'mtime_ns', 'sha256'}
+    """
+
+    stat = os.stat(input_file)
+    if entry is not None and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+        sha256 = entry.get('sha256')
+    else:
+        sha256 = hash_file(input_file)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+
+def load_manifest(manifest_file):
+    """
+    加载转换清单
+
+    清单是 JSON lines 格式的日志，同一路径以后出现的行为准。
+    被中断的运行留下的不完整行会被忽略。
+
+    Args:
+        manifest_file (Path): 清单文件路径
+
+    Returns:
+        dict: 输入文件相对路径 -> 清单条目
+    """
+
+    manifest = {}
+    if not manifest_file.exists():
+        return manifest
+
+    with open(manifest_file, 'r', encoding='utf-8') as infile:
+        for line in infile:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and 'path' in entry:
+                manifest[entry['path']] = entry
+    return manifest
+
+def append_manifest_entry(manifest_file, manifest, entry):
+    """
+    在清单中记录一个已完成的文件
+
+    条目会立即追加到文件中，被中断的运行可以从最后完成的文件之后继续。
+
+    Args:
+        manifest_file (Path): 清单文件路径
+        manifest (dict): 已加载的清单，会被原地更新
+        entry (dict): 清单条目
+    """
+
+    manifest[entry['path']] = entry
+    with open(manifest_file, 'a', encoding='utf-8', newline='\n') as outfile:
+        outfile.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+def save_manifest(manifest_file, manifest, input_path):
+    """
+    重写清单，每个输入文件一行，并移除已删除输入文件的条目
+
+    Args:
+        manifest_file (Path): 清单文件路径
+        manifest (dict): 已加载的清单
+        input_path (Path): 输入文件夹路径
+    """
+
+    temp_file = manifest_file.with_name(manifest_file.name + '.tmp')
+    with open(temp_file, 'w', encoding='utf-8', newline='\n') as outfile:
+        for path in sorted(manifest):
+            if (input_path / path).exists():
+                outfile.write(json.dumps(manifest[path], ensure_ascii=False) + '\n')
+    os.replace(temp_file, manifest_file)
+
+def is_unchanged(entry, state, options, inputs, output_file):
+    """
+    检查增量模式下文件是否可以跳过
+
+    Args:
+        entry (dict): 该文件的清单条目，之前未转换过时为 None
+        state (dict): get_file_state 返回的当前文件状态
+        options (dict): 本次运行的转换选项
+        inputs (list): 共用输出文件的输入文件的相对路径（已排序）
+        output_file (Path): 输出文件路径
+
+    Returns:
+        bool: 内容和选项均未改变、输出文件由相同的输入文件共用且仍存在时为 True
+    """
+
+    return (entry is not None and
+            entry.get('sha256') == state['sha256'] and
+            entry.get('options') == options and
+            entry.get('inputs') == inputs and
+            output_file.exists())
+
+def convert_file_task(input_file, output_file, sample_rows=FORMAT_SAMPLE_ROWS, normalize=None, existing_lines=None):
     """
-    检测CSV文件的格式类型
+    工作进程入口，转换单个文件并捕获其控制台输出
 
     Args:
         input_file (str): 输入CSV文件路径
+        output_file (str): 输出CSV文件路径
+        sample_rows (int): 用于格式检测的行数
+        normalize (str): 时间轴规范化，"report"、"fix" 或 None
+        existing_lines (list): 已有输出文件的行，保留其中的翻译（可选）
 
     Returns:
-        str: 格式类型 ('format1', 'format2', 'unknown')
+        tuple: (记录数, 转换过程的控制台输出, 文件信息, 耗时秒数)
     """
-    try:
-        with open(input_file, 'r', encoding='utf-8-sig') as infile:
-            reader = csv.reader(infile)
-            first_row = next(reader, None)
-
-            if not first_row:
-                return 'unknown'
-
-            # 检查是否为格式2 (包含ID和日文列名)
-            if (len(first_row) >= 4 and
-                ('ID' in first_row[0] or first_row[0].strip() == 'ID') and
-                ('開始時間' in first_row[1] or '終了時間' in first_row[2] or 'ローカライズ用キー名' in first_row[3])):
-                return 'format2'
-
-            # 检查是否为格式1 (原始格式)
-            if (len(first_row) >= 3 and
-                (first_row[0].strip() in ['開始時間(秒)', '開始時間', 'StartTime', 'Start Time', 'start_time'] or
-                 first_row[1].strip() in ['結束時間(秒)', '結束時間', 'EndTime', 'End Time', 'end_time'] or
-                 first_row[2].strip() in ['歌詞', 'Lyric', 'Lyrics', 'OriginalLyric', 'Original Lyric'])):
-                return 'format1'
-
-            # 如果第一行不是表头，尝试检测数据格式
-            # 格式2通常第一列是数字ID
-            try:
-                int(first_row[0])
-                if len(first_row) >= 4:
-                    return 'format2'
-            except ValueError:
-                pass
-
-            # 格式1通常直接以时间开始
-            try:
-                float(first_row[0])
-                float(first_row[1])
-                if len(first_row) >= 3:
-                    return 'format1'
-            except ValueError:
-                pass
-
-    except Exception as e:
-        print(f"检测文件格式时发生错误: {e}")
 
-    return 'unknown'
+    start_time = time.perf_counter()
+    console_output = io.StringIO()
+    file_info = {}
+    with contextlib.redirect_stdout(console_output):
+        record_count = convert_lyric_csv(input_file, output_file, file_info, sample_rows, normalize=normalize,
+                                         existing_lines=existing_lines)
+    return record_count, console_output.getvalue(), file_info, time.perf_counter() - start_time
 
-def convert_lyric_csv(input_file, output_file):
+def convert_file_group_task(input_files, output_file, sample_rows=FORMAT_SAMPLE_ROWS, normalize=None,
+                            keep_translations=False):
     """
-    将歌词时间轴CSV格式转换为包含翻译字段的格式
-    支持多种输入格式：
-    - 格式1: 开始时间(秒),结束时间(秒),歌词
-    - 格式2: ID,開始時間,終了時間,ローカライズ用キー名
+    工作进程入口，按输入顺序转换共用同一输出文件的多个文件
 
-    输出格式: StartTime,EndTime,OriginalLyric,TranslatedLyric
+    同一文件夹中的所有CSV文件都会转换为同一个歌词文件。在一个工作进程中依次转换，
+    可以保证最终输出为输入顺序中的最后一个文件，与串行模式相同。
 
     Args:
-        input_file (str): 输入CSV文件路径
+        input_files (list): 输入CSV文件路径，按输入顺序
         output_file (str): 输出CSV文件路径
+        sample_rows (int): 用于格式检测的行数
+        normalize (str): 时间轴规范化，"report"、"fix" 或 None
+        keep_translations (bool): 保留输出文件中已有的 TranslatedLyric
+
+    Returns:
+        list: 每个输入文件的 (记录数, 转换过程的控制台输出, 文件信息, 耗时秒数)
     """
 
-    # 检测文件格式
-    file_format = detect_csv_format(input_file)
-    print(f"  检测到文件格式: {file_format}")
+    # 已有的输出文件只读取一次，在第一个文件替换它之前
+    existing_lines = load_lyric_translations(output_file) if keep_translations else None
+    return [convert_file_task(input_file, output_file, sample_rows, normalize, existing_lines)
+            for input_file in input_files]
 
-    try:
-        # 使用utf-8-sig编码处理BOM
-        with open(input_file, 'r', encoding='utf-8-sig') as infile:
-            reader = csv.reader(infile)
+def convert_files_parallel(tasks, jobs, sample_rows=FORMAT_SAMPLE_ROWS, normalize=None, keep_translations=False):
+    """
+    使用进程池转换文件
 
-            # 准备输出数据
-            output_data = []
+    Args:
+        tasks (list): (输入文件, 相对路径, 输出文件, 文件状态) 元组列表
+        jobs (int): 工作进程数
+        sample_rows (int): 用于格式检测的行数
+        normalize (str): 时间轴规范化，"report"、"fix" 或 None
+        keep_translations (bool): 保留输出文件中已有的 TranslatedLyric
 
-            for row_num, row in enumerate(reader, 1):
-                # 跳过空行
-                if not row or len(row) < 3:
-                    continue
+    Yields:
+        tuple: (记录数, 转换过程的控制台输出, 文件信息, 耗时秒数)，顺序与 tasks 相同
+    """
 
-                # 根据格式处理数据
-                if file_format == 'format2':
-                    # 格式2: ID,開始時間,終了時間,ローカライズ用キー名
-                    if len(row) < 4:
-                        continue
-
-                    id_field = row[0].strip()
-                    start_time = row[1].strip()
-                    end_time = row[2].strip()
-                    original_lyric = row[3].strip()
-
-                    # 跳过表头行
-                    if (id_field in ['ID', 'id'] or
-                        start_time in ['開始時間', 'StartTime', 'Start Time'] or
-                        end_time in ['終了時間', 'EndTime', 'End Time'] or
-                        original_lyric in ['ローカライズ用キー名', 'OriginalLyric', 'Lyric']):
-                        continue
-
-                    # 验证ID是否为数字（可选验证）
-                    try:
-                        int(id_field)
-                    except ValueError:
-                        # ID不是数字，可能是表头或无效行，跳过
-                        continue
+    executor = ProcessPoolExecutor(max_workers=jobs, initializer=set_force_encoding, initargs=(FORCE_ENCODING,))
+    try:
+        # 共用输出文件的多个文件由同一个工作进程按输入顺序转换
+        groups = {}
+        for index, (_, _, output_file, _) in enumerate(tasks):
+            groups.setdefault(output_file, []).append(index)
 
-                else:
-                    # 格式1: 开始时间(秒),结束时间(秒),歌词
-                    start_time = row[0].strip()
-                    end_time = row[1].strip()
-                    original_lyric = row[2].strip() if len(row) > 2 else ""
-
-                    # 跳过表头行
-                    if (start_time in ['開始時間(秒)', '開始時間', 'StartTime', 'Start Time', 'start_time'] or
-                        end_time in ['結束時間(秒)', '結束時間', 'EndTime', 'End Time', 'end_time'] or
-                        original_lyric in ['歌詞', 'Lyric', 'Lyrics', 'OriginalLyric', 'Original Lyric']):
-                        continue
-
-                # 共同验证：检查时间格式
-                try:
-                    # 尝试将开始时间和结束时间转换为浮点数
-                    float(start_time)
-                    float(end_time)
-                except ValueError:
-                    # 如果不能转换为数字，跳过这一行
-                    continue
+        futures = {}
+        for output_file, indexes in groups.items():
+            future = executor.submit(convert_file_group_task, [tasks[index][0] for index in indexes],
+                                     output_file, sample_rows, normalize, keep_translations)
+            for position, index in enumerate(indexes):
+                futures[index] = (future, position)
 
-                # 跳过空歌词
-                if not original_lyric:
-                    continue
+        for index, (csv_file, _, _, _) in enumerate(tasks):
+            future, position = futures[index]
+            try:
+                yield future.result()[position]
+            except Exception as e:
+                # 工作进程本身出错，按转换错误报告
+                yield -1, f"处理文件 {csv_file} 时发生错误: {e}\n", {}, None
+    finally:
+        executor.shutdown(cancel_futures=True)
 
-                # 创建新的行数据（翻译字段留空）
-                new_row = {
-                    'StartTime': start_time,
-                    'EndTime': end_time,
-                    'OriginalLyric': original_lyric,
-                    'TranslatedLyric': ''  # 翻译字段留空
-                }
-
-                output_data.append(new_row)
-
-        # 写入输出文件
-        with open(output_file, 'w', encoding='utf-8-sig', newline='') as outfile:
-            if output_data:
-                writer = csv.DictWriter(outfile, fieldnames=['StartTime', 'EndTime', 'OriginalLyric', 'TranslatedLyric'])
-                writer.writeheader()
-                writer.writerows(output_data)
-                return len(output_data)
-            else:
-                return 0
+def get_output_file(csv_file, input_path, output_path=None, output_suffix=""):
+    """
+    获取一个输入文件的歌词文件路径，该路径由其文件夹中的所有CSV文件共用
 
-    except Exception as e:
-        print(f"处理文件 {input_file} 时发生错误: {e}")
-        return -1
+    Args:
+        csv_file (Path): 输入CSV文件路径
+        input_path (Path): 输入文件夹路径
+        output_path (Path): 输出文件夹路径，None 时写在输入文件旁边
+        output_suffix (str): 输出文件名后缀（默认为空）
+
+    Returns:
+        Path: 输出文件路径
+    """
 
-def process_folder(input_folder, output_folder=None, output_suffix="", recursive=True):
+    output_filename = "lyric" + output_suffix + ".csv"
+    if output_path is None:
+        # 在原位置生成文件
+        return csv_file.parent / output_filename
+    # 在指定输出文件夹中保持相同的文件夹结构
+    return output_path / csv_file.relative_to(input_path).parent / output_filename
+
+def process_folder(input_folder, output_folder=None, output_suffix="", recursive=True, jobs=1, incremental=False,
+                   sample_rows=FORMAT_SAMPLE_ROWS, normalize=None, keep_translations=False, csv_files=None):
     """
     批量处理文件夹中的所有CSV文件（包括子文件夹）
 
@@ -179,6 +1288,12 @@ def process_folder(input_folder, output_folder=None, output_suffix="", recursive
         output_folder (str): 输出文件夹路径（可选，默认为输入文件夹）
         output_suffix (str): 输出文件名后缀（默认为空）
         recursive (bool): 是否递归处理子文件夹（默认为True）
+        jobs (int): 工作进程数，0 表示使用全部CPU核心（默认为1）
+        incremental (bool): 跳过自上次运行以来未改变的文件，由输出文件夹中的清单记录
+        sample_rows (int): 用于格式检测的行数
+        normalize (str): 时间轴规范化，"report"、"fix" 或 None（默认为 None）
+        keep_translations (bool): 保留输出文件中已有的 TranslatedLyric（默认为 False）
+        csv_files (list): 要转换的输入CSV文件，代替搜索输入文件夹，由 --watch 使用（可选）
     """
 
     input_path = Path(input_folder)
@@ -200,13 +1315,17 @@ def process_folder(input_folder, output_folder=None, output_suffix="", recursive
         # 如果输出文件夹不存在，创建它
         output_path.mkdir(parents=True, exist_ok=True)
 
-    # 查找所有CSV文件（递归或非递归）
-    if recursive:
-        csv_files = list(input_path.rglob("*.csv"))  # 递归查找所有子文件夹
-        print(f"递归搜索文件夹 {input_folder} 及其子文件夹...")
-    else:
-        csv_files = list(input_path.glob("*.csv"))   # 只查找当前文件夹
-        print(f"搜索文件夹 {input_folder}...")
+    # 查找所有CSV文件（递归或非递归），除非已给出要转换的文件
+    if csv_files is None:
+        with profile_stage('discover'):
+            if recursive:
+                csv_files = list(input_path.rglob("*.csv"))  # 递归查找所有子文件夹
+            else:
+                csv_files = list(input_path.glob("*.csv"))   # 只查找当前文件夹
+        if recursive:
+            print(f"递归搜索文件夹 {input_folder} 及其子文件夹...")
+        else:
+            print(f"搜索文件夹 {input_folder}...")
 
     if not csv_files:
         search_type = "及其子文件夹" if recursive else ""
@@ -214,58 +1333,636 @@ def process_folder(input_folder, output_folder=None, output_suffix="", recursive
         return
 
     print(f"找到 {len(csv_files)} 个CSV文件，开始处理...")
-    print("-" * 50)
 
     total_processed = 0
     successful_files = 0
+    timeline_total = {}
+    translations_total = {}
+    tasks = []
 
-    for csv_file in csv_files:
-        # 计算相对路径，用于保持文件夹结构
-        relative_path = csv_file.relative_to(input_path)
+    # 增量模式下加载之前运行的清单
+    manifest = None
+    if incremental:
+        manifest_file = output_path / MANIFEST_FILENAME
+        manifest = load_manifest(manifest_file)
+        options = {'output_suffix': output_suffix, 'sample_rows': sample_rows}
+        if normalize is not None:
+            options['normalize'] = normalize
+        if keep_translations:
+            options['keep_translations'] = True
+        if FORCE_ENCODING is not None:
+            options['encoding'] = FORCE_ENCODING
+        skipped_files = 0
 
+    # 一个文件夹中的所有CSV文件共用一个歌词文件，按输出文件分组并保持输入顺序
+    groups = {}
+    for csv_file in csv_files:
         # 生成输出文件路径，保持原有的文件夹结构
-        if output_folder is None:
-            # 在原位置生成文件
-            output_filename = "lyric" + output_suffix + ".csv"
-            output_file = csv_file.parent / output_filename
-        else:
-            # 在指定输出文件夹中保持相同的文件夹结构
-            output_filename = "lyric" + output_suffix + ".csv"
-            output_file = output_path / relative_path.parent / output_filename
+        output_file = get_output_file(csv_file, input_path, None if output_folder is None else output_path,
+                                      output_suffix)
+        groups.setdefault(output_file, []).append(csv_file)
 
+    group_inputs = {}
+    for output_file, group_files in groups.items():
+        if output_folder is not None:
             # 确保输出文件夹存在
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # 显示相对路径，便于理解文件位置
-        print(f"处理文件: {relative_path}")
+        # 计算相对路径，用于保持文件夹结构
+        relative_paths = [csv_file.relative_to(input_path) for csv_file in group_files]
+        states = [None] * len(group_files)
+
+        # 跳过所有文件自上次运行以来都未改变的组，它们仍计入统计。
+        # 组内文件共用输出文件，因此有文件被修改、新增或删除时整组重新转换。
+        if manifest is not None:
+            inputs = group_inputs[output_file] = sorted(relative_path.as_posix() for relative_path in relative_paths)
+            entries = [manifest.get(relative_path.as_posix()) for relative_path in relative_paths]
+            with profile_stage('manifest'):
+                states = [get_file_state(csv_file, entry) for csv_file, entry in zip(group_files, entries)]
+            if all(is_unchanged(entry, state, options, inputs, output_file) for entry, state in zip(entries, states)):
+                for relative_path, entry, state in zip(relative_paths, entries, states):
+                    if entry.get('size') != state['size'] or entry.get('mtime_ns') != state['mtime_ns']:
+                        append_manifest_entry(manifest_file, manifest, {**entry, **state})
+                    if entry.get('records', 0) > 0:
+                        total_processed += entry['records']
+                        successful_files += 1
+                    add_report(timeline_total, entry.get('timeline'))
+                    add_report(translations_total, entry.get('translations'))
+                    skipped_files += 1
+                    if PROGRESS is not None:
+                        report_file(relative_path, None)
+                continue
+
+        tasks.extend(zip(group_files, relative_paths, [output_file] * len(group_files), states))
+
+    if manifest is not None:
+        print(f"注意：跳过 {skipped_files} 个未改变的文件。")
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(tasks))
+    if jobs > 1:
+        print(f"注意：使用 {jobs} 个工作进程。")
+    print("-" * 50)
+
+    # 并行模式下由工作进程转换文件，结果按输入顺序返回
+    results = convert_files_parallel(tasks, jobs, sample_rows, normalize, keep_translations) if jobs > 1 else None
+
+    if PROGRESS is not None:
+        PROGRESS['total_files'] = len(csv_files)
+    existing_lines = existing_output = None
+    for csv_file, relative_path, output_file, state in tasks:
+        if PROGRESS is None:
+            # 显示相对路径，便于理解文件位置
+            print(f"处理文件: {relative_path}")
+            input_bytes = None
+        else:
+            input_bytes = csv_file.stat().st_size
 
         # 转换文件
-        record_count = convert_lyric_csv(csv_file, output_file)
+        if results is None:
+            if keep_translations and output_file != existing_output:
+                # 已有的输出文件只读取一次，在共用它的第一个文件替换它之前
+                with profile_stage('merge'):
+                    existing_lines, existing_output = load_lyric_translations(output_file), output_file
+            file_info = {}
+            record_count, console_output, duration = run_file(relative_path, lambda: convert_lyric_csv(
+                csv_file, output_file, file_info, sample_rows, normalize=normalize,
+                existing_lines=existing_lines))
+        else:
+            record_count, console_output, file_info, duration = next(results)
+            if PROGRESS is None:
+                print(console_output, end='')
 
         if record_count > 0:
-            print(f"  ✓ 成功转换 {record_count} 条记录")
-            print(f"  ✓ 输出文件: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
             total_processed += record_count
             successful_files += 1
+        add_report(timeline_total, file_info.get('timeline'))
+        add_report(translations_total, file_info.get('translations'))
+
+        if PROGRESS is not None:
+            report_file(relative_path, record_count, console_output, bytes=input_bytes, duration=duration, **file_info)
+        elif record_count > 0:
+            print(f"  ✓ 成功转换 {record_count} 条记录")
+            print(f"  ✓ 输出文件: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
         elif record_count == 0:
             print(f"  ⚠ 文件中没有有效数据")
         else:
             print(f"  ✗ 处理失败")
 
-        print()
+        # 在清单中记录已转换的文件，失败的文件会在下次运行时重试
+        if manifest is not None and record_count >= 0:
+            if output_file == csv_file:
+                # 原地转换，记录转换后的内容，避免下次再次转换
+                with profile_stage('manifest'):
+                    state = get_file_state(csv_file)
+            append_manifest_entry(manifest_file, manifest, {
+                'path': relative_path.as_posix(),
+                **state,
+                'options': options,
+                'format': file_info.get('format'),
+                'output': output_file.relative_to(output_path).as_posix(),
+                'inputs': group_inputs[output_file],
+                'records': record_count,
+                **{key: file_info[key] for key in ('timeline', 'translations') if key in file_info}
+            })
+
+        if PROGRESS is None:
+            print()
+
+    if manifest is not None:
+        save_manifest(manifest_file, manifest, input_path)
+
+    print("-" * 50)
+    print_summary(successful_files, len(csv_files), total_processed, skipped_files if manifest is not None else None)
+    if normalize is not None and PROGRESS is None:
+        print(describe_timeline(timeline_total, normalize == 'fix'))
+    if translations_total and PROGRESS is None:
+        print(describe_translations(translations_total))
+
+# 连续保存后没有新改动多少秒才开始转换
+WATCH_DEBOUNCE = 0.1
+
+# 无法使用 inotify 时扫描输入文件夹的间隔秒数
+WATCH_POLL_INTERVAL = 0.25
+
+# 列出时修改时间距今少于此秒数的文件夹会在下一次轮询时重新列出，因为与列出处于同一时钟刻度的改动
+# 不会改变文件夹的修改时间
+WATCH_MTIME_GRACE = 2.0
+
+# inotify 事件标志（linux/inotify.h）
+IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x8, 0x40, 0x80, 0x100, 0x200
+IN_Q_OVERFLOW, IN_IGNORED, IN_ONLYDIR, IN_ISDIR = 0x4000, 0x8000, 0x1000000, 0x40000000
+
+# 每个文件夹监视的事件，新文件在写入后关闭时才转换
+INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+
+# inotify 事件头：监视描述符、掩码、cookie 和名称长度
+INOTIFY_EVENT = struct.Struct('iIII')
+
+def is_csv_name(name):
+    """
+    检查文件名是否匹配 *.csv，在不区分大小写的文件系统上不区分大小写
+
+    Args:
+        name (str): 文件名
+
+    Returns:
+        bool: CSV文件返回 True
+    """
+
+    return os.path.normcase(name).endswith('.csv')
+
+def refresh_folder(snapshot, folder, recursive, changes):
+    """
+    重新列出一个文件夹，并记录新增、修改或删除的CSV文件
+
+    快照中没有的子文件夹会被完整扫描，已知的子文件夹不会重新列出。
+
+    Args:
+        snapshot (dict): 文件夹路径 -> {'mtime_ns', 'files': {名称: (mtime_ns, 大小)}, 'folders': 名称集合}，
+            就地更新
+        folder (Path): 文件夹路径
+        recursive (bool): 是否监视子文件夹
+        changes (set): 接收改变的CSV文件路径
+
+    Returns:
+        int: 改变的CSV文件数
+    """
+
+    old = snapshot.get(folder)
+    try:
+        folder_mtime = os.stat(folder).st_mtime_ns
+        with os.scandir(folder) as entries:
+            files = {}
+            folders = set()
+            for entry in entries:
+                if entry.is_dir():
+                    if recursive:
+                        folders.add(entry.name)
+                elif is_csv_name(entry.name) and entry.is_file():
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    except (FileNotFoundError, NotADirectoryError):
+        return forget_folder(snapshot, folder, changes)
+
+    count = 0
+    old_files = old['files'] if old is not None else {}
+    for name in files.keys() | old_files.keys():
+        if files.get(name) != old_files.get(name):
+            changes.add(folder / name)
+            count += 1
+    # 下一次轮询时重新列出，见 WATCH_MTIME_GRACE
+    if time.time_ns() - folder_mtime < WATCH_MTIME_GRACE * 1e9:
+        folder_mtime = None
+    snapshot[folder] = {'mtime_ns': folder_mtime, 'files': files, 'folders': folders}
+
+    old_folders = old['folders'] if old is not None else set()
+    for name in old_folders - folders:
+        count += forget_folder(snapshot, folder / name, changes)
+    for name in folders - old_folders:
+        count += refresh_folder(snapshot, folder / name, recursive, changes)
+    return count
+
+def forget_folder(snapshot, folder, changes):
+    """
+    从快照中移除已删除的文件夹及其子文件夹，并将其中的CSV文件记录为已改变
+
+    Args:
+        snapshot (dict): refresh_folder 生成的快照，就地更新
+        folder (Path): 文件夹路径
+        changes (set): 接收被删除的CSV文件路径
+
+    Returns:
+        int: 被删除的CSV文件数
+    """
+
+    old = snapshot.pop(folder, None)
+    if old is None:
+        return 0
+    changes.update(folder / name for name in old['files'])
+    return len(old['files']) + sum(forget_folder(snapshot, folder / name, changes) for name in old['folders'])
+
+def refresh_file(snapshot, csv_file, changes):
+    """
+    重新读取被监视文件夹中一个文件的状态，如果它被新增、修改或删除则记录下来
+
+    Args:
+        snapshot (dict): refresh_folder 生成的快照，就地更新
+        csv_file (Path): 文件路径
+        changes (set): 文件改变时接收其路径
+
+    Returns:
+        int: 文件改变时为 1，否则为 0
+    """
+
+    folder = snapshot.get(csv_file.parent)
+    if folder is None or not is_csv_name(csv_file.name):
+        return 0
+    try:
+        stat = os.stat(csv_file)
+        state = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        state = None
+    if state == folder['files'].get(csv_file.name):
+        return 0
+    if state is None:
+        del folder['files'][csv_file.name]
+    else:
+        folder['files'][csv_file.name] = state
+    changes.add(csv_file)
+    return 1
+
+def poll_snapshot(snapshot, recursive, changes):
+    """
+    重新检查被监视的文件夹，即无法使用 inotify 时的轮询方式
+
+    只有修改时间改变的文件夹会被重新列出，以找到新增、删除和重命名的文件和文件夹。就地写入的文件
+    不会改变所在文件夹的修改时间，因此其他文件夹中的CSV文件各用一次 stat 检查。
+
+    Args:
+        snapshot (dict): refresh_folder 生成的快照，就地更新
+        recursive (bool): 是否监视子文件夹
+        changes (set): 接收改变的CSV文件路径
+
+    Returns:
+        int: 改变的CSV文件数
+    """
+
+    count = 0
+    for folder in list(snapshot):
+        entry = snapshot.get(folder)
+        if entry is None:
+            # 已在本次轮询中随其父文件夹一起移除
+            continue
+        try:
+            folder_mtime = os.stat(folder).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            count += forget_folder(snapshot, folder, changes)
+            continue
+        if folder_mtime != entry['mtime_ns']:
+            count += refresh_folder(snapshot, folder, recursive, changes)
+        else:
+            for name, state in list(entry['files'].items()):
+                try:
+                    stat = os.stat(os.path.join(folder, name))
+                except FileNotFoundError:
+                    stat = None
+                if stat is None or (stat.st_mtime_ns, stat.st_size) != state:
+                    count += refresh_file(snapshot, folder / name, changes)
+    return count
+
+def open_inotify():
+    """
+    通过C库打开一个 inotify 实例
+
+    Returns:
+        dict: {'libc', 'fd', 'folders': 监视描述符 -> 文件夹路径}，无法使用 inotify 时返回 None
+    """
+
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    return {'libc': libc, 'fd': fd, 'folders': {}}
+
+def update_inotify_watches(watcher, snapshot):
+    """
+    监视快照中的文件夹，并停止监视已删除或移走的文件夹
+
+    Args:
+        watcher (dict): open_inotify 打开的 inotify 实例
+        snapshot (dict): refresh_folder 生成的快照
+
+    Raises:
+        OSError: 无法添加监视，例如达到 inotify 监视数量上限时
+    """
+
+    for wd, folder in list(watcher['folders'].items()):
+        if folder not in snapshot:
+            watcher['libc'].inotify_rm_watch(watcher['fd'], wd)
+            del watcher['folders'][wd]
+
+    watched = set(watcher['folders'].values())
+    for folder in snapshot:
+        if folder in watched:
+            continue
+        wd = watcher['libc'].inotify_add_watch(watcher['fd'], os.fsencode(folder), INOTIFY_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOENT:
+                # 列出后已被删除，其父文件夹会报告删除
+                continue
+            raise OSError(error, os.strerror(error), str(folder))
+        watcher['folders'][wd] = folder
+
+def read_inotify(watcher, snapshot, recursive, timeout, changes):
+    """
+    等待 inotify 事件，并根据事件涉及的文件和文件夹更新快照
+
+    Args:
+        watcher (dict): open_inotify 打开的 inotify 实例
+        snapshot (dict): refresh_folder 生成的快照，就地更新
+        recursive (bool): 是否监视子文件夹
+        timeout (float): 等待第一个事件的秒数
+        changes (set): 接收改变的CSV文件路径
+
+    Returns:
+        int: 改变的CSV文件数
+    """
+
+    if not select.select([watcher['fd']], [], [], timeout)[0]:
+        return 0
+
+    data = b''
+    while True:
+        try:
+            data += os.read(watcher['fd'], 64 * 1024)
+        except BlockingIOError:
+            break
+
+    count = 0
+    offset = 0
+    while offset < len(data):
+        wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+        name = os.fsdecode(data[offset + INOTIFY_EVENT.size:offset + INOTIFY_EVENT.size + length].rstrip(b'\0'))
+        offset += INOTIFY_EVENT.size + length
+        folder = watcher['folders'].get(wd)
+        if mask & IN_Q_OVERFLOW:
+            # 事件被丢弃，改为比较每个文件夹
+            count += poll_snapshot(snapshot, recursive, changes)
+        elif mask & IN_IGNORED:
+            watcher['folders'].pop(wd, None)
+        elif folder is None:
+            continue
+        elif mask & IN_ISDIR:
+            count += refresh_folder(snapshot, folder, recursive, changes)
+        elif not mask & IN_CREATE:
+            # 新文件在写入后关闭时转换，而不是在创建时转换
+            count += refresh_file(snapshot, folder / name, changes)
+
+    update_inotify_watches(watcher, snapshot)
+    return count
+
+def watch_folder(input_folder, output_folder, output_suffix="", recursive=True, jobs=1, incremental=False,
+                 sample_rows=FORMAT_SAMPLE_ROWS, normalize=None, keep_translations=False, progress_mode=None):
+    """
+    转换文件夹，然后持续转换新增、修改或删除的CSV文件，直到被中断
+
+    文件夹树保存在内存中，可用时根据 inotify 事件更新，否则每 WATCH_POLL_INTERVAL 秒列出被监视的文件夹。
+    WATCH_DEBOUNCE 秒内没有新改动后才转换这些改动。一个文件夹中的所有CSV文件共用一个歌词文件，
+    因此改动会重新转换其文件夹中剩余的每个CSV文件，没有CSV文件的文件夹的歌词文件会被删除。
+
+    Args:
+        input_folder (str): 输入文件夹路径
+        output_folder (str): 输出文件夹路径，位于输入文件夹之外
+        output_suffix (str): 输出文件名后缀（默认为空）
+        recursive (bool): 是否递归处理子文件夹（默认为True）
+        jobs (int): 工作进程数，0 表示使用全部CPU核心（默认为1）
+        incremental (bool): 跳过自上次运行以来未改变的文件，由输出文件夹中的清单记录
+        sample_rows (int): 用于格式检测的行数
+        normalize (str): 时间轴规范化，"report"、"fix" 或 None（默认为 None）
+        keep_translations (bool): 保留输出文件中已有的 TranslatedLyric（默认为 False）
+        progress_mode (str): "quiet" 只打印每次转换的摘要，None 打印通常的控制台文本
+    """
+
+    input_path = Path(input_folder)
+    if not input_path.is_dir():
+        print(f"错误：{input_folder} 不是文件夹")
+        return
+
+    # 输入文件夹中的输出文件会被当作改变的输入文件
+    if output_folder is None or Path(output_folder).resolve().is_relative_to(input_path.resolve()):
+        print("错误：--watch 需要一个位于输入文件夹之外的输出文件夹")
+        return
+    output_path = Path(output_folder)
+
+    snapshot = {}
+    refresh_folder(snapshot, input_path, recursive, set())
+    watcher = open_inotify()
+    if watcher is not None:
+        try:
+            update_inotify_watches(watcher, snapshot)
+        except OSError as e:
+            print(f"⚠ 无法使用 inotify 监视（{e}），改为轮询")
+            os.close(watcher['fd'])
+            watcher = None
+
+    with progress_output(progress_mode):
+        process_folder(input_folder, output_folder, output_suffix, recursive, jobs=jobs, incremental=incremental,
+                       sample_rows=sample_rows, normalize=normalize, keep_translations=keep_translations)
+    print()
+    if watcher is None:
+        print(f"正在每 {WATCH_POLL_INTERVAL} 秒轮询监视文件夹 {input_folder}，按 Ctrl+C 停止...")
+    else:
+        print(f"正在使用 inotify 监视文件夹 {input_folder}，按 Ctrl+C 停止...")
+
+    changes = set()
+    last_change_time = None
+    try:
+        while True:
+            timeout = WATCH_POLL_INTERVAL if last_change_time is None else WATCH_DEBOUNCE
+            try:
+                if watcher is None:
+                    time.sleep(timeout)
+                    change_count = poll_snapshot(snapshot, recursive, changes)
+                else:
+                    change_count = read_inotify(watcher, snapshot, recursive, timeout, changes)
+            except OSError as e:
+                if watcher is None:
+                    raise
+                print(f"⚠ inotify 失败（{e}），改为轮询")
+                os.close(watcher['fd'])
+                watcher = None
+                change_count = poll_snapshot(snapshot, recursive, changes)
+
+            if change_count:
+                last_change_time = time.perf_counter()
+                continue
+            if not changes or time.perf_counter() - last_change_time < WATCH_DEBOUNCE:
+                continue
+
+            # 转换每个改变的文件夹中剩余的CSV文件，删除已清空文件夹的歌词文件
+            start_time = time.perf_counter()
+            csv_files = []
+            removed_files = 0
+            print()
+            for folder, csv_file in sorted({path.parent: path for path in changes}.items()):
+                names = sorted(snapshot[folder]['files']) if folder in snapshot else []
+                if names:
+                    csv_files.extend(folder / name for name in names)
+                    continue
+                output_file = get_output_file(csv_file, input_path, output_path, output_suffix)
+                if output_file.exists():
+                    output_file.unlink()
+                    removed_files += 1
+                    if progress_mode is None:
+                        print(f"  ✓ 已删除输出文件: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
+            if csv_files:
+                with progress_output(progress_mode):
+                    process_folder(input_folder, output_folder, output_suffix, recursive, jobs=jobs,
+                                   incremental=incremental, sample_rows=sample_rows, normalize=normalize,
+                                   keep_translations=keep_translations, csv_files=csv_files)
+            print(f"已转换改变的文件夹中的 {len(csv_files)} 个文件，删除 {removed_files} 个输出文件，"
+                  f"耗时 {time.perf_counter() - start_time:.3f} 秒")
+            changes = set()
+            last_change_time = None
+    except KeyboardInterrupt:
+        print("已停止监视。")
+    finally:
+        if watcher is not None:
+            os.close(watcher['fd'])
+
+def process_archive(input_archive, output_folder, output_suffix="", recursive=True, sample_rows=FORMAT_SAMPLE_ROWS,
+                    normalize=None, keep_translations=False):
+    """
+    不解压到磁盘，批量处理 zip 或 tar 压缩包中的所有CSV文件
+
+    成员在读取压缩包的同时进行转换，输出文件保持压缩包中的文件夹结构，与 process_folder 处理文件夹时相同。
+
+    Args:
+        input_archive (str): 输入压缩包路径（.zip、.tar、.tar.gz、.tgz、.tar.bz2、.tar.xz）
+        output_folder (str): 输出文件夹路径
+        output_suffix (str): 输出文件名后缀（默认为空）
+        recursive (bool): 是否处理子文件夹中的成员（默认为True）
+        sample_rows (int): 用于格式检测的行数
+        normalize (str): 时间轴规范化，"report"、"fix" 或 None（默认为 None）
+        keep_translations (bool): 保留输出文件中已有的 TranslatedLyric（默认为 False）
+    """
+
+    input_path = Path(input_archive)
+
+    if output_folder is None:
+        print("错误：转换压缩包时必须指定输出文件夹")
+        return
+
+    output_path = Path(output_folder)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    if recursive:
+        print(f"递归读取压缩包 {input_archive} 及其子文件夹...")
+    else:
+        print(f"读取压缩包 {input_archive}...")
+    print("-" * 50)
+
+    total_files = 0
+    total_processed = 0
+    successful_files = 0
+    timeline_total = {}
+    translations_total = {}
+    existing_lines = {}
+
+    try:
+        for relative_path, member_file in iter_archive_csv_files(input_path, recursive):
+            total_files += 1
+
+            # 生成输出文件路径，保持压缩包中的文件夹结构
+            output_filename = "lyric" + output_suffix + ".csv"
+            output_file = output_path / relative_path.parent / output_filename
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # 已有的输出文件只读取一次，在共用它的第一个文件替换它之前
+            if keep_translations and output_file not in existing_lines:
+                with profile_stage('merge'):
+                    existing_lines[output_file] = load_lyric_translations(output_file)
+
+            if PROGRESS is None:
+                print(f"处理文件: {relative_path}")
+            file_info = {}
+            record_count, console_output, duration = run_file(relative_path, lambda: convert_lyric_csv(
+                input_path / relative_path, output_file, file_info, sample_rows, input_stream=member_file,
+                normalize=normalize, existing_lines=existing_lines.get(output_file)))
+
+            if record_count > 0:
+                total_processed += record_count
+                successful_files += 1
+            add_report(timeline_total, file_info.get('timeline'))
+            add_report(translations_total, file_info.get('translations'))
+
+            if PROGRESS is not None:
+                report_file(relative_path, record_count, console_output, duration=duration, **file_info)
+                continue
+            if record_count > 0:
+                print(f"  ✓ 成功转换 {record_count} 条记录")
+                print(f"  ✓ 输出文件: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
+            elif record_count == 0:
+                print(f"  ⚠ 文件中没有有效数据")
+            else:
+                print(f"  ✗ 处理失败")
+
+            print()
+    except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+        print(f"读取压缩包 {input_archive} 时发生错误: {e}")
+        return
+
+    if total_files == 0:
+        search_type = "及其子文件夹" if recursive else ""
+        print(f"在压缩包 {input_archive} {search_type}中没有找到CSV文件")
+        return
 
     print("-" * 50)
-    print(f"批量处理完成！")
-    print(f"成功处理文件: {successful_files}/{len(csv_files)}")
-    print(f"总共转换记录: {total_processed} 条")
+    print_summary(successful_files, total_files, total_processed)
+    if normalize is not None and PROGRESS is None:
+        print(describe_timeline(timeline_total, normalize == 'fix'))
+    if translations_total and PROGRESS is None:
+        print(describe_translations(translations_total))
 
-def convert_single_file(input_file, output_file=None):
+def convert_single_file(input_file, output_file=None, sample_rows=FORMAT_SAMPLE_ROWS, normalize=None,
+                        keep_translations=False):
     """
     转换单个文件
 
     Args:
         input_file (str): 输入文件路径
         output_file (str): 输出文件路径（可选）
+        sample_rows (int): 用于格式检测的行数
+        normalize (str): 时间轴规范化，"report"、"fix" 或 None（默认为 None）
+        keep_translations (bool): 保留输出文件中已有的 TranslatedLyric（默认为 False）
     """
 
     input_path = Path(input_file)
@@ -283,15 +1980,114 @@ def convert_single_file(input_file, output_file=None):
     print(f"输出文件: {output_file}")
 
     # 转换文件
-    record_count = convert_lyric_csv(input_file, output_file)
+    input_bytes = input_path.stat().st_size
+    existing_lines = None
+    if keep_translations:
+        with profile_stage('merge'):
+            existing_lines = load_lyric_translations(output_file)
+    file_info = {}
+    record_count, console_output, duration = run_file(input_file, lambda: convert_lyric_csv(
+        input_file, output_file, file_info, sample_rows, normalize=normalize, existing_lines=existing_lines))
 
-    if record_count > 0:
+    if PROGRESS is not None:
+        report_file(input_path.name, record_count, console_output, bytes=input_bytes, duration=duration, **file_info)
+        print_summary(1 if record_count > 0 else 0, 1, max(record_count, 0))
+    elif record_count > 0:
         print(f"✓ 成功转换 {record_count} 条记录")
     elif record_count == 0:
         print(f"⚠ 文件中没有有效数据")
     else:
         print(f"✗ 处理失败")
 
+def pop_option(args, name, default=None):
+    """
+    从参数列表中移除带值的选项
+
+    支持 "--name value" 和 "--name=value" 两种写法
+
+    Args:
+        args (list): 参数列表，会被原地修改
+        name (str): 选项名
+        default (str): 选项不存在时返回的值
+
+    Returns:
+        str: 选项值，选项没有值时为 None
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """打印命令行用法"""
+
+    print("歌词CSV格式转换工具")
+    print("将歌词时间轴CSV格式转换为包含翻译字段的格式")
+    print()
+    print("支持的输入格式:")
+    print("  格式1: 开始时间(秒),结束时间(秒),歌词")
+    print("  格式2: ID,開始時間,終了時間,ローカライズ用キー名")
+    print()
+    print("使用方法:")
+    print("  转换单个文件:")
+    print("    python script.py <输入文件> [输出文件] [--sample-rows N] [--normalize] [--fix-timeline] [--keep-translations] [--force-encoding 编码] [--profile] [--quiet] [--progress 模式]")
+    print("  批量转换文件夹或 zip/tar 压缩包（压缩包需要指定输出文件夹）:")
+    print("    python script.py <输入文件夹> [输出文件夹] [输出后缀] [--no-recursive] [--jobs N] [--incremental] [--watch] [--sample-rows N] [--normalize] [--fix-timeline] [--keep-translations] [--force-encoding 编码] [--profile] [--quiet] [--progress 模式]")
+    print()
+    print("示例:")
+    print("  python script.py song.csv")
+    print("  python script.py song.csv converted_song.csv")
+    print("  python script.py ./lyrics_folder")
+    print("  python script.py ./lyrics_folder ./output_folder")
+    print("  python script.py ./lyrics_folder ./output_folder _new")
+    print("  python script.py ./lyrics.tar.gz ./output_folder")
+    print("  python script.py ./lyrics_folder --no-recursive")
+    print("  python script.py ./lyrics_folder ./output_folder --jobs 8")
+    print("  python script.py ./lyrics_folder ./output_folder --watch")
+    print("  python script.py ./lyrics_folder ./output_folder --incremental")
+    print("  python script.py ./lyrics_folder --sample-rows 50")
+    print("  python script.py ./lyrics_folder ./output_folder --normalize")
+    print("  python script.py song.csv --fix-timeline")
+    print("  python script.py ./lyrics_folder --keep-translations")
+    print("  python script.py ./lyrics_folder ./output_folder --profile --profile-output profile.json")
+    print("  python script.py ./lyrics_folder ./output_folder --progress=jsonl > progress.jsonl")
+    print()
+    print("参数说明:")
+    print("  输入文件/文件夹: 要转换的CSV文件，或包含CSV文件的文件夹或 .zip/.tar(.gz/.bz2/.xz) 压缩包路径")
+    print("  输出文件夹: 输出文件夹路径（可选，默认为输入文件夹）")
+    print("  输出后缀: 输出文件名后缀（可选，默认为空）")
+    print("  --no-recursive: (可选标志) 如果使用，将不会递归处理子文件夹")
+    print("  --jobs N: (可选) 使用 N 个工作进程转换文件，0 表示使用全部CPU核心（默认为1）")
+    print("  --incremental: (可选标志) 如果使用，将跳过自上次运行以来未改变的文件，记录在输出文件夹的 .convert_manifest.jsonl 中")
+    print("  --watch: (可选标志) 如果使用，将在首次转换后持续转换新增、修改和删除的CSV文件，直到按下 Ctrl+C，")
+    print("           需要一个位于输入文件夹之外的输出文件夹")
+    print("  --sample-rows N: (可选) 每个文件开头用于格式检测的行数（默认为20）")
+    print("  --normalize: (可选标志) 如果使用，将像插件一样按开始时间排序歌词行，并报告顺序错误、时长为负、时长为零、")
+    print("               重复和时间重叠的行")
+    print("  --fix-timeline: (可选标志) 包含 --normalize，同时交换时长为负的开始和结束时间，删除时长为零和重复的行，")
+    print("                  截断重叠的行并合并开始时间相同的行")
+    print("  --keep-translations: (可选标志) 如果使用，将保留已有输出文件中的 TranslatedLyric，先按开始时间、结束时间和")
+    print("                       原文匹配，再只按原文匹配，并报告时间改变、新增和未使用的已翻译行")
+    print("  --force-encoding 编码: (可选) 用此编码（例如 cp932 或 utf-16）解码所有输入文件，")
+    print("                         而不是根据字节顺序标记和前 256 KiB 逐个文件检测编码")
+    print("  --profile: (可选标志) 如果使用，将在单个进程中转换，并打印各阶段（discover、decode、parse、detect、")
+    print("             transform、write...）的耗时、跟踪的内存峰值和最慢的文件")
+    print("  --profile-top N: (可选) --profile 列出的最慢文件数（默认为 10）")
+    print("  --profile-output 文件: (可选) 包含 --profile，同时将摘要写入 文件.json，其他扩展名（如 文件.prof）")
+    print("                         则写入 pstats/snakeviz 可读取的 cProfile 转储")
+    print("  --quiet: (可选标志) 如果使用，将只打印最终摘要，失败文件的错误信息写入 stderr")
+    print("  --progress 模式: (可选) \"text\" 打印通常的控制台文本，\"jsonl\" 为每个文件打印一个 JSON 事件（路径、格式、")
+    print("                   行数、字节数、耗时、状态），并打印吞吐量/预计剩余时间事件和摘要事件（默认为 text）")
+    print()
+    print("输出格式: StartTime,EndTime,OriginalLyric,TranslatedLyric")
+    print()
+
 def main():
     """主函数，处理命令行参数"""
 
@@ -302,45 +2098,119 @@ def main():
         recursive = False
         args.remove("--no-recursive")
 
+    incremental = False
+    if "--incremental" in args:
+        incremental = True
+        args.remove("--incremental")
+
+    jobs = pop_option(args, "--jobs", "1")
+    if jobs is None or not jobs.isdigit():
+        print("错误：--jobs 需要一个非负整数")
+        return
+
+    force_encoding = pop_option(args, "--force-encoding", "")
+    if force_encoding is None:
+        print("错误：--force-encoding 需要一个编码名称")
+        return
+    if force_encoding:
+        try:
+            set_force_encoding(codecs.lookup(force_encoding).name)
+        except LookupError:
+            print(f"错误：未知编码: {force_encoding}")
+            return
+
+    sample_rows = pop_option(args, "--sample-rows", str(FORMAT_SAMPLE_ROWS))
+    if sample_rows is None or not sample_rows.isdigit() or int(sample_rows) < 1:
+        print("错误：--sample-rows 需要一个正整数")
+        return
+
+    profile = False
+    if "--profile" in args:
+        profile = True
+        args.remove("--profile")
+
+    profile_output = pop_option(args, "--profile-output", "")
+    if profile_output is None:
+        print("错误：--profile-output 需要一个文件路径")
+        return
+    profile_output = profile_output or None
+    if profile_output is not None:
+        profile = True
+
+    profile_top = pop_option(args, "--profile-top", str(PROFILE_TOP_FILES))
+    if profile_top is None or not profile_top.isdigit():
+        print("错误：--profile-top 需要一个非负整数")
+        return
+
+    quiet = False
+    if "--quiet" in args:
+        quiet = True
+        args.remove("--quiet")
+
+    progress = pop_option(args, "--progress", "text")
+    if progress not in PROGRESS_MODES:
+        print("错误：--progress 需要 \"text\" 或 \"jsonl\"")
+        return
+    if quiet and progress != "text":
+        print("错误：--quiet 和 --progress=jsonl 不能同时使用")
+        return
+    progress_mode = "quiet" if quiet else None if progress == "text" else progress
+
+    normalize = None
+    if "--normalize" in args:
+        normalize = "report"
+        args.remove("--normalize")
+    if "--fix-timeline" in args:
+        normalize = "fix"
+        args.remove("--fix-timeline")
+
+    keep_translations = False
+    if "--keep-translations" in args:
+        keep_translations = True
+        args.remove("--keep-translations")
+
+    watch = False
+    if "--watch" in args:
+        watch = True
+        args.remove("--watch")
+    if watch and (profile or progress == "jsonl"):
+        print("错误：--watch 不能与 --profile 或 --progress=jsonl 一起使用")
+        return
+
     if len(args) < 2:
-        print("歌词CSV格式转换工具")
-        print("将歌词时间轴CSV格式转换为包含翻译字段的格式")
-        print()
-        print("支持的输入格式:")
-        print("  格式1: 开始时间(秒),结束时间(秒),歌词")
-        print("  格式2: ID,開始時間,終了時間,ローカライズ用キー名")
-        print()
-        print("使用方法:")
-        print("  转换单个文件:")
-        print("    python script.py <输入文件> [输出文件]")
-        print("  批量转换文件夹:")
-        print("    python script.py <输入文件夹> [输出文件夹] [输出后缀] [--no-recursive]")
-        print()
-        print("示例:")
-        print("  python script.py song.csv")
-        print("  python script.py song.csv converted_song.csv")
-        print("  python script.py ./lyrics_folder")
-        print("  python script.py ./lyrics_folder ./output_folder")
-        print("  python script.py ./lyrics_folder ./output_folder _new")
-        print("  python script.py ./lyrics_folder --no-recursive")
-        print()
-        print("参数说明:")
-        print("  输入文件/文件夹: 要转换的CSV文件或包含CSV文件的文件夹路径")
-        print("  输出文件夹: 输出文件夹路径（可选，默认为输入文件夹）")
-        print("  输出后缀: 输出文件名后缀（可选，默认为空）")
-        print("  --no-recursive: (可选标志) 如果使用，将不会递归处理子文件夹")
-        print()
-        print("输出格式: StartTime,EndTime,OriginalLyric,TranslatedLyric")
-        print()
+        print_usage()
         return
     
+    if profile:
+        # 只在当前进程中收集各阶段耗时
+        if jobs != "1":
+            print("注意：--profile 在单个进程中转换，忽略 --jobs。")
+            jobs = "1"
+        start_profile(use_cprofile=profile_output is not None and not profile_output.lower().endswith('.json'))
+
     input_path = Path(args[1])
     
-    # 判断是文件还是文件夹
-    if input_path.is_file():
+    # 判断是压缩包、文件还是文件夹
+    if input_path.is_file() and is_archive(input_path):
+        # 压缩包批量处理
+        if incremental or watch or jobs != "1":
+            print("错误：转换压缩包时不支持 --incremental、--watch 和 --jobs")
+            return
+        output_folder = args[2] if len(args) > 2 else None
+        output_suffix = args[3] if len(args) > 3 else ""
+
+        with progress_output(progress_mode):
+            process_archive(args[1], output_folder, output_suffix, recursive, sample_rows=int(sample_rows),
+                            normalize=normalize, keep_translations=keep_translations)
+    elif input_path.is_file():
         # 单文件处理
         output_file = args[2] if len(args) > 2 else None
-        convert_single_file(args[1], output_file)
+        if watch:
+            print("错误：--watch 仅支持转换文件夹")
+            return
+        with progress_output(progress_mode):
+            convert_single_file(args[1], output_file, sample_rows=int(sample_rows), normalize=normalize,
+                                keep_translations=keep_translations)
     elif input_path.is_dir():
         # 文件夹批量处理
         output_folder = args[2] if len(args) > 2 else None
@@ -349,41 +2219,24 @@ def main():
         if not recursive:
             print("注意：已设置不递归处理子文件夹。")
         
-        process_folder(args[1], output_folder, output_suffix, recursive)
+        if watch:
+            watch_folder(args[1], output_folder, output_suffix, recursive, jobs=int(jobs), incremental=incremental,
+                         sample_rows=int(sample_rows), normalize=normalize, keep_translations=keep_translations,
+                         progress_mode=progress_mode)
+        else:
+            with progress_output(progress_mode):
+                process_folder(args[1], output_folder, output_suffix, recursive, jobs=int(jobs),
+                               incremental=incremental, sample_rows=int(sample_rows), normalize=normalize,
+                               keep_translations=keep_translations)
     else:
         print(f"错误：路径 {args[1]} 不存在")
 
+    if profile:
+        finish_profile(int(profile_top), profile_output)
+
 if __name__ == "__main__":
     # 使用命令行参数
     if len(sys.argv) > 1:
         main()
     else:
-        print("歌词CSV格式转换工具")
-        print("将歌词时间轴CSV格式转换为包含翻译字段的格式")
-        print()
-        print("使用方法:")
-        print("  转换单个文件:")
-        print("    python script.py <输入文件> [输出文件]")
-        print("  批量转换文件夹:")
-        print("    python script.py <输入文件夹> [输出文件夹] [输出后缀] [--no-recursive]")
-        print()
-        print("示例:")
-        print("  python script.py song.csv")
-        print("  python script.py song.csv converted_song.csv")
-        print("  python script.py ./lyrics_folder")
-        print("  python script.py ./lyrics_folder ./output_folder")
-        print("  python script.py ./lyrics_folder ./output_folder _new")
-        print("  python script.py ./lyrics_folder --no-recursive")
-        print()
-        print("参数说明:")
-        print("  输入文件/文件夹: 要转换的CSV文件或包含CSV文件的文件夹路径")
-        print("  输出文件夹: 输出文件夹路径（可选，默认为输入文件夹）")
-        print("  输出后缀: 输出文件名后缀（可选，默认为空）")
-        print("  --no-recursive: (可选标志) 如果使用，将不会递归处理子文件夹")
-        print()
-        print("支持的输入格式:")
-        print("  格式1: 开始时间(秒),结束时间(秒),歌词")
-        print("  格式2: ID,開始時間,終了時間,ローカライズ用キー名")
-        print()
-        print("输出格式: StartTime,EndTime,OriginalLyric,TranslatedLyric")
-        print()
+        print_usage()
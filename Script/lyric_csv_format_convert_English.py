@@ -3,174 +3,1299 @@
 # Function: Convert lyric timeline CSV format to format with translation fields
 # Author: claude 4 & 90135
 # Creation date: 2025-07-19
-# Version: 2025-08-02_01
+# Version: 2026-10-17_10
 # License: BSD-3
 
+import codecs
+import contextlib
+import cProfile
 import csv
+import ctypes
+import errno
+import hashlib
+import io
+import itertools
+import json
 import os
+import select
+import struct
 import sys
-from pathlib import Path
+import tarfile
+import time
+import tracemalloc
+import zipfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
 
-def detect_csv_format(input_file):
+# Number of rows read from the start of the file for format detection
+FORMAT_SAMPLE_ROWS = 20
+
+# Score of a header row, a matching header outweighs a few ambiguous data rows
+HEADER_SCORE = 3
+
+def score_csv_row(row):
+    """
+    Score how well a single row matches each format
+
+    Args:
+        row (list): Parsed CSV row
+
+    Returns:
+        tuple: (format1 score, format2 score)
+    """
+
+    if not row:
+        return 0, 0
+
+    # Check if it's format2 header (contains ID and Japanese column names)
+    if (len(row) >= 4 and
+        'ID' in row[0] and
+        ('開始時間' in row[1] or '終了時間' in row[2] or 'ローカライズ用キー名' in row[3])):
+        return 0, HEADER_SCORE
+
+    # Check if it's format1 header (original format)
+    if (len(row) >= 3 and
+        (row[0].strip() in ['開始時間(秒)', '開始時間', 'StartTime', 'Start Time', 'start_time'] or
+         row[1].strip() in ['結束時間(秒)', '結束時間', 'EndTime', 'End Time', 'end_time'] or
+         row[2].strip() in ['歌詞', 'Lyric', 'Lyrics', 'OriginalLyric', 'Original Lyric'])):
+        return HEADER_SCORE, 0
+
+    # Format2 data row has numeric ID followed by two times
+    if len(row) >= 4:
+        try:
+            int(row[0])
+            float(row[1])
+            float(row[2])
+            return 0, 1
+        except ValueError:
+            pass
+
+    # Format1 data row starts directly with two times
+    if len(row) >= 3:
+        try:
+            float(row[0])
+            float(row[1])
+            return 1, 0
+        except ValueError:
+            pass
+
+    return 0, 0
+
+def sniff_csv_format(sample):
+    """
+    Detect the format type from sample rows
+
+    Args:
+        sample (list): Rows from the start of the file
+
+    Returns:
+        str: Format type ('format1', 'format2', 'unknown')
+    """
+
+    format1_score = 0
+    format2_score = 0
+    for row in sample:
+        row_format1_score, row_format2_score = score_csv_row(row)
+        format1_score += row_format1_score
+        format2_score += row_format2_score
+
+    if format1_score == 0 and format2_score == 0:
+        return 'unknown'
+    return 'format2' if format2_score > format1_score else 'format1'
+
+# Output column order of the lyric file
+OUTPUT_FIELDNAMES = ('StartTime', 'EndTime', 'OriginalLyric', 'TranslatedLyric')
+
+# Profile of the current run, set by --profile; None keeps timing code out of the conversion path
+PROFILE = None
+
+# Number of slowest files listed in the profile summary
+PROFILE_TOP_FILES = 10
+
+def start_profile(use_cprofile=False):
+    """
+    Start collecting per-stage timing, traced memory and per-file times for this run
+
+    Args:
+        use_cprofile (bool): Also run cProfile, for a dump readable by pstats
+    """
+
+    global PROFILE
+    PROFILE = {'stages': {}, 'nested': [], 'files': [], 'start_time': time.perf_counter(), 'cprofile': None}
+    tracemalloc.start()
+    if use_cprofile:
+        PROFILE['cprofile'] = cProfile.Profile()
+        PROFILE['cprofile'].enable()
+
+@contextlib.contextmanager
+def profile_stage(stage):
+    """
+    Time a block as a stage when profiling, the time of stages nested inside it is not counted twice
+
+    Args:
+        stage (str): Stage name
+    """
+
+    if PROFILE is None:
+        yield
+        return
+    PROFILE['nested'].append(0.0)
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start_time
+        PROFILE['stages'][stage] = PROFILE['stages'].get(stage, 0.0) + elapsed - PROFILE['nested'].pop()
+        if PROFILE['nested']:
+            PROFILE['nested'][-1] += elapsed
+
+def profile_iter(stage, iterable):
+    """
+    Wrap an iterable so the time spent producing each item counts towards a stage
+
+    Args:
+        stage (str): Stage name
+        iterable (iterable): Wrapped iterable
+
+    Yields:
+        Items of the iterable
+    """
+
+    iterator = iter(iterable)
+    while True:
+        with profile_stage(stage):
+            item = next(iterator, iterator)
+        if item is iterator:
+            return
+        yield item
+
+def profile_file(file_name, convert):
+    """
+    Convert one file, recording its time and row count when profiling
+
+    Time not spent in the stages entered by the conversion is counted towards write.
+
+    Args:
+        file_name (str): File name shown in the summary
+        convert (callable): Conversion, returns a record count
+
+    Returns:
+        Result of convert
+    """
+
+    if PROFILE is None:
+        return convert()
+
+    result = -1
+    start_time = time.perf_counter()
+    try:
+        with profile_stage('write'):
+            result = convert()
+    finally:
+        PROFILE['files'].append((str(file_name), time.perf_counter() - start_time,
+                                 result if result is not None else -1))
+    return result
+
+def finish_profile(top_files=PROFILE_TOP_FILES, output_file=None):
+    """
+    Stop profiling, print the summary and optionally write it to a file
+
+    Args:
+        top_files (int): Number of slowest files to list
+        output_file (str): Write a JSON summary (.json) or a cProfile dump (any other extension) (optional)
+    """
+
+    global PROFILE
+    profile, PROFILE = PROFILE, None
+    if profile['cprofile'] is not None:
+        profile['cprofile'].disable()
+    total_time = time.perf_counter() - profile['start_time']
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stages = dict(profile['stages'])
+    stages['other'] = max(0.0, total_time - sum(stages.values()))
+    slowest_files = sorted(profile['files'], key=lambda file: file[1], reverse=True)[:top_files]
+
+    print()
+    print("=" * 50)
+    print("Profile summary")
+    print(f"  Total time: {total_time:.3f} s, files: {len(profile['files'])}")
+    print(f"  {'Stage':<12}{'Time (s)':>12}{'Share':>9}")
+    for stage, stage_time in stages.items():
+        share = stage_time / total_time if total_time else 0
+        print(f"  {stage:<12}{stage_time:>12.3f}{share:>9.1%}")
+    print(f"  Peak traced memory: {peak_memory / (1024 * 1024):.1f} MB (tracemalloc)")
+    if slowest_files:
+        print(f"  Slowest {len(slowest_files)} files:")
+        for file_name, file_time, rows in slowest_files:
+            rows_text = f"{rows:>10,} rows" if rows >= 0 else f"{'failed':>15}"
+            print(f"    {file_time:>9.3f} s {rows_text}  {file_name}")
+    print("  Note: Timing includes profiling overhead, compare stages rather than absolute times")
+
+    if output_file is None:
+        return
+
+    if output_file.lower().endswith('.json'):
+        with open(output_file, 'w', encoding='utf-8') as outfile:
+            json.dump({
+                'total_time': total_time,
+                'stages': stages,
+                'peak_traced_memory': peak_memory,
+                'slowest_files': [{'file': file_name, 'time': file_time, 'rows': rows}
+                                  for file_name, file_time, rows in slowest_files]
+            }, outfile, ensure_ascii=False, indent=2)
+    elif profile['cprofile'] is not None:
+        profile['cprofile'].dump_stats(output_file)
+    print(f"  Profile written to {output_file}")
+
+# Progress output of the current run, set by --quiet or --progress=jsonl; None prints the usual console text
+PROGRESS = None
+
+# Progress output modes selected with --progress, "text" is the usual console text
+PROGRESS_MODES = ('text', 'jsonl')
+
+# Minimum seconds between throughput events in JSON lines progress mode
+PROGRESS_INTERVAL = 1.0
+
+# Buffer size of the progress writer in bytes
+PROGRESS_BUFFER_SIZE = 64 * 1024
+
+@contextlib.contextmanager
+def progress_output(mode=None):
+    """
+    Write progress through a buffered writer instead of printing console text line by line
+
+    Other console text of the run is kept in memory, and written to stderr if the run ends
+    before its summary so errors are not lost.
+
+    Args:
+        mode (str): "jsonl" writes one JSON event per line, "quiet" writes only the final summary,
+            None prints the usual console text
+    """
+
+    global PROGRESS
+    if mode is None:
+        yield
+        return
+
+    sys.stdout.flush()
+    writer = open(sys.stdout.fileno(), 'w', encoding='utf-8', buffering=PROGRESS_BUFFER_SIZE, closefd=False)
+    start_time = time.perf_counter()
+    PROGRESS = {'mode': mode, 'writer': writer, 'start_time': start_time, 'last_event_time': start_time,
+                'total_files': 0, 'done_files': 0, 'rows': 0, 'summary': False}
+    console_output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(console_output):
+            yield
+    finally:
+        progress, PROGRESS = PROGRESS, None
+        progress['writer'].close()
+        if not progress['summary']:
+            sys.stderr.write(console_output.getvalue())
+
+def write_progress_event(event):
+    """
+    Write one JSON lines event
+
+    Args:
+        event (dict): Event fields
+    """
+
+    PROGRESS['writer'].write(json.dumps(event, ensure_ascii=False) + '\n')
+
+def run_file(file_name, convert):
+    """
+    Convert one file, capturing its console output when progress output is on
+
+    Args:
+        file_name (str): File name shown in the profile summary
+        convert (callable): Conversion, returns a record count
+
+    Returns:
+        tuple: (result of convert, captured console output or None if printed, duration in seconds)
+    """
+
+    start_time = time.perf_counter()
+    if PROGRESS is None:
+        return profile_file(file_name, convert), None, time.perf_counter() - start_time
+
+    console_output = io.StringIO()
+    with contextlib.redirect_stdout(console_output):
+        result = profile_file(file_name, convert)
+    return result, console_output.getvalue(), time.perf_counter() - start_time
+
+def report_file(file_name, record_count, console_output=None, **fields):
+    """
+    Report one converted file in progress mode
+
+    Failed files keep their console output, as the message of the event in JSON lines mode
+    and on stderr in quiet mode.
+
+    Args:
+        file_name (str): File name relative to the input folder
+        record_count (int): Number of converted records, 0 if no valid data, -1 on error, None if skipped
+        console_output (str): Console output of the conversion (optional)
+        **fields: Other event fields such as format, bytes and duration, None values are left out
+    """
+
+    status = ('skipped' if record_count is None else 'ok' if record_count > 0
+              else 'empty' if record_count == 0 else 'failed')
+    PROGRESS['done_files'] += 1
+    PROGRESS['rows'] += max(record_count or 0, 0)
+
+    if PROGRESS['mode'] == 'quiet':
+        if status == 'failed' and console_output:
+            sys.stderr.write(console_output)
+        return
+
+    event = {'event': 'file', 'path': Path(file_name).as_posix(), 'status': status, 'rows': record_count, **fields}
+    event = {key: round(value, 6) if isinstance(value, float) else value
+             for key, value in event.items() if value is not None}
+    if status == 'failed' and console_output:
+        event['message'] = console_output.strip()
+    write_progress_event(event)
+
+    now = time.perf_counter()
+    if now - PROGRESS['last_event_time'] < PROGRESS_INTERVAL:
+        return
+    PROGRESS['last_event_time'] = now
+    elapsed = now - PROGRESS['start_time']
+    done_files, total_files = PROGRESS['done_files'], PROGRESS['total_files']
+    write_progress_event({
+        'event': 'progress',
+        'done_files': done_files,
+        'total_files': total_files,
+        'rows': PROGRESS['rows'],
+        'elapsed': round(elapsed, 3),
+        'files_per_second': round(done_files / elapsed, 1),
+        'rows_per_second': round(PROGRESS['rows'] / elapsed, 1),
+        'eta': round(max(total_files - done_files, 0) * elapsed / done_files, 1) if total_files else None
+    })
+
+def print_summary(successful_files, total_files, total_processed, skipped_files=None):
+    """
+    Print the final summary of a batch, as console text or as a summary event
+
+    Args:
+        successful_files (int): Number of files with converted records
+        total_files (int): Number of input files
+        total_processed (int): Total number of converted records
+        skipped_files (int): Number of unchanged files skipped in incremental mode (optional)
+    """
+
+    lines = [
+        "Batch processing completed!",
+        f"Successfully processed files: {successful_files}/{total_files}",
+        f"Total converted records: {total_processed}"
+    ]
+    if skipped_files is not None:
+        lines.append(f"Skipped unchanged files: {skipped_files}")
+
+    if PROGRESS is None:
+        for line in lines:
+            print(line)
+        return
+
+    PROGRESS['summary'] = True
+    if PROGRESS['mode'] == 'quiet':
+        PROGRESS['writer'].write('\n'.join(lines) + '\n')
+        return
+
+    event = {'event': 'summary', 'successful_files': successful_files, 'total_files': total_files,
+             'records': total_processed, 'elapsed': round(time.perf_counter() - PROGRESS['start_time'], 3)}
+    if skipped_files is not None:
+        event['skipped_files'] = skipped_files
+    write_progress_event(event)
+
+# Encoding of every input file, set by --force-encoding; None detects the encoding of each file
+FORCE_ENCODING = None
+
+# Encodings recognized by their byte order mark
+BOM_ENCODINGS = ((codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF16_LE, 'utf-16'), (codecs.BOM_UTF16_BE, 'utf-16'))
+
+# Encodings tried in order on files without a byte order mark, cp932 is Shift_JIS with the Windows extensions
+DETECT_ENCODINGS = ('utf-8', 'cp932')
+
+# Bytes read from the start of a file to detect its encoding
+ENCODING_SAMPLE_SIZE = 256 * 1024
+
+def set_force_encoding(encoding):
+    """
+    Set the encoding of every input file, also the initializer of worker processes
+
+    Args:
+        encoding (str): Codec name, None detects the encoding of each file
+    """
+
+    global FORCE_ENCODING
+    FORCE_ENCODING = encoding
+
+def detect_encoding(input_stream):
+    """
+    Detect the encoding of a binary stream from its byte order mark or the start of its content
+
+    Without a byte order mark, the sample is fed to an incremental decoder of each encoding of
+    DETECT_ENCODINGS, so a character cut at the end of the sample is not an error.
+
+    Args:
+        input_stream (file): Binary stream, ENCODING_SAMPLE_SIZE bytes are read from its current position
+
+    Returns:
+        str: Codec name, None if no encoding decodes the sample
+    """
+
+    sample = input_stream.read(ENCODING_SAMPLE_SIZE)
+    for bom, encoding in BOM_ENCODINGS:
+        if sample.startswith(bom):
+            return encoding
+
+    for encoding in DETECT_ENCODINGS:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(sample, final=len(sample) < ENCODING_SAMPLE_SIZE)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    return None
+
+def open_input(input_file, input_stream=None):
+    """
+    Open an input CSV file as text, or wrap an already open binary stream such as an archive member
+
+    The encoding is FORCE_ENCODING or detected by detect_encoding, the text is decoded in chunks
+    while it is read, so the file is never loaded whole.
+
+    Args:
+        input_file (str): Input CSV file path
+        input_stream (file): Seekable binary stream of the input file (optional)
+
+    Returns:
+        file: Text stream
+
+    Raises:
+        ValueError: The encoding cannot be detected
+    """
+
+    binary_stream = open(input_file, 'rb') if input_stream is None else input_stream
+    try:
+        encoding = FORCE_ENCODING
+        if encoding is None:
+            with profile_stage('encoding'):
+                start = binary_stream.tell()
+                encoding = detect_encoding(binary_stream)
+                binary_stream.seek(start)
+            if encoding is None:
+                raise ValueError(f"Cannot detect the encoding (tried {', '.join(DETECT_ENCODINGS)}), "
+                                 f"set it with --force-encoding")
+            if encoding not in ('utf-8', 'utf-8-sig'):
+                print(f"  Detected encoding: {encoding}")
+        return io.TextIOWrapper(binary_stream, encoding=encoding)
+    except BaseException:
+        if input_stream is None:
+            binary_stream.close()
+        raise
+
+def read_lyric_rows(input_file, file_info=None, sample_rows=FORMAT_SAMPLE_ROWS, input_stream=None):
+    """
+    Read and transform lyric timeline CSV rows one at a time
+
+    The format is detected from the first rows of the stream, which are kept in memory and
+    then parsed together with the rest of the stream, so the file is opened and decoded only once.
+
+    Args:
+        input_file (str): Input CSV file path
+        file_info (dict): Optional, receives the detected format under 'format'
+        sample_rows (int): Number of rows used for format detection
+        input_stream (file): Binary stream to read instead of opening input_file (optional)
+
+    Yields:
+        tuple: (StartTime, EndTime, OriginalLyric, TranslatedLyric)
+    """
+
+    with open_input(input_file, input_stream) as infile:
+        if PROFILE is None:
+            reader = csv.reader(infile)
+        else:
+            reader = profile_iter('parse', csv.reader(profile_iter('decode', infile)))
+
+        # Detect file format
+        sample = list(itertools.islice(reader, sample_rows))
+        with profile_stage('detect'):
+            file_format = sniff_csv_format(sample)
+        print(f"  Detected file format: {file_format}")
+        if file_info is not None:
+            file_info['format'] = file_format
+
+        for row in itertools.chain(sample, reader):
+            # Skip empty rows
+            if not row or len(row) < 3:
+                continue
+
+            # Process data according to format
+            if file_format == 'format2':
+                # Format2: ID,開始時間,終了時間,ローカライズ用キー名
+                if len(row) < 4:
+                    continue
+
+                id_field = row[0].strip()
+                start_time = row[1].strip()
+                end_time = row[2].strip()
+                original_lyric = row[3].strip()
+
+                # Skip header row
+                if (id_field in ['ID', 'id'] or
+                    start_time in ['開始時間', 'StartTime', 'Start Time'] or
+                    end_time in ['終了時間', 'EndTime', 'End Time'] or
+                    original_lyric in ['ローカライズ用キー名', 'OriginalLyric', 'Lyric']):
+                    continue
+
+                # Validate if ID is numeric (optional validation)
+                try:
+                    int(id_field)
+                except ValueError:
+                    # ID is not numeric, might be header or invalid row, skip
+                    continue
+
+            else:
+                # Format1: start_time(seconds),end_time(seconds),lyric
+                start_time = row[0].strip()
+                end_time = row[1].strip()
+                original_lyric = row[2].strip() if len(row) > 2 else ""
+
+                # Skip header row
+                if (start_time in ['開始時間(秒)', '開始時間', 'StartTime', 'Start Time', 'start_time'] or
+                    end_time in ['結束時間(秒)', '結束時間', 'EndTime', 'End Time', 'end_time'] or
+                    original_lyric in ['歌詞', 'Lyric', 'Lyrics', 'OriginalLyric', 'Original Lyric']):
+                    continue
+
+            # Common validation: check time format
+            try:
+                # Try to convert start time and end time to float
+                float(start_time)
+                float(end_time)
+            except ValueError:
+                # If cannot convert to number, skip this row
+                continue
+
+            # Skip empty lyrics
+            if not original_lyric:
+                continue
+
+            # Create new row data (translation field left empty)
+            yield (start_time, end_time, original_lyric, '')
+
+def write_csv_rows(output_file, fieldnames, rows):
+    """
+    Write rows to output file as soon as they are produced
+
+    Rows go to a temporary file next to the output file, which replaces the output
+    file only after the input has been fully read. Converting in place (output file
+    is the input file) therefore stays safe, and a failed run leaves no half-written output.
+
+    Args:
+        output_file (str): Output CSV file path
+        fieldnames (tuple): Header row, only written when there is at least one row
+        rows (iterable): Row tuples
+
+    Returns:
+        int: Number of rows written
+    """
+
+    output_file = Path(output_file)
+    temp_file = output_file.with_name(output_file.name + '.tmp')
+    row_count = 0
+
+    try:
+        with open(temp_file, 'w', encoding='utf-8-sig', newline='') as outfile:
+            writer = csv.writer(outfile)
+            for row in rows:
+                if row_count == 0:
+                    writer.writerow(fieldnames)
+                writer.writerow(row)
+                row_count += 1
+        os.replace(temp_file, output_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+    return row_count
+
+# Timeline problems found by normalize_lyric_rows, with their report labels
+TIMELINE_ISSUES = {
+    'unsorted': "out of order",
+    'negative': "negative span",
+    'zero_length': "zero-length",
+    'duplicate': "duplicate",
+    'overlap': "overlapping"
+}
+
+def normalize_lyric_rows(rows, fix=False, report=None):
+    """
+    Sort lyric rows by start time and detect timeline problems, optionally fixing them
+
+    LyricManger sorts the lines by StartTime and, during playback, moves to the next line only
+    after the current one has ended. Times are compared as 32-bit floats like the plugin does.
+    A line overlapping an earlier line is therefore shown late or not at all, and a zero-length or
+    negative span is never shown.
+    With fix:
+    - A negative span has its start and end time swapped
+    - A zero-length line is dropped, the plugin never shows it
+    - A duplicate line (same times and OriginalLyric) is dropped, keeping a TranslatedLyric
+    - An overlapped line is clipped to end when the next line starts, or joined with it into one
+      line, one text per line, when both start at the same time
+
+    Args:
+        rows (iterable): (StartTime, EndTime, OriginalLyric, TranslatedLyric) tuples with numeric times
+        fix (bool): Fix problems instead of only reporting them
+        report (dict): Optional, receives the number of lines per problem in TIMELINE_ISSUES,
+            plus 'lines' read and 'written'
+
+    Returns:
+        list: Rows sorted by start time
+    """
+
+    rows = [list(row) for row in rows]
+    starts = array('f', (float(row[0]) for row in rows))
+    ends = array('f', (float(row[1]) for row in rows))
+    issues = dict.fromkeys(TIMELINE_ISSUES, 0)
+
+    for index, row in enumerate(rows):
+        if ends[index] < starts[index]:
+            issues['negative'] += 1
+            if fix:
+                row[0], row[1] = row[1], row[0]
+                starts[index], ends[index] = ends[index], starts[index]
+
+    # Sort once, stable so lines with the same start time keep their file order
+    issues['unsorted'] = sum(1 for index in range(1, len(rows)) if starts[index] < starts[index - 1])
+    order = sorted(range(len(rows)), key=starts.__getitem__)
+
+    # Kept lines as [row, start, end], the latest end time so far and the (start, end, OriginalLyric) seen
+    normalized = []
+    max_end = float('-inf')
+    seen_lines = set()
+
+    for index in order:
+        row, start, end = rows[index], starts[index], ends[index]
+
+        # Each line is counted under its first problem only, so fixing does not change the counts
+        if end == start:
+            issues['zero_length'] += 1
+            if not fix:
+                normalized.append([row, start, end])
+            continue
+
+        line = (start, end, row[2])
+        if line in seen_lines:
+            issues['duplicate'] += 1
+            if not fix:
+                normalized.append([row, start, end])
+            elif not normalized[-1][0][3]:
+                # Lines with the same start time are joined, so the duplicated line is the last kept one
+                normalized[-1][0][3] = row[3]
+            continue
+        seen_lines.add(line)
+
+        if start < max_end:
+            issues['overlap'] += 1
+            if fix:
+                # Earlier lines already end before the previous line starts, so only it overlaps
+                previous = normalized[-1]
+                if start == previous[1]:
+                    previous[0][2] += '\n' + row[2]
+                    if previous[0][3] or row[3]:
+                        previous[0][3] += '\n' + row[3]
+                    if end > previous[2]:
+                        previous[0][1], previous[2] = row[1], end
+                    max_end = max(max_end, end)
+                    continue
+                previous[0][1], previous[2] = row[0], start
+                max_end = start
+
+        normalized.append([row, start, end])
+        max_end = max(max_end, end)
+
+    if report is not None:
+        report.update(issues)
+        report['lines'] = len(rows)
+        report['written'] = len(normalized)
+    return [tuple(row) for row, _, _ in normalized]
+
+def describe_timeline(report, fix=False):
+    """
+    Describe the timeline problems of a normalize_lyric_rows report in one line
+
+    Args:
+        report (dict): Report from normalize_lyric_rows, or the sum of several reports
+        fix (bool): Whether the problems were fixed
+
+    Returns:
+        str: Report line
+    """
+
+    problems = [f"{report[issue]} {label}" for issue, label in TIMELINE_ISSUES.items() if report.get(issue)]
+    if not problems:
+        return f"✓ Timeline: {report.get('lines', 0)} lines sorted, no problems"
+    if fix:
+        return f"✓ Timeline fixed: {', '.join(problems)}, {report.get('written', 0)} of {report.get('lines', 0)} lines written"
+    return f"⚠ Timeline problems: {', '.join(problems)} (sorted only, use --fix-timeline to fix)"
+
+def add_report(total, report):
+    """
+    Add the report of one file (timeline or translations) to the total of a batch
+
+    Args:
+        total (dict): Total report, modified in place
+        report (dict): Report of one file, None if the file has no such report
+    """
+
+    if report is None:
+        return
+    for key, value in report.items():
+        total[key] = total.get(key, 0) + value
+
+# Number of orphaned translated lines listed per file when keeping translations
+ORPHAN_PREVIEW_LINES = 5
+
+def load_lyric_translations(lyric_file):
+    """
+    Read the lines of an existing lyric file so their translations can be carried over
+
+    All CSV files of a folder write the same lyric file, so it is read once, before the first of
+    them replaces it, and each of them is matched against the same lines.
+
+    Args:
+        lyric_file (str): Existing lyric file path
+
+    Returns:
+        list: (StartTime, EndTime, OriginalLyric, TranslatedLyric) tuples, None if the file does not exist
+            or is not a lyric file
+    """
+
+    lyric_file = Path(lyric_file)
+    if not lyric_file.is_file():
+        return None
+
+    lines = []
+    with open(lyric_file, 'r', encoding='utf-8-sig', newline='') as infile:
+        reader = csv.reader(infile)
+        # Header names are matched case-insensitively like the plugin does
+        header = [name.strip().lower() for name in next(reader, [])]
+        try:
+            columns = [header.index(name.lower()) for name in OUTPUT_FIELDNAMES]
+        except ValueError:
+            return None
+
+        for row in reader:
+            if len(row) <= max(columns):
+                continue
+            start_time, end_time, original_lyric, translated_lyric = (row[column] for column in columns)
+            try:
+                float(start_time), float(end_time)
+            except ValueError:
+                continue
+            lines.append((start_time, end_time, original_lyric.strip(), translated_lyric))
+    return lines
+
+def index_lyric_translations(lines):
+    """
+    Index the lines of an existing lyric file for carry_translations
+
+    Lines are indexed by (StartTime, EndTime, OriginalLyric) and by OriginalLyric alone.
+    Index lists are kept in reverse file order, so taking a line from the end uses the first
+    unused line of the file.
+
+    Args:
+        lines (list): Lines from load_lyric_translations
+
+    Returns:
+        dict: 'lines', the 'exact' and 'text' indexes and the 'used' flag per line
+    """
+
+    exact = {}
+    text = {}
+    for number, (start_time, end_time, original_lyric, _) in enumerate(lines):
+        exact.setdefault((float(start_time), float(end_time), original_lyric), []).append(number)
+        text.setdefault(original_lyric, []).append(number)
+
+    for indexes in itertools.chain(exact.values(), text.values()):
+        indexes.reverse()
+    return {'lines': lines, 'exact': exact, 'text': text, 'used': bytearray(len(lines))}
+
+def take_lyric_line(index, key, used):
+    """
+    Take the first unused existing line matching a key
+
+    Args:
+        index (dict): Index of index_lyric_translations
+        key: Index key
+        used (bytearray): Used flag per existing line, modified in place
+
+    Returns:
+        int: Line number in the existing file, None if no unused line matches
+    """
+
+    indexes = index.get(key)
+    while indexes:
+        line = indexes.pop()
+        if not used[line]:
+            used[line] = 1
+            return line
+    return None
+
+def carry_translations(rows, existing, report=None):
+    """
+    Carry the translations of an existing lyric file over to converted rows
+
+    A row takes the TranslatedLyric of the existing line with the same times and OriginalLyric,
+    otherwise of a line with the same OriginalLyric whose timing changed. Each existing line is
+    used at most once, so repeated lyrics keep their translations in order.
+
+    Args:
+        rows (iterable): (StartTime, EndTime, OriginalLyric, TranslatedLyric) tuples
+        existing (dict): Existing lines from index_lyric_translations
+        report (dict): Optional, receives the number of 'kept', 'changed' (timing) and 'new' lines
+            once all rows have been read
+
+    Yields:
+        tuple: (StartTime, EndTime, OriginalLyric, TranslatedLyric)
+    """
+
+    counts = {'kept': 0, 'changed': 0, 'new': 0}
+    lines, used = existing['lines'], existing['used']
+
+    for row in rows:
+        line = take_lyric_line(existing['exact'], (float(row[0]), float(row[1]), row[2]), used)
+        if line is not None:
+            counts['kept'] += 1
+        else:
+            line = take_lyric_line(existing['text'], row[2], used)
+            if line is None:
+                counts['new'] += 1
+                yield row
+                continue
+            counts['changed'] += 1
+        yield row[:3] + (lines[line][3],)
+
+    if report is not None:
+        report.update(counts)
+
+def describe_translations(report):
+    """
+    Describe a carry_translations report in one line
+
+    Args:
+        report (dict): Report with 'orphaned' added, or the sum of several reports
+
+    Returns:
+        str: Report line
+    """
+
+    line = (f"Translations: {report.get('kept', 0)} lines kept, {report.get('changed', 0)} with changed timing, "
+            f"{report.get('new', 0)} new lines")
+    if report.get('orphaned'):
+        return f"⚠ {line}, {report['orphaned']} translated lines orphaned"
+    return f"✓ {line}"
+
+def convert_lyric_csv(input_file, output_file, file_info=None, sample_rows=FORMAT_SAMPLE_ROWS, input_stream=None,
+                      normalize=None, existing_lines=None):
+    """
+    Convert lyric timeline CSV format to format with translation fields
+    Supports multiple input formats:
+    - Format1: start_time(seconds),end_time(seconds),lyric
+    - Format2: ID,開始時間,終了時間,ローカライズ用キー名
+
+    Output format: StartTime,EndTime,OriginalLyric,TranslatedLyric
+
+    Args:
+        input_file (str): Input CSV file path
+        output_file (str): Output CSV file path
+        file_info (dict): Optional, receives the detected format under 'format' and the
+            normalize_lyric_rows report under 'timeline' and the translations report under 'translations'
+        sample_rows (int): Number of rows used for format detection
+        input_stream (file): Binary stream to read instead of opening input_file (optional)
+        normalize (str): "report" sorts the lines by start time and reports timeline problems,
+            "fix" also fixes them, None keeps the input order (defaults to None)
+        existing_lines (list): Lines of the existing output file from load_lyric_translations,
+            whose translations are kept (optional)
+
+    Returns:
+        int: Number of converted records, 0 if no valid data, -1 on error
+    """
+
+    try:
+        # Rows are streamed from input to output, memory use does not grow with file size
+        rows = read_lyric_rows(input_file, file_info, sample_rows, input_stream)
+        if PROFILE is not None:
+            rows = profile_iter('transform', rows)
+
+        # Every file sharing the output file is matched against the same existing lines
+        existing = None
+        if existing_lines is not None:
+            with profile_stage('merge'):
+                existing = index_lyric_translations(existing_lines)
+        if existing is not None:
+            translations = {}
+            rows = carry_translations(rows, existing, translations)
+            if PROFILE is not None:
+                rows = profile_iter('merge', rows)
+
+        # Normalizing sorts the whole file, so its rows are kept in memory
+        if normalize is not None:
+            timeline = {}
+            with profile_stage('normalize'):
+                rows = normalize_lyric_rows(rows, fix=normalize == 'fix', report=timeline)
+
+        record_count = write_csv_rows(output_file, OUTPUT_FIELDNAMES, rows)
+        if normalize is not None and timeline['lines'] > 0:
+            print("  " + describe_timeline(timeline, normalize == 'fix'))
+            if file_info is not None:
+                file_info['timeline'] = timeline
+        if existing is not None:
+            orphaned = [line for line, used in zip(existing['lines'], existing['used']) if not used and line[3]]
+            translations['orphaned'] = len(orphaned)
+            print("  " + describe_translations(translations))
+            for start_time, end_time, original_lyric, translated_lyric in orphaned[:ORPHAN_PREVIEW_LINES]:
+                print(f"    Orphaned: {start_time}-{end_time} {original_lyric} → {translated_lyric}")
+            if len(orphaned) > ORPHAN_PREVIEW_LINES:
+                print(f"    ... and {len(orphaned) - ORPHAN_PREVIEW_LINES} more")
+            if file_info is not None:
+                file_info['translations'] = translations
+        return record_count
+
+    except UnicodeDecodeError as e:
+        print(f"Error occurred while processing file {input_file}: not valid {e.encoding} ({e.reason}), set the encoding with --force-encoding")
+        return -1
+
+    except Exception as e:
+        print(f"Error occurred while processing file {input_file}: {e}")
+        return -1
+
+# Archive types accepted as input in place of a folder
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+
+def is_archive(input_path):
+    """
+    Check whether a path names a supported zip or tar archive
+
+    Args:
+        input_path (Path): Input path
+
+    Returns:
+        bool: True for .zip and .tar(.gz/.bz2/.xz) files
+    """
+
+    return input_path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+def is_member_path_unsafe(member_name):
+    """
+    Check an archive member name the same way as FileTool.IsZipPathUnsafe in the plugin
+
+    Rejects empty names, parent folder references and absolute or rooted paths.
+
+    Args:
+        member_name (str): Member name in the archive
+
+    Returns:
+        bool: True if the member must not be used
+    """
+
+    if not member_name:
+        return True
+
+    # Unify path separators
+    normalized_path = member_name.replace('\\', '/')
+
+    # Reject "../"
+    if '../' in normalized_path:
+        return True
+
+    # Reject absolute paths, including Windows drive paths
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def iter_archive_csv_files(input_archive, recursive=True):
+    """
+    Iterate over the CSV members of a zip or tar archive without extracting it
+
+    Members are opened one at a time in archive order, so compressed tar archives are
+    decompressed in a single forward pass.
+
+    Args:
+        input_archive (Path): Archive path
+        recursive (bool): Whether to include members in subfolders
+
+    Yields:
+        tuple: (relative path of the member, binary stream of the member)
+    """
+
+    def get_relative_path(member_name):
+        if is_member_path_unsafe(member_name):
+            print(f"Skipping unsafe archive member: {member_name}")
+            return None
+        relative_path = PurePosixPath(member_name.replace('\\', '/'))
+        if relative_path.suffix != '.csv' or (not recursive and len(relative_path.parts) > 1):
+            return None
+        return relative_path
+
+    if zipfile.is_zipfile(input_archive):
+        with zipfile.ZipFile(input_archive) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                relative_path = get_relative_path(info.filename)
+                if relative_path is not None:
+                    with archive.open(info) as member_file:
+                        yield relative_path, member_file
+    else:
+        with tarfile.open(input_archive, 'r:*') as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                relative_path = get_relative_path(member.name)
+                if relative_path is not None:
+                    with archive.extractfile(member) as member_file:
+                        yield relative_path, member_file
+
+# Manifest file name for incremental conversion, stored in the output folder
+MANIFEST_FILENAME = ".convert_manifest.jsonl"
+
+def hash_file(input_file):
+    """
+    Calculate SHA-256 hash of file content
+
+    Args:
+        input_file (str): File path
+
+    Returns:
+        str: Hex digest
+    """
+
+    digest = hashlib.sha256()
+    with open(input_file, 'rb') as infile:
+        for chunk in iter(lambda: infile.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def get_file_state(input_file, entry=None):
+    """
+    Get size, mtime and content hash of input file
+
+    The hash is taken from the manifest entry when size and mtime are unchanged,
+    so unchanged files are never read.
+
+    Args:
+        input_file (str): Input file path
+        entry (dict): Manifest entry of the file (optional)
+
+    Returns:
+        dict: {'size', 'mtime_ns', 'sha256'}
+    """
+
+    stat = os.stat(input_file)
+    if entry is not None and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+        sha256 = entry.get('sha256')
+    else:
+        sha256 = hash_file(input_file)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+
+def load_manifest(manifest_file):
+    """
+    Load conversion manifest
+
+    The manifest is a JSON lines journal, later lines override earlier ones for the same path.
+    A line cut off by an interrupted run is ignored.
+
+    Args:
+        manifest_file (Path): Manifest file path
+
+    Returns:
+        dict: Relative input path -> manifest entry
+    """
+
+    manifest = {}
+    if not manifest_file.exists():
+        return manifest
+
+    with open(manifest_file, 'r', encoding='utf-8') as infile:
+        for line in infile:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and 'path' in entry:
+                manifest[entry['path']] = entry
+    return manifest
+
+def append_manifest_entry(manifest_file, manifest, entry):
+    """
+    Record a completed file in the manifest
+
+    The entry is appended to the file immediately, so an interrupted run resumes after the last completed file.
+
+    Args:
+        manifest_file (Path): Manifest file path
+        manifest (dict): Loaded manifest, updated in place
+        entry (dict): Manifest entry
+    """
+
+    manifest[entry['path']] = entry
+    with open(manifest_file, 'a', encoding='utf-8', newline='\n') as outfile:
+        outfile.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+def save_manifest(manifest_file, manifest, input_path):
+    """
+    Rewrite manifest with one line per input file, dropping entries of deleted inputs
+
+    Args:
+        manifest_file (Path): Manifest file path
+        manifest (dict): Loaded manifest
+        input_path (Path): Input folder path
+    """
+
+    temp_file = manifest_file.with_name(manifest_file.name + '.tmp')
+    with open(temp_file, 'w', encoding='utf-8', newline='\n') as outfile:
+        for path in sorted(manifest):
+            if (input_path / path).exists():
+                outfile.write(json.dumps(manifest[path], ensure_ascii=False) + '\n')
+    os.replace(temp_file, manifest_file)
+
+def is_unchanged(entry, state, options, inputs, output_file):
+    """
+    Check whether a file can be skipped in incremental mode
+
+    Args:
+        entry (dict): Manifest entry of the file, None if not converted before
+        state (dict): Current file state from get_file_state
+        options (dict): Conversion options of this run
+        inputs (list): Sorted relative paths of the input files sharing the output file
+        output_file (Path): Output file path
+
+    Returns:
+        bool: True if content and options are unchanged, the output is shared by the same input files
+            and still exists
+    """
+
+    return (entry is not None and
+            entry.get('sha256') == state['sha256'] and
+            entry.get('options') == options and
+            entry.get('inputs') == inputs and
+            output_file.exists())
+
+def convert_file_task(input_file, output_file, sample_rows=FORMAT_SAMPLE_ROWS, normalize=None, existing_lines=None):
     """
-    Detect the format type of the CSV file
+    Worker process entry, convert one file and capture its console output
 
     Args:
         input_file (str): Input CSV file path
+        output_file (str): Output CSV file path
+        sample_rows (int): Number of rows used for format detection
+        normalize (str): Timeline normalization, "report", "fix" or None
+        existing_lines (list): Lines of the existing output file whose translations are kept (optional)
 
     Returns:
-        str: Format type ('format1', 'format2', 'unknown')
+        tuple: (record_count, console output of the conversion, file_info, duration in seconds)
     """
-    try:
-        with open(input_file, 'r', encoding='utf-8-sig') as infile:
-            reader = csv.reader(infile)
-            first_row = next(reader, None)
-
-            if not first_row:
-                return 'unknown'
-
-            # Check if it's format2 (contains ID and Japanese column names)
-            if (len(first_row) >= 4 and
-                ('ID' in first_row[0] or first_row[0].strip() == 'ID') and
-                ('開始時間' in first_row[1] or '終了時間' in first_row[2] or 'ローカライズ用キー名' in first_row[3])):
-                return 'format2'
-
-            # Check if it's format1 (original format)
-            if (len(first_row) >= 3 and
-                (first_row[0].strip() in ['開始時間(秒)', '開始時間', 'StartTime', 'Start Time', 'start_time'] or
-                 first_row[1].strip() in ['結束時間(秒)', '結束時間', 'EndTime', 'End Time', 'end_time'] or
-                 first_row[2].strip() in ['歌詞', 'Lyric', 'Lyrics', 'OriginalLyric', 'Original Lyric'])):
-                return 'format1'
-
-            # If the first row is not a header, try to detect data format
-            # Format2 usually has numeric ID in the first column
-            try:
-                int(first_row[0])
-                if len(first_row) >= 4:
-                    return 'format2'
-            except ValueError:
-                pass
-
-            # Format1 usually starts directly with time
-            try:
-                float(first_row[0])
-                float(first_row[1])
-                if len(first_row) >= 3:
-                    return 'format1'
-            except ValueError:
-                pass
-
-    except Exception as e:
-        print(f"Error occurred while detecting file format: {e}")
 
-    return 'unknown'
+    start_time = time.perf_counter()
+    console_output = io.StringIO()
+    file_info = {}
+    with contextlib.redirect_stdout(console_output):
+        record_count = convert_lyric_csv(input_file, output_file, file_info, sample_rows, normalize=normalize,
+                                         existing_lines=existing_lines)
+    return record_count, console_output.getvalue(), file_info, time.perf_counter() - start_time
 
-def convert_lyric_csv(input_file, output_file):
+def convert_file_group_task(input_files, output_file, sample_rows=FORMAT_SAMPLE_ROWS, normalize=None,
+                            keep_translations=False):
     """
-    Convert lyric timeline CSV format to format with translation fields
-    Supports multiple input formats:
-    - Format1: start_time(seconds),end_time(seconds),lyric
-    - Format2: ID,開始時間,終了時間,ローカライズ用キー名
+    Worker process entry, convert files sharing one output file in input order
 
-    Output format: StartTime,EndTime,OriginalLyric,TranslatedLyric
+    All CSV files in a folder are converted to the same lyric file. Running them in one worker
+    keeps the last file in input order as the final output, the same as in serial mode.
 
     Args:
-        input_file (str): Input CSV file path
+        input_files (list): Input CSV file paths, in input order
         output_file (str): Output CSV file path
+        sample_rows (int): Number of rows used for format detection
+        normalize (str): Timeline normalization, "report", "fix" or None
+        keep_translations (bool): Keep the TranslatedLyric values of the existing output file
+
+    Returns:
+        list: (record_count, console output of the conversion, file_info, duration in seconds) per input file
     """
 
-    # Detect file format
-    file_format = detect_csv_format(input_file)
-    print(f"  Detected file format: {file_format}")
+    # The existing output file is read once, before the first file replaces it
+    existing_lines = load_lyric_translations(output_file) if keep_translations else None
+    return [convert_file_task(input_file, output_file, sample_rows, normalize, existing_lines)
+            for input_file in input_files]
 
-    try:
-        # Use utf-8-sig encoding to handle BOM
-        with open(input_file, 'r', encoding='utf-8-sig') as infile:
-            reader = csv.reader(infile)
+def convert_files_parallel(tasks, jobs, sample_rows=FORMAT_SAMPLE_ROWS, normalize=None, keep_translations=False):
+    """
+    Convert files in a process pool
 
-            # Prepare output data
-            output_data = []
+    Args:
+        tasks (list): (input_file, relative_path, output_file, state) tuples
+        jobs (int): Number of worker processes
+        sample_rows (int): Number of rows used for format detection
+        normalize (str): Timeline normalization, "report", "fix" or None
+        keep_translations (bool): Keep the TranslatedLyric values of the existing output file
 
-            for row_num, row in enumerate(reader, 1):
-                # Skip empty rows
-                if not row or len(row) < 3:
-                    continue
+    Yields:
+        tuple: (record_count, console output of the conversion, file_info, duration in seconds), in the same
+            order as tasks
+    """
 
-                # Process data according to format
-                if file_format == 'format2':
-                    # Format2: ID,開始時間,終了時間,ローカライズ用キー名
-                    if len(row) < 4:
-                        continue
-
-                    id_field = row[0].strip()
-                    start_time = row[1].strip()
-                    end_time = row[2].strip()
-                    original_lyric = row[3].strip()
-
-                    # Skip header row
-                    if (id_field in ['ID', 'id'] or
-                        start_time in ['開始時間', 'StartTime', 'Start Time'] or
-                        end_time in ['終了時間', 'EndTime', 'End Time'] or
-                        original_lyric in ['ローカライズ用キー名', 'OriginalLyric', 'Lyric']):
-                        continue
-
-                    # Validate if ID is numeric (optional validation)
-                    try:
-                        int(id_field)
-                    except ValueError:
-                        # ID is not numeric, might be header or invalid row, skip
-                        continue
+    executor = ProcessPoolExecutor(max_workers=jobs, initializer=set_force_encoding, initargs=(FORCE_ENCODING,))
+    try:
+        # Files sharing an output file are converted by one worker in input order
+        groups = {}
+        for index, (_, _, output_file, _) in enumerate(tasks):
+            groups.setdefault(output_file, []).append(index)
 
-                else:
-                    # Format1: start_time(seconds),end_time(seconds),lyric
-                    start_time = row[0].strip()
-                    end_time = row[1].strip()
-                    original_lyric = row[2].strip() if len(row) > 2 else ""
-
-                    # Skip header row
-                    if (start_time in ['開始時間(秒)', '開始時間', 'StartTime', 'Start Time', 'start_time'] or
-                        end_time in ['結束時間(秒)', '結束時間', 'EndTime', 'End Time', 'end_time'] or
-                        original_lyric in ['歌詞', 'Lyric', 'Lyrics', 'OriginalLyric', 'Original Lyric']):
-                        continue
-
-                # Common validation: check time format
-                try:
-                    # Try to convert start time and end time to float
-                    float(start_time)
-                    float(end_time)
-                except ValueError:
-                    # If cannot convert to number, skip this row
-                    continue
+        futures = {}
+        for output_file, indexes in groups.items():
+            future = executor.submit(convert_file_group_task, [tasks[index][0] for index in indexes],
+                                     output_file, sample_rows, normalize, keep_translations)
+            for position, index in enumerate(indexes):
+                futures[index] = (future, position)
 
-                # Skip empty lyrics
-                if not original_lyric:
-                    continue
+        for index, (csv_file, _, _, _) in enumerate(tasks):
+            future, position = futures[index]
+            try:
+                yield future.result()[position]
+            except Exception as e:
+                # The worker process itself failed, report it like a conversion error
+                yield -1, f"Error occurred while processing file {csv_file}: {e}\n", {}, None
+    finally:
+        executor.shutdown(cancel_futures=True)
 
-                # Create new row data (translation field left empty)
-                new_row = {
-                    'StartTime': start_time,
-                    'EndTime': end_time,
-                    'OriginalLyric': original_lyric,
-                    'TranslatedLyric': ''  # Translation field left empty
-                }
-
-                output_data.append(new_row)
-
-        # Write to output file
-        with open(output_file, 'w', encoding='utf-8-sig', newline='') as outfile:
-            if output_data:
-                writer = csv.DictWriter(outfile, fieldnames=['StartTime', 'EndTime', 'OriginalLyric', 'TranslatedLyric'])
-                writer.writeheader()
-                writer.writerows(output_data)
-                return len(output_data)
-            else:
-                return 0
+def get_output_file(csv_file, input_path, output_path=None, output_suffix=""):
+    """
+    Get the lyric file path of one input file, shared by all CSV files of its folder
 
-    except Exception as e:
-        print(f"Error occurred while processing file {input_file}: {e}")
-        return -1
+    Args:
+        csv_file (Path): Input CSV file path
+        input_path (Path): Input folder path
+        output_path (Path): Output folder path, None writes next to the input file
+        output_suffix (str): Output filename suffix (defaults to empty)
+
+    Returns:
+        Path: Output file path
+    """
+
+    output_filename = "lyric" + output_suffix + ".csv"
+    if output_path is None:
+        # Generate file in original location
+        return csv_file.parent / output_filename
+    # Maintain same folder structure in specified output folder
+    return output_path / csv_file.relative_to(input_path).parent / output_filename
 
-def process_folder(input_folder, output_folder=None, output_suffix="", recursive=True):
+def process_folder(input_folder, output_folder=None, output_suffix="", recursive=True, jobs=1, incremental=False,
+                   sample_rows=FORMAT_SAMPLE_ROWS, normalize=None, keep_translations=False, csv_files=None):
     """
     Batch process all CSV files in a folder (including subfolders)
 
@@ -179,6 +1304,12 @@ def process_folder(input_folder, output_folder=None, output_suffix="", recursive
         output_folder (str): Output folder path (optional, defaults to input folder)
         output_suffix (str): Output filename suffix (defaults to empty)
         recursive (bool): Whether to recursively process subfolders (defaults to True)
+        jobs (int): Number of worker processes, 0 uses all CPU cores (defaults to 1)
+        incremental (bool): Skip files unchanged since the last run, tracked by a manifest in the output folder
+        sample_rows (int): Number of rows used for format detection
+        normalize (str): Timeline normalization, "report", "fix" or None (defaults to None)
+        keep_translations (bool): Keep the TranslatedLyric values of the existing output file (defaults to False)
+        csv_files (list): Input CSV files to convert instead of searching the input folder, used by --watch (optional)
     """
 
     input_path = Path(input_folder)
@@ -200,13 +1331,17 @@ def process_folder(input_folder, output_folder=None, output_suffix="", recursive
         # If output folder doesn't exist, create it
         output_path.mkdir(parents=True, exist_ok=True)
 
-    # Find all CSV files (recursive or non-recursive)
-    if recursive:
-        csv_files = list(input_path.rglob("*.csv"))  # Recursively find all subfolders
-        print(f"Recursively searching folder {input_folder} and its subfolders...")
-    else:
-        csv_files = list(input_path.glob("*.csv"))   # Only search current folder
-        print(f"Searching folder {input_folder}...")
+    # Find all CSV files (recursive or non-recursive), unless the files to convert are given
+    if csv_files is None:
+        with profile_stage('discover'):
+            if recursive:
+                csv_files = list(input_path.rglob("*.csv"))  # Recursively find all subfolders
+            else:
+                csv_files = list(input_path.glob("*.csv"))   # Only search current folder
+        if recursive:
+            print(f"Recursively searching folder {input_folder} and its subfolders...")
+        else:
+            print(f"Searching folder {input_folder}...")
 
     if not csv_files:
         search_type = "and its subfolders" if recursive else ""
@@ -214,58 +1349,640 @@ def process_folder(input_folder, output_folder=None, output_suffix="", recursive
         return
 
     print(f"Found {len(csv_files)} CSV files, starting processing...")
-    print("-" * 50)
 
     total_processed = 0
     successful_files = 0
+    timeline_total = {}
+    translations_total = {}
+    tasks = []
 
-    for csv_file in csv_files:
-        # Calculate relative path to maintain folder structure
-        relative_path = csv_file.relative_to(input_path)
+    # Load manifest of previous runs in incremental mode
+    manifest = None
+    if incremental:
+        manifest_file = output_path / MANIFEST_FILENAME
+        manifest = load_manifest(manifest_file)
+        options = {'output_suffix': output_suffix, 'sample_rows': sample_rows}
+        if normalize is not None:
+            options['normalize'] = normalize
+        if keep_translations:
+            options['keep_translations'] = True
+        if FORCE_ENCODING is not None:
+            options['encoding'] = FORCE_ENCODING
+        skipped_files = 0
 
+    # All CSV files of a folder share one lyric file, group them by output file in input order
+    groups = {}
+    for csv_file in csv_files:
         # Generate output file path, maintaining original folder structure
-        if output_folder is None:
-            # Generate file in original location
-            output_filename = "lyric" + output_suffix + ".csv"
-            output_file = csv_file.parent / output_filename
-        else:
-            # Maintain same folder structure in specified output folder
-            output_filename = "lyric" + output_suffix + ".csv"
-            output_file = output_path / relative_path.parent / output_filename
+        output_file = get_output_file(csv_file, input_path, None if output_folder is None else output_path,
+                                      output_suffix)
+        groups.setdefault(output_file, []).append(csv_file)
 
+    group_inputs = {}
+    for output_file, group_files in groups.items():
+        if output_folder is not None:
             # Ensure output folder exists
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Display relative path for better understanding of file location
-        print(f"Processing file: {relative_path}")
+        # Calculate relative paths to maintain folder structure
+        relative_paths = [csv_file.relative_to(input_path) for csv_file in group_files]
+        states = [None] * len(group_files)
+
+        # Skip groups whose files are all unchanged since the last run, they still count towards the totals.
+        # The files of a group share the output file, so a changed, added or removed file reconverts the group.
+        if manifest is not None:
+            inputs = group_inputs[output_file] = sorted(relative_path.as_posix() for relative_path in relative_paths)
+            entries = [manifest.get(relative_path.as_posix()) for relative_path in relative_paths]
+            with profile_stage('manifest'):
+                states = [get_file_state(csv_file, entry) for csv_file, entry in zip(group_files, entries)]
+            if all(is_unchanged(entry, state, options, inputs, output_file) for entry, state in zip(entries, states)):
+                for relative_path, entry, state in zip(relative_paths, entries, states):
+                    if entry.get('size') != state['size'] or entry.get('mtime_ns') != state['mtime_ns']:
+                        append_manifest_entry(manifest_file, manifest, {**entry, **state})
+                    if entry.get('records', 0) > 0:
+                        total_processed += entry['records']
+                        successful_files += 1
+                    add_report(timeline_total, entry.get('timeline'))
+                    add_report(translations_total, entry.get('translations'))
+                    skipped_files += 1
+                    if PROGRESS is not None:
+                        report_file(relative_path, None)
+                continue
+
+        tasks.extend(zip(group_files, relative_paths, [output_file] * len(group_files), states))
+
+    if manifest is not None:
+        print(f"Note: Skipping {skipped_files} unchanged files.")
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(tasks))
+    if jobs > 1:
+        print(f"Note: Using {jobs} worker processes.")
+    print("-" * 50)
+
+    # In parallel mode, workers convert files and results come back in input order
+    results = convert_files_parallel(tasks, jobs, sample_rows, normalize, keep_translations) if jobs > 1 else None
+
+    if PROGRESS is not None:
+        PROGRESS['total_files'] = len(csv_files)
+    existing_lines = existing_output = None
+    for csv_file, relative_path, output_file, state in tasks:
+        if PROGRESS is None:
+            # Display relative path for better understanding of file location
+            print(f"Processing file: {relative_path}")
+            input_bytes = None
+        else:
+            input_bytes = csv_file.stat().st_size
 
         # Convert file
-        record_count = convert_lyric_csv(csv_file, output_file)
+        if results is None:
+            if keep_translations and output_file != existing_output:
+                # The existing output file is read once, before the first of the files sharing it replaces it
+                with profile_stage('merge'):
+                    existing_lines, existing_output = load_lyric_translations(output_file), output_file
+            file_info = {}
+            record_count, console_output, duration = run_file(relative_path, lambda: convert_lyric_csv(
+                csv_file, output_file, file_info, sample_rows, normalize=normalize,
+                existing_lines=existing_lines))
+        else:
+            record_count, console_output, file_info, duration = next(results)
+            if PROGRESS is None:
+                print(console_output, end='')
 
         if record_count > 0:
-            print(f"  ✓ Successfully converted {record_count} records")
-            print(f"  ✓ Output file: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
             total_processed += record_count
             successful_files += 1
+        add_report(timeline_total, file_info.get('timeline'))
+        add_report(translations_total, file_info.get('translations'))
+
+        if PROGRESS is not None:
+            report_file(relative_path, record_count, console_output, bytes=input_bytes, duration=duration, **file_info)
+        elif record_count > 0:
+            print(f"  ✓ Successfully converted {record_count} records")
+            print(f"  ✓ Output file: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
         elif record_count == 0:
             print(f"  ⚠ No valid data in file")
         else:
             print(f"  ✗ Processing failed")
 
-        print()
+        # Record converted file in manifest, failed files are retried on the next run
+        if manifest is not None and record_count >= 0:
+            if output_file == csv_file:
+                # Converted in place, record the converted content so it is not converted again
+                with profile_stage('manifest'):
+                    state = get_file_state(csv_file)
+            append_manifest_entry(manifest_file, manifest, {
+                'path': relative_path.as_posix(),
+                **state,
+                'options': options,
+                'format': file_info.get('format'),
+                'output': output_file.relative_to(output_path).as_posix(),
+                'inputs': group_inputs[output_file],
+                'records': record_count,
+                **{key: file_info[key] for key in ('timeline', 'translations') if key in file_info}
+            })
+
+        if PROGRESS is None:
+            print()
+
+    if manifest is not None:
+        save_manifest(manifest_file, manifest, input_path)
+
+    print("-" * 50)
+    print_summary(successful_files, len(csv_files), total_processed, skipped_files if manifest is not None else None)
+    if normalize is not None and PROGRESS is None:
+        print(describe_timeline(timeline_total, normalize == 'fix'))
+    if translations_total and PROGRESS is None:
+        print(describe_translations(translations_total))
+
+# Seconds without new changes before a burst of saves is converted
+WATCH_DEBOUNCE = 0.1
+
+# Seconds between scans of the input folder when inotify is not available
+WATCH_POLL_INTERVAL = 0.25
+
+# Folders modified less than this many seconds before they were listed are listed again by the next
+# poll, a change in the same clock tick as the listing would not change their modification time
+WATCH_MTIME_GRACE = 2.0
+
+# inotify event flags (linux/inotify.h)
+IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x8, 0x40, 0x80, 0x100, 0x200
+IN_Q_OVERFLOW, IN_IGNORED, IN_ONLYDIR, IN_ISDIR = 0x4000, 0x8000, 0x1000000, 0x40000000
+
+# Events watched on every folder, new files are converted when closed after writing
+INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+
+# Header of an inotify event: watch descriptor, mask, cookie and name length
+INOTIFY_EVENT = struct.Struct('iIII')
+
+def is_csv_name(name):
+    """
+    Check whether a file name is matched by *.csv, case-insensitively where the file system is
+
+    Args:
+        name (str): File name
+
+    Returns:
+        bool: True for CSV files
+    """
+
+    return os.path.normcase(name).endswith('.csv')
+
+def refresh_folder(snapshot, folder, recursive, changes):
+    """
+    List one folder again and record the CSV files that were added, changed or removed
+
+    Subfolders new to the snapshot are scanned completely, known subfolders are not listed again.
+
+    Args:
+        snapshot (dict): Folder path -> {'mtime_ns', 'files': {name: (mtime_ns, size)}, 'folders': set of names},
+            updated in place
+        folder (Path): Folder path
+        recursive (bool): Whether subfolders are watched
+        changes (set): Receives the paths of changed CSV files
+
+    Returns:
+        int: Number of changed CSV files
+    """
+
+    old = snapshot.get(folder)
+    try:
+        folder_mtime = os.stat(folder).st_mtime_ns
+        with os.scandir(folder) as entries:
+            files = {}
+            folders = set()
+            for entry in entries:
+                if entry.is_dir():
+                    if recursive:
+                        folders.add(entry.name)
+                elif is_csv_name(entry.name) and entry.is_file():
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    except (FileNotFoundError, NotADirectoryError):
+        return forget_folder(snapshot, folder, changes)
+
+    count = 0
+    old_files = old['files'] if old is not None else {}
+    for name in files.keys() | old_files.keys():
+        if files.get(name) != old_files.get(name):
+            changes.add(folder / name)
+            count += 1
+    # Listed again by the next poll, see WATCH_MTIME_GRACE
+    if time.time_ns() - folder_mtime < WATCH_MTIME_GRACE * 1e9:
+        folder_mtime = None
+    snapshot[folder] = {'mtime_ns': folder_mtime, 'files': files, 'folders': folders}
+
+    old_folders = old['folders'] if old is not None else set()
+    for name in old_folders - folders:
+        count += forget_folder(snapshot, folder / name, changes)
+    for name in folders - old_folders:
+        count += refresh_folder(snapshot, folder / name, recursive, changes)
+    return count
+
+def forget_folder(snapshot, folder, changes):
+    """
+    Remove a deleted folder and its subfolders from the snapshot, recording their CSV files as changed
+
+    Args:
+        snapshot (dict): Snapshot from refresh_folder, updated in place
+        folder (Path): Folder path
+        changes (set): Receives the paths of removed CSV files
+
+    Returns:
+        int: Number of removed CSV files
+    """
+
+    old = snapshot.pop(folder, None)
+    if old is None:
+        return 0
+    changes.update(folder / name for name in old['files'])
+    return len(old['files']) + sum(forget_folder(snapshot, folder / name, changes) for name in old['folders'])
+
+def refresh_file(snapshot, csv_file, changes):
+    """
+    Stat one file of a watched folder again and record it if it was added, changed or removed
+
+    Args:
+        snapshot (dict): Snapshot from refresh_folder, updated in place
+        csv_file (Path): File path
+        changes (set): Receives the path if the file changed
+
+    Returns:
+        int: 1 if the file changed, 0 otherwise
+    """
+
+    folder = snapshot.get(csv_file.parent)
+    if folder is None or not is_csv_name(csv_file.name):
+        return 0
+    try:
+        stat = os.stat(csv_file)
+        state = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        state = None
+    if state == folder['files'].get(csv_file.name):
+        return 0
+    if state is None:
+        del folder['files'][csv_file.name]
+    else:
+        folder['files'][csv_file.name] = state
+    changes.add(csv_file)
+    return 1
+
+def poll_snapshot(snapshot, recursive, changes):
+    """
+    Check the watched folders again, the polling fallback where inotify is not available
+
+    Only the folders whose modification time changed are listed again, which finds added, removed and
+    renamed files and folders. A file written in place does not change the modification time of its
+    folder, so the CSV files of the other folders are checked with one stat each.
+
+    Args:
+        snapshot (dict): Snapshot from refresh_folder, updated in place
+        recursive (bool): Whether subfolders are watched
+        changes (set): Receives the paths of changed CSV files
+
+    Returns:
+        int: Number of changed CSV files
+    """
+
+    count = 0
+    for folder in list(snapshot):
+        entry = snapshot.get(folder)
+        if entry is None:
+            # Forgotten with its parent folder during this poll
+            continue
+        try:
+            folder_mtime = os.stat(folder).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            count += forget_folder(snapshot, folder, changes)
+            continue
+        if folder_mtime != entry['mtime_ns']:
+            count += refresh_folder(snapshot, folder, recursive, changes)
+        else:
+            for name, state in list(entry['files'].items()):
+                try:
+                    stat = os.stat(os.path.join(folder, name))
+                except FileNotFoundError:
+                    stat = None
+                if stat is None or (stat.st_mtime_ns, stat.st_size) != state:
+                    count += refresh_file(snapshot, folder / name, changes)
+    return count
+
+def open_inotify():
+    """
+    Open an inotify instance through the C library
+
+    Returns:
+        dict: {'libc', 'fd', 'folders': watch descriptor -> folder path}, None where inotify is not available
+    """
+
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    return {'libc': libc, 'fd': fd, 'folders': {}}
+
+def update_inotify_watches(watcher, snapshot):
+    """
+    Watch the folders of the snapshot, and stop watching folders that were removed or moved away
+
+    Args:
+        watcher (dict): inotify instance from open_inotify
+        snapshot (dict): Snapshot from refresh_folder
+
+    Raises:
+        OSError: A watch cannot be added, e.g. when the inotify watch limit is reached
+    """
+
+    for wd, folder in list(watcher['folders'].items()):
+        if folder not in snapshot:
+            watcher['libc'].inotify_rm_watch(watcher['fd'], wd)
+            del watcher['folders'][wd]
+
+    watched = set(watcher['folders'].values())
+    for folder in snapshot:
+        if folder in watched:
+            continue
+        wd = watcher['libc'].inotify_add_watch(watcher['fd'], os.fsencode(folder), INOTIFY_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOENT:
+                # Removed since it was listed, its parent reports the removal
+                continue
+            raise OSError(error, os.strerror(error), str(folder))
+        watcher['folders'][wd] = folder
+
+def read_inotify(watcher, snapshot, recursive, timeout, changes):
+    """
+    Wait for inotify events and update the snapshot for the files and folders they name
+
+    Args:
+        watcher (dict): inotify instance from open_inotify
+        snapshot (dict): Snapshot from refresh_folder, updated in place
+        recursive (bool): Whether subfolders are watched
+        timeout (float): Seconds to wait for the first event
+        changes (set): Receives the paths of changed CSV files
+
+    Returns:
+        int: Number of changed CSV files
+    """
+
+    if not select.select([watcher['fd']], [], [], timeout)[0]:
+        return 0
+
+    data = b''
+    while True:
+        try:
+            data += os.read(watcher['fd'], 64 * 1024)
+        except BlockingIOError:
+            break
+
+    count = 0
+    offset = 0
+    while offset < len(data):
+        wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+        name = os.fsdecode(data[offset + INOTIFY_EVENT.size:offset + INOTIFY_EVENT.size + length].rstrip(b'\0'))
+        offset += INOTIFY_EVENT.size + length
+        folder = watcher['folders'].get(wd)
+        if mask & IN_Q_OVERFLOW:
+            # Events were dropped, compare every folder instead
+            count += poll_snapshot(snapshot, recursive, changes)
+        elif mask & IN_IGNORED:
+            watcher['folders'].pop(wd, None)
+        elif folder is None:
+            continue
+        elif mask & IN_ISDIR:
+            count += refresh_folder(snapshot, folder, recursive, changes)
+        elif not mask & IN_CREATE:
+            # A new file is converted when it is closed after writing, not when it is created
+            count += refresh_file(snapshot, folder / name, changes)
+
+    update_inotify_watches(watcher, snapshot)
+    return count
+
+def watch_folder(input_folder, output_folder, output_suffix="", recursive=True, jobs=1, incremental=False,
+                 sample_rows=FORMAT_SAMPLE_ROWS, normalize=None, keep_translations=False, progress_mode=None):
+    """
+    Convert a folder, then keep converting the CSV files that are added, changed or removed until interrupted
+
+    The folder tree is kept in memory and updated from inotify events where available, otherwise by
+    listing the watched folders every WATCH_POLL_INTERVAL seconds. Changes are converted once no new
+    change came in for WATCH_DEBOUNCE seconds. All CSV files of a folder share one lyric file, so a
+    change converts every CSV file left in its folder again, and the lyric file of a folder without
+    CSV files is deleted.
+
+    Args:
+        input_folder (str): Input folder path
+        output_folder (str): Output folder path, outside the input folder
+        output_suffix (str): Output filename suffix (defaults to empty)
+        recursive (bool): Whether to recursively process subfolders (defaults to True)
+        jobs (int): Number of worker processes, 0 uses all CPU cores (defaults to 1)
+        incremental (bool): Skip files unchanged since the last run, tracked by a manifest in the output folder
+        sample_rows (int): Number of rows used for format detection
+        normalize (str): Timeline normalization, "report", "fix" or None (defaults to None)
+        keep_translations (bool): Keep the TranslatedLyric values of the existing output file (defaults to False)
+        progress_mode (str): "quiet" prints only the summary of each conversion, None prints the usual console text
+    """
+
+    input_path = Path(input_folder)
+    if not input_path.is_dir():
+        print(f"Error: {input_folder} is not a folder")
+        return
+
+    # Output files inside the input folder would be picked up as changed inputs
+    if output_folder is None or Path(output_folder).resolve().is_relative_to(input_path.resolve()):
+        print("Error: --watch requires an output folder outside the input folder")
+        return
+    output_path = Path(output_folder)
+
+    snapshot = {}
+    refresh_folder(snapshot, input_path, recursive, set())
+    watcher = open_inotify()
+    if watcher is not None:
+        try:
+            update_inotify_watches(watcher, snapshot)
+        except OSError as e:
+            print(f"⚠ Cannot watch with inotify ({e}), polling instead")
+            os.close(watcher['fd'])
+            watcher = None
+
+    with progress_output(progress_mode):
+        process_folder(input_folder, output_folder, output_suffix, recursive, jobs=jobs, incremental=incremental,
+                       sample_rows=sample_rows, normalize=normalize, keep_translations=keep_translations)
+    print()
+    if watcher is None:
+        print(f"Watching folder {input_folder} by polling every {WATCH_POLL_INTERVAL} seconds, press Ctrl+C to stop...")
+    else:
+        print(f"Watching folder {input_folder} with inotify, press Ctrl+C to stop...")
+
+    changes = set()
+    last_change_time = None
+    try:
+        while True:
+            timeout = WATCH_POLL_INTERVAL if last_change_time is None else WATCH_DEBOUNCE
+            try:
+                if watcher is None:
+                    time.sleep(timeout)
+                    change_count = poll_snapshot(snapshot, recursive, changes)
+                else:
+                    change_count = read_inotify(watcher, snapshot, recursive, timeout, changes)
+            except OSError as e:
+                if watcher is None:
+                    raise
+                print(f"⚠ inotify failed ({e}), polling instead")
+                os.close(watcher['fd'])
+                watcher = None
+                change_count = poll_snapshot(snapshot, recursive, changes)
+
+            if change_count:
+                last_change_time = time.perf_counter()
+                continue
+            if not changes or time.perf_counter() - last_change_time < WATCH_DEBOUNCE:
+                continue
+
+            # Convert the CSV files left in each changed folder, remove the lyric file of emptied folders
+            start_time = time.perf_counter()
+            csv_files = []
+            removed_files = 0
+            print()
+            for folder, csv_file in sorted({path.parent: path for path in changes}.items()):
+                names = sorted(snapshot[folder]['files']) if folder in snapshot else []
+                if names:
+                    csv_files.extend(folder / name for name in names)
+                    continue
+                output_file = get_output_file(csv_file, input_path, output_path, output_suffix)
+                if output_file.exists():
+                    output_file.unlink()
+                    removed_files += 1
+                    if progress_mode is None:
+                        print(f"  ✓ Removed output file: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
+            if csv_files:
+                with progress_output(progress_mode):
+                    process_folder(input_folder, output_folder, output_suffix, recursive, jobs=jobs,
+                                   incremental=incremental, sample_rows=sample_rows, normalize=normalize,
+                                   keep_translations=keep_translations, csv_files=csv_files)
+            print(f"Converted {len(csv_files)} files of changed folders and removed {removed_files} output files "
+                  f"in {time.perf_counter() - start_time:.3f} seconds")
+            changes = set()
+            last_change_time = None
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    finally:
+        if watcher is not None:
+            os.close(watcher['fd'])
+
+def process_archive(input_archive, output_folder, output_suffix="", recursive=True, sample_rows=FORMAT_SAMPLE_ROWS,
+                    normalize=None, keep_translations=False):
+    """
+    Batch process all CSV files in a zip or tar archive without extracting it to disk
+
+    Members are converted while the archive is read, output files keep the folder structure
+    of the archive like process_folder does for a folder.
+
+    Args:
+        input_archive (str): Input archive path (.zip, .tar, .tar.gz, .tgz, .tar.bz2, .tar.xz)
+        output_folder (str): Output folder path
+        output_suffix (str): Output filename suffix (defaults to empty)
+        recursive (bool): Whether to process members in subfolders (defaults to True)
+        sample_rows (int): Number of rows used for format detection
+        normalize (str): Timeline normalization, "report", "fix" or None (defaults to None)
+        keep_translations (bool): Keep the TranslatedLyric values of the existing output file (defaults to False)
+    """
+
+    input_path = Path(input_archive)
+
+    if output_folder is None:
+        print("Error: An output folder is required when converting an archive")
+        return
+
+    output_path = Path(output_folder)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    if recursive:
+        print(f"Recursively reading archive {input_archive} and its subfolders...")
+    else:
+        print(f"Reading archive {input_archive}...")
+    print("-" * 50)
+
+    total_files = 0
+    total_processed = 0
+    successful_files = 0
+    timeline_total = {}
+    translations_total = {}
+    existing_lines = {}
+
+    try:
+        for relative_path, member_file in iter_archive_csv_files(input_path, recursive):
+            total_files += 1
+
+            # Generate output file path, maintaining the folder structure of the archive
+            output_filename = "lyric" + output_suffix + ".csv"
+            output_file = output_path / relative_path.parent / output_filename
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # The existing output file is read once, before the first of the files sharing it replaces it
+            if keep_translations and output_file not in existing_lines:
+                with profile_stage('merge'):
+                    existing_lines[output_file] = load_lyric_translations(output_file)
+
+            if PROGRESS is None:
+                print(f"Processing file: {relative_path}")
+            file_info = {}
+            record_count, console_output, duration = run_file(relative_path, lambda: convert_lyric_csv(
+                input_path / relative_path, output_file, file_info, sample_rows, input_stream=member_file,
+                normalize=normalize, existing_lines=existing_lines.get(output_file)))
+
+            if record_count > 0:
+                total_processed += record_count
+                successful_files += 1
+            add_report(timeline_total, file_info.get('timeline'))
+            add_report(translations_total, file_info.get('translations'))
+
+            if PROGRESS is not None:
+                report_file(relative_path, record_count, console_output, duration=duration, **file_info)
+                continue
+            if record_count > 0:
+                print(f"  ✓ Successfully converted {record_count} records")
+                print(f"  ✓ Output file: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
+            elif record_count == 0:
+                print(f"  ⚠ No valid data in file")
+            else:
+                print(f"  ✗ Processing failed")
+
+            print()
+    except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+        print(f"Error reading archive {input_archive}: {e}")
+        return
+
+    if total_files == 0:
+        search_type = "and its subfolders" if recursive else ""
+        print(f"No CSV files found in archive {input_archive} {search_type}")
+        return
 
     print("-" * 50)
-    print(f"Batch processing completed!")
-    print(f"Successfully processed files: {successful_files}/{len(csv_files)}")
-    print(f"Total converted records: {total_processed}")
+    print_summary(successful_files, total_files, total_processed)
+    if normalize is not None and PROGRESS is None:
+        print(describe_timeline(timeline_total, normalize == 'fix'))
+    if translations_total and PROGRESS is None:
+        print(describe_translations(translations_total))
 
-def convert_single_file(input_file, output_file=None):
+def convert_single_file(input_file, output_file=None, sample_rows=FORMAT_SAMPLE_ROWS, normalize=None,
+                        keep_translations=False):
     """
     Convert a single file
 
     Args:
         input_file (str): Input file path
         output_file (str): Output file path (optional)
+        sample_rows (int): Number of rows used for format detection
+        normalize (str): Timeline normalization, "report", "fix" or None (defaults to None)
+        keep_translations (bool): Keep the TranslatedLyric values of the existing output file (defaults to False)
     """
 
     input_path = Path(input_file)
@@ -283,15 +2000,116 @@ def convert_single_file(input_file, output_file=None):
     print(f"Output file: {output_file}")
 
     # Convert file
-    record_count = convert_lyric_csv(input_file, output_file)
+    input_bytes = input_path.stat().st_size
+    existing_lines = None
+    if keep_translations:
+        with profile_stage('merge'):
+            existing_lines = load_lyric_translations(output_file)
+    file_info = {}
+    record_count, console_output, duration = run_file(input_file, lambda: convert_lyric_csv(
+        input_file, output_file, file_info, sample_rows, normalize=normalize, existing_lines=existing_lines))
 
-    if record_count > 0:
+    if PROGRESS is not None:
+        report_file(input_path.name, record_count, console_output, bytes=input_bytes, duration=duration, **file_info)
+        print_summary(1 if record_count > 0 else 0, 1, max(record_count, 0))
+    elif record_count > 0:
         print(f"✓ Successfully converted {record_count} records")
     elif record_count == 0:
         print(f"⚠ No valid data in file")
     else:
         print(f"✗ Processing failed")
 
+def pop_option(args, name, default=None):
+    """
+    Remove an option with a value from the argument list
+
+    Supports both "--name value" and "--name=value"
+
+    Args:
+        args (list): Argument list, modified in place
+        name (str): Option name
+        default (str): Value returned when the option is not present
+
+    Returns:
+        str: Option value, None if the option has no value
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """Print command line usage"""
+
+    print("Lyric CSV Format Converter Tool")
+    print("Convert lyric timeline CSV format to format with translation fields")
+    print()
+    print("Supported input formats:")
+    print("  Format1: start_time(seconds),end_time(seconds),lyric")
+    print("  Format2: ID,開始時間,終了時間,ローカライズ用キー名")
+    print()
+    print("Usage:")
+    print("  Convert single file:")
+    print("    python script.py <input_file> [output_file] [--sample-rows N] [--normalize] [--fix-timeline] [--keep-translations] [--force-encoding NAME] [--profile] [--quiet] [--progress MODE]")
+    print("  Batch convert folder or zip/tar archive (archives require output_folder):")
+    print("    python script.py <input_folder> [output_folder] [output_suffix] [--no-recursive] [--jobs N] [--incremental] [--watch] [--sample-rows N] [--normalize] [--fix-timeline] [--keep-translations] [--force-encoding NAME] [--profile] [--quiet] [--progress MODE]")
+    print()
+    print("Examples:")
+    print("  python script.py song.csv")
+    print("  python script.py song.csv converted_song.csv")
+    print("  python script.py ./lyrics_folder")
+    print("  python script.py ./lyrics_folder ./output_folder")
+    print("  python script.py ./lyrics_folder ./output_folder _new")
+    print("  python script.py ./lyrics.tar.gz ./output_folder")
+    print("  python script.py ./lyrics_folder --no-recursive")
+    print("  python script.py ./lyrics_folder ./output_folder --jobs 8")
+    print("  python script.py ./lyrics_folder ./output_folder --watch")
+    print("  python script.py ./lyrics_folder ./output_folder --incremental")
+    print("  python script.py ./lyrics_folder --sample-rows 50")
+    print("  python script.py ./lyrics_folder ./output_folder --normalize")
+    print("  python script.py song.csv --fix-timeline")
+    print("  python script.py ./lyrics_folder --keep-translations")
+    print("  python script.py ./lyrics_folder ./output_folder --profile --profile-output profile.json")
+    print("  python script.py ./lyrics_folder ./output_folder --progress=jsonl > progress.jsonl")
+    print()
+    print("Parameter description:")
+    print("  input_file/folder: CSV file, or folder or .zip/.tar(.gz/.bz2/.xz) archive containing CSV files to convert")
+    print("  output_folder: Output folder path (optional, defaults to input folder)")
+    print("  output_suffix: Output filename suffix (optional, defaults to empty)")
+    print("  --no-recursive: (optional flag) If used, will not recursively process subfolders")
+    print("  --jobs N: (optional) Convert files in N worker processes, 0 uses all CPU cores (defaults to 1)")
+    print("  --incremental: (optional flag) If used, will skip files unchanged since the last run, tracked in .convert_manifest.jsonl in the output folder")
+    print("  --watch: (optional flag) If used, will keep converting added, changed and removed CSV files after the first run")
+    print("           until Ctrl+C, requires an output folder outside the input folder")
+    print("  --sample-rows N: (optional) Number of rows from the start of each file used for format detection (defaults to 20)")
+    print("  --normalize: (optional flag) If used, will sort lines by start time as the plugin does and report out of order,")
+    print("               negative, zero-length, duplicate and overlapping lines")
+    print("  --fix-timeline: (optional flag) Implies --normalize, also swap negative spans, drop zero-length and duplicate")
+    print("                  lines, clip overlapping lines and join lines with the same start time")
+    print("  --keep-translations: (optional flag) If used, will keep the TranslatedLyric values of existing output files,")
+    print("                       matching lines by start time, end time and original text, then by original text only,")
+    print("                       and report lines with changed timing, new lines and orphaned translated lines")
+    print("  --force-encoding NAME: (optional) Decode every input file with this encoding, such as cp932 or utf-16,")
+    print("                         instead of detecting it per file from the byte order mark and the first 256 KiB")
+    print("  --profile: (optional flag) If used, will print time per stage (discover, decode, parse, detect, transform,")
+    print("             write...), peak traced memory and the slowest files, converting in a single process")
+    print("  --profile-top N: (optional) Number of slowest files listed by --profile (defaults to 10)")
+    print("  --profile-output FILE: (optional) Implies --profile, also write the summary to FILE.json, or a cProfile")
+    print("                         dump readable by pstats/snakeviz for any other extension such as FILE.prof")
+    print("  --quiet: (optional flag) If used, will print only the final summary, errors of failed files go to stderr")
+    print("  --progress MODE: (optional) \"text\" prints the usual console text, \"jsonl\" prints one JSON event per file")
+    print("                   (path, format, rows, bytes, duration, status), throughput/ETA events and a summary event")
+    print("                   (defaults to text)")
+    print()
+    print("Output format: StartTime,EndTime,OriginalLyric,TranslatedLyric")
+    print()
+
 def main():
     """Main function to handle command line arguments"""
 
@@ -302,45 +2120,119 @@ def main():
         recursive = False
         args.remove("--no-recursive")
 
+    incremental = False
+    if "--incremental" in args:
+        incremental = True
+        args.remove("--incremental")
+
+    jobs = pop_option(args, "--jobs", "1")
+    if jobs is None or not jobs.isdigit():
+        print("Error: --jobs requires a non-negative integer")
+        return
+
+    force_encoding = pop_option(args, "--force-encoding", "")
+    if force_encoding is None:
+        print("Error: --force-encoding requires an encoding name")
+        return
+    if force_encoding:
+        try:
+            set_force_encoding(codecs.lookup(force_encoding).name)
+        except LookupError:
+            print(f"Error: Unknown encoding: {force_encoding}")
+            return
+
+    sample_rows = pop_option(args, "--sample-rows", str(FORMAT_SAMPLE_ROWS))
+    if sample_rows is None or not sample_rows.isdigit() or int(sample_rows) < 1:
+        print("Error: --sample-rows requires a positive integer")
+        return
+
+    profile = False
+    if "--profile" in args:
+        profile = True
+        args.remove("--profile")
+
+    profile_output = pop_option(args, "--profile-output", "")
+    if profile_output is None:
+        print("Error: --profile-output requires a file path")
+        return
+    profile_output = profile_output or None
+    if profile_output is not None:
+        profile = True
+
+    profile_top = pop_option(args, "--profile-top", str(PROFILE_TOP_FILES))
+    if profile_top is None or not profile_top.isdigit():
+        print("Error: --profile-top requires a non-negative integer")
+        return
+
+    quiet = False
+    if "--quiet" in args:
+        quiet = True
+        args.remove("--quiet")
+
+    progress = pop_option(args, "--progress", "text")
+    if progress not in PROGRESS_MODES:
+        print("Error: --progress requires \"text\" or \"jsonl\"")
+        return
+    if quiet and progress != "text":
+        print("Error: --quiet and --progress=jsonl cannot be used together")
+        return
+    progress_mode = "quiet" if quiet else None if progress == "text" else progress
+
+    normalize = None
+    if "--normalize" in args:
+        normalize = "report"
+        args.remove("--normalize")
+    if "--fix-timeline" in args:
+        normalize = "fix"
+        args.remove("--fix-timeline")
+
+    keep_translations = False
+    if "--keep-translations" in args:
+        keep_translations = True
+        args.remove("--keep-translations")
+
+    watch = False
+    if "--watch" in args:
+        watch = True
+        args.remove("--watch")
+    if watch and (profile or progress == "jsonl"):
+        print("Error: --watch cannot be combined with --profile or --progress=jsonl")
+        return
+
     if len(args) < 2:
-        print("Lyric CSV Format Converter Tool")
-        print("Convert lyric timeline CSV format to format with translation fields")
-        print()
-        print("Supported input formats:")
-        print("  Format1: start_time(seconds),end_time(seconds),lyric")
-        print("  Format2: ID,開始時間,終了時間,ローカライズ用キー名")
-        print()
-        print("Usage:")
-        print("  Convert single file:")
-        print("    python script.py <input_file> [output_file]")
-        print("  Batch convert folder:")
-        print("    python script.py <input_folder> [output_folder] [output_suffix] [--no-recursive]")
-        print()
-        print("Examples:")
-        print("  python script.py song.csv")
-        print("  python script.py song.csv converted_song.csv")
-        print("  python script.py ./lyrics_folder")
-        print("  python script.py ./lyrics_folder ./output_folder")
-        print("  python script.py ./lyrics_folder ./output_folder _new")
-        print("  python script.py ./lyrics_folder --no-recursive")
-        print()
-        print("Parameter description:")
-        print("  input_file/folder: CSV file or folder containing CSV files to convert")
-        print("  output_folder: Output folder path (optional, defaults to input folder)")
-        print("  output_suffix: Output filename suffix (optional, defaults to empty)")
-        print("  --no-recursive: (optional flag) If used, will not recursively process subfolders")
-        print()
-        print("Output format: StartTime,EndTime,OriginalLyric,TranslatedLyric")
-        print()
+        print_usage()
         return
     
+    if profile:
+        # Stage timing is only collected in this process
+        if jobs != "1":
+            print("Note: --profile converts in a single process, --jobs is ignored.")
+            jobs = "1"
+        start_profile(use_cprofile=profile_output is not None and not profile_output.lower().endswith('.json'))
+
     input_path = Path(args[1])
     
-    # Determine if it's a file or folder
-    if input_path.is_file():
+    # Determine if it's an archive, a file or a folder
+    if input_path.is_file() and is_archive(input_path):
+        # Archive batch processing
+        if incremental or watch or jobs != "1":
+            print("Error: --incremental, --watch and --jobs are not supported when converting an archive")
+            return
+        output_folder = args[2] if len(args) > 2 else None
+        output_suffix = args[3] if len(args) > 3 else ""
+
+        with progress_output(progress_mode):
+            process_archive(args[1], output_folder, output_suffix, recursive, sample_rows=int(sample_rows),
+                            normalize=normalize, keep_translations=keep_translations)
+    elif input_path.is_file():
         # Single file processing
         output_file = args[2] if len(args) > 2 else None
-        convert_single_file(args[1], output_file)
+        if watch:
+            print("Error: --watch is only supported when converting a folder")
+            return
+        with progress_output(progress_mode):
+            convert_single_file(args[1], output_file, sample_rows=int(sample_rows), normalize=normalize,
+                                keep_translations=keep_translations)
     elif input_path.is_dir():
         # Folder batch processing
         output_folder = args[2] if len(args) > 2 else None
@@ -349,41 +2241,24 @@ def main():
         if not recursive:
             print("Note: Set to not recursively process subfolders.")
         
-        process_folder(args[1], output_folder, output_suffix, recursive)
+        if watch:
+            watch_folder(args[1], output_folder, output_suffix, recursive, jobs=int(jobs), incremental=incremental,
+                         sample_rows=int(sample_rows), normalize=normalize, keep_translations=keep_translations,
+                         progress_mode=progress_mode)
+        else:
+            with progress_output(progress_mode):
+                process_folder(args[1], output_folder, output_suffix, recursive, jobs=int(jobs),
+                               incremental=incremental, sample_rows=int(sample_rows), normalize=normalize,
+                               keep_translations=keep_translations)
     else:
         print(f"Error: Path {args[1]} does not exist")
 
+    if profile:
+        finish_profile(int(profile_top), profile_output)
+
 if __name__ == "__main__":
     # Use command line arguments
     if len(sys.argv) > 1:
         main()
     else:
-        print("Lyric CSV Format Converter Tool")
-        print("Convert lyric timeline CSV format to format with translation fields")
-        print()
-        print("Usage:")
-        print("  Convert single file:")
-        print("    python script.py <input_file> [output_file]")
-        print("  Batch convert folder:")
-        print("    python script.py <input_folder> [output_folder] [output_suffix] [--no-recursive]")
-        print()
-        print("Examples:")
-        print("  python script.py song.csv")
-        print("  python script.py song.csv converted_song.csv")
-        print("  python script.py ./lyrics_folder")
-        print("  python script.py ./lyrics_folder ./output_folder")
-        print("  python script.py ./lyrics_folder ./output_folder _new")
-        print("  python script.py ./lyrics_folder --no-recursive")
-        print()
-        print("Parameter description:")
-        print("  input_file/folder: CSV file or folder containing CSV files to convert")
-        print("  output_folder: Output folder path (optional, defaults to input folder)")
-        print("  output_suffix: Output filename suffix (optional, defaults to empty)")
-        print("  --no-recursive: (optional flag) If used, will not recursively process subfolders")
-        print()
-        print("Supported input formats:")
-        print("  Format1: start_time(seconds),end_time(seconds),lyric")
-        print("  Format2: ID,開始時間,終了時間,ローカライズ用キー名")
-        print()
-        print("Output format: StartTime,EndTime,OriginalLyric,TranslatedLyric")
-        print()
\ No newline at end of file
+        print_usage()
@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: 并行无损压缩纹理替换文件夹中的 PNG 文件
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# 每个 PNG 文件都以这 8 个字节开头
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# 数据块长度和类型，后跟数据以及类型和数据的 CRC-32
+CHUNK_HEADER = struct.Struct('>I4s')
+CHUNK_CRC = struct.Struct('>I')
+
+# 宽度、高度、位深度、颜色类型、压缩方法、过滤方法和隔行扫描方法
+IHDR = struct.Struct('>IIBBBBB')
+
+# 默认保留的辅助数据块，tRNS 保存调色板和灰度/RGB 图像的透明度。
+# 关键数据块（首字母大写）总是保留。
+KEEP_ANCILLARY = ('tRNS',)
+
+# 动画 PNG 的数据块，这类文件保持不变
+ANIMATION_CHUNKS = (b'acTL', b'fcTL', b'fdAT')
+
+# 每种颜色类型每像素的采样数
+COLOR_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+# Adam7 各遍的 (起始列, 起始行, 列步长, 行步长)
+ADAM7_PASSES = ((0, 0, 8, 8), (4, 0, 8, 8), (0, 4, 4, 8), (2, 0, 4, 4), (0, 2, 2, 4), (1, 0, 2, 2), (0, 1, 1, 2))
+
+# 对图像数据尝试的 zlib 策略，保留最小的结果
+DEFLATE_STRATEGIES = (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED, zlib.Z_RLE)
+
+# 图像数据写入不超过此字节数的 IDAT 数据块
+IDAT_CHUNK_SIZE = 1 << 20
+
+# 上次运行写入的文件的哈希值，保存在纹理文件夹中
+CACHE_NAME = '.png_optimize_cache.json'
+
+# 优化方式的版本，保存在缓存中，新版本会重新检查所有文件
+OPTIMIZER_VERSION = 1
+
+# 每个文件的结果及其报告名称
+PNG_RESULTS = {
+    'optimized': "已优化",
+    'kept': "已足够小，保持不变",
+    'unchanged': "自上次运行以来未改变",
+    'animated': "动画 PNG，已跳过",
+    'error': "无效的 PNG，已跳过"
+}
+
+def read_chunks(data):
+    """
+    将 PNG 文件拆分为数据块并检查其 CRC
+
+    Args:
+        data (bytes): PNG 文件
+
+    Returns:
+        list: (数据块类型, 数据块数据) 元组，IHDR 在最前，IEND 在最后
+
+    Raises:
+        ValueError: 文件不是有效的 PNG
+    """
+
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("没有 PNG 签名")
+    chunks = []
+    offset = len(PNG_SIGNATURE)
+    while offset < len(data):
+        if offset + CHUNK_HEADER.size + CHUNK_CRC.size > len(data):
+            raise ValueError(f"第 {offset} 字节处的数据块不完整")
+        length, chunk_type = CHUNK_HEADER.unpack_from(data, offset)
+        start = offset + CHUNK_HEADER.size
+        end = start + length
+        if end + CHUNK_CRC.size > len(data):
+            raise ValueError(f"第 {offset} 字节处的 {chunk_type.decode('latin-1')} 数据块不完整")
+        (crc,) = CHUNK_CRC.unpack_from(data, end)
+        if zlib.crc32(data[offset + 4:end]) != crc:
+            raise ValueError(f"第 {offset} 字节处的 {chunk_type.decode('latin-1')} 数据块 CRC 不匹配")
+        chunks.append((chunk_type, data[start:end]))
+        offset = end + CHUNK_CRC.size
+        if chunk_type == b'IEND':
+            break
+    if not chunks or chunks[0][0] != b'IHDR' or chunks[-1][0] != b'IEND':
+        raise ValueError("缺少 IHDR 或 IEND 数据块")
+    return chunks
+
+def image_data_size(header):
+    """
+    根据 IHDR 数据块计算解压后图像数据的大小
+
+    Args:
+        header (bytes): IHDR 数据块数据
+
+    Returns:
+        int: 过滤后扫描行的字节数，包括过滤类型字节
+
+    Raises:
+        ValueError: 不支持或无效的文件头
+    """
+
+    if len(header) != IHDR.size:
+        raise ValueError("无效的 IHDR 数据块")
+    width, height, bit_depth, color_type, compression, filter_method, interlace = IHDR.unpack(header)
+    if color_type not in COLOR_CHANNELS or bit_depth not in (1, 2, 4, 8, 16) or not width or not height:
+        raise ValueError(f"无效的图像格式 {width}x{height}，位深度 {bit_depth}，颜色类型 {color_type}")
+    if compression or filter_method or interlace not in (0, 1):
+        raise ValueError("未知的压缩、过滤或隔行扫描方法")
+    bits_per_pixel = COLOR_CHANNELS[color_type] * bit_depth
+    passes = ADAM7_PASSES if interlace else ((0, 0, 1, 1),)
+    size = 0
+    for first_column, first_row, column_step, row_step in passes:
+        columns = (width - first_column + column_step - 1) // column_step
+        rows = (height - first_row + row_step - 1) // row_step
+        if columns and rows:
+            size += rows * (1 + (columns * bits_per_pixel + 7) // 8)
+    return size
+
+def inflate(stream):
+    """
+    解压拼接后的 IDAT 数据
+
+    Args:
+        stream (bytes): zlib 数据流
+
+    Returns:
+        bytes: 过滤后的扫描行
+
+    Raises:
+        ValueError: 数据流损坏、不完整或后面有多余数据
+    """
+
+    decompressor = zlib.decompressobj()
+    try:
+        data = decompressor.decompress(stream) + decompressor.flush()
+    except zlib.error as e:
+        raise ValueError(f"图像数据损坏：{e}") from None
+    if not decompressor.eof:
+        raise ValueError("图像数据不完整")
+    if decompressor.unused_data:
+        raise ValueError("图像数据后有多余字节")
+    return data
+
+def deflate(data):
+    """
+    用 DEFLATE_STRATEGIES 的每种策略压缩图像数据，保留最小的结果
+
+    Args:
+        data (bytes): 过滤后的扫描行
+
+    Returns:
+        bytes: zlib 数据流
+    """
+
+    best = None
+    for strategy in DEFLATE_STRATEGIES:
+        compressor = zlib.compressobj(9, zlib.DEFLATED, zlib.MAX_WBITS, 9, strategy)
+        stream = compressor.compress(data) + compressor.flush()
+        if best is None or len(stream) < len(best):
+            best = stream
+    return best
+
+def write_chunk(parts, chunk_type, chunk_data):
+    """
+    追加一个带长度和 CRC 的数据块
+
+    Args:
+        parts (list): 文件的字节串，原地追加
+        chunk_type (bytes): 数据块类型
+        chunk_data (bytes): 数据块数据
+    """
+
+    parts.append(CHUNK_HEADER.pack(len(chunk_data), chunk_type))
+    parts.append(chunk_data)
+    parts.append(CHUNK_CRC.pack(zlib.crc32(chunk_type + chunk_data)))
+
+def decode_image(data):
+    """
+    将 PNG 文件解码到过滤后的扫描行
+
+    扫描行不做反过滤：优化时保留过滤字节，因此在相同的 IHDR、PLTE 和 tRNS 数据块下，
+    扫描行相同即像素相同。
+
+    Args:
+        data (bytes): PNG 文件
+
+    Returns:
+        tuple: (IDAT 以外数据块的 (类型, 数据) 元组列表, 过滤后的扫描行)
+
+    Raises:
+        ValueError: 文件不是有效的 PNG
+    """
+
+    chunks = read_chunks(data)
+    scanlines = inflate(b''.join(chunk_data for chunk_type, chunk_data in chunks if chunk_type == b'IDAT'))
+    if len(scanlines) != image_data_size(chunks[0][1]):
+        raise ValueError(f"图像数据有 {len(scanlines):,} 字节，IHDR 需要 {image_data_size(chunks[0][1]):,} 字节")
+    return [chunk for chunk in chunks if chunk[0] != b'IDAT'], scanlines
+
+def optimize_png(data, keep=KEEP_ANCILLARY):
+    """
+    删除 PNG 文件的辅助数据块并重新压缩图像数据
+
+    过滤后的扫描行按原样重新压缩，因此像素不会改变。返回前会解码结果并进行比较。
+
+    Args:
+        data (bytes): PNG 文件
+        keep (tuple): 要保留的辅助数据块类型
+
+    Returns:
+        bytes: 优化后的 PNG 文件，动画 PNG 为 None
+
+    Raises:
+        ValueError: 文件不是有效的 PNG，或结果解码后不是相同的图像
+    """
+
+    chunks = read_chunks(data)
+    if any(chunk_type in ANIMATION_CHUNKS for chunk_type, _ in chunks):
+        return None
+    keep = {chunk_type.encode('latin-1') for chunk_type in keep}
+
+    _, scanlines = decode_image(data)
+    stream = deflate(scanlines)
+    parts = [PNG_SIGNATURE]
+    kept = []
+    for chunk_type, chunk_data in chunks:
+        if chunk_type == b'IDAT':
+            if stream is not None:
+                for offset in range(0, len(stream), IDAT_CHUNK_SIZE):
+                    write_chunk(parts, b'IDAT', stream[offset:offset + IDAT_CHUNK_SIZE])
+                stream = None
+        elif chunk_type[0:1].isupper() or chunk_type in keep:
+            write_chunk(parts, chunk_type, chunk_data)
+            kept.append((chunk_type, chunk_data))
+    result = b''.join(parts)
+
+    if decode_image(result) != (kept, scanlines):
+        raise ValueError("优化后的文件解码后不是相同的图像")
+    return result
+
+def write_atomic(file_path, data):
+    """
+    通过同一文件夹中的临时文件替换文件，因此文件不会处于写了一半的状态
+
+    Args:
+        file_path (Path): 要写入的文件
+        data (bytes): 新内容
+    """
+
+    handle, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as outfile:
+            outfile.write(data)
+            outfile.flush()
+            os.fsync(outfile.fileno())
+        # mkstemp 创建的文件只有所有者可读
+        if file_path.exists():
+            mode = file_path.stat().st_mode & 0o7777
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+def optimize_task(file_path, cached_hash, keep, dry_run):
+    """
+    原地优化一个文件
+
+    Args:
+        file_path (Path): PNG 文件
+        cached_hash (str): 上次运行后文件的 SHA-256，未知则为 None
+        keep (tuple): 要保留的辅助数据块类型
+        dry_run (bool): 不写入文件
+
+    Returns:
+        dict: 'status'（PNG_RESULTS 的键）、'before' 和 'after' 大小、文件最终状态的 'hash'
+            （出错时为 None）和 'error'
+    """
+
+    data = file_path.read_bytes()
+    result = {'status': 'kept', 'before': len(data), 'after': len(data), 'hash': None, 'error': None}
+    file_hash = hashlib.sha256(data).hexdigest()
+    if file_hash == cached_hash:
+        result.update(status='unchanged', hash=file_hash)
+        return result
+
+    try:
+        optimized = optimize_png(data, keep)
+    except ValueError as e:
+        result.update(status='error', error=str(e))
+        return result
+    if optimized is None:
+        result.update(status='animated', hash=file_hash)
+    elif len(optimized) < len(data):
+        if not dry_run:
+            write_atomic(file_path, optimized)
+        result.update(status='optimized', after=len(optimized), hash=hashlib.sha256(optimized).hexdigest())
+    else:
+        result['hash'] = file_hash
+    return result
+
+def optimize_files_serial(tasks, keep, dry_run):
+    """
+    逐个优化文件
+
+    Args:
+        tasks (list): (file_path, cached_hash) 元组
+        keep (tuple): 要保留的辅助数据块类型
+        dry_run (bool): 不写入文件
+
+    Yields:
+        dict: optimize_task 的结果，或读写文件时引发的异常，顺序与 tasks 相同
+    """
+
+    for file_path, cached_hash in tasks:
+        try:
+            yield optimize_task(file_path, cached_hash, keep, dry_run)
+        except OSError as e:
+            yield e
+
+def optimize_files_parallel(tasks, jobs, keep, dry_run):
+    """
+    在进程池中优化文件
+
+    Args:
+        tasks (list): (file_path, cached_hash) 元组
+        jobs (int): 工作进程数
+        keep (tuple): 要保留的辅助数据块类型
+        dry_run (bool): 不写入文件
+
+    Yields:
+        dict: optimize_task 的结果，或读写文件时引发的异常，顺序与 tasks 相同
+    """
+
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        futures = [executor.submit(optimize_task, file_path, cached_hash, keep, dry_run) for file_path, cached_hash in tasks]
+        for future in futures:
+            try:
+                yield future.result()
+            except Exception as e:
+                # 包括工作进程本身的失败
+                yield e
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+def find_png_files(input_path):
+    """
+    与 TextureReplaceManger.ScanReplaceTextures 一样查找文件夹中的 .png 文件
+
+    Args:
+        input_path (Path): 纹理替换文件夹，递归搜索
+
+    Returns:
+        list: 按路径排序的文件路径
+    """
+
+    return [file for file in sorted(input_path.rglob('*'))
+            if file.is_file() and file.suffix.lower() == '.png']
+
+def load_cache(cache_file, settings):
+    """
+    加载上次运行的文件哈希值
+
+    Args:
+        cache_file (Path): 缓存文件
+        settings (dict): 本次运行的设置，忽略以其他设置写入的缓存
+
+    Returns:
+        dict: 相对路径（使用 /）-> SHA-256
+    """
+
+    try:
+        cache = json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('settings') != settings or not isinstance(cache.get('files'), dict):
+        return {}
+    return cache['files']
+
+def pop_option(args, name, default=None):
+    """
+    从参数列表中移除一个带值的选项
+
+    支持 "--name value" 和 "--name=value" 两种形式
+
+    Args:
+        args (list): 参数列表，会被原地修改
+        name (str): 选项名
+        default (str): 选项不存在时返回的值
+
+    Returns:
+        str: 选项值，选项没有值时为 None
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """打印命令行用法"""
+
+    print("PNG 纹理优化工具")
+    print("原地无损压缩纹理替换文件夹中的 PNG 文件")
+    print()
+    print("用法:")
+    print("  python script.py <texture_folder> [--jobs N] [--keep gAMA,sRGB] [--dry-run] [--force]")
+    print()
+    print("示例:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/Texture")
+    print("  python script.py ./Texture --jobs 4 --dry-run")
+    print()
+    print("参数:")
+    print("  texture_folder: 与插件一样递归搜索 .png 文件的文件夹")
+    print("  --jobs N: （可选）使用 N 个工作进程优化，0 表示使用所有 CPU 核心（默认为 0）")
+    print("  --keep: （可选）除 tRNS 外要保留的辅助数据块类型，以逗号分隔")
+    print("  --dry-run: （可选）只报告节省的空间，不写入任何文件")
+    print("  --force: （可选）重新检查自上次运行以来未改变的文件")
+    print()
+    print("注意:")
+    print("  - 删除文本、时间、颜色配置文件等辅助数据块，图像数据以相同的过滤方式重新压缩，")
+    print("    因此像素不会改变")
+    print("  - 每个结果在替换文件前都会解码并比较，文件通过临时文件替换，")
+    print("    动画 PNG 文件保持不变")
+    print(f"  - 写入文件的哈希值保存在纹理文件夹的 {CACHE_NAME} 中")
+    print()
+    print("退出码：成功为 0，有文件无法优化为 1，用法错误为 2")
+    print()
+
+def main():
+    """处理命令行参数的主函数"""
+
+    args = sys.argv.copy()
+    if len(args) < 2 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    jobs = pop_option(args, "--jobs", "0")
+    if jobs is None or not jobs.isdigit():
+        print("错误：--jobs 需要一个非负整数")
+        return 2
+
+    keep = pop_option(args, "--keep", "")
+    if keep is None:
+        print("错误：--keep 需要数据块类型")
+        return 2
+    keep = tuple(sorted(set(KEEP_ANCILLARY) | {chunk_type.strip() for chunk_type in keep.split(",") if chunk_type.strip()}))
+    for chunk_type in keep:
+        if len(chunk_type) != 4 or not chunk_type.isascii() or not chunk_type.isalpha():
+            print(f"错误：无效的数据块类型 {chunk_type}")
+            return 2
+
+    dry_run = "--dry-run" in args
+    force = "--force" in args
+    args = [arg for arg in args if arg not in ("--dry-run", "--force")]
+
+    input_path = Path(args[1])
+    if not input_path.is_dir():
+        print(f"错误：文件夹 {args[1]} 不存在")
+        return 2
+
+    start_time = time.perf_counter()
+    files = find_png_files(input_path)
+    if not files:
+        print(f"在 {args[1]} 中未找到 .png 文件")
+        return 0
+
+    cache_file = input_path / CACHE_NAME
+    settings = {'version': OPTIMIZER_VERSION, 'keep': list(keep)}
+    cache = {} if force else load_cache(cache_file, settings)
+    names = [file_path.relative_to(input_path).as_posix() for file_path in files]
+    tasks = [(file_path, cache.get(name)) for file_path, name in zip(files, names)]
+
+    jobs = int(jobs) or os.cpu_count() or 1
+    jobs = min(jobs, len(tasks))
+    print(f"正在优化 {len(files)} 个 PNG 文件" + (f"，使用 {jobs} 个工作进程" if jobs > 1 else "")
+          + ("，试运行……" if dry_run else "……"))
+    print("-" * 50)
+
+    if jobs > 1:
+        results = optimize_files_parallel(tasks, jobs, keep, dry_run)
+    else:
+        results = optimize_files_serial(tasks, keep, dry_run)
+
+    status_counts = dict.fromkeys(PNG_RESULTS, 0)
+    total_before = 0
+    total_after = 0
+    hashes = {}
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            print(f"{name}: ✗ 错误：{result}")
+            status_counts['error'] += 1
+            continue
+        status_counts[result['status']] += 1
+        total_before += result['before']
+        total_after += result['after']
+        if result['hash'] is not None:
+            hashes[name] = result['hash']
+        if result['status'] == 'optimized':
+            saved = result['before'] - result['after']
+            print(f"{name}: {result['before']:,} -> {result['after']:,} 字节（-{saved / result['before']:.1%}）")
+        elif result['status'] == 'error':
+            print(f"{name}: ✗ {result['error']}")
+
+    if not dry_run:
+        try:
+            write_atomic(cache_file, json.dumps({'settings': settings, 'files': hashes}, indent=0).encode('utf-8'))
+        except OSError as e:
+            print(f"⚠ 无法写入 {cache_file}：{e}")
+
+    elapsed = time.perf_counter() - start_time
+    saved = total_before - total_after
+    print("-" * 50)
+    for status, count in status_counts.items():
+        if count:
+            print(f"{PNG_RESULTS[status]}：{count}")
+    print(f"总计：{total_before:,} -> {total_after:,} 字节，节省 {saved:,} 字节"
+          + (f"（{saved / total_before:.1%}）" if total_before else "") + f"，耗时 {elapsed:.2f} 秒")
+    if status_counts['error']:
+        print(f"✗ 无法优化的文件：{status_counts['error']}")
+        return 1
+    print("✓ 完成" + ("，未写入任何文件" if dry_run else ""))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Losslessly shrink the PNG files of the texture replacement folder in parallel
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Every PNG file starts with these 8 bytes
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Chunk length and type, followed by the data and a CRC-32 of type and data
+CHUNK_HEADER = struct.Struct('>I4s')
+CHUNK_CRC = struct.Struct('>I')
+
+# Width, height, bit depth, color type, compression, filter and interlace method
+IHDR = struct.Struct('>IIBBBBB')
+
+# Ancillary chunks kept by default, tRNS holds the transparency of palette and gray/RGB images.
+# Critical chunks (uppercase first letter) are always kept.
+KEEP_ANCILLARY = ('tRNS',)
+
+# Chunks of animated PNG, such files are left alone
+ANIMATION_CHUNKS = (b'acTL', b'fcTL', b'fdAT')
+
+# Samples per pixel of each color type
+COLOR_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+# Adam7 passes as (first column, first row, column step, row step)
+ADAM7_PASSES = ((0, 0, 8, 8), (4, 0, 8, 8), (0, 4, 4, 8), (2, 0, 4, 4), (0, 2, 2, 4), (1, 0, 2, 2), (0, 1, 1, 2))
+
+# zlib strategies tried on the image data, the smallest result is kept
+DEFLATE_STRATEGIES = (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED, zlib.Z_RLE)
+
+# Image data is written in IDAT chunks of at most this many bytes
+IDAT_CHUNK_SIZE = 1 << 20
+
+# Hashes of the files written by the previous run, stored in the texture folder
+CACHE_NAME = '.png_optimize_cache.json'
+
+# Version of the optimization, stored in the cache so a new version checks every file again
+OPTIMIZER_VERSION = 1
+
+# Result of each file and its report label
+PNG_RESULTS = {
+    'optimized': "optimized",
+    'kept': "already small, kept",
+    'unchanged': "unchanged since last run",
+    'animated': "animated PNG, skipped",
+    'error': "invalid PNG, skipped"
+}
+
+def read_chunks(data):
+    """
+    Split a PNG file into chunks and check their CRC
+
+    Args:
+        data (bytes): PNG file
+
+    Returns:
+        list: (chunk type, chunk data) tuples, IHDR first and IEND last
+
+    Raises:
+        ValueError: The file is not a valid PNG
+    """
+
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("no PNG signature")
+    chunks = []
+    offset = len(PNG_SIGNATURE)
+    while offset < len(data):
+        if offset + CHUNK_HEADER.size + CHUNK_CRC.size > len(data):
+            raise ValueError(f"truncated chunk at byte {offset}")
+        length, chunk_type = CHUNK_HEADER.unpack_from(data, offset)
+        start = offset + CHUNK_HEADER.size
+        end = start + length
+        if end + CHUNK_CRC.size > len(data):
+            raise ValueError(f"truncated {chunk_type.decode('latin-1')} chunk at byte {offset}")
+        (crc,) = CHUNK_CRC.unpack_from(data, end)
+        if zlib.crc32(data[offset + 4:end]) != crc:
+            raise ValueError(f"CRC mismatch in {chunk_type.decode('latin-1')} chunk at byte {offset}")
+        chunks.append((chunk_type, data[start:end]))
+        offset = end + CHUNK_CRC.size
+        if chunk_type == b'IEND':
+            break
+    if not chunks or chunks[0][0] != b'IHDR' or chunks[-1][0] != b'IEND':
+        raise ValueError("IHDR or IEND chunk missing")
+    return chunks
+
+def image_data_size(header):
+    """
+    Compute the size of the decompressed image data from the IHDR chunk
+
+    Args:
+        header (bytes): IHDR chunk data
+
+    Returns:
+        int: Bytes of filtered scanlines, filter type bytes included
+
+    Raises:
+        ValueError: Unsupported or invalid header
+    """
+
+    if len(header) != IHDR.size:
+        raise ValueError("invalid IHDR chunk")
+    width, height, bit_depth, color_type, compression, filter_method, interlace = IHDR.unpack(header)
+    if color_type not in COLOR_CHANNELS or bit_depth not in (1, 2, 4, 8, 16) or not width or not height:
+        raise ValueError(f"invalid image format {width}x{height}, bit depth {bit_depth}, color type {color_type}")
+    if compression or filter_method or interlace not in (0, 1):
+        raise ValueError("unknown compression, filter or interlace method")
+    bits_per_pixel = COLOR_CHANNELS[color_type] * bit_depth
+    passes = ADAM7_PASSES if interlace else ((0, 0, 1, 1),)
+    size = 0
+    for first_column, first_row, column_step, row_step in passes:
+        columns = (width - first_column + column_step - 1) // column_step
+        rows = (height - first_row + row_step - 1) // row_step
+        if columns and rows:
+            size += rows * (1 + (columns * bits_per_pixel + 7) // 8)
+    return size
+
+def inflate(stream):
+    """
+    Decompress the concatenated IDAT data
+
+    Args:
+        stream (bytes): zlib stream
+
+    Returns:
+        bytes: Filtered scanlines
+
+    Raises:
+        ValueError: The stream is corrupt, incomplete or followed by extra data
+    """
+
+    decompressor = zlib.decompressobj()
+    try:
+        data = decompressor.decompress(stream) + decompressor.flush()
+    except zlib.error as e:
+        raise ValueError(f"corrupt image data: {e}") from None
+    if not decompressor.eof:
+        raise ValueError("incomplete image data")
+    if decompressor.unused_data:
+        raise ValueError("extra bytes after image data")
+    return data
+
+def deflate(data):
+    """
+    Compress image data with every strategy of DEFLATE_STRATEGIES and keep the smallest
+
+    Args:
+        data (bytes): Filtered scanlines
+
+    Returns:
+        bytes: zlib stream
+    """
+
+    best = None
+    for strategy in DEFLATE_STRATEGIES:
+        compressor = zlib.compressobj(9, zlib.DEFLATED, zlib.MAX_WBITS, 9, strategy)
+        stream = compressor.compress(data) + compressor.flush()
+        if best is None or len(stream) < len(best):
+            best = stream
+    return best
+
+def write_chunk(parts, chunk_type, chunk_data):
+    """
+    Append a chunk with its length and CRC
+
+    Args:
+        parts (list): Byte strings of the file, appended in place
+        chunk_type (bytes): Chunk type
+        chunk_data (bytes): Chunk data
+    """
+
+    parts.append(CHUNK_HEADER.pack(len(chunk_data), chunk_type))
+    parts.append(chunk_data)
+    parts.append(CHUNK_CRC.pack(zlib.crc32(chunk_type + chunk_data)))
+
+def decode_image(data):
+    """
+    Decode a PNG file down to its filtered scanlines
+
+    Scanlines are not unfiltered: the optimizer keeps the filter bytes, so equal scanlines under
+    equal IHDR, PLTE and tRNS chunks mean equal pixels.
+
+    Args:
+        data (bytes): PNG file
+
+    Returns:
+        tuple: (list of kept chunk (type, data) tuples other than IDAT, filtered scanlines)
+
+    Raises:
+        ValueError: The file is not a valid PNG
+    """
+
+    chunks = read_chunks(data)
+    scanlines = inflate(b''.join(chunk_data for chunk_type, chunk_data in chunks if chunk_type == b'IDAT'))
+    if len(scanlines) != image_data_size(chunks[0][1]):
+        raise ValueError(f"image data has {len(scanlines):,} bytes, IHDR needs {image_data_size(chunks[0][1]):,}")
+    return [chunk for chunk in chunks if chunk[0] != b'IDAT'], scanlines
+
+def optimize_png(data, keep=KEEP_ANCILLARY):
+    """
+    Drop ancillary chunks and recompress the image data of a PNG file
+
+    The filtered scanlines are compressed again as they are, so the pixels cannot change.
+    The result is decoded and compared before it is returned.
+
+    Args:
+        data (bytes): PNG file
+        keep (tuple): Ancillary chunk types to keep
+
+    Returns:
+        bytes: Optimized PNG file, None for animated PNG
+
+    Raises:
+        ValueError: The file is not a valid PNG, or the result does not decode to the same image
+    """
+
+    chunks = read_chunks(data)
+    if any(chunk_type in ANIMATION_CHUNKS for chunk_type, _ in chunks):
+        return None
+    keep = {chunk_type.encode('latin-1') for chunk_type in keep}
+
+    _, scanlines = decode_image(data)
+    stream = deflate(scanlines)
+    parts = [PNG_SIGNATURE]
+    kept = []
+    for chunk_type, chunk_data in chunks:
+        if chunk_type == b'IDAT':
+            if stream is not None:
+                for offset in range(0, len(stream), IDAT_CHUNK_SIZE):
+                    write_chunk(parts, b'IDAT', stream[offset:offset + IDAT_CHUNK_SIZE])
+                stream = None
+        elif chunk_type[0:1].isupper() or chunk_type in keep:
+            write_chunk(parts, chunk_type, chunk_data)
+            kept.append((chunk_type, chunk_data))
+    result = b''.join(parts)
+
+    if decode_image(result) != (kept, scanlines):
+        raise ValueError("optimized file does not decode to the same image")
+    return result
+
+def write_atomic(file_path, data):
+    """
+    Replace a file through a temporary file in the same folder, so it is never left half written
+
+    Args:
+        file_path (Path): File to write
+        data (bytes): New content
+    """
+
+    handle, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as outfile:
+            outfile.write(data)
+            outfile.flush()
+            os.fsync(outfile.fileno())
+        # mkstemp creates the file readable by the owner only
+        if file_path.exists():
+            mode = file_path.stat().st_mode & 0o7777
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+def optimize_task(file_path, cached_hash, keep, dry_run):
+    """
+    Optimize one file in place
+
+    Args:
+        file_path (Path): PNG file
+        cached_hash (str): SHA-256 of the file after the previous run, None if unknown
+        keep (tuple): Ancillary chunk types to keep
+        dry_run (bool): Do not write the file
+
+    Returns:
+        dict: 'status' (key of PNG_RESULTS), 'before' and 'after' sizes, 'hash' of the file as it is
+            left (None on errors) and 'error'
+    """
+
+    data = file_path.read_bytes()
+    result = {'status': 'kept', 'before': len(data), 'after': len(data), 'hash': None, 'error': None}
+    file_hash = hashlib.sha256(data).hexdigest()
+    if file_hash == cached_hash:
+        result.update(status='unchanged', hash=file_hash)
+        return result
+
+    try:
+        optimized = optimize_png(data, keep)
+    except ValueError as e:
+        result.update(status='error', error=str(e))
+        return result
+    if optimized is None:
+        result.update(status='animated', hash=file_hash)
+    elif len(optimized) < len(data):
+        if not dry_run:
+            write_atomic(file_path, optimized)
+        result.update(status='optimized', after=len(optimized), hash=hashlib.sha256(optimized).hexdigest())
+    else:
+        result['hash'] = file_hash
+    return result
+
+def optimize_files_serial(tasks, keep, dry_run):
+    """
+    Optimize files one after another
+
+    Args:
+        tasks (list): (file_path, cached_hash) tuples
+        keep (tuple): Ancillary chunk types to keep
+        dry_run (bool): Do not write the files
+
+    Yields:
+        dict: Result of optimize_task, or the exception raised reading or writing the file, in the same order as tasks
+    """
+
+    for file_path, cached_hash in tasks:
+        try:
+            yield optimize_task(file_path, cached_hash, keep, dry_run)
+        except OSError as e:
+            yield e
+
+def optimize_files_parallel(tasks, jobs, keep, dry_run):
+    """
+    Optimize files in a process pool
+
+    Args:
+        tasks (list): (file_path, cached_hash) tuples
+        jobs (int): Number of worker processes
+        keep (tuple): Ancillary chunk types to keep
+        dry_run (bool): Do not write the files
+
+    Yields:
+        dict: Result of optimize_task, or the exception raised reading or writing the file, in the same order as tasks
+    """
+
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        futures = [executor.submit(optimize_task, file_path, cached_hash, keep, dry_run) for file_path, cached_hash in tasks]
+        for future in futures:
+            try:
+                yield future.result()
+            except Exception as e:
+                # Includes failures of the worker process itself
+                yield e
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+def find_png_files(input_path):
+    """
+    Find the .png files of a folder like TextureReplaceManger.ScanReplaceTextures
+
+    Args:
+        input_path (Path): Texture replacement folder, searched recursively
+
+    Returns:
+        list: File paths sorted by path
+    """
+
+    return [file for file in sorted(input_path.rglob('*'))
+            if file.is_file() and file.suffix.lower() == '.png']
+
+def load_cache(cache_file, settings):
+    """
+    Load the file hashes of the previous run
+
+    Args:
+        cache_file (Path): Cache file
+        settings (dict): Settings of this run, a cache written with other settings is ignored
+
+    Returns:
+        dict: Relative path (with /) -> SHA-256
+    """
+
+    try:
+        cache = json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('settings') != settings or not isinstance(cache.get('files'), dict):
+        return {}
+    return cache['files']
+
+def pop_option(args, name, default=None):
+    """
+    Remove an option with a value from the argument list
+
+    Supports both "--name value" and "--name=value"
+
+    Args:
+        args (list): Argument list, modified in place
+        name (str): Option name
+        default (str): Value returned when the option is not present
+
+    Returns:
+        str: Option value, None if the option has no value
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """Print command line usage"""
+
+    print("PNG Texture Optimizer")
+    print("Losslessly shrink the PNG files of the texture replacement folder in place")
+    print()
+    print("Usage:")
+    print("  python script.py <texture_folder> [--jobs N] [--keep gAMA,sRGB] [--dry-run] [--force]")
+    print()
+    print("Examples:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/Texture")
+    print("  python script.py ./Texture --jobs 4 --dry-run")
+    print()
+    print("Parameters:")
+    print("  texture_folder: Folder searched recursively for .png files, like the plugin does")
+    print("  --jobs N: (optional) Optimize in N worker processes, 0 uses all CPU cores (defaults to 0)")
+    print("  --keep: (optional) Comma separated ancillary chunk types kept besides tRNS")
+    print("  --dry-run: (optional) Report the savings without writing any file")
+    print("  --force: (optional) Check files that have not changed since the last run again")
+    print()
+    print("Notes:")
+    print("  - Text, time, color profile and other ancillary chunks are removed, the image data is")
+    print("    recompressed with the same filters, so the pixels do not change")
+    print("  - Every result is decoded and compared before it replaces the file, files are replaced")
+    print("    through a temporary file, animated PNG files are left alone")
+    print(f"  - Hashes of the written files are kept in {CACHE_NAME} in the texture folder")
+    print()
+    print("Exit code: 0 on success, 1 if some files could not be optimized, 2 on usage errors")
+    print()
+
+def main():
+    """Main function to handle command line arguments"""
+
+    args = sys.argv.copy()
+    if len(args) < 2 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    jobs = pop_option(args, "--jobs", "0")
+    if jobs is None or not jobs.isdigit():
+        print("Error: --jobs requires a non-negative integer")
+        return 2
+
+    keep = pop_option(args, "--keep", "")
+    if keep is None:
+        print("Error: --keep requires chunk types")
+        return 2
+    keep = tuple(sorted(set(KEEP_ANCILLARY) | {chunk_type.strip() for chunk_type in keep.split(",") if chunk_type.strip()}))
+    for chunk_type in keep:
+        if len(chunk_type) != 4 or not chunk_type.isascii() or not chunk_type.isalpha():
+            print(f"Error: Invalid chunk type {chunk_type}")
+            return 2
+
+    dry_run = "--dry-run" in args
+    force = "--force" in args
+    args = [arg for arg in args if arg not in ("--dry-run", "--force")]
+
+    input_path = Path(args[1])
+    if not input_path.is_dir():
+        print(f"Error: Folder {args[1]} does not exist")
+        return 2
+
+    start_time = time.perf_counter()
+    files = find_png_files(input_path)
+    if not files:
+        print(f"No .png files found in {args[1]}")
+        return 0
+
+    cache_file = input_path / CACHE_NAME
+    settings = {'version': OPTIMIZER_VERSION, 'keep': list(keep)}
+    cache = {} if force else load_cache(cache_file, settings)
+    names = [file_path.relative_to(input_path).as_posix() for file_path in files]
+    tasks = [(file_path, cache.get(name)) for file_path, name in zip(files, names)]
+
+    jobs = int(jobs) or os.cpu_count() or 1
+    jobs = min(jobs, len(tasks))
+    print(f"Optimizing {len(files)} PNG files" + (f" in {jobs} worker processes" if jobs > 1 else "")
+          + (", dry run..." if dry_run else "..."))
+    print("-" * 50)
+
+    if jobs > 1:
+        results = optimize_files_parallel(tasks, jobs, keep, dry_run)
+    else:
+        results = optimize_files_serial(tasks, keep, dry_run)
+
+    status_counts = dict.fromkeys(PNG_RESULTS, 0)
+    total_before = 0
+    total_after = 0
+    hashes = {}
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            print(f"{name}: ✗ Error: {result}")
+            status_counts['error'] += 1
+            continue
+        status_counts[result['status']] += 1
+        total_before += result['before']
+        total_after += result['after']
+        if result['hash'] is not None:
+            hashes[name] = result['hash']
+        if result['status'] == 'optimized':
+            saved = result['before'] - result['after']
+            print(f"{name}: {result['before']:,} -> {result['after']:,} bytes (-{saved / result['before']:.1%})")
+        elif result['status'] == 'error':
+            print(f"{name}: ✗ {result['error']}")
+
+    if not dry_run:
+        try:
+            write_atomic(cache_file, json.dumps({'settings': settings, 'files': hashes}, indent=0).encode('utf-8'))
+        except OSError as e:
+            print(f"⚠ Cannot write {cache_file}: {e}")
+
+    elapsed = time.perf_counter() - start_time
+    saved = total_before - total_after
+    print("-" * 50)
+    for status, count in status_counts.items():
+        if count:
+            print(f"{PNG_RESULTS[status]}: {count}")
+    print(f"Total: {total_before:,} -> {total_after:,} bytes, saved {saved:,} bytes"
+          + (f" ({saved / total_before:.1%})" if total_before else "") + f" in {elapsed:.2f} s")
+    if status_counts['error']:
+        print(f"✗ Files that could not be optimized: {status_counts['error']}")
+        return 1
+    print("✓ Done" + (", no file was written" if dry_run else ""))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: 用未翻译文本导出重放 $ 正则翻译，找出缓慢、未使用和被遮蔽的规则
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# 回溯、锚定和合并分析遍历 re 自带解析器的解析树，该解析器没有公开 API：Python 3.11 起为 re._parser，
+# 之前为 sre_parse。两者都无法导入，或缺少分析所用的名称时，规则仍会被重放和计时，但不做该分析。
+try:
+    from re import _parser as regex_parser
+except ImportError:
+    try:
+        import sre_parse as regex_parser
+    except ImportError:
+        regex_parser = None
+
+# 分析所用的 regex_parser 名称
+REGEX_PARSER_NAMES = ('parse', 'MAXREPEAT', 'SUBPATTERN', 'MAX_REPEAT', 'MIN_REPEAT', 'LITERAL', 'NOT_LITERAL', 'ANY',
+                      'IN', 'NEGATE', 'RANGE', 'CATEGORY', 'BRANCH', 'ASSERT', 'ASSERT_NOT', 'GROUPREF_EXISTS', 'AT',
+                      'AT_BEGINNING', 'AT_BEGINNING_STRING', 'CATEGORY_DIGIT', 'CATEGORY_NOT_DIGIT', 'CATEGORY_SPACE',
+                      'CATEGORY_NOT_SPACE', 'CATEGORY_WORD', 'CATEGORY_NOT_WORD')
+if regex_parser is not None and not all(hasattr(regex_parser, name) for name in REGEX_PARSER_NAMES):
+    regex_parser = None
+
+# UTF-8 BOM，只在文件开头被跳过
+BYTE_ORDER_MARK = '\ufeff'
+
+# TxtTranslationFileProcessor 会从译文中移除此字符，见 XUAT RedirectedResourceDetectionStrategy
+MONGOLIAN_VOWEL_SEPARATOR = '\u180e'
+
+# dotnet_regex_to_python 改写的 .NET 正则分组：命名分组、平衡分组和内联选项
+DOTNET_GROUP = re.compile(r"\(\?(?:<(?![=!])([^>]*)>|'([^']*)'|([imnsx-]+)([:)]))")
+
+# 插件文本翻译加载器读取的文件后缀，zip 中只读取 .txt 文件
+TRANSLATION_FILE_SUFFIXES = ('.txt', '.zip')
+
+# StringExtensions.Unescape 支持的转义序列，其他序列保持原样
+ESCAPES = {
+    '0': '\0',
+    'a': '\a',
+    'b': '\b',
+    't': '\t',
+    'n': '\n',
+    'v': '\v',
+    'f': '\f',
+    'r': '\r',
+    "'": "'",
+    '"': '"',
+    '\\': '\\'
+}
+
+# TextTranslateManger 写入的未翻译文本导出文件后缀，不重放 _normalized 导出文件
+DUMP_FILE_SUFFIX = '_untranslate.txt'
+
+# StreamReader.ReadLine 的换行符
+LINE_BREAK = re.compile(r'\r\n|\r|\n')
+
+# StringTool.NormalizeText 修剪的空白字符
+WHITESPACE_CHARS = ('\t\n\v\f\r \u0085\u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008'
+                    '\u2009\u200a\u200b\u2028\u2029\u3000\ufeff')
+
+# GetTranslateText 在尝试正则规则之前返回的原因及其报告名称
+SKIP_REASONS = {
+    'exact': "精确翻译",
+    'bracket': "[...] 文本",
+    'xuat': "XUAT 标记"
+}
+
+# find_backtracking 发现的结构及其报告名称
+BACKTRACKING_RISKS = {
+    'timeout': "重放未能完成，游戏在相同文本上会卡住",
+    'nested': "嵌套重复（指数级）",
+    'alternation': "重复的歧义分支（指数级）",
+    'adjacent': "相邻的重叠重复（多项式级）",
+    'slow': "在重放的文本上很慢"
+}
+
+# 单次匹配慢于此时间时报告为 'slow'
+SLOW_MATCH_SECONDS = 0.001
+
+# 易发生指数级回溯的规则先在单独的进程中重放，超过此秒数后停止进程，
+# 因为 re 内部正在进行的匹配无法被中断
+PROBE_TIMEOUT_SECONDS = 10
+
+# 用于比较两个正则项所匹配字符的字符，另加上模式本身的字符
+PROBE_CHARS = ''.join(chr(code) for code in range(0x20, 0x7f)) + '\t\nあアー亜。、「」…\u3000０'
+
+# 解析后的 Python 正则中 \d、\s 和 \w 类别对应的正则字符类
+CATEGORY_CLASSES = {
+    regex_parser.CATEGORY_DIGIT: '\\d',
+    regex_parser.CATEGORY_NOT_DIGIT: '\\D',
+    regex_parser.CATEGORY_SPACE: '\\s',
+    regex_parser.CATEGORY_NOT_SPACE: '\\S',
+    regex_parser.CATEGORY_WORD: '\\w',
+    regex_parser.CATEGORY_NOT_WORD: '\\W'
+} if regex_parser is not None else {}
+
+# 结束模式字面前缀的字符，见 literal_prefix
+REGEX_METACHARACTERS = '\\^$.|?*+()[]{}'
+
+# 每个工作任务的不重复文本数
+TASK_TEXTS = 2000
+
+# 默认每个报告部分列出的规则数
+REPORT_TOP_RULES = 10
+
+def dotnet_regex_to_python(pattern):
+    """
+    将 .NET 特有的正则语法改写为 Python re 语法，以便编译检查
+
+    只保留语法：\\p{L} 等 Unicode 类别变为 \\w，平衡分组变为非捕获分组，内联选项被删除。
+
+    Args:
+        pattern (str): .NET 正则
+
+    Returns:
+        str: Python 正则
+    """
+
+    result = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\' and index + 1 < len(pattern):
+            escape = pattern[index + 1]
+            close = -1
+            if escape in 'pP' and pattern.startswith('{', index + 2):
+                close = pattern.find('}', index + 3)
+                replacement = '\\w' if escape == 'p' else '\\W'
+            elif escape == 'c' and index + 2 < len(pattern):
+                close = index + 2
+                replacement = '\\x00'
+            elif escape == 'k' and pattern[index + 2:index + 3] in ('<', "'"):
+                close = pattern.find('>' if pattern[index + 2] == '<' else "'", index + 3)
+                name = pattern[index + 3:close]
+                replacement = f'\\{name}' if name.isdigit() else f'(?P={name})'
+            if close > 0:
+                result.append(replacement)
+                index = close + 1
+                continue
+            result.append({'z': '\\Z', 'G': '', 'e': '\\x1b'}.get(escape, pattern[index:index + 2]))
+            index += 2
+            continue
+
+        match = DOTNET_GROUP.match(pattern, index) if char == '(' else None
+        if match is None:
+            result.append(char)
+            index += 1
+            continue
+        name = match.group(1) if match.group(1) is not None else match.group(2)
+        if name is not None:
+            result.append(f'(?P<{name}>' if name.isidentifier() else '(?:')
+        elif match.group(4) == ':':
+            result.append('(?:')
+        index = match.end()
+    return ''.join(result)
+
+def ordinal_key(text):
+    """
+    与 .NET StringComparer.Ordinal 一致的排序键，按 UTF-16 码元比较
+
+    Args:
+        text (str): 要排序的文本
+
+    Returns:
+        bytes: 文本的 UTF-16 大端编码
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def loader_order_key(relative_path):
+    """
+    插件加载翻译文件顺序的排序键
+
+    插件先加载翻译文件夹根目录中的文件，再加载各子文件夹中的文件，
+    文件夹和文件都按序数路径排序 (FileTool.GetAllTranslationFiles)。
+
+    Args:
+        relative_path (Path): 相对于翻译文件夹的文件路径
+
+    Returns:
+        tuple: 排序键
+    """
+
+    folder = relative_path.parent.parts
+    return len(folder) > 0, ordinal_key('\\'.join(folder)), ordinal_key(relative_path.name)
+
+def find_translation_files(input_path):
+    """
+    按插件的加载顺序查找文件夹中的 .txt 和 .zip 翻译文件
+
+    Args:
+        input_path (Path): 翻译文件夹，或单个 .txt 或 .zip 文件
+
+    Returns:
+        list: (文件路径, 报告中显示的名称) 元组
+    """
+
+    if input_path.is_file():
+        return [(input_path, input_path.name)]
+    files = [file for file in input_path.rglob('*')
+             if file.is_file() and file.name.lower().endswith(TRANSLATION_FILE_SUFFIXES)]
+    files.sort(key=lambda file: loader_order_key(file.relative_to(input_path)))
+    return [(file, file.relative_to(input_path).as_posix()) for file in files]
+
+def is_member_path_unsafe(member_name):
+    """
+    与插件中的 FileTool.IsZipPathUnsafe 相同的方式检查压缩包成员名
+
+    拒绝空名称、上级目录引用以及绝对路径或带根路径。
+
+    Args:
+        member_name (str): 压缩包中的成员名
+
+    Returns:
+        bool: 成员不可使用时为 True
+    """
+
+    if not member_name:
+        return True
+
+    # 统一路径分隔符
+    normalized_path = member_name.replace('\\', '/')
+
+    # 拒绝 "../"
+    if '../' in normalized_path:
+        return True
+
+    # 拒绝绝对路径，包括 Windows 盘符路径
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def shorten(text, length=40):
+    """
+    缩短报告行中的文本
+
+    Args:
+        text (str): 文本
+        length (int): 最大长度
+
+    Returns:
+        str: 文本，超过 length 时截断并加上 "..."
+    """
+
+    return text if len(text) <= length else text[:length] + "..."
+
+def unescape(text, unknown_escapes=None):
+    """
+    与插件中的 StringExtensions.Unescape 相同的方式替换转义序列
+
+    未知序列连同反斜杠保持原样，文本末尾的反斜杠也保留。
+
+    Args:
+        text (str): 含转义序列的文本
+        unknown_escapes (list): 可选，接收未知序列，例如 "\\x"
+
+    Returns:
+        str: 反转义后的文本
+    """
+
+    index = text.find('\\')
+    if index < 0:
+        return text
+
+    parts = []
+    start = 0
+    while 0 <= index < len(text) - 1:
+        parts.append(text[start:index])
+        char = text[index + 1]
+        escaped = ESCAPES.get(char)
+        if escaped is None:
+            parts.append('\\' + char)
+            if unknown_escapes is not None:
+                unknown_escapes.append('\\' + char)
+        else:
+            parts.append(escaped)
+        start = index + 2
+        index = text.find('\\', start)
+    parts.append(text[start:])
+    return ''.join(parts)
+
+def normalize_text(text):
+    """
+    与插件中的 StringTool.NormalizeText 相同的方式规范化文本
+
+    Args:
+        text (str): 文本
+
+    Returns:
+        str: 去除 \\r、\\n 和 \\t，修剪空白并转为大写的文本
+    """
+
+    return text.replace('\r', '').replace('\n', '').replace('\t', '').strip(WHITESPACE_CHARS).upper()
+
+def add_translation_lines(data, source, translations, rules):
+    """
+    与 TxtTranslationFileProcessor 相同的方式解析 .txt 翻译文件的行
+
+    Args:
+        data (bytes): 文件内容
+        source (str): 报告中显示的文件名
+        translations (dict): 精确翻译，会被原地修改
+        rules (list): 正则规则，会被原地修改
+    """
+
+    text = data.decode('utf-8', 'replace')
+    if text.startswith(BYTE_ORDER_MARK):
+        text = text[1:]
+
+    for line_number, line in enumerate(LINE_BREAK.split(text), 1):
+        if not line or line[0] == ';':
+            continue
+        original, tab, translation = line.partition('\t')
+        if not tab:
+            continue
+        original = unescape(original)
+        translation = unescape(translation).replace(MONGOLIAN_VOWEL_SEPARATOR, '')
+        if not original or not translation:
+            continue
+        if line[0] == '$':
+            rules.append({'source': f"{source}:{line_number}", 'pattern': original[1:], 'template': translation})
+        else:
+            translations[original] = translation
+
+def load_translations(input_path):
+    """
+    按插件的加载顺序加载翻译文件夹中的翻译
+
+    后加载文件的精确翻译会替换之前的翻译，而每个 $ 行都是一条独立的规则：
+    插件以 Regex 实例为键，因此即使模式相同也都会保留，并按加载顺序尝试。
+
+    Args:
+        input_path (Path): 翻译文件夹，或单个 .txt 或 .zip 文件
+
+    Returns:
+        tuple: (精确翻译, 含 'source'、'pattern' 和 'template' 的规则字典列表, 文件数)
+    """
+
+    translations = {}
+    rules = []
+    files = find_translation_files(input_path)
+    for file_path, name in files:
+        try:
+            if not file_path.name.lower().endswith('.zip'):
+                add_translation_lines(file_path.read_bytes(), name, translations, rules)
+                continue
+            with zipfile.ZipFile(file_path) as archive:
+                for info in archive.infolist():
+                    if info.is_dir() or not info.filename.lower().endswith('.txt'):
+                        continue
+                    if is_member_path_unsafe(info.filename):
+                        continue
+                    add_translation_lines(archive.read(info), f"{name}/{info.filename}", translations, rules)
+        except (OSError, zipfile.BadZipFile) as e:
+            print(f"✗ 读取 {name} 时发生错误: {e}")
+    return translations, rules, len(files)
+
+def load_corpus(corpus_path):
+    """
+    读取未翻译文本导出文件，每行一条文本
+
+    插件使用 WriteLine 写入每条文本，因此含换行符的文本会被读回为多条文本。
+    在多个会话中导出的文本，每个导出文件计数一次。
+
+    Args:
+        corpus_path (Path): 递归查找 *_untranslate.txt 文件的文件夹，或单个导出文件
+
+    Returns:
+        tuple: (文本的 Counter, 导出文件数)
+    """
+
+    if corpus_path.is_file():
+        files = [corpus_path]
+    else:
+        files = sorted(file for file in corpus_path.rglob('*') if file.is_file() and file.name.endswith(DUMP_FILE_SUFFIX))
+
+    texts = Counter()
+    for file in files:
+        text = file.read_bytes().decode('utf-8', 'replace')
+        if text.startswith(BYTE_ORDER_MARK):
+            text = text[1:]
+        texts.update(line for line in LINE_BREAK.split(text) if line)
+    return texts, len(files)
+
+def skip_reason(text, normalized, translations):
+    """
+    检查 GetTranslateText 是否在尝试正则规则之前返回
+
+    Args:
+        text (str): 文本
+        normalized (str): normalize_text 处理后的文本
+        translations (dict): 精确翻译
+
+    Returns:
+        str: SKIP_REASONS 的键，会尝试正则规则时为 None
+    """
+
+    if MONGOLIAN_VOWEL_SEPARATOR in text:
+        return 'xuat'
+    if text.startswith('[') and text.endswith(']'):
+        return 'bracket'
+    if text in translations or normalized in translations:
+        return 'exact'
+    return None
+
+def profile_task(patterns, texts):
+    """
+    工作进程入口，像 GetTranslateText 一样用每条规则匹配每条文本并计时
+
+    每条规则先匹配文本，没有非空匹配且规范化文本不同时再匹配规范化文本。
+    第一条匹配的规则翻译该文本。之后的规则仍会匹配，以找出被它遮蔽的规则，但不计入耗时。
+
+    Args:
+        patterns (list): 按规则顺序的 Python 正则，不重放的规则为 None
+        texts (list): (文本, 规范化文本, 出现次数) 元组
+
+    Returns:
+        dict: 每条规则的列表 'matches'、'hits'、'at_start'、'time' 和 'worst' ((秒, 文本) 元组)，
+            'taken' ((规则, 之前的规则) -> 文本数)、'translated'、'untranslated' 和 'untranslated_time'
+    """
+
+    regexes = [re.compile(pattern) if pattern is not None else None for pattern in patterns]
+    matches = [0] * len(regexes)
+    hits = [0] * len(regexes)
+    at_start = [0] * len(regexes)
+    times = [0.0] * len(regexes)
+    worst = [(0.0, None)] * len(regexes)
+    taken = Counter()
+    translated = 0
+    untranslated = 0
+    untranslated_time = 0.0
+    perf_counter = time.perf_counter
+
+    for text, normalized, count in texts:
+        winner = None
+        text_time = 0.0
+        for index, regex in enumerate(regexes):
+            if regex is None:
+                continue
+            started = perf_counter()
+            match = regex.search(text)
+            if (match is None or match.end() == match.start()) and normalized != text and normalized:
+                match = regex.search(normalized)
+            elapsed = perf_counter() - started
+
+            if elapsed > worst[index][0]:
+                worst[index] = (elapsed, text)
+            if winner is None:
+                times[index] += elapsed * count
+                text_time += elapsed
+            if match is None or match.end() == match.start():
+                continue
+
+            matches[index] += count
+            if match.start() == 0:
+                at_start[index] += count
+            if winner is None:
+                winner = index
+                hits[index] += count
+            else:
+                taken[index, winner] += count
+
+        if winner is None:
+            untranslated += count
+            untranslated_time += text_time * count
+        else:
+            translated += count
+
+    return {'matches': matches, 'hits': hits, 'at_start': at_start, 'time': times, 'worst': worst,
+            'taken': taken, 'translated': translated, 'untranslated': untranslated,
+            'untranslated_time': untranslated_time}
+
+def probe_task(pattern, texts):
+    """
+    工作进程入口，用一条规则匹配每条文本，见 probe_rules
+
+    Args:
+        pattern (str): Python 正则
+        texts (list): (文本, 规范化文本, 出现次数) 元组
+    """
+
+    regex = re.compile(pattern)
+    for text, normalized, _ in texts:
+        regex.search(text)
+        if normalized != text and normalized:
+            regex.search(normalized)
+
+def probe_rules(patterns, texts, jobs=1, timeout=PROBE_TIMEOUT_SECONDS):
+    """
+    单独重放易发生指数级回溯的规则，每条规则使用独立的进程
+
+    否则无休止回溯的规则会让整个重放卡住。超时后仍在运行的规则进程会被终止。
+
+    Args:
+        patterns (list): Python 正则
+        texts (list): (文本, 规范化文本, 出现次数) 元组
+        jobs (int): 同时运行的进程数
+        timeout (float): 每条规则的秒数
+
+    Returns:
+        list: 未能完成的规则在 patterns 中的索引
+    """
+
+    timed_out = []
+    for start in range(0, len(patterns), jobs):
+        processes = [(index, multiprocessing.Process(target=probe_task, args=(patterns[index], texts)))
+                     for index in range(start, min(start + jobs, len(patterns)))]
+        for _, process in processes:
+            process.start()
+        deadline = time.monotonic() + timeout
+        for index, process in processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+                process.join()
+                timed_out.append(index)
+    return timed_out
+
+def profile_rules(patterns, texts, jobs=1):
+    """
+    用规则重放文本，jobs 大于 1 时使用工作进程
+
+    Args:
+        patterns (list): 按规则顺序的 Python 正则，不重放的规则为 None
+        texts (list): (文本, 规范化文本, 出现次数) 元组
+        jobs (int): 工作进程数
+
+    Returns:
+        dict: 合计的 profile_task 结果
+    """
+
+    tasks = [texts[start:start + TASK_TEXTS] for start in range(0, len(texts), TASK_TEXTS)]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+            results = list(executor.map(profile_task, [patterns] * len(tasks), tasks))
+    else:
+        results = [profile_task(patterns, task) for task in tasks]
+
+    total = profile_task(patterns, [])
+    for result in results:
+        for key in ('matches', 'hits', 'at_start', 'time'):
+            total[key] = [a + b for a, b in zip(total[key], result[key])]
+        total['worst'] = [max(a, b, key=lambda worst: worst[0]) for a, b in zip(total['worst'], result['worst'])]
+        total['taken'].update(result['taken'])
+        for key in ('translated', 'untranslated', 'untranslated_time'):
+            total[key] += result[key]
+    return total
+
+def as_repeat(op, av):
+    """
+    展开解析后的正则中包裹重复的分组
+
+    Args:
+        op: 解析后的正则操作符
+        av: 操作符参数
+
+    Returns:
+        tuple: (最小次数, 最大次数, 重复体的项)，不是重复时为 None
+    """
+
+    while op == regex_parser.SUBPATTERN and len(av[-1]) == 1:
+        op, av = av[-1][0]
+    if op in (regex_parser.MAX_REPEAT, regex_parser.MIN_REPEAT):
+        return av
+    return None
+
+def char_class(items):
+    """
+    构建与解析后的正则项匹配相同单个字符的 Python 正则
+
+    Args:
+        items (list): 解析后的正则项
+
+    Returns:
+        str: 匹配一个字符的正则，这些项不是恰好匹配一个字符时为 None
+    """
+
+    while len(items) == 1 and items[0][0] == regex_parser.SUBPATTERN:
+        items = items[0][1][-1]
+    if len(items) != 1:
+        return None
+
+    op, av = items[0]
+    if op == regex_parser.LITERAL:
+        return re.escape(chr(av))
+    if op == regex_parser.NOT_LITERAL:
+        return f'[^{re.escape(chr(av))}]'
+    if op == regex_parser.ANY:
+        return '.'
+    if op != regex_parser.IN:
+        return None
+
+    parts = []
+    for item_op, item_av in av:
+        if item_op == regex_parser.NEGATE:
+            parts.append('^')
+        elif item_op == regex_parser.LITERAL:
+            parts.append(re.escape(chr(item_av)))
+        elif item_op == regex_parser.RANGE:
+            parts.append(f'{re.escape(chr(item_av[0]))}-{re.escape(chr(item_av[1]))}')
+        elif item_op == regex_parser.CATEGORY and item_av in CATEGORY_CLASSES:
+            parts.append(CATEGORY_CLASSES[item_av])
+        else:
+            return None
+    return f"[{''.join(parts)}]"
+
+def find_backtracking(pattern):
+    """
+    查找易发生灾难性回溯的正则结构
+
+    - 'nested': 重复的分组中含有无上限的重复，且分组的其他项是可选的或与之重叠，
+      例如 (a+)+、(\\w+\\s?)* 或 (.+,)+，匹配失败时会尝试每一种拆分
+    - 'alternation': 重复的分支可以匹配相同的文本，例如 (a|aa)+
+    - 'adjacent': 两个相邻的无上限重复匹配重叠的字符，例如 .*.* 或 \\w+\\d+
+
+    字符在 PROBE_CHARS 和模式本身的字符上进行比较。模式由 regex_parser 解析，
+    调用时它不能为 None。
+
+    Args:
+        pattern (str): Python 正则
+
+    Returns:
+        set: BACKTRACKING_RISKS 的键
+    """
+
+    try:
+        tree = regex_parser.parse(pattern)
+    except re.error:
+        return set()
+
+    candidates = PROBE_CHARS + ''.join(set(pattern))
+    char_sets = {}
+    def chars_of(items):
+        source = char_class(items)
+        if source is None:
+            return None
+        if source not in char_sets:
+            regex = re.compile(source)
+            char_sets[source] = frozenset(char for char in candidates if regex.fullmatch(char))
+        return char_sets[source]
+
+    risks = set()
+    def check_sequence(items):
+        # 其他所有必需项都能匹配无上限重复的字符时，该重复存在歧义
+        for index, (op, av) in enumerate(items):
+            repeat = as_repeat(op, av)
+            if repeat is None or repeat[1] != regex_parser.MAXREPEAT:
+                continue
+            chars = chars_of(repeat[2])
+            ambiguous = True
+            for other_index, (other_op, other_av) in enumerate(items):
+                other_repeat = as_repeat(other_op, other_av)
+                if other_index == index or (other_repeat is not None and other_repeat[0] == 0):
+                    continue
+                other_chars = chars_of(other_repeat[2] if other_repeat is not None else [(other_op, other_av)])
+                if chars is None or other_chars is None or not chars & other_chars:
+                    ambiguous = False
+                    break
+            if ambiguous:
+                risks.add('nested')
+                return
+
+    def check_repeated(items):
+        while len(items) == 1 and items[0][0] == regex_parser.SUBPATTERN:
+            items = items[0][1][-1]
+        if len(items) == 0 or items[-1][0] != regex_parser.BRANCH:
+            check_sequence(items)
+            return
+
+        # 解析器会把所有分支共有的前缀移到分支前面，(a|aa) 会变为 a(?:|a)
+        prefix = [items[index] for index in range(len(items) - 1)]
+        if any(chars_of([item]) is None for item in prefix):
+            check_sequence(items)
+            return
+        branches = [prefix + list(branch) for branch in items[-1][1][1]]
+        for branch in branches:
+            check_sequence(branch)
+        # 由单个字符组成的分支，一个分支能匹配另一个分支或其重复时存在歧义
+        sequences = [[chars_of([item]) for item in branch] for branch in branches]
+        sequences = [sequence for sequence in sequences if sequence and None not in sequence]
+        for index, short in enumerate(sequences):
+            for long in sequences[index + 1:]:
+                if len(short) > len(long):
+                    short, long = long, short
+                if len(long) % len(short) == 0 and all(
+                        long[position] & short[position % len(short)] for position in range(len(long))):
+                    risks.add('alternation')
+
+    def walk(items):
+        previous = None
+        for op, av in items:
+            repeat = as_repeat(op, av)
+            if repeat is not None:
+                low, high, body = repeat
+                if high == regex_parser.MAXREPEAT:
+                    chars = chars_of(body)
+                    if previous is not None and chars is not None and previous & chars:
+                        risks.add('adjacent')
+                    check_repeated(body)
+                    previous = chars
+                elif low > 0:
+                    previous = None
+                walk(body)
+                continue
+
+            previous = None
+            if op == regex_parser.SUBPATTERN:
+                walk(av[-1])
+            elif op == regex_parser.BRANCH:
+                for branch in av[1]:
+                    walk(branch)
+            elif op in (regex_parser.ASSERT, regex_parser.ASSERT_NOT):
+                walk(av[1])
+            elif op == regex_parser.GROUPREF_EXISTS:
+                for branch in av[1:]:
+                    if branch is not None:
+                        walk(branch)
+
+    walk(tree)
+    return risks
+
+def is_start_anchored(tree):
+    """
+    检查解析后的正则是否只在文本开头匹配
+
+    Args:
+        tree (list): 解析后的正则项
+
+    Returns:
+        bool: 正则在分支之外以 ^ 或 \\A 开头时为 True
+    """
+
+    while len(tree) > 0 and tree[0][0] == regex_parser.SUBPATTERN:
+        tree = tree[0][1][-1]
+    return len(tree) > 0 and tree[0][0] == regex_parser.AT and tree[0][1] in (
+        regex_parser.AT_BEGINNING, regex_parser.AT_BEGINNING_STRING)
+
+def has_top_level_alternation(pattern):
+    """
+    检查正则是否在顶层为分支，例如 a|b
+
+    解析树无法判断这一点：re 的解析器会把 a|b 变成字符类，并提取各分支的公共前缀。
+
+    Args:
+        pattern (str): .NET 正则
+
+    Returns:
+        bool: 在前面添加的锚点只作用于第一个分支时为 True
+    """
+
+    depth = 0
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\':
+            index += 1
+        elif char == '[':
+            # Skip the class, a ] right after [ or [^ is a literal
+            index += 2 if pattern.startswith('^', index + 1) else 1
+            index += 1 if pattern.startswith(']', index) else 0
+            while index < len(pattern) and pattern[index] != ']':
+                index += 2 if pattern[index] == '\\' else 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+        index += 1
+    return False
+
+def literal_prefix(pattern):
+    """
+    获取 .NET 模式开头（^ 锚点之后）的字面文本
+
+    Args:
+        pattern (str): .NET 正则
+
+    Returns:
+        str: 字面前缀，模式不以字面文本开头时为空
+    """
+
+    start = 1 if pattern.startswith('^') else 0
+    end = start
+    while end < len(pattern) and pattern[end] not in REGEX_METACHARACTERS:
+        end += 1
+    if end < len(pattern) and pattern[end] in '?*+{':
+        # 最后一个字符属于量词
+        end -= 1
+    return pattern[start:max(end, start)]
+
+def suggest_anchor(rule, tree):
+    """
+    建议将规则锚定在文本开头
+
+    没有锚点的正则会在每条未翻译文本的每个位置尝试匹配，有锚点的正则在第一个位置之后就会失败。
+    规则以 .* 或 .+ 开头（本来就只能从开头匹配），或者重放时的所有匹配都从开头开始时适用。
+
+    Args:
+        rule (dict): 已分析的规则
+        tree (list): 规则解析后的 Python 正则
+
+    Returns:
+        str: 建议的模式，不适用锚定时为 None
+    """
+
+    if is_start_anchored(tree) or len(tree) == 0:
+        return None
+    first = tree[0]
+    repeat = as_repeat(*first)
+    leading_wildcard = (repeat is not None and repeat[0] <= 1 and repeat[1] == regex_parser.MAXREPEAT
+                        and len(repeat[2]) == 1 and repeat[2][0][0] == regex_parser.ANY)
+    if not leading_wildcard and not (rule['matches'] and rule['at_start'] == rule['matches']):
+        return None
+    if has_top_level_alternation(rule['pattern']):
+        return f"^(?:{rule['pattern']})"
+    return f"^{rule['pattern']}"
+
+def suggest_merges(rules):
+    """
+    查找译文相同、可以共用一个分支结构的连续锚定规则
+
+    只有相邻且锚定在开头的规则合并后才能保持查找顺序，并且模板不能使用编号分组，
+    因为合并会改变分组编号。.NET 允许在多个分支中使用相同的分组名，因此命名分组会被保留。
+
+    Args:
+        rules (list): 按加载顺序的规则
+
+    Returns:
+        list: (合并的规则列表, 合并后的模式) 元组
+    """
+
+    merges = []
+    run = []
+    def flush():
+        if len(run) > 1:
+            prefixes = [literal_prefix(rule['pattern']) for rule in run]
+            common = os.path.commonprefix(prefixes)
+            branches = '|'.join(rule['pattern'][1 + len(common):] for rule in run)
+            merges.append((list(run), f"^{common}(?:{branches})"))
+        run.clear()
+
+    for rule in rules:
+        tree = rule.get('tree')
+        mergeable = (tree is not None and rule['pattern'].startswith('^')
+                     and not has_top_level_alternation(rule['pattern'])
+                     and not re.search(r'(?<!\\)\$\{?\d', rule['template']))
+        if not mergeable or (run and rule['template'] != run[-1]['template']):
+            flush()
+        if mergeable:
+            run.append(rule)
+    flush()
+    return merges
+
+def describe_rule(rule):
+    """
+    用一行报告描述规则
+
+    Args:
+        rule (dict): 规则
+
+    Returns:
+        str: 来源和缩短的模式
+    """
+
+    return f"{rule['source']}  {shorten(rule['pattern'], 60)}"
+
+def pop_option(args, name, default=None):
+    """
+    从参数列表中移除带值的选项
+
+    支持 "--name value" 和 "--name=value" 两种写法
+
+    Args:
+        args (list): 参数列表，会被原地修改
+        name (str): 选项名
+        default (str): 选项不存在时返回的值
+
+    Returns:
+        str: 选项值，选项没有值时为 None
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """打印命令行用法"""
+
+    print("正则翻译规则分析工具")
+    print("按插件的查找顺序，用未翻译文本导出重放 $ 正则翻译")
+    print()
+    print("用法:")
+    print("  python script.py <翻译文件夹|file.txt|file.zip> <导出文件夹|dump.txt> [--jobs N] [--top N] [--output report.json]")
+    print()
+    print("示例:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/Text ./BepInEx/JustAnotherTranslator/Dump")
+    print("  python script.py ./Text 2026-10-17-20-00_untranslate.txt --top 0 --output rules.json")
+    print()
+    print("参数说明:")
+    print("  翻译文件夹: 包含 .txt 和 .zip 翻译文件的文件夹，按插件的顺序加载")
+    print("  导出文件夹: 递归查找 *_untranslate.txt 导出文件的文件夹，每行一条文本")
+    print("  --jobs N: (可选) 使用 N 个工作进程重放，0 表示使用所有CPU核心（默认为 0）")
+    print("  --top N: (可选) 每个部分列出的规则数，0 表示全部列出（默认为 10）")
+    print("  --output report.json: (可选) 将每条规则的统计写入 JSON 文件")
+    print()
+    print("注意:")
+    print("  - 模式在改写 .NET 特有语法后使用 Python re 匹配，请比较规则之间的耗时，")
+    print("    而不是与游戏中的耗时比较")
+    print("  - 与插件一样，有精确翻译的文本会在尝试规则之前被跳过")
+    if regex_parser is None:
+        print("  - 此 Python 版本无法使用回溯、锚定和合并分析，其正则解析器（re._parser 或 sre_parse）")
+        print("    不可用；规则只会被重放和计时")
+    print()
+
+def main():
+    """处理命令行参数的主函数"""
+
+    args = sys.argv.copy()
+    if len(args) < 3 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    jobs = pop_option(args, "--jobs", "0")
+    if jobs is None or not jobs.isdigit():
+        print("错误：--jobs 需要一个非负整数")
+        return 2
+    jobs = int(jobs) or os.cpu_count() or 1
+
+    top = pop_option(args, "--top", str(REPORT_TOP_RULES))
+    if top is None or not top.isdigit():
+        print("错误：--top 需要一个非负整数")
+        return 2
+    top = int(top) or None
+
+    output_file = pop_option(args, "--output")
+    if "--output" in sys.argv and output_file is None:
+        print("错误：--output 需要一个文件路径")
+        return 2
+
+    input_path = Path(args[1])
+    corpus_path = Path(args[2])
+    for path in (input_path, corpus_path):
+        if not path.exists():
+            print(f"错误：路径 {path} 不存在")
+            return 2
+
+    start_time = time.perf_counter()
+    translations, rules, file_count = load_translations(input_path)
+    print(f"从 {file_count} 个文件中加载了 {len(rules):,} 条正则规则和 {len(translations):,} 条精确翻译")
+    if regex_parser is None:
+        print("⚠ 此 Python 版本无法进行正则分析，规则只会被重放和计时")
+    if not rules:
+        print("未找到 $ 正则翻译")
+        return 0
+
+    for rule in rules:
+        try:
+            python_pattern = dotnet_regex_to_python(rule['pattern'])
+            re.compile(python_pattern)
+            rule['python_pattern'] = python_pattern
+            rule['tree'] = regex_parser.parse(python_pattern) if regex_parser is not None else None
+            rule['risks'] = find_backtracking(python_pattern) if regex_parser is not None else set()
+        except re.error as e:
+            rule['error'] = str(e)
+    checked_rules = [rule for rule in rules if 'error' not in rule]
+
+    texts, dump_count = load_corpus(corpus_path)
+    skipped = dict.fromkeys(SKIP_REASONS, 0)
+    replay = []
+    for text, count in texts.items():
+        if text.isspace():
+            continue
+        normalized = normalize_text(text)
+        reason = skip_reason(text, normalized, translations)
+        if reason is None:
+            replay.append((text, normalized, count))
+        else:
+            skipped[reason] += count
+    print(f"正在重放 {dump_count} 个导出文件中的 {sum(count for _, _, count in replay):,} 条文本（{len(replay):,} 条不重复）"
+          + (f"，使用 {jobs} 个工作进程..." if jobs > 1 else "..."))
+    if any(skipped.values()):
+        print(f"  在正则规则之前跳过: {', '.join(f'{count} {SKIP_REASONS[reason]}' for reason, count in skipped.items() if count)}")
+
+    # 没有正则分析时任何规则都可能无休止地回溯，因此全部先单独重放
+    risky_rules = ([rule for rule in checked_rules if rule['risks'] & {'nested', 'alternation'}]
+                   if regex_parser is not None else checked_rules)
+    if risky_rules and replay:
+        print(f"  先单独重放 {len(risky_rules)} 条" + ("易发生指数级回溯的" if regex_parser is not None else "") + "规则...")
+        for index in probe_rules([rule['python_pattern'] for rule in risky_rules], replay, jobs):
+            risky_rules[index]['risks'].add('timeout')
+
+    timed_out_rules = [rule for rule in risky_rules if 'timeout' in rule['risks']]
+    result = profile_rules([rule['python_pattern'] if 'timeout' not in rule['risks'] else None
+                            for rule in checked_rules], replay, jobs)
+    taken_by = {}
+    for (index, winner), count in result['taken'].items():
+        taken_by.setdefault(index, Counter())[checked_rules[winner]['source']] += count
+    for index, rule in enumerate(checked_rules):
+        rule['matches'] = result['matches'][index]
+        rule['hits'] = result['hits'][index]
+        rule['at_start'] = result['at_start'][index]
+        rule['time'] = result['time'][index]
+        rule['worst_time'], rule['worst_text'] = result['worst'][index]
+        rule['taken_by'] = taken_by.get(index, Counter())
+        if rule['worst_time'] > SLOW_MATCH_SECONDS:
+            rule['risks'].add('slow')
+        rule['anchor'] = suggest_anchor(rule, rule['tree']) if rule['tree'] is not None else None
+
+    # 相同的模式在插件中是不同的规则，只有第一条可能翻译文本
+    first_rule = {}
+    for rule in checked_rules:
+        rule['duplicate_of'] = first_rule.setdefault(rule['pattern'], rule)['source']
+        if rule['duplicate_of'] == rule['source']:
+            rule['duplicate_of'] = None
+
+    total_time = sum(rule['time'] for rule in checked_rules)
+    print("-" * 50)
+    print(f"正则耗时: {result['translated'] + result['untranslated']:,} 条文本共 {total_time:.3f} 秒，"
+          f"{result['translated']:,} 条由规则翻译，{result['untranslated']:,} 条未翻译")
+    if result['untranslated']:
+        print(f"  每条未翻译文本会尝试全部 {len(checked_rules) - len(timed_out_rules):,} 条重放的规则: "
+              f"每条文本 {result['untranslated_time'] / result['untranslated'] * 1000:.3f} 毫秒")
+
+    def print_section(title, section_rules, describe):
+        if not section_rules:
+            return
+        print()
+        print(f"{title}（{len(section_rules)} 条规则）:")
+        for rule in section_rules[:top]:
+            print(f"  {describe_rule(rule)}")
+            detail = describe(rule)
+            if detail:
+                print(f"      {detail}")
+        if top is not None and len(section_rules) > top:
+            print(f"  ……另有 {len(section_rules) - top} 条")
+
+    print_section("最慢的规则，按插件查找顺序计算耗时",
+                  sorted((rule for rule in checked_rules if rule['time'] > 0), key=lambda rule: -rule['time']),
+                  lambda rule: f"{rule['time']:.3f} 秒，翻译 {rule['hits']:,} 条，最慢匹配 {rule['worst_time'] * 1000:.3f} 毫秒")
+    print_section("从未匹配",
+                  [rule for rule in checked_rules
+                   if not rule['matches'] and not rule['duplicate_of'] and 'timeout' not in rule['risks']],
+                  lambda rule: None)
+    print_section("被遮蔽，每次匹配都已由之前的规则翻译",
+                  [rule for rule in checked_rules if (rule['matches'] and not rule['hits']) or rule['duplicate_of']],
+                  lambda rule: (f"与 {rule['duplicate_of']} 的模式相同" if rule['duplicate_of'] else
+                                f"{rule['matches']:,} 次匹配被 {rule['taken_by'].most_common(1)[0][0]} 抢先"))
+    print_section("回溯风险",
+                  sorted((rule for rule in checked_rules if rule['risks']), key=lambda rule: -rule['worst_time']),
+                  lambda rule: '，'.join(BACKTRACKING_RISKS[risk] for risk in BACKTRACKING_RISKS if risk in rule['risks'])
+                  + (f"；最慢匹配 {rule['worst_time'] * 1000:.3f} 毫秒，文本 \"{shorten(rule['worst_text'])}\""
+                     if rule['worst_text'] is not None else ""))
+    print_section("锚定在文本开头，使未匹配时在第一个位置之后就失败",
+                  [rule for rule in checked_rules if rule['anchor']],
+                  lambda rule: rule['anchor'])
+    print_section("未分析，Python re 无法编译该模式",
+                  [rule for rule in rules if 'error' in rule],
+                  lambda rule: rule['error'])
+
+    merges = suggest_merges(checked_rules)
+    if merges:
+        print()
+        print(f"将译文相同的连续规则合并为一个分支结构（{len(merges)} 组）:")
+        for merged_rules, pattern in merges[:top]:
+            print(f"  {merged_rules[0]['source']} .. {merged_rules[-1]['source']}: {len(merged_rules)} 条规则")
+            print(f"      {shorten(pattern, 100)}")
+        if top is not None and len(merges) > top:
+            print(f"  ……另有 {len(merges) - top} 组")
+
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as outfile:
+            json.dump({
+                'texts': result['translated'] + result['untranslated'],
+                'translated': result['translated'],
+                'untranslated': result['untranslated'],
+                'skipped': skipped,
+                'total_time': total_time,
+                'rules': [{
+                    'source': rule['source'],
+                    'pattern': rule['pattern'],
+                    'template': rule['template'],
+                    **({'error': rule['error']} if 'error' in rule else {
+                        'matches': rule['matches'],
+                        'hits': rule['hits'],
+                        'time': rule['time'],
+                        'worst_time': rule['worst_time'],
+                        'worst_text': rule['worst_text'],
+                        'shadowed_by': dict(rule['taken_by']),
+                        'duplicate_of': rule['duplicate_of'],
+                        'risks': sorted(rule['risks']),
+                        'anchor': rule['anchor']
+                    })
+                } for rule in rules],
+                'merges': [{'sources': [rule['source'] for rule in merged_rules], 'pattern': pattern}
+                           for merged_rules, pattern in merges]
+            }, outfile, ensure_ascii=False, indent=2)
+        print()
+        print(f"报告已写入 {output_file}")
+
+    print("-" * 50)
+    print(f"完成，耗时 {time.perf_counter() - start_time:.2f} 秒")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Replay untranslated text dumps against the $ regex translations to find slow, unused and shadowed rules
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# The backtracking, anchor and merge analysis walks parse trees of re's own parser, which has no public
+# API: re._parser since Python 3.11, sre_parse before. Where neither can be imported, or it lacks a name
+# the analysis uses, the rules are still replayed and timed without that analysis.
+try:
+    from re import _parser as regex_parser
+except ImportError:
+    try:
+        import sre_parse as regex_parser
+    except ImportError:
+        regex_parser = None
+
+# Names of regex_parser used by the analysis
+REGEX_PARSER_NAMES = ('parse', 'MAXREPEAT', 'SUBPATTERN', 'MAX_REPEAT', 'MIN_REPEAT', 'LITERAL', 'NOT_LITERAL', 'ANY',
+                      'IN', 'NEGATE', 'RANGE', 'CATEGORY', 'BRANCH', 'ASSERT', 'ASSERT_NOT', 'GROUPREF_EXISTS', 'AT',
+                      'AT_BEGINNING', 'AT_BEGINNING_STRING', 'CATEGORY_DIGIT', 'CATEGORY_NOT_DIGIT', 'CATEGORY_SPACE',
+                      'CATEGORY_NOT_SPACE', 'CATEGORY_WORD', 'CATEGORY_NOT_WORD')
+if regex_parser is not None and not all(hasattr(regex_parser, name) for name in REGEX_PARSER_NAMES):
+    regex_parser = None
+
+# UTF-8 byte order mark, only skipped at the start of a file
+BYTE_ORDER_MARK = '\ufeff'
+
+# Removed from the translation by TxtTranslationFileProcessor, see XUAT RedirectedResourceDetectionStrategy
+MONGOLIAN_VOWEL_SEPARATOR = '\u180e'
+
+# .NET regex groups rewritten by dotnet_regex_to_python: named and balancing groups, inline options
+DOTNET_GROUP = re.compile(r"\(\?(?:<(?![=!])([^>]*)>|'([^']*)'|([imnsx-]+)([:)]))")
+
+# Suffixes of the files read by the plugin's text translation loader, zip members are .txt files
+TRANSLATION_FILE_SUFFIXES = ('.txt', '.zip')
+
+# Escape sequences of StringExtensions.Unescape, any other sequence is kept as is
+ESCAPES = {
+    '0': '\0',
+    'a': '\a',
+    'b': '\b',
+    't': '\t',
+    'n': '\n',
+    'v': '\v',
+    'f': '\f',
+    'r': '\r',
+    "'": "'",
+    '"': '"',
+    '\\': '\\'
+}
+
+# Suffix of the untranslated text dumps written by TextTranslateManger, the _normalized dumps are not replayed
+DUMP_FILE_SUFFIX = '_untranslate.txt'
+
+# Line breaks of StreamReader.ReadLine
+LINE_BREAK = re.compile(r'\r\n|\r|\n')
+
+# Whitespace trimmed by StringTool.NormalizeText
+WHITESPACE_CHARS = ('\t\n\v\f\r \u0085\u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008'
+                    '\u2009\u200a\u200b\u2028\u2029\u3000\ufeff')
+
+# Reasons for GetTranslateText to return before trying the regex rules, with their report labels
+SKIP_REASONS = {
+    'exact': "exact translation",
+    'bracket': "[...] text",
+    'xuat': "XUAT marked"
+}
+
+# Constructs found by find_backtracking, with their report labels
+BACKTRACKING_RISKS = {
+    'timeout': "did not finish the replay, the game hangs on the same texts",
+    'nested': "nested repeat (exponential)",
+    'alternation': "repeated ambiguous alternation (exponential)",
+    'adjacent': "adjacent overlapping repeats (polynomial)",
+    'slow': "slow on a replayed text"
+}
+
+# A single match slower than this is reported as 'slow'
+SLOW_MATCH_SECONDS = 0.001
+
+# Rules prone to exponential backtracking are first replayed alone in a process stopped after this
+# many seconds, a running match cannot be interrupted inside re
+PROBE_TIMEOUT_SECONDS = 10
+
+# Characters used to compare the characters matched by two regex items, plus the characters of the pattern
+PROBE_CHARS = ''.join(chr(code) for code in range(0x20, 0x7f)) + '\t\nあアー亜。、「」…\u3000０'
+
+# .NET regex classes of the \d, \s and \w categories of a parsed Python regex
+CATEGORY_CLASSES = {
+    regex_parser.CATEGORY_DIGIT: '\\d',
+    regex_parser.CATEGORY_NOT_DIGIT: '\\D',
+    regex_parser.CATEGORY_SPACE: '\\s',
+    regex_parser.CATEGORY_NOT_SPACE: '\\S',
+    regex_parser.CATEGORY_WORD: '\\w',
+    regex_parser.CATEGORY_NOT_WORD: '\\W'
+} if regex_parser is not None else {}
+
+# Characters ending the literal prefix of a pattern, see literal_prefix
+REGEX_METACHARACTERS = '\\^$.|?*+()[]{}'
+
+# Unique texts per worker task
+TASK_TEXTS = 2000
+
+# Rules listed per report section by default
+REPORT_TOP_RULES = 10
+
+def dotnet_regex_to_python(pattern):
+    """
+    Rewrite .NET-only regex syntax to Python re syntax, so the pattern can be compiled to check it
+
+    Only the syntax is kept: Unicode categories such as \\p{L} become \\w, balancing groups become
+    non-capturing groups and inline options are dropped.
+
+    Args:
+        pattern (str): .NET regex
+
+    Returns:
+        str: Python regex
+    """
+
+    result = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\' and index + 1 < len(pattern):
+            escape = pattern[index + 1]
+            close = -1
+            if escape in 'pP' and pattern.startswith('{', index + 2):
+                close = pattern.find('}', index + 3)
+                replacement = '\\w' if escape == 'p' else '\\W'
+            elif escape == 'c' and index + 2 < len(pattern):
+                close = index + 2
+                replacement = '\\x00'
+            elif escape == 'k' and pattern[index + 2:index + 3] in ('<', "'"):
+                close = pattern.find('>' if pattern[index + 2] == '<' else "'", index + 3)
+                name = pattern[index + 3:close]
+                replacement = f'\\{name}' if name.isdigit() else f'(?P={name})'
+            if close > 0:
+                result.append(replacement)
+                index = close + 1
+                continue
+            result.append({'z': '\\Z', 'G': '', 'e': '\\x1b'}.get(escape, pattern[index:index + 2]))
+            index += 2
+            continue
+
+        match = DOTNET_GROUP.match(pattern, index) if char == '(' else None
+        if match is None:
+            result.append(char)
+            index += 1
+            continue
+        name = match.group(1) if match.group(1) is not None else match.group(2)
+        if name is not None:
+            result.append(f'(?P<{name}>' if name.isidentifier() else '(?:')
+        elif match.group(4) == ':':
+            result.append('(?:')
+        index = match.end()
+    return ''.join(result)
+
+def ordinal_key(text):
+    """
+    Sort key matching .NET StringComparer.Ordinal, which compares UTF-16 code units
+
+    Args:
+        text (str): Text to sort
+
+    Returns:
+        bytes: UTF-16 big-endian encoding of the text
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def loader_order_key(relative_path):
+    """
+    Sort key for the order in which the plugin loads translation files
+
+    The plugin loads the files in the root of the translation folder first, then the files of
+    every subfolder, with folders and files each sorted by ordinal path (FileTool.GetAllTranslationFiles).
+
+    Args:
+        relative_path (Path): File path relative to the translation folder
+
+    Returns:
+        tuple: Sort key
+    """
+
+    folder = relative_path.parent.parts
+    return len(folder) > 0, ordinal_key('\\'.join(folder)), ordinal_key(relative_path.name)
+
+def find_translation_files(input_path):
+    """
+    Find the .txt and .zip translation files of a folder in the order the plugin loads them
+
+    Args:
+        input_path (Path): Translation folder, or a single .txt or .zip file
+
+    Returns:
+        list: (file path, name shown in reports) tuples
+    """
+
+    if input_path.is_file():
+        return [(input_path, input_path.name)]
+    files = [file for file in input_path.rglob('*')
+             if file.is_file() and file.name.lower().endswith(TRANSLATION_FILE_SUFFIXES)]
+    files.sort(key=lambda file: loader_order_key(file.relative_to(input_path)))
+    return [(file, file.relative_to(input_path).as_posix()) for file in files]
+
+def is_member_path_unsafe(member_name):
+    """
+    Check an archive member name the same way as FileTool.IsZipPathUnsafe in the plugin
+
+    Rejects empty names, parent folder references and absolute or rooted paths.
+
+    Args:
+        member_name (str): Member name in the archive
+
+    Returns:
+        bool: True if the member must not be used
+    """
+
+    if not member_name:
+        return True
+
+    # Unify path separators
+    normalized_path = member_name.replace('\\', '/')
+
+    # Reject "../"
+    if '../' in normalized_path:
+        return True
+
+    # Reject absolute paths, including Windows drive paths
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def shorten(text, length=40):
+    """
+    Shorten text for a report line
+
+    Args:
+        text (str): Text
+        length (int): Maximum length
+
+    Returns:
+        str: Text, cut with "..." if longer than length
+    """
+
+    return text if len(text) <= length else text[:length] + "..."
+
+def unescape(text, unknown_escapes=None):
+    """
+    Replace escape sequences the same way as StringExtensions.Unescape in the plugin
+
+    Unknown sequences are kept with their backslash, and so is a backslash at the end of the text.
+
+    Args:
+        text (str): Text with escape sequences
+        unknown_escapes (list): Optional, receives the unknown sequences such as "\\x"
+
+    Returns:
+        str: Unescaped text
+    """
+
+    index = text.find('\\')
+    if index < 0:
+        return text
+
+    parts = []
+    start = 0
+    while 0 <= index < len(text) - 1:
+        parts.append(text[start:index])
+        char = text[index + 1]
+        escaped = ESCAPES.get(char)
+        if escaped is None:
+            parts.append('\\' + char)
+            if unknown_escapes is not None:
+                unknown_escapes.append('\\' + char)
+        else:
+            parts.append(escaped)
+        start = index + 2
+        index = text.find('\\', start)
+    parts.append(text[start:])
+    return ''.join(parts)
+
+def normalize_text(text):
+    """
+    Normalize text the same way as StringTool.NormalizeText in the plugin
+
+    Args:
+        text (str): Text
+
+    Returns:
+        str: Text without \\r, \\n and \\t, trimmed and in upper case
+    """
+
+    return text.replace('\r', '').replace('\n', '').replace('\t', '').strip(WHITESPACE_CHARS).upper()
+
+def add_translation_lines(data, source, translations, rules):
+    """
+    Parse the lines of a .txt translation file the same way as TxtTranslationFileProcessor
+
+    Args:
+        data (bytes): File content
+        source (str): File name shown in reports
+        translations (dict): Exact translations, modified in place
+        rules (list): Regex rules, modified in place
+    """
+
+    text = data.decode('utf-8', 'replace')
+    if text.startswith(BYTE_ORDER_MARK):
+        text = text[1:]
+
+    for line_number, line in enumerate(LINE_BREAK.split(text), 1):
+        if not line or line[0] == ';':
+            continue
+        original, tab, translation = line.partition('\t')
+        if not tab:
+            continue
+        original = unescape(original)
+        translation = unescape(translation).replace(MONGOLIAN_VOWEL_SEPARATOR, '')
+        if not original or not translation:
+            continue
+        if line[0] == '$':
+            rules.append({'source': f"{source}:{line_number}", 'pattern': original[1:], 'template': translation})
+        else:
+            translations[original] = translation
+
+def load_translations(input_path):
+    """
+    Load the translations of a translation folder in the order the plugin loads them
+
+    Exact translations of later files replace earlier ones, while each $ line becomes its own
+    rule: the plugin keys them by Regex instance, so even identical patterns are all kept and
+    tried in load order.
+
+    Args:
+        input_path (Path): Translation folder, or a single .txt or .zip file
+
+    Returns:
+        tuple: (exact translations, list of rule dicts with 'source', 'pattern' and 'template', number of files)
+    """
+
+    translations = {}
+    rules = []
+    files = find_translation_files(input_path)
+    for file_path, name in files:
+        try:
+            if not file_path.name.lower().endswith('.zip'):
+                add_translation_lines(file_path.read_bytes(), name, translations, rules)
+                continue
+            with zipfile.ZipFile(file_path) as archive:
+                for info in archive.infolist():
+                    if info.is_dir() or not info.filename.lower().endswith('.txt'):
+                        continue
+                    if is_member_path_unsafe(info.filename):
+                        continue
+                    add_translation_lines(archive.read(info), f"{name}/{info.filename}", translations, rules)
+        except (OSError, zipfile.BadZipFile) as e:
+            print(f"✗ Error reading {name}: {e}")
+    return translations, rules, len(files)
+
+def load_corpus(corpus_path):
+    """
+    Read untranslated text dumps, one text per line
+
+    The plugin writes each text with WriteLine, so a text containing line breaks is read back as
+    several texts. A text dumped in several sessions is counted once per dump.
+
+    Args:
+        corpus_path (Path): Folder searched recursively for *_untranslate.txt files, or a single dump file
+
+    Returns:
+        tuple: (Counter of texts, number of dump files)
+    """
+
+    if corpus_path.is_file():
+        files = [corpus_path]
+    else:
+        files = sorted(file for file in corpus_path.rglob('*') if file.is_file() and file.name.endswith(DUMP_FILE_SUFFIX))
+
+    texts = Counter()
+    for file in files:
+        text = file.read_bytes().decode('utf-8', 'replace')
+        if text.startswith(BYTE_ORDER_MARK):
+            text = text[1:]
+        texts.update(line for line in LINE_BREAK.split(text) if line)
+    return texts, len(files)
+
+def skip_reason(text, normalized, translations):
+    """
+    Check whether GetTranslateText returns before trying the regex rules
+
+    Args:
+        text (str): Text
+        normalized (str): Text after normalize_text
+        translations (dict): Exact translations
+
+    Returns:
+        str: Key of SKIP_REASONS, None if the regex rules are tried
+    """
+
+    if MONGOLIAN_VOWEL_SEPARATOR in text:
+        return 'xuat'
+    if text.startswith('[') and text.endswith(']'):
+        return 'bracket'
+    if text in translations or normalized in translations:
+        return 'exact'
+    return None
+
+def profile_task(patterns, texts):
+    """
+    Worker process entry, match every rule against every text like GetTranslateText and time it
+
+    Each rule is tried on the text and, when it has no non-empty match and the normalized text
+    differs, on the normalized text. The first rule with a match translates the text. The rules
+    after it are still matched, to find the rules they shadow, but their time is not counted.
+
+    Args:
+        patterns (list): Python regex patterns, in rule order, None for rules that are not replayed
+        texts (list): (text, normalized text, number of occurrences) tuples
+
+    Returns:
+        dict: Per-rule lists 'matches', 'hits', 'at_start', 'time' and 'worst' ((seconds, text) tuples),
+            'taken' ((rule, earlier rule) -> texts), 'translated', 'untranslated' and 'untranslated_time'
+    """
+
+    regexes = [re.compile(pattern) if pattern is not None else None for pattern in patterns]
+    matches = [0] * len(regexes)
+    hits = [0] * len(regexes)
+    at_start = [0] * len(regexes)
+    times = [0.0] * len(regexes)
+    worst = [(0.0, None)] * len(regexes)
+    taken = Counter()
+    translated = 0
+    untranslated = 0
+    untranslated_time = 0.0
+    perf_counter = time.perf_counter
+
+    for text, normalized, count in texts:
+        winner = None
+        text_time = 0.0
+        for index, regex in enumerate(regexes):
+            if regex is None:
+                continue
+            started = perf_counter()
+            match = regex.search(text)
+            if (match is None or match.end() == match.start()) and normalized != text and normalized:
+                match = regex.search(normalized)
+            elapsed = perf_counter() - started
+
+            if elapsed > worst[index][0]:
+                worst[index] = (elapsed, text)
+            if winner is None:
+                times[index] += elapsed * count
+                text_time += elapsed
+            if match is None or match.end() == match.start():
+                continue
+
+            matches[index] += count
+            if match.start() == 0:
+                at_start[index] += count
+            if winner is None:
+                winner = index
+                hits[index] += count
+            else:
+                taken[index, winner] += count
+
+        if winner is None:
+            untranslated += count
+            untranslated_time += text_time * count
+        else:
+            translated += count
+
+    return {'matches': matches, 'hits': hits, 'at_start': at_start, 'time': times, 'worst': worst,
+            'taken': taken, 'translated': translated, 'untranslated': untranslated,
+            'untranslated_time': untranslated_time}
+
+def probe_task(pattern, texts):
+    """
+    Worker process entry, match one rule against every text, see probe_rules
+
+    Args:
+        pattern (str): Python regex
+        texts (list): (text, normalized text, number of occurrences) tuples
+    """
+
+    regex = re.compile(pattern)
+    for text, normalized, _ in texts:
+        regex.search(text)
+        if normalized != text and normalized:
+            regex.search(normalized)
+
+def probe_rules(patterns, texts, jobs=1, timeout=PROBE_TIMEOUT_SECONDS):
+    """
+    Replay rules prone to exponential backtracking alone, each in its own process
+
+    A rule that backtracks without end would otherwise hang the whole replay. The process of a
+    rule still running after the timeout is terminated.
+
+    Args:
+        patterns (list): Python regex patterns
+        texts (list): (text, normalized text, number of occurrences) tuples
+        jobs (int): Number of processes run at the same time
+        timeout (float): Seconds given to each rule
+
+    Returns:
+        list: Indexes in patterns of the rules that did not finish
+    """
+
+    timed_out = []
+    for start in range(0, len(patterns), jobs):
+        processes = [(index, multiprocessing.Process(target=probe_task, args=(patterns[index], texts)))
+                     for index in range(start, min(start + jobs, len(patterns)))]
+        for _, process in processes:
+            process.start()
+        deadline = time.monotonic() + timeout
+        for index, process in processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+                process.join()
+                timed_out.append(index)
+    return timed_out
+
+def profile_rules(patterns, texts, jobs=1):
+    """
+    Replay texts against the rules, in worker processes if jobs is more than 1
+
+    Args:
+        patterns (list): Python regex patterns, in rule order, None for rules that are not replayed
+        texts (list): (text, normalized text, number of occurrences) tuples
+        jobs (int): Number of worker processes
+
+    Returns:
+        dict: Summed result of profile_task
+    """
+
+    tasks = [texts[start:start + TASK_TEXTS] for start in range(0, len(texts), TASK_TEXTS)]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+            results = list(executor.map(profile_task, [patterns] * len(tasks), tasks))
+    else:
+        results = [profile_task(patterns, task) for task in tasks]
+
+    total = profile_task(patterns, [])
+    for result in results:
+        for key in ('matches', 'hits', 'at_start', 'time'):
+            total[key] = [a + b for a, b in zip(total[key], result[key])]
+        total['worst'] = [max(a, b, key=lambda worst: worst[0]) for a, b in zip(total['worst'], result['worst'])]
+        total['taken'].update(result['taken'])
+        for key in ('translated', 'untranslated', 'untranslated_time'):
+            total[key] += result[key]
+    return total
+
+def as_repeat(op, av):
+    """
+    Unwrap groups around a repeat of a parsed regex
+
+    Args:
+        op: Parsed regex operator
+        av: Operator arguments
+
+    Returns:
+        tuple: (min, max, body items), None if the item is not a repeat
+    """
+
+    while op == regex_parser.SUBPATTERN and len(av[-1]) == 1:
+        op, av = av[-1][0]
+    if op in (regex_parser.MAX_REPEAT, regex_parser.MIN_REPEAT):
+        return av
+    return None
+
+def char_class(items):
+    """
+    Build a Python regex matching the same single character as parsed regex items
+
+    Args:
+        items (list): Parsed regex items
+
+    Returns:
+        str: Regex for one character, None if the items do not match exactly one character
+    """
+
+    while len(items) == 1 and items[0][0] == regex_parser.SUBPATTERN:
+        items = items[0][1][-1]
+    if len(items) != 1:
+        return None
+
+    op, av = items[0]
+    if op == regex_parser.LITERAL:
+        return re.escape(chr(av))
+    if op == regex_parser.NOT_LITERAL:
+        return f'[^{re.escape(chr(av))}]'
+    if op == regex_parser.ANY:
+        return '.'
+    if op != regex_parser.IN:
+        return None
+
+    parts = []
+    for item_op, item_av in av:
+        if item_op == regex_parser.NEGATE:
+            parts.append('^')
+        elif item_op == regex_parser.LITERAL:
+            parts.append(re.escape(chr(item_av)))
+        elif item_op == regex_parser.RANGE:
+            parts.append(f'{re.escape(chr(item_av[0]))}-{re.escape(chr(item_av[1]))}')
+        elif item_op == regex_parser.CATEGORY and item_av in CATEGORY_CLASSES:
+            parts.append(CATEGORY_CLASSES[item_av])
+        else:
+            return None
+    return f"[{''.join(parts)}]"
+
+def find_backtracking(pattern):
+    """
+    Find regex constructs prone to catastrophic backtracking
+
+    - 'nested': a repeated group whose other items are optional or overlap an unbounded repeat
+      inside it, such as (a+)+, (\\w+\\s?)* or (.+,)+, a failing match tries every split
+    - 'alternation': a repeated alternation whose branches match the same text, such as (a|aa)+
+    - 'adjacent': two unbounded repeats of overlapping characters in a row, such as .*.* or \\w+\\d+
+
+    Characters are compared on PROBE_CHARS and the characters of the pattern. The pattern is parsed
+    with regex_parser, which must not be None.
+
+    Args:
+        pattern (str): Python regex
+
+    Returns:
+        set: Keys of BACKTRACKING_RISKS
+    """
+
+    try:
+        tree = regex_parser.parse(pattern)
+    except re.error:
+        return set()
+
+    candidates = PROBE_CHARS + ''.join(set(pattern))
+    char_sets = {}
+    def chars_of(items):
+        source = char_class(items)
+        if source is None:
+            return None
+        if source not in char_sets:
+            regex = re.compile(source)
+            char_sets[source] = frozenset(char for char in candidates if regex.fullmatch(char))
+        return char_sets[source]
+
+    risks = set()
+    def check_sequence(items):
+        # An unbounded repeat is ambiguous when every other required item can match its characters
+        for index, (op, av) in enumerate(items):
+            repeat = as_repeat(op, av)
+            if repeat is None or repeat[1] != regex_parser.MAXREPEAT:
+                continue
+            chars = chars_of(repeat[2])
+            ambiguous = True
+            for other_index, (other_op, other_av) in enumerate(items):
+                other_repeat = as_repeat(other_op, other_av)
+                if other_index == index or (other_repeat is not None and other_repeat[0] == 0):
+                    continue
+                other_chars = chars_of(other_repeat[2] if other_repeat is not None else [(other_op, other_av)])
+                if chars is None or other_chars is None or not chars & other_chars:
+                    ambiguous = False
+                    break
+            if ambiguous:
+                risks.add('nested')
+                return
+
+    def check_repeated(items):
+        while len(items) == 1 and items[0][0] == regex_parser.SUBPATTERN:
+            items = items[0][1][-1]
+        if len(items) == 0 or items[-1][0] != regex_parser.BRANCH:
+            check_sequence(items)
+            return
+
+        # The parser moves a prefix shared by all branches in front of them, (a|aa) becomes a(?:|a)
+        prefix = [items[index] for index in range(len(items) - 1)]
+        if any(chars_of([item]) is None for item in prefix):
+            check_sequence(items)
+            return
+        branches = [prefix + list(branch) for branch in items[-1][1][1]]
+        for branch in branches:
+            check_sequence(branch)
+        # Branches made of single characters are ambiguous when one matches the other, or repeats of it
+        sequences = [[chars_of([item]) for item in branch] for branch in branches]
+        sequences = [sequence for sequence in sequences if sequence and None not in sequence]
+        for index, short in enumerate(sequences):
+            for long in sequences[index + 1:]:
+                if len(short) > len(long):
+                    short, long = long, short
+                if len(long) % len(short) == 0 and all(
+                        long[position] & short[position % len(short)] for position in range(len(long))):
+                    risks.add('alternation')
+
+    def walk(items):
+        previous = None
+        for op, av in items:
+            repeat = as_repeat(op, av)
+            if repeat is not None:
+                low, high, body = repeat
+                if high == regex_parser.MAXREPEAT:
+                    chars = chars_of(body)
+                    if previous is not None and chars is not None and previous & chars:
+                        risks.add('adjacent')
+                    check_repeated(body)
+                    previous = chars
+                elif low > 0:
+                    previous = None
+                walk(body)
+                continue
+
+            previous = None
+            if op == regex_parser.SUBPATTERN:
+                walk(av[-1])
+            elif op == regex_parser.BRANCH:
+                for branch in av[1]:
+                    walk(branch)
+            elif op in (regex_parser.ASSERT, regex_parser.ASSERT_NOT):
+                walk(av[1])
+            elif op == regex_parser.GROUPREF_EXISTS:
+                for branch in av[1:]:
+                    if branch is not None:
+                        walk(branch)
+
+    walk(tree)
+    return risks
+
+def is_start_anchored(tree):
+    """
+    Check whether a parsed regex only matches at the start of the text
+
+    Args:
+        tree (list): Parsed regex items
+
+    Returns:
+        bool: True if the regex starts with ^ or \\A outside of an alternation
+    """
+
+    while len(tree) > 0 and tree[0][0] == regex_parser.SUBPATTERN:
+        tree = tree[0][1][-1]
+    return len(tree) > 0 and tree[0][0] == regex_parser.AT and tree[0][1] in (
+        regex_parser.AT_BEGINNING, regex_parser.AT_BEGINNING_STRING)
+
+def has_top_level_alternation(pattern):
+    """
+    Check whether a regex is an alternation at the top level, such as a|b
+
+    The parse tree cannot tell, re's parser turns a|b into a character class and factors the
+    common prefix out of the branches.
+
+    Args:
+        pattern (str): .NET regex
+
+    Returns:
+        bool: True if an anchor added in front would only apply to the first branch
+    """
+
+    depth = 0
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\':
+            index += 1
+        elif char == '[':
+            # Skip the class, a ] right after [ or [^ is a literal
+            index += 2 if pattern.startswith('^', index + 1) else 1
+            index += 1 if pattern.startswith(']', index) else 0
+            while index < len(pattern) and pattern[index] != ']':
+                index += 2 if pattern[index] == '\\' else 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+        index += 1
+    return False
+
+def literal_prefix(pattern):
+    """
+    Get the literal text at the start of a .NET pattern, after a ^ anchor
+
+    Args:
+        pattern (str): .NET regex
+
+    Returns:
+        str: Literal prefix, empty if the pattern does not start with literal text
+    """
+
+    start = 1 if pattern.startswith('^') else 0
+    end = start
+    while end < len(pattern) and pattern[end] not in REGEX_METACHARACTERS:
+        end += 1
+    if end < len(pattern) and pattern[end] in '?*+{':
+        # The last character belongs to the quantifier
+        end -= 1
+    return pattern[start:max(end, start)]
+
+def suggest_anchor(rule, tree):
+    """
+    Suggest anchoring a rule at the start of the text
+
+    An unanchored regex is tried at every position of every untranslated text, an anchored one
+    fails after the first position. A rule qualifies when it starts with .* or .+, which can only
+    match from the start anyway, or when all of its replayed matches started at the start.
+
+    Args:
+        rule (dict): Profiled rule
+        tree (list): Parsed Python regex of the rule
+
+    Returns:
+        str: Suggested pattern, None if anchoring does not apply
+    """
+
+    if is_start_anchored(tree) or len(tree) == 0:
+        return None
+    first = tree[0]
+    repeat = as_repeat(*first)
+    leading_wildcard = (repeat is not None and repeat[0] <= 1 and repeat[1] == regex_parser.MAXREPEAT
+                        and len(repeat[2]) == 1 and repeat[2][0][0] == regex_parser.ANY)
+    if not leading_wildcard and not (rule['matches'] and rule['at_start'] == rule['matches']):
+        return None
+    if has_top_level_alternation(rule['pattern']):
+        return f"^(?:{rule['pattern']})"
+    return f"^{rule['pattern']}"
+
+def suggest_merges(rules):
+    """
+    Find consecutive anchored rules with the same translation that can share one alternation
+
+    Merging keeps the lookup order only for rules next to each other and anchored at the start,
+    and only when the template does not use numbered groups, which are renumbered by the merge.
+    .NET allows the same group name in several branches, so named groups are kept.
+
+    Args:
+        rules (list): Rules in load order
+
+    Returns:
+        list: (list of merged rules, merged pattern) tuples
+    """
+
+    merges = []
+    run = []
+    def flush():
+        if len(run) > 1:
+            prefixes = [literal_prefix(rule['pattern']) for rule in run]
+            common = os.path.commonprefix(prefixes)
+            branches = '|'.join(rule['pattern'][1 + len(common):] for rule in run)
+            merges.append((list(run), f"^{common}(?:{branches})"))
+        run.clear()
+
+    for rule in rules:
+        tree = rule.get('tree')
+        mergeable = (tree is not None and rule['pattern'].startswith('^')
+                     and not has_top_level_alternation(rule['pattern'])
+                     and not re.search(r'(?<!\\)\$\{?\d', rule['template']))
+        if not mergeable or (run and rule['template'] != run[-1]['template']):
+            flush()
+        if mergeable:
+            run.append(rule)
+    flush()
+    return merges
+
+def describe_rule(rule):
+    """
+    Describe a rule in one report line
+
+    Args:
+        rule (dict): Rule
+
+    Returns:
+        str: Source and shortened pattern
+    """
+
+    return f"{rule['source']}  {shorten(rule['pattern'], 60)}"
+
+def pop_option(args, name, default=None):
+    """
+    Remove an option with a value from the argument list
+
+    Supports both "--name value" and "--name=value"
+
+    Args:
+        args (list): Argument list, modified in place
+        name (str): Option name
+        default (str): Value returned when the option is not present
+
+    Returns:
+        str: Option value, None if the option has no value
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """Print command line usage"""
+
+    print("Regex Translation Rule Profiler")
+    print("Replay untranslated text dumps against the $ regex translations in the plugin's lookup order")
+    print()
+    print("Usage:")
+    print("  python script.py <translation_folder|file.txt|file.zip> <dump_folder|dump.txt> [--jobs N] [--top N] [--output report.json]")
+    print()
+    print("Examples:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/Text ./BepInEx/JustAnotherTranslator/Dump")
+    print("  python script.py ./Text 2026-10-17-20-00_untranslate.txt --top 0 --output rules.json")
+    print()
+    print("Parameters:")
+    print("  translation_folder: Folder with the .txt and .zip translation files, loaded in the plugin's order")
+    print("  dump_folder: Folder searched recursively for *_untranslate.txt dumps, one text per line")
+    print("  --jobs N: (optional) Replay in N worker processes, 0 uses all CPU cores (defaults to 0)")
+    print("  --top N: (optional) Number of rules listed per section, 0 lists all (defaults to 10)")
+    print("  --output report.json: (optional) Write the statistics of every rule to a JSON file")
+    print()
+    print("Notes:")
+    print("  - Patterns are matched with Python re after rewriting .NET-only syntax, compare times")
+    print("    between rules rather than with the game")
+    print("  - Texts with an exact translation are skipped, like the plugin does before trying the rules")
+    if regex_parser is None:
+        print("  - The backtracking, anchor and merge analysis is not available in this Python version,")
+        print("    its regex parser (re._parser or sre_parse) cannot be used; rules are only replayed and timed")
+    print()
+
+def main():
+    """Main function to handle command line arguments"""
+
+    args = sys.argv.copy()
+    if len(args) < 3 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    jobs = pop_option(args, "--jobs", "0")
+    if jobs is None or not jobs.isdigit():
+        print("Error: --jobs requires a non-negative integer")
+        return 2
+    jobs = int(jobs) or os.cpu_count() or 1
+
+    top = pop_option(args, "--top", str(REPORT_TOP_RULES))
+    if top is None or not top.isdigit():
+        print("Error: --top requires a non-negative integer")
+        return 2
+    top = int(top) or None
+
+    output_file = pop_option(args, "--output")
+    if "--output" in sys.argv and output_file is None:
+        print("Error: --output requires a file path")
+        return 2
+
+    input_path = Path(args[1])
+    corpus_path = Path(args[2])
+    for path in (input_path, corpus_path):
+        if not path.exists():
+            print(f"Error: Path {path} does not exist")
+            return 2
+
+    start_time = time.perf_counter()
+    translations, rules, file_count = load_translations(input_path)
+    print(f"Loaded {len(rules):,} regex rules and {len(translations):,} exact translations from {file_count} files")
+    if regex_parser is None:
+        print("⚠ Regex analysis is not available in this Python version, rules are only replayed and timed")
+    if not rules:
+        print("No $ regex translations found")
+        return 0
+
+    for rule in rules:
+        try:
+            python_pattern = dotnet_regex_to_python(rule['pattern'])
+            re.compile(python_pattern)
+            rule['python_pattern'] = python_pattern
+            rule['tree'] = regex_parser.parse(python_pattern) if regex_parser is not None else None
+            rule['risks'] = find_backtracking(python_pattern) if regex_parser is not None else set()
+        except re.error as e:
+            rule['error'] = str(e)
+    checked_rules = [rule for rule in rules if 'error' not in rule]
+
+    texts, dump_count = load_corpus(corpus_path)
+    skipped = dict.fromkeys(SKIP_REASONS, 0)
+    replay = []
+    for text, count in texts.items():
+        if text.isspace():
+            continue
+        normalized = normalize_text(text)
+        reason = skip_reason(text, normalized, translations)
+        if reason is None:
+            replay.append((text, normalized, count))
+        else:
+            skipped[reason] += count
+    print(f"Replaying {sum(count for _, _, count in replay):,} texts ({len(replay):,} unique) from {dump_count} dump files"
+          + (f" in {jobs} worker processes..." if jobs > 1 else "..."))
+    if any(skipped.values()):
+        print(f"  Skipped before the regex rules: {', '.join(f'{count} {SKIP_REASONS[reason]}' for reason, count in skipped.items() if count)}")
+
+    # Without the analysis any rule may backtrack without end, so all of them are replayed alone first
+    risky_rules = ([rule for rule in checked_rules if rule['risks'] & {'nested', 'alternation'}]
+                   if regex_parser is not None else checked_rules)
+    if risky_rules and replay:
+        print(f"  Replaying {len(risky_rules)} rules " + ("prone to exponential backtracking " if regex_parser is not None else "")
+              + "alone first...")
+        for index in probe_rules([rule['python_pattern'] for rule in risky_rules], replay, jobs):
+            risky_rules[index]['risks'].add('timeout')
+
+    timed_out_rules = [rule for rule in risky_rules if 'timeout' in rule['risks']]
+    result = profile_rules([rule['python_pattern'] if 'timeout' not in rule['risks'] else None
+                            for rule in checked_rules], replay, jobs)
+    taken_by = {}
+    for (index, winner), count in result['taken'].items():
+        taken_by.setdefault(index, Counter())[checked_rules[winner]['source']] += count
+    for index, rule in enumerate(checked_rules):
+        rule['matches'] = result['matches'][index]
+        rule['hits'] = result['hits'][index]
+        rule['at_start'] = result['at_start'][index]
+        rule['time'] = result['time'][index]
+        rule['worst_time'], rule['worst_text'] = result['worst'][index]
+        rule['taken_by'] = taken_by.get(index, Counter())
+        if rule['worst_time'] > SLOW_MATCH_SECONDS:
+            rule['risks'].add('slow')
+        rule['anchor'] = suggest_anchor(rule, rule['tree']) if rule['tree'] is not None else None
+
+    # Identical patterns are separate rules in the plugin, only the first one can ever translate
+    first_rule = {}
+    for rule in checked_rules:
+        rule['duplicate_of'] = first_rule.setdefault(rule['pattern'], rule)['source']
+        if rule['duplicate_of'] == rule['source']:
+            rule['duplicate_of'] = None
+
+    total_time = sum(rule['time'] for rule in checked_rules)
+    print("-" * 50)
+    print(f"Regex time: {total_time:.3f} s for {result['translated'] + result['untranslated']:,} texts, "
+          f"{result['translated']:,} translated by a rule, {result['untranslated']:,} untranslated")
+    if result['untranslated']:
+        print(f"  Each untranslated text tries all {len(checked_rules) - len(timed_out_rules):,} replayed rules: "
+              f"{result['untranslated_time'] / result['untranslated'] * 1000:.3f} ms per text")
+
+    def print_section(title, section_rules, describe):
+        if not section_rules:
+            return
+        print()
+        print(f"{title} ({len(section_rules)} rules):")
+        for rule in section_rules[:top]:
+            print(f"  {describe_rule(rule)}")
+            detail = describe(rule)
+            if detail:
+                print(f"      {detail}")
+        if top is not None and len(section_rules) > top:
+            print(f"  ... {len(section_rules) - top} more")
+
+    print_section("Slowest rules, time spent in the plugin's lookup order",
+                  sorted((rule for rule in checked_rules if rule['time'] > 0), key=lambda rule: -rule['time']),
+                  lambda rule: f"{rule['time']:.3f} s, {rule['hits']:,} translated, worst match {rule['worst_time'] * 1000:.3f} ms")
+    print_section("Never matched",
+                  [rule for rule in checked_rules
+                   if not rule['matches'] and not rule['duplicate_of'] and 'timeout' not in rule['risks']],
+                  lambda rule: None)
+    print_section("Shadowed, every match is translated by an earlier rule",
+                  [rule for rule in checked_rules if (rule['matches'] and not rule['hits']) or rule['duplicate_of']],
+                  lambda rule: (f"same pattern as {rule['duplicate_of']}" if rule['duplicate_of'] else
+                                f"{rule['matches']:,} matches taken by {rule['taken_by'].most_common(1)[0][0]}"))
+    print_section("Backtracking risks",
+                  sorted((rule for rule in checked_rules if rule['risks']), key=lambda rule: -rule['worst_time']),
+                  lambda rule: ', '.join(BACKTRACKING_RISKS[risk] for risk in BACKTRACKING_RISKS if risk in rule['risks'])
+                  + (f"; worst match {rule['worst_time'] * 1000:.3f} ms on \"{shorten(rule['worst_text'])}\""
+                     if rule['worst_text'] is not None else ""))
+    print_section("Anchor at the start of the text, so a miss fails after the first position",
+                  [rule for rule in checked_rules if rule['anchor']],
+                  lambda rule: rule['anchor'])
+    print_section("Not profiled, Python re cannot compile the pattern",
+                  [rule for rule in rules if 'error' in rule],
+                  lambda rule: rule['error'])
+
+    merges = suggest_merges(checked_rules)
+    if merges:
+        print()
+        print(f"Merge consecutive rules with the same translation into one alternation ({len(merges)} groups):")
+        for merged_rules, pattern in merges[:top]:
+            print(f"  {merged_rules[0]['source']} .. {merged_rules[-1]['source']}: {len(merged_rules)} rules")
+            print(f"      {shorten(pattern, 100)}")
+        if top is not None and len(merges) > top:
+            print(f"  ... {len(merges) - top} more")
+
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as outfile:
+            json.dump({
+                'texts': result['translated'] + result['untranslated'],
+                'translated': result['translated'],
+                'untranslated': result['untranslated'],
+                'skipped': skipped,
+                'total_time': total_time,
+                'rules': [{
+                    'source': rule['source'],
+                    'pattern': rule['pattern'],
+                    'template': rule['template'],
+                    **({'error': rule['error']} if 'error' in rule else {
+                        'matches': rule['matches'],
+                        'hits': rule['hits'],
+                        'time': rule['time'],
+                        'worst_time': rule['worst_time'],
+                        'worst_text': rule['worst_text'],
+                        'shadowed_by': dict(rule['taken_by']),
+                        'duplicate_of': rule['duplicate_of'],
+                        'risks': sorted(rule['risks']),
+                        'anchor': rule['anchor']
+                    })
+                } for rule in rules],
+                'merges': [{'sources': [rule['source'] for rule in merged_rules], 'pattern': pattern}
+                           for merged_rules, pattern in merges]
+            }, outfile, ensure_ascii=False, indent=2)
+        print()
+        print(f"Report written to {output_file}")
+
+    print("-" * 50)
+    print(f"Done in {time.perf_counter() - start_time:.2f} s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
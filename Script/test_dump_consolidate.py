@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Tests of the untranslated dump consolidators
+# Creation date: 2026-10-18
+# Version: 2026-10-18_1
+# License: BSD-3
+
+import contextlib
+import csv
+import importlib
+import io
+import random
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# The English and Chinese scripts share their code, both are tested
+CONSOLIDATORS = [importlib.import_module(name) for name in ('dump_consolidate_English', 'dump_consolidate_Chinese')]
+
+def write_text(path, text, encoding='utf-8'):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding=encoding)
+
+def run(consolidator, *args):
+    """Run the consolidator with command line arguments, returning its exit code"""
+
+    with mock.patch.object(sys, 'argv', ['dump_consolidate', *map(str, args)]), \
+            contextlib.redirect_stdout(io.StringIO()):
+        return consolidator.main()
+
+def read_entries(text):
+    """Split untranslated.txt into (first seen, session count, line) entries, the comment line is localized"""
+
+    lines = text.split('\n')
+    assert lines.pop() == ''
+    return [(*re.fullmatch(r'; (\S+?)\D+(\d+)\D+', comment).groups(), line)
+            for comment, line in zip(lines[::2], lines[1::2])]
+
+def make_dumps(folder):
+    """Write text and term dumps of three sessions and the translations of some of their texts"""
+
+    dumps = folder / 'Dump'
+    write_text(dumps / '2026-10-01-10-00_untranslate.txt', "seen thrice\nseen once\nHP100\nexact\n")
+    write_text(dumps / '2026-10-02-10-00_untranslate.txt', "seen thrice\nseen twice\n;comment-like\n")
+    write_text(dumps / 'old' / '2026-09-30-10-00_untranslate.txt',
+               "seen thrice\nseen twice\n  normalized me  \ntab\\in\ttext\n$dollar\n")
+    write_text(dumps / '2026-10-02-10-00_untranslate_term.csv',
+               "Term,Original,Translation\nUI/a,later original,\nUI/b,b,\n\"UI/c,quoted\",\"multi\nline\",\n",
+               encoding='utf-8-sig')
+    write_text(dumps / '2026-10-01-10-00_untranslate_term.csv',
+               "Term,Original,Translation\nUI/a,first original,\nUI/done,x,\n", encoding='utf-8-sig')
+
+    write_text(folder / 'Text' / 'a.txt', "exact\tExact\nNORMALIZED ME\tNormalized\n$^HP(\\d+)\tHP $1\n")
+    write_text(folder / 'UI' / 'a.csv', "Term,Original,Translation\nUI/done,x,Done\n")
+
+class ExternalSortTest(unittest.TestCase):
+    def test_runs_on_disk_give_the_in_memory_result(self):
+        generator = random.Random(17)
+        records = [[f"text {generator.randint(0, 300)}", f"2026-10-{generator.randint(1, 28):02d}-00-00",
+                    1, f"original {index}"] for index in range(2000)]
+
+        def key(record):
+            return record[0]
+
+        for consolidator in CONSOLIDATORS:
+            with self.subTest(consolidator=consolidator.__name__), tempfile.TemporaryDirectory() as temp_dir:
+                expected = list(consolidator.external_sort([list(record) for record in records], key, 1 << 30,
+                                                           Path(temp_dir), combine=True))
+                stats = {}
+                with mock.patch.object(consolidator, 'MERGE_FAN_IN', 3):
+                    result = list(consolidator.external_sort([list(record) for record in records], key, 4000,
+                                                             Path(temp_dir), combine=True, stats=stats))
+                self.assertGreater(stats['runs'], 3)
+                self.assertEqual(result, expected)
+                self.assertEqual(list(Path(temp_dir).iterdir()), [])
+
+                # Each text keeps its first-seen session, the original seen then, and its total count
+                first = {}
+                for text, seen, _, original in records:
+                    if text not in first or seen < first[text][0]:
+                        first[text] = (seen, original)
+                counts = {}
+                for record in records:
+                    counts[record[0]] = counts.get(record[0], 0) + 1
+                self.assertEqual(result, [[text, *first[text][:1], counts[text], first[text][1]] for text in sorted(first)])
+
+class MainTest(unittest.TestCase):
+    def consolidate(self, consolidator, folder, *options):
+        output = folder / 'Out'
+        self.assertEqual(run(consolidator, folder / 'Dump', output, '--text', folder / 'Text',
+                             '--ui', folder / 'UI', *options), 0)
+        with open(output / 'untranslated_term.csv', encoding='utf-8-sig', newline='') as infile:
+            return (output / 'untranslated.txt').read_text(encoding='utf-8'), list(csv.reader(infile))
+
+    def test_outputs(self):
+        for consolidator in CONSOLIDATORS:
+            with self.subTest(consolidator=consolidator.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder)
+                make_dumps(folder)
+                text, terms = self.consolidate(consolidator, folder)
+
+                # Ordered by session count, then first-seen session; translated and ;/$ texts are left out
+                self.assertEqual(read_entries(text), [
+                    ('2026-09-30-10-00', '3', 'seen thrice\t'),
+                    ('2026-09-30-10-00', '2', 'seen twice\t'),
+                    ('2026-09-30-10-00', '1', 'tab\\\\in\\ttext\t'),
+                    ('2026-10-01-10-00', '1', 'seen once\t')
+                ])
+                self.assertEqual(terms, [
+                    ['Term', 'Original', 'Translation', 'FirstSeen', 'Sessions'],
+                    ['UI/a', 'first original', '', '2026-10-01-10-00', '2'],
+                    ['UI/b', 'b', '', '2026-10-02-10-00', '1'],
+                    ['UI/c,quoted', 'multi\nline', '', '2026-10-02-10-00', '1']
+                ])
+
+    def test_outputs_sorted_on_disk(self):
+        for consolidator in CONSOLIDATORS:
+            with self.subTest(consolidator=consolidator.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder)
+                make_dumps(folder)
+                expected = self.consolidate(consolidator, folder)
+                # Every record fills the 1 MB budget, so each one becomes a run
+                with mock.patch.object(consolidator, 'RECORD_OVERHEAD', 1024 * 1024), \
+                        mock.patch.object(consolidator, 'MERGE_FAN_IN', 2):
+                    self.assertEqual(self.consolidate(consolidator, folder, '--memory', '1',
+                                                      '--temp', folder / 'Temp'), expected)
+                self.assertEqual(list((folder / 'Temp').iterdir()), [])
+
+if __name__ == '__main__':
+    unittest.main()
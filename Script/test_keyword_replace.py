@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Tests of the keyword replacement tools
+# Creation date: 2026-10-18
+# Version: 2026-10-18_1
+# License: BSD-3
+
+import contextlib
+import importlib
+import io
+import json
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# The English and Chinese scripts share their code, both are tested
+REPLACERS = [importlib.import_module(name) for name in ('keyword_replace_English', 'keyword_replace_Chinese')]
+
+# Few characters, so keywords often contain, overlap and follow each other
+ALPHABET = 'abcé\U0001f600'
+
+def random_text(generator, max_length):
+    return ''.join(generator.choice(ALPHABET) for _ in range(generator.randint(0, max_length)))
+
+def random_keywords(generator, count):
+    """Keyword dictionary in random order, with an empty key the plugin ignores"""
+
+    keywords = {'': 'never'}
+    while len(keywords) < count + 1:
+        keywords[random_text(generator, 6) or 'a'] = random_text(generator, 4)
+    return keywords
+
+def write_keywords(path, keywords):
+    path.write_text(json.dumps(keywords, ensure_ascii=False), encoding='utf-8')
+
+def run(replacer, *args):
+    """Run the replacer with command line arguments, returning its exit code"""
+
+    with mock.patch.object(sys, 'argv', ['keyword_replace', *map(str, args)]), \
+            contextlib.redirect_stdout(io.StringIO()):
+        return replacer.main()
+
+class ReplaceTextTest(unittest.TestCase):
+    def test_automaton_gives_the_regex_result(self):
+        # Dictionaries below and above AUTOMATON_MIN_KEYWORDS, where --apply switches to the automaton
+        for replacer in REPLACERS:
+            with self.subTest(replacer=replacer.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                keyword_file = Path(temp_folder) / 'KeywordReplaceText.json'
+                generator = random.Random(19)
+                for count in (1, 8, 40, replacer.AUTOMATON_MIN_KEYWORDS + 50):
+                    write_keywords(keyword_file, random_keywords(generator, count))
+                    keywords, keyword_regex = replacer.load_keywords(keyword_file)
+                    automaton = replacer.build_automaton(keywords)
+                    for _ in range(300):
+                        text = random_text(generator, 40)
+                        self.assertEqual(replacer.replace_text(automaton, text),
+                                         replacer.replace_text_regex(text, keywords, keyword_regex), repr(text))
+
+    def test_lean_keywords_give_the_same_result(self):
+        for replacer in REPLACERS:
+            with self.subTest(replacer=replacer.__name__):
+                generator = random.Random(23)
+                for _ in range(20):
+                    keywords = random_keywords(generator, 30)
+                    report = replacer.analyze_keywords(list(keywords.items()))
+                    self.assertEqual(report['empty'], [''])
+                    removed = set(report['removable']) | set(report['empty'])
+                    lean = {key: value for key, value in keywords.items() if key not in removed}
+                    full_automaton = replacer.build_automaton(keywords)
+                    lean_automaton = replacer.build_automaton(lean)
+                    for _ in range(200):
+                        text = random_text(generator, 30)
+                        self.assertEqual(replacer.replace_text(lean_automaton, text)[0],
+                                         replacer.replace_text(full_automaton, text)[0], repr(text))
+
+    def test_analyze_keywords(self):
+        pairs = [('ab', 'X'), ('a', '1'), ('b', '2'), ('abc', 'Y'), ('cd', 'Z'), ('ab', 'x'), ('', 'e'),
+                 ('a1', 'unused'), ('y', '8'), ('z', '9'), ('yz', '89')]
+        for replacer in REPLACERS:
+            with self.subTest(replacer=replacer.__name__):
+                report = replacer.analyze_keywords(pairs)
+                # The last value wins, like JsonConvert
+                self.assertEqual(report['keywords']['ab'], 'x')
+                self.assertEqual(report['duplicates'], ['ab'])
+                self.assertEqual(report['empty'], [''])
+                self.assertEqual([item[:2] for item in report['contained']], [('ab', 'a'), ('a1', 'a'), ('yz', 'y'),
+                                                                               ('abc', 'ab')])
+                # cd starts inside abc and continues past it, so abc must stay
+                self.assertEqual(report['overlaps'], [('abc', 'cd', 1)])
+                # y and z already give yz its replacement
+                self.assertEqual(report['removable'], ['yz'])
+
+class ApplyTest(unittest.TestCase):
+    def test_automaton_and_regex_write_the_same_files(self):
+        for replacer in REPLACERS:
+            with self.subTest(replacer=replacer.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder)
+                keyword_file = folder / 'KeywordReplaceText.json'
+                write_keywords(keyword_file, {'Bob': 'Robert', 'Bo': 'X', 'cat': 'dog'})
+                (folder / 'Text' / 'sub').mkdir(parents=True)
+                (folder / 'Text' / 'a.txt').write_bytes(
+                    '\ufeffBob\tBob and Bo\r\n;Bob\tcomment\n$^Bob(\\d+)\tBob $1\nBob dump line\ncat\tcatBob'.encode('utf-8'))
+                (folder / 'Text' / 'sub' / 'b.txt').write_bytes(b'no keyword\tnothing\n')
+
+                outputs = []
+                for threshold in (0, 10 ** 6):
+                    with mock.patch.object(replacer, 'AUTOMATON_MIN_KEYWORDS', threshold):
+                        output = folder / f"Out{threshold}"
+                        self.assertEqual(run(replacer, keyword_file, '--apply', folder / 'Text', '--output', output), 0)
+                        outputs.append({path.relative_to(output).as_posix(): path.read_bytes()
+                                        for path in output.rglob('*.txt')})
+                self.assertEqual(outputs[0], outputs[1])
+                # Only translations and dump lines change, the byte order mark and line breaks are kept
+                self.assertEqual(outputs[0], {
+                    'a.txt': '\ufeffBob\tRobert and X\r\n;Bob\tcomment\n$^Bob(\\d+)\tBob $1\n'
+                             'Robert dump line\ncat\tdogRobert'.encode('utf-8'),
+                    'sub/b.txt': b'no keyword\tnothing\n'
+                })
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Tests of the lyric CSV converters
+# Creation date: 2026-10-17
+# Version: 2026-10-18_1
+# License: BSD-3
+
+import contextlib
+import csv
+import importlib
+import io
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# The English and Chinese scripts share their code, both are tested
+CONVERTERS = [importlib.import_module(name) for name in
+              ('lyric_csv_format_convert_English', 'lyric_csv_format_convert_Chinese')]
+
+def write_text(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+
+def read_lyric(path):
+    with open(path, 'r', encoding='utf-8-sig', newline='') as infile:
+        return list(csv.reader(infile))
+
+class KeepTranslationsTest(unittest.TestCase):
+    def convert_folder(self, converter, jobs):
+        """
+        Convert a folder whose two CSV files share one lyric.csv, keeping its translations
+
+        a.csv is converted first and replaces lyric.csv, b.csv must still be matched against the
+        lyric.csv that existed before the run.
+        """
+
+        with tempfile.TemporaryDirectory() as temp_folder:
+            folder = Path(temp_folder) / 'li' / 's'
+            write_text(folder / 'a.csv', "StartTime,EndTime,OriginalLyric\n1,2,x\n")
+            write_text(folder / 'b.csv', "StartTime,EndTime,OriginalLyric\n3,4,b\n5,6,c\n")
+            write_text(folder / 'lyric.csv', "StartTime,EndTime,OriginalLyric,TranslatedLyric\n3,4,b,BEE\n5,6,c,SEE\n")
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                converter.process_folder(Path(temp_folder) / 'li', jobs=jobs, keep_translations=True,
+                                         csv_files=[folder / 'a.csv', folder / 'b.csv'])
+            return read_lyric(folder / 'lyric.csv')
+
+    def test_folder_with_several_files(self):
+        for converter in CONVERTERS:
+            with self.subTest(converter=converter.__name__):
+                self.assertEqual(self.convert_folder(converter, jobs=1), [
+                    ['StartTime', 'EndTime', 'OriginalLyric', 'TranslatedLyric'],
+                    ['3', '4', 'b', 'BEE'],
+                    ['5', '6', 'c', 'SEE']
+                ])
+
+    def test_folder_with_several_files_in_parallel(self):
+        for converter in CONVERTERS:
+            with self.subTest(converter=converter.__name__):
+                self.assertEqual(self.convert_folder(converter, jobs=2)[1:], [['3', '4', 'b', 'BEE'], ['5', '6', 'c', 'SEE']])
+
+class NormalizeTimelineTest(unittest.TestCase):
+    # One line of each problem; 1.00000001 is 1.0 as a 32-bit float, so it starts with the first line
+    ROWS = [
+        ('5', '6', 'e', ''),
+        ('1', '2', 'a', 'A'),
+        ('4', '3', 'negative', ''),
+        ('2', '2', 'zero', ''),
+        ('1', '2', 'a', ''),
+        ('1.00000001', '1.5', 'b', 'B'),
+        ('3.5', '4.5', 'c', '')
+    ]
+
+    REPORT = {'unsorted': 3, 'negative': 1, 'zero_length': 1, 'duplicate': 1, 'overlap': 2, 'lines': 7}
+
+    def test_report_sorts_only(self):
+        for converter in CONVERTERS:
+            with self.subTest(converter=converter.__name__):
+                report = {}
+                rows = converter.normalize_lyric_rows(self.ROWS, report=report)
+                # Stable sort, lines with the same start time keep their file order
+                self.assertEqual(rows, [self.ROWS[index] for index in (1, 4, 5, 3, 6, 2, 0)])
+                self.assertEqual(report, {**self.REPORT, 'written': 7})
+
+    def test_fix(self):
+        for converter in CONVERTERS:
+            with self.subTest(converter=converter.__name__):
+                report = {}
+                rows = converter.normalize_lyric_rows(self.ROWS, fix=True, report=report)
+                # The counts do not depend on fixing
+                self.assertEqual(report, {**self.REPORT, 'written': 4})
+                self.assertEqual(rows, [
+                    ('1', '2', 'a\nb', 'A\nB'),
+                    ('3', '3.5', 'negative', ''),
+                    ('3.5', '4.5', 'c', ''),
+                    ('5', '6', 'e', '')
+                ])
+
+    def test_fixed_rows_have_no_problems(self):
+        generator = random.Random(12)
+        for converter in CONVERTERS:
+            with self.subTest(converter=converter.__name__):
+                for _ in range(200):
+                    rows = [(str(generator.randint(0, 8) / 2), str(generator.randint(0, 8) / 2),
+                             generator.choice('abc'), generator.choice(('', 'T'))) for _ in range(generator.randint(0, 12))]
+                    fixed = converter.normalize_lyric_rows(rows, fix=True)
+                    report = {}
+                    self.assertEqual(converter.normalize_lyric_rows(fixed, report=report), fixed, rows)
+                    self.assertEqual([report[issue] for issue in converter.TIMELINE_ISSUES],
+                                     [0] * len(converter.TIMELINE_ISSUES), rows)
+
+    def test_convert_with_fix(self):
+        for converter in CONVERTERS:
+            with self.subTest(converter=converter.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder)
+                write_text(folder / 'in.csv', "StartTime,EndTime,Lyric\n3,4,later\n1,3,first\n2,2.5,inside\n")
+                file_info = {}
+                with contextlib.redirect_stdout(io.StringIO()):
+                    record_count = converter.convert_lyric_csv(folder / 'in.csv', folder / 'lyric.csv', file_info,
+                                                               normalize='fix')
+                self.assertEqual(record_count, 3)
+                self.assertEqual(file_info['timeline']['overlap'], 1)
+                self.assertEqual(read_lyric(folder / 'lyric.csv'), [
+                    ['StartTime', 'EndTime', 'OriginalLyric', 'TranslatedLyric'],
+                    ['1', '2', 'first', ''],
+                    ['2', '2.5', 'inside', ''],
+                    ['3', '4', 'later', '']
+                ])
+
+if __name__ == '__main__':
+    unittest.main()
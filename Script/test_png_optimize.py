@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Tests of the PNG texture optimizers
+# Creation date: 2026-10-18
+# Version: 2026-10-18_1
+# License: BSD-3
+
+import contextlib
+import importlib
+import io
+import json
+import random
+import struct
+import sys
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# The English and Chinese scripts share their code, both are tested
+OPTIMIZERS = [importlib.import_module(name) for name in ('png_optimize_English', 'png_optimize_Chinese')]
+
+# Adam7 passes as (first column, first row, column step, row step)
+ADAM7_PASSES = ((0, 0, 8, 8), (4, 0, 8, 8), (0, 4, 4, 8), (2, 0, 4, 4), (0, 2, 2, 4), (1, 0, 2, 2), (0, 1, 1, 2))
+
+CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+def paeth(left, up, up_left):
+    estimate = left + up - up_left
+    distances = (abs(estimate - left), abs(estimate - up), abs(estimate - up_left))
+    return (left, up, up_left)[distances.index(min(distances))]
+
+def pass_sizes(width, height, bit_depth, color_type, interlace):
+    """(row bytes, rows) of each pass with pixels, the whole image when not interlaced"""
+
+    sizes = []
+    for first_column, first_row, column_step, row_step in ADAM7_PASSES if interlace else ((0, 0, 1, 1),):
+        columns = (width - first_column + column_step - 1) // column_step
+        rows = (height - first_row + row_step - 1) // row_step
+        if columns and rows:
+            sizes.append(((columns * CHANNELS[color_type] * bit_depth + 7) // 8, rows))
+    return sizes
+
+def chunk(chunk_type, data):
+    return struct.pack('>I4s', len(data), chunk_type) + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+def encode_png(generator, width, height, bit_depth, color_type, interlace=0, extra=()):
+    """
+    Encode random pixels with a random filter on each row, stored uncompressed over several IDAT chunks
+
+    Returns:
+        bytes: PNG file
+    """
+
+    bpp = max(1, CHANNELS[color_type] * bit_depth // 8)
+    scanlines = bytearray()
+    for row_bytes, rows in pass_sizes(width, height, bit_depth, color_type, interlace):
+        previous = bytes(row_bytes)
+        for _ in range(rows):
+            row = bytes(generator.randrange(256) for _ in range(row_bytes))
+            if color_type == 3 and bit_depth == 8:
+                # Indexes into the 4 color palette
+                row = bytes(value & 3 for value in row)
+            filter_type = generator.randrange(5)
+            filtered = bytearray(row_bytes)
+            for index in range(row_bytes):
+                left = row[index - bpp] if index >= bpp else 0
+                up = previous[index]
+                up_left = previous[index - bpp] if index >= bpp else 0
+                predictor = (0, left, up, (left + up) // 2, paeth(left, up, up_left))[filter_type]
+                filtered[index] = (row[index] - predictor) & 0xFF
+            scanlines += bytes((filter_type,)) + filtered
+            previous = row
+    stream = zlib.compress(bytes(scanlines), 0)
+    parts = [b'\x89PNG\r\n\x1a\n', chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, bit_depth, color_type, 0, 0, interlace))]
+    parts.extend(chunk(chunk_type, data) for chunk_type, data in extra)
+    if color_type == 3:
+        parts.append(chunk(b'PLTE', bytes(range(12))))
+        parts.append(chunk(b'tRNS', b'\x00\xff'))
+    parts.extend(chunk(b'IDAT', stream[offset:offset + 100]) for offset in range(0, len(stream), 100))
+    parts.append(chunk(b'IEND', b''))
+    return b''.join(parts)
+
+def decode_pixels(data):
+    """
+    Decode a PNG file to its unfiltered rows, independently of the optimizer
+
+    Returns:
+        tuple: (IHDR, PLTE and tRNS chunk data, list of the unfiltered rows of each pass)
+    """
+
+    chunks = []
+    offset = 8
+    while offset < len(data):
+        length, chunk_type = struct.unpack_from('>I4s', data, offset)
+        chunks.append((chunk_type, data[offset + 8:offset + 8 + length]))
+        offset += 12 + length
+    header = dict(chunks)[b'IHDR']
+    width, height, bit_depth, color_type, _, _, interlace = struct.unpack('>IIBBBBB', header)
+    bpp = max(1, CHANNELS[color_type] * bit_depth // 8)
+    scanlines = zlib.decompress(b''.join(chunk_data for chunk_type, chunk_data in chunks if chunk_type == b'IDAT'))
+
+    passes = []
+    position = 0
+    for row_bytes, rows in pass_sizes(width, height, bit_depth, color_type, interlace):
+        previous = bytes(row_bytes)
+        pass_rows = []
+        for _ in range(rows):
+            filter_type = scanlines[position]
+            row = bytearray(scanlines[position + 1:position + 1 + row_bytes])
+            position += 1 + row_bytes
+            for index in range(row_bytes):
+                left = row[index - bpp] if index >= bpp else 0
+                up = previous[index]
+                up_left = previous[index - bpp] if index >= bpp else 0
+                predictor = (0, left, up, (left + up) // 2, paeth(left, up, up_left))[filter_type]
+                row[index] = (row[index] + predictor) & 0xFF
+            pass_rows.append(bytes(row))
+            previous = row
+        passes.append(pass_rows)
+    assert position == len(scanlines)
+    kept = {chunk_type: chunk_data for chunk_type, chunk_data in chunks if chunk_type in (b'PLTE', b'tRNS')}
+    return header, kept, passes
+
+def make_images(seed):
+    """Images of every color type, sub-byte and 16-bit depths, interlaced or not, with ancillary chunks"""
+
+    generator = random.Random(seed)
+    extra = ((b'tEXt', b'Comment\x00made by a test'), (b'gAMA', struct.pack('>I', 45455)))
+    return {
+        'rgb.png': encode_png(generator, 23, 17, 8, 2, extra=extra),
+        'rgba_interlaced.png': encode_png(generator, 19, 13, 8, 6, interlace=1, extra=extra),
+        'gray16.png': encode_png(generator, 9, 11, 16, 0),
+        'gray1_interlaced.png': encode_png(generator, 13, 5, 1, 0, interlace=1),
+        'gray_alpha.png': encode_png(generator, 7, 7, 8, 4),
+        'palette.png': encode_png(generator, 15, 9, 8, 3, extra=extra),
+        'palette2.png': encode_png(generator, 31, 3, 2, 3)
+    }
+
+def run(optimizer, *args):
+    """Run the optimizer with command line arguments, returning its exit code and output"""
+
+    output = io.StringIO()
+    with mock.patch.object(sys, 'argv', ['png_optimize', *map(str, args)]), contextlib.redirect_stdout(output):
+        return optimizer.main(), output.getvalue()
+
+class OptimizePngTest(unittest.TestCase):
+    def test_pixels_identical(self):
+        for optimizer in OPTIMIZERS:
+            with self.subTest(optimizer=optimizer.__name__):
+                for name, data in make_images(20).items():
+                    optimized = optimizer.optimize_png(data)
+                    self.assertLess(len(optimized), len(data), name)
+                    self.assertEqual(decode_pixels(optimized), decode_pixels(data), name)
+                    chunk_types = [chunk_type for chunk_type, _ in optimizer.read_chunks(optimized)]
+                    self.assertNotIn(b'tEXt', chunk_types, name)
+                    self.assertNotIn(b'gAMA', chunk_types, name)
+
+                    kept = optimizer.optimize_png(data, keep=('tRNS', 'gAMA'))
+                    self.assertEqual(decode_pixels(kept), decode_pixels(data), name)
+                    if b'gAMA' in data:
+                        self.assertIn(b'gAMA', [chunk_type for chunk_type, _ in optimizer.read_chunks(kept)], name)
+
+    def test_animated_and_invalid_files(self):
+        for optimizer in OPTIMIZERS:
+            with self.subTest(optimizer=optimizer.__name__):
+                data = make_images(21)['rgb.png']
+                animated = data[:33] + chunk(b'acTL', struct.pack('>II', 1, 0)) + data[33:]
+                self.assertIsNone(optimizer.optimize_png(animated))
+
+                damaged = bytearray(data)
+                damaged[40] ^= 0xFF
+                with self.assertRaises(ValueError):
+                    optimizer.optimize_png(bytes(damaged))
+                # Drop the last IDAT chunk, the image data is then incomplete
+                idat = data.rfind(b'IDAT') - 4
+                with self.assertRaises(ValueError):
+                    optimizer.optimize_png(data[:idat] + chunk(b'IEND', b''))
+                with self.assertRaises(ValueError):
+                    optimizer.optimize_png(b'GIF89a')
+
+class MainTest(unittest.TestCase):
+    def test_rewrite_in_place(self):
+        for optimizer in OPTIMIZERS:
+            with self.subTest(optimizer=optimizer.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder)
+                images = make_images(22)
+                for name, data in images.items():
+                    path = folder / ('sub' if 'palette' in name else '') / name.replace('rgb', 'RGB')
+                    path.parent.mkdir(exist_ok=True)
+                    path.write_bytes(data)
+                (folder / 'broken.PNG').write_bytes(b'\x89PNG\r\n\x1a\nbroken')
+                files = {path: path.read_bytes() for path in folder.rglob('*') if path.is_file()}
+
+                exit_code, _ = run(optimizer, folder, '--jobs', '1', '--dry-run')
+                self.assertEqual(exit_code, 1)
+                self.assertEqual({path: path.read_bytes() for path in files}, files)
+                self.assertFalse((folder / optimizer.CACHE_NAME).exists())
+
+                exit_code, _ = run(optimizer, folder, '--jobs', '2')
+                self.assertEqual(exit_code, 1)
+                self.assertEqual((folder / 'broken.PNG').read_bytes(), files[folder / 'broken.PNG'])
+                for path, data in files.items():
+                    if path.name != 'broken.PNG':
+                        self.assertLess(path.stat().st_size, len(data), path.name)
+                        self.assertEqual(decode_pixels(path.read_bytes()), decode_pixels(data), path.name)
+
+                # Written files are in the cache and not read again by the next run
+                cache = json.loads((folder / optimizer.CACHE_NAME).read_text(encoding='utf-8'))
+                self.assertEqual(sorted(cache['files']), sorted(path.relative_to(folder).as_posix()
+                                                                for path in files if path.name != 'broken.PNG'))
+                (folder / 'broken.PNG').unlink()
+                with mock.patch.object(optimizer, 'optimize_png', side_effect=AssertionError):
+                    exit_code, _ = run(optimizer, folder, '--jobs', '1')
+                self.assertEqual(exit_code, 0)
+
+if __name__ == '__main__':
+    unittest.main()
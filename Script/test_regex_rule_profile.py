@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Tests of the regex rule profilers
+# Creation date: 2026-10-18
+# Version: 2026-10-18_1
+# License: BSD-3
+
+import contextlib
+import importlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# The English and Chinese scripts share their code, both are tested
+PROFILERS = [importlib.import_module(name) for name in ('regex_rule_profile_English', 'regex_rule_profile_Chinese')]
+
+# Rules of a translation folder without exponential rules, so the replay needs no probe timeout
+RULES = (
+    "$^HP(\\d+)\tHP $1\n"
+    "$^HP(\\d+)\tHP again $1\n"
+    "$^MP(\\d+)\tMP $1\n"
+    "$.*メイド(\\w+)\tMaid $1\n"
+    "$^夜伽(?<n>\\d+)\tNight\n"
+    "$^夜伽モード(?<n>\\d+)\tNight\n"
+    "$never_zzz\tnever\n"
+    "exact\tExact\n"
+)
+
+# Untranslated text dump, " hp3 " is only matched after normalization
+DUMP = "HP100\nHP100\n hp3 \nMP5\n新しいメイドさん\nexact\n[bracket]\n夜伽2\nnothing\n"
+
+def profile(profiler, folder):
+    """Run the profiler on the test folder and return its JSON report"""
+
+    write_text(folder / 'Text' / 'a.txt', RULES)
+    write_text(folder / 'Dump' / '2026-10-18-00-00_untranslate.txt', DUMP)
+    report_file = folder / 'report.json'
+    argv = ['regex_rule_profile', str(folder / 'Text'), str(folder / 'Dump'), '--jobs', '1',
+            '--output', str(report_file)]
+    with mock.patch.object(sys, 'argv', argv), contextlib.redirect_stdout(io.StringIO()):
+        exit_code = profiler.main()
+    assert exit_code == 0
+    with open(report_file, encoding='utf-8') as infile:
+        return json.load(infile)
+
+def write_text(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+
+class FindBacktrackingTest(unittest.TestCase):
+    def test_risks(self):
+        cases = {
+            '(a+)+b': {'nested'},
+            '(\\w+\\s?)*!': {'nested'},
+            '(.+,)+x': {'nested'},
+            '(a|aa)+c': {'alternation'},
+            '.*.*x': {'adjacent'},
+            '^第(\\d+)話$': set(),
+            '^(\\d+),(\\d+)$': set(),
+            '(ab|cd)+': set()
+        }
+        for profiler in PROFILERS:
+            with self.subTest(profiler=profiler.__name__):
+                for pattern, expected in cases.items():
+                    self.assertEqual(profiler.find_backtracking(pattern), expected, pattern)
+
+class ProfileTaskTest(unittest.TestCase):
+    def test_first_match_translates(self):
+        patterns = ['^HP(\\d+)', '^HP(\\d+)', 'x*', '^MP', None]
+        texts = [('HP1', 'HP1', 2), (' hp2 ', 'HP2', 1), ('zzz', 'ZZZ', 1)]
+        for profiler in PROFILERS:
+            with self.subTest(profiler=profiler.__name__):
+                result = profiler.profile_task(patterns, texts)
+                # An empty match does not translate, like the plugin checking the replaced text
+                self.assertEqual(result['matches'], [3, 3, 0, 0, 0])
+                self.assertEqual(result['hits'], [3, 0, 0, 0, 0])
+                self.assertEqual(result['at_start'], [3, 3, 0, 0, 0])
+                self.assertEqual(dict(result['taken']), {(1, 0): 3})
+                self.assertEqual((result['translated'], result['untranslated']), (3, 1))
+
+class SuggestTest(unittest.TestCase):
+    def make_rule(self, profiler, pattern, template='T', matches=1, at_start=1):
+        tree = profiler.regex_parser.parse(profiler.dotnet_regex_to_python(pattern))
+        return {'source': pattern, 'pattern': pattern, 'template': template, 'tree': tree,
+                'matches': matches, 'at_start': at_start}
+
+    def test_suggest_anchor(self):
+        for profiler in PROFILERS:
+            with self.subTest(profiler=profiler.__name__):
+                def anchor(pattern, **fields):
+                    rule = self.make_rule(profiler, pattern, **fields)
+                    return profiler.suggest_anchor(rule, rule['tree'])
+                self.assertEqual(anchor('.*メイド(\\w+)', at_start=0), '^.*メイド(\\w+)')
+                # re's parser turns a|b into a character class, the anchor must still cover both branches
+                self.assertEqual(anchor('a|b'), '^(?:a|b)')
+                self.assertEqual(anchor('ab|ac'), '^(?:ab|ac)')
+                self.assertIsNone(anchor('^a'))
+                self.assertIsNone(anchor('b', at_start=0))
+
+    def test_suggest_merges(self):
+        for profiler in PROFILERS:
+            with self.subTest(profiler=profiler.__name__):
+                rules = [self.make_rule(profiler, pattern, template) for pattern, template in (
+                    ('^夜伽(?<n>\\d+)', 'Night'), ('^夜伽モード(?<n>\\d+)', 'Night'),
+                    ('^HP(\\d+)', 'HP $1'), ('^MP(\\d+)', 'HP $1'), ('^a', 'A'), ('b', 'A'), ('^c', 'A'))]
+                merges = [([rule['pattern'] for rule in merged], pattern)
+                          for merged, pattern in profiler.suggest_merges(rules)]
+                # Numbered groups would be renumbered and an unanchored rule breaks the run
+                self.assertEqual(merges, [(['^夜伽(?<n>\\d+)', '^夜伽モード(?<n>\\d+)'],
+                                           '^夜伽(?:(?<n>\\d+)|モード(?<n>\\d+))')])
+
+class MainTest(unittest.TestCase):
+    def test_report(self):
+        for profiler in PROFILERS:
+            with self.subTest(profiler=profiler.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                report = profile(profiler, Path(temp_folder))
+                self.assertEqual((report['texts'], report['translated'], report['untranslated']), (7, 6, 1))
+                self.assertEqual(report['skipped'], {'exact': 1, 'bracket': 1, 'xuat': 0})
+                rules = {rule['template']: rule for rule in report['rules']}
+                self.assertEqual(rules['HP $1']['hits'], 3)
+                self.assertEqual(rules['HP again $1']['shadowed_by'], {'a.txt:1': 3})
+                self.assertEqual(rules['HP again $1']['duplicate_of'], 'a.txt:1')
+                self.assertEqual(rules['Maid $1']['anchor'], '^.*メイド(\\w+)')
+                self.assertEqual(rules['never']['matches'], 0)
+                self.assertEqual(report['merges'], [{'sources': ['a.txt:5', 'a.txt:6'],
+                                                     'pattern': '^夜伽(?:(?<n>\\d+)|モード(?<n>\\d+))'}])
+
+    def test_report_without_regex_parser(self):
+        # Where no regex parser can be imported, rules are still replayed and timed without the analysis
+        for profiler in PROFILERS:
+            with self.subTest(profiler=profiler.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                expected = profile(profiler, Path(temp_folder))
+                with mock.patch.object(profiler, 'regex_parser', None):
+                    report = profile(profiler, Path(temp_folder))
+                self.assertEqual(report['merges'], [])
+                for rule, expected_rule in zip(report['rules'], expected['rules']):
+                    self.assertEqual((rule['matches'], rule['hits'], rule['shadowed_by'], rule['duplicate_of']),
+                                     (expected_rule['matches'], expected_rule['hits'], expected_rule['shadowed_by'],
+                                      expected_rule['duplicate_of']))
+                    self.assertIsNone(rule['anchor'])
+
+if __name__ == '__main__':
+    unittest.main()
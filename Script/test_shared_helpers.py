@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Tests that the helpers copied into every standalone tool give the plugin's results
+# Creation date: 2026-10-18
+# Version: 2026-10-18_1
+# License: BSD-3
+
+import contextlib
+import importlib
+import inspect
+import io
+import re
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path, PurePosixPath
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# Every tool runs on its own, so helpers are copied instead of imported, both languages are tested
+TOOLS = [importlib.import_module(f"{tool}_{language}") for tool in (
+    'benchmark_converters', 'dump_consolidate', 'keyword_replace', 'lyric_csv_format_convert', 'png_optimize',
+    'regex_rule_profile', 'texture_index', 'translation_coverage', 'translation_index', 'txt_translation_lint',
+    'ui_csv_format_convert') for language in ('English', 'Chinese')]
+
+def tools_with(*names):
+    """Tools that define all the named helpers"""
+
+    return [tool for tool in TOOLS if all(hasattr(tool, name) for name in names)]
+
+def write_bytes(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+class SharedHelpersTest(unittest.TestCase):
+    def for_each_tool(self, names, count):
+        """Yield the tools defining the helpers in a subTest each, checking none lost its copy"""
+
+        tools = tools_with(*names)
+        self.assertEqual(len(tools), count * 2, f"tools defining {', '.join(names)}")
+        for tool in tools:
+            with self.subTest(tool=tool.__name__):
+                yield tool
+
+    def test_unescape(self):
+        # Every case of the switch in StringExtensions.Unescape, an unknown sequence and a trailing backslash
+        cases = [
+            ('', '', []),
+            ('plain', 'plain', []),
+            ('\\0\\a\\b\\t\\n\\v\\f\\r', '\0\a\b\t\n\v\f\r', []),
+            ('\\\'\\"\\\\', '\'"\\', []),
+            ('a\\qb\\', 'a\\qb\\', ['\\q']),
+            ('\\\\n\\x\\', '\\n\\x\\', ['\\x']),
+            ('\\', '\\', [])
+        ]
+        for tool in self.for_each_tool(('unescape',), 5):
+            for text, expected, expected_unknown in cases:
+                unknown_escapes = []
+                self.assertEqual(tool.unescape(text, unknown_escapes), expected, repr(text))
+                self.assertEqual(unknown_escapes, expected_unknown, repr(text))
+
+    def test_dotnet_regex_to_python(self):
+        cases = {
+            r'^\p{L}+(\d+)$': r'^\w+(\d+)$',
+            r'\P{Lu}\cA\e\z': r'\W\x00\x1b\Z',
+            r'(?<n>\w+)\s\k<n>': r'(?P<n>\w+)\s(?P=n)',
+            r"(\w)\k'1'": r'(\w)\1',
+            r'\G(?i)abc': 'abc'
+        }
+        results = {}
+        for tool in self.for_each_tool(('dotnet_regex_to_python',), 4):
+            for pattern in cases:
+                python_pattern = tool.dotnet_regex_to_python(pattern)
+                re.compile(python_pattern)
+                results.setdefault(pattern, python_pattern)
+                self.assertEqual(python_pattern, results[pattern], pattern)
+        self.assertEqual(results, cases)
+
+    def test_is_member_path_unsafe(self):
+        # FileTool.IsZipPathUnsafe on Windows, where the plugin runs
+        cases = {
+            '': True,
+            '../a.txt': True,
+            'a/../b.txt': True,
+            'a\\..\\b.txt': True,
+            '/a.txt': True,
+            '\\a.txt': True,
+            'C:/a.txt': True,
+            'C:a.txt': True,
+            '..': False,
+            'a..b/c.txt': False,
+            'sub/a.txt': False,
+            'sub\\a.txt': False
+        }
+        for tool in self.for_each_tool(('is_member_path_unsafe',), 7):
+            for name, expected in cases.items():
+                self.assertEqual(tool.is_member_path_unsafe(name), expected, repr(name))
+
+    def test_ordinal_key(self):
+        # StringComparer.Ordinal compares UTF-16 code units, so a character outside the BMP
+        # sorts before U+FF5E although its code point is larger
+        texts = ['\uff5e', 'b', '\U0001f600', '日本', 'a', '_', 'é', 'B', 'ab', '']
+        expected = ['', 'B', '_', 'a', 'ab', 'b', 'é', '日本', '\U0001f600', '\uff5e']
+        for tool in self.for_each_tool(('ordinal_key',), 7):
+            self.assertEqual(sorted(texts, key=tool.ordinal_key), expected)
+
+    def test_loader_order_key(self):
+        # FileTool.GetAllTranslationFiles: root files first, then every folder sorted by its full
+        # path, where "sub-2" sorts before "sub\deep" because '-' is below '\'
+        paths = ['sub/deep/y.txt', 'b.txt', 'sub-2/z.txt', 'sub/x.txt', 'Sub/w.txt', 'A.txt', 'sub/X.txt']
+        expected = ['A.txt', 'b.txt', 'Sub/w.txt', 'sub/X.txt', 'sub/x.txt', 'sub-2/z.txt', 'sub/deep/y.txt']
+        for tool in self.for_each_tool(('loader_order_key',), 6):
+            self.assertEqual(sorted(paths, key=lambda path: tool.loader_order_key(PurePosixPath(path))), expected)
+
+    def test_normalize_text(self):
+        # StringTool.NormalizeText drops \r, \n and \t, trims Unicode white space and upper-cases
+        cases = {
+            ' \tHello\r\nWorld\u3000': 'HELLOWORLD',
+            '\u00a0ｍａｉｄ\ufeff': 'ＭＡＩＤ',
+            'メイド': 'メイド',
+            '': ''
+        }
+        for tool in self.for_each_tool(('normalize_text',), 3):
+            for text, expected in cases.items():
+                self.assertEqual(tool.normalize_text(text), expected, repr(text))
+
+    def test_load_sources(self):
+        with tempfile.TemporaryDirectory() as temp_folder:
+            folder = Path(temp_folder)
+            write_bytes(folder / 'b.txt', b'\xef\xbb\xbfkey\tfrom b\n$^HP(\\d+)\tHP $1\n;comment\tskipped\n')
+            write_bytes(folder / 'A.txt', b'key\tfrom A\nline\\tbreak\tescaped\n')
+            write_bytes(folder / 'sub' / 'c.txt', 'key\tfrom sub\n$^HP(\\d+)\tsecond HP $1\n'.encode('utf-8'))
+            write_bytes(folder / 'sub-2' / 'd.csv', b'Term,Original,Translation\n#comment\nterm,o,from d\n')
+            write_bytes(folder / 'e.csv', b'TERM , Translation\nterm,from e\nother,x\n')
+            with zipfile.ZipFile(folder / 'sub' / 'z.zip', 'w') as archive:
+                archive.writestr('2.txt', 'zip\tsecond\n')
+                archive.writestr('1.txt', 'zip\tfirst\n')
+                archive.writestr('../evil.txt', 'key\tevil\n')
+
+            expected = {
+                (0, False): ({'key': 'from sub', 'line\tbreak': 'escaped', 'zip': 'first'},
+                             [('^HP(\\d+)', 'HP $1'), ('^HP(\\d+)', 'second HP $1')], 4),
+                (0, True): ({'key': 'from sub', 'line\tbreak': 'escaped', 'zip': 'second'},
+                            [('^HP(\\d+)', 'HP $1'), ('^HP(\\d+)', 'second HP $1')], 4),
+                (1, False): ({'term': 'from d', 'other': 'x'}, [], 3)
+            }
+            for tool in self.for_each_tool(('load_sources',), 3):
+                for (kind, zip_in_order), result in expected.items():
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        self.assertEqual(tool.load_sources(folder, kind, zip_in_order), result)
+
+    def test_iter_translations_and_read_rules(self):
+        builder = importlib.import_module('translation_index_English')
+        translations = {'b': 'B', 'a': 'A', '\uff5e': 'tilde', '\U0001f600': 'smile'}
+        rules = [('^x(\\d+)$', 'X$1'), ('^x(\\d+)$', 'again $1')]
+        with tempfile.TemporaryDirectory() as temp_folder:
+            index_file = Path(temp_folder) / 'Text.jatindex'
+            index_file.write_bytes(builder.build_index(translations, rules, 0, 0, 1))
+            for tool in self.for_each_tool(('open_index', 'iter_translations', 'read_rules'), 3):
+                index = tool.open_index(index_file)
+                try:
+                    self.assertEqual(list(tool.iter_translations(index)),
+                                     [('a', 'A'), ('b', 'B'), ('\U0001f600', 'smile'), ('\uff5e', 'tilde')])
+                    self.assertEqual(tool.read_rules(index), rules)
+                finally:
+                    index['map'].close()
+
+    def test_converter_helpers_in_sync(self):
+        # The UI and lyric converters carry the same profiling, progress, encoding, archive, manifest and
+        # watch helpers, a fix to one copy has to reach the other
+        names = ('start_profile', 'profile_stage', 'profile_iter', 'finish_profile', 'progress_output',
+                 'write_progress_event', 'report_file', 'print_summary', 'set_force_encoding', 'detect_encoding',
+                 'open_input', 'write_csv_rows', 'is_archive', 'iter_archive_csv_files', 'hash_file', 'get_file_state',
+                 'load_manifest', 'append_manifest_entry', 'save_manifest', 'is_csv_name', 'refresh_folder',
+                 'forget_folder', 'refresh_file', 'poll_snapshot', 'open_inotify', 'update_inotify_watches',
+                 'read_inotify', 'pop_option')
+        for language in ('English', 'Chinese'):
+            ui_converter = importlib.import_module(f"ui_csv_format_convert_{language}")
+            lyric_converter = importlib.import_module(f"lyric_csv_format_convert_{language}")
+            for name in names:
+                with self.subTest(language=language, helper=name):
+                    self.assertEqual(inspect.getsource(getattr(ui_converter, name)),
+                                     inspect.getsource(getattr(lyric_converter, name)))
+
+if __name__ == '__main__':
+    unittest.main()
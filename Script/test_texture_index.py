@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Tests of the texture replacement indexers
+# Creation date: 2026-10-18
+# Version: 2026-10-18_1
+# License: BSD-3
+
+import contextlib
+import csv
+import importlib
+import io
+import json
+import struct
+import sys
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# The English and Chinese scripts share their code, both are tested
+INDEXERS = [importlib.import_module(name) for name in ('texture_index_English', 'texture_index_Chinese')]
+
+def chunk(chunk_type, data):
+    return struct.pack('>I4s', len(data), chunk_type) + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+def png(width, height, tag=b''):
+    """PNG header of the given size, the tag makes the content of otherwise equal files differ"""
+
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0))
+            + chunk(b'tEXt', b'Comment\x00' + tag) + chunk(b'IEND', b''))
+
+def write_files(root, files):
+    for path, data in files.items():
+        file_path = root / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(data)
+
+def run(indexer, *args):
+    """Run the indexer with command line arguments, returning its exit code"""
+
+    with mock.patch.object(sys, 'argv', ['texture_index', *map(str, args)]), \
+            contextlib.redirect_stdout(io.StringIO()):
+        return indexer.main()
+
+class ScanTreeTest(unittest.TestCase):
+    def test_plugin_order(self):
+        # Directory.GetFiles(path, "*.png", AllDirectories) on Mono: the files of a folder, then each
+        # subfolder recursively, names in case-insensitive ordinal order, where '-' < 'B' < '_'
+        paths = ['z.png', 'A.png', 'b.PNG', 'notes.txt', 'sub/a.png', 'sub/deep/a.png', 'Sub2/a.png',
+                 'x_1/a.png', 'x-1/a.png', 'xb/a.png']
+        expected = ['A.png', 'b.PNG', 'z.png', 'sub/a.png', 'sub/deep/a.png', 'Sub2/a.png', 'x-1/a.png',
+                    'xb/a.png', 'x_1/a.png']
+        for indexer in INDEXERS:
+            with self.subTest(indexer=indexer.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                root = Path(temp_folder)
+                write_files(root, {path: png(1, 1) for path in paths})
+                self.assertEqual([path for path, _, _ in indexer.scan_tree(root)], expected)
+                self.assertEqual(indexer.scan_tree(root / 'missing'), [])
+
+class MainTest(unittest.TestCase):
+    def make_folders(self, folder):
+        write_files(folder / 'Chinese', {
+            'Texture/a.png': png(64, 64, b'1'),
+            'Texture/sub/a.png': png(64, 64, b'2'),
+            'Texture/Sub2/a.png': png(32, 32, b'3'),
+            'Texture/copy.png': png(64, 64, b'1'),
+            'Texture/upper.PNG': png(8, 8, b'4'),
+            'Texture/broken.png': b'not a png',
+            'UI/Sprite/icon.png': png(16, 16, b'5'),
+            'UI/Sprite/more/icon.PNG': png(16, 16, b'6')
+        })
+        write_files(folder / 'Dump', {
+            'Texture/a.png': png(64, 64, b'dump'),
+            'UI/Sprite/icon.png': png(20, 20, b'dump')
+        })
+
+    def test_collision_winner_like_the_plugin(self):
+        for indexer in INDEXERS:
+            with self.subTest(indexer=indexer.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder)
+                self.make_folders(folder)
+                self.assertEqual(run(indexer, folder / 'Chinese', '--dump', folder / 'Dump', '--jobs', '2',
+                                     '--output', folder / 'index.json', '--csv', folder / 'index.csv'), 0)
+                index = json.loads((folder / 'index.json').read_text(encoding='utf-8'))
+
+                # The cache is filled in load order, so the last file of a name is used
+                self.assertEqual(index['collisions'], [
+                    {'tree': 'texture', 'key': 'a.png', 'winner': 'Sub2/a.png', 'shadowed': ['a.png', 'sub/a.png']},
+                    {'tree': 'sprite', 'key': 'icon', 'winner': 'more/icon.PNG', 'shadowed': ['icon.png']}
+                ])
+                # The dumped original is compared with the file used, not with the shadowed ones
+                self.assertEqual([(item['key'], item['kind']) for item in index['mismatches']],
+                                 [('a.png', 'collision'), ('a.png', 'dump'), ('icon', 'dump')])
+                self.assertEqual([item['files'] for item in index['duplicates']], [['texture:a.png', 'texture:copy.png']])
+                self.assertEqual([item['path'] for item in index['invalid']], ['broken.png', 'upper.PNG'])
+
+                with open(folder / 'index.csv', encoding='utf-8-sig', newline='') as infile:
+                    statuses = {row['Path']: row['Status'] for row in csv.DictReader(infile)}
+                self.assertEqual(statuses, {
+                    'a.png': 'shadowed', 'broken.png': 'invalid', 'copy.png': 'active', 'upper.PNG': 'unreachable',
+                    'sub/a.png': 'shadowed', 'Sub2/a.png': 'active', 'icon.png': 'shadowed', 'more/icon.PNG': 'active'
+                })
+
+    def test_unchanged_files_not_read_again(self):
+        for indexer in INDEXERS:
+            with self.subTest(indexer=indexer.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder)
+                self.make_folders(folder)
+                self.assertEqual(run(indexer, folder / 'Chinese', '--output', folder / 'index.json'), 0)
+                expected = (folder / 'index.json').read_text(encoding='utf-8')
+
+                with mock.patch.object(indexer, 'read_png_info', wraps=indexer.read_png_info) as read_png_info:
+                    self.assertEqual(run(indexer, folder / 'Chinese', '--output', folder / 'index.json'), 0)
+                    self.assertEqual([call.args[0].name for call in read_png_info.call_args_list], [])
+                    self.assertEqual((folder / 'index.json').read_text(encoding='utf-8'), expected)
+
+                    (folder / 'Chinese' / 'Texture' / 'copy.png').write_bytes(png(64, 64, b'changed'))
+                    self.assertEqual(run(indexer, folder / 'Chinese', '--output', folder / 'index.json'), 0)
+                    self.assertEqual([call.args[0].name for call in read_png_info.call_args_list], ['copy.png'])
+                index = json.loads((folder / 'index.json').read_text(encoding='utf-8'))
+                self.assertEqual(index['duplicates'], [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Tests of the translation coverage checkers
+# Creation date: 2026-10-18
+# Version: 2026-10-18_1
+# License: BSD-3
+
+import contextlib
+import importlib
+import io
+import json
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# The English and Chinese scripts share their code, both are tested
+CHECKERS = [importlib.import_module(name) for name in ('translation_coverage_English', 'translation_coverage_Chinese')]
+
+TRANSLATIONS = {
+    'key': 'Key [HF] done',
+    'KEY2': 'Second',
+    'HP5': 'five exact',
+    '[bracket]': 'never used',
+    'slime': 'Slime',
+    'Bob talk': 'Bob says'
+}
+
+# An empty match does not translate, so the x* rule never takes a text
+RULES = [('^HP(\\d+)', 'HP $1'), ('x*', 'empty'), ('^(\\w+) attack', '$1 attacks')]
+
+def write_text(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+
+def run(checker, *args):
+    """Run the checker with command line arguments, returning its exit code"""
+
+    with mock.patch.object(sys, 'argv', ['translation_coverage', *map(str, args)]), \
+            contextlib.redirect_stdout(io.StringIO()):
+        return checker.main()
+
+class TranslateTest(unittest.TestCase):
+    def test_stage_credited(self):
+        # Each text is credited to the first stage of GetTranslateText that handles it
+        cases = [
+            ('', 'blank', None),
+            ('  \t', 'blank', None),
+            ('key\u180e', 'xuat', None),
+            # A text equal to any translation counts as shown, before its own exact translation is tried
+            ('slime', 'translated_text', 'slime'),
+            ('key Alice done', 'translated_text', 'key Alice done'),
+            ('[bracket]', 'bracket', None),
+            ('key', 'exact', 'Key [HF] done'),
+            (' key2\t', 'normalized', 'Second'),
+            ('HP5', 'exact', 'five exact'),
+            # As in the plugin, a placeholder at the very end of the template is dropped
+            ('HP100', 'regex', 'HP '),
+            (' hp7 ', 'regex', 'HP '),
+            # A captured text with an exact translation is translated in the template
+            ('slime attack', 'regex', 'Slime attacks'),
+            ('nothing', 'miss', None)
+        ]
+        for checker in CHECKERS:
+            with self.subTest(checker=checker.__name__):
+                engine, failed_rules = checker.build_engine(TRANSLATIONS, RULES)
+                self.assertEqual(failed_rules, [])
+                for text, stage, translation in cases:
+                    self.assertEqual(checker.translate(engine, text), (stage, translation), repr(text))
+
+    def test_keywords(self):
+        for checker in CHECKERS:
+            with self.subTest(checker=checker.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                keyword_file = Path(temp_folder) / 'KeywordReplaceText.json'
+                write_text(keyword_file, json.dumps({'Bo': 'X', 'Bob': 'Robert'}))
+                keywords, keyword_regex = checker.load_keywords(keyword_file)
+                engine, _ = checker.build_engine(TRANSLATIONS, RULES, keywords, keyword_regex)
+                # The longest keyword is replaced first, and shown translations are the replaced ones
+                self.assertEqual(checker.translate(engine, 'Bob talk'), ('exact', 'Robert says'))
+                self.assertEqual(checker.translate(engine, 'Robert says')[0], 'translated_text')
+                self.assertEqual(checker.translate(engine, 'Bob says')[0], 'miss')
+
+    def test_worker_processes(self):
+        texts = ['HP100', 'slime', 'nothing', 'key', ' key2 ', '[bracket]', 'slime attack', ''] * 3
+        for checker in CHECKERS:
+            with self.subTest(checker=checker.__name__):
+                engine, _ = checker.build_engine(TRANSLATIONS, RULES)
+                expected = [checker.translate(engine, text)[0] for text in texts]
+                with mock.patch.object(checker, 'TASK_TEXTS', 5):
+                    self.assertEqual(checker.translate_texts(engine, texts, jobs=2), expected)
+
+class MainTest(unittest.TestCase):
+    def test_report(self):
+        for checker in CHECKERS:
+            with self.subTest(checker=checker.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder)
+                write_text(folder / 'Text' / 'a.txt', "slime\tSlime\nkey\tDone\n$^HP(\\d+)\tHP $1\n")
+                write_text(folder / 'Dump' / 'a.txt', "HP100\nHP100\nslime\n[bracket]\nnothing\n\n")
+                write_text(folder / 'Dump' / 'sub' / 'b.txt', "nothing\nkey\n;semi\n")
+                # The normalized dumps repeat the texts of the other dumps and are skipped
+                write_text(folder / 'Dump' / 'b_untranslate_normalized.txt', "NOTHING\n")
+
+                self.assertEqual(run(checker, folder / 'Text', folder / 'Dump', '--jobs', '1', '--top', '0',
+                                     '--output', folder / 'report.json', '--misses', folder / 'misses.txt'), 0)
+
+                report = json.loads((folder / 'report.json').read_text(encoding='utf-8'))
+                self.assertEqual({stage: count for stage, count in report['stages'].items() if count},
+                                 {'translated_text': 1, 'bracket': 1, 'exact': 1, 'regex': 2, 'miss': 3})
+                self.assertEqual((report['lines'], report['unique']), (8, 6))
+                self.assertAlmostEqual(report['hit_rate'], 4 / 7)
+                self.assertEqual([(file['file'], file['lines'], file['stages']['miss']) for file in report['files']],
+                                 [('a.txt', 5, 1), ('sub/b.txt', 3, 2)])
+
+                # The comment line is localized, ;semi would become a comment and is left out
+                lines = (folder / 'misses.txt').read_text(encoding='utf-8').split('\n')
+                self.assertEqual(len(lines), 3)
+                self.assertRegex(lines[0], re.compile(r'^; 2\D+$'))
+                self.assertEqual(lines[1:], ['nothing\t', ''])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Tests of the translation index builders
+# Creation date: 2026-10-18
+# Version: 2026-10-18_1
+# License: BSD-3
+
+import contextlib
+import importlib
+import io
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# The English and Chinese scripts share their code, both are tested
+BUILDERS = [importlib.import_module(name) for name in ('translation_index_English', 'translation_index_Chinese')]
+
+def write_text(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+
+def run(builder, *args):
+    """Run the builder with command line arguments, returning its exit code"""
+
+    with mock.patch.object(sys, 'argv', ['translation_index', *map(str, args)]), \
+            contextlib.redirect_stdout(io.StringIO()):
+        return builder.main()
+
+def make_text_folder(folder):
+    """
+    Write a Text folder whose later files override earlier ones
+
+    The plugin loads the root files first, then the subfolders in ordinal order, so sub/b.txt
+    overrides a.txt, and within the zip 2.txt is stored before 1.txt.
+    """
+
+    write_text(folder / 'a.txt', "key\tfrom a\nonly a\tA\n$^HP(\\d+)\tHP $1\n")
+    write_text(folder / 'sub' / 'b.txt', "key\tfrom b\nsmile \\U\tescape kept\n$^HP(\\d+)\tsecond $1\n")
+    with zipfile.ZipFile(folder / 'sub' / 'c.zip', 'w') as archive:
+        archive.writestr('2.txt', "zip\tsecond\n\U0001f600\temoji\n")
+        archive.writestr('1.txt', "zip\tfirst\n\uff5e\twave dash\n")
+
+class RoundTripTest(unittest.TestCase):
+    def test_build_then_verify(self):
+        for builder in BUILDERS:
+            with self.subTest(builder=builder.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder) / 'Text'
+                index_file = Path(temp_folder) / 'Text.jatidx'
+                make_text_folder(folder)
+
+                self.assertEqual(run(builder, folder, index_file), 0)
+                self.assertEqual(run(builder, '--verify', index_file, folder), 0)
+
+                index = builder.open_index(index_file)
+                try:
+                    self.assertTrue(builder.check_index(index))
+                    self.assertEqual(builder.lookup(index, 'key'), 'from b')
+                    self.assertEqual(builder.lookup(index, 'zip'), 'first')
+                    self.assertEqual(builder.lookup(index, 'smile \\U'), 'escape kept')
+                    self.assertEqual(builder.lookup(index, '\U0001f600'), 'emoji')
+                    self.assertEqual(builder.lookup(index, '\uff5e'), 'wave dash')
+                    self.assertIsNone(builder.lookup(index, 'missing'))
+                    self.assertEqual(builder.read_rules(index), [('^HP(\\d+)', 'HP $1'), ('^HP(\\d+)', 'second $1')])
+                finally:
+                    index['map'].close()
+
+    def test_zip_in_order(self):
+        for builder in BUILDERS:
+            with self.subTest(builder=builder.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder) / 'Text'
+                index_file = Path(temp_folder) / 'Text.jatidx'
+                make_text_folder(folder)
+
+                self.assertEqual(run(builder, folder, index_file, '--zip-in-order'), 0)
+                # The flag is stored, so verifying reloads the zip members in name order as well
+                self.assertEqual(run(builder, '--verify', index_file, folder), 0)
+                index = builder.open_index(index_file)
+                try:
+                    self.assertEqual(builder.lookup(index, 'zip'), 'second')
+                finally:
+                    index['map'].close()
+
+    def test_ui_csv(self):
+        for builder in BUILDERS:
+            with self.subTest(builder=builder.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder) / 'UI'
+                index_file = Path(temp_folder) / 'UI.jatidx'
+                write_text(folder / 'a.csv', "Term,Original,Translation\nt1,o,first\nt2,o,\n")
+                write_text(folder / 'sub' / 'b.csv', " TERM ,Translation\n# comment\nt1,second\n\"t,3\",\"multi\nline\"\n")
+
+                self.assertEqual(run(builder, folder, index_file, '--ui'), 0)
+                self.assertEqual(run(builder, '--verify', index_file, folder), 0)
+                index = builder.open_index(index_file)
+                try:
+                    self.assertEqual(list(builder.iter_translations(index)), [('t,3', 'multi\nline'), ('t1', 'second')])
+                finally:
+                    index['map'].close()
+
+    def test_stale_and_damaged_index(self):
+        for builder in BUILDERS:
+            with self.subTest(builder=builder.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder) / 'Text'
+                index_file = Path(temp_folder) / 'Text.jatidx'
+                make_text_folder(folder)
+                self.assertEqual(run(builder, folder, index_file), 0)
+
+                write_text(folder / 'sub' / 'd.txt', "key\tfrom d\n")
+                self.assertEqual(run(builder, '--verify', index_file, folder), 1)
+                (folder / 'sub' / 'd.txt').unlink()
+                self.assertEqual(run(builder, '--verify', index_file, folder), 0)
+
+                data = bytearray(index_file.read_bytes())
+                data[-1] ^= 0xFF
+                index_file.write_bytes(bytes(data))
+                self.assertEqual(run(builder, '--verify', index_file, folder), 1)
+
+                index_file.write_bytes(bytes(data[:-1]))
+                with self.assertRaises(ValueError):
+                    builder.open_index(index_file)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Tests of the .txt translation linters
+# Creation date: 2026-10-18
+# Version: 2026-10-18_1
+# License: BSD-3
+
+import importlib
+import io
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# The English and Chinese scripts share their code, both are tested
+LINTERS = [importlib.import_module(name) for name in ('txt_translation_lint_English', 'txt_translation_lint_Chinese')]
+
+# Lines of every kind TxtTranslationFileProcessor.ProcessTranslationLine handles
+SAMPLE_LINES = [
+    'plain\ttranslation', 'a\tb\tc', ';comment without tab', '', '   ', 'no tab here', '\tno original',
+    'no translation\t', 'only mark\t\u180e', 'esc\\qape\tx', 'x\tesc\\qape', '$^HP(\\d+)\tHP $1',
+    '$^(\tbroken', '$\\bword\tx', '$\tempty pattern', '\ufeffbom\tinside', '$^\\p{L}+$\tletters',
+    'tab\\tescaped\tok', 'ends with backslash\\\tok\\'
+]
+
+def check_lines(linter, data):
+    """
+    List the issues of a file checking every line, split the way StreamReader.ReadLine splits them
+
+    Args:
+        linter (module): Linter
+        data (bytes): File content
+
+    Returns:
+        list: (line number, issue, detail) tuples
+    """
+
+    text = data.decode('utf-8', 'replace')
+    if text.startswith('\ufeff'):
+        text = text[1:]
+    issues = []
+    for line_number, line in enumerate(text.split('\n'), 1):
+        if line.endswith('\r'):
+            line = line[:-1]
+        for part in line.split('\r'):
+            issues.extend((line_number, issue, detail) for issue, detail in linter.check_line(part))
+    return issues
+
+class CheckLineTest(unittest.TestCase):
+    def test_lines_like_the_plugin(self):
+        # Issue kinds only, the details are localized
+        cases = {
+            '': [],
+            ';a\tb': [],
+            '   ': [],
+            'plain\ttranslation': [],
+            'a\tb\tc': [],
+            'no tab here': ['no_tab'],
+            '\tno original': ['empty_original'],
+            'no translation\t': ['empty_translation'],
+            # U+180E is removed from the translation before the empty check
+            'only mark\t\u180e': ['empty_translation'],
+            'esc\\qape\tx': ['unknown_escape'],
+            '\\q\t\\z': ['unknown_escape', 'unknown_escape'],
+            # A backslash at the end of a side is kept as it is
+            'end\\\tend\\': [],
+            # Unknown escapes of a pattern are regex escapes, and \$ in the template is a dollar sign
+            '$^HP(\\d+)\tHP \\$1 $1': [],
+            '$^(\tbroken': ['invalid_regex'],
+            '$\\bword\tx': ['regex_backspace'],
+            '$\tempty pattern': ['invalid_regex'],
+            '$^\\p{L}+(?<n>\\d)\\k<n>$\tletters': [],
+            'x\ufeff\ty': ['bom']
+        }
+        for linter in LINTERS:
+            with self.subTest(linter=linter.__name__):
+                for line, expected in cases.items():
+                    self.assertEqual([issue for issue, _ in linter.check_line(line)], expected, repr(line))
+
+class LintStreamTest(unittest.TestCase):
+    def make_file(self, seed, line_count=400):
+        generator = random.Random(seed)
+        lines = [generator.choice(SAMPLE_LINES) for _ in range(line_count)]
+        breaks = [generator.choice(('\n', '\n', '\r\n', '\r')) for _ in range(line_count)]
+        text = ''.join(line + line_break for line, line_break in zip(lines, breaks))
+        data = text.encode('utf-8')
+        if seed % 2:
+            # No line break at the end, and a byte order mark at the start the plugin skips
+            data = b'\xef\xbb\xbf' + data.rstrip(b'\r\n')
+        return data
+
+    def test_candidate_lines_find_every_issue(self):
+        for linter in LINTERS:
+            with self.subTest(linter=linter.__name__):
+                for seed in range(6):
+                    data = self.make_file(seed)
+                    with mock.patch.object(linter, 'READ_BLOCK_SIZE', 997):
+                        line_count, counts, issues = linter.lint_stream(io.BytesIO(data), max_issues=0)
+                    expected = check_lines(linter, data)
+                    self.assertEqual(issues, sorted(expected, key=lambda issue: issue[0]))
+                    self.assertEqual(line_count, data.count(b'\n') + (not data.endswith(b'\n')))
+                    self.assertEqual(sum(counts.values()), len(expected))
+
+    def test_ranges_cover_the_file(self):
+        for linter in LINTERS:
+            with self.subTest(linter=linter.__name__):
+                data = self.make_file(3)
+                bounds = [0, 1, 777, 778, 2500, len(data) // 2, len(data)]
+                issues = []
+                line_count = 0
+                for start, end in zip(bounds, bounds[1:]):
+                    range_lines, _, range_issues = linter.lint_stream(io.BytesIO(data), max_issues=0,
+                                                                      start=start, end=end)
+                    issues.extend((line_count + line, issue, detail) for line, issue, detail in range_issues)
+                    line_count += range_lines
+                self.assertEqual(line_count, data.count(b'\n') + 1)
+                self.assertEqual(issues, sorted(check_lines(linter, data), key=lambda issue: issue[0]))
+
+    def test_invalid_utf8(self):
+        for linter in LINTERS:
+            with self.subTest(linter=linter.__name__):
+                _, counts, issues = linter.lint_stream(io.BytesIO(b'a\tb\nbad\xff\tx\nno tab\n'), max_issues=0)
+                self.assertEqual([issue[:2] for issue in issues], [(2, 'invalid_utf8'), (3, 'no_tab')])
+                self.assertEqual(counts['invalid_utf8'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Tests of the UI CSV converters
+# Creation date: 2026-10-18
+# Version: 2026-10-18_1
+# License: BSD-3
+
+import contextlib
+import csv
+import importlib
+import io
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# The English and Chinese scripts share their code, both are tested
+CONVERTERS = [importlib.import_module(name) for name in ('ui_csv_format_convert_English', 'ui_csv_format_convert_Chinese')]
+
+# Field values with commas, quotes, line breaks, white space and non-ASCII text
+FIELD_PIECES = ['a', 'key', 'b,c', 'say "hi"', '"', 'multi\nline', 'cr\r\nlf', '', ' sp ', 'é日本', '\\n', ',']
+
+def write_text(path, text, encoding='utf-8'):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding=encoding, newline='')
+
+def read_table(path):
+    with open(path, encoding='utf-8-sig', newline='') as infile:
+        return list(csv.reader(infile))
+
+def read_term_rows_reference(converter, input_file, add_prefix, translation_columns):
+    """The rows read_term_rows gave with csv.DictReader, before the fast-path splitter"""
+
+    file_prefix = Path(input_file).stem
+    with converter.open_input(input_file) as infile:
+        for row in csv.DictReader(infile):
+            key_field = 'Key'
+            if key_field not in row:
+                key_field = next((column for column in row if column.endswith('Key')), key_field)
+            key = row.get(key_field, '')
+            if not key:
+                continue
+            yield (f"{file_prefix}/{key}" if add_prefix else key, row.get('Japanese', ''),
+                   *[row.get(column, '') for column in translation_columns])
+
+def random_csv(generator):
+    """
+    CSV text mixing unquoted lines, quoted and multiline fields, blank lines, short and long rows
+    and a repeated column
+    """
+
+    header = ['Key' if generator.random() < 0.7 else 'ItemKey', 'Japanese', 'English']
+    header += generator.sample(['Chinese', 'Note', 'English', 'Japanese'], generator.randint(0, 2))
+    generator.shuffle(header)
+    output = io.StringIO()
+    line_break = generator.choice(('\n', '\r\n', '\r'))
+    writer = csv.writer(output, lineterminator=line_break)
+    writer.writerow(header)
+    for _ in range(generator.randint(0, 30)):
+        if generator.random() < 0.1:
+            output.write(line_break)
+            continue
+        row = [generator.choice(FIELD_PIECES) if generator.random() < 0.3 else generator.choice('xyz')
+               for _ in range(max(0, len(header) + generator.randint(-2, 2)))]
+        quoting = csv.QUOTE_ALL if generator.random() < 0.2 else csv.QUOTE_MINIMAL
+        csv.writer(output, lineterminator=line_break, quoting=quoting).writerow(row)
+    text = output.getvalue()
+    # No line break at the end of some files
+    return text.rstrip('\r\n') if generator.random() < 0.3 else text
+
+@contextlib.contextmanager
+def field_size_limit(limit):
+    previous = csv.field_size_limit(limit)
+    try:
+        yield
+    finally:
+        csv.field_size_limit(previous)
+
+class TokenizerTest(unittest.TestCase):
+    def test_records_like_csv_reader(self):
+        generator = random.Random(25)
+        texts = [random_csv(generator) for _ in range(300)]
+        for converter in CONVERTERS:
+            with self.subTest(converter=converter.__name__):
+                for text in texts:
+                    # Lines as a text file with universal newlines gives them
+                    expected = [record for record in csv.reader(io.StringIO(text, newline=None)) if record]
+                    self.assertEqual(list(converter.iter_csv_records(iter(io.StringIO(text, newline=None)))),
+                                     expected, repr(text))
+
+    def test_rows_like_dict_reader(self):
+        generator = random.Random(26)
+        for converter in CONVERTERS:
+            with self.subTest(converter=converter.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                input_file = Path(temp_folder) / 'ui.csv'
+                for _ in range(200):
+                    write_text(input_file, random_csv(generator), generator.choice(('utf-8', 'utf-8-sig', 'utf-16')))
+                    add_prefix = generator.random() < 0.5
+                    translation_columns = tuple(generator.sample(['English', 'Chinese', 'Missing'], generator.randint(1, 3)))
+                    self.assertEqual(
+                        list(converter.read_term_rows(input_file, add_prefix, translation_columns)),
+                        list(read_term_rows_reference(converter, input_file, add_prefix, translation_columns)),
+                        input_file.read_bytes())
+
+    def test_oversized_fields(self):
+        # Whether its line has a quote or not, a field is rejected exactly when the csv module rejects it
+        for converter in CONVERTERS:
+            with self.subTest(converter=converter.__name__), field_size_limit(50):
+                for length in (49, 50, 51, 200):
+                    field = 'x' * length
+                    for text in (f"Key,English\nk,{field}\n", f"Key,English\nk,\"{field}\"\n",
+                                 f"Key,English\n\"k\",\"{field[:10]}\n{field[10:]}\"\n", f"Key,English\n{field},v\n"):
+                        lines = io.StringIO(text, newline=None)
+                        try:
+                            expected = [record for record in csv.reader(lines) if record]
+                        except csv.Error as e:
+                            with self.assertRaises(csv.Error, msg=repr(text)) as raised:
+                                list(converter.iter_csv_records(iter(io.StringIO(text, newline=None))))
+                            self.assertEqual(str(raised.exception), str(e))
+                        else:
+                            self.assertEqual(list(converter.iter_csv_records(iter(io.StringIO(text, newline=None)))),
+                                             expected, repr(text))
+
+class MergeTest(unittest.TestCase):
+    # Loaded by the plugin in the order A, b, Sub/f, sub/c, sub-2/d, sub/deep/e
+    FILES = {
+        'b.csv': "Key,Japanese,English\nk,jb,from b\nonly b,jb,B\n",
+        'A.csv': "Key,Japanese,English\nk,ja,from A\ndup,first,one\ndup,second,two\n",
+        'sub/c.csv': "Key,Japanese,English\nk,jc,from c\n",
+        'sub-2/d.csv': "Key,Japanese,English\nk,jd,from d\nonly b,jd,\n",
+        'sub/deep/e.csv': "Key,Japanese,English\nk,je,\n",
+        'Sub/f.csv': "Key,Japanese,English\nk,jf,from f\n"
+    }
+
+    def test_merge_loads_like_the_separate_files(self):
+        for converter in CONVERTERS:
+            with self.subTest(converter=converter.__name__), tempfile.TemporaryDirectory() as temp_folder:
+                folder = Path(temp_folder)
+                for path, text in self.FILES.items():
+                    write_text(folder / 'in' / path, text)
+                csv_files = sorted((folder / 'in').rglob('*.csv'))
+
+                with contextlib.redirect_stdout(io.StringIO()):
+                    converter.process_folder(folder / 'in', folder / 'separate', add_prefix=False)
+                    converter.merge_csv_files(csv_files, folder / 'in', folder / 'merged', add_prefix=False)
+                    converter.merge_csv_files(csv_files, folder / 'in', folder / 'parallel', add_prefix=False, jobs=2)
+
+                # The plugin loads the separate files in order, a row with an empty Translation is skipped
+                separate_files = sorted((folder / 'separate').rglob('*.csv'), key=lambda path: converter.loader_order_key(
+                    path.relative_to(folder / 'separate')))
+                loaded = {}
+                for separate_file in separate_files:
+                    for term, original, translation in read_table(separate_file)[1:]:
+                        if translation:
+                            loaded[term] = [term, original, translation]
+
+                merged = read_table(folder / 'merged' / 'merged.csv')
+                self.assertEqual(merged[0], ['Term', 'Original', 'Translation'])
+                self.assertEqual(merged[1:], [loaded[term] for term in sorted(loaded)])
+                self.assertEqual(merged[1:], [['dup', 'second', 'two'], ['k', 'jd', 'from d'], ['only b', 'jb', 'B']])
+                self.assertEqual((folder / 'parallel' / 'merged.csv').read_bytes(),
+                                 (folder / 'merged' / 'merged.csv').read_bytes())
+
+if __name__ == '__main__':
+    unittest.main()
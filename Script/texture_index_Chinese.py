@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: 为纹理和精灵图替换文件夹建立索引，报告重名、重复文件和尺寸不符
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import csv
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 每个 PNG 文件都以这 8 个字节开头
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# 数据块长度和类型，后跟数据以及类型和数据的 CRC-32
+CHUNK_HEADER = struct.Struct('>I4s')
+
+# 宽度、高度、位深度、颜色类型、压缩方法、过滤方法和隔行扫描方法
+IHDR = struct.Struct('>IIBBBBB')
+
+# 每种颜色类型每像素的采样数
+COLOR_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+# 每种树在语言文件夹下的替换文件夹，以及在导出文件夹下的导出文件夹
+TREES = {
+    'texture': ('Texture',),
+    'sprite': ('UI', 'Sprite')
+}
+
+# 按此大小分块计算文件内容的哈希值
+HASH_BLOCK_SIZE = 1 << 20
+
+# 每个工作线程任务读取的文件数
+TASK_FILES = 256
+
+# 每个部分默认列出的问题数
+REPORT_TOP_ISSUES = 10
+
+# 每组重复文件列出的文件数
+REPORT_GROUP_FILES = 3
+
+# CSV 索引的列
+CSV_FIELDNAMES = ('Tree', 'Path', 'Key', 'Status', 'Size', 'Width', 'Height', 'BitDepth', 'ColorType',
+                  'SHA256', 'DuplicateOf')
+
+def ordinal_key(text):
+    """
+    与 .NET StringComparer.Ordinal 一致的排序键，按 UTF-16 码元比较
+
+    Args:
+        text (str): 要排序的文本
+
+    Returns:
+        bytes: 文本的 UTF-16 大端编码
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def scan_tree(root):
+    """
+    按 Directory.GetFiles(path, "*.png", AllDirectories) 返回的顺序列出文件夹中的 .png 文件
+
+    Mono 先列出文件夹中的文件，再递归列出每个子文件夹中的文件。Windows 按不区分大小写的顺序
+    列出 NTFS 文件夹中的名称。
+
+    Args:
+        root (Path): 文件夹，文件夹不存在时没有文件
+
+    Returns:
+        list: (相对于 root 的路径（使用 /）, 大小, 以纳秒计的修改时间) 元组
+    """
+
+    def name_key(entry):
+        return ordinal_key(entry.name.upper())
+
+    files = []
+    stack = [('', str(root))]
+    while stack:
+        prefix, folder = stack.pop()
+        try:
+            with os.scandir(folder) as scanner:
+                entries = sorted(scanner, key=name_key)
+        except OSError:
+            continue
+        subfolders = []
+        for entry in entries:
+            if entry.is_dir():
+                subfolders.append((prefix + entry.name + '/', entry.path))
+            elif entry.name.lower().endswith('.png') and entry.is_file():
+                stat = entry.stat()
+                files.append((prefix + entry.name, stat.st_size, stat.st_mtime_ns))
+        # 逆序弹出，因此按顺序访问子文件夹
+        stack.extend(reversed(subfolders))
+    return files
+
+def plugin_key(tree, name):
+    """
+    查找文件所用的名称，即 TextureReplaceManger.FilePathCache 或 UITranslateManager.SpritePathCache 的键
+
+    Args:
+        tree (str): TREES 的键
+        name (str): 文件名
+
+    Returns:
+        str: 纹理为文件名，精灵图为不含扩展名的文件名
+    """
+
+    if tree == 'texture':
+        return name
+    return name.rpartition('.')[0] or name
+
+def read_png_info(file_path):
+    """
+    计算 PNG 文件的哈希值，并从其 IHDR 数据块读取图像尺寸
+
+    Args:
+        file_path (Path): PNG 文件
+
+    Returns:
+        dict: 'sha256'、'width'、'height'、'bit_depth'、'color_type' 和 'error'（文件头有效时为 None）
+    """
+
+    info = {'sha256': None, 'width': None, 'height': None, 'bit_depth': None, 'color_type': None, 'error': None}
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, 'rb') as infile:
+            block = infile.read(HASH_BLOCK_SIZE)
+            head = block[:len(PNG_SIGNATURE) + CHUNK_HEADER.size + IHDR.size]
+            while block:
+                digest.update(block)
+                block = infile.read(HASH_BLOCK_SIZE)
+    except OSError as e:
+        info['error'] = f"无法读取：{e}"
+        return info
+    info['sha256'] = digest.hexdigest()
+
+    if not head.startswith(PNG_SIGNATURE):
+        info['error'] = "不是 PNG 文件"
+    elif len(head) < len(PNG_SIGNATURE) + CHUNK_HEADER.size + IHDR.size:
+        info['error'] = "PNG 文件头不完整"
+    elif CHUNK_HEADER.unpack_from(head, len(PNG_SIGNATURE)) != (IHDR.size, b'IHDR'):
+        info['error'] = "第一个数据块不是 IHDR"
+    else:
+        width, height, bit_depth, color_type = IHDR.unpack_from(head, len(PNG_SIGNATURE) + CHUNK_HEADER.size)[:4]
+        info.update(width=width, height=height, bit_depth=bit_depth, color_type=color_type)
+        if not width or not height or color_type not in COLOR_CHANNELS:
+            info['error'] = f"无效的 IHDR {width}x{height}，颜色类型 {color_type}"
+    return info
+
+def read_task(file_paths):
+    """
+    在工作线程中读取多个文件的 PNG 信息
+
+    Args:
+        file_paths (list): PNG 文件
+
+    Returns:
+        list: 顺序相同的 read_png_info 结果
+    """
+
+    return [read_png_info(file_path) for file_path in file_paths]
+
+def index_files(folder, tree, previous, jobs):
+    """
+    扫描文件夹并读取其中文件的信息，未改变的文件沿用上次的索引
+
+    Args:
+        folder (Path): 替换或导出文件夹
+        tree (str): TREES 的键
+        previous (dict): (tree, folder, path) -> 上次索引的记录
+        jobs (int): 工作线程数
+
+    Returns:
+        tuple: (按插件加载顺序排列的记录, 读取的文件数)
+    """
+
+    records = []
+    pending = []
+    for path, size, mtime_ns in scan_tree(folder):
+        record = {'tree': tree, 'folder': str(folder), 'path': path, 'key': plugin_key(tree, path.rpartition('/')[2]),
+                  'status': 'active', 'size': size, 'mtime_ns': mtime_ns}
+        old = previous.get((tree, str(folder), path))
+        if old is not None and old.get('size') == size and old.get('mtime_ns') == mtime_ns and old.get('sha256'):
+            for field in ('sha256', 'width', 'height', 'bit_depth', 'color_type', 'error'):
+                record[field] = old.get(field)
+        else:
+            pending.append(record)
+        records.append(record)
+
+    # hashlib 处理大块数据时会释放 GIL，多个线程可以同时读取和计算哈希
+    tasks = [pending[start:start + TASK_FILES] for start in range(0, len(pending), TASK_FILES)]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for task, infos in zip(tasks, executor.map(read_task, [[folder / record['path'] for record in task]
+                                                               for task in tasks])):
+            for record, info in zip(task, infos):
+                record.update(info)
+    return records, len(pending)
+
+def find_issues(files, dumps):
+    """
+    标记被覆盖的文件并收集索引中的问题
+
+    Args:
+        files (list): 按插件加载顺序排列的替换文件夹记录，原地更新 'status'
+        dumps (list): 导出文件夹的记录
+
+    Returns:
+        dict: 'collisions'、'duplicates'、'mismatches' 和 'invalid' 列表
+    """
+
+    by_key = {}
+    for record in files:
+        by_key.setdefault((record['tree'], record['key']), []).append(record)
+
+    collisions = []
+    mismatches = []
+    for (tree, key), records in by_key.items():
+        if len(records) < 2:
+            continue
+        # 缓存按加载顺序填充，同名文件中最后一个生效
+        for record in records[:-1]:
+            record['status'] = 'shadowed'
+        collisions.append({'tree': tree, 'key': key, 'winner': records[-1]['path'],
+                           'shadowed': [record['path'] for record in records[:-1]]})
+        sizes = {(record['width'], record['height']) for record in records if not record['error']}
+        if len(sizes) > 1:
+            mismatches.append({'tree': tree, 'key': key, 'kind': 'collision',
+                               'files': [f"{record['path']} {record['width']}x{record['height']}"
+                                         for record in records if not record['error']]})
+
+    for record in dumps:
+        replacement = by_key.get((record['tree'], record['key']))
+        if not replacement or record['error'] or replacement[-1]['error']:
+            continue
+        winner = replacement[-1]
+        if (winner['width'], winner['height']) != (record['width'], record['height']):
+            mismatches.append({'tree': record['tree'], 'key': record['key'], 'kind': 'dump',
+                               'files': [f"{winner['path']} {winner['width']}x{winner['height']}",
+                                         f"dump {record['path']} {record['width']}x{record['height']}"]})
+
+    invalid = []
+    for record in files:
+        if record['error']:
+            record['status'] = 'invalid'
+            invalid.append({'tree': record['tree'], 'path': record['path'], 'error': record['error']})
+        elif record['tree'] == 'texture' and not record['path'].endswith('.png'):
+            # 查找的名称以 .png 结尾，其他大小写的名称永远找不到
+            record['status'] = 'unreachable'
+            invalid.append({'tree': record['tree'], 'path': record['path'],
+                            'error': "扩展名不是小写的 .png，插件永远不会查找它"})
+
+    by_hash = {}
+    for record in files:
+        if record['sha256']:
+            by_hash.setdefault(record['sha256'], []).append(record)
+    duplicates = []
+    for digest, records in by_hash.items():
+        if len(records) < 2:
+            continue
+        for record in records[1:]:
+            record['duplicate_of'] = f"{records[0]['tree']}:{records[0]['path']}"
+        duplicates.append({'sha256': digest, 'size': records[0]['size'],
+                           'files': [f"{record['tree']}:{record['path']}" for record in records]})
+    duplicates.sort(key=lambda item: -item['size'] * (len(item['files']) - 1))
+
+    return {'collisions': collisions, 'duplicates': duplicates, 'mismatches': mismatches, 'invalid': invalid}
+
+def load_previous(index_file):
+    """
+    加载上次 JSON 索引中的文件记录
+
+    Args:
+        index_file (Path): 本工具写入的 JSON 索引，可以不存在
+
+    Returns:
+        dict: (tree, folder, path) -> 记录
+    """
+
+    try:
+        index = json.loads(index_file.read_text(encoding='utf-8'))
+        records = index['files'] + index['dumps']
+        return {(record['tree'], record['folder'], record['path']): record for record in records}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+def write_csv(csv_file, files):
+    """
+    为每个替换文件写入一行
+
+    Args:
+        csv_file (Path): 输出文件，为 Excel 写入字节顺序标记
+        files (list): 替换文件夹的记录
+    """
+
+    csv_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(csv_file, 'w', encoding='utf-8-sig', newline='') as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(CSV_FIELDNAMES)
+        for record in files:
+            writer.writerow([record['tree'], record['path'], record['key'], record['status'], record['size'],
+                             record['width'], record['height'], record['bit_depth'], record['color_type'],
+                             record['sha256'], record.get('duplicate_of', '')])
+
+def pop_option(args, name, default=None):
+    """
+    从参数列表中移除一个带值的选项
+
+    支持 "--name value" 和 "--name=value" 两种形式
+
+    Args:
+        args (list): 参数列表，会被原地修改
+        name (str): 选项名
+        default (str): 选项不存在时返回的值
+
+    Returns:
+        str: 选项值，选项没有值时为 None
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """打印命令行用法"""
+
+    print("纹理替换索引工具")
+    print("为 Texture 和 UI/Sprite 文件夹建立索引，报告插件会覆盖、重复和尺寸不符的文件")
+    print()
+    print("用法:")
+    print("  python script.py <language_folder> [--dump <dump_folder>] [--output index.json] [--csv index.csv]")
+    print("                   [--jobs N] [--top N]")
+    print()
+    print("示例:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese --output texture_index.json")
+    print("  python script.py ./Chinese --dump ./BepInEx/JustAnotherTranslator/Dump --csv texture_index.csv")
+    print()
+    print("参数:")
+    print("  language_folder: 包含 Texture 和 UI/Sprite 的文件夹")
+    print("  --dump: （可选）包含 Texture 和 UI/Sprite 的导出文件夹，报告尺寸与导出的原图")
+    print("          不同的替换文件")
+    print("  --output: （可选）JSON 索引，自上次索引以来未改变的文件不再读取")
+    print("  --csv: （可选）每个替换文件一行的 CSV 索引")
+    print("  --jobs N: （可选）使用 N 个线程读取文件，0 表示根据 CPU 选择（默认为 0）")
+    print("  --top N: （可选）每个部分列出的问题数，0 表示全部列出（默认为 10）")
+    print()
+    print("注意:")
+    print("  - 纹理按文件名查找，精灵图按不含扩展名的文件名查找；同名文件中使用")
+    print("    Directory.GetFiles 顺序中的最后一个")
+    print()
+
+def main():
+    """处理命令行参数的主函数"""
+
+    args = sys.argv.copy()
+    if len(args) < 2 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    jobs = pop_option(args, "--jobs", "0")
+    if jobs is None or not jobs.isdigit():
+        print("错误：--jobs 需要一个非负整数")
+        return 2
+    jobs = int(jobs) or min(32, (os.cpu_count() or 1) + 4)
+
+    top = pop_option(args, "--top", str(REPORT_TOP_ISSUES))
+    if top is None or not top.isdigit():
+        print("错误：--top 需要一个非负整数")
+        return 2
+    top = int(top) or None
+
+    paths = {}
+    for option in ("--dump", "--output", "--csv"):
+        value = pop_option(args, option)
+        if option in sys.argv and value is None:
+            print(f"错误：{option} 需要一个路径")
+            return 2
+        paths[option] = Path(value) if value is not None else None
+
+    language_folder = Path(args[1])
+    for path in (language_folder, paths["--dump"]):
+        if path is not None and not path.is_dir():
+            print(f"错误：文件夹 {path} 不存在")
+            return 2
+
+    start_time = time.perf_counter()
+    previous = load_previous(paths["--output"]) if paths["--output"] is not None else {}
+    files = []
+    dumps = []
+    read_count = 0
+    for tree, parts in TREES.items():
+        records, count = index_files(language_folder.joinpath(*parts), tree, previous, jobs)
+        files.extend(records)
+        read_count += count
+        if paths["--dump"] is not None:
+            records, count = index_files(paths["--dump"].joinpath(*parts), tree, previous, jobs)
+            dumps.extend(records)
+            read_count += count
+    if not files:
+        print(f"在 {language_folder.joinpath('Texture')} 或 {language_folder.joinpath('UI', 'Sprite')} 中未找到 .png 文件")
+        return 0
+
+    issues = find_issues(files, dumps)
+    total_size = sum(record['size'] for record in files)
+    print(f"已索引 {len(files):,} 个文件（{total_size / (1024 * 1024):.1f} MB）"
+          + (f"和 {len(dumps):,} 个导出的原图" if dumps else "")
+          + f"，读取 {read_count:,} 个，耗时 {time.perf_counter() - start_time:.2f} 秒")
+
+    def print_section(title, items, describe):
+        if not items:
+            return
+        print()
+        print(f"{title}（{len(items)}）：")
+        for item in items[:top]:
+            print(f"  {describe(item)}")
+        if top is not None and len(items) > top:
+            print(f"  ……另有 {len(items) - top} 条")
+
+    print_section("重名文件，插件使用最后一个", issues['collisions'],
+                  lambda item: f"{item['tree']} \"{item['key']}\"：使用 {item['winner']}，覆盖 {', '.join(item['shadowed'])}")
+    print_section("内容完全相同的文件", issues['duplicates'],
+                  lambda item: f"{item['size']:,} 字节 x {len(item['files'])}：{', '.join(item['files'][:REPORT_GROUP_FILES])}"
+                  + (f" 等另外 {len(item['files']) - REPORT_GROUP_FILES} 个" if len(item['files']) > REPORT_GROUP_FILES else ""))
+    print_section("尺寸不符", issues['mismatches'],
+                  lambda item: f"{item['tree']} \"{item['key']}\"：{', '.join(item['files'])}")
+    print_section("无效或无法查找到的文件", issues['invalid'],
+                  lambda item: f"{item['tree']} {item['path']}：{item['error']}")
+
+    wasted = sum(item['size'] * (len(item['files']) - 1) for item in issues['duplicates'])
+    print()
+    print(f"被覆盖的文件：{sum(record['status'] == 'shadowed' for record in files):,}，"
+          f"重复的字节数：{wasted:,}")
+
+    if paths["--output"] is not None:
+        index = {'language_folder': str(language_folder), 'dump_folder': str(paths["--dump"]) if dumps else None,
+                 'files': files, 'dumps': dumps, **issues}
+        paths["--output"].parent.mkdir(parents=True, exist_ok=True)
+        with open(paths["--output"], 'w', encoding='utf-8') as outfile:
+            json.dump(index, outfile, ensure_ascii=False, indent=1)
+        print(f"✓ JSON 索引已写入 {paths['--output']}")
+    if paths["--csv"] is not None:
+        write_csv(paths["--csv"], files)
+        print(f"✓ CSV 索引已写入 {paths['--csv']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Index the texture and sprite replacement folders and report name collisions, duplicates and size mismatches
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import csv
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Every PNG file starts with these 8 bytes
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Chunk length and type, followed by the data and a CRC-32 of type and data
+CHUNK_HEADER = struct.Struct('>I4s')
+
+# Width, height, bit depth, color type, compression, filter and interlace method
+IHDR = struct.Struct('>IIBBBBB')
+
+# Samples per pixel of each color type
+COLOR_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+# Replacement folders under the language folder, and dump folders under the dump folder, of each tree
+TREES = {
+    'texture': ('Texture',),
+    'sprite': ('UI', 'Sprite')
+}
+
+# File content is hashed in blocks of this size
+HASH_BLOCK_SIZE = 1 << 20
+
+# Files read per worker thread task
+TASK_FILES = 256
+
+# Issues listed per section by default
+REPORT_TOP_ISSUES = 10
+
+# Files listed per duplicate group
+REPORT_GROUP_FILES = 3
+
+# Columns of the CSV index
+CSV_FIELDNAMES = ('Tree', 'Path', 'Key', 'Status', 'Size', 'Width', 'Height', 'BitDepth', 'ColorType',
+                  'SHA256', 'DuplicateOf')
+
+def ordinal_key(text):
+    """
+    Sort key matching .NET StringComparer.Ordinal, which compares UTF-16 code units
+
+    Args:
+        text (str): Text to sort
+
+    Returns:
+        bytes: UTF-16 big-endian encoding of the text
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def scan_tree(root):
+    """
+    List the .png files of a folder in the order Directory.GetFiles(path, "*.png", AllDirectories) returns them
+
+    Mono lists the files of a folder, then the files of each subfolder, recursively. Windows lists
+    the names of NTFS folders in case-insensitive order.
+
+    Args:
+        root (Path): Folder, a missing folder gives no files
+
+    Returns:
+        list: (path relative to root with /, size, modification time in ns) tuples
+    """
+
+    def name_key(entry):
+        return ordinal_key(entry.name.upper())
+
+    files = []
+    stack = [('', str(root))]
+    while stack:
+        prefix, folder = stack.pop()
+        try:
+            with os.scandir(folder) as scanner:
+                entries = sorted(scanner, key=name_key)
+        except OSError:
+            continue
+        subfolders = []
+        for entry in entries:
+            if entry.is_dir():
+                subfolders.append((prefix + entry.name + '/', entry.path))
+            elif entry.name.lower().endswith('.png') and entry.is_file():
+                stat = entry.stat()
+                files.append((prefix + entry.name, stat.st_size, stat.st_mtime_ns))
+        # Popped in reverse, so subfolders are visited in order
+        stack.extend(reversed(subfolders))
+    return files
+
+def plugin_key(tree, name):
+    """
+    Name a file is looked up by, the key of TextureReplaceManger.FilePathCache or UITranslateManager.SpritePathCache
+
+    Args:
+        tree (str): Key of TREES
+        name (str): File name
+
+    Returns:
+        str: File name for textures, file name without extension for sprites
+    """
+
+    if tree == 'texture':
+        return name
+    return name.rpartition('.')[0] or name
+
+def read_png_info(file_path):
+    """
+    Hash a PNG file and read the image size from its IHDR chunk
+
+    Args:
+        file_path (Path): PNG file
+
+    Returns:
+        dict: 'sha256', 'width', 'height', 'bit_depth', 'color_type' and 'error' (None for a valid header)
+    """
+
+    info = {'sha256': None, 'width': None, 'height': None, 'bit_depth': None, 'color_type': None, 'error': None}
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, 'rb') as infile:
+            block = infile.read(HASH_BLOCK_SIZE)
+            head = block[:len(PNG_SIGNATURE) + CHUNK_HEADER.size + IHDR.size]
+            while block:
+                digest.update(block)
+                block = infile.read(HASH_BLOCK_SIZE)
+    except OSError as e:
+        info['error'] = f"cannot read: {e}"
+        return info
+    info['sha256'] = digest.hexdigest()
+
+    if not head.startswith(PNG_SIGNATURE):
+        info['error'] = "not a PNG file"
+    elif len(head) < len(PNG_SIGNATURE) + CHUNK_HEADER.size + IHDR.size:
+        info['error'] = "truncated PNG header"
+    elif CHUNK_HEADER.unpack_from(head, len(PNG_SIGNATURE)) != (IHDR.size, b'IHDR'):
+        info['error'] = "first chunk is not IHDR"
+    else:
+        width, height, bit_depth, color_type = IHDR.unpack_from(head, len(PNG_SIGNATURE) + CHUNK_HEADER.size)[:4]
+        info.update(width=width, height=height, bit_depth=bit_depth, color_type=color_type)
+        if not width or not height or color_type not in COLOR_CHANNELS:
+            info['error'] = f"invalid IHDR {width}x{height}, color type {color_type}"
+    return info
+
+def read_task(file_paths):
+    """
+    Read the PNG information of several files in a worker thread
+
+    Args:
+        file_paths (list): PNG files
+
+    Returns:
+        list: Results of read_png_info in the same order
+    """
+
+    return [read_png_info(file_path) for file_path in file_paths]
+
+def index_files(folder, tree, previous, jobs):
+    """
+    Scan a folder and read the information of its files, reusing the previous index for unchanged files
+
+    Args:
+        folder (Path): Replacement or dump folder
+        tree (str): Key of TREES
+        previous (dict): (tree, folder, path) -> record of the previous index
+        jobs (int): Number of worker threads
+
+    Returns:
+        tuple: (records in plugin load order, number of files read)
+    """
+
+    records = []
+    pending = []
+    for path, size, mtime_ns in scan_tree(folder):
+        record = {'tree': tree, 'folder': str(folder), 'path': path, 'key': plugin_key(tree, path.rpartition('/')[2]),
+                  'status': 'active', 'size': size, 'mtime_ns': mtime_ns}
+        old = previous.get((tree, str(folder), path))
+        if old is not None and old.get('size') == size and old.get('mtime_ns') == mtime_ns and old.get('sha256'):
+            for field in ('sha256', 'width', 'height', 'bit_depth', 'color_type', 'error'):
+                record[field] = old.get(field)
+        else:
+            pending.append(record)
+        records.append(record)
+
+    # hashlib releases the GIL on large blocks, threads overlap the reads and the hashing
+    tasks = [pending[start:start + TASK_FILES] for start in range(0, len(pending), TASK_FILES)]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for task, infos in zip(tasks, executor.map(read_task, [[folder / record['path'] for record in task]
+                                                               for task in tasks])):
+            for record, info in zip(task, infos):
+                record.update(info)
+    return records, len(pending)
+
+def find_issues(files, dumps):
+    """
+    Mark shadowed files and collect the issues of the index
+
+    Args:
+        files (list): Records of the replacement folders in plugin load order, 'status' is updated in place
+        dumps (list): Records of the dump folders
+
+    Returns:
+        dict: 'collisions', 'duplicates', 'mismatches' and 'invalid' lists
+    """
+
+    by_key = {}
+    for record in files:
+        by_key.setdefault((record['tree'], record['key']), []).append(record)
+
+    collisions = []
+    mismatches = []
+    for (tree, key), records in by_key.items():
+        if len(records) < 2:
+            continue
+        # The cache is filled in load order, the last file of a name wins
+        for record in records[:-1]:
+            record['status'] = 'shadowed'
+        collisions.append({'tree': tree, 'key': key, 'winner': records[-1]['path'],
+                           'shadowed': [record['path'] for record in records[:-1]]})
+        sizes = {(record['width'], record['height']) for record in records if not record['error']}
+        if len(sizes) > 1:
+            mismatches.append({'tree': tree, 'key': key, 'kind': 'collision',
+                               'files': [f"{record['path']} {record['width']}x{record['height']}"
+                                         for record in records if not record['error']]})
+
+    for record in dumps:
+        replacement = by_key.get((record['tree'], record['key']))
+        if not replacement or record['error'] or replacement[-1]['error']:
+            continue
+        winner = replacement[-1]
+        if (winner['width'], winner['height']) != (record['width'], record['height']):
+            mismatches.append({'tree': record['tree'], 'key': record['key'], 'kind': 'dump',
+                               'files': [f"{winner['path']} {winner['width']}x{winner['height']}",
+                                         f"dump {record['path']} {record['width']}x{record['height']}"]})
+
+    invalid = []
+    for record in files:
+        if record['error']:
+            record['status'] = 'invalid'
+            invalid.append({'tree': record['tree'], 'path': record['path'], 'error': record['error']})
+        elif record['tree'] == 'texture' and not record['path'].endswith('.png'):
+            # Lookups end with .png, a name with another case is never found
+            record['status'] = 'unreachable'
+            invalid.append({'tree': record['tree'], 'path': record['path'],
+                            'error': "extension is not lowercase .png, the plugin never looks it up"})
+
+    by_hash = {}
+    for record in files:
+        if record['sha256']:
+            by_hash.setdefault(record['sha256'], []).append(record)
+    duplicates = []
+    for digest, records in by_hash.items():
+        if len(records) < 2:
+            continue
+        for record in records[1:]:
+            record['duplicate_of'] = f"{records[0]['tree']}:{records[0]['path']}"
+        duplicates.append({'sha256': digest, 'size': records[0]['size'],
+                           'files': [f"{record['tree']}:{record['path']}" for record in records]})
+    duplicates.sort(key=lambda item: -item['size'] * (len(item['files']) - 1))
+
+    return {'collisions': collisions, 'duplicates': duplicates, 'mismatches': mismatches, 'invalid': invalid}
+
+def load_previous(index_file):
+    """
+    Load the file records of a previous JSON index
+
+    Args:
+        index_file (Path): JSON index written by this tool, may not exist
+
+    Returns:
+        dict: (tree, folder, path) -> record
+    """
+
+    try:
+        index = json.loads(index_file.read_text(encoding='utf-8'))
+        records = index['files'] + index['dumps']
+        return {(record['tree'], record['folder'], record['path']): record for record in records}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+def write_csv(csv_file, files):
+    """
+    Write one row per replacement file
+
+    Args:
+        csv_file (Path): Output file, written with a byte order mark for Excel
+        files (list): Records of the replacement folders
+    """
+
+    csv_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(csv_file, 'w', encoding='utf-8-sig', newline='') as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(CSV_FIELDNAMES)
+        for record in files:
+            writer.writerow([record['tree'], record['path'], record['key'], record['status'], record['size'],
+                             record['width'], record['height'], record['bit_depth'], record['color_type'],
+                             record['sha256'], record.get('duplicate_of', '')])
+
+def pop_option(args, name, default=None):
+    """
+    Remove an option with a value from the argument list
+
+    Supports both "--name value" and "--name=value"
+
+    Args:
+        args (list): Argument list, modified in place
+        name (str): Option name
+        default (str): Value returned when the option is not present
+
+    Returns:
+        str: Option value, None if the option has no value
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """Print command line usage"""
+
+    print("Texture Replacement Indexer")
+    print("Index the Texture and UI/Sprite folders and report what the plugin shadows, duplicates and resizes")
+    print()
+    print("Usage:")
+    print("  python script.py <language_folder> [--dump <dump_folder>] [--output index.json] [--csv index.csv]")
+    print("                   [--jobs N] [--top N]")
+    print()
+    print("Examples:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese --output texture_index.json")
+    print("  python script.py ./Chinese --dump ./BepInEx/JustAnotherTranslator/Dump --csv texture_index.csv")
+    print()
+    print("Parameters:")
+    print("  language_folder: Folder holding Texture and UI/Sprite")
+    print("  --dump: (optional) Dump folder holding Texture and UI/Sprite, replacements whose size differs")
+    print("          from the dumped original are reported")
+    print("  --output: (optional) JSON index, files unchanged since the previous index are not read again")
+    print("  --csv: (optional) CSV index with one row per replacement file")
+    print("  --jobs N: (optional) Read files in N threads, 0 picks a number for the CPU (defaults to 0)")
+    print("  --top N: (optional) Number of issues listed per section, 0 lists all (defaults to 10)")
+    print()
+    print("Notes:")
+    print("  - Textures are looked up by file name, sprites by file name without extension; of files with")
+    print("    the same name the last one in Directory.GetFiles order is used")
+    print()
+
+def main():
+    """Main function to handle command line arguments"""
+
+    args = sys.argv.copy()
+    if len(args) < 2 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    jobs = pop_option(args, "--jobs", "0")
+    if jobs is None or not jobs.isdigit():
+        print("Error: --jobs requires a non-negative integer")
+        return 2
+    jobs = int(jobs) or min(32, (os.cpu_count() or 1) + 4)
+
+    top = pop_option(args, "--top", str(REPORT_TOP_ISSUES))
+    if top is None or not top.isdigit():
+        print("Error: --top requires a non-negative integer")
+        return 2
+    top = int(top) or None
+
+    paths = {}
+    for option in ("--dump", "--output", "--csv"):
+        value = pop_option(args, option)
+        if option in sys.argv and value is None:
+            print(f"Error: {option} requires a path")
+            return 2
+        paths[option] = Path(value) if value is not None else None
+
+    language_folder = Path(args[1])
+    for path in (language_folder, paths["--dump"]):
+        if path is not None and not path.is_dir():
+            print(f"Error: Folder {path} does not exist")
+            return 2
+
+    start_time = time.perf_counter()
+    previous = load_previous(paths["--output"]) if paths["--output"] is not None else {}
+    files = []
+    dumps = []
+    read_count = 0
+    for tree, parts in TREES.items():
+        records, count = index_files(language_folder.joinpath(*parts), tree, previous, jobs)
+        files.extend(records)
+        read_count += count
+        if paths["--dump"] is not None:
+            records, count = index_files(paths["--dump"].joinpath(*parts), tree, previous, jobs)
+            dumps.extend(records)
+            read_count += count
+    if not files:
+        print(f"No .png files found in {language_folder.joinpath('Texture')} or {language_folder.joinpath('UI', 'Sprite')}")
+        return 0
+
+    issues = find_issues(files, dumps)
+    total_size = sum(record['size'] for record in files)
+    print(f"Indexed {len(files):,} files ({total_size / (1024 * 1024):.1f} MB)"
+          + (f" and {len(dumps):,} dumped originals" if dumps else "")
+          + f", read {read_count:,} in {time.perf_counter() - start_time:.2f} s")
+
+    def print_section(title, items, describe):
+        if not items:
+            return
+        print()
+        print(f"{title} ({len(items)}):")
+        for item in items[:top]:
+            print(f"  {describe(item)}")
+        if top is not None and len(items) > top:
+            print(f"  ... {len(items) - top} more")
+
+    print_section("Name collisions, the plugin uses the last file", issues['collisions'],
+                  lambda item: f"{item['tree']} \"{item['key']}\": uses {item['winner']}, shadows {', '.join(item['shadowed'])}")
+    print_section("Byte-identical files", issues['duplicates'],
+                  lambda item: f"{item['size']:,} bytes x {len(item['files'])}: {', '.join(item['files'][:REPORT_GROUP_FILES])}"
+                  + (f" and {len(item['files']) - REPORT_GROUP_FILES} more" if len(item['files']) > REPORT_GROUP_FILES else ""))
+    print_section("Size mismatches", issues['mismatches'],
+                  lambda item: f"{item['tree']} \"{item['key']}\": {', '.join(item['files'])}")
+    print_section("Invalid or unreachable files", issues['invalid'],
+                  lambda item: f"{item['tree']} {item['path']}: {item['error']}")
+
+    wasted = sum(item['size'] * (len(item['files']) - 1) for item in issues['duplicates'])
+    print()
+    print(f"Shadowed files: {sum(record['status'] == 'shadowed' for record in files):,}, "
+          f"duplicate bytes: {wasted:,}")
+
+    if paths["--output"] is not None:
+        index = {'language_folder': str(language_folder), 'dump_folder': str(paths["--dump"]) if dumps else None,
+                 'files': files, 'dumps': dumps, **issues}
+        paths["--output"].parent.mkdir(parents=True, exist_ok=True)
+        with open(paths["--output"], 'w', encoding='utf-8') as outfile:
+            json.dump(index, outfile, ensure_ascii=False, indent=1)
+        print(f"✓ JSON index written to {paths['--output']}")
+    if paths["--csv"] is not None:
+        write_csv(paths["--csv"], files)
+        print(f"✓ CSV index written to {paths['--csv']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1086 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: 按插件的查找顺序离线翻译文本导出，报告翻译包的覆盖率
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import csv
+import io
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# TxtTranslationFileProcessor 会从译文中移除此字符，见 XUAT RedirectedResourceDetectionStrategy
+MONGOLIAN_VOWEL_SEPARATOR = '\u180e'
+
+# dotnet_regex_to_python 改写的 .NET 正则分组：命名分组、平衡分组和内联选项
+DOTNET_GROUP = re.compile(r"\(\?(?:<(?![=!])([^>]*)>|'([^']*)'|([imnsx-]+)([:)]))")
+
+# StreamReader.ReadLine 的换行符
+LINE_BREAK = re.compile(r'\r\n|\r|\n')
+
+# UTF-8 BOM，只在文件开头被跳过
+BYTE_ORDER_MARK = '\ufeff'
+
+# StringTool.NormalizeText 修剪的空白字符
+WHITESPACE_CHARS = ('\t\n\v\f\r \u0085\u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008'
+                    '\u2009\u200a\u200b\u2028\u2029\u3000\ufeff')
+
+# .txt 行原文中需要转义的字符，由 StringExtensions.Unescape 还原
+TXT_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\r': '\\r', '\n': '\\n'})
+
+# 文件头：魔数、版本、类型、标志、源文件数、条目数、正则规则数、
+# 字符串池字节数、文件头之后全部内容的 CRC-32
+HEADER = struct.Struct('<8sIIIIIIII')
+
+# 键表和正则规则表的条目：键（或模式）在字符串池中的字节偏移和长度，
+# 然后是译文（或模板）的字节偏移和长度
+ENTRY = struct.Struct('<IIII')
+
+# 字符串池的编码，即 .NET 字符串的编码，插件无需解码即可用序数比较二分查找键表
+POOL_ENCODING = 'utf-16-le'
+
+KIND_SUFFIXES = ('.txt', '.csv')
+
+# StringExtensions.Unescape 支持的转义序列，其他序列保持原样
+ESCAPES = {
+    '0': '\0',
+    'a': '\a',
+    'b': '\b',
+    't': '\t',
+    'n': '\n',
+    'v': '\v',
+    'f': '\f',
+    'r': '\r',
+    "'": "'",
+    '"': '"',
+    '\\': '\\'
+}
+
+# 索引文件的起始字节
+INDEX_MAGIC = b'JATINDEX'
+
+# 格式版本，布局每次发生不兼容的变化时递增
+INDEX_VERSION = 1
+
+# 索引类型、其替代的加载器，以及该加载器读取的文件后缀
+INDEX_KINDS = ('Text', 'UI')
+
+# TextTranslateManger.GetTranslateText 按尝试顺序排列的查找阶段及其报告名称
+STAGES = {
+    'blank': "空白，不翻译",
+    'xuat': "XUAT 标记，不翻译",
+    'translated_text': "已是译文（IsJatTranslatedText）",
+    'bracket': "[...] 文本，不翻译",
+    'exact': "精确翻译",
+    'normalized': "规范化翻译",
+    'regex': "$ 正则规则",
+    'miss': "未翻译，会被插件导出"
+}
+
+# 翻译文本的阶段，以及不翻译也不导出文本的阶段
+HIT_STAGES = ('translated_text', 'exact', 'normalized', 'regex')
+SKIP_STAGES = ('blank', 'xuat', 'bracket')
+
+# [HF] 等角色名占位符，StringTool.CharaNameTokenRegex
+CHARA_NAME_TOKEN = re.compile(r'\[[A-Z][A-Z0-9]*\]')
+
+# 规范化导出文件的后缀，其中重复了 _untranslate.txt 导出中的文本
+NORMALIZED_DUMP_SUFFIX = '_untranslate_normalized.txt'
+
+# 每个工作任务的不重复文本数
+TASK_TEXTS = 5000
+
+# 默认列出的未命中数
+REPORT_TOP_MISSES = 20
+
+# 工作进程的查找表，由 init_worker 设置
+ENGINE = None
+
+def dotnet_regex_to_python(pattern):
+    """
+    将 .NET 特有的正则语法改写为 Python re 语法，以便编译检查
+
+    只保留语法：\\p{L} 等 Unicode 类别变为 \\w，平衡分组变为非捕获分组，内联选项被删除。
+
+    Args:
+        pattern (str): .NET 正则
+
+    Returns:
+        str: Python 正则
+    """
+
+    result = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\' and index + 1 < len(pattern):
+            escape = pattern[index + 1]
+            close = -1
+            if escape in 'pP' and pattern.startswith('{', index + 2):
+                close = pattern.find('}', index + 3)
+                replacement = '\\w' if escape == 'p' else '\\W'
+            elif escape == 'c' and index + 2 < len(pattern):
+                close = index + 2
+                replacement = '\\x00'
+            elif escape == 'k' and pattern[index + 2:index + 3] in ('<', "'"):
+                close = pattern.find('>' if pattern[index + 2] == '<' else "'", index + 3)
+                name = pattern[index + 3:close]
+                replacement = f'\\{name}' if name.isdigit() else f'(?P={name})'
+            if close > 0:
+                result.append(replacement)
+                index = close + 1
+                continue
+            result.append({'z': '\\Z', 'G': '', 'e': '\\x1b'}.get(escape, pattern[index:index + 2]))
+            index += 2
+            continue
+
+        match = DOTNET_GROUP.match(pattern, index) if char == '(' else None
+        if match is None:
+            result.append(char)
+            index += 1
+            continue
+        name = match.group(1) if match.group(1) is not None else match.group(2)
+        if name is not None:
+            result.append(f'(?P<{name}>' if name.isidentifier() else '(?:')
+        elif match.group(4) == ':':
+            result.append('(?:')
+        index = match.end()
+    return ''.join(result)
+
+def shorten(text, length=40):
+    """
+    缩短报告行中的文本
+
+    Args:
+        text (str): 文本
+        length (int): 最大长度
+
+    Returns:
+        str: 文本，超过 length 时截断并加上 "..."
+    """
+
+    return text if len(text) <= length else text[:length] + "..."
+
+def normalize_text(text):
+    """
+    与插件中的 StringTool.NormalizeText 相同的方式规范化文本
+
+    Args:
+        text (str): 文本
+
+    Returns:
+        str: 去除 \\r、\\n 和 \\t，修剪空白并转为大写的文本
+    """
+
+    return text.replace('\r', '').replace('\n', '').replace('\t', '').strip(WHITESPACE_CHARS).upper()
+
+def read_entry(index, table_offset, position):
+    """
+    读取键表或正则规则表中的一个条目
+
+    Args:
+        index (dict): open_index 返回的索引
+        table_offset (int): 表的字节偏移
+        position (int): 条目在表中的序号
+
+    Returns:
+        tuple: (键或模式, 译文或模板)
+    """
+
+    index_map = index['map']
+    pool_offset = index['pool_offset']
+    key_offset, key_length, value_offset, value_length = ENTRY.unpack_from(index_map, table_offset + position * ENTRY.size)
+    key_start = pool_offset + key_offset
+    value_start = pool_offset + value_offset
+    return (index_map[key_start:key_start + key_length].decode(POOL_ENCODING, 'surrogatepass'),
+            index_map[value_start:value_start + value_length].decode(POOL_ENCODING, 'surrogatepass'))
+
+def iter_translations(index):
+    """
+    按键的顺序产出索引中的翻译
+
+    Args:
+        index (dict): open_index 返回的索引
+
+    Yields:
+        tuple: (键, 译文)
+    """
+
+    for position in range(index['entry_count']):
+        yield read_entry(index, HEADER.size, position)
+
+def is_member_path_unsafe(member_name):
+    """
+    与插件中的 FileTool.IsZipPathUnsafe 相同的方式检查压缩包成员名
+
+    拒绝空名称、上级目录引用以及绝对路径或带根路径。
+
+    Args:
+        member_name (str): 压缩包中的成员名
+
+    Returns:
+        bool: 成员不可使用时为 True
+    """
+
+    if not member_name:
+        return True
+
+    # 统一路径分隔符
+    normalized_path = member_name.replace('\\', '/')
+
+    # 拒绝 "../"
+    if '../' in normalized_path:
+        return True
+
+    # 拒绝绝对路径，包括 Windows 盘符路径
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def ordinal_key(text):
+    """
+    与 .NET StringComparer.Ordinal 一致的排序键，按 UTF-16 码元比较
+
+    Args:
+        text (str): 要排序的文本
+
+    Returns:
+        bytes: 文本的 UTF-16 大端编码
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def unescape(text, unknown_escapes=None):
+    """
+    与插件中的 StringExtensions.Unescape 相同的方式替换转义序列
+
+    未知序列连同反斜杠保持原样，文本末尾的反斜杠也保留。
+
+    Args:
+        text (str): 含转义序列的文本
+        unknown_escapes (list): 可选，接收未知序列，例如 "\\x"
+
+    Returns:
+        str: 反转义后的文本
+    """
+
+    index = text.find('\\')
+    if index < 0:
+        return text
+
+    parts = []
+    start = 0
+    while 0 <= index < len(text) - 1:
+        parts.append(text[start:index])
+        char = text[index + 1]
+        escaped = ESCAPES.get(char)
+        if escaped is None:
+            parts.append('\\' + char)
+            if unknown_escapes is not None:
+                unknown_escapes.append('\\' + char)
+        else:
+            parts.append(escaped)
+        start = index + 2
+        index = text.find('\\', start)
+    parts.append(text[start:])
+    return ''.join(parts)
+
+def add_translation_lines(data, source, translations, rules):
+    """
+    与 TxtTranslationFileProcessor 相同的方式解析 .txt 翻译文件的行
+
+    Args:
+        data (bytes): 文件内容
+        source (str): 报告中显示的文件名
+        translations (dict): 精确翻译，会被原地修改
+        rules (list): 正则规则，会被原地修改
+    """
+
+    text = data.decode('utf-8', 'replace')
+    if text.startswith(BYTE_ORDER_MARK):
+        text = text[1:]
+
+    for line_number, line in enumerate(LINE_BREAK.split(text), 1):
+        if not line or line[0] == ';':
+            continue
+        original, tab, translation = line.partition('\t')
+        if not tab:
+            continue
+        original = unescape(original)
+        translation = unescape(translation).replace(MONGOLIAN_VOWEL_SEPARATOR, '')
+        if not original or not translation:
+            continue
+        if line[0] == '$':
+            rules.append({'source': f"{source}:{line_number}", 'pattern': original[1:], 'template': translation})
+        else:
+            translations[original] = translation
+
+def loader_order_key(relative_path):
+    """
+    插件加载翻译文件顺序的排序键
+
+    插件先加载翻译文件夹根目录中的文件，再加载各子文件夹中的文件，
+    文件夹和文件都按序数路径排序 (FileTool.GetAllTranslationFiles)。
+
+    Args:
+        relative_path (Path): 相对于翻译文件夹的文件路径
+
+    Returns:
+        tuple: 排序键
+    """
+
+    folder = relative_path.parent.parts
+    return len(folder) > 0, ordinal_key('\\'.join(folder)), ordinal_key(relative_path.name)
+
+def find_source_files(input_path, suffix):
+    """
+    按插件的加载顺序查找文件夹中的翻译文件
+
+    Args:
+        input_path (Path): 翻译文件夹，或单个翻译文件或 .zip 文件
+        suffix (str): 翻译文件后缀
+
+    Returns:
+        list: (文件路径, 报告中显示的名称) 元组
+    """
+
+    if input_path.is_file():
+        return [(input_path, input_path.name)]
+    files = [file for file in input_path.rglob('*')
+             if file.is_file() and file.name.lower().endswith((suffix, '.zip'))]
+    files.sort(key=lambda file: loader_order_key(file.relative_to(input_path)))
+    return [(file, file.relative_to(input_path).as_posix()) for file in files]
+
+def iter_csv_lines(text):
+    """
+    逐行产出 CSV 文本，跳过 CsvHelper 忽略的注释行（AllowComments）
+
+    以 # 开头的行只有在引号字段之外才是注释，引号数量可以判断之前的行是否留下了未闭合的字段。
+
+    Args:
+        text (str): CSV 文本
+
+    Yields:
+        str: 带换行符的行
+    """
+
+    in_quotes = False
+    for line in io.StringIO(text, newline=''):
+        if not in_quotes and line.startswith('#'):
+            continue
+        if line.count('"') % 2:
+            in_quotes = not in_quotes
+        yield line
+
+def add_csv_rows(data, translations):
+    """
+    与 CsvTranslationFileProcessor 相同的方式解析 .csv 翻译文件
+
+    表头去除首尾空白后不区分大小写匹配，空行和只含空白的记录会被跳过，
+    没有 Term 或 Translation 的行会被忽略。
+
+    Args:
+        data (bytes): 文件内容
+        translations (dict): 翻译，会被原地修改
+    """
+
+    columns = None
+    for row in csv.reader(iter_csv_lines(data.decode('utf-8-sig', 'replace'))):
+        if all(not field or field.isspace() for field in row):
+            continue
+        if columns is None:
+            columns = {name.strip().lower(): index for index, name in reversed(list(enumerate(row)))}
+            continue
+        term_index = columns.get('term')
+        translation_index = columns.get('translation')
+        term = row[term_index] if term_index is not None and term_index < len(row) else None
+        translation = row[translation_index] if translation_index is not None and translation_index < len(row) else None
+        if term and translation:
+            translations[term] = translation
+
+def load_sources(input_path, kind, zip_in_order=False):
+    """
+    按 AsyncTranslationLoader 的方式加载翻译文件夹
+
+    后加载的文件会替换之前文件的翻译。.txt 文件的每个 $ 行都是一条独立的正则规则，
+    插件以 Regex 实例为键，因此相同的模式也都会保留。
+
+    Args:
+        input_path (Path): 翻译文件夹，或单个翻译文件或 .zip 文件
+        kind (int): 加载器在 INDEX_KINDS 中的序号
+        zip_in_order (bool): 按名称排序加载 zip 成员，而不是按存储顺序
+
+    Returns:
+        tuple: (翻译, (模式, 模板) 规则列表, 文件数)
+    """
+
+    suffix = KIND_SUFFIXES[kind]
+    translations = {}
+    rules = []
+
+    def add_file(data, name):
+        if suffix == '.csv':
+            add_csv_rows(data, translations)
+            return
+        file_rules = []
+        add_translation_lines(data, name, translations, file_rules)
+        rules.extend((rule['pattern'], rule['template']) for rule in file_rules)
+
+    files = find_source_files(input_path, suffix)
+    for file_path, name in files:
+        try:
+            if not file_path.name.lower().endswith('.zip'):
+                add_file(file_path.read_bytes(), name)
+                continue
+            with zipfile.ZipFile(file_path) as archive:
+                members = [info for info in archive.infolist()
+                           if not info.is_dir() and info.filename.lower().endswith(suffix)
+                           and not is_member_path_unsafe(info.filename)]
+                if zip_in_order:
+                    members.sort(key=lambda info: ordinal_key(info.filename))
+                for info in members:
+                    try:
+                        add_file(archive.read(info), f"{name}/{info.filename}")
+                    except (OSError, zipfile.BadZipFile, csv.Error) as e:
+                        print(f"✗ 读取 {name}/{info.filename} 时发生错误: {e}")
+        except (OSError, zipfile.BadZipFile, csv.Error) as e:
+            print(f"✗ 读取 {name} 时发生错误: {e}")
+    return translations, rules, len(files)
+
+def open_index(index_file):
+    """
+    内存映射索引文件并检查文件头
+
+    Args:
+        index_file (Path): 索引文件
+
+    Returns:
+        dict: 文件头字段、各表偏移，以及使用后需要关闭的 'map'
+
+    Raises:
+        ValueError: 文件不是受支持版本的索引
+    """
+
+    with open(index_file, 'rb') as file:
+        index_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(index_map) < HEADER.size:
+            raise ValueError("文件比索引文件头还短")
+        magic, version, kind, flags, file_count, entry_count, rule_count, pool_size, checksum = \
+            HEADER.unpack_from(index_map, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError("不是翻译索引文件")
+        if version != INDEX_VERSION:
+            raise ValueError(f"不支持索引版本 {version}，需要版本 {INDEX_VERSION}")
+        if kind >= len(INDEX_KINDS):
+            raise ValueError(f"未知的索引类型 {kind}")
+        pool_offset = HEADER.size + (entry_count + rule_count) * ENTRY.size
+        if pool_offset + pool_size != len(index_map):
+            raise ValueError("文件大小与文件头不符，索引已被截断或损坏")
+    except ValueError:
+        index_map.close()
+        raise
+
+    return {
+        'map': index_map,
+        'kind': kind,
+        'flags': flags,
+        'file_count': file_count,
+        'entry_count': entry_count,
+        'rule_count': rule_count,
+        'checksum': checksum,
+        'rules_offset': HEADER.size + entry_count * ENTRY.size,
+        'pool_offset': pool_offset
+    }
+
+def read_rules(index):
+    """
+    读取索引中的正则规则
+
+    Args:
+        index (dict): open_index 返回的索引
+
+    Returns:
+        list: 按加载顺序排列的 (模式, 模板) 规则
+    """
+
+    return [read_entry(index, index['rules_offset'], position) for position in range(index['rule_count'])]
+
+def load_tree(tree_path, kind, zip_in_order):
+    """
+    加载翻译文件夹或由 translation_index 构建的索引中的翻译
+
+    Args:
+        tree_path (Path): 翻译文件夹、翻译文件或 .zip 文件，或 .jatidx 索引
+        kind (int): 0 表示 Text 加载器，1 表示 UI 加载器
+        zip_in_order (bool): 按名称排序加载 zip 成员
+
+    Returns:
+        tuple: (翻译, (模式, 模板) 正则规则列表)
+    """
+
+    if tree_path.is_file() and tree_path.name.lower().endswith('.jatidx'):
+        index = open_index(tree_path)
+        try:
+            return dict(iter_translations(index)), read_rules(index)
+        finally:
+            index['map'].close()
+    translations, rules, _ = load_sources(tree_path, kind, zip_in_order)
+    return translations, rules
+
+def load_keywords(keyword_file):
+    """
+    加载 KeywordReplaceText.json，并与 UpdateKeywordReplaceRegex 相同地构建替换正则
+
+    Args:
+        keyword_file (Path): 关键词 -> 替换词的 JSON 对象
+
+    Returns:
+        tuple: (关键词字典, 已编译的正则，没有关键词时为 None)
+    """
+
+    keywords = json.loads(keyword_file.read_text(encoding='utf-8-sig')) or {}
+    # 最长的关键词优先，OrderByDescending 保持相同长度关键词在文件中的顺序
+    keys = sorted((key for key in keywords if key), key=lambda key: -len(key.encode('utf-16-le', 'surrogatepass')))
+    if not keys:
+        return keywords, None
+    return keywords, re.compile('|'.join(re.escape(key) for key in keys))
+
+def replace_keywords(text, keywords, keyword_regex):
+    """
+    与 TextTranslateManger.ReplaceKeyword 相同地替换译文中的关键词
+
+    Args:
+        text (str): 译文
+        keywords (dict): 关键词 -> 替换词
+        keyword_regex (re.Pattern): load_keywords 返回的正则，为 None 时保持文本不变
+
+    Returns:
+        str: 替换关键词后的译文
+    """
+
+    if not text or keyword_regex is None:
+        return text
+    return keyword_regex.sub(lambda match: keywords.get(match.group(), match.group()), text)
+
+def build_token_pattern(normalized_text):
+    """
+    构建匹配游戏填入角色名之后的译文的正则，与 StringTool.BuildTokenPattern 相同
+
+    Args:
+        normalized_text (str): 含有 [HF] 等占位符的规范化译文
+
+    Returns:
+        re.Pattern: 每个占位符替换为 .+ 的正则
+    """
+
+    parts = CHARA_NAME_TOKEN.split(normalized_text)
+    return re.compile('^' + '.+'.join(re.escape(part) for part in parts) + '$')
+
+def dotnet_group_numbers(regex):
+    """
+    将 .NET 分组编号映射为 Python 分组编号
+
+    .NET 先为未命名分组编号，再为命名分组编号，Python 则从左到右为所有分组编号。
+
+    Args:
+        regex (re.Pattern): 已编译的模式
+
+    Returns:
+        list: 每个 .NET 分组编号对应的 Python 分组编号
+    """
+
+    named = sorted(regex.groupindex.values())
+    unnamed = [number for number in range(1, regex.groups + 1) if number not in named]
+    return [0] + unnamed + named
+
+def expand_template(template, match, group_numbers, translations):
+    """
+    与 StringExtensions.Template 及 GetTranslateText 的回调相同地填充正则规则模板
+
+    $n 和 ${name} 替换为捕获的文本，捕获的文本有精确翻译时替换为其译文。
+    \\$ 表示字面的 $。与插件相同，位于模板最末尾的占位符会被丢弃。
+
+    Args:
+        template (str): 规则的译文模板
+        match (re.Match): 规则的匹配结果
+        group_numbers (list): dotnet_group_numbers 的结果
+        translations (dict): 精确翻译
+
+    Returns:
+        str: 译文
+    """
+
+    def captured(name):
+        try:
+            number = int(name)
+        except ValueError:
+            number = None
+        if number is not None:
+            group = group_numbers[number] if 0 <= number < len(group_numbers) else None
+        else:
+            group = name if name in match.re.groupindex else None
+        text = (match.group(group) or '') if group is not None else ''
+        return translations.get(text, text)
+
+    result = []
+    name = []
+    inside = False
+    braced = False
+    index = 0
+    while index < len(template):
+        char = template[index]
+        index += 1
+        if char == '\\' and template[index:index + 1] == '$':
+            result.append('$')
+            index += 1
+            continue
+        if char == '$':
+            inside = True
+            continue
+        if char == '{' and inside:
+            braced = True
+            continue
+        if char == '}' and inside and name:
+            result.append(captured(''.join(name)))
+            name = []
+            inside = braced = False
+            continue
+        if inside and not braced and not char.isdecimal():
+            result.append(captured(''.join(name)))
+            name = []
+            inside = False
+        if inside:
+            name.append(char)
+        else:
+            result.append(char)
+    return ''.join(result)
+
+def build_engine(translations, rules, keywords=None, keyword_regex=None):
+    """
+    准备离线引擎的查找表
+
+    插件的 IsJatTranslatedText 检查只知道当前场景中显示过的译文，这里翻译包的所有译文都计入，是一个上限。
+
+    Args:
+        translations (dict): 精确翻译
+        rules (list): 按加载顺序排列的 (模式, 模板) 正则规则
+        keywords (dict): 关键词替换（可选）
+        keyword_regex (re.Pattern): load_keywords 返回的正则（可选）
+
+    Returns:
+        tuple: (引擎字典, Python re 无法编译的规则的 (模式, 错误) 列表)
+    """
+
+    compiled_rules = []
+    failed_rules = []
+    for pattern, template in rules:
+        try:
+            regex = re.compile(dotnet_regex_to_python(pattern))
+        except re.error as e:
+            failed_rules.append((pattern, str(e)))
+            continue
+        compiled_rules.append((regex, template, dotnet_group_numbers(regex)))
+
+    # MarkTranslated 保存规范化的译文，并为含有角色名占位符的译文保存一个模式。
+    # 模式按第一个占位符之前和最后一个占位符之后的文本中较长者分桶，
+    # 只尝试文本位于所查找文本开头或结尾的桶。
+    translated_texts = set()
+    token_patterns = ({}, {})
+    for translation in set(translations.values()):
+        if translation.isspace():
+            continue
+        normalized = normalize_text(replace_keywords(translation, keywords, keyword_regex).replace(MONGOLIAN_VOWEL_SEPARATOR, ''))
+        translated_texts.add(normalized)
+        if CHARA_NAME_TOKEN.search(normalized):
+            parts = CHARA_NAME_TOKEN.split(normalized)
+            side = 1 if len(parts[-1]) > len(parts[0]) else 0
+            token_patterns[side].setdefault(parts[-1] if side else parts[0], []).append(build_token_pattern(normalized))
+
+    engine = {
+        'translations': translations,
+        'rules': compiled_rules,
+        'keywords': keywords or {},
+        'keyword_regex': keyword_regex,
+        'translated_texts': translated_texts,
+        'token_patterns': token_patterns,
+        'token_lengths': tuple(sorted({len(part) for part in patterns}) for patterns in token_patterns)
+    }
+    return engine, failed_rules
+
+def is_translated_text(engine, normalized):
+    """
+    与 IsJatTranslatedText 相同地检查文本是否为插件显示过的译文
+
+    Args:
+        engine (dict): build_engine 的结果
+        normalized (str): 不含 XUAT 标记的规范化文本
+
+    Returns:
+        bool: 文本是译文时为 True
+    """
+
+    if normalized in engine['translated_texts']:
+        return True
+    for side, patterns in enumerate(engine['token_patterns']):
+        for length in engine['token_lengths'][side]:
+            if length > len(normalized):
+                break
+            part = normalized[len(normalized) - length:] if side else normalized[:length]
+            for pattern in patterns.get(part, ()):
+                if pattern.match(normalized):
+                    return True
+    return False
+
+def translate(engine, text):
+    """
+    与 TextTranslateManger.GetTranslateText 相同地查找文本
+
+    Args:
+        engine (dict): build_engine 的结果
+        text (str): 游戏显示的文本
+
+    Returns:
+        tuple: (STAGES 的键, 译文或 None)
+    """
+
+    if not text or text.isspace():
+        return 'blank', None
+    if MONGOLIAN_VOWEL_SEPARATOR in text:
+        return 'xuat', None
+    normalized = normalize_text(text)
+    if is_translated_text(engine, normalized):
+        return 'translated_text', text
+    if text.startswith('[') and text.endswith(']'):
+        return 'bracket', None
+
+    translations = engine['translations']
+    keywords = engine['keywords']
+    keyword_regex = engine['keyword_regex']
+    translation = translations.get(text)
+    if translation is not None:
+        return 'exact', replace_keywords(translation, keywords, keyword_regex)
+    translation = translations.get(normalized)
+    if translation is not None:
+        return 'normalized', replace_keywords(translation, keywords, keyword_regex)
+
+    for regex, template, group_numbers in engine['rules']:
+        match = regex.search(text)
+        if (match is None or match.end() == match.start()) and normalized != text and normalized:
+            match = regex.search(normalized)
+        if match is None or match.end() == match.start():
+            continue
+        translation = expand_template(template, match, group_numbers, translations)
+        return 'regex', replace_keywords(translation, keywords, keyword_regex)
+    return 'miss', None
+
+def init_worker(engine):
+    """
+    工作进程初始化函数，为进程的每个任务保留查找表
+
+    Args:
+        engine (dict): build_engine 的结果
+    """
+
+    global ENGINE
+    ENGINE = engine
+
+def translate_task(texts):
+    """
+    工作进程入口，查找一批不重复的文本
+
+    Args:
+        texts (list): 文本
+
+    Returns:
+        list: 每个文本对应的 STAGES 键
+    """
+
+    return [translate(ENGINE, text)[0] for text in texts]
+
+def translate_texts(engine, texts, jobs=1):
+    """
+    查找不重复的文本，jobs 大于 1 时在工作进程中进行
+
+    Args:
+        engine (dict): build_engine 的结果
+        texts (list): 不重复的文本
+        jobs (int): 工作进程数
+
+    Returns:
+        list: 每个文本对应的 STAGES 键
+    """
+
+    tasks = [texts[start:start + TASK_TEXTS] for start in range(0, len(texts), TASK_TEXTS)]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), initializer=init_worker,
+                                 initargs=(engine,)) as executor:
+            results = list(executor.map(translate_task, tasks))
+    else:
+        init_worker(engine)
+        results = [translate_task(task) for task in tasks]
+    return [stage for result in results for stage in result]
+
+def find_dump_files(dump_path):
+    """
+    查找要查找的文本文件，每行一条文本
+
+    Args:
+        dump_path (Path): 递归查找 .txt 文件的文件夹，或单个文件
+
+    Returns:
+        list: 按路径排序的文件，不含 _normalized 导出
+    """
+
+    if dump_path.is_file():
+        return [dump_path]
+    return sorted(file for file in dump_path.rglob('*')
+                  if file.is_file() and file.name.lower().endswith('.txt') and not file.name.endswith(NORMALIZED_DUMP_SUFFIX))
+
+def read_dump(dump_file):
+    """
+    统计导出文件中的文本，插件每行写入一条文本
+
+    Args:
+        dump_file (Path): 文本文件
+
+    Returns:
+        Counter: 每条文本的行数
+    """
+
+    text = dump_file.read_bytes().decode('utf-8', 'replace')
+    if text.startswith(BYTE_ORDER_MARK):
+        text = text[1:]
+    return Counter(line for line in LINE_BREAK.split(text) if line)
+
+def hit_rate(stage_counts):
+    """
+    插件尝试翻译的文本中被翻译的比例
+
+    Args:
+        stage_counts (Counter): 每个 STAGES 键的行数
+
+    Returns:
+        float: 0 到 1 的命中率，所有文本都被跳过时为 None
+    """
+
+    hits = sum(stage_counts[stage] for stage in HIT_STAGES)
+    tried = hits + stage_counts['miss']
+    return hits / tried if tried else None
+
+def format_rate(rate):
+    """
+    将命中率格式化为百分比
+
+    Args:
+        rate (float): hit_rate 的结果
+
+    Returns:
+        str: 百分比，None 时为 "-"
+    """
+
+    return f"{rate * 100:.2f}%" if rate is not None else "-"
+
+def pop_option(args, name, default=None):
+    """
+    从参数列表中移除带值的选项
+
+    支持 "--name value" 和 "--name=value" 两种写法
+
+    Args:
+        args (list): 参数列表，会被原地修改
+        name (str): 选项名
+        default (str): 选项不存在时返回的值
+
+    Returns:
+        str: 选项值，选项没有值时为 None
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """打印命令行用法"""
+
+    print("翻译覆盖率检查工具")
+    print("按插件的查找顺序离线翻译文本导出，报告翻译包覆盖了多少文本")
+    print()
+    print("用法:")
+    print("  python script.py <翻译文件夹|index.jatidx> <导出文件夹|dump.txt> [--keywords KeywordReplaceText.json]")
+    print("                   [--jobs N] [--top N] [--misses misses.txt] [--output report.json] [--zip-in-order]")
+    print()
+    print("示例:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/Text ./BepInEx/JustAnotherTranslator/Dump")
+    print("  python script.py ./Text.jatidx ./script_dump --misses misses.txt --output coverage.json")
+    print()
+    print("参数说明:")
+    print("  翻译文件夹: 文本翻译文件夹，按插件的顺序加载，或 .jatidx 索引")
+    print("  导出文件夹: 递归查找每行一条文本的 .txt 文件的文件夹，跳过 *_normalized.txt 导出")
+    print("  --keywords: （可选）KeywordReplaceText.json，与 EnableKeywordReplace 相同地应用于译文")
+    print("  --jobs N: （可选）在 N 个工作进程中查找，0 表示使用所有 CPU 核心（默认为 0）")
+    print(f"  --top N: （可选）列出最常见的未命中数，0 表示全部列出（默认为 {REPORT_TOP_MISSES}）")
+    print("  --misses: （可选）将所有未命中按出现次数从多到少写入可直接翻译的 .txt 文件")
+    print("  --output: （可选）将每个文件和阶段的计数写入 JSON 文件")
+    print("  --zip-in-order: （可选）按名称排序加载 zip 成员，与 AllowFilesInZipLoadInOrder 相同")
+    print()
+    print("注意事项:")
+    print("  - 命中率不计入空白、XUAT 标记和 [...] 文本，插件既不翻译也不导出这些文本")
+    print("  - 翻译包的所有译文都视为已显示过，用于 IsJatTranslatedText，因此该阶段是一个上限")
+    print("  - 模式使用 Python re 匹配，如果规则可能无休止地回溯，请先运行 regex_rule_profile")
+    print()
+
+def main():
+    """主函数，处理命令行参数"""
+
+    args = sys.argv.copy()
+    if len(args) < 3 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    jobs = pop_option(args, "--jobs", "0")
+    if jobs is None or not jobs.isdigit():
+        print("错误：--jobs 需要一个非负整数")
+        return 2
+    jobs = int(jobs) or os.cpu_count() or 1
+
+    top = pop_option(args, "--top", str(REPORT_TOP_MISSES))
+    if top is None or not top.isdigit():
+        print("错误：--top 需要一个非负整数")
+        return 2
+    top = int(top) or None
+
+    paths = {}
+    for option in ("--keywords", "--misses", "--output"):
+        value = pop_option(args, option)
+        if option in sys.argv and value is None:
+            print(f"错误：{option} 需要一个文件路径")
+            return 2
+        paths[option] = Path(value) if value is not None else None
+
+    zip_in_order = "--zip-in-order" in args
+    args = [arg for arg in args if arg != "--zip-in-order"]
+
+    tree_path = Path(args[1])
+    dump_path = Path(args[2])
+    for path in (tree_path, dump_path, paths["--keywords"]):
+        if path is not None and not path.exists():
+            print(f"错误：路径 {path} 不存在")
+            return 2
+
+    start_time = time.perf_counter()
+    keywords, keyword_regex = None, None
+    if paths["--keywords"] is not None:
+        try:
+            keywords, keyword_regex = load_keywords(paths["--keywords"])
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"✗ 无法读取 {paths['--keywords']}: {e}")
+            return 1
+    translations, rules = load_tree(tree_path, 0, zip_in_order)
+    engine, failed_rules = build_engine(translations, rules, keywords, keyword_regex)
+    print(f"已加载 {len(translations):,} 条精确翻译和 {len(rules):,} 条正则规则"
+          + (f"，{len(keywords):,} 个关键词" if keywords else ""))
+    if failed_rules:
+        print(f"  {len(failed_rules)} 条正则规则无法被 Python re 编译，已跳过，"
+              f"例如 \"{shorten(failed_rules[0][0])}\": {failed_rules[0][1]}")
+
+    dump_files = find_dump_files(dump_path)
+    file_texts = []
+    all_texts = Counter()
+    for dump_file in dump_files:
+        texts = read_dump(dump_file)
+        file_texts.append((dump_file, texts))
+        all_texts.update(texts)
+    unique_texts = list(all_texts)
+    print(f"正在查找来自 {len(dump_files)} 个文件的 {sum(all_texts.values()):,} 行（{len(unique_texts):,} 条不重复）"
+          + (f"，使用 {jobs} 个工作进程……" if jobs > 1 else "……"))
+
+    stages = dict(zip(unique_texts, translate_texts(engine, unique_texts, jobs)))
+
+    total = Counter()
+    file_reports = []
+    for dump_file, texts in file_texts:
+        counts = Counter()
+        for text, count in texts.items():
+            counts[stages[text]] += count
+        total.update(counts)
+        name = dump_file.relative_to(dump_path).as_posix() if dump_path.is_dir() else dump_file.name
+        file_reports.append({'file': name, 'lines': sum(texts.values()), 'hit_rate': hit_rate(counts),
+                             'stages': {stage: counts[stage] for stage in STAGES}})
+
+    line_count = sum(total.values())
+    print("-" * 50)
+    print(f"命中率：{line_count - sum(total[stage] for stage in SKIP_STAGES):,} 行可翻译文本中的 "
+          f"{format_rate(hit_rate(total))}")
+    for stage, label in STAGES.items():
+        if total[stage]:
+            print(f"  {label}: {total[stage]:,} ({total[stage] / line_count * 100:.2f}%)")
+
+    if len(file_reports) > 1:
+        print()
+        print("每个文件:")
+        width = max(len(report['file']) for report in file_reports)
+        for report in file_reports:
+            print(f"  {report['file']:<{width}}  {format_rate(report['hit_rate']):>8}  "
+                  f"{report['lines']:,} 行中 {report['stages']['miss']:,} 行未命中")
+
+    misses = sorted(((text, count) for text, count in all_texts.items() if stages[text] == 'miss'),
+                    key=lambda miss: (-miss[1], miss[0]))
+    if misses:
+        print()
+        print(f"最常见的未命中（{len(misses):,} 条不重复）:")
+        for text, count in misses[:top]:
+            print(f"  {count:>8,}  {shorten(text, 60)}")
+        if top is not None and len(misses) > top:
+            print(f"  ……另有 {len(misses) - top} 条")
+
+    if paths["--misses"] is not None:
+        paths["--misses"].parent.mkdir(parents=True, exist_ok=True)
+        unwritable = 0
+        with open(paths["--misses"], 'w', encoding='utf-8', newline='\n') as outfile:
+            for text, count in misses:
+                # 以 ; 或 $ 开头的文本会变成注释或正则规则
+                if text[0] in ';$':
+                    unwritable += 1
+                    continue
+                outfile.write(f"; {count} 行\n{text.translate(TXT_ESCAPES)}\t\n")
+        print(f"未命中已写入 {paths['--misses']}"
+              + (f"，{unwritable} 条以 ; 或 $ 开头的文本未输出" if unwritable else ""))
+
+    if paths["--output"] is not None:
+        report = {
+            'hit_rate': hit_rate(total),
+            'lines': line_count,
+            'unique': len(unique_texts),
+            'stages': {stage: total[stage] for stage in STAGES},
+            'files': file_reports,
+            'failed_rules': [{'pattern': pattern, 'error': error} for pattern, error in failed_rules]
+        }
+        paths["--output"].parent.mkdir(parents=True, exist_ok=True)
+        with open(paths["--output"], 'w', encoding='utf-8') as outfile:
+            json.dump(report, outfile, ensure_ascii=False, indent=2)
+        print(f"报告已写入 {paths['--output']}")
+
+    print(f"完成，耗时 {time.perf_counter() - start_time:.2f} 秒")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
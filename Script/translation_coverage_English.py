@@ -0,0 +1,1091 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Translate text dumps offline in the plugin's lookup order and report the coverage of a translation pack
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import csv
+import io
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Removed from the translation by TxtTranslationFileProcessor, see XUAT RedirectedResourceDetectionStrategy
+MONGOLIAN_VOWEL_SEPARATOR = '\u180e'
+
+# .NET regex groups rewritten by dotnet_regex_to_python: named and balancing groups, inline options
+DOTNET_GROUP = re.compile(r"\(\?(?:<(?![=!])([^>]*)>|'([^']*)'|([imnsx-]+)([:)]))")
+
+# Line breaks of StreamReader.ReadLine
+LINE_BREAK = re.compile(r'\r\n|\r|\n')
+
+# UTF-8 byte order mark, only skipped at the start of a file
+BYTE_ORDER_MARK = '\ufeff'
+
+# Whitespace trimmed by StringTool.NormalizeText
+WHITESPACE_CHARS = ('\t\n\v\f\r \u0085\u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008'
+                    '\u2009\u200a\u200b\u2028\u2029\u3000\ufeff')
+
+# Characters escaped in the original of a .txt line, reversed by StringExtensions.Unescape
+TXT_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\r': '\\r', '\n': '\\n'})
+
+# Header: magic, version, kind, flags, number of source files, number of entries, number of regex rules,
+# size of the string pool in bytes, CRC-32 of everything after the header
+HEADER = struct.Struct('<8sIIIIIIII')
+
+# Entry of the key table and of the regex rule table: byte offset and length in the string pool of
+# the key (or pattern), then of the translation (or template)
+ENTRY = struct.Struct('<IIII')
+
+# Encoding of the string pool, the strings of a .NET string, so the plugin can binary search the
+# key table with an ordinal comparison without decoding
+POOL_ENCODING = 'utf-16-le'
+
+KIND_SUFFIXES = ('.txt', '.csv')
+
+# Escape sequences of StringExtensions.Unescape, any other sequence is kept as is
+ESCAPES = {
+    '0': '\0',
+    'a': '\a',
+    'b': '\b',
+    't': '\t',
+    'n': '\n',
+    'v': '\v',
+    'f': '\f',
+    'r': '\r',
+    "'": "'",
+    '"': '"',
+    '\\': '\\'
+}
+
+# First bytes of an index file
+INDEX_MAGIC = b'JATINDEX'
+
+# Format version, increased on every incompatible change of the layout
+INDEX_VERSION = 1
+
+# Index kinds, the loader they replace and the suffix of the files read by that loader
+INDEX_KINDS = ('Text', 'UI')
+
+# Lookup stages of TextTranslateManger.GetTranslateText in the order they are tried, with their report labels
+STAGES = {
+    'blank': "blank, not translated",
+    'xuat': "XUAT marked, not translated",
+    'translated_text': "already a translation (IsJatTranslatedText)",
+    'bracket': "[...] text, not translated",
+    'exact': "exact translation",
+    'normalized': "normalized translation",
+    'regex': "$ regex rule",
+    'miss': "untranslated, dumped by the plugin"
+}
+
+# Stages that translate the text, and stages that leave it alone without dumping it
+HIT_STAGES = ('translated_text', 'exact', 'normalized', 'regex')
+SKIP_STAGES = ('blank', 'xuat', 'bracket')
+
+# Character name placeholders such as [HF], StringTool.CharaNameTokenRegex
+CHARA_NAME_TOKEN = re.compile(r'\[[A-Z][A-Z0-9]*\]')
+
+# Suffix of the normalized dumps, which repeat the texts of the _untranslate.txt dumps
+NORMALIZED_DUMP_SUFFIX = '_untranslate_normalized.txt'
+
+# Unique texts per worker task
+TASK_TEXTS = 5000
+
+# Misses listed by default
+REPORT_TOP_MISSES = 20
+
+# Lookup tables of the worker process, set by init_worker
+ENGINE = None
+
+def dotnet_regex_to_python(pattern):
+    """
+    Rewrite .NET-only regex syntax to Python re syntax, so the pattern can be compiled to check it
+
+    Only the syntax is kept: Unicode categories such as \\p{L} become \\w, balancing groups become
+    non-capturing groups and inline options are dropped.
+
+    Args:
+        pattern (str): .NET regex
+
+    Returns:
+        str: Python regex
+    """
+
+    result = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\' and index + 1 < len(pattern):
+            escape = pattern[index + 1]
+            close = -1
+            if escape in 'pP' and pattern.startswith('{', index + 2):
+                close = pattern.find('}', index + 3)
+                replacement = '\\w' if escape == 'p' else '\\W'
+            elif escape == 'c' and index + 2 < len(pattern):
+                close = index + 2
+                replacement = '\\x00'
+            elif escape == 'k' and pattern[index + 2:index + 3] in ('<', "'"):
+                close = pattern.find('>' if pattern[index + 2] == '<' else "'", index + 3)
+                name = pattern[index + 3:close]
+                replacement = f'\\{name}' if name.isdigit() else f'(?P={name})'
+            if close > 0:
+                result.append(replacement)
+                index = close + 1
+                continue
+            result.append({'z': '\\Z', 'G': '', 'e': '\\x1b'}.get(escape, pattern[index:index + 2]))
+            index += 2
+            continue
+
+        match = DOTNET_GROUP.match(pattern, index) if char == '(' else None
+        if match is None:
+            result.append(char)
+            index += 1
+            continue
+        name = match.group(1) if match.group(1) is not None else match.group(2)
+        if name is not None:
+            result.append(f'(?P<{name}>' if name.isidentifier() else '(?:')
+        elif match.group(4) == ':':
+            result.append('(?:')
+        index = match.end()
+    return ''.join(result)
+
+def shorten(text, length=40):
+    """
+    Shorten text for a report line
+
+    Args:
+        text (str): Text
+        length (int): Maximum length
+
+    Returns:
+        str: Text, cut with "..." if longer than length
+    """
+
+    return text if len(text) <= length else text[:length] + "..."
+
+def normalize_text(text):
+    """
+    Normalize text the same way as StringTool.NormalizeText in the plugin
+
+    Args:
+        text (str): Text
+
+    Returns:
+        str: Text without \\r, \\n and \\t, trimmed and in upper case
+    """
+
+    return text.replace('\r', '').replace('\n', '').replace('\t', '').strip(WHITESPACE_CHARS).upper()
+
+def read_entry(index, table_offset, position):
+    """
+    Read an entry of the key table or of the regex rule table
+
+    Args:
+        index (dict): Index returned by open_index
+        table_offset (int): Byte offset of the table
+        position (int): Entry number in the table
+
+    Returns:
+        tuple: (key or pattern, translation or template)
+    """
+
+    index_map = index['map']
+    pool_offset = index['pool_offset']
+    key_offset, key_length, value_offset, value_length = ENTRY.unpack_from(index_map, table_offset + position * ENTRY.size)
+    key_start = pool_offset + key_offset
+    value_start = pool_offset + value_offset
+    return (index_map[key_start:key_start + key_length].decode(POOL_ENCODING, 'surrogatepass'),
+            index_map[value_start:value_start + value_length].decode(POOL_ENCODING, 'surrogatepass'))
+
+def iter_translations(index):
+    """
+    Yield the translations of an index in key order
+
+    Args:
+        index (dict): Index returned by open_index
+
+    Yields:
+        tuple: (key, translation)
+    """
+
+    for position in range(index['entry_count']):
+        yield read_entry(index, HEADER.size, position)
+
+def is_member_path_unsafe(member_name):
+    """
+    Check an archive member name the same way as FileTool.IsZipPathUnsafe in the plugin
+
+    Rejects empty names, parent folder references and absolute or rooted paths.
+
+    Args:
+        member_name (str): Member name in the archive
+
+    Returns:
+        bool: True if the member must not be used
+    """
+
+    if not member_name:
+        return True
+
+    # Unify path separators
+    normalized_path = member_name.replace('\\', '/')
+
+    # Reject "../"
+    if '../' in normalized_path:
+        return True
+
+    # Reject absolute paths, including Windows drive paths
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def ordinal_key(text):
+    """
+    Sort key matching .NET StringComparer.Ordinal, which compares UTF-16 code units
+
+    Args:
+        text (str): Text to sort
+
+    Returns:
+        bytes: UTF-16 big-endian encoding of the text
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def unescape(text, unknown_escapes=None):
+    """
+    Replace escape sequences the same way as StringExtensions.Unescape in the plugin
+
+    Unknown sequences are kept with their backslash, and so is a backslash at the end of the text.
+
+    Args:
+        text (str): Text with escape sequences
+        unknown_escapes (list): Optional, receives the unknown sequences such as "\\x"
+
+    Returns:
+        str: Unescaped text
+    """
+
+    index = text.find('\\')
+    if index < 0:
+        return text
+
+    parts = []
+    start = 0
+    while 0 <= index < len(text) - 1:
+        parts.append(text[start:index])
+        char = text[index + 1]
+        escaped = ESCAPES.get(char)
+        if escaped is None:
+            parts.append('\\' + char)
+            if unknown_escapes is not None:
+                unknown_escapes.append('\\' + char)
+        else:
+            parts.append(escaped)
+        start = index + 2
+        index = text.find('\\', start)
+    parts.append(text[start:])
+    return ''.join(parts)
+
+def add_translation_lines(data, source, translations, rules):
+    """
+    Parse the lines of a .txt translation file the same way as TxtTranslationFileProcessor
+
+    Args:
+        data (bytes): File content
+        source (str): File name shown in reports
+        translations (dict): Exact translations, modified in place
+        rules (list): Regex rules, modified in place
+    """
+
+    text = data.decode('utf-8', 'replace')
+    if text.startswith(BYTE_ORDER_MARK):
+        text = text[1:]
+
+    for line_number, line in enumerate(LINE_BREAK.split(text), 1):
+        if not line or line[0] == ';':
+            continue
+        original, tab, translation = line.partition('\t')
+        if not tab:
+            continue
+        original = unescape(original)
+        translation = unescape(translation).replace(MONGOLIAN_VOWEL_SEPARATOR, '')
+        if not original or not translation:
+            continue
+        if line[0] == '$':
+            rules.append({'source': f"{source}:{line_number}", 'pattern': original[1:], 'template': translation})
+        else:
+            translations[original] = translation
+
+def loader_order_key(relative_path):
+    """
+    Sort key for the order in which the plugin loads translation files
+
+    The plugin loads the files in the root of the translation folder first, then the files of
+    every subfolder, with folders and files each sorted by ordinal path (FileTool.GetAllTranslationFiles).
+
+    Args:
+        relative_path (Path): File path relative to the translation folder
+
+    Returns:
+        tuple: Sort key
+    """
+
+    folder = relative_path.parent.parts
+    return len(folder) > 0, ordinal_key('\\'.join(folder)), ordinal_key(relative_path.name)
+
+def find_source_files(input_path, suffix):
+    """
+    Find the translation files of a folder in the order the plugin loads them
+
+    Args:
+        input_path (Path): Translation folder, or a single translation or .zip file
+        suffix (str): Suffix of the translation files
+
+    Returns:
+        list: (file path, name shown in reports) tuples
+    """
+
+    if input_path.is_file():
+        return [(input_path, input_path.name)]
+    files = [file for file in input_path.rglob('*')
+             if file.is_file() and file.name.lower().endswith((suffix, '.zip'))]
+    files.sort(key=lambda file: loader_order_key(file.relative_to(input_path)))
+    return [(file, file.relative_to(input_path).as_posix()) for file in files]
+
+def iter_csv_lines(text):
+    """
+    Yield the lines of a CSV text except the comment lines skipped by CsvHelper (AllowComments)
+
+    A line starting with # is only a comment outside a quoted field, the quote count tells
+    whether the previous lines left a field open.
+
+    Args:
+        text (str): CSV text
+
+    Yields:
+        str: Line with its line break
+    """
+
+    in_quotes = False
+    for line in io.StringIO(text, newline=''):
+        if not in_quotes and line.startswith('#'):
+            continue
+        if line.count('"') % 2:
+            in_quotes = not in_quotes
+        yield line
+
+def add_csv_rows(data, translations):
+    """
+    Parse a .csv translation file the same way as CsvTranslationFileProcessor
+
+    The header is matched trimmed and case-insensitive, blank and whitespace-only records are
+    skipped and rows without a Term or a Translation are ignored.
+
+    Args:
+        data (bytes): File content
+        translations (dict): Translations, modified in place
+    """
+
+    columns = None
+    for row in csv.reader(iter_csv_lines(data.decode('utf-8-sig', 'replace'))):
+        if all(not field or field.isspace() for field in row):
+            continue
+        if columns is None:
+            columns = {name.strip().lower(): index for index, name in reversed(list(enumerate(row)))}
+            continue
+        term_index = columns.get('term')
+        translation_index = columns.get('translation')
+        term = row[term_index] if term_index is not None and term_index < len(row) else None
+        translation = row[translation_index] if translation_index is not None and translation_index < len(row) else None
+        if term and translation:
+            translations[term] = translation
+
+def load_sources(input_path, kind, zip_in_order=False):
+    """
+    Load a translation folder the way AsyncTranslationLoader does
+
+    Later files replace the translations of earlier ones. Every $ line of a .txt file becomes its
+    own regex rule, the plugin keys them by Regex instance so identical patterns are all kept.
+
+    Args:
+        input_path (Path): Translation folder, or a single translation or .zip file
+        kind (int): Index of the loader in INDEX_KINDS
+        zip_in_order (bool): Load zip members sorted by name instead of in storage order
+
+    Returns:
+        tuple: (translations, list of (pattern, template) rules, number of files)
+    """
+
+    suffix = KIND_SUFFIXES[kind]
+    translations = {}
+    rules = []
+
+    def add_file(data, name):
+        if suffix == '.csv':
+            add_csv_rows(data, translations)
+            return
+        file_rules = []
+        add_translation_lines(data, name, translations, file_rules)
+        rules.extend((rule['pattern'], rule['template']) for rule in file_rules)
+
+    files = find_source_files(input_path, suffix)
+    for file_path, name in files:
+        try:
+            if not file_path.name.lower().endswith('.zip'):
+                add_file(file_path.read_bytes(), name)
+                continue
+            with zipfile.ZipFile(file_path) as archive:
+                members = [info for info in archive.infolist()
+                           if not info.is_dir() and info.filename.lower().endswith(suffix)
+                           and not is_member_path_unsafe(info.filename)]
+                if zip_in_order:
+                    members.sort(key=lambda info: ordinal_key(info.filename))
+                for info in members:
+                    try:
+                        add_file(archive.read(info), f"{name}/{info.filename}")
+                    except (OSError, zipfile.BadZipFile, csv.Error) as e:
+                        print(f"✗ Error reading {name}/{info.filename}: {e}")
+        except (OSError, zipfile.BadZipFile, csv.Error) as e:
+            print(f"✗ Error reading {name}: {e}")
+    return translations, rules, len(files)
+
+def open_index(index_file):
+    """
+    Memory-map an index file and check its header
+
+    Args:
+        index_file (Path): Index file
+
+    Returns:
+        dict: Header fields, table offsets and the 'map' to close after use
+
+    Raises:
+        ValueError: The file is not an index of a supported version
+    """
+
+    with open(index_file, 'rb') as file:
+        index_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(index_map) < HEADER.size:
+            raise ValueError("file is shorter than the index header")
+        magic, version, kind, flags, file_count, entry_count, rule_count, pool_size, checksum = \
+            HEADER.unpack_from(index_map, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError("not a translation index file")
+        if version != INDEX_VERSION:
+            raise ValueError(f"index version {version} is not supported, expected {INDEX_VERSION}")
+        if kind >= len(INDEX_KINDS):
+            raise ValueError(f"unknown index kind {kind}")
+        pool_offset = HEADER.size + (entry_count + rule_count) * ENTRY.size
+        if pool_offset + pool_size != len(index_map):
+            raise ValueError("file size does not match the header, the index is truncated or damaged")
+    except ValueError:
+        index_map.close()
+        raise
+
+    return {
+        'map': index_map,
+        'kind': kind,
+        'flags': flags,
+        'file_count': file_count,
+        'entry_count': entry_count,
+        'rule_count': rule_count,
+        'checksum': checksum,
+        'rules_offset': HEADER.size + entry_count * ENTRY.size,
+        'pool_offset': pool_offset
+    }
+
+def read_rules(index):
+    """
+    Read the regex rules of an index
+
+    Args:
+        index (dict): Index returned by open_index
+
+    Returns:
+        list: (pattern, template) rules in load order
+    """
+
+    return [read_entry(index, index['rules_offset'], position) for position in range(index['rule_count'])]
+
+def load_tree(tree_path, kind, zip_in_order):
+    """
+    Load the translations of a translation folder or of an index built by translation_index
+
+    Args:
+        tree_path (Path): Translation folder, translation or .zip file, or .jatidx index
+        kind (int): 0 for the Text loader, 1 for the UI loader
+        zip_in_order (bool): Load zip members sorted by name
+
+    Returns:
+        tuple: (translations, list of (pattern, template) regex rules)
+    """
+
+    if tree_path.is_file() and tree_path.name.lower().endswith('.jatidx'):
+        index = open_index(tree_path)
+        try:
+            return dict(iter_translations(index)), read_rules(index)
+        finally:
+            index['map'].close()
+    translations, rules, _ = load_sources(tree_path, kind, zip_in_order)
+    return translations, rules
+
+def load_keywords(keyword_file):
+    """
+    Load KeywordReplaceText.json and build the replacement regex like UpdateKeywordReplaceRegex
+
+    Args:
+        keyword_file (Path): JSON object of keyword -> replacement
+
+    Returns:
+        tuple: (keyword dict, compiled regex or None when there are no keywords)
+    """
+
+    keywords = json.loads(keyword_file.read_text(encoding='utf-8-sig')) or {}
+    # Longest keyword first, OrderByDescending keeps the file order of keywords of the same length
+    keys = sorted((key for key in keywords if key), key=lambda key: -len(key.encode('utf-16-le', 'surrogatepass')))
+    if not keys:
+        return keywords, None
+    return keywords, re.compile('|'.join(re.escape(key) for key in keys))
+
+def replace_keywords(text, keywords, keyword_regex):
+    """
+    Replace keywords in a translation like TextTranslateManger.ReplaceKeyword
+
+    Args:
+        text (str): Translation
+        keywords (dict): Keyword -> replacement
+        keyword_regex (re.Pattern): Regex from load_keywords, None to keep the text
+
+    Returns:
+        str: Translation with the keywords replaced
+    """
+
+    if not text or keyword_regex is None:
+        return text
+    return keyword_regex.sub(lambda match: keywords.get(match.group(), match.group()), text)
+
+def build_token_pattern(normalized_text):
+    """
+    Build the regex matching a translation after the game fills its name placeholders, like StringTool.BuildTokenPattern
+
+    Args:
+        normalized_text (str): Normalized translation containing placeholders such as [HF]
+
+    Returns:
+        re.Pattern: Regex with .+ in place of each placeholder
+    """
+
+    parts = CHARA_NAME_TOKEN.split(normalized_text)
+    return re.compile('^' + '.+'.join(re.escape(part) for part in parts) + '$')
+
+def dotnet_group_numbers(regex):
+    """
+    Map .NET group numbers to Python group numbers
+
+    .NET numbers the unnamed groups first and the named groups after them, Python numbers all
+    groups from left to right.
+
+    Args:
+        regex (re.Pattern): Compiled pattern
+
+    Returns:
+        list: Python group number of each .NET group number
+    """
+
+    named = sorted(regex.groupindex.values())
+    unnamed = [number for number in range(1, regex.groups + 1) if number not in named]
+    return [0] + unnamed + named
+
+def expand_template(template, match, group_numbers, translations):
+    """
+    Fill a regex rule template like StringExtensions.Template with the callback of GetTranslateText
+
+    $n and ${name} are replaced by the captured text, or by its exact translation when it has one.
+    \\$ is a literal $. As in the plugin, a placeholder at the very end of the template is dropped.
+
+    Args:
+        template (str): Translation template of the rule
+        match (re.Match): Match of the rule
+        group_numbers (list): Result of dotnet_group_numbers
+        translations (dict): Exact translations
+
+    Returns:
+        str: Translation
+    """
+
+    def captured(name):
+        try:
+            number = int(name)
+        except ValueError:
+            number = None
+        if number is not None:
+            group = group_numbers[number] if 0 <= number < len(group_numbers) else None
+        else:
+            group = name if name in match.re.groupindex else None
+        text = (match.group(group) or '') if group is not None else ''
+        return translations.get(text, text)
+
+    result = []
+    name = []
+    inside = False
+    braced = False
+    index = 0
+    while index < len(template):
+        char = template[index]
+        index += 1
+        if char == '\\' and template[index:index + 1] == '$':
+            result.append('$')
+            index += 1
+            continue
+        if char == '$':
+            inside = True
+            continue
+        if char == '{' and inside:
+            braced = True
+            continue
+        if char == '}' and inside and name:
+            result.append(captured(''.join(name)))
+            name = []
+            inside = braced = False
+            continue
+        if inside and not braced and not char.isdecimal():
+            result.append(captured(''.join(name)))
+            name = []
+            inside = False
+        if inside:
+            name.append(char)
+        else:
+            result.append(char)
+    return ''.join(result)
+
+def build_engine(translations, rules, keywords=None, keyword_regex=None):
+    """
+    Prepare the lookup tables of the offline engine
+
+    The plugin only knows the translations it has shown in the current scene for the
+    IsJatTranslatedText check, here every translation of the pack counts, an upper bound.
+
+    Args:
+        translations (dict): Exact translations
+        rules (list): (pattern, template) regex rules in load order
+        keywords (dict): Keyword replacements (optional)
+        keyword_regex (re.Pattern): Regex from load_keywords (optional)
+
+    Returns:
+        tuple: (engine dict, list of (pattern, error) of the rules Python re cannot compile)
+    """
+
+    compiled_rules = []
+    failed_rules = []
+    for pattern, template in rules:
+        try:
+            regex = re.compile(dotnet_regex_to_python(pattern))
+        except re.error as e:
+            failed_rules.append((pattern, str(e)))
+            continue
+        compiled_rules.append((regex, template, dotnet_group_numbers(regex)))
+
+    # MarkTranslated stores normalized translations, and a pattern for those with name placeholders.
+    # The patterns are bucketed by the longer of their texts before the first and after the last
+    # placeholder, only buckets whose text starts or ends the looked up text are tried.
+    translated_texts = set()
+    token_patterns = ({}, {})
+    for translation in set(translations.values()):
+        if translation.isspace():
+            continue
+        normalized = normalize_text(replace_keywords(translation, keywords, keyword_regex).replace(MONGOLIAN_VOWEL_SEPARATOR, ''))
+        translated_texts.add(normalized)
+        if CHARA_NAME_TOKEN.search(normalized):
+            parts = CHARA_NAME_TOKEN.split(normalized)
+            side = 1 if len(parts[-1]) > len(parts[0]) else 0
+            token_patterns[side].setdefault(parts[-1] if side else parts[0], []).append(build_token_pattern(normalized))
+
+    engine = {
+        'translations': translations,
+        'rules': compiled_rules,
+        'keywords': keywords or {},
+        'keyword_regex': keyword_regex,
+        'translated_texts': translated_texts,
+        'token_patterns': token_patterns,
+        'token_lengths': tuple(sorted({len(part) for part in patterns}) for patterns in token_patterns)
+    }
+    return engine, failed_rules
+
+def is_translated_text(engine, normalized):
+    """
+    Check whether a text is a translation shown by the plugin, like IsJatTranslatedText
+
+    Args:
+        engine (dict): Result of build_engine
+        normalized (str): Normalized text without XUAT marks
+
+    Returns:
+        bool: True if the text is a translation
+    """
+
+    if normalized in engine['translated_texts']:
+        return True
+    for side, patterns in enumerate(engine['token_patterns']):
+        for length in engine['token_lengths'][side]:
+            if length > len(normalized):
+                break
+            part = normalized[len(normalized) - length:] if side else normalized[:length]
+            for pattern in patterns.get(part, ()):
+                if pattern.match(normalized):
+                    return True
+    return False
+
+def translate(engine, text):
+    """
+    Look up a text like TextTranslateManger.GetTranslateText
+
+    Args:
+        engine (dict): Result of build_engine
+        text (str): Text shown by the game
+
+    Returns:
+        tuple: (key of STAGES, translation or None)
+    """
+
+    if not text or text.isspace():
+        return 'blank', None
+    if MONGOLIAN_VOWEL_SEPARATOR in text:
+        return 'xuat', None
+    normalized = normalize_text(text)
+    if is_translated_text(engine, normalized):
+        return 'translated_text', text
+    if text.startswith('[') and text.endswith(']'):
+        return 'bracket', None
+
+    translations = engine['translations']
+    keywords = engine['keywords']
+    keyword_regex = engine['keyword_regex']
+    translation = translations.get(text)
+    if translation is not None:
+        return 'exact', replace_keywords(translation, keywords, keyword_regex)
+    translation = translations.get(normalized)
+    if translation is not None:
+        return 'normalized', replace_keywords(translation, keywords, keyword_regex)
+
+    for regex, template, group_numbers in engine['rules']:
+        match = regex.search(text)
+        if (match is None or match.end() == match.start()) and normalized != text and normalized:
+            match = regex.search(normalized)
+        if match is None or match.end() == match.start():
+            continue
+        translation = expand_template(template, match, group_numbers, translations)
+        return 'regex', replace_keywords(translation, keywords, keyword_regex)
+    return 'miss', None
+
+def init_worker(engine):
+    """
+    Worker process initializer, keeps the lookup tables for every task of the process
+
+    Args:
+        engine (dict): Result of build_engine
+    """
+
+    global ENGINE
+    ENGINE = engine
+
+def translate_task(texts):
+    """
+    Worker process entry, look up a batch of unique texts
+
+    Args:
+        texts (list): Texts
+
+    Returns:
+        list: Key of STAGES for each text
+    """
+
+    return [translate(ENGINE, text)[0] for text in texts]
+
+def translate_texts(engine, texts, jobs=1):
+    """
+    Look up unique texts, in worker processes if jobs is more than 1
+
+    Args:
+        engine (dict): Result of build_engine
+        texts (list): Unique texts
+        jobs (int): Number of worker processes
+
+    Returns:
+        list: Key of STAGES for each text
+    """
+
+    tasks = [texts[start:start + TASK_TEXTS] for start in range(0, len(texts), TASK_TEXTS)]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), initializer=init_worker,
+                                 initargs=(engine,)) as executor:
+            results = list(executor.map(translate_task, tasks))
+    else:
+        init_worker(engine)
+        results = [translate_task(task) for task in tasks]
+    return [stage for result in results for stage in result]
+
+def find_dump_files(dump_path):
+    """
+    Find the text files to look up, one text per line
+
+    Args:
+        dump_path (Path): Folder searched recursively for .txt files, or a single file
+
+    Returns:
+        list: Files sorted by path, without the _normalized dumps
+    """
+
+    if dump_path.is_file():
+        return [dump_path]
+    return sorted(file for file in dump_path.rglob('*')
+                  if file.is_file() and file.name.lower().endswith('.txt') and not file.name.endswith(NORMALIZED_DUMP_SUFFIX))
+
+def read_dump(dump_file):
+    """
+    Count the texts of a dump file, the plugin writes one text per line
+
+    Args:
+        dump_file (Path): Text file
+
+    Returns:
+        Counter: Number of lines of each text
+    """
+
+    text = dump_file.read_bytes().decode('utf-8', 'replace')
+    if text.startswith(BYTE_ORDER_MARK):
+        text = text[1:]
+    return Counter(line for line in LINE_BREAK.split(text) if line)
+
+def hit_rate(stage_counts):
+    """
+    Share of the texts the plugin translates, among the texts it tries to translate
+
+    Args:
+        stage_counts (Counter): Lines per key of STAGES
+
+    Returns:
+        float: Hit rate from 0 to 1, None when every text is skipped
+    """
+
+    hits = sum(stage_counts[stage] for stage in HIT_STAGES)
+    tried = hits + stage_counts['miss']
+    return hits / tried if tried else None
+
+def format_rate(rate):
+    """
+    Format a hit rate as a percentage
+
+    Args:
+        rate (float): Result of hit_rate
+
+    Returns:
+        str: Percentage, or "-" for None
+    """
+
+    return f"{rate * 100:.2f}%" if rate is not None else "-"
+
+def pop_option(args, name, default=None):
+    """
+    Remove an option with a value from the argument list
+
+    Supports both "--name value" and "--name=value"
+
+    Args:
+        args (list): Argument list, modified in place
+        name (str): Option name
+        default (str): Value returned when the option is not present
+
+    Returns:
+        str: Option value, None if the option has no value
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """Print command line usage"""
+
+    print("Translation Coverage Checker")
+    print("Translate text dumps offline in the plugin's lookup order and report how much a translation pack covers")
+    print()
+    print("Usage:")
+    print("  python script.py <translation_folder|index.jatidx> <dump_folder|dump.txt> [--keywords KeywordReplaceText.json]")
+    print("                   [--jobs N] [--top N] [--misses misses.txt] [--output report.json] [--zip-in-order]")
+    print()
+    print("Examples:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/Text ./BepInEx/JustAnotherTranslator/Dump")
+    print("  python script.py ./Text.jatidx ./script_dump --misses misses.txt --output coverage.json")
+    print()
+    print("Parameters:")
+    print("  translation_folder: Text translation folder, loaded in the plugin's order, or a .jatidx index")
+    print("  dump_folder: Folder searched recursively for .txt files with one text per line, *_normalized.txt dumps are skipped")
+    print("  --keywords: (optional) KeywordReplaceText.json, applied to translations like EnableKeywordReplace")
+    print("  --jobs N: (optional) Look up in N worker processes, 0 uses all CPU cores (defaults to 0)")
+    print(f"  --top N: (optional) Number of most frequent misses listed, 0 lists all (defaults to {REPORT_TOP_MISSES})")
+    print("  --misses: (optional) Write every miss, most frequent first, as a ready-to-translate .txt file")
+    print("  --output: (optional) Write the counts per file and stage to a JSON file")
+    print("  --zip-in-order: (optional) Load zip members sorted by name, like AllowFilesInZipLoadInOrder")
+    print()
+    print("Notes:")
+    print("  - The hit rate leaves out blank, XUAT marked and [...] texts, which the plugin neither translates nor dumps")
+    print("  - Every translation of the pack counts as already shown for IsJatTranslatedText, so that stage is an upper bound")
+    print("  - Patterns are matched with Python re, run regex_rule_profile first if a rule may backtrack without end")
+    print()
+
+def main():
+    """Main function to handle command line arguments"""
+
+    args = sys.argv.copy()
+    if len(args) < 3 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    jobs = pop_option(args, "--jobs", "0")
+    if jobs is None or not jobs.isdigit():
+        print("Error: --jobs requires a non-negative integer")
+        return 2
+    jobs = int(jobs) or os.cpu_count() or 1
+
+    top = pop_option(args, "--top", str(REPORT_TOP_MISSES))
+    if top is None or not top.isdigit():
+        print("Error: --top requires a non-negative integer")
+        return 2
+    top = int(top) or None
+
+    paths = {}
+    for option in ("--keywords", "--misses", "--output"):
+        value = pop_option(args, option)
+        if option in sys.argv and value is None:
+            print(f"Error: {option} requires a file path")
+            return 2
+        paths[option] = Path(value) if value is not None else None
+
+    zip_in_order = "--zip-in-order" in args
+    args = [arg for arg in args if arg != "--zip-in-order"]
+
+    tree_path = Path(args[1])
+    dump_path = Path(args[2])
+    for path in (tree_path, dump_path, paths["--keywords"]):
+        if path is not None and not path.exists():
+            print(f"Error: Path {path} does not exist")
+            return 2
+
+    start_time = time.perf_counter()
+    keywords, keyword_regex = None, None
+    if paths["--keywords"] is not None:
+        try:
+            keywords, keyword_regex = load_keywords(paths["--keywords"])
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"✗ Cannot read {paths['--keywords']}: {e}")
+            return 1
+    translations, rules = load_tree(tree_path, 0, zip_in_order)
+    engine, failed_rules = build_engine(translations, rules, keywords, keyword_regex)
+    print(f"Loaded {len(translations):,} exact translations and {len(rules):,} regex rules"
+          + (f", {len(keywords):,} keywords" if keywords else ""))
+    if failed_rules:
+        print(f"  {len(failed_rules)} regex rules cannot be compiled by Python re and are skipped, "
+              f"e.g. \"{shorten(failed_rules[0][0])}\": {failed_rules[0][1]}")
+
+    dump_files = find_dump_files(dump_path)
+    file_texts = []
+    all_texts = Counter()
+    for dump_file in dump_files:
+        texts = read_dump(dump_file)
+        file_texts.append((dump_file, texts))
+        all_texts.update(texts)
+    unique_texts = list(all_texts)
+    print(f"Looking up {sum(all_texts.values()):,} lines ({len(unique_texts):,} unique) from {len(dump_files)} files"
+          + (f" in {jobs} worker processes..." if jobs > 1 else "..."))
+
+    stages = dict(zip(unique_texts, translate_texts(engine, unique_texts, jobs)))
+
+    total = Counter()
+    file_reports = []
+    for dump_file, texts in file_texts:
+        counts = Counter()
+        for text, count in texts.items():
+            counts[stages[text]] += count
+        total.update(counts)
+        name = dump_file.relative_to(dump_path).as_posix() if dump_path.is_dir() else dump_file.name
+        file_reports.append({'file': name, 'lines': sum(texts.values()), 'hit_rate': hit_rate(counts),
+                             'stages': {stage: counts[stage] for stage in STAGES}})
+
+    line_count = sum(total.values())
+    print("-" * 50)
+    print(f"Hit rate: {format_rate(hit_rate(total))} of {line_count - sum(total[stage] for stage in SKIP_STAGES):,} "
+          f"translatable lines")
+    for stage, label in STAGES.items():
+        if total[stage]:
+            print(f"  {label}: {total[stage]:,} ({total[stage] / line_count * 100:.2f}%)")
+
+    if len(file_reports) > 1:
+        print()
+        print("Per file:")
+        width = max(len(report['file']) for report in file_reports)
+        for report in file_reports:
+            print(f"  {report['file']:<{width}}  {format_rate(report['hit_rate']):>8}  "
+                  f"{report['stages']['miss']:,} misses of {report['lines']:,} lines")
+
+    misses = sorted(((text, count) for text, count in all_texts.items() if stages[text] == 'miss'),
+                    key=lambda miss: (-miss[1], miss[0]))
+    if misses:
+        print()
+        print(f"Most frequent misses ({len(misses):,} unique):")
+        for text, count in misses[:top]:
+            print(f"  {count:>8,}  {shorten(text, 60)}")
+        if top is not None and len(misses) > top:
+            print(f"  ... {len(misses) - top} more")
+
+    if paths["--misses"] is not None:
+        paths["--misses"].parent.mkdir(parents=True, exist_ok=True)
+        unwritable = 0
+        with open(paths["--misses"], 'w', encoding='utf-8', newline='\n') as outfile:
+            for text, count in misses:
+                # A text starting with ; or $ would become a comment or a regex rule
+                if text[0] in ';$':
+                    unwritable += 1
+                    continue
+                outfile.write(f"; {count} lines\n{text.translate(TXT_ESCAPES)}\t\n")
+        print(f"Misses written to {paths['--misses']}"
+              + (f", {unwritable} starting with ; or $ left out" if unwritable else ""))
+
+    if paths["--output"] is not None:
+        report = {
+            'hit_rate': hit_rate(total),
+            'lines': line_count,
+            'unique': len(unique_texts),
+            'stages': {stage: total[stage] for stage in STAGES},
+            'files': file_reports,
+            'failed_rules': [{'pattern': pattern, 'error': error} for pattern, error in failed_rules]
+        }
+        paths["--output"].parent.mkdir(parents=True, exist_ok=True)
+        with open(paths["--output"], 'w', encoding='utf-8') as outfile:
+            json.dump(report, outfile, ensure_ascii=False, indent=2)
+        print(f"Report written to {paths['--output']}")
+
+    print(f"Done in {time.perf_counter() - start_time:.2f} s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,662 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: 将翻译文件夹编译为可内存映射的单个二进制索引，并与源文件对照验证
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import csv
+import io
+import mmap
+import re
+import struct
+import sys
+import time
+import zipfile
+import zlib
+from pathlib import Path
+
+# UTF-8 BOM，只在文件开头被跳过
+BYTE_ORDER_MARK = '\ufeff'
+
+# TxtTranslationFileProcessor 会从译文中移除此字符，见 XUAT RedirectedResourceDetectionStrategy
+MONGOLIAN_VOWEL_SEPARATOR = '\u180e'
+
+# StreamReader.ReadLine 的换行符
+LINE_BREAK = re.compile(r'\r\n|\r|\n')
+
+# StringExtensions.Unescape 支持的转义序列，其他序列保持原样
+ESCAPES = {
+    '0': '\0',
+    'a': '\a',
+    'b': '\b',
+    't': '\t',
+    'n': '\n',
+    'v': '\v',
+    'f': '\f',
+    'r': '\r',
+    "'": "'",
+    '"': '"',
+    '\\': '\\'
+}
+
+# 索引文件的起始字节
+INDEX_MAGIC = b'JATINDEX'
+
+# 格式版本，布局每次发生不兼容的变化时递增
+INDEX_VERSION = 1
+
+# 文件头：魔数、版本、类型、标志、源文件数、条目数、正则规则数、
+# 字符串池字节数、文件头之后全部内容的 CRC-32
+HEADER = struct.Struct('<8sIIIIIIII')
+
+# 键表和正则规则表的条目：键（或模式）在字符串池中的字节偏移和长度，
+# 然后是译文（或模板）的字节偏移和长度
+ENTRY = struct.Struct('<IIII')
+
+# 字符串池的编码，即 .NET 字符串的编码，插件无需解码即可用序数比较二分查找键表
+POOL_ENCODING = 'utf-16-le'
+
+# 索引类型、其替代的加载器，以及该加载器读取的文件后缀
+INDEX_KINDS = ('Text', 'UI')
+KIND_SUFFIXES = ('.txt', '.csv')
+
+# zip 成员按名称排序加载时设置的标志（AllowFilesInZipLoadInOrder）
+FLAG_ZIP_IN_ORDER = 1
+
+# --verify 列出的不一致数
+REPORT_MISMATCHES = 10
+
+def is_member_path_unsafe(member_name):
+    """
+    与插件中的 FileTool.IsZipPathUnsafe 相同的方式检查压缩包成员名
+
+    拒绝空名称、上级目录引用以及绝对路径或带根路径。
+
+    Args:
+        member_name (str): 压缩包中的成员名
+
+    Returns:
+        bool: 成员不可使用时为 True
+    """
+
+    if not member_name:
+        return True
+
+    # 统一路径分隔符
+    normalized_path = member_name.replace('\\', '/')
+
+    # 拒绝 "../"
+    if '../' in normalized_path:
+        return True
+
+    # 拒绝绝对路径，包括 Windows 盘符路径
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def ordinal_key(text):
+    """
+    与 .NET StringComparer.Ordinal 一致的排序键，按 UTF-16 码元比较
+
+    Args:
+        text (str): 要排序的文本
+
+    Returns:
+        bytes: 文本的 UTF-16 大端编码
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def loader_order_key(relative_path):
+    """
+    插件加载翻译文件顺序的排序键
+
+    插件先加载翻译文件夹根目录中的文件，再加载各子文件夹中的文件，
+    文件夹和文件都按序数路径排序 (FileTool.GetAllTranslationFiles)。
+
+    Args:
+        relative_path (Path): 相对于翻译文件夹的文件路径
+
+    Returns:
+        tuple: 排序键
+    """
+
+    folder = relative_path.parent.parts
+    return len(folder) > 0, ordinal_key('\\'.join(folder)), ordinal_key(relative_path.name)
+
+def unescape(text, unknown_escapes=None):
+    """
+    与插件中的 StringExtensions.Unescape 相同的方式替换转义序列
+
+    未知序列连同反斜杠保持原样，文本末尾的反斜杠也保留。
+
+    Args:
+        text (str): 含转义序列的文本
+        unknown_escapes (list): 可选，接收未知序列，例如 "\\x"
+
+    Returns:
+        str: 反转义后的文本
+    """
+
+    index = text.find('\\')
+    if index < 0:
+        return text
+
+    parts = []
+    start = 0
+    while 0 <= index < len(text) - 1:
+        parts.append(text[start:index])
+        char = text[index + 1]
+        escaped = ESCAPES.get(char)
+        if escaped is None:
+            parts.append('\\' + char)
+            if unknown_escapes is not None:
+                unknown_escapes.append('\\' + char)
+        else:
+            parts.append(escaped)
+        start = index + 2
+        index = text.find('\\', start)
+    parts.append(text[start:])
+    return ''.join(parts)
+
+def add_translation_lines(data, source, translations, rules):
+    """
+    与 TxtTranslationFileProcessor 相同的方式解析 .txt 翻译文件的行
+
+    Args:
+        data (bytes): 文件内容
+        source (str): 报告中显示的文件名
+        translations (dict): 精确翻译，会被原地修改
+        rules (list): 正则规则，会被原地修改
+    """
+
+    text = data.decode('utf-8', 'replace')
+    if text.startswith(BYTE_ORDER_MARK):
+        text = text[1:]
+
+    for line_number, line in enumerate(LINE_BREAK.split(text), 1):
+        if not line or line[0] == ';':
+            continue
+        original, tab, translation = line.partition('\t')
+        if not tab:
+            continue
+        original = unescape(original)
+        translation = unescape(translation).replace(MONGOLIAN_VOWEL_SEPARATOR, '')
+        if not original or not translation:
+            continue
+        if line[0] == '$':
+            rules.append({'source': f"{source}:{line_number}", 'pattern': original[1:], 'template': translation})
+        else:
+            translations[original] = translation
+
+def find_source_files(input_path, suffix):
+    """
+    按插件的加载顺序查找文件夹中的翻译文件
+
+    Args:
+        input_path (Path): 翻译文件夹，或单个翻译文件或 .zip 文件
+        suffix (str): 翻译文件后缀
+
+    Returns:
+        list: (文件路径, 报告中显示的名称) 元组
+    """
+
+    if input_path.is_file():
+        return [(input_path, input_path.name)]
+    files = [file for file in input_path.rglob('*')
+             if file.is_file() and file.name.lower().endswith((suffix, '.zip'))]
+    files.sort(key=lambda file: loader_order_key(file.relative_to(input_path)))
+    return [(file, file.relative_to(input_path).as_posix()) for file in files]
+
+def iter_csv_lines(text):
+    """
+    逐行产出 CSV 文本，跳过 CsvHelper 忽略的注释行（AllowComments）
+
+    以 # 开头的行只有在引号字段之外才是注释，引号数量可以判断之前的行是否留下了未闭合的字段。
+
+    Args:
+        text (str): CSV 文本
+
+    Yields:
+        str: 带换行符的行
+    """
+
+    in_quotes = False
+    for line in io.StringIO(text, newline=''):
+        if not in_quotes and line.startswith('#'):
+            continue
+        if line.count('"') % 2:
+            in_quotes = not in_quotes
+        yield line
+
+def add_csv_rows(data, translations):
+    """
+    与 CsvTranslationFileProcessor 相同的方式解析 .csv 翻译文件
+
+    表头去除首尾空白后不区分大小写匹配，空行和只含空白的记录会被跳过，
+    没有 Term 或 Translation 的行会被忽略。
+
+    Args:
+        data (bytes): 文件内容
+        translations (dict): 翻译，会被原地修改
+    """
+
+    columns = None
+    for row in csv.reader(iter_csv_lines(data.decode('utf-8-sig', 'replace'))):
+        if all(not field or field.isspace() for field in row):
+            continue
+        if columns is None:
+            columns = {name.strip().lower(): index for index, name in reversed(list(enumerate(row)))}
+            continue
+        term_index = columns.get('term')
+        translation_index = columns.get('translation')
+        term = row[term_index] if term_index is not None and term_index < len(row) else None
+        translation = row[translation_index] if translation_index is not None and translation_index < len(row) else None
+        if term and translation:
+            translations[term] = translation
+
+def load_sources(input_path, kind, zip_in_order=False):
+    """
+    按 AsyncTranslationLoader 的方式加载翻译文件夹
+
+    后加载的文件会替换之前文件的翻译。.txt 文件的每个 $ 行都是一条独立的正则规则，
+    插件以 Regex 实例为键，因此相同的模式也都会保留。
+
+    Args:
+        input_path (Path): 翻译文件夹，或单个翻译文件或 .zip 文件
+        kind (int): 加载器在 INDEX_KINDS 中的序号
+        zip_in_order (bool): 按名称排序加载 zip 成员，而不是按存储顺序
+
+    Returns:
+        tuple: (翻译, (模式, 模板) 规则列表, 文件数)
+    """
+
+    suffix = KIND_SUFFIXES[kind]
+    translations = {}
+    rules = []
+
+    def add_file(data, name):
+        if suffix == '.csv':
+            add_csv_rows(data, translations)
+            return
+        file_rules = []
+        add_translation_lines(data, name, translations, file_rules)
+        rules.extend((rule['pattern'], rule['template']) for rule in file_rules)
+
+    files = find_source_files(input_path, suffix)
+    for file_path, name in files:
+        try:
+            if not file_path.name.lower().endswith('.zip'):
+                add_file(file_path.read_bytes(), name)
+                continue
+            with zipfile.ZipFile(file_path) as archive:
+                members = [info for info in archive.infolist()
+                           if not info.is_dir() and info.filename.lower().endswith(suffix)
+                           and not is_member_path_unsafe(info.filename)]
+                if zip_in_order:
+                    members.sort(key=lambda info: ordinal_key(info.filename))
+                for info in members:
+                    try:
+                        add_file(archive.read(info), f"{name}/{info.filename}")
+                    except (OSError, zipfile.BadZipFile, csv.Error) as e:
+                        print(f"✗ 读取 {name}/{info.filename} 时发生错误: {e}")
+        except (OSError, zipfile.BadZipFile, csv.Error) as e:
+            print(f"✗ 读取 {name} 时发生错误: {e}")
+    return translations, rules, len(files)
+
+def build_index(translations, rules, kind, flags, file_count):
+    """
+    将翻译和正则规则序列化为二进制索引格式
+
+    文件头之后依次为：按序数键排序的键表、按加载顺序排列的正则规则表、字符串池。
+    相同的字符串在字符串池中只存储一次。
+
+    Args:
+        translations (dict): 翻译
+        rules (list): 按加载顺序排列的 (模式, 模板) 正则规则
+        kind (int): 加载器在 INDEX_KINDS 中的序号
+        flags (int): FLAG_* 标志位
+        file_count (int): 源文件数
+
+    Returns:
+        bytes: 索引文件内容
+    """
+
+    pool = bytearray()
+    pooled = {}
+
+    def add_string(text):
+        location = pooled.get(text)
+        if location is None:
+            encoded = text.encode(POOL_ENCODING, 'surrogatepass')
+            location = pooled[text] = (len(pool), len(encoded))
+            pool.extend(encoded)
+        return location
+
+    tables = bytearray()
+    for key in sorted(translations, key=ordinal_key):
+        tables += ENTRY.pack(*add_string(key), *add_string(translations[key]))
+    for pattern, template in rules:
+        tables += ENTRY.pack(*add_string(pattern), *add_string(template))
+    if len(pool) > 0xFFFFFFFF:
+        raise ValueError(f"{len(pool):,} 字节的字符串池超出 32 位偏移的范围")
+
+    body = tables + pool
+    header = HEADER.pack(INDEX_MAGIC, INDEX_VERSION, kind, flags, file_count,
+                         len(translations), len(rules), len(pool), zlib.crc32(body))
+    return header + body
+
+def open_index(index_file):
+    """
+    内存映射索引文件并检查文件头
+
+    Args:
+        index_file (Path): 索引文件
+
+    Returns:
+        dict: 文件头字段、各表偏移，以及使用后需要关闭的 'map'
+
+    Raises:
+        ValueError: 文件不是受支持版本的索引
+    """
+
+    with open(index_file, 'rb') as file:
+        index_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(index_map) < HEADER.size:
+            raise ValueError("文件比索引文件头还短")
+        magic, version, kind, flags, file_count, entry_count, rule_count, pool_size, checksum = \
+            HEADER.unpack_from(index_map, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError("不是翻译索引文件")
+        if version != INDEX_VERSION:
+            raise ValueError(f"不支持索引版本 {version}，需要版本 {INDEX_VERSION}")
+        if kind >= len(INDEX_KINDS):
+            raise ValueError(f"未知的索引类型 {kind}")
+        pool_offset = HEADER.size + (entry_count + rule_count) * ENTRY.size
+        if pool_offset + pool_size != len(index_map):
+            raise ValueError("文件大小与文件头不符，索引已被截断或损坏")
+    except ValueError:
+        index_map.close()
+        raise
+
+    return {
+        'map': index_map,
+        'kind': kind,
+        'flags': flags,
+        'file_count': file_count,
+        'entry_count': entry_count,
+        'rule_count': rule_count,
+        'checksum': checksum,
+        'rules_offset': HEADER.size + entry_count * ENTRY.size,
+        'pool_offset': pool_offset
+    }
+
+def check_index(index):
+    """
+    检查已打开索引的 CRC-32
+
+    Args:
+        index (dict): open_index 返回的索引
+
+    Returns:
+        bool: 各表和字符串池完好时为 True
+    """
+
+    return zlib.crc32(index['map'][HEADER.size:]) == index['checksum']
+
+def read_entry(index, table_offset, position):
+    """
+    读取键表或正则规则表中的一个条目
+
+    Args:
+        index (dict): open_index 返回的索引
+        table_offset (int): 表的字节偏移
+        position (int): 条目在表中的序号
+
+    Returns:
+        tuple: (键或模式, 译文或模板)
+    """
+
+    index_map = index['map']
+    pool_offset = index['pool_offset']
+    key_offset, key_length, value_offset, value_length = ENTRY.unpack_from(index_map, table_offset + position * ENTRY.size)
+    key_start = pool_offset + key_offset
+    value_start = pool_offset + value_offset
+    return (index_map[key_start:key_start + key_length].decode(POOL_ENCODING, 'surrogatepass'),
+            index_map[value_start:value_start + value_length].decode(POOL_ENCODING, 'surrogatepass'))
+
+def iter_translations(index):
+    """
+    按键的顺序产出索引中的翻译
+
+    Args:
+        index (dict): open_index 返回的索引
+
+    Yields:
+        tuple: (键, 译文)
+    """
+
+    for position in range(index['entry_count']):
+        yield read_entry(index, HEADER.size, position)
+
+def read_rules(index):
+    """
+    读取索引中的正则规则
+
+    Args:
+        index (dict): open_index 返回的索引
+
+    Returns:
+        list: 按加载顺序排列的 (模式, 模板) 规则
+    """
+
+    return [read_entry(index, index['rules_offset'], position) for position in range(index['rule_count'])]
+
+def lookup(index, text):
+    """
+    在键表中二分查找文本的翻译
+
+    Args:
+        index (dict): open_index 返回的索引
+        text (str): 要翻译的文本
+
+    Returns:
+        str: 译文，没有翻译时为 None
+    """
+
+    index_map = index['map']
+    pool_offset = index['pool_offset']
+    target = ordinal_key(text)
+    low, high = 0, index['entry_count']
+    while low < high:
+        middle = (low + high) // 2
+        key_offset, key_length, _, _ = ENTRY.unpack_from(index_map, HEADER.size + middle * ENTRY.size)
+        key_start = pool_offset + key_offset
+        key = ordinal_key(index_map[key_start:key_start + key_length].decode(POOL_ENCODING, 'surrogatepass'))
+        if key < target:
+            low = middle + 1
+        elif key > target:
+            high = middle
+        else:
+            return read_entry(index, HEADER.size, middle)[1]
+    return None
+
+def verify_index(index, translations, rules):
+    """
+    将索引与从源文件加载的翻译和正则规则进行比较
+
+    Args:
+        index (dict): open_index 返回的索引
+        translations (dict): load_sources 返回的翻译
+        rules (list): load_sources 返回的正则规则
+
+    Returns:
+        list: 不一致的描述，索引可完整还原时为空
+    """
+
+    mismatches = []
+    if index['entry_count'] != len(translations):
+        mismatches.append(f"索引有 {index['entry_count']:,} 条翻译，源文件有 {len(translations):,} 条")
+
+    previous_key = None
+    for key, translation in iter_translations(index):
+        if previous_key is not None and ordinal_key(previous_key) >= ordinal_key(key):
+            mismatches.append(f"键表在 \"{key}\" 处未排序")
+        previous_key = key
+        if key not in translations:
+            mismatches.append(f"\"{key}\" 不在源文件中")
+        elif translations[key] != translation:
+            mismatches.append(f"\"{key}\" 的译文为 \"{translation}\"，源文件中为 \"{translations[key]}\"")
+
+    for key, translation in translations.items():
+        if lookup(index, key) != translation:
+            mismatches.append(f"查找 \"{key}\" 未返回其译文")
+
+    index_rules = read_rules(index)
+    if index_rules != rules:
+        mismatches.append(f"索引有 {len(index_rules):,} 条正则规则，源文件有 {len(rules):,} 条")
+        for position, (index_rule, rule) in enumerate(zip(index_rules, rules), 1):
+            if index_rule != rule:
+                mismatches.append(f"第 {position} 条正则规则为 \"{index_rule[0]}\"，源文件中为 \"{rule[0]}\"")
+    return mismatches
+
+def pop_option(args, name, default=None):
+    """
+    从参数列表中移除带值的选项
+
+    支持 "--name value" 和 "--name=value" 两种写法
+
+    Args:
+        args (list): 参数列表，会被原地修改
+        name (str): 选项名
+        default (str): 选项不存在时返回的值
+
+    Returns:
+        str: 选项值，选项没有值时为 None
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """打印命令行用法"""
+
+    print("翻译索引构建工具")
+    print("将翻译文件夹编译为二进制索引，可直接内存映射而无需解析")
+    print()
+    print("用法:")
+    print("  python script.py <翻译文件夹|文件|file.zip> <output.jatidx> [--ui] [--zip-in-order]")
+    print("  python script.py --verify <index.jatidx> <翻译文件夹|文件|file.zip>")
+    print()
+    print("示例:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/Text ./Text.jatidx")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/UI ./UI.jatidx --ui")
+    print("  python script.py --verify ./Text.jatidx ./BepInEx/JustAnotherTranslator/Chinese/Text")
+    print()
+    print("参数说明:")
+    print("  翻译文件夹: 包含翻译文件和 .zip 文件的文件夹，按插件的顺序加载")
+    print("  --ui: （可选）读取 .csv UI 翻译，而不是 .txt 文本翻译")
+    print("  --zip-in-order: （可选）按名称排序加载 zip 成员，与 AllowFilesInZipLoadInOrder 相同")
+    print("  --verify: 重新加载源文件，检查每条翻译和正则规则都能完整还原")
+    print()
+    print("注意事项:")
+    print("  - 后加载的文件会替换之前文件的翻译，$ 正则规则按加载顺序保留")
+    print("  - 翻译文件修改后必须重新构建索引")
+    print()
+
+def main():
+    """主函数，处理命令行参数"""
+
+    args = sys.argv.copy()
+    if len(args) < 3 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    index_file = pop_option(args, "--verify")
+    if "--verify" in sys.argv and index_file is None:
+        print("错误：--verify 需要一个索引文件")
+        return 2
+
+    kind = 1 if "--ui" in args else 0
+    flags = FLAG_ZIP_IN_ORDER if "--zip-in-order" in args else 0
+    args = [arg for arg in args if arg not in ("--ui", "--zip-in-order")]
+
+    if index_file is not None:
+        if len(args) < 2:
+            print_usage()
+            return 2
+        input_path = Path(args[1])
+        index_file = Path(index_file)
+        for path in (index_file, input_path):
+            if not path.exists():
+                print(f"错误：路径 {path} 不存在")
+                return 2
+
+        start_time = time.perf_counter()
+        try:
+            index = open_index(index_file)
+        except (OSError, ValueError) as e:
+            print(f"✗ 无法打开 {index_file}: {e}")
+            return 1
+        try:
+            intact = check_index(index)
+            translations_read = sum(1 for _ in iter_translations(index))
+            index_time = time.perf_counter() - start_time
+            if not intact:
+                print(f"✗ {index_file} 已损坏，校验和不符")
+                return 1
+
+            start_time = time.perf_counter()
+            translations, rules, file_count = load_sources(input_path, index['kind'],
+                                                           bool(index['flags'] & FLAG_ZIP_IN_ORDER))
+            source_time = time.perf_counter() - start_time
+            mismatches = verify_index(index, translations, rules)
+        finally:
+            index['map'].close()
+
+        print(f"{INDEX_KINDS[index['kind']]} 索引：读取 {translations_read:,} 条翻译和 {index['rule_count']:,} 条正则规则"
+              f"耗时 {index_time:.3f} 秒，解析源文件耗时 {source_time:.3f} 秒")
+        if index['file_count'] != file_count:
+            print(f"  索引由 {index['file_count']} 个文件构建，源文件现有 {file_count} 个")
+        if mismatches:
+            print(f"✗ {len(mismatches):,} 处不一致，请重新构建索引:")
+            for mismatch in mismatches[:REPORT_MISMATCHES]:
+                print(f"  {mismatch}")
+            if len(mismatches) > REPORT_MISMATCHES:
+                print(f"  ……另有 {len(mismatches) - REPORT_MISMATCHES} 处")
+            return 1
+        print(f"✓ {index_file} 与 {input_path} 一致")
+        return 0
+
+    input_path = Path(args[1])
+    output_file = Path(args[2])
+    if not input_path.exists():
+        print(f"错误：路径 {input_path} 不存在")
+        return 2
+
+    start_time = time.perf_counter()
+    translations, rules, file_count = load_sources(input_path, kind, bool(flags & FLAG_ZIP_IN_ORDER))
+    try:
+        data = build_index(translations, rules, kind, flags, file_count)
+    except ValueError as e:
+        print(f"✗ 无法构建索引: {e}")
+        return 1
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_bytes(data)
+    print(f"✓ 已写入 {output_file}：来自 {file_count} 个文件的 {len(translations):,} 条翻译和 {len(rules):,} 条正则规则，"
+          f"{len(data):,} 字节，耗时 {time.perf_counter() - start_time:.3f} 秒")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,664 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Compile a translation folder into a single memory-mappable binary index and verify it against the sources
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import csv
+import io
+import mmap
+import re
+import struct
+import sys
+import time
+import zipfile
+import zlib
+from pathlib import Path
+
+# UTF-8 byte order mark, only skipped at the start of a file
+BYTE_ORDER_MARK = '\ufeff'
+
+# Removed from the translation by TxtTranslationFileProcessor, see XUAT RedirectedResourceDetectionStrategy
+MONGOLIAN_VOWEL_SEPARATOR = '\u180e'
+
+# Line breaks of StreamReader.ReadLine
+LINE_BREAK = re.compile(r'\r\n|\r|\n')
+
+# Escape sequences of StringExtensions.Unescape, any other sequence is kept as is
+ESCAPES = {
+    '0': '\0',
+    'a': '\a',
+    'b': '\b',
+    't': '\t',
+    'n': '\n',
+    'v': '\v',
+    'f': '\f',
+    'r': '\r',
+    "'": "'",
+    '"': '"',
+    '\\': '\\'
+}
+
+# First bytes of an index file
+INDEX_MAGIC = b'JATINDEX'
+
+# Format version, increased on every incompatible change of the layout
+INDEX_VERSION = 1
+
+# Header: magic, version, kind, flags, number of source files, number of entries, number of regex rules,
+# size of the string pool in bytes, CRC-32 of everything after the header
+HEADER = struct.Struct('<8sIIIIIIII')
+
+# Entry of the key table and of the regex rule table: byte offset and length in the string pool of
+# the key (or pattern), then of the translation (or template)
+ENTRY = struct.Struct('<IIII')
+
+# Encoding of the string pool, the strings of a .NET string, so the plugin can binary search the
+# key table with an ordinal comparison without decoding
+POOL_ENCODING = 'utf-16-le'
+
+# Index kinds, the loader they replace and the suffix of the files read by that loader
+INDEX_KINDS = ('Text', 'UI')
+KIND_SUFFIXES = ('.txt', '.csv')
+
+# Flag set when zip members were loaded sorted by name (AllowFilesInZipLoadInOrder)
+FLAG_ZIP_IN_ORDER = 1
+
+# Mismatches listed by --verify
+REPORT_MISMATCHES = 10
+
+def is_member_path_unsafe(member_name):
+    """
+    Check an archive member name the same way as FileTool.IsZipPathUnsafe in the plugin
+
+    Rejects empty names, parent folder references and absolute or rooted paths.
+
+    Args:
+        member_name (str): Member name in the archive
+
+    Returns:
+        bool: True if the member must not be used
+    """
+
+    if not member_name:
+        return True
+
+    # Unify path separators
+    normalized_path = member_name.replace('\\', '/')
+
+    # Reject "../"
+    if '../' in normalized_path:
+        return True
+
+    # Reject absolute paths, including Windows drive paths
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def ordinal_key(text):
+    """
+    Sort key matching .NET StringComparer.Ordinal, which compares UTF-16 code units
+
+    Args:
+        text (str): Text to sort
+
+    Returns:
+        bytes: UTF-16 big-endian encoding of the text
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def loader_order_key(relative_path):
+    """
+    Sort key for the order in which the plugin loads translation files
+
+    The plugin loads the files in the root of the translation folder first, then the files of
+    every subfolder, with folders and files each sorted by ordinal path (FileTool.GetAllTranslationFiles).
+
+    Args:
+        relative_path (Path): File path relative to the translation folder
+
+    Returns:
+        tuple: Sort key
+    """
+
+    folder = relative_path.parent.parts
+    return len(folder) > 0, ordinal_key('\\'.join(folder)), ordinal_key(relative_path.name)
+
+def unescape(text, unknown_escapes=None):
+    """
+    Replace escape sequences the same way as StringExtensions.Unescape in the plugin
+
+    Unknown sequences are kept with their backslash, and so is a backslash at the end of the text.
+
+    Args:
+        text (str): Text with escape sequences
+        unknown_escapes (list): Optional, receives the unknown sequences such as "\\x"
+
+    Returns:
+        str: Unescaped text
+    """
+
+    index = text.find('\\')
+    if index < 0:
+        return text
+
+    parts = []
+    start = 0
+    while 0 <= index < len(text) - 1:
+        parts.append(text[start:index])
+        char = text[index + 1]
+        escaped = ESCAPES.get(char)
+        if escaped is None:
+            parts.append('\\' + char)
+            if unknown_escapes is not None:
+                unknown_escapes.append('\\' + char)
+        else:
+            parts.append(escaped)
+        start = index + 2
+        index = text.find('\\', start)
+    parts.append(text[start:])
+    return ''.join(parts)
+
+def add_translation_lines(data, source, translations, rules):
+    """
+    Parse the lines of a .txt translation file the same way as TxtTranslationFileProcessor
+
+    Args:
+        data (bytes): File content
+        source (str): File name shown in reports
+        translations (dict): Exact translations, modified in place
+        rules (list): Regex rules, modified in place
+    """
+
+    text = data.decode('utf-8', 'replace')
+    if text.startswith(BYTE_ORDER_MARK):
+        text = text[1:]
+
+    for line_number, line in enumerate(LINE_BREAK.split(text), 1):
+        if not line or line[0] == ';':
+            continue
+        original, tab, translation = line.partition('\t')
+        if not tab:
+            continue
+        original = unescape(original)
+        translation = unescape(translation).replace(MONGOLIAN_VOWEL_SEPARATOR, '')
+        if not original or not translation:
+            continue
+        if line[0] == '$':
+            rules.append({'source': f"{source}:{line_number}", 'pattern': original[1:], 'template': translation})
+        else:
+            translations[original] = translation
+
+def find_source_files(input_path, suffix):
+    """
+    Find the translation files of a folder in the order the plugin loads them
+
+    Args:
+        input_path (Path): Translation folder, or a single translation or .zip file
+        suffix (str): Suffix of the translation files
+
+    Returns:
+        list: (file path, name shown in reports) tuples
+    """
+
+    if input_path.is_file():
+        return [(input_path, input_path.name)]
+    files = [file for file in input_path.rglob('*')
+             if file.is_file() and file.name.lower().endswith((suffix, '.zip'))]
+    files.sort(key=lambda file: loader_order_key(file.relative_to(input_path)))
+    return [(file, file.relative_to(input_path).as_posix()) for file in files]
+
+def iter_csv_lines(text):
+    """
+    Yield the lines of a CSV text except the comment lines skipped by CsvHelper (AllowComments)
+
+    A line starting with # is only a comment outside a quoted field, the quote count tells
+    whether the previous lines left a field open.
+
+    Args:
+        text (str): CSV text
+
+    Yields:
+        str: Line with its line break
+    """
+
+    in_quotes = False
+    for line in io.StringIO(text, newline=''):
+        if not in_quotes and line.startswith('#'):
+            continue
+        if line.count('"') % 2:
+            in_quotes = not in_quotes
+        yield line
+
+def add_csv_rows(data, translations):
+    """
+    Parse a .csv translation file the same way as CsvTranslationFileProcessor
+
+    The header is matched trimmed and case-insensitive, blank and whitespace-only records are
+    skipped and rows without a Term or a Translation are ignored.
+
+    Args:
+        data (bytes): File content
+        translations (dict): Translations, modified in place
+    """
+
+    columns = None
+    for row in csv.reader(iter_csv_lines(data.decode('utf-8-sig', 'replace'))):
+        if all(not field or field.isspace() for field in row):
+            continue
+        if columns is None:
+            columns = {name.strip().lower(): index for index, name in reversed(list(enumerate(row)))}
+            continue
+        term_index = columns.get('term')
+        translation_index = columns.get('translation')
+        term = row[term_index] if term_index is not None and term_index < len(row) else None
+        translation = row[translation_index] if translation_index is not None and translation_index < len(row) else None
+        if term and translation:
+            translations[term] = translation
+
+def load_sources(input_path, kind, zip_in_order=False):
+    """
+    Load a translation folder the way AsyncTranslationLoader does
+
+    Later files replace the translations of earlier ones. Every $ line of a .txt file becomes its
+    own regex rule, the plugin keys them by Regex instance so identical patterns are all kept.
+
+    Args:
+        input_path (Path): Translation folder, or a single translation or .zip file
+        kind (int): Index of the loader in INDEX_KINDS
+        zip_in_order (bool): Load zip members sorted by name instead of in storage order
+
+    Returns:
+        tuple: (translations, list of (pattern, template) rules, number of files)
+    """
+
+    suffix = KIND_SUFFIXES[kind]
+    translations = {}
+    rules = []
+
+    def add_file(data, name):
+        if suffix == '.csv':
+            add_csv_rows(data, translations)
+            return
+        file_rules = []
+        add_translation_lines(data, name, translations, file_rules)
+        rules.extend((rule['pattern'], rule['template']) for rule in file_rules)
+
+    files = find_source_files(input_path, suffix)
+    for file_path, name in files:
+        try:
+            if not file_path.name.lower().endswith('.zip'):
+                add_file(file_path.read_bytes(), name)
+                continue
+            with zipfile.ZipFile(file_path) as archive:
+                members = [info for info in archive.infolist()
+                           if not info.is_dir() and info.filename.lower().endswith(suffix)
+                           and not is_member_path_unsafe(info.filename)]
+                if zip_in_order:
+                    members.sort(key=lambda info: ordinal_key(info.filename))
+                for info in members:
+                    try:
+                        add_file(archive.read(info), f"{name}/{info.filename}")
+                    except (OSError, zipfile.BadZipFile, csv.Error) as e:
+                        print(f"✗ Error reading {name}/{info.filename}: {e}")
+        except (OSError, zipfile.BadZipFile, csv.Error) as e:
+            print(f"✗ Error reading {name}: {e}")
+    return translations, rules, len(files)
+
+def build_index(translations, rules, kind, flags, file_count):
+    """
+    Serialize translations and regex rules into the binary index format
+
+    Layout after the header: the key table sorted by ordinal key, the regex rule table in load
+    order, then the string pool. Identical strings are stored once in the pool.
+
+    Args:
+        translations (dict): Translations
+        rules (list): (pattern, template) regex rules in load order
+        kind (int): Index of the loader in INDEX_KINDS
+        flags (int): FLAG_* bits
+        file_count (int): Number of source files
+
+    Returns:
+        bytes: Index file content
+    """
+
+    pool = bytearray()
+    pooled = {}
+
+    def add_string(text):
+        location = pooled.get(text)
+        if location is None:
+            encoded = text.encode(POOL_ENCODING, 'surrogatepass')
+            location = pooled[text] = (len(pool), len(encoded))
+            pool.extend(encoded)
+        return location
+
+    tables = bytearray()
+    for key in sorted(translations, key=ordinal_key):
+        tables += ENTRY.pack(*add_string(key), *add_string(translations[key]))
+    for pattern, template in rules:
+        tables += ENTRY.pack(*add_string(pattern), *add_string(template))
+    if len(pool) > 0xFFFFFFFF:
+        raise ValueError(f"string pool of {len(pool):,} bytes does not fit 32-bit offsets")
+
+    body = tables + pool
+    header = HEADER.pack(INDEX_MAGIC, INDEX_VERSION, kind, flags, file_count,
+                         len(translations), len(rules), len(pool), zlib.crc32(body))
+    return header + body
+
+def open_index(index_file):
+    """
+    Memory-map an index file and check its header
+
+    Args:
+        index_file (Path): Index file
+
+    Returns:
+        dict: Header fields, table offsets and the 'map' to close after use
+
+    Raises:
+        ValueError: The file is not an index of a supported version
+    """
+
+    with open(index_file, 'rb') as file:
+        index_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(index_map) < HEADER.size:
+            raise ValueError("file is shorter than the index header")
+        magic, version, kind, flags, file_count, entry_count, rule_count, pool_size, checksum = \
+            HEADER.unpack_from(index_map, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError("not a translation index file")
+        if version != INDEX_VERSION:
+            raise ValueError(f"index version {version} is not supported, expected {INDEX_VERSION}")
+        if kind >= len(INDEX_KINDS):
+            raise ValueError(f"unknown index kind {kind}")
+        pool_offset = HEADER.size + (entry_count + rule_count) * ENTRY.size
+        if pool_offset + pool_size != len(index_map):
+            raise ValueError("file size does not match the header, the index is truncated or damaged")
+    except ValueError:
+        index_map.close()
+        raise
+
+    return {
+        'map': index_map,
+        'kind': kind,
+        'flags': flags,
+        'file_count': file_count,
+        'entry_count': entry_count,
+        'rule_count': rule_count,
+        'checksum': checksum,
+        'rules_offset': HEADER.size + entry_count * ENTRY.size,
+        'pool_offset': pool_offset
+    }
+
+def check_index(index):
+    """
+    Check the CRC-32 of an opened index
+
+    Args:
+        index (dict): Index returned by open_index
+
+    Returns:
+        bool: True if the tables and the string pool are intact
+    """
+
+    return zlib.crc32(index['map'][HEADER.size:]) == index['checksum']
+
+def read_entry(index, table_offset, position):
+    """
+    Read an entry of the key table or of the regex rule table
+
+    Args:
+        index (dict): Index returned by open_index
+        table_offset (int): Byte offset of the table
+        position (int): Entry number in the table
+
+    Returns:
+        tuple: (key or pattern, translation or template)
+    """
+
+    index_map = index['map']
+    pool_offset = index['pool_offset']
+    key_offset, key_length, value_offset, value_length = ENTRY.unpack_from(index_map, table_offset + position * ENTRY.size)
+    key_start = pool_offset + key_offset
+    value_start = pool_offset + value_offset
+    return (index_map[key_start:key_start + key_length].decode(POOL_ENCODING, 'surrogatepass'),
+            index_map[value_start:value_start + value_length].decode(POOL_ENCODING, 'surrogatepass'))
+
+def iter_translations(index):
+    """
+    Yield the translations of an index in key order
+
+    Args:
+        index (dict): Index returned by open_index
+
+    Yields:
+        tuple: (key, translation)
+    """
+
+    for position in range(index['entry_count']):
+        yield read_entry(index, HEADER.size, position)
+
+def read_rules(index):
+    """
+    Read the regex rules of an index
+
+    Args:
+        index (dict): Index returned by open_index
+
+    Returns:
+        list: (pattern, template) rules in load order
+    """
+
+    return [read_entry(index, index['rules_offset'], position) for position in range(index['rule_count'])]
+
+def lookup(index, text):
+    """
+    Find the translation of a text by binary search in the key table
+
+    Args:
+        index (dict): Index returned by open_index
+        text (str): Text to translate
+
+    Returns:
+        str: Translation, None if the text has none
+    """
+
+    index_map = index['map']
+    pool_offset = index['pool_offset']
+    target = ordinal_key(text)
+    low, high = 0, index['entry_count']
+    while low < high:
+        middle = (low + high) // 2
+        key_offset, key_length, _, _ = ENTRY.unpack_from(index_map, HEADER.size + middle * ENTRY.size)
+        key_start = pool_offset + key_offset
+        key = ordinal_key(index_map[key_start:key_start + key_length].decode(POOL_ENCODING, 'surrogatepass'))
+        if key < target:
+            low = middle + 1
+        elif key > target:
+            high = middle
+        else:
+            return read_entry(index, HEADER.size, middle)[1]
+    return None
+
+def verify_index(index, translations, rules):
+    """
+    Compare an index with the translations and regex rules loaded from the sources
+
+    Args:
+        index (dict): Index returned by open_index
+        translations (dict): Translations from load_sources
+        rules (list): Regex rules from load_sources
+
+    Returns:
+        list: Mismatch descriptions, empty if the index round-trips
+    """
+
+    mismatches = []
+    if index['entry_count'] != len(translations):
+        mismatches.append(f"index has {index['entry_count']:,} translations, the sources have {len(translations):,}")
+
+    previous_key = None
+    for key, translation in iter_translations(index):
+        if previous_key is not None and ordinal_key(previous_key) >= ordinal_key(key):
+            mismatches.append(f"key table is not sorted at \"{key}\"")
+        previous_key = key
+        if key not in translations:
+            mismatches.append(f"\"{key}\" is not in the sources")
+        elif translations[key] != translation:
+            mismatches.append(f"\"{key}\" is translated as \"{translation}\", the sources say \"{translations[key]}\"")
+
+    for key, translation in translations.items():
+        if lookup(index, key) != translation:
+            mismatches.append(f"lookup of \"{key}\" does not return its translation")
+
+    index_rules = read_rules(index)
+    if index_rules != rules:
+        mismatches.append(f"index has {len(index_rules):,} regex rules, the sources have {len(rules):,}")
+        for position, (index_rule, rule) in enumerate(zip(index_rules, rules), 1):
+            if index_rule != rule:
+                mismatches.append(f"regex rule {position} is \"{index_rule[0]}\", the sources say \"{rule[0]}\"")
+    return mismatches
+
+def pop_option(args, name, default=None):
+    """
+    Remove an option with a value from the argument list
+
+    Supports both "--name value" and "--name=value"
+
+    Args:
+        args (list): Argument list, modified in place
+        name (str): Option name
+        default (str): Value returned when the option is not present
+
+    Returns:
+        str: Option value, None if the option has no value
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """Print command line usage"""
+
+    print("Translation Index Builder")
+    print("Compile a translation folder into a binary index that can be memory-mapped instead of parsed")
+    print()
+    print("Usage:")
+    print("  python script.py <translation_folder|file|file.zip> <output.jatidx> [--ui] [--zip-in-order]")
+    print("  python script.py --verify <index.jatidx> <translation_folder|file|file.zip>")
+    print()
+    print("Examples:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/Text ./Text.jatidx")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/UI ./UI.jatidx --ui")
+    print("  python script.py --verify ./Text.jatidx ./BepInEx/JustAnotherTranslator/Chinese/Text")
+    print()
+    print("Parameters:")
+    print("  translation_folder: Folder with the translation and .zip files, loaded in the plugin's order")
+    print("  --ui: (optional) Read .csv UI translations instead of .txt text translations")
+    print("  --zip-in-order: (optional) Load zip members sorted by name, like AllowFilesInZipLoadInOrder")
+    print("  --verify: Reload the sources and check that every translation and regex rule round-trips")
+    print()
+    print("Notes:")
+    print("  - Later files replace the translations of earlier ones, $ regex rules are kept in load order")
+    print("  - The index must be rebuilt after the translation files change")
+    print()
+
+def main():
+    """Main function to handle command line arguments"""
+
+    args = sys.argv.copy()
+    if len(args) < 3 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if "--help" in args or "-h" in args else 2
+
+    index_file = pop_option(args, "--verify")
+    if "--verify" in sys.argv and index_file is None:
+        print("Error: --verify requires an index file")
+        return 2
+
+    kind = 1 if "--ui" in args else 0
+    flags = FLAG_ZIP_IN_ORDER if "--zip-in-order" in args else 0
+    args = [arg for arg in args if arg not in ("--ui", "--zip-in-order")]
+
+    if index_file is not None:
+        if len(args) < 2:
+            print_usage()
+            return 2
+        input_path = Path(args[1])
+        index_file = Path(index_file)
+        for path in (index_file, input_path):
+            if not path.exists():
+                print(f"Error: Path {path} does not exist")
+                return 2
+
+        start_time = time.perf_counter()
+        try:
+            index = open_index(index_file)
+        except (OSError, ValueError) as e:
+            print(f"✗ Cannot open {index_file}: {e}")
+            return 1
+        try:
+            intact = check_index(index)
+            translations_read = sum(1 for _ in iter_translations(index))
+            index_time = time.perf_counter() - start_time
+            if not intact:
+                print(f"✗ {index_file} is damaged, the checksum does not match")
+                return 1
+
+            start_time = time.perf_counter()
+            translations, rules, file_count = load_sources(input_path, index['kind'],
+                                                           bool(index['flags'] & FLAG_ZIP_IN_ORDER))
+            source_time = time.perf_counter() - start_time
+            mismatches = verify_index(index, translations, rules)
+        finally:
+            index['map'].close()
+
+        print(f"{INDEX_KINDS[index['kind']]} index: {translations_read:,} translations and {index['rule_count']:,} regex rules "
+              f"read in {index_time:.3f} s, sources parsed in {source_time:.3f} s")
+        if index['file_count'] != file_count:
+            print(f"  The index was built from {index['file_count']} files, the sources now have {file_count}")
+        if mismatches:
+            print(f"✗ {len(mismatches):,} mismatches, rebuild the index:")
+            for mismatch in mismatches[:REPORT_MISMATCHES]:
+                print(f"  {mismatch}")
+            if len(mismatches) > REPORT_MISMATCHES:
+                print(f"  ... {len(mismatches) - REPORT_MISMATCHES} more")
+            return 1
+        print(f"✓ {index_file} matches {input_path}")
+        return 0
+
+    input_path = Path(args[1])
+    output_file = Path(args[2])
+    if not input_path.exists():
+        print(f"Error: Path {input_path} does not exist")
+        return 2
+
+    start_time = time.perf_counter()
+    translations, rules, file_count = load_sources(input_path, kind, bool(flags & FLAG_ZIP_IN_ORDER))
+    try:
+        data = build_index(translations, rules, kind, flags, file_count)
+    except ValueError as e:
+        print(f"✗ Cannot build the index: {e}")
+        return 1
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_bytes(data)
+    print(f"✓ Wrote {output_file}: {len(translations):,} translations and {len(rules):,} regex rules "
+          f"from {file_count} files, {len(data):,} bytes in {time.perf_counter() - start_time:.3f} s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,741 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: 检查 .txt 翻译文件中会被插件丢弃或以非预期方式加载的行
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# 插件文本翻译加载器读取的文件后缀，zip 中只读取 .txt 文件
+TRANSLATION_FILE_SUFFIXES = ('.txt', '.zip')
+
+# StringExtensions.Unescape 支持的转义序列，其他序列保持原样
+ESCAPES = {
+    '0': '\0',
+    'a': '\a',
+    'b': '\b',
+    't': '\t',
+    'n': '\n',
+    'v': '\v',
+    'f': '\f',
+    'r': '\r',
+    "'": "'",
+    '"': '"',
+    '\\': '\\'
+}
+
+# TxtTranslationFileProcessor 会从译文中移除此字符，见 XUAT RedirectedResourceDetectionStrategy
+MONGOLIAN_VOWEL_SEPARATOR = '\u180e'
+
+# UTF-8 BOM，只在文件开头被跳过
+BYTE_ORDER_MARK = '\ufeff'
+
+# check_line 发现的问题及其报告名称
+TXT_ISSUES = {
+    'no_tab': "缺少制表符",
+    'empty_original': "原文为空",
+    'empty_translation': "译文为空",
+    'invalid_regex': "正则无效",
+    'regex_backspace': "正则中的退格符",
+    'unknown_escape': "未知转义",
+    'bom': "文件中间的BOM",
+    'invalid_utf8': "无效的UTF-8"
+}
+
+# 从块中删除这些字节以找出没有制表符的行，见 find_candidate_lines
+NOT_TAB_OR_LINE_BREAK = bytes(byte for byte in range(256) if byte not in b'\t\n')
+
+# 标记可能有问题的行的文本：转义、U+FEFF、U+180E、行首的制表符或 "$"，
+# 以及紧挨换行符的制表符
+CANDIDATE_MARKERS = ('\\', BYTE_ORDER_MARK, MONGOLIAN_VOWEL_SEPARATOR, '\n\t', '\n$', '\t\n', '\t\r')
+
+# dotnet_regex_to_python 改写的 .NET 正则分组：命名分组、平衡分组和内联选项
+DOTNET_GROUP = re.compile(r"\(\?(?:<(?![=!])([^>]*)>|'([^']*)'|([imnsx-]+)([:)]))")
+
+# .NET 支持但 Python re 报错的语法，这类正则不报告
+PYTHON_ONLY_REGEX_ERRORS = ('look-behind requires fixed-width pattern',)
+
+# 每次读取的字节数，文件以整行的块流式读取
+READ_BLOCK_SIZE = 8 * 1024 * 1024
+
+# 大于此大小的文件会被拆分为多个范围，由不同的工作进程检查
+CHUNK_SIZE = 64 * 1024 * 1024
+
+# 默认每个文件列出的问题数，所有问题都会计数
+MAX_ISSUES_PER_FILE = 100
+
+def unescape(text, unknown_escapes=None):
+    """
+    与插件中的 StringExtensions.Unescape 相同的方式替换转义序列
+
+    未知序列连同反斜杠保持原样，文本末尾的反斜杠也保留。
+
+    Args:
+        text (str): 含转义序列的文本
+        unknown_escapes (list): 可选，接收未知序列，例如 "\\x"
+
+    Returns:
+        str: 反转义后的文本
+    """
+
+    index = text.find('\\')
+    if index < 0:
+        return text
+
+    parts = []
+    start = 0
+    while 0 <= index < len(text) - 1:
+        parts.append(text[start:index])
+        char = text[index + 1]
+        escaped = ESCAPES.get(char)
+        if escaped is None:
+            parts.append('\\' + char)
+            if unknown_escapes is not None:
+                unknown_escapes.append('\\' + char)
+        else:
+            parts.append(escaped)
+        start = index + 2
+        index = text.find('\\', start)
+    parts.append(text[start:])
+    return ''.join(parts)
+
+def dotnet_regex_to_python(pattern):
+    """
+    将 .NET 特有的正则语法改写为 Python re 语法，以便编译检查
+
+    只保留语法：\\p{L} 等 Unicode 类别变为 \\w，平衡分组变为非捕获分组，内联选项被删除。
+
+    Args:
+        pattern (str): .NET 正则
+
+    Returns:
+        str: Python 正则
+    """
+
+    result = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\' and index + 1 < len(pattern):
+            escape = pattern[index + 1]
+            close = -1
+            if escape in 'pP' and pattern.startswith('{', index + 2):
+                close = pattern.find('}', index + 3)
+                replacement = '\\w' if escape == 'p' else '\\W'
+            elif escape == 'c' and index + 2 < len(pattern):
+                close = index + 2
+                replacement = '\\x00'
+            elif escape == 'k' and pattern[index + 2:index + 3] in ('<', "'"):
+                close = pattern.find('>' if pattern[index + 2] == '<' else "'", index + 3)
+                name = pattern[index + 3:close]
+                replacement = f'\\{name}' if name.isdigit() else f'(?P={name})'
+            if close > 0:
+                result.append(replacement)
+                index = close + 1
+                continue
+            result.append({'z': '\\Z', 'G': '', 'e': '\\x1b'}.get(escape, pattern[index:index + 2]))
+            index += 2
+            continue
+
+        match = DOTNET_GROUP.match(pattern, index) if char == '(' else None
+        if match is None:
+            result.append(char)
+            index += 1
+            continue
+        name = match.group(1) if match.group(1) is not None else match.group(2)
+        if name is not None:
+            result.append(f'(?P<{name}>' if name.isidentifier() else '(?:')
+        elif match.group(4) == ':':
+            result.append('(?:')
+        index = match.end()
+    return ''.join(result)
+
+def check_regex(pattern):
+    """
+    检查正则翻译的模式
+
+    Args:
+        pattern (str): 反转义后的 .NET 正则
+
+    Returns:
+        str: 错误信息，模式有效时为 None
+    """
+
+    if not pattern:
+        return "空模式匹配所有文本"
+    try:
+        re.compile(dotnet_regex_to_python(pattern))
+    except re.error as e:
+        if any(message in str(e) for message in PYTHON_ONLY_REGEX_ERRORS):
+            return None
+        return str(e)
+    return None
+
+def shorten(text, length=40):
+    """
+    缩短报告行中的文本
+
+    Args:
+        text (str): 文本
+        length (int): 最大长度
+
+    Returns:
+        str: 文本，超过 length 时截断并加上 "..."
+    """
+
+    return text if len(text) <= length else text[:length] + "..."
+
+def check_line(line):
+    """
+    与 TxtTranslationFileProcessor.ProcessTranslationLine 相同的方式解析一行并列出其问题
+
+    插件跳过空行和 ";" 注释，按第一个制表符拆分，两侧都反转义，从译文中移除 U+180E，
+    任意一侧为空时丢弃该行。以 "$" 开头的行是正则翻译，原文其余部分作为 .NET 正则编译。
+
+    Args:
+        line (str): 不含换行符的行
+
+    Returns:
+        list: (issue, detail) 元组，issue 为 TXT_ISSUES 的键
+    """
+
+    if not line or line[0] == ';':
+        return []
+
+    problems = []
+    if BYTE_ORDER_MARK in line:
+        problems.append(('bom', f"第 {line.index(BYTE_ORDER_MARK) + 1} 列"))
+
+    original, tab, translation = line.partition('\t')
+    if not tab:
+        # 只有空白的行也会被丢弃，但不值得报告
+        if line.strip():
+            problems.append(('no_tab', shorten(line)))
+        return problems
+
+    is_regex = line[0] == '$'
+    unknown_original = []
+    unknown_translation = []
+    original = unescape(original, unknown_original)
+    translation = unescape(translation, unknown_translation).replace(MONGOLIAN_VOWEL_SEPARATOR, '')
+    if is_regex:
+        # 模式中的未知转义是 \d 等正则转义，模板中的 "\$" 表示美元符号
+        unknown_original = []
+        unknown_translation = [sequence for sequence in unknown_translation if sequence != '\\$']
+    problems.extend(('unknown_escape', f"原文中的 {sequence}") for sequence in unknown_original)
+    problems.extend(('unknown_escape', f"译文中的 {sequence}") for sequence in unknown_translation)
+
+    if not original:
+        problems.append(('empty_original', shorten(translation)))
+    if not translation:
+        problems.append(('empty_translation', shorten(original)))
+    if not original or not translation or not is_regex:
+        return problems
+
+    pattern = original[1:]
+    if '\b' in pattern:
+        problems.append(('regex_backspace', "\\b 在编译前被反转义为退格符，请使用 \\\\b"))
+    error = check_regex(pattern)
+    if error is not None:
+        problems.append(('invalid_regex', f"{error}: {shorten(pattern)}"))
+    return problems
+
+def find_candidate_lines(block, text):
+    """
+    只用 C 速度的搜索找出块中可能有问题的行
+
+    其他行都是普通的 "原文<制表符>译文" 条目，因此正常的行不会进入 lint_block 的 Python 循环。
+
+    Args:
+        block (bytes): UTF-8 行
+        text (str): 解码后的块
+
+    Returns:
+        set: 块中的行索引
+    """
+
+    candidates = set()
+
+    # 没有制表符的行：删除制表符和换行符以外的所有字节后，其换行符紧跟在上一个换行符之后。
+    # 空行和注释也会被找到。
+    skeleton = block.translate(None, NOT_TAB_OR_LINE_BREAK)
+    if skeleton[:1] == b'\n':
+        candidates.add(0)
+    line_index = 0
+    position = 0
+    index = skeleton.find(b'\n\n')
+    while index >= 0:
+        line_index += skeleton.count(b'\n', position, index + 1)
+        position = index + 1
+        candidates.add(line_index)
+        index = skeleton.find(b'\n\n', index + 1)
+    if not block.endswith(b'\n') and not skeleton[skeleton.rfind(b'\n') + 1:]:
+        candidates.add(skeleton.count(b'\n'))
+
+    # 包含标记、以制表符或 "$" 开头、或在第一个制表符后立即结束的行
+    positions = []
+    for marker in CANDIDATE_MARKERS:
+        index = text.find(marker)
+        while index >= 0:
+            positions.append(index + 1 if marker[0] == '\n' else index)
+            index = text.find(marker, index + 1)
+    if text[:1] in ('\t', '$'):
+        positions.append(0)
+    if text.endswith(('\t', '\t\r')):
+        positions.append(len(text) - 1)
+
+    # StreamReader.ReadLine 也会在单独的回车符处结束一行，这可能把一行藏在注释后面
+    if text.count('\r') != text.count('\r\n'):
+        index = text.find('\r')
+        while index >= 0:
+            if text[index + 1:index + 2] != '\n':
+                positions.append(index)
+            index = text.find('\r', index + 1)
+
+    line_index = 0
+    position = 0
+    for index in sorted(positions):
+        line_index += text.count('\n', position, index)
+        position = index
+        candidates.add(line_index)
+    return candidates
+
+def lint_block(block, line_count, counts, issues, max_issues):
+    """
+    检查由整行组成的块
+
+    Args:
+        block (bytes): UTF-8 行，除文件末尾外每行都以换行符结束
+        line_count (int): 块之前的行数
+        counts (dict): 每种问题的数量，会被原地修改
+        issues (list): (行号, 问题, 详情) 元组，会被原地修改
+        max_issues (int): 列出这么多问题后停止列出，0 表示全部列出
+
+    Returns:
+        int: 块之前的行数加上块中的换行符数
+    """
+
+    found = []
+    try:
+        text = block.decode('utf-8')
+    except UnicodeDecodeError:
+        # 逐行解码以找出损坏的行，插件加载这些行时会使用替换字符
+        lines = []
+        for index, line in enumerate(block.split(b'\n')):
+            try:
+                lines.append(line.decode('utf-8'))
+            except UnicodeDecodeError as e:
+                found.append((line_count + index + 1, 'invalid_utf8', f"第 {e.start + 1} 字节"))
+                lines.append(line.decode('utf-8', 'replace'))
+        text = '\n'.join(lines)
+
+    candidates = find_candidate_lines(block, text)
+    if candidates:
+        lines = block.split(b'\n')
+        for line_index in candidates:
+            line = lines[line_index].decode('utf-8', 'replace')
+            if line.endswith('\r'):
+                line = line[:-1]
+            for part in line.split('\r'):
+                found.extend((line_count + line_index + 1, issue, detail) for issue, detail in check_line(part))
+
+    found.sort(key=lambda issue: issue[0])
+    for issue in found:
+        counts[issue[1]] += 1
+        if not max_issues or len(issues) < max_issues:
+            issues.append(issue)
+    return line_count + block.count(b'\n')
+
+def lint_stream(stream, max_issues=MAX_ISSUES_PER_FILE, start=0, end=None):
+    """
+    按块读取并检查二进制流中的行
+
+    文件的一个范围包含从其内部开始的行：跨越范围起点的行属于上一个范围，跨越范围终点的行会读到行尾。
+
+    Args:
+        stream (file): 二进制流，start 不为 0 时需要可定位
+        max_issues (int): 列出这么多问题后停止列出，0 表示全部列出
+        start (int): 范围的起始偏移（默认为 0）
+        end (int): 范围的结束偏移，None 表示读到流末尾
+
+    Returns:
+        tuple: (行数, 每种问题的数量, (行号, 问题, 详情) 元组)，行号从范围起点开始计数
+    """
+
+    counts = dict.fromkeys(TXT_ISSUES, 0)
+    issues = []
+    line_count = 0
+    position = start
+    if start > 0:
+        stream.seek(start - 1)
+        position += len(stream.readline()) - 1
+
+    pending = b''
+    first_block = start == 0
+    while True:
+        if end is None:
+            data = stream.read(READ_BLOCK_SIZE)
+            last_block = not data
+        else:
+            data = stream.read(min(READ_BLOCK_SIZE, end - position)) if position < end else b''
+            position += len(data)
+            last_block = position >= end or not data
+
+        block = pending + data
+        pending = b''
+        if last_block and end is not None and block and not block.endswith(b'\n'):
+            # 读完跨越范围终点的行
+            block += stream.readline()
+        if not last_block:
+            cut = block.rfind(b'\n') + 1
+            block, pending = block[:cut], block[cut:]
+        if first_block and block:
+            # 插件以 UTF-8 读取文件，只跳过文件开头的 BOM
+            if block.startswith(b'\xef\xbb\xbf'):
+                block = block[3:]
+            first_block = False
+
+        if block:
+            line_count = lint_block(block, line_count, counts, issues, max_issues)
+            if last_block and not block.endswith(b'\n'):
+                line_count += 1
+        if last_block:
+            return line_count, counts, issues
+
+def is_member_path_unsafe(member_name):
+    """
+    与插件中的 FileTool.IsZipPathUnsafe 相同的方式检查压缩包成员名
+
+    拒绝空名称、上级目录引用以及绝对路径或带根路径。
+
+    Args:
+        member_name (str): 压缩包中的成员名
+
+    Returns:
+        bool: 成员不可使用时为 True
+    """
+
+    if not member_name:
+        return True
+
+    # 统一路径分隔符
+    normalized_path = member_name.replace('\\', '/')
+
+    # 拒绝 "../"
+    if '../' in normalized_path:
+        return True
+
+    # 拒绝绝对路径，包括 Windows 盘符路径
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def lint_task(file_path, start=0, end=None, max_issues=MAX_ISSUES_PER_FILE):
+    """
+    工作进程入口，检查 .txt 文件的一个范围或 zip 压缩包中的所有 .txt 成员
+
+    Args:
+        file_path (str): .txt 或 .zip 文件路径
+        start (int): .txt 文件中范围的起始偏移
+        end (int): .txt 文件中范围的结束偏移，None 表示读到末尾
+        max_issues (int): 每个文件列出这么多问题后停止列出，0 表示全部列出
+
+    Returns:
+        list: 每个被检查的文件的 (成员名或 None, lint_stream 的结果)
+    """
+
+    if not str(file_path).lower().endswith('.zip'):
+        with open(file_path, 'rb') as stream:
+            return [(None, lint_stream(stream, max_issues, start, end))]
+
+    results = []
+    with zipfile.ZipFile(file_path) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not info.filename.lower().endswith('.txt'):
+                continue
+            if is_member_path_unsafe(info.filename):
+                # 插件会跳过不安全的成员，它们永远不会被加载
+                continue
+            with archive.open(info) as stream:
+                results.append((info.filename, lint_stream(stream, max_issues)))
+    return results
+
+def lint_files_serial(tasks, max_issues=MAX_ISSUES_PER_FILE):
+    """
+    在当前进程中检查文件
+
+    Args:
+        tasks (list): (file_path, start, end) 元组
+        max_issues (int): 每个文件列出这么多问题后停止列出，0 表示全部列出
+
+    Yields:
+        list: lint_task 的结果或读取文件时引发的异常，顺序与 tasks 相同
+    """
+
+    for file_path, start, end in tasks:
+        try:
+            yield lint_task(file_path, start, end, max_issues)
+        except (OSError, zipfile.BadZipFile) as e:
+            yield e
+
+def lint_files_parallel(tasks, jobs, max_issues=MAX_ISSUES_PER_FILE):
+    """
+    在进程池中检查文件
+
+    Args:
+        tasks (list): (file_path, start, end) 元组
+        jobs (int): 工作进程数
+        max_issues (int): 每个文件列出这么多问题后停止列出，0 表示全部列出
+
+    Yields:
+        list: lint_task 的结果或读取文件时引发的异常，顺序与 tasks 相同
+    """
+
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        futures = [executor.submit(lint_task, file_path, start, end, max_issues) for file_path, start, end in tasks]
+        for future in futures:
+            try:
+                yield future.result()
+            except Exception as e:
+                # 包括工作进程本身的失败
+                yield e
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+def ordinal_key(text):
+    """
+    与 .NET StringComparer.Ordinal 一致的排序键，按 UTF-16 码元比较
+
+    Args:
+        text (str): 要排序的文本
+
+    Returns:
+        bytes: 文本的 UTF-16 大端编码
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def loader_order_key(relative_path):
+    """
+    插件加载翻译文件顺序的排序键
+
+    插件先加载翻译文件夹根目录中的文件，再加载各子文件夹中的文件，
+    文件夹和文件都按序数路径排序 (FileTool.GetAllTranslationFiles)。
+
+    Args:
+        relative_path (Path): 相对于翻译文件夹的文件路径
+
+    Returns:
+        tuple: 排序键
+    """
+
+    folder = relative_path.parent.parts
+    return len(folder) > 0, ordinal_key('\\'.join(folder)), ordinal_key(relative_path.name)
+
+def find_translation_files(input_path):
+    """
+    按插件的加载顺序查找文件夹中的 .txt 和 .zip 翻译文件
+
+    Args:
+        input_path (Path): 翻译文件夹，或单个 .txt 或 .zip 文件
+
+    Returns:
+        list: (文件路径, 报告中显示的名称) 元组
+    """
+
+    if input_path.is_file():
+        return [(input_path, input_path.name)]
+    files = [file for file in input_path.rglob('*')
+             if file.is_file() and file.name.lower().endswith(TRANSLATION_FILE_SUFFIXES)]
+    files.sort(key=lambda file: loader_order_key(file.relative_to(input_path)))
+    return [(file, file.relative_to(input_path).as_posix()) for file in files]
+
+def plan_tasks(files, chunk_size=CHUNK_SIZE):
+    """
+    将文件拆分为工作任务，较大的 .txt 文件被拆分为约 chunk_size 字节的范围
+
+    Args:
+        files (list): (文件路径, 报告中显示的名称) 元组
+        chunk_size (int): 范围大小（字节）
+
+    Returns:
+        list: (file_path, start, end, 报告中显示的名称) 元组
+    """
+
+    tasks = []
+    for file_path, name in files:
+        size = file_path.stat().st_size
+        if file_path.name.lower().endswith('.zip') or size <= chunk_size:
+            tasks.append((file_path, 0, None, name))
+            continue
+        for start in range(0, size, chunk_size):
+            tasks.append((file_path, start, min(start + chunk_size, size), name))
+    return tasks
+
+def pop_option(args, name, default=None):
+    """
+    从参数列表中移除带值的选项
+
+    支持 "--name value" 和 "--name=value" 两种写法
+
+    Args:
+        args (list): 参数列表，会被原地修改
+        name (str): 选项名
+        default (str): 选项不存在时返回的值
+
+    Returns:
+        str: 选项值，选项没有值时为 None
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """打印命令行用法"""
+
+    print("TXT 翻译文件检查工具")
+    print("检查 .txt 翻译文件中会被插件丢弃或以非预期方式加载的行")
+    print()
+    print("用法:")
+    print("  python script.py <翻译文件夹|file.txt|file.zip> [--jobs N] [--max-issues N]")
+    print()
+    print("示例:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/Text")
+    print("  python script.py my_translation.txt")
+    print("  python script.py ./Text --jobs 4 --max-issues 0")
+    print()
+    print("参数说明:")
+    print("  翻译文件夹: 递归检查的文件夹，文件按插件的加载顺序列出")
+    print("  --jobs N: (可选) 使用 N 个工作进程检查文件，0 表示使用所有CPU核心（默认为 0）")
+    print("  --max-issues N: (可选) 每个文件列出的问题数，0 表示全部列出（默认为 100）")
+    print()
+    print("报告的问题:")
+    print("  缺少制表符: 原文和译文之间没有制表符，插件会丢弃该行")
+    print("  原文为空 / 译文为空: 反转义后有一侧为空，插件会丢弃该行")
+    print("  正则无效: $ 行的模式无法编译，插件会丢弃该行")
+    print("  正则中的退格符: $ 行中的 \\b 被反转义为退格符，而不是单词边界")
+    print("  未知转义: Unescape 保持原样的反斜杠序列，例如 \\x")
+    print("  文件中间的BOM: 文件开头之后的 U+FEFF 会成为文本的一部分")
+    print("  无效的UTF-8: 该行会以替换字符加载")
+    print()
+    print("退出码: 没有发现问题时为 0，发现问题时为 1，用法错误时为 2")
+    print()
+
+def main():
+    """处理命令行参数的主函数"""
+
+    args = sys.argv.copy()
+    if len(args) < 2 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if len(args) >= 2 else 2
+
+    jobs = pop_option(args, "--jobs", "0")
+    if jobs is None or not jobs.isdigit():
+        print("错误：--jobs 需要一个非负整数")
+        return 2
+
+    max_issues = pop_option(args, "--max-issues", str(MAX_ISSUES_PER_FILE))
+    if max_issues is None or not max_issues.isdigit():
+        print("错误：--max-issues 需要一个非负整数")
+        return 2
+    max_issues = int(max_issues)
+
+    input_path = Path(args[1])
+    if not input_path.exists():
+        print(f"错误：路径 {args[1]} 不存在")
+        return 2
+
+    start_time = time.perf_counter()
+    files = find_translation_files(input_path)
+    if not files:
+        print(f"在 {args[1]} 中未找到 .txt 或 .zip 翻译文件")
+        return 0
+    tasks = plan_tasks(files)
+
+    jobs = int(jobs) or os.cpu_count() or 1
+    jobs = min(jobs, len(tasks))
+    print(f"正在检查 {len(files)} 个翻译文件" + (f"，使用 {jobs} 个工作进程..." if jobs > 1 else "..."))
+    print("-" * 50)
+
+    if jobs > 1:
+        results = lint_files_parallel([task[:3] for task in tasks], jobs, max_issues)
+    else:
+        results = lint_files_serial([task[:3] for task in tasks], max_issues)
+
+    total_counts = dict.fromkeys(TXT_ISSUES, 0)
+    total_lines = 0
+    checked_files = 0
+    failed_files = 0
+
+    # 同一文件的范围按顺序返回，行号从上一个范围继续
+    file_state = None
+    def flush_file():
+        name, line_count, counts, issues = file_state
+        listed = 0
+        for line_number, issue, detail in issues:
+            if max_issues and listed >= max_issues:
+                break
+            print(f"{name}:{line_number}: {TXT_ISSUES[issue]}: {detail}")
+            listed += 1
+        issue_count = sum(counts.values())
+        if issue_count > listed:
+            print(f"{name}: ……另有 {issue_count - listed} 个问题")
+
+    for (file_path, start, _, name), result in zip(tasks, results):
+        if isinstance(result, Exception):
+            print(f"{name}: ✗ 读取文件时发生错误: {result}")
+            failed_files += 1
+            continue
+
+        for member, (line_count, counts, issues) in result:
+            member_name = name if member is None else f"{name}/{member}"
+            if file_state is not None and (member is not None or start == 0):
+                flush_file()
+                file_state = None
+            if file_state is None:
+                file_state = [member_name, 0, dict.fromkeys(TXT_ISSUES, 0), []]
+                checked_files += 1
+            offset = file_state[1]
+            file_state[1] += line_count
+            file_state[3].extend((offset + line_number, issue, detail) for line_number, issue, detail in issues)
+            for issue, count in counts.items():
+                file_state[2][issue] += count
+                total_counts[issue] += count
+            total_lines += line_count
+    if file_state is not None:
+        flush_file()
+
+    elapsed = time.perf_counter() - start_time
+    total_bytes = sum(file_path.stat().st_size for file_path, _ in files)
+    print("-" * 50)
+    print(f"已检查 {checked_files} 个文件，{total_lines:,} 行，{total_bytes / (1024 * 1024):.1f} MB，耗时 {elapsed:.2f} 秒")
+    if failed_files:
+        print(f"✗ 无法读取的文件: {failed_files}")
+    problems = [f"{count} {TXT_ISSUES[issue]}" for issue, count in total_counts.items() if count]
+    if problems:
+        print(f"⚠ 问题: {', '.join(problems)}")
+        return 1
+    if failed_files:
+        return 1
+    print("✓ 未发现问题")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
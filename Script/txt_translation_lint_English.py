@@ -0,0 +1,746 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Function: Check .txt translation files for lines the plugin drops or loads differently than intended
+# Author: 90135
+# Creation date: 2026-10-17
+# Version: 2026-10-17_01
+# License: BSD-3
+
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Suffixes of the files read by the plugin's text translation loader, zip members are .txt files
+TRANSLATION_FILE_SUFFIXES = ('.txt', '.zip')
+
+# Escape sequences of StringExtensions.Unescape, any other sequence is kept as is
+ESCAPES = {
+    '0': '\0',
+    'a': '\a',
+    'b': '\b',
+    't': '\t',
+    'n': '\n',
+    'v': '\v',
+    'f': '\f',
+    'r': '\r',
+    "'": "'",
+    '"': '"',
+    '\\': '\\'
+}
+
+# Removed from the translation by TxtTranslationFileProcessor, see XUAT RedirectedResourceDetectionStrategy
+MONGOLIAN_VOWEL_SEPARATOR = '\u180e'
+
+# UTF-8 byte order mark, only skipped at the start of a file
+BYTE_ORDER_MARK = '\ufeff'
+
+# Problems found by check_line, with their report labels
+TXT_ISSUES = {
+    'no_tab': "no tab",
+    'empty_original': "empty original",
+    'empty_translation': "empty translation",
+    'invalid_regex': "invalid regex",
+    'regex_backspace': "backspace in regex",
+    'unknown_escape': "unknown escape",
+    'bom': "byte order mark inside file",
+    'invalid_utf8': "invalid UTF-8"
+}
+
+# Bytes deleted from a block to find the lines without a tab, see find_candidate_lines
+NOT_TAB_OR_LINE_BREAK = bytes(byte for byte in range(256) if byte not in b'\t\n')
+
+# Text marking a line that may have a problem: escapes, U+FEFF, U+180E, a tab or "$" at the
+# start of a line and a tab right before the line break
+CANDIDATE_MARKERS = ('\\', BYTE_ORDER_MARK, MONGOLIAN_VOWEL_SEPARATOR, '\n\t', '\n$', '\t\n', '\t\r')
+
+# .NET regex groups rewritten by dotnet_regex_to_python: named and balancing groups, inline options
+DOTNET_GROUP = re.compile(r"\(\?(?:<(?![=!])([^>]*)>|'([^']*)'|([imnsx-]+)([:)]))")
+
+# Python re errors for syntax that .NET accepts, such patterns are not reported
+PYTHON_ONLY_REGEX_ERRORS = ('look-behind requires fixed-width pattern',)
+
+# Bytes read at a time, files are streamed in blocks of whole lines
+READ_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Files larger than this are split into ranges checked by different workers
+CHUNK_SIZE = 64 * 1024 * 1024
+
+# Number of issues listed per file by default, all issues are counted
+MAX_ISSUES_PER_FILE = 100
+
+def unescape(text, unknown_escapes=None):
+    """
+    Replace escape sequences the same way as StringExtensions.Unescape in the plugin
+
+    Unknown sequences are kept with their backslash, and so is a backslash at the end of the text.
+
+    Args:
+        text (str): Text with escape sequences
+        unknown_escapes (list): Optional, receives the unknown sequences such as "\\x"
+
+    Returns:
+        str: Unescaped text
+    """
+
+    index = text.find('\\')
+    if index < 0:
+        return text
+
+    parts = []
+    start = 0
+    while 0 <= index < len(text) - 1:
+        parts.append(text[start:index])
+        char = text[index + 1]
+        escaped = ESCAPES.get(char)
+        if escaped is None:
+            parts.append('\\' + char)
+            if unknown_escapes is not None:
+                unknown_escapes.append('\\' + char)
+        else:
+            parts.append(escaped)
+        start = index + 2
+        index = text.find('\\', start)
+    parts.append(text[start:])
+    return ''.join(parts)
+
+def dotnet_regex_to_python(pattern):
+    """
+    Rewrite .NET-only regex syntax to Python re syntax, so the pattern can be compiled to check it
+
+    Only the syntax is kept: Unicode categories such as \\p{L} become \\w, balancing groups become
+    non-capturing groups and inline options are dropped.
+
+    Args:
+        pattern (str): .NET regex
+
+    Returns:
+        str: Python regex
+    """
+
+    result = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\' and index + 1 < len(pattern):
+            escape = pattern[index + 1]
+            close = -1
+            if escape in 'pP' and pattern.startswith('{', index + 2):
+                close = pattern.find('}', index + 3)
+                replacement = '\\w' if escape == 'p' else '\\W'
+            elif escape == 'c' and index + 2 < len(pattern):
+                close = index + 2
+                replacement = '\\x00'
+            elif escape == 'k' and pattern[index + 2:index + 3] in ('<', "'"):
+                close = pattern.find('>' if pattern[index + 2] == '<' else "'", index + 3)
+                name = pattern[index + 3:close]
+                replacement = f'\\{name}' if name.isdigit() else f'(?P={name})'
+            if close > 0:
+                result.append(replacement)
+                index = close + 1
+                continue
+            result.append({'z': '\\Z', 'G': '', 'e': '\\x1b'}.get(escape, pattern[index:index + 2]))
+            index += 2
+            continue
+
+        match = DOTNET_GROUP.match(pattern, index) if char == '(' else None
+        if match is None:
+            result.append(char)
+            index += 1
+            continue
+        name = match.group(1) if match.group(1) is not None else match.group(2)
+        if name is not None:
+            result.append(f'(?P<{name}>' if name.isidentifier() else '(?:')
+        elif match.group(4) == ':':
+            result.append('(?:')
+        index = match.end()
+    return ''.join(result)
+
+def check_regex(pattern):
+    """
+    Check a regex translation pattern
+
+    Args:
+        pattern (str): .NET regex, after unescaping
+
+    Returns:
+        str: Error message, None if the pattern is valid
+    """
+
+    if not pattern:
+        return "empty pattern matches every text"
+    try:
+        re.compile(dotnet_regex_to_python(pattern))
+    except re.error as e:
+        if any(message in str(e) for message in PYTHON_ONLY_REGEX_ERRORS):
+            return None
+        return str(e)
+    return None
+
+def shorten(text, length=40):
+    """
+    Shorten text for a report line
+
+    Args:
+        text (str): Text
+        length (int): Maximum length
+
+    Returns:
+        str: Text, cut with "..." if longer than length
+    """
+
+    return text if len(text) <= length else text[:length] + "..."
+
+def check_line(line):
+    """
+    Parse one line the same way as TxtTranslationFileProcessor.ProcessTranslationLine and list its problems
+
+    The plugin skips empty lines and ";" comments, splits on the first tab, unescapes both sides,
+    removes U+180E from the translation and drops the line if a side is empty. Lines starting
+    with "$" are regex translations, the rest of the original is compiled as a .NET regex.
+
+    Args:
+        line (str): Line without line break
+
+    Returns:
+        list: (issue, detail) tuples, issue is a key of TXT_ISSUES
+    """
+
+    if not line or line[0] == ';':
+        return []
+
+    problems = []
+    if BYTE_ORDER_MARK in line:
+        problems.append(('bom', f"column {line.index(BYTE_ORDER_MARK) + 1}"))
+
+    original, tab, translation = line.partition('\t')
+    if not tab:
+        # Whitespace-only lines are dropped too, but they are not worth a report
+        if line.strip():
+            problems.append(('no_tab', shorten(line)))
+        return problems
+
+    is_regex = line[0] == '$'
+    unknown_original = []
+    unknown_translation = []
+    original = unescape(original, unknown_original)
+    translation = unescape(translation, unknown_translation).replace(MONGOLIAN_VOWEL_SEPARATOR, '')
+    if is_regex:
+        # Unknown escapes of the pattern are regex escapes such as \d, "\$" in the template is a dollar sign
+        unknown_original = []
+        unknown_translation = [sequence for sequence in unknown_translation if sequence != '\\$']
+    problems.extend(('unknown_escape', f"{sequence} in original") for sequence in unknown_original)
+    problems.extend(('unknown_escape', f"{sequence} in translation") for sequence in unknown_translation)
+
+    if not original:
+        problems.append(('empty_original', shorten(translation)))
+    if not translation:
+        problems.append(('empty_translation', shorten(original)))
+    if not original or not translation or not is_regex:
+        return problems
+
+    pattern = original[1:]
+    if '\b' in pattern:
+        problems.append(('regex_backspace', "\\b is unescaped to a backspace before compiling, use \\\\b"))
+    error = check_regex(pattern)
+    if error is not None:
+        problems.append(('invalid_regex', f"{error}: {shorten(pattern)}"))
+    return problems
+
+def find_candidate_lines(block, text):
+    """
+    Find the lines of a block that may have a problem, using only C-speed searches
+
+    Every other line is a plain "original<tab>translation" entry, so clean lines never reach
+    the Python loop of lint_block.
+
+    Args:
+        block (bytes): UTF-8 lines
+        text (str): The decoded block
+
+    Returns:
+        set: Line indexes in the block
+    """
+
+    candidates = set()
+
+    # Lines without a tab: once everything but tabs and line breaks is deleted, their line
+    # break follows the previous one. This also finds empty lines and comments.
+    skeleton = block.translate(None, NOT_TAB_OR_LINE_BREAK)
+    if skeleton[:1] == b'\n':
+        candidates.add(0)
+    line_index = 0
+    position = 0
+    index = skeleton.find(b'\n\n')
+    while index >= 0:
+        line_index += skeleton.count(b'\n', position, index + 1)
+        position = index + 1
+        candidates.add(line_index)
+        index = skeleton.find(b'\n\n', index + 1)
+    if not block.endswith(b'\n') and not skeleton[skeleton.rfind(b'\n') + 1:]:
+        candidates.add(skeleton.count(b'\n'))
+
+    # Lines containing a marker, starting with a tab or "$", or ending right after their first tab
+    positions = []
+    for marker in CANDIDATE_MARKERS:
+        index = text.find(marker)
+        while index >= 0:
+            positions.append(index + 1 if marker[0] == '\n' else index)
+            index = text.find(marker, index + 1)
+    if text[:1] in ('\t', '$'):
+        positions.append(0)
+    if text.endswith(('\t', '\t\r')):
+        positions.append(len(text) - 1)
+
+    # StreamReader.ReadLine also ends a line at a lone carriage return, which can hide a line after a comment
+    if text.count('\r') != text.count('\r\n'):
+        index = text.find('\r')
+        while index >= 0:
+            if text[index + 1:index + 2] != '\n':
+                positions.append(index)
+            index = text.find('\r', index + 1)
+
+    line_index = 0
+    position = 0
+    for index in sorted(positions):
+        line_index += text.count('\n', position, index)
+        position = index
+        candidates.add(line_index)
+    return candidates
+
+def lint_block(block, line_count, counts, issues, max_issues):
+    """
+    Check a block of whole lines
+
+    Args:
+        block (bytes): UTF-8 lines, each ending with a line break except at the end of the file
+        line_count (int): Number of lines before the block
+        counts (dict): Number of issues per kind, modified in place
+        issues (list): (line number, issue, detail) tuples, modified in place
+        max_issues (int): Stop listing issues after this many, 0 lists all
+
+    Returns:
+        int: Number of lines before the block plus the line breaks in the block
+    """
+
+    found = []
+    try:
+        text = block.decode('utf-8')
+    except UnicodeDecodeError:
+        # Decode line by line to find the broken lines, the plugin loads them with replacement characters
+        lines = []
+        for index, line in enumerate(block.split(b'\n')):
+            try:
+                lines.append(line.decode('utf-8'))
+            except UnicodeDecodeError as e:
+                found.append((line_count + index + 1, 'invalid_utf8', f"byte {e.start + 1}"))
+                lines.append(line.decode('utf-8', 'replace'))
+        text = '\n'.join(lines)
+
+    candidates = find_candidate_lines(block, text)
+    if candidates:
+        lines = block.split(b'\n')
+        for line_index in candidates:
+            line = lines[line_index].decode('utf-8', 'replace')
+            if line.endswith('\r'):
+                line = line[:-1]
+            for part in line.split('\r'):
+                found.extend((line_count + line_index + 1, issue, detail) for issue, detail in check_line(part))
+
+    found.sort(key=lambda issue: issue[0])
+    for issue in found:
+        counts[issue[1]] += 1
+        if not max_issues or len(issues) < max_issues:
+            issues.append(issue)
+    return line_count + block.count(b'\n')
+
+def lint_stream(stream, max_issues=MAX_ISSUES_PER_FILE, start=0, end=None):
+    """
+    Check the lines of a binary stream, reading it in blocks
+
+    A range of a file covers the lines starting inside it: the line crossing its start belongs to
+    the previous range and the line crossing its end is read to its end.
+
+    Args:
+        stream (file): Binary stream, seekable if start is not 0
+        max_issues (int): Stop listing issues after this many, 0 lists all
+        start (int): Start offset of the range (defaults to 0)
+        end (int): End offset of the range, None reads to the end of the stream
+
+    Returns:
+        tuple: (number of lines, number of issues per kind, (line number, issue, detail) tuples),
+            line numbers count from the start of the range
+    """
+
+    counts = dict.fromkeys(TXT_ISSUES, 0)
+    issues = []
+    line_count = 0
+    position = start
+    if start > 0:
+        stream.seek(start - 1)
+        position += len(stream.readline()) - 1
+
+    pending = b''
+    first_block = start == 0
+    while True:
+        if end is None:
+            data = stream.read(READ_BLOCK_SIZE)
+            last_block = not data
+        else:
+            data = stream.read(min(READ_BLOCK_SIZE, end - position)) if position < end else b''
+            position += len(data)
+            last_block = position >= end or not data
+
+        block = pending + data
+        pending = b''
+        if last_block and end is not None and block and not block.endswith(b'\n'):
+            # Finish the line crossing the end of the range
+            block += stream.readline()
+        if not last_block:
+            cut = block.rfind(b'\n') + 1
+            block, pending = block[:cut], block[cut:]
+        if first_block and block:
+            # The plugin reads files as UTF-8 and skips a byte order mark at the start only
+            if block.startswith(b'\xef\xbb\xbf'):
+                block = block[3:]
+            first_block = False
+
+        if block:
+            line_count = lint_block(block, line_count, counts, issues, max_issues)
+            if last_block and not block.endswith(b'\n'):
+                line_count += 1
+        if last_block:
+            return line_count, counts, issues
+
+def is_member_path_unsafe(member_name):
+    """
+    Check an archive member name the same way as FileTool.IsZipPathUnsafe in the plugin
+
+    Rejects empty names, parent folder references and absolute or rooted paths.
+
+    Args:
+        member_name (str): Member name in the archive
+
+    Returns:
+        bool: True if the member must not be used
+    """
+
+    if not member_name:
+        return True
+
+    # Unify path separators
+    normalized_path = member_name.replace('\\', '/')
+
+    # Reject "../"
+    if '../' in normalized_path:
+        return True
+
+    # Reject absolute paths, including Windows drive paths
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def lint_task(file_path, start=0, end=None, max_issues=MAX_ISSUES_PER_FILE):
+    """
+    Worker process entry, check a range of a .txt file or all .txt members of a zip archive
+
+    Args:
+        file_path (str): .txt or .zip file path
+        start (int): Start offset of the range in a .txt file
+        end (int): End offset of the range in a .txt file, None reads to the end
+        max_issues (int): Stop listing issues of a file after this many, 0 lists all
+
+    Returns:
+        list: (member name or None, result of lint_stream) per checked file
+    """
+
+    if not str(file_path).lower().endswith('.zip'):
+        with open(file_path, 'rb') as stream:
+            return [(None, lint_stream(stream, max_issues, start, end))]
+
+    results = []
+    with zipfile.ZipFile(file_path) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not info.filename.lower().endswith('.txt'):
+                continue
+            if is_member_path_unsafe(info.filename):
+                # The plugin skips unsafe members, so they are never loaded
+                continue
+            with archive.open(info) as stream:
+                results.append((info.filename, lint_stream(stream, max_issues)))
+    return results
+
+def lint_files_serial(tasks, max_issues=MAX_ISSUES_PER_FILE):
+    """
+    Check files in this process
+
+    Args:
+        tasks (list): (file_path, start, end) tuples
+        max_issues (int): Stop listing issues of a file after this many, 0 lists all
+
+    Yields:
+        list: Result of lint_task, or the exception raised reading the file, in the same order as tasks
+    """
+
+    for file_path, start, end in tasks:
+        try:
+            yield lint_task(file_path, start, end, max_issues)
+        except (OSError, zipfile.BadZipFile) as e:
+            yield e
+
+def lint_files_parallel(tasks, jobs, max_issues=MAX_ISSUES_PER_FILE):
+    """
+    Check files in a process pool
+
+    Args:
+        tasks (list): (file_path, start, end) tuples
+        jobs (int): Number of worker processes
+        max_issues (int): Stop listing issues of a file after this many, 0 lists all
+
+    Yields:
+        list: Result of lint_task, or the exception raised reading the file, in the same order as tasks
+    """
+
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        futures = [executor.submit(lint_task, file_path, start, end, max_issues) for file_path, start, end in tasks]
+        for future in futures:
+            try:
+                yield future.result()
+            except Exception as e:
+                # Includes failures of the worker process itself
+                yield e
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+def ordinal_key(text):
+    """
+    Sort key matching .NET StringComparer.Ordinal, which compares UTF-16 code units
+
+    Args:
+        text (str): Text to sort
+
+    Returns:
+        bytes: UTF-16 big-endian encoding of the text
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def loader_order_key(relative_path):
+    """
+    Sort key for the order in which the plugin loads translation files
+
+    The plugin loads the files in the root of the translation folder first, then the files of
+    every subfolder, with folders and files each sorted by ordinal path (FileTool.GetAllTranslationFiles).
+
+    Args:
+        relative_path (Path): File path relative to the translation folder
+
+    Returns:
+        tuple: Sort key
+    """
+
+    folder = relative_path.parent.parts
+    return len(folder) > 0, ordinal_key('\\'.join(folder)), ordinal_key(relative_path.name)
+
+def find_translation_files(input_path):
+    """
+    Find the .txt and .zip translation files of a folder in the order the plugin loads them
+
+    Args:
+        input_path (Path): Translation folder, or a single .txt or .zip file
+
+    Returns:
+        list: (file path, name shown in reports) tuples
+    """
+
+    if input_path.is_file():
+        return [(input_path, input_path.name)]
+    files = [file for file in input_path.rglob('*')
+             if file.is_file() and file.name.lower().endswith(TRANSLATION_FILE_SUFFIXES)]
+    files.sort(key=lambda file: loader_order_key(file.relative_to(input_path)))
+    return [(file, file.relative_to(input_path).as_posix()) for file in files]
+
+def plan_tasks(files, chunk_size=CHUNK_SIZE):
+    """
+    Split files into worker tasks, large .txt files are split into ranges of about chunk_size bytes
+
+    Args:
+        files (list): (file path, name shown in reports) tuples
+        chunk_size (int): Range size in bytes
+
+    Returns:
+        list: (file_path, start, end, name shown in reports) tuples
+    """
+
+    tasks = []
+    for file_path, name in files:
+        size = file_path.stat().st_size
+        if file_path.name.lower().endswith('.zip') or size <= chunk_size:
+            tasks.append((file_path, 0, None, name))
+            continue
+        for start in range(0, size, chunk_size):
+            tasks.append((file_path, start, min(start + chunk_size, size), name))
+    return tasks
+
+def pop_option(args, name, default=None):
+    """
+    Remove an option with a value from the argument list
+
+    Supports both "--name value" and "--name=value"
+
+    Args:
+        args (list): Argument list, modified in place
+        name (str): Option name
+        default (str): Value returned when the option is not present
+
+    Returns:
+        str: Option value, None if the option has no value
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """Print command line usage"""
+
+    print("TXT Translation File Linter")
+    print("Check .txt translation files for lines the plugin drops or loads differently than intended")
+    print()
+    print("Usage:")
+    print("  python script.py <translation_folder|file.txt|file.zip> [--jobs N] [--max-issues N]")
+    print()
+    print("Examples:")
+    print("  python script.py ./BepInEx/JustAnotherTranslator/Chinese/Text")
+    print("  python script.py my_translation.txt")
+    print("  python script.py ./Text --jobs 4 --max-issues 0")
+    print()
+    print("Parameters:")
+    print("  translation_folder: Folder checked recursively, files are listed in the order the plugin loads them")
+    print("  --jobs N: (optional) Check files in N worker processes, 0 uses all CPU cores (defaults to 0)")
+    print("  --max-issues N: (optional) Number of issues listed per file, 0 lists all (defaults to 100)")
+    print()
+    print("Reported issues:")
+    print("  no tab: the line has no tab between original and translation, the plugin drops it")
+    print("  empty original / empty translation: a side is empty after unescaping, the plugin drops the line")
+    print("  invalid regex: the pattern of a $ line does not compile, the plugin drops the line")
+    print("  backspace in regex: \\b of a $ line is unescaped to a backspace, not a word boundary")
+    print("  unknown escape: a backslash sequence that Unescape keeps as is, such as \\x")
+    print("  byte order mark inside file: U+FEFF after the start of the file becomes part of the text")
+    print("  invalid UTF-8: the line is loaded with replacement characters")
+    print()
+    print("Exit code: 0 if no issues were found, 1 if issues were found, 2 on usage errors")
+    print()
+
+def main():
+    """Main function to handle command line arguments"""
+
+    args = sys.argv.copy()
+    if len(args) < 2 or "--help" in args or "-h" in args:
+        print_usage()
+        return 0 if len(args) >= 2 else 2
+
+    jobs = pop_option(args, "--jobs", "0")
+    if jobs is None or not jobs.isdigit():
+        print("Error: --jobs requires a non-negative integer")
+        return 2
+
+    max_issues = pop_option(args, "--max-issues", str(MAX_ISSUES_PER_FILE))
+    if max_issues is None or not max_issues.isdigit():
+        print("Error: --max-issues requires a non-negative integer")
+        return 2
+    max_issues = int(max_issues)
+
+    input_path = Path(args[1])
+    if not input_path.exists():
+        print(f"Error: Path {args[1]} does not exist")
+        return 2
+
+    start_time = time.perf_counter()
+    files = find_translation_files(input_path)
+    if not files:
+        print(f"No .txt or .zip translation files found in {args[1]}")
+        return 0
+    tasks = plan_tasks(files)
+
+    jobs = int(jobs) or os.cpu_count() or 1
+    jobs = min(jobs, len(tasks))
+    print(f"Checking {len(files)} translation files" + (f" in {jobs} worker processes..." if jobs > 1 else "..."))
+    print("-" * 50)
+
+    if jobs > 1:
+        results = lint_files_parallel([task[:3] for task in tasks], jobs, max_issues)
+    else:
+        results = lint_files_serial([task[:3] for task in tasks], max_issues)
+
+    total_counts = dict.fromkeys(TXT_ISSUES, 0)
+    total_lines = 0
+    checked_files = 0
+    failed_files = 0
+
+    # Ranges of one file come in order, line numbers continue from the previous range
+    file_state = None
+    def flush_file():
+        name, line_count, counts, issues = file_state
+        listed = 0
+        for line_number, issue, detail in issues:
+            if max_issues and listed >= max_issues:
+                break
+            print(f"{name}:{line_number}: {TXT_ISSUES[issue]}: {detail}")
+            listed += 1
+        issue_count = sum(counts.values())
+        if issue_count > listed:
+            print(f"{name}: ... {issue_count - listed} more issues")
+
+    for (file_path, start, _, name), result in zip(tasks, results):
+        if isinstance(result, Exception):
+            print(f"{name}: ✗ Error reading file: {result}")
+            failed_files += 1
+            continue
+
+        for member, (line_count, counts, issues) in result:
+            member_name = name if member is None else f"{name}/{member}"
+            if file_state is not None and (member is not None or start == 0):
+                flush_file()
+                file_state = None
+            if file_state is None:
+                file_state = [member_name, 0, dict.fromkeys(TXT_ISSUES, 0), []]
+                checked_files += 1
+            offset = file_state[1]
+            file_state[1] += line_count
+            file_state[3].extend((offset + line_number, issue, detail) for line_number, issue, detail in issues)
+            for issue, count in counts.items():
+                file_state[2][issue] += count
+                total_counts[issue] += count
+            total_lines += line_count
+    if file_state is not None:
+        flush_file()
+
+    elapsed = time.perf_counter() - start_time
+    total_bytes = sum(file_path.stat().st_size for file_path, _ in files)
+    print("-" * 50)
+    print(f"Checked {checked_files} files, {total_lines:,} lines, {total_bytes / (1024 * 1024):.1f} MB in {elapsed:.2f} s")
+    if failed_files:
+        print(f"✗ Files that could not be read: {failed_files}")
+    problems = [f"{count} {TXT_ISSUES[issue]}" for issue, count in total_counts.items() if count]
+    if problems:
+        print(f"⚠ Issues: {', '.join(problems)}")
+        return 1
+    if failed_files:
+        return 1
+    print("✓ No issues found")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,84 +3,1480 @@
 # Function: 将从官方提取的 csv 文件格式或 I18nEx 的 csv 文件格式转换为 JustAnotherTranslator 使用的格式 Convert the csv file format extracted from the official website or I18nEx to the format used by JustAnotherTranslator
 # Author: claude 4 & 90135
 # Creation date: 2025-07-04
-# Version: 2025-08-02_01
+# Version: 2026-10-17_09
 # License: Bsd-3
 
+import codecs
+import contextlib
+import cProfile
 import csv
+import ctypes
+import errno
+import glob
+import hashlib
+import io
+import itertools
+import json
+import operator
 import os
+import select
+import shutil
+import struct
 import sys
-from pathlib import Path
+import tarfile
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
 
-def convert_single_csv(input_file, output_file, add_prefix=True):
+# 术语表输出列顺序
+OUTPUT_FIELDNAMES = ('Term', 'Original', 'Translation')
+
+# 未指定语言时用作 Translation 的输入列
+DEFAULT_TRANSLATION_COLUMN = 'English'
+
+# 本次运行的性能分析数据，由 --profile 设置；为 None 时转换过程中不执行计时代码
+PROFILE = None
+
+# 性能分析摘要中列出的最慢文件数
+PROFILE_TOP_FILES = 10
+
+def start_profile(use_cprofile=False):
+    """
+    开始收集本次运行各阶段的耗时、跟踪的内存和每个文件的耗时
+
+    Args:
+        use_cprofile (bool): 同时运行 cProfile，用于生成 pstats 可读取的转储
+    """
+
+    global PROFILE
+    PROFILE = {'stages': {}, 'nested': [], 'files': [], 'start_time': time.perf_counter(), 'cprofile': None}
+    tracemalloc.start()
+    if use_cprofile:
+        PROFILE['cprofile'] = cProfile.Profile()
+        PROFILE['cprofile'].enable()
+
+@contextlib.contextmanager
+def profile_stage(stage):
+    """
+    性能分析时将代码块作为一个阶段计时，嵌套在其内部的阶段的耗时不会重复计算
+
+    Args:
+        stage (str): 阶段名称
+    """
+
+    if PROFILE is None:
+        yield
+        return
+    PROFILE['nested'].append(0.0)
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start_time
+        PROFILE['stages'][stage] = PROFILE['stages'].get(stage, 0.0) + elapsed - PROFILE['nested'].pop()
+        if PROFILE['nested']:
+            PROFILE['nested'][-1] += elapsed
+
+def profile_iter(stage, iterable):
+    """
+    包装可迭代对象，使生成每一项的耗时计入一个阶段
+
+    Args:
+        stage (str): 阶段名称
+        iterable (iterable): 被包装的可迭代对象
+
+    Yields:
+        可迭代对象中的项
+    """
+
+    iterator = iter(iterable)
+    while True:
+        with profile_stage(stage):
+            item = next(iterator, iterator)
+        if item is iterator:
+            return
+        yield item
+
+def profile_file(file_name, convert, stage='write'):
+    """
+    转换单个文件，性能分析时记录其耗时和行数
+
+    转换过程中未计入其进入的阶段的耗时计入 stage。
+
+    Args:
+        file_name (str): 摘要中显示的文件名
+        convert (callable): 转换函数，返回记录数
+        stage (str): 其余耗时计入的阶段名称（默认为 write）
+
+    Returns:
+        convert 的返回值
+    """
+
+    if PROFILE is None:
+        return convert()
+
+    result = -1
+    start_time = time.perf_counter()
+    try:
+        with profile_stage(stage):
+            result = convert()
+    finally:
+        PROFILE['files'].append((str(file_name), time.perf_counter() - start_time,
+                                 result if result is not None else -1))
+    return result
+
+def finish_profile(top_files=PROFILE_TOP_FILES, output_file=None):
+    """
+    停止性能分析，打印摘要，并可选地写入文件
+
+    Args:
+        top_files (int): 列出的最慢文件数
+        output_file (str): 写入 JSON 摘要（.json）或 cProfile 转储（其他扩展名）（可选）
+    """
+
+    global PROFILE
+    profile, PROFILE = PROFILE, None
+    if profile['cprofile'] is not None:
+        profile['cprofile'].disable()
+    total_time = time.perf_counter() - profile['start_time']
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stages = dict(profile['stages'])
+    stages['other'] = max(0.0, total_time - sum(stages.values()))
+    slowest_files = sorted(profile['files'], key=lambda file: file[1], reverse=True)[:top_files]
+
+    print()
+    print("=" * 50)
+    print("性能分析摘要")
+    print(f"  总耗时: {total_time:.3f} 秒，文件数: {len(profile['files'])}")
+    print(f"  {'阶段':<10}{'耗时 (秒)':>11}{'占比':>7}")
+    for stage, stage_time in stages.items():
+        share = stage_time / total_time if total_time else 0
+        print(f"  {stage:<12}{stage_time:>12.3f}{share:>9.1%}")
+    print(f"  跟踪的内存峰值: {peak_memory / (1024 * 1024):.1f} MB (tracemalloc)")
+    if slowest_files:
+        print(f"  最慢的 {len(slowest_files)} 个文件:")
+        for file_name, file_time, rows in slowest_files:
+            rows_text = f"{rows:>10,} 行" if rows >= 0 else f"{'失败':>10}"
+            print(f"    {file_time:>9.3f} 秒 {rows_text}  {file_name}")
+    print("  注意：耗时包含性能分析本身的开销，请比较各阶段的占比而不是绝对耗时")
+
+    if output_file is None:
+        return
+
+    if output_file.lower().endswith('.json'):
+        with open(output_file, 'w', encoding='utf-8') as outfile:
+            json.dump({
+                'total_time': total_time,
+                'stages': stages,
+                'peak_traced_memory': peak_memory,
+                'slowest_files': [{'file': file_name, 'time': file_time, 'rows': rows}
+                                  for file_name, file_time, rows in slowest_files]
+            }, outfile, ensure_ascii=False, indent=2)
+    elif profile['cprofile'] is not None:
+        profile['cprofile'].dump_stats(output_file)
+    print(f"  性能分析结果已写入 {output_file}")
+
+# 本次运行的进度输出，由 --quiet 或 --progress=jsonl 设置；为 None 时打印通常的控制台文本
+PROGRESS = None
+
+# --progress 可选的进度输出模式，"text" 为通常的控制台文本
+PROGRESS_MODES = ('text', 'jsonl')
+
+# JSON lines 进度模式下吞吐量事件之间的最小间隔秒数
+PROGRESS_INTERVAL = 1.0
+
+# 进度输出写入器的缓冲区大小（字节）
+PROGRESS_BUFFER_SIZE = 64 * 1024
+
+@contextlib.contextmanager
+def progress_output(mode=None):
+    """
+    通过带缓冲的写入器输出进度，而不是逐行打印控制台文本
+
+    本次运行的其他控制台文本保存在内存中，如果运行在输出摘要之前结束，则写入 stderr，以免丢失错误信息。
+
+    Args:
+        mode (str): "jsonl" 每行写入一个 JSON 事件，"quiet" 只写入最终摘要，None 打印通常的控制台文本
+    """
+
+    global PROGRESS
+    if mode is None:
+        yield
+        return
+
+    sys.stdout.flush()
+    writer = open(sys.stdout.fileno(), 'w', encoding='utf-8', buffering=PROGRESS_BUFFER_SIZE, closefd=False)
+    start_time = time.perf_counter()
+    PROGRESS = {'mode': mode, 'writer': writer, 'start_time': start_time, 'last_event_time': start_time,
+                'total_files': 0, 'done_files': 0, 'rows': 0, 'summary': False}
+    console_output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(console_output):
+            yield
+    finally:
+        progress, PROGRESS = PROGRESS, None
+        progress['writer'].close()
+        if not progress['summary']:
+            sys.stderr.write(console_output.getvalue())
+
+def write_progress_event(event):
+    """
+    写入一个 JSON lines 事件
+
+    Args:
+        event (dict): 事件字段
+    """
+
+    PROGRESS['writer'].write(json.dumps(event, ensure_ascii=False) + '\n')
+
+def run_file(file_name, convert, stage='write'):
+    """
+    转换单个文件，启用进度输出时捕获其控制台输出
+
+    Args:
+        file_name (str): 性能分析摘要中显示的文件名
+        convert (callable): 转换函数，返回记录数
+        stage (str): 未计入其他阶段的耗时计入的性能分析阶段（默认为 write）
+
+    Returns:
+        tuple: (convert 的返回值, 捕获的控制台输出，已直接打印时为 None, 耗时秒数)
+    """
+
+    start_time = time.perf_counter()
+    if PROGRESS is None:
+        return profile_file(file_name, convert, stage), None, time.perf_counter() - start_time
+
+    console_output = io.StringIO()
+    with contextlib.redirect_stdout(console_output):
+        result = profile_file(file_name, convert, stage)
+    return result, console_output.getvalue(), time.perf_counter() - start_time
+
+def report_file(file_name, record_count, console_output=None, **fields):
+    """
+    在进度模式下报告一个已转换的文件
+
+    失败文件的控制台输出会被保留，JSON lines 模式下作为事件的 message，quiet 模式下写入 stderr。
+
+    Args:
+        file_name (str): 相对于输入文件夹的文件名
+        record_count (int): 转换的记录数，无有效数据时为 0，出错时为 -1，跳过时为 None
+        console_output (str): 转换过程的控制台输出（可选）
+        **fields: 其他事件字段，例如 format、bytes 和 duration，值为 None 的字段不写入
+    """
+
+    status = ('skipped' if record_count is None else 'ok' if record_count > 0
+              else 'empty' if record_count == 0 else 'failed')
+    PROGRESS['done_files'] += 1
+    PROGRESS['rows'] += max(record_count or 0, 0)
+
+    if PROGRESS['mode'] == 'quiet':
+        if status == 'failed' and console_output:
+            sys.stderr.write(console_output)
+        return
+
+    event = {'event': 'file', 'path': Path(file_name).as_posix(), 'status': status, 'rows': record_count, **fields}
+    event = {key: round(value, 6) if isinstance(value, float) else value
+             for key, value in event.items() if value is not None}
+    if status == 'failed' and console_output:
+        event['message'] = console_output.strip()
+    write_progress_event(event)
+
+    now = time.perf_counter()
+    if now - PROGRESS['last_event_time'] < PROGRESS_INTERVAL:
+        return
+    PROGRESS['last_event_time'] = now
+    elapsed = now - PROGRESS['start_time']
+    done_files, total_files = PROGRESS['done_files'], PROGRESS['total_files']
+    write_progress_event({
+        'event': 'progress',
+        'done_files': done_files,
+        'total_files': total_files,
+        'rows': PROGRESS['rows'],
+        'elapsed': round(elapsed, 3),
+        'files_per_second': round(done_files / elapsed, 1),
+        'rows_per_second': round(PROGRESS['rows'] / elapsed, 1),
+        'eta': round(max(total_files - done_files, 0) * elapsed / done_files, 1) if total_files else None
+    })
+
+def print_summary(successful_files, total_files, total_processed, skipped_files=None):
+    """
+    打印批量处理的最终摘要，输出为控制台文本或摘要事件
+
+    Args:
+        successful_files (int): 有转换记录的文件数
+        total_files (int): 输入文件数
+        total_processed (int): 转换的记录总数
+        skipped_files (int): 增量模式下跳过的未改变文件数（可选）
+    """
+
+    lines = [
+        "批量处理完成！",
+        f"成功处理文件: {successful_files}/{total_files}",
+        f"总共转换记录: {total_processed} 条"
+    ]
+    if skipped_files is not None:
+        lines.append(f"跳过未改变的文件: {skipped_files}")
+
+    if PROGRESS is None:
+        for line in lines:
+            print(line)
+        return
+
+    PROGRESS['summary'] = True
+    if PROGRESS['mode'] == 'quiet':
+        PROGRESS['writer'].write('\n'.join(lines) + '\n')
+        return
+
+    event = {'event': 'summary', 'successful_files': successful_files, 'total_files': total_files,
+             'records': total_processed, 'elapsed': round(time.perf_counter() - PROGRESS['start_time'], 3)}
+    if skipped_files is not None:
+        event['skipped_files'] = skipped_files
+    write_progress_event(event)
+
+# 所有输入文件的编码，由 --force-encoding 设置；None 时逐个文件检测编码
+FORCE_ENCODING = None
+
+# 通过字节顺序标记识别的编码
+BOM_ENCODINGS = ((codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF16_LE, 'utf-16'), (codecs.BOM_UTF16_BE, 'utf-16'))
+
+# 对没有字节顺序标记的文件依次尝试的编码，cp932 即带 Windows 扩展的 Shift_JIS
+DETECT_ENCODINGS = ('utf-8', 'cp932')
+
+# 为检测编码从文件开头读取的字节数
+ENCODING_SAMPLE_SIZE = 256 * 1024
+
+def set_force_encoding(encoding):
+    """
+    设置所有输入文件的编码，同时也是工作进程的初始化函数
+
+    Args:
+        encoding (str): 编码名称，None 时逐个文件检测编码
+    """
+
+    global FORCE_ENCODING
+    FORCE_ENCODING = encoding
+
+def detect_encoding(input_stream):
+    """
+    根据字节顺序标记或内容开头检测二进制流的编码
+
+    没有字节顺序标记时，将样本依次交给 DETECT_ENCODINGS 中每种编码的增量解码器，
+    因此样本末尾被截断的字符不算错误。
+
+    Args:
+        input_stream (file): 二进制流，从当前位置读取 ENCODING_SAMPLE_SIZE 字节
+
+    Returns:
+        str: 编码名称，没有编码能解码样本时返回 None
+    """
+
+    sample = input_stream.read(ENCODING_SAMPLE_SIZE)
+    for bom, encoding in BOM_ENCODINGS:
+        if sample.startswith(bom):
+            return encoding
+
+    for encoding in DETECT_ENCODINGS:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(sample, final=len(sample) < ENCODING_SAMPLE_SIZE)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    return None
+
+def open_input(input_file, input_stream=None):
+    """
+    以文本方式打开输入CSV文件，或包装已打开的二进制流（例如压缩包成员）
+
+    编码为 FORCE_ENCODING 或由 detect_encoding 检测，文本在读取时分块解码，因此不会整个载入文件。
+
+    Args:
+        input_file (str): 输入CSV文件路径
+        input_stream (file): 输入文件的可定位二进制流（可选）
+
+    Returns:
+        file: 文本流
+
+    Raises:
+        ValueError: 无法检测编码
+    """
+
+    binary_stream = open(input_file, 'rb') if input_stream is None else input_stream
+    try:
+        encoding = FORCE_ENCODING
+        if encoding is None:
+            with profile_stage('encoding'):
+                start = binary_stream.tell()
+                encoding = detect_encoding(binary_stream)
+                binary_stream.seek(start)
+            if encoding is None:
+                raise ValueError(f"无法检测编码（已尝试 {', '.join(DETECT_ENCODINGS)}），"
+                                 f"请用 --force-encoding 指定编码")
+            if encoding not in ('utf-8', 'utf-8-sig'):
+                print(f"  检测到编码: {encoding}")
+        return io.TextIOWrapper(binary_stream, encoding=encoding)
+    except BaseException:
+        if input_stream is None:
+            binary_stream.close()
+        raise
+
+def iter_csv_records(lines):
+    """
+    将CSV行拆分为记录，结果与 csv.reader 相同，但不包括 csv.DictReader 会跳过的空行
+
+    不含引号的行直接按逗号拆分。含引号的行交给 csv 模块处理，引号字段跨行时，
+    csv 模块会从同一个迭代器继续读取后面的行。两种方式对超过 csv.field_size_limit() 的字段
+    都抛出相同的 csv.Error。
+
+    Args:
+        lines (iterator): 以 '\n' 结尾的文本行，即以通用换行模式从文本文件读取的行
+
+    Yields:
+        list: 一条记录的字段
+    """
+
+    field_limit = csv.field_size_limit()
+    for line in lines:
+        if '"' in line:
+            yield next(csv.reader(itertools.chain((line,), lines)))
+        elif line != '\n':
+            fields = line.rstrip('\n').split(',')
+            if len(line) > field_limit and any(len(field) > field_limit for field in fields):
+                raise csv.Error(f"field larger than field limit ({field_limit})")
+            yield fields
+
+def read_term_rows(input_file, add_prefix=True, translation_columns=(DEFAULT_TRANSLATION_COLUMN,), input_stream=None):
+    """
+    逐行读取并转换多语言CSV
+
+    结果与使用 csv.DictReader 读取文件相同，但列索引只从表头查找一次，也不会为每行构建字典。
+
+    Args:
+        input_file (str): 输入CSV文件路径
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        translation_columns (tuple): 用作 Translation 的输入列，每列对应一个输出表
+        input_stream (file): 代替打开 input_file 读取的二进制流（可选）
+
+    Yields:
+        tuple: (Term, Original, Translation...)，每个翻译列对应一个 Translation
+    """
+
+    # 获取文件名（不含扩展名）用作前缀，Term的格式由 add_prefix 参数决定
+    file_prefix = Path(input_file).stem
+    term_prefix = f"{file_prefix}/" if add_prefix else ""
+
+    with open_input(input_file, input_stream) as infile:
+        lines = infile if PROFILE is None else profile_iter('decode', infile)
+        fieldnames = next(csv.reader(lines), None)
+        if fieldnames is None:
+            return
+
+        # 重复的列名取最后一列的值，与 csv.DictReader 相同
+        width = len(fieldnames)
+        column_indexes = {}
+        for index, column in enumerate(fieldnames):
+            column_indexes[column] = index
+
+        # 提取关键信息，处理可能的BOM字符
+        key_field = 'Key'
+        if key_field not in column_indexes:
+            # 查找包含'Key'的列名（可能有BOM前缀）
+            key_field = next((column for column in column_indexes if column.endswith('Key')), None)
+
+        # 表头中没有的列指向最后一列之后的空值
+        key_index = column_indexes.get(key_field, width)
+        value_indexes = [column_indexes.get(column, width) for column in ('Japanese', *translation_columns)]
+        get_values = operator.itemgetter(*value_indexes)
+        complete = key_index < width and width not in value_indexes
+        missing_values = [None] * width
+
+        records = iter_csv_records(lines)
+        if PROFILE is not None:
+            records = profile_iter('parse', records)
+
+        for record in records:
+            if not complete or len(record) < width:
+                # 较短的行中缺少的字段为 None，与 csv.DictReader 相同
+                record = record[:width] + missing_values[len(record):] + ['']
+
+            key = record[key_index]
+
+            # 跳过空行或无效数据
+            if not key:
+                continue
+
+            yield (term_prefix + key, *get_values(record))
+
+def write_csv_rows(output_file, fieldnames, rows):
+    """
+    边产生边写入输出文件
+
+    数据先写入输出文件旁的临时文件，输入读取完毕后再替换输出文件。
+    因此原地转换（输出文件即输入文件）仍然安全，失败时也不会留下写了一半的输出。
+
+    Args:
+        output_file (str): 输出CSV文件路径
+        fieldnames (tuple): 表头，仅在至少有一行数据时写入
+        rows (iterable): 行元组
+
+    Returns:
+        int: 写入的行数
+    """
+
+    output_file = Path(output_file)
+    temp_file = output_file.with_name(output_file.name + '.tmp')
+    row_count = 0
+
+    try:
+        with open(temp_file, 'w', encoding='utf-8-sig', newline='') as outfile:
+            writer = csv.writer(outfile)
+            for row in rows:
+                if row_count == 0:
+                    writer.writerow(fieldnames)
+                writer.writerow(row)
+                row_count += 1
+        os.replace(temp_file, output_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+    return row_count
+
+def write_term_tables(output_files, rows):
+    """
+    一次遍历所有行，为每个翻译列写入一个术语表
+
+    与 write_csv_rows 相同，每个表先写入临时文件，最后再替换输出文件。
+
+    Args:
+        output_files (list): 每个翻译列对应的输出CSV文件路径
+        rows (iterable): (Term, Original, Translation...) 元组，每个输出文件对应一个 Translation
+
+    Returns:
+        int: 每个文件写入的行数
+    """
+
+    output_files = [Path(output_file) for output_file in output_files]
+    temp_files = [output_file.with_name(output_file.name + '.tmp') for output_file in output_files]
+    row_count = 0
+
+    try:
+        with contextlib.ExitStack() as stack:
+            writers = [csv.writer(stack.enter_context(open(temp_file, 'w', encoding='utf-8-sig', newline='')))
+                       for temp_file in temp_files]
+            for term, original, *translations in rows:
+                for writer, translation in zip(writers, translations):
+                    if row_count == 0:
+                        writer.writerow(OUTPUT_FIELDNAMES)
+                    writer.writerow((term, original, translation))
+                row_count += 1
+        for temp_file, output_file in zip(temp_files, output_files):
+            os.replace(temp_file, output_file)
+    except BaseException:
+        for temp_file in temp_files:
+            temp_file.unlink(missing_ok=True)
+        raise
+
+    return row_count
+
+def convert_single_csv(input_file, output_file, add_prefix=True, input_stream=None):
+    """
+    将单个多语言CSV格式转换为简化的术语对照表格式
+    
+    输入格式: Key,Type,Desc,Japanese,English,Chinese (Simplified),Chinese (Traditional)
+    或: Key,Type,Desc,Japanese,English
+    输出格式: Term,Original,Translation
+    
+    Args:
+        input_file (str): 输入CSV文件路径
+        output_file (str): 输出CSV文件路径
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        input_stream (file): 代替打开 input_file 读取的二进制流（可选）
+
+    Returns:
+        int: 转换的记录数，无有效数据时为 0，出错时为 -1
+    """
+    
+    try:
+        # 逐行从输入流式写入输出，内存占用不随文件大小增长
+        rows = read_term_rows(input_file, add_prefix=add_prefix, input_stream=input_stream)
+        if PROFILE is not None:
+            rows = profile_iter('transform', rows)
+        return write_csv_rows(output_file, OUTPUT_FIELDNAMES, rows)
+                
+    except UnicodeDecodeError as e:
+        print(f"处理文件 {input_file} 时发生错误: 不是有效的 {e.encoding} 编码（{e.reason}），请用 --force-encoding 指定编码")
+        return -1
+
+    except Exception as e:
+        print(f"处理文件 {input_file} 时发生错误: {e}")
+        return -1
+
+def convert_multilingual_csv(input_file, output_files, languages, add_prefix=True, input_stream=None):
+    """
+    读取一次多语言CSV，为每个目标语言各生成一个术语表
+
+    每个表与将该语言列作为 Translation 单独转换的结果相同。
+
+    Args:
+        input_file (str): 输入CSV文件路径
+        output_files (list): 每个语言对应的输出CSV文件路径
+        languages (list): 用作 Translation 的输入列名，例如 'Chinese (Simplified)'
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        input_stream (file): 代替打开 input_file 读取的二进制流（可选）
+
+    Returns:
+        int: 每个表转换的记录数，无有效数据时为 0，出错时为 -1
+    """
+
+    try:
+        rows = read_term_rows(input_file, add_prefix=add_prefix, translation_columns=tuple(languages),
+                              input_stream=input_stream)
+        if PROFILE is not None:
+            rows = profile_iter('transform', rows)
+        return write_term_tables(output_files, rows)
+
+    except UnicodeDecodeError as e:
+        print(f"处理文件 {input_file} 时发生错误: 不是有效的 {e.encoding} 编码（{e.reason}），请用 --force-encoding 指定编码")
+        return -1
+
+    except Exception as e:
+        print(f"处理文件 {input_file} 时发生错误: {e}")
+        return -1
+
+def convert_file(input_file, output_files, add_prefix=True, languages=None, input_stream=None):
+    """
+    将单个文件转换为一个输出文件，或每个语言一个输出文件
+
+    Args:
+        input_file (str): 输入CSV文件路径
+        output_files (list): 输出CSV文件路径，每个语言一个或只有一个文件
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        languages (list): 用作 Translation 的输入列名（可选，默认只转换 English）
+        input_stream (file): 代替打开 input_file 读取的二进制流（可选）
+
+    Returns:
+        int: 转换的记录数，无有效数据时为 0，出错时为 -1
+    """
+
+    if languages:
+        return convert_multilingual_csv(input_file, output_files, languages, add_prefix=add_prefix,
+                                        input_stream=input_stream)
+    return convert_single_csv(input_file, output_files[0], add_prefix=add_prefix, input_stream=input_stream)
+
+# 可代替文件夹作为输入的压缩包类型
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+
+def is_archive(input_path):
+    """
+    检查路径是否为支持的 zip 或 tar 压缩包
+
+    Args:
+        input_path (Path): 输入路径
+
+    Returns:
+        bool: .zip 和 .tar(.gz/.bz2/.xz) 文件返回 True
+    """
+
+    return input_path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+def is_member_path_unsafe(member_name):
+    """
+    使用与插件中 FileTool.IsZipPathUnsafe 相同的规则检查压缩包成员名称
+
+    拒绝空名称、上级目录引用以及绝对路径或根路径。
+
+    Args:
+        member_name (str): 压缩包中的成员名称
+
+    Returns:
+        bool: 成员不可使用时返回 True
+    """
+
+    if not member_name:
+        return True
+
+    # 统一路径分隔符
+    normalized_path = member_name.replace('\\', '/')
+
+    # 拒绝包含 "../"
+    if '../' in normalized_path:
+        return True
+
+    # 拒绝绝对路径，包括 Windows 盘符路径
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def iter_archive_csv_files(input_archive, recursive=True):
+    """
+    不解压地遍历 zip 或 tar 压缩包中的CSV成员
+
+    成员按压缩包中的顺序逐个打开，因此压缩的 tar 包只需向前解压一遍。
+
+    Args:
+        input_archive (Path): 压缩包路径
+        recursive (bool): 是否包含子文件夹中的成员
+
+    Yields:
+        tuple: (成员的相对路径, 成员的二进制流)
+    """
+
+    def get_relative_path(member_name):
+        if is_member_path_unsafe(member_name):
+            print(f"跳过不安全的压缩包成员: {member_name}")
+            return None
+        relative_path = PurePosixPath(member_name.replace('\\', '/'))
+        if relative_path.suffix != '.csv' or (not recursive and len(relative_path.parts) > 1):
+            return None
+        return relative_path
+
+    if zipfile.is_zipfile(input_archive):
+        with zipfile.ZipFile(input_archive) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                relative_path = get_relative_path(info.filename)
+                if relative_path is not None:
+                    with archive.open(info) as member_file:
+                        yield relative_path, member_file
+    else:
+        with tarfile.open(input_archive, 'r:*') as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                relative_path = get_relative_path(member.name)
+                if relative_path is not None:
+                    with archive.extractfile(member) as member_file:
+                        yield relative_path, member_file
+
+# 增量转换清单文件名，保存在输出文件夹中
+MANIFEST_FILENAME = ".convert_manifest.jsonl"
+
+def hash_file(input_file):
+    """
+    计算文件内容的 SHA-256 哈希
+
+    Args:
+        input_file (str): 文件路径
+
+    Returns:
+        str: 十六进制摘要
+    """
+
+    digest = hashlib.sha256()
+    with open(input_file, 'rb') as infile:
+        for chunk in iter(lambda: infile.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def get_file_state(input_file, entry=None):
+    """
+    获取输入文件的大小、修改时间和内容哈希
+
+    大小和修改时间未变时直接沿用清单条目中的哈希，因此不会读取未改变的文件。
+
+    Args:
+        input_file (str): 输入文件路径
+        entry (dict): 该文件的清单条目（可选）
+
+    Returns:
+        dict: {'size', 'mtime_ns', 'sha256'}
+    """
+
+    stat = os.stat(input_file)
+    if entry is not None and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+        sha256 = entry.get('sha256')
+    else:
+        sha256 = hash_file(input_file)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+
+def load_manifest(manifest_file):
+    """
+    加载转换清单
+
+    清单是 JSON lines 格式的日志，同一路径以后出现的行为准。
+    被中断的运行留下的不完整行会被忽略。
+
+    Args:
+        manifest_file (Path): 清单文件路径
+
+    Returns:
+        dict: 输入文件相对路径 -> 清单条目
+    """
+
+    manifest = {}
+    if not manifest_file.exists():
+        return manifest
+
+    with open(manifest_file, 'r', encoding='utf-8') as infile:
+        for line in infile:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and 'path' in entry:
+                manifest[entry['path']] = entry
+    return manifest
+
+def append_manifest_entry(manifest_file, manifest, entry):
+    """
+    在清单中记录一个已完成的文件
+
+    条目会立即追加到文件中，被中断的运行可以从最后完成的文件之后继续。
+
+    Args:
+        manifest_file (Path): 清单文件路径
+        manifest (dict): 已加载的清单，会被原地更新
+        entry (dict): 清单条目
+    """
+
+    manifest[entry['path']] = entry
+    with open(manifest_file, 'a', encoding='utf-8', newline='\n') as outfile:
+        outfile.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+def save_manifest(manifest_file, manifest, input_path):
+    """
+    重写清单，每个输入文件一行，并移除已删除输入文件的条目
+
+    Args:
+        manifest_file (Path): 清单文件路径
+        manifest (dict): 已加载的清单
+        input_path (Path): 输入文件夹路径
+    """
+
+    temp_file = manifest_file.with_name(manifest_file.name + '.tmp')
+    with open(temp_file, 'w', encoding='utf-8', newline='\n') as outfile:
+        for path in sorted(manifest):
+            if (input_path / path).exists():
+                outfile.write(json.dumps(manifest[path], ensure_ascii=False) + '\n')
+    os.replace(temp_file, manifest_file)
+
+def is_unchanged(entry, state, options, output_files):
+    """
+    检查增量模式下文件是否可以跳过
+
+    Args:
+        entry (dict): 该文件的清单条目，之前未转换过时为 None
+        state (dict): get_file_state 返回的当前文件状态
+        options (dict): 本次运行的转换选项
+        output_files (list): 输出文件路径
+
+    Returns:
+        bool: 内容和选项均未改变且所有输出文件仍存在时为 True
+    """
+
+    return (entry is not None and
+            entry.get('sha256') == state['sha256'] and
+            entry.get('options') == options and
+            all(output_file.exists() for output_file in output_files))
+
+def convert_file_task(input_file, output_files, add_prefix=True, languages=None):
+    """
+    工作进程入口，转换单个文件并捕获其控制台输出
+
+    Args:
+        input_file (str): 输入CSV文件路径
+        output_files (list): 输出CSV文件路径
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        languages (list): 用作 Translation 的输入列名（可选）
+
+    Returns:
+        tuple: (记录数, 转换过程的控制台输出, 耗时秒数)
+    """
+
+    start_time = time.perf_counter()
+    console_output = io.StringIO()
+    with contextlib.redirect_stdout(console_output):
+        record_count = convert_file(input_file, output_files, add_prefix=add_prefix, languages=languages)
+    return record_count, console_output.getvalue(), time.perf_counter() - start_time
+
+def convert_files_parallel(tasks, jobs, add_prefix=True, languages=None):
+    """
+    使用进程池转换文件
+
+    Args:
+        tasks (list): (输入文件, 相对路径, 输出文件列表, 文件状态) 元组列表
+        jobs (int): 工作进程数
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        languages (list): 用作 Translation 的输入列名（可选）
+
+    Yields:
+        tuple: (记录数, 转换过程的控制台输出, 耗时秒数)，顺序与 tasks 相同
+    """
+
+    executor = ProcessPoolExecutor(max_workers=jobs, initializer=set_force_encoding, initargs=(FORCE_ENCODING,))
+    try:
+        futures = [executor.submit(convert_file_task, csv_file, output_files, add_prefix, languages)
+                   for csv_file, _, output_files, _ in tasks]
+
+        for (csv_file, _, _, _), future in zip(tasks, futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # 工作进程本身出错，按转换错误报告
+                yield -1, f"处理文件 {csv_file} 时发生错误: {e}\n", None
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+# 合并术语表的文件名，分片会添加 _001、_002... 后缀
+MERGED_FILENAME = "merged"
+
+def ordinal_key(text):
+    """
+    与 .NET StringComparer.Ordinal 一致的排序键，按 UTF-16 码元比较
+
+    Args:
+        text (str): 要排序的文本
+
+    Returns:
+        bytes: 文本的 UTF-16 大端编码
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def loader_order_key(relative_path):
+    """
+    插件加载翻译文件顺序的排序键
+
+    插件先加载翻译文件夹根目录中的文件，再加载每个子文件夹中的文件，
+    文件夹和文件均按路径的序数顺序排序（FileTool.GetAllTranslationFiles）。
+
+    Args:
+        relative_path (Path): 相对于翻译文件夹的文件路径
+
+    Returns:
+        tuple: 排序键
+    """
+
+    folder = relative_path.parent.parts
+    return len(folder) > 0, ordinal_key('\\'.join(folder)), ordinal_key(relative_path.name)
+
+def read_term_file(input_file, add_prefix=True, translation_columns=(DEFAULT_TRANSLATION_COLUMN,), consume=list,
+                   rows=None):
+    """
+    将一个文件转换后的行在读取时逐行交给 consume
+
+    行读取出错时 consume 会撤销已做的处理，因此中途失败的文件不会贡献任何行。
+
+    Args:
+        input_file (str): 输入CSV文件路径
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        translation_columns (tuple): 用作 Translation 的输入列
+        consume (callable): 以 (Term, Original, Translation...) 元组的迭代器调用，返回其结果
+            （默认为 list，即收集全部行）
+        rows (list): 工作进程已读取的行，代替读取 input_file 交给 consume（可选）
+
+    Returns:
+        consume 的结果，出错时为 None
+    """
+
+    try:
+        if rows is None:
+            rows = read_term_rows(input_file, add_prefix=add_prefix, translation_columns=translation_columns)
+            if PROFILE is not None:
+                rows = profile_iter('transform', rows)
+        return consume(iter(rows))
+
+    except UnicodeDecodeError as e:
+        print(f"处理文件 {input_file} 时发生错误: 不是有效的 {e.encoding} 编码（{e.reason}），请用 --force-encoding 指定编码")
+        return None
+
+    except Exception as e:
+        print(f"处理文件 {input_file} 时发生错误: {e}")
+        return None
+
+def read_file_task(input_file, add_prefix=True, translation_columns=(DEFAULT_TRANSLATION_COLUMN,)):
+    """
+    工作进程入口，读取单个文件并捕获其控制台输出
+
+    Args:
+        input_file (str): 输入CSV文件路径
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        translation_columns (tuple): 用作 Translation 的输入列
+
+    Returns:
+        tuple: (行列表，出错时为 None, 读取过程的控制台输出, 耗时秒数)
+    """
+
+    start_time = time.perf_counter()
+    console_output = io.StringIO()
+    with contextlib.redirect_stdout(console_output):
+        rows = read_term_file(input_file, add_prefix=add_prefix, translation_columns=translation_columns)
+    return rows, console_output.getvalue(), time.perf_counter() - start_time
+
+def read_files_parallel(csv_files, jobs, add_prefix=True, translation_columns=(DEFAULT_TRANSLATION_COLUMN,)):
+    """
+    使用进程池读取文件
+
+    Args:
+        csv_files (list): 输入CSV文件路径列表
+        jobs (int): 工作进程数
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        translation_columns (tuple): 用作 Translation 的输入列
+
+    Yields:
+        tuple: (行列表，出错时为 None, 读取过程的控制台输出, 耗时秒数)，顺序与 csv_files 相同
+    """
+
+    executor = ProcessPoolExecutor(max_workers=jobs, initializer=set_force_encoding, initargs=(FORCE_ENCODING,))
+    try:
+        futures = [executor.submit(read_file_task, csv_file, add_prefix, translation_columns)
+                   for csv_file in csv_files]
+
+        for csv_file, future in zip(csv_files, futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # 工作进程本身失败，按读取错误报告
+                yield None, f"处理文件 {csv_file} 时发生错误: {e}\n", None
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+def read_term_files(csv_files, input_path, consume, jobs=1, add_prefix=True,
+                    translation_columns=(DEFAULT_TRANSLATION_COLUMN,)):
+    """
+    逐个文件将转换后的行流式交给 consume，并打印处理进度
+
+    单进程时每个文件边读取边处理。工作进程会交回整个文件的行，由主进程处理。
+
+    Args:
+        csv_files (list): 输入CSV文件路径列表，按此顺序返回
+        input_path (Path): 输入文件夹路径
+        consume (callable): 以每个文件的行迭代器调用，迭代器出错时撤销已做的处理，返回处理的行数
+        jobs (int): 工作进程数，0 表示使用全部CPU核心
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        translation_columns (tuple): 用作 Translation 的输入列
+
+    Yields:
+        tuple: (输入文件, 行数，出错时为 None)
+    """
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(csv_files))
+    if jobs > 1:
+        print(f"注意：使用 {jobs} 个工作进程。")
+    print("-" * 50)
+
+    # 并行模式下由工作进程读取文件，结果按输入顺序返回
+    results = read_files_parallel(csv_files, jobs, add_prefix=add_prefix,
+                                  translation_columns=translation_columns) if jobs > 1 else None
+
+    if PROGRESS is not None:
+        PROGRESS['total_files'] = len(csv_files)
+    for csv_file in csv_files:
+        relative_path = csv_file.relative_to(input_path)
+        if PROGRESS is None:
+            print(f"处理文件: {relative_path}")
+            input_bytes = None
+        else:
+            input_bytes = csv_file.stat().st_size
+
+        if results is None:
+            record_count, console_output, duration = run_file(relative_path, lambda: read_term_file(
+                csv_file, add_prefix=add_prefix, translation_columns=translation_columns, consume=consume),
+                stage='transform')
+        else:
+            rows, console_output, duration = next(results)
+            record_count = None
+            if rows is not None:
+                # 处理出错时与工作进程的读取错误一样报告
+                consume_output = io.StringIO()
+                with contextlib.redirect_stdout(consume_output):
+                    record_count = read_term_file(csv_file, consume=consume, rows=rows)
+                console_output += consume_output.getvalue()
+            if PROGRESS is None:
+                print(console_output, end='')
+
+        if PROGRESS is not None:
+            report_file(relative_path, record_count if record_count is not None else -1, console_output,
+                        bytes=input_bytes, duration=duration)
+
+        yield csv_file, record_count
+
+def get_merged_shards(output_filename, terms, shard_rows=0):
+    """
+    按 Term 排序合并后的术语并拆分为分片
+
+    Args:
+        output_filename (str): 合并表文件名，分片命名为 <名称>_001.csv、<名称>_002.csv...
+        terms (dict): Term -> (Original, Translation)
+        shard_rows (int): 每个分片的最大行数，0 表示只有一个表
+
+    Returns:
+        list: (文件名, 分片中的 Term 列表) 元组列表
+    """
+
+    sorted_terms = sorted(terms, key=ordinal_key)
+    if shard_rows <= 0:
+        return [(output_filename, sorted_terms)]
+
+    stem, suffix = os.path.splitext(output_filename)
+    shard_count = max(1, -(-len(sorted_terms) // shard_rows))
+    return [(f"{stem}_{index + 1:03d}{suffix}", sorted_terms[index * shard_rows:(index + 1) * shard_rows])
+            for index in range(shard_count)]
+
+def write_merged_table(output_file, terms, shard_rows=0):
+    """
+    按 Term 排序写入合并后的术语，可选拆分为多个分片
+
+    之前以不同分片数运行留下的合并表会被删除，以免插件加载过时的术语。
+
+    Args:
+        output_file (Path): 合并表路径
+        terms (dict): Term -> (Original, Translation)
+        shard_rows (int): 每个分片的最大行数，0 表示只写入一个表
+
+    Returns:
+        list: 已写入的表路径
+    """
+
+    written_files = []
+    for shard_filename, shard_terms in get_merged_shards(output_file.name, terms, shard_rows):
+        shard_file = output_file.with_name(shard_filename)
+        write_csv_rows(shard_file, OUTPUT_FIELDNAMES, ((term, *terms[term]) for term in shard_terms))
+        written_files.append(shard_file)
+
+    shard_prefix = output_file.stem + "_"
+    stale_files = [output_file] + [
+        shard_file for shard_file in output_file.parent.glob(glob.escape(shard_prefix) + "*" + output_file.suffix)
+        if shard_file.stem[len(shard_prefix):].isdigit()]
+    for stale_file in stale_files:
+        if stale_file not in written_files:
+            stale_file.unlink(missing_ok=True)
+
+    return written_files
+
+# zip 压缩选项，"stored" 或 deflate 压缩级别
+ZIP_COMPRESSION_LEVELS = ('stored',) + tuple(str(level) for level in range(10))
+DEFAULT_ZIP_COMPRESSION = '6'
+
+def get_zip_files(zip_file, languages=None):
+    """
+    获取每个翻译列对应的压缩包路径
+
+    Args:
+        zip_file (str): 压缩包路径
+        languages (list): 用作 Translation 的输入列名，每个语言写入名为 <压缩包>_<语言>.zip 的压缩包（可选）
+
+    Returns:
+        list: 压缩包路径列表
+    """
+
+    zip_file = Path(zip_file)
+    if not languages:
+        return [zip_file]
+    return [zip_file.with_name(f"{zip_file.stem}_{language}{zip_file.suffix}") for language in languages]
+
+@contextlib.contextmanager
+def open_zip_archive(zip_file, compression=DEFAULT_ZIP_COMPRESSION):
+    """
+    打开用于写入条目的 zip 压缩包
+
+    压缩包先写入最终路径旁边，完成后才替换最终文件，插件不会加载写了一半的压缩包。
+
+    Args:
+        zip_file (Path): 压缩包路径
+        compression (str): "stored" 或 0 到 9 的 deflate 压缩级别
+
+    Yields:
+        zipfile.ZipFile: 已打开用于写入的压缩包
+    """
+
+    temp_file = zip_file.with_name(zip_file.name + '.tmp')
+    if compression == 'stored':
+        compress_type, compress_level = zipfile.ZIP_STORED, None
+    else:
+        compress_type, compress_level = zipfile.ZIP_DEFLATED, int(compression)
+
+    try:
+        with zipfile.ZipFile(temp_file, 'w', compression=compress_type, compresslevel=compress_level) as archive:
+            yield archive
+        os.replace(temp_file, zip_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+def write_zip_entry(archive, entry_name, fieldnames, rows):
+    """
+    行一产生就写入 zip 压缩包中的 CSV 条目
+
+    Args:
+        archive (zipfile.ZipFile): 已打开用于写入的压缩包
+        entry_name (str): 条目名称
+        fieldnames (tuple): 表头行
+        rows (iterable): 行元组
+
+    Returns:
+        int: 写入的行数
+    """
+
+    row_count = 0
+    with archive.open(entry_name, 'w') as entry_file:
+        with io.TextIOWrapper(entry_file, encoding='utf-8-sig', newline='') as outfile:
+            writer = csv.writer(outfile)
+            writer.writerow(fieldnames)
+            for row in rows:
+                writer.writerow(row)
+                row_count += 1
+    return row_count
+
+def copy_zip_entry(archive, entry_name, spool):
+    """
+    将暂存的CSV文件作为条目复制到 zip 压缩包
+
+    Args:
+        archive (zipfile.ZipFile): 以写入模式打开的压缩包
+        entry_name (str): 条目名称
+        spool (io.TextIOWrapper): 基于二进制临时文件的文本文件，保存整个条目
+    """
+
+    spool.flush()
+    spool.buffer.seek(0)
+    with archive.open(entry_name, 'w') as entry_file:
+        shutil.copyfileobj(spool.buffer, entry_file)
+
+def print_zip_report(zip_file, compression=DEFAULT_ZIP_COMPRESSION):
+    """
+    打印 zip 压缩包中每个条目的大小和压缩率
+
+    Args:
+        zip_file (Path): 压缩包路径
+        compression (str): 压缩包使用的压缩方式
+    """
+
+    with zipfile.ZipFile(zip_file) as archive:
+        entries = archive.infolist()
+
+    print(f"压缩包: {zip_file} (压缩方式: {compression})")
+    for info in entries:
+        ratio = info.compress_size / info.file_size if info.file_size else 1
+        print(f"  {info.file_size:>12,} -> {info.compress_size:>12,} 字节 ({ratio:6.1%})  {info.filename}")
+    total_size = sum(info.file_size for info in entries)
+    total_compressed = sum(info.compress_size for info in entries)
+    total_ratio = total_compressed / total_size if total_size else 1
+    print(f"  {total_size:>12,} -> {total_compressed:>12,} 字节 ({total_ratio:6.1%})  "
+          f"共 {len(entries)} 个条目，压缩包大小 {zip_file.stat().st_size:,} 字节")
+
+def zip_csv_files(csv_files, input_path, zip_file, output_suffix="", add_prefix=True, jobs=1, languages=None,
+                  compression=DEFAULT_ZIP_COMPRESSION):
+    """
+    将CSV文件直接转换为 zip 压缩包中的条目，每个语言一个压缩包
+
+    条目保持输入文件夹的结构，并按名称的序数顺序添加，即 AsyncTranslationLoader.ProcessZipFileInOrder
+    的加载顺序，因此两种 zip 加载方式的加载结果相同。
+
+    Args:
+        csv_files (list): 输入CSV文件路径列表
+        input_path (Path): 输入文件夹路径
+        zip_file (str): 压缩包路径
+        output_suffix (str): 输出文件名后缀
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        jobs (int): 工作进程数，0 表示使用全部CPU核心
+        languages (list): 用作 Translation 的输入列名，每个语言写入名为 <压缩包>_<语言>.zip 的压缩包
+            （可选，默认只转换 English）
+        compression (str): "stored" 或 0 到 9 的 deflate 压缩级别
+    """
+
+    translation_columns = tuple(languages) if languages else (DEFAULT_TRANSLATION_COLUMN,)
+    zip_files = get_zip_files(zip_file, languages)
+
+    def entry_name(csv_file):
+        return csv_file.relative_to(input_path).with_name(csv_file.stem + output_suffix + ".csv").as_posix()
+
+    csv_files = sorted(csv_files, key=lambda csv_file: ordinal_key(entry_name(csv_file)))
+
+    total_processed = 0
+    successful_files = 0
+    spools = []
+
+    def spool_rows(rows):
+        # 条目写入压缩包后无法撤回，因此文件的条目先暂存到临时文件，整个文件读取完成后才添加
+        spools.extend(io.TextIOWrapper(tempfile.TemporaryFile(), encoding='utf-8-sig', newline='')
+                      for _ in translation_columns)
+        writers = [csv.writer(spool) for spool in spools]
+        record_count = 0
+        with profile_stage('write'):
+            for writer in writers:
+                writer.writerow(OUTPUT_FIELDNAMES)
+            for term, original, *translations in rows:
+                for writer, translation in zip(writers, translations):
+                    writer.writerow((term, original, translation))
+                record_count += 1
+        return record_count
+
+    try:
+        with contextlib.ExitStack() as stack:
+            archives = [stack.enter_context(open_zip_archive(zip_file, compression)) for zip_file in zip_files]
+
+            for csv_file, record_count in read_term_files(csv_files, input_path, spool_rows, jobs,
+                                                          add_prefix=add_prefix,
+                                                          translation_columns=translation_columns):
+                try:
+                    if record_count:
+                        with profile_stage('write'):
+                            for archive, spool in zip(archives, spools):
+                                copy_zip_entry(archive, entry_name(csv_file), spool)
+                        total_processed += record_count
+                        successful_files += 1
+                finally:
+                    for spool in spools:
+                        spool.close()
+                    spools.clear()
+
+                if PROGRESS is not None:
+                    continue
+                if record_count:
+                    print(f"  ✓ 成功转换 {record_count} 条记录")
+                    print(f"  ✓ 输出条目: {entry_name(csv_file)}")
+                elif record_count is not None:
+                    print(f"  ⚠ 文件中没有有效数据")
+                else:
+                    print(f"  ✗ 处理失败")
+
+                print()
+    except Exception as e:
+        print(f"写入压缩包 {zip_file} 时发生错误: {e}")
+        return
+
+    print("-" * 50)
+    for written_file in zip_files:
+        print_zip_report(written_file, compression)
+    print_summary(successful_files, len(csv_files), total_processed)
+
+def merge_csv_files(csv_files, input_path, output_path, output_suffix="", add_prefix=True, jobs=1, languages=None,
+                    shard_rows=0, zip_file=None, compression=DEFAULT_ZIP_COMPRESSION):
+    """
+    将CSV文件转换为每个语言一个合并、去重的术语表
+
+    文件按插件加载各自转换结果的顺序合并，后面的行会替换 Term 相同的前面的行，
+    因此合并表加载后的翻译与分开的文件相同。Translation 为空的行会被丢弃，
+    因为插件会跳过这些行，而不会让它们替换前面的行。
+
+    Args:
+        csv_files (list): 输入CSV文件路径列表
+        input_path (Path): 输入文件夹路径
+        output_path (Path): 输出文件夹路径
+        output_suffix (str): 输出文件名后缀
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        jobs (int): 工作进程数，0 表示使用全部CPU核心
+        languages (list): 用作 Translation 的输入列名，每个语言合并到输出文件夹下各自的子文件夹
+            （可选，默认只转换 English）
+        shard_rows (int): 每个合并表的最大行数，0 表示只写入一个表
+        zip_file (str): 将合并表写入此压缩包而不是输出文件夹（可选）
+        compression (str): "stored" 或 0 到 9 的 deflate 压缩级别，与 zip_file 一起使用
+    """
+
+    translation_columns = tuple(languages) if languages else (DEFAULT_TRANSLATION_COLUMN,)
+    output_filename = MERGED_FILENAME + output_suffix + ".csv"
+    if zip_file is not None:
+        output_files = get_zip_files(zip_file, languages)
+    elif languages:
+        output_files = [output_path / language / output_filename for language in languages]
+    else:
+        output_files = [output_path / output_filename]
+
+    # 按插件加载原本会写入的各个文件的顺序合并
+    csv_files = sorted(csv_files, key=lambda csv_file: loader_order_key(
+        csv_file.relative_to(input_path).with_name(csv_file.stem + output_suffix + ".csv")))
+
+    merged_terms = [{} for _ in translation_columns]
+    total_processed = 0
+    successful_files = 0
+
+    def merge_rows(rows):
+        # 后面的文件和行优先，与插件按顺序加载分开的文件一致。行先在文件内去重，
+        # 因此中途失败的文件不会改动已合并的术语
+        file_terms = [{} for _ in translation_columns]
+        record_count = 0
+        with profile_stage('merge'):
+            for term, original, *translations in rows:
+                for terms, translation in zip(file_terms, translations):
+                    if translation:
+                        terms[term] = (original, translation)
+                record_count += 1
+            for terms, new_terms in zip(merged_terms, file_terms):
+                terms.update(new_terms)
+        return record_count
+
+    for csv_file, record_count in read_term_files(csv_files, input_path, merge_rows, jobs, add_prefix=add_prefix,
+                                                  translation_columns=translation_columns):
+        if record_count:
+            total_processed += record_count
+            successful_files += 1
+
+        if PROGRESS is not None:
+            continue
+        if record_count:
+            print(f"  ✓ 成功转换 {record_count} 条记录")
+        elif record_count is not None:
+            print(f"  ⚠ 文件中没有有效数据")
+        else:
+            print(f"  ✗ 处理失败")
+
+        print()
+
+    print("-" * 50)
+    for output_file, terms in zip(output_files, merged_terms):
+        try:
+            with profile_stage('write'):
+                if zip_file is not None:
+                    with open_zip_archive(output_file, compression) as archive:
+                        for shard_filename, shard_terms in get_merged_shards(output_filename, terms, shard_rows):
+                            write_zip_entry(archive, shard_filename, OUTPUT_FIELDNAMES,
+                                            ((term, *terms[term]) for term in shard_terms))
+                    written_files = [output_file]
+                else:
+                    output_file.parent.mkdir(parents=True, exist_ok=True)
+                    written_files = write_merged_table(output_file, terms, shard_rows=shard_rows)
+        except Exception as e:
+            print(f"写入合并表 {output_file} 时发生错误: {e}")
+            continue
+
+        print(f"✓ 合并了 {len(terms)} 个不重复的术语")
+        for written_file in written_files:
+            print(f"  ✓ 输出文件: {written_file.relative_to(Path.cwd()) if written_file.is_relative_to(Path.cwd()) else written_file}")
+        if zip_file is not None:
+            print_zip_report(output_file, compression)
+
+    print_summary(successful_files, len(csv_files), total_processed)
+
+def get_output_files(csv_file, input_path, output_path=None, output_suffix="", languages=None):
     """
-    将单个多语言CSV格式转换为简化的术语对照表格式
-    
-    输入格式: Key,Type,Desc,Japanese,English,Chinese (Simplified),Chinese (Traditional)
-    或: Key,Type,Desc,Japanese,English
-    输出格式: Term,Original,Translation
-    
+    获取一个输入文件的输出文件路径，保持输入文件夹的文件夹结构
+
     Args:
-        input_file (str): 输入CSV文件路径
-        output_file (str): 输出CSV文件路径
-        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        csv_file (Path): 输入CSV文件路径
+        input_path (Path): 输入文件夹路径
+        output_path (Path): 输出文件夹路径，None 时写在输入文件旁边
+        output_suffix (str): 输出文件名后缀（默认为空）
+        languages (list): 用作 Translation 的输入列名，每个语言写入各自的子文件夹（可选）
+
+    Returns:
+        list: 输出文件路径，每个语言一个
     """
-    
-    try:
-        # 获取文件名（不含扩展名）用作前缀
-        file_prefix = Path(input_file).stem
-        
-        # 使用utf-8-sig编码处理BOM
-        with open(input_file, 'r', encoding='utf-8-sig') as infile:
-            reader = csv.DictReader(infile)
-            
-            # 准备输出数据
-            output_data = []
-            
-            for row_num, row in enumerate(reader, 1):
-                # 提取关键信息，处理可能的BOM字符
-                key_field = 'Key'
-                if key_field not in row:
-                    # 查找包含'Key'的列名（可能有BOM前缀）
-                    for col_name in row.keys():
-                        if col_name.endswith('Key'):
-                            key_field = col_name
-                            break
-                
-                key = row.get(key_field, '')
-                japanese = row.get('Japanese', '')
-                english = row.get('English', '')
-                
-                # 跳过空行或无效数据
-                if not key:
-                    continue
-                
-                # 根据 add_prefix 参数决定Term的格式
-                term_value = f"{file_prefix}/{key}" if add_prefix else key
-                
-                # 创建新的行数据
-                new_row = {
-                    'Term': term_value,
-                    'Original': japanese,
-                    'Translation': english
-                }
-                
-                output_data.append(new_row)
-    
-        # 写入输出文件
-        with open(output_file, 'w', encoding='utf-8-sig', newline='') as outfile:
-            if output_data:
-                writer = csv.DictWriter(outfile, fieldnames=['Term', 'Original', 'Translation'])
-                writer.writeheader()
-                writer.writerows(output_data)
-                return len(output_data)
-            else:
-                return 0
-                
-    except Exception as e:
-        print(f"处理文件 {input_file} 时发生错误: {e}")
-        return -1
 
-def process_folder(input_folder, output_folder=None, output_suffix="", add_prefix=True, recursive=True):
+    relative_path = csv_file.relative_to(input_path)
+    output_filename = csv_file.stem + output_suffix + ".csv"
+    if languages:
+        # 在指定输出文件夹中为每个语言生成一个文件夹树
+        return [output_path / language / relative_path.parent / output_filename for language in languages]
+    if output_path is None:
+        # 在原位置生成文件
+        return [csv_file.parent / output_filename]
+    # 在指定输出文件夹中保持相同的文件夹结构
+    return [output_path / relative_path.parent / output_filename]
+
+def process_folder(input_folder, output_folder=None, output_suffix="", add_prefix=True, recursive=True, jobs=1,
+                   incremental=False, languages=None, merge=False, shard_rows=0, zip_file=None,
+                   compression=DEFAULT_ZIP_COMPRESSION, csv_files=None):
     """
     批量处理文件夹中的所有CSV文件（包括子文件夹）
     
@@ -90,10 +1486,35 @@ def process_folder(input_folder, output_folder=None, output_suffix="", add_prefi
         output_suffix (str): 输出文件名后缀（默认为空）
         add_prefix (bool): 是否在Term字段前添加文件名前缀
         recursive (bool): 是否递归处理子文件夹（默认为True）
+        jobs (int): 工作进程数，0 表示使用全部CPU核心（默认为1）
+        incremental (bool): 跳过自上次运行以来未改变的文件，由输出文件夹中的清单记录
+        languages (list): 用作 Translation 的输入列名，每个语言写入输出文件夹下各自的子文件夹
+            （可选，默认只转换 English）
+        merge (bool): 将所有文件合并为一个按 Term 排序、去重的表，而不是每个文件一个表
+        shard_rows (int): 每个合并表的最大行数，0 表示只写入一个表
+        zip_file (str): 将转换后的表作为此压缩包中的条目写入，而不是单独的文件，每个语言一个压缩包（可选）
+        compression (str): "stored" 或 0 到 9 的 deflate 压缩级别，与 zip_file 一起使用
+        csv_files (list): 要转换的输入CSV文件，代替搜索输入文件夹，由 --watch 使用（可选）
     """
     
     input_path = Path(input_folder)
     
+    if languages and output_folder is None and zip_file is None:
+        print("错误：使用 --languages 时必须指定输出文件夹")
+        return
+    
+    if merge and output_folder is None and zip_file is None:
+        print("错误：使用 --merge 时必须指定输出文件夹")
+        return
+    
+    if merge and incremental:
+        print("错误：--merge 不能与 --incremental 同时使用")
+        return
+    
+    if zip_file is not None and incremental:
+        print("错误：--zip 不能与 --incremental 同时使用")
+        return
+    
     # 检查输入文件夹是否存在
     if not input_path.exists():
         print(f"错误：输入文件夹 {input_folder} 不存在")
@@ -111,13 +1532,17 @@ def process_folder(input_folder, output_folder=None, output_suffix="", add_prefi
         # 如果输出文件夹不存在，创建它
         output_path.mkdir(parents=True, exist_ok=True)
     
-    # 查找所有CSV文件（递归或非递归）
-    if recursive:
-        csv_files = list(input_path.rglob("*.csv"))  # 递归查找所有子文件夹
-        print(f"递归搜索文件夹 {input_folder} 及其子文件夹...")
-    else:
-        csv_files = list(input_path.glob("*.csv"))   # 只查找当前文件夹
-        print(f"搜索文件夹 {input_folder}...")
+    # 查找所有CSV文件（递归或非递归），除非已给出要转换的文件
+    if csv_files is None:
+        with profile_stage('discover'):
+            if recursive:
+                csv_files = list(input_path.rglob("*.csv"))  # 递归查找所有子文件夹
+            else:
+                csv_files = list(input_path.glob("*.csv"))   # 只查找当前文件夹
+        if recursive:
+            print(f"递归搜索文件夹 {input_folder} 及其子文件夹...")
+        else:
+            print(f"搜索文件夹 {input_folder}...")
     
     if not csv_files:
         search_type = "及其子文件夹" if recursive else ""
@@ -127,52 +1552,598 @@ def process_folder(input_folder, output_folder=None, output_suffix="", add_prefi
     print(f"找到 {len(csv_files)} 个CSV文件，开始处理...")
     if not add_prefix:
         print("注意：已设置不在Term前添加文件名前缀。")
-    print("-" * 50)
+    if languages:
+        print(f"注意：每个语言写入一个输出文件夹: {', '.join(languages)}")
+    
+    if merge:
+        print("注意：将所有文件合并为一个去重的表。")
+        merge_csv_files(csv_files, input_path, output_path, output_suffix, add_prefix=add_prefix, jobs=jobs,
+                        languages=languages, shard_rows=shard_rows, zip_file=zip_file, compression=compression)
+        return
+    
+    if zip_file is not None:
+        print(f"注意：将转换后的文件写入 zip 压缩包 {zip_file}。")
+        zip_csv_files(csv_files, input_path, zip_file, output_suffix, add_prefix=add_prefix, jobs=jobs,
+                      languages=languages, compression=compression)
+        return
     
     total_processed = 0
     successful_files = 0
+    tasks = []
+    
+    # 增量模式下加载之前运行的清单
+    manifest = None
+    if incremental:
+        manifest_file = output_path / MANIFEST_FILENAME
+        manifest = load_manifest(manifest_file)
+        options = {'add_prefix': add_prefix, 'output_suffix': output_suffix, 'languages': languages}
+        if FORCE_ENCODING is not None:
+            options['encoding'] = FORCE_ENCODING
+        skipped_files = 0
     
     for csv_file in csv_files:
         # 计算相对路径，用于保持文件夹结构
         relative_path = csv_file.relative_to(input_path)
         
         # 生成输出文件路径，保持原有的文件夹结构
-        if output_folder is None:
-            # 在原位置生成文件
-            output_filename = csv_file.stem + output_suffix + ".csv"
-            output_file = csv_file.parent / output_filename
-        else:
-            # 在指定输出文件夹中保持相同的文件夹结构
-            output_filename = csv_file.stem + output_suffix + ".csv"
-            output_file = output_path / relative_path.parent / output_filename
-            
-            # 确保输出文件夹存在
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_files = get_output_files(csv_file, input_path, None if output_folder is None else output_path,
+                                        output_suffix, languages)
+        
+        # 确保输出文件夹存在
+        if output_folder is not None:
+            for output_file in output_files:
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        # 跳过自上次运行以来未改变的文件，它们仍计入统计
+        state = None
+        if manifest is not None:
+            entry = manifest.get(relative_path.as_posix())
+            with profile_stage('manifest'):
+                state = get_file_state(csv_file, entry)
+            if is_unchanged(entry, state, options, output_files):
+                if entry.get('size') != state['size'] or entry.get('mtime_ns') != state['mtime_ns']:
+                    append_manifest_entry(manifest_file, manifest, {**entry, **state})
+                if entry.get('records', 0) > 0:
+                    total_processed += entry['records']
+                    successful_files += 1
+                skipped_files += 1
+                if PROGRESS is not None:
+                    report_file(relative_path, None)
+                continue
         
-        # 显示相对路径，便于理解文件位置
-        print(f"处理文件: {relative_path}")
+        tasks.append((csv_file, relative_path, output_files, state))
+    
+    if manifest is not None:
+        print(f"注意：跳过 {skipped_files} 个未改变的文件。")
+    
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(tasks))
+    if jobs > 1:
+        print(f"注意：使用 {jobs} 个工作进程。")
+    print("-" * 50)
+    
+    # 并行模式下由工作进程转换文件，结果按输入顺序返回
+    results = convert_files_parallel(tasks, jobs, add_prefix=add_prefix, languages=languages) if jobs > 1 else None
+    
+    if PROGRESS is not None:
+        PROGRESS['total_files'] = len(csv_files)
+    for csv_file, relative_path, output_files, state in tasks:
+        if PROGRESS is None:
+            # 显示相对路径，便于理解文件位置
+            print(f"处理文件: {relative_path}")
+            input_bytes = None
+        else:
+            input_bytes = csv_file.stat().st_size
         
         # 转换文件，传入add_prefix参数
-        record_count = convert_single_csv(csv_file, output_file, add_prefix=add_prefix)
+        if results is None:
+            record_count, console_output, duration = run_file(relative_path, lambda: convert_file(
+                csv_file, output_files, add_prefix=add_prefix, languages=languages))
+        else:
+            record_count, console_output, duration = next(results)
+            if PROGRESS is None:
+                print(console_output, end='')
         
         if record_count > 0:
-            print(f"  ✓ 成功转换 {record_count} 条记录")
-            print(f"  ✓ 输出文件: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
             total_processed += record_count
             successful_files += 1
+        
+        if PROGRESS is not None:
+            report_file(relative_path, record_count, console_output, bytes=input_bytes, duration=duration)
+        elif record_count > 0:
+            print(f"  ✓ 成功转换 {record_count} 条记录")
+            for output_file in output_files:
+                print(f"  ✓ 输出文件: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
         elif record_count == 0:
             print(f"  ⚠ 文件中没有有效数据")
         else:
             print(f"  ✗ 处理失败")
         
-        print()
+        # 在清单中记录已转换的文件，失败的文件会在下次运行时重试
+        if manifest is not None and record_count >= 0:
+            if csv_file in output_files:
+                # 原地转换，记录转换后的内容，避免下次再次转换
+                with profile_stage('manifest'):
+                    state = get_file_state(csv_file)
+            append_manifest_entry(manifest_file, manifest, {
+                'path': relative_path.as_posix(),
+                **state,
+                'options': options,
+                'outputs': [output_file.relative_to(output_path).as_posix() for output_file in output_files],
+                'records': record_count
+            })
+        
+        if PROGRESS is None:
+            print()
+    
+    if manifest is not None:
+        save_manifest(manifest_file, manifest, input_path)
+    
+    print("-" * 50)
+    print_summary(successful_files, len(csv_files), total_processed, skipped_files if manifest is not None else None)
+
+# 连续保存后没有新改动多少秒才开始转换
+WATCH_DEBOUNCE = 0.1
+
+# 无法使用 inotify 时扫描输入文件夹的间隔秒数
+WATCH_POLL_INTERVAL = 0.25
+
+# 列出时修改时间距今少于此秒数的文件夹会在下一次轮询时重新列出，因为与列出处于同一时钟刻度的改动
+# 不会改变文件夹的修改时间
+WATCH_MTIME_GRACE = 2.0
+
+# inotify 事件标志（linux/inotify.h）
+IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x8, 0x40, 0x80, 0x100, 0x200
+IN_Q_OVERFLOW, IN_IGNORED, IN_ONLYDIR, IN_ISDIR = 0x4000, 0x8000, 0x1000000, 0x40000000
+
+# 每个文件夹监视的事件，新文件在写入后关闭时才转换
+INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+
+# inotify 事件头：监视描述符、掩码、cookie 和名称长度
+INOTIFY_EVENT = struct.Struct('iIII')
+
+def is_csv_name(name):
+    """
+    检查文件名是否匹配 *.csv，在不区分大小写的文件系统上不区分大小写
+
+    Args:
+        name (str): 文件名
+
+    Returns:
+        bool: CSV文件返回 True
+    """
+
+    return os.path.normcase(name).endswith('.csv')
+
+def refresh_folder(snapshot, folder, recursive, changes):
+    """
+    重新列出一个文件夹，并记录新增、修改或删除的CSV文件
+
+    快照中没有的子文件夹会被完整扫描，已知的子文件夹不会重新列出。
+
+    Args:
+        snapshot (dict): 文件夹路径 -> {'mtime_ns', 'files': {名称: (mtime_ns, 大小)}, 'folders': 名称集合}，
+            就地更新
+        folder (Path): 文件夹路径
+        recursive (bool): 是否监视子文件夹
+        changes (set): 接收改变的CSV文件路径
+
+    Returns:
+        int: 改变的CSV文件数
+    """
+
+    old = snapshot.get(folder)
+    try:
+        folder_mtime = os.stat(folder).st_mtime_ns
+        with os.scandir(folder) as entries:
+            files = {}
+            folders = set()
+            for entry in entries:
+                if entry.is_dir():
+                    if recursive:
+                        folders.add(entry.name)
+                elif is_csv_name(entry.name) and entry.is_file():
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    except (FileNotFoundError, NotADirectoryError):
+        return forget_folder(snapshot, folder, changes)
+
+    count = 0
+    old_files = old['files'] if old is not None else {}
+    for name in files.keys() | old_files.keys():
+        if files.get(name) != old_files.get(name):
+            changes.add(folder / name)
+            count += 1
+    # 下一次轮询时重新列出，见 WATCH_MTIME_GRACE
+    if time.time_ns() - folder_mtime < WATCH_MTIME_GRACE * 1e9:
+        folder_mtime = None
+    snapshot[folder] = {'mtime_ns': folder_mtime, 'files': files, 'folders': folders}
+
+    old_folders = old['folders'] if old is not None else set()
+    for name in old_folders - folders:
+        count += forget_folder(snapshot, folder / name, changes)
+    for name in folders - old_folders:
+        count += refresh_folder(snapshot, folder / name, recursive, changes)
+    return count
+
+def forget_folder(snapshot, folder, changes):
+    """
+    从快照中移除已删除的文件夹及其子文件夹，并将其中的CSV文件记录为已改变
+
+    Args:
+        snapshot (dict): refresh_folder 生成的快照，就地更新
+        folder (Path): 文件夹路径
+        changes (set): 接收被删除的CSV文件路径
+
+    Returns:
+        int: 被删除的CSV文件数
+    """
+
+    old = snapshot.pop(folder, None)
+    if old is None:
+        return 0
+    changes.update(folder / name for name in old['files'])
+    return len(old['files']) + sum(forget_folder(snapshot, folder / name, changes) for name in old['folders'])
+
+def refresh_file(snapshot, csv_file, changes):
+    """
+    重新读取被监视文件夹中一个文件的状态，如果它被新增、修改或删除则记录下来
+
+    Args:
+        snapshot (dict): refresh_folder 生成的快照，就地更新
+        csv_file (Path): 文件路径
+        changes (set): 文件改变时接收其路径
+
+    Returns:
+        int: 文件改变时为 1，否则为 0
+    """
+
+    folder = snapshot.get(csv_file.parent)
+    if folder is None or not is_csv_name(csv_file.name):
+        return 0
+    try:
+        stat = os.stat(csv_file)
+        state = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        state = None
+    if state == folder['files'].get(csv_file.name):
+        return 0
+    if state is None:
+        del folder['files'][csv_file.name]
+    else:
+        folder['files'][csv_file.name] = state
+    changes.add(csv_file)
+    return 1
+
+def poll_snapshot(snapshot, recursive, changes):
+    """
+    重新检查被监视的文件夹，即无法使用 inotify 时的轮询方式
+
+    只有修改时间改变的文件夹会被重新列出，以找到新增、删除和重命名的文件和文件夹。就地写入的文件
+    不会改变所在文件夹的修改时间，因此其他文件夹中的CSV文件各用一次 stat 检查。
+
+    Args:
+        snapshot (dict): refresh_folder 生成的快照，就地更新
+        recursive (bool): 是否监视子文件夹
+        changes (set): 接收改变的CSV文件路径
+
+    Returns:
+        int: 改变的CSV文件数
+    """
+
+    count = 0
+    for folder in list(snapshot):
+        entry = snapshot.get(folder)
+        if entry is None:
+            # 已在本次轮询中随其父文件夹一起移除
+            continue
+        try:
+            folder_mtime = os.stat(folder).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            count += forget_folder(snapshot, folder, changes)
+            continue
+        if folder_mtime != entry['mtime_ns']:
+            count += refresh_folder(snapshot, folder, recursive, changes)
+        else:
+            for name, state in list(entry['files'].items()):
+                try:
+                    stat = os.stat(os.path.join(folder, name))
+                except FileNotFoundError:
+                    stat = None
+                if stat is None or (stat.st_mtime_ns, stat.st_size) != state:
+                    count += refresh_file(snapshot, folder / name, changes)
+    return count
+
+def open_inotify():
+    """
+    通过C库打开一个 inotify 实例
+
+    Returns:
+        dict: {'libc', 'fd', 'folders': 监视描述符 -> 文件夹路径}，无法使用 inotify 时返回 None
+    """
+
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    return {'libc': libc, 'fd': fd, 'folders': {}}
+
+def update_inotify_watches(watcher, snapshot):
+    """
+    监视快照中的文件夹，并停止监视已删除或移走的文件夹
+
+    Args:
+        watcher (dict): open_inotify 打开的 inotify 实例
+        snapshot (dict): refresh_folder 生成的快照
+
+    Raises:
+        OSError: 无法添加监视，例如达到 inotify 监视数量上限时
+    """
+
+    for wd, folder in list(watcher['folders'].items()):
+        if folder not in snapshot:
+            watcher['libc'].inotify_rm_watch(watcher['fd'], wd)
+            del watcher['folders'][wd]
+
+    watched = set(watcher['folders'].values())
+    for folder in snapshot:
+        if folder in watched:
+            continue
+        wd = watcher['libc'].inotify_add_watch(watcher['fd'], os.fsencode(folder), INOTIFY_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOENT:
+                # 列出后已被删除，其父文件夹会报告删除
+                continue
+            raise OSError(error, os.strerror(error), str(folder))
+        watcher['folders'][wd] = folder
+
+def read_inotify(watcher, snapshot, recursive, timeout, changes):
+    """
+    等待 inotify 事件，并根据事件涉及的文件和文件夹更新快照
+
+    Args:
+        watcher (dict): open_inotify 打开的 inotify 实例
+        snapshot (dict): refresh_folder 生成的快照，就地更新
+        recursive (bool): 是否监视子文件夹
+        timeout (float): 等待第一个事件的秒数
+        changes (set): 接收改变的CSV文件路径
+
+    Returns:
+        int: 改变的CSV文件数
+    """
+
+    if not select.select([watcher['fd']], [], [], timeout)[0]:
+        return 0
+
+    data = b''
+    while True:
+        try:
+            data += os.read(watcher['fd'], 64 * 1024)
+        except BlockingIOError:
+            break
+
+    count = 0
+    offset = 0
+    while offset < len(data):
+        wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+        name = os.fsdecode(data[offset + INOTIFY_EVENT.size:offset + INOTIFY_EVENT.size + length].rstrip(b'\0'))
+        offset += INOTIFY_EVENT.size + length
+        folder = watcher['folders'].get(wd)
+        if mask & IN_Q_OVERFLOW:
+            # 事件被丢弃，改为比较每个文件夹
+            count += poll_snapshot(snapshot, recursive, changes)
+        elif mask & IN_IGNORED:
+            watcher['folders'].pop(wd, None)
+        elif folder is None:
+            continue
+        elif mask & IN_ISDIR:
+            count += refresh_folder(snapshot, folder, recursive, changes)
+        elif not mask & IN_CREATE:
+            # 新文件在写入后关闭时转换，而不是在创建时转换
+            count += refresh_file(snapshot, folder / name, changes)
+
+    update_inotify_watches(watcher, snapshot)
+    return count
+
+def watch_folder(input_folder, output_folder, output_suffix="", add_prefix=True, recursive=True, jobs=1,
+                 incremental=False, languages=None, progress_mode=None):
+    """
+    转换文件夹，然后持续转换新增、修改或删除的CSV文件，直到被中断
+
+    文件夹树保存在内存中，可用时根据 inotify 事件更新，否则每 WATCH_POLL_INTERVAL 秒列出被监视的文件夹。
+    WATCH_DEBOUNCE 秒内没有新改动后才转换这些改动，并删除已删除输入文件的输出文件。
+
+    Args:
+        input_folder (str): 输入文件夹路径
+        output_folder (str): 输出文件夹路径，位于输入文件夹之外
+        output_suffix (str): 输出文件名后缀（默认为空）
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        recursive (bool): 是否递归处理子文件夹（默认为True）
+        jobs (int): 工作进程数，0 表示使用全部CPU核心（默认为1）
+        incremental (bool): 跳过自上次运行以来未改变的文件，由输出文件夹中的清单记录
+        languages (list): 用作 Translation 的输入列名，每个语言写入输出文件夹下各自的子文件夹
+            （可选，默认只转换 English）
+        progress_mode (str): "quiet" 只打印每次转换的摘要，None 打印通常的控制台文本
+    """
+
+    input_path = Path(input_folder)
+    if not input_path.is_dir():
+        print(f"错误：{input_folder} 不是文件夹")
+        return
+
+    # 输入文件夹中的输出文件会被当作改变的输入文件
+    if output_folder is None or Path(output_folder).resolve().is_relative_to(input_path.resolve()):
+        print("错误：--watch 需要一个位于输入文件夹之外的输出文件夹")
+        return
+    output_path = Path(output_folder)
+
+    snapshot = {}
+    refresh_folder(snapshot, input_path, recursive, set())
+    watcher = open_inotify()
+    if watcher is not None:
+        try:
+            update_inotify_watches(watcher, snapshot)
+        except OSError as e:
+            print(f"⚠ 无法使用 inotify 监视（{e}），改为轮询")
+            os.close(watcher['fd'])
+            watcher = None
+
+    with progress_output(progress_mode):
+        process_folder(input_folder, output_folder, output_suffix, add_prefix=add_prefix, recursive=recursive,
+                       jobs=jobs, incremental=incremental, languages=languages)
+    print()
+    if watcher is None:
+        print(f"正在每 {WATCH_POLL_INTERVAL} 秒轮询监视文件夹 {input_folder}，按 Ctrl+C 停止...")
+    else:
+        print(f"正在使用 inotify 监视文件夹 {input_folder}，按 Ctrl+C 停止...")
+
+    changes = set()
+    last_change_time = None
+    try:
+        while True:
+            timeout = WATCH_POLL_INTERVAL if last_change_time is None else WATCH_DEBOUNCE
+            try:
+                if watcher is None:
+                    time.sleep(timeout)
+                    change_count = poll_snapshot(snapshot, recursive, changes)
+                else:
+                    change_count = read_inotify(watcher, snapshot, recursive, timeout, changes)
+            except OSError as e:
+                if watcher is None:
+                    raise
+                print(f"⚠ inotify 失败（{e}），改为轮询")
+                os.close(watcher['fd'])
+                watcher = None
+                change_count = poll_snapshot(snapshot, recursive, changes)
+
+            if change_count:
+                last_change_time = time.perf_counter()
+                continue
+            if not changes or time.perf_counter() - last_change_time < WATCH_DEBOUNCE:
+                continue
+
+            # 转换仍然存在的文件，删除其他文件的输出
+            start_time = time.perf_counter()
+            csv_files = sorted(path for path in changes if path.name in snapshot.get(path.parent, {}).get('files', ()))
+            removed_files = 0
+            print()
+            for csv_file in sorted(changes.difference(csv_files)):
+                for output_file in get_output_files(csv_file, input_path, output_path, output_suffix, languages):
+                    if output_file.exists():
+                        output_file.unlink()
+                        removed_files += 1
+                        if progress_mode is None:
+                            print(f"  ✓ 已删除输出文件: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
+            if csv_files:
+                with progress_output(progress_mode):
+                    process_folder(input_folder, output_folder, output_suffix, add_prefix=add_prefix,
+                                   recursive=recursive, jobs=jobs, incremental=incremental, languages=languages,
+                                   csv_files=csv_files)
+            print(f"已转换 {len(csv_files)} 个改变的文件，删除 {removed_files} 个输出文件，"
+                  f"耗时 {time.perf_counter() - start_time:.3f} 秒")
+            changes = set()
+            last_change_time = None
+    except KeyboardInterrupt:
+        print("已停止监视。")
+    finally:
+        if watcher is not None:
+            os.close(watcher['fd'])
+
+def process_archive(input_archive, output_folder, output_suffix="", add_prefix=True, recursive=True, languages=None):
+    """
+    不解压到磁盘，批量处理 zip 或 tar 压缩包中的所有CSV文件
+
+    成员在读取压缩包的同时进行转换，输出文件保持压缩包中的文件夹结构，与 process_folder 处理文件夹时相同。
+
+    Args:
+        input_archive (str): 输入压缩包路径（.zip、.tar、.tar.gz、.tgz、.tar.bz2、.tar.xz）
+        output_folder (str): 输出文件夹路径
+        output_suffix (str): 输出文件名后缀（默认为空）
+        add_prefix (bool): 是否在Term字段前添加文件名前缀
+        recursive (bool): 是否处理子文件夹中的成员（默认为True）
+        languages (list): 用作 Translation 的输入列名，每个语言写入输出文件夹下各自的子文件夹
+            （可选，默认只转换 English）
+    """
+    
+    input_path = Path(input_archive)
+    
+    if output_folder is None:
+        print("错误：转换压缩包时必须指定输出文件夹")
+        return
+    
+    output_path = Path(output_folder)
+    output_path.mkdir(parents=True, exist_ok=True)
+    
+    if recursive:
+        print(f"递归读取压缩包 {input_archive} 及其子文件夹...")
+    else:
+        print(f"读取压缩包 {input_archive}...")
+    if not add_prefix:
+        print("注意：已设置不在Term前添加文件名前缀。")
+    if languages:
+        print(f"注意：每个语言写入一个输出文件夹: {', '.join(languages)}")
+    print("-" * 50)
+    
+    total_files = 0
+    total_processed = 0
+    successful_files = 0
+    
+    try:
+        for relative_path, member_file in iter_archive_csv_files(input_path, recursive):
+            total_files += 1
+            
+            # 生成输出文件路径，保持压缩包中的文件夹结构
+            output_filename = relative_path.stem + output_suffix + ".csv"
+            if languages:
+                output_files = [output_path / language / relative_path.parent / output_filename for language in languages]
+            else:
+                output_files = [output_path / relative_path.parent / output_filename]
+            for output_file in output_files:
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            if PROGRESS is None:
+                print(f"处理文件: {relative_path}")
+            record_count, console_output, duration = run_file(relative_path, lambda: convert_file(
+                input_path / relative_path, output_files, add_prefix=add_prefix, languages=languages,
+                input_stream=member_file))
+            
+            if record_count > 0:
+                total_processed += record_count
+                successful_files += 1
+            
+            if PROGRESS is not None:
+                report_file(relative_path, record_count, console_output, duration=duration)
+                continue
+            if record_count > 0:
+                print(f"  ✓ 成功转换 {record_count} 条记录")
+                for output_file in output_files:
+                    print(f"  ✓ 输出文件: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
+            elif record_count == 0:
+                print(f"  ⚠ 文件中没有有效数据")
+            else:
+                print(f"  ✗ 处理失败")
+            
+            print()
+    except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+        print(f"读取压缩包 {input_archive} 时发生错误: {e}")
+        return
+    
+    if total_files == 0:
+        search_type = "及其子文件夹" if recursive else ""
+        print(f"在压缩包 {input_archive} {search_type}中没有找到CSV文件")
+        return
     
     print("-" * 50)
-    print(f"批量处理完成！")
-    print(f"成功处理文件: {successful_files}/{len(csv_files)}")
-    print(f"总共转换记录: {total_processed} 条")
+    print_summary(successful_files, total_files, total_processed)
 
-def convert_single_file(input_file, output_file=None, add_prefix=True):
+def convert_single_file(input_file, output_file=None, add_prefix=True, languages=None):
     """
     转换单个文件
     
@@ -180,6 +2151,8 @@ def convert_single_file(input_file, output_file=None, add_prefix=True):
         input_file (str): 输入文件路径
         output_file (str): 输出文件路径（可选）
         add_prefix (bool): 是否在Term字段前添加文件名前缀
+        languages (list): 用作 Translation 的输入列名，每个语言写入名为 <输出文件>_<语言>.csv 的文件
+            （可选，默认只转换 English）
     """
     
     input_path = Path(input_file)
@@ -193,21 +2166,123 @@ def convert_single_file(input_file, output_file=None, add_prefix=True):
     if output_file is None:
         output_file = input_path.parent / f"{input_path.stem}_converted.csv"
     
+    output_file = Path(output_file)
+    if languages:
+        output_files = [output_file.with_name(f"{output_file.stem}_{language}{output_file.suffix}") for language in languages]
+    else:
+        output_files = [output_file]
+    
     print(f"转换文件: {input_file}")
-    print(f"输出文件: {output_file}")
+    for output_file in output_files:
+        print(f"输出文件: {output_file}")
     if not add_prefix:
         print("注意：已设置不在Term前添加文件名前缀。")
     
     # 转换文件
-    record_count = convert_single_csv(input_file, output_file, add_prefix=add_prefix)
+    input_bytes = input_path.stat().st_size
+    record_count, console_output, duration = run_file(input_file, lambda: convert_file(
+        input_file, output_files, add_prefix=add_prefix, languages=languages))
     
-    if record_count > 0:
+    if PROGRESS is not None:
+        report_file(input_path.name, record_count, console_output, bytes=input_bytes, duration=duration)
+        print_summary(1 if record_count > 0 else 0, 1, max(record_count, 0))
+    elif record_count > 0:
         print(f"✓ 成功转换 {record_count} 条记录")
     elif record_count == 0:
         print(f"⚠ 文件中没有有效数据")
     else:
         print(f"✗ 处理失败")
 
+def pop_option(args, name, default=None):
+    """
+    从参数列表中移除带值的选项
+
+    支持 "--name value" 和 "--name=value" 两种写法
+
+    Args:
+        args (list): 参数列表，会被原地修改
+        name (str): 选项名
+        default (str): 选项不存在时返回的值
+
+    Returns:
+        str: 选项值，选项没有值时为 None
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """打印命令行用法"""
+
+    print("多语言CSV格式转换工具")
+    print("将多语言CSV格式转换为术语对照表格式")
+    print()
+    print("使用方法:")
+    print("  转换单个文件:")
+    print("    python script.py <输入文件> [输出文件] [--no-prefix] [--languages 列表] [--force-encoding 编码] [--profile] [--quiet] [--progress 模式]")
+    print("  批量转换文件夹或 zip/tar 压缩包（压缩包需要指定输出文件夹）:")
+    print("    python script.py <输入文件夹> [输出文件夹] [输出后缀] [--no-prefix] [--no-recursive] [--jobs N] [--incremental] [--watch] [--languages 列表] [--merge] [--shard-rows N] [--zip 压缩包] [--compression 级别] [--force-encoding 编码] [--profile] [--quiet] [--progress 模式]")
+    print()
+    print("示例:")
+    print("  python script.py terms.csv")
+    print("  python script.py terms.csv converted_terms.csv")
+    print("  python script.py ./input_folder")
+    print("  python script.py ./input_folder ./output_folder")
+    print("  python script.py ./input_folder ./output_folder _new")
+    print("  python script.py ./dump.tar.gz ./output_folder")
+    print("  python script.py ./input_folder --no-prefix")
+    print("  python script.py ./input_folder --no-recursive")
+    print("  python script.py ./input_folder --no-prefix --no-recursive")
+    print("  python script.py ./input_folder ./output_folder --jobs 8")
+    print("  python script.py ./input_folder ./output_folder --watch")
+    print("  python script.py ./input_folder ./output_folder --incremental")
+    print("  python script.py ./input_folder ./output_folder --languages \"English,Chinese (Simplified),Chinese (Traditional)\"")
+    print("  python script.py ./input_folder ./output_folder --merge --shard-rows 50000")
+    print("  python script.py ./input_folder --zip translations.zip --compression stored")
+    print("  python script.py ./input_folder ./output_folder --profile --profile-output profile.json")
+    print("  python script.py ./input_folder ./output_folder --progress=jsonl > progress.jsonl")
+    print()
+    print("参数说明:")
+    print("  输入文件/文件夹: 要转换的CSV文件，或包含CSV文件的文件夹或 .zip/.tar(.gz/.bz2/.xz) 压缩包路径")
+    print("  输出文件夹: 输出文件夹路径（可选，默认为输入文件夹）")
+    print("  输出后缀: 输出文件名后缀（可选，默认为空）")
+    print("  --no-prefix: (可选标志) 如果使用，将不会在Term前添加文件名前缀")
+    print("  --no-recursive: (可选标志) 如果使用，将不会递归处理子文件夹")
+    print("  --jobs N: (可选) 使用 N 个工作进程转换文件，0 表示使用全部CPU核心（默认为1）")
+    print("  --incremental: (可选标志) 如果使用，将跳过自上次运行以来未改变的文件，记录在输出文件夹的 .convert_manifest.jsonl 中")
+    print("  --watch: (可选标志) 如果使用，将在首次转换后持续转换新增、修改和删除的CSV文件，直到按下 Ctrl+C，")
+    print("           需要一个位于输入文件夹之外的输出文件夹")
+    print("  --languages 列表: (可选) 以逗号分隔的用作 Translation 的输入列，只读取一次输入，")
+    print("                    每个语言写入输出文件夹下各自的子文件夹（默认为 English）")
+    print("  --merge: (可选标志) 如果使用，将所有文件写入输出文件夹中一个按 Term 排序、去重的 merged.csv，")
+    print("           按插件加载顺序，后面的文件优先")
+    print("  --shard-rows N: (可选) 与 --merge 一起使用，将合并表拆分为每个最多 N 行的 merged_001.csv、")
+    print("                  merged_002.csv...（默认为 0，只写入一个表）")
+    print("  --zip 压缩包: (可选) 将转换后的文件按名称序数顺序作为压缩包中的条目写入，而不是单独的文件，")
+    print("               与 --languages 一起使用时每个语言写入一个 压缩包_<语言>.zip")
+    print("  --compression 级别: (可选) 与 --zip 一起使用，\"stored\" 或 0 到 9 的 deflate 压缩级别（默认为 6）")
+    print("  --force-encoding 编码: (可选) 用此编码（例如 cp932 或 utf-16）解码所有输入文件，")
+    print("                         而不是根据字节顺序标记和前 256 KiB 逐个文件检测编码")
+    print("  --profile: (可选标志) 如果使用，将在单个进程中转换，并打印各阶段（discover、decode、parse、transform、")
+    print("             write...）的耗时、跟踪的内存峰值和最慢的文件")
+    print("  --profile-top N: (可选) --profile 列出的最慢文件数（默认为 10）")
+    print("  --profile-output 文件: (可选) 包含 --profile，同时将摘要写入 文件.json，其他扩展名（如 文件.prof）")
+    print("                         则写入 pstats/snakeviz 可读取的 cProfile 转储")
+    print("  --quiet: (可选标志) 如果使用，将只打印最终摘要，失败文件的错误信息写入 stderr")
+    print("  --progress 模式: (可选) \"text\" 打印通常的控制台文本，\"jsonl\" 为每个文件打印一个 JSON 事件（路径、行数、")
+    print("                   字节数、耗时、状态），并打印吞吐量/预计剩余时间事件和摘要事件（默认为 text）")
+    print()
+    print("输入格式: Key,Type,Desc,Japanese,English,Chinese (Simplified),Chinese (Traditional)")
+    print("输出格式: Term,Original,Translation")
+    print()
+
 def main():
     """主函数，处理命令行参数"""
     
@@ -224,45 +2299,133 @@ def main():
         recursive = False
         args.remove("--no-recursive")
 
+    incremental = False
+    if "--incremental" in args:
+        incremental = True
+        args.remove("--incremental")
+
+    jobs = pop_option(args, "--jobs", "1")
+    if jobs is None or not jobs.isdigit():
+        print("错误：--jobs 需要一个非负整数")
+        return
+
+    force_encoding = pop_option(args, "--force-encoding", "")
+    if force_encoding is None:
+        print("错误：--force-encoding 需要一个编码名称")
+        return
+    if force_encoding:
+        try:
+            set_force_encoding(codecs.lookup(force_encoding).name)
+        except LookupError:
+            print(f"错误：未知编码: {force_encoding}")
+            return
+
+    languages = pop_option(args, "--languages", "")
+    if languages is None:
+        print("错误：--languages 需要一个以逗号分隔的列名列表")
+        return
+    languages = [language.strip() for language in languages.split(",") if language.strip()] or None
+
+    merge = False
+    if "--merge" in args:
+        merge = True
+        args.remove("--merge")
+
+    shard_rows = pop_option(args, "--shard-rows", "0")
+    if shard_rows is None or not shard_rows.isdigit():
+        print("错误：--shard-rows 需要一个非负整数")
+        return
+    if int(shard_rows) > 0 and not merge:
+        print("错误：--shard-rows 需要与 --merge 一起使用")
+        return
+
+    zip_file = pop_option(args, "--zip", "")
+    if zip_file is None:
+        print("错误：--zip 需要一个压缩包路径")
+        return
+    zip_file = zip_file or None
+
+    compression = pop_option(args, "--compression", DEFAULT_ZIP_COMPRESSION)
+    if compression not in ZIP_COMPRESSION_LEVELS:
+        print("错误：--compression 需要 \"stored\" 或 0 到 9 的 deflate 压缩级别")
+        return
+
+    profile = False
+    if "--profile" in args:
+        profile = True
+        args.remove("--profile")
+
+    profile_output = pop_option(args, "--profile-output", "")
+    if profile_output is None:
+        print("错误：--profile-output 需要一个文件路径")
+        return
+    profile_output = profile_output or None
+    if profile_output is not None:
+        profile = True
+
+    profile_top = pop_option(args, "--profile-top", str(PROFILE_TOP_FILES))
+    if profile_top is None or not profile_top.isdigit():
+        print("错误：--profile-top 需要一个非负整数")
+        return
+
+    quiet = False
+    if "--quiet" in args:
+        quiet = True
+        args.remove("--quiet")
+
+    progress = pop_option(args, "--progress", "text")
+    if progress not in PROGRESS_MODES:
+        print("错误：--progress 需要 \"text\" 或 \"jsonl\"")
+        return
+    if quiet and progress != "text":
+        print("错误：--quiet 和 --progress=jsonl 不能同时使用")
+        return
+    progress_mode = "quiet" if quiet else None if progress == "text" else progress
+
+    watch = False
+    if "--watch" in args:
+        watch = True
+        args.remove("--watch")
+    if watch and (merge or zip_file is not None or profile or progress == "jsonl"):
+        print("错误：--watch 不能与 --merge、--zip、--profile 或 --progress=jsonl 一起使用")
+        return
+
     if len(args) < 2:
-        print("多语言CSV格式转换工具")
-        print("将多语言CSV格式转换为术语对照表格式")
-        print()
-        print("使用方法:")
-        print("  转换单个文件:")
-        print("    python script.py <输入文件> [输出文件] [--no-prefix]")
-        print("  批量转换文件夹:")
-        print("    python script.py <输入文件夹> [输出文件夹] [输出后缀] [--no-prefix] [--no-recursive]")
-        print()
-        print("示例:")
-        print("  python script.py terms.csv")
-        print("  python script.py terms.csv converted_terms.csv")
-        print("  python script.py ./input_folder")
-        print("  python script.py ./input_folder ./output_folder")
-        print("  python script.py ./input_folder ./output_folder _new")
-        print("  python script.py ./input_folder --no-prefix")
-        print("  python script.py ./input_folder --no-recursive")
-        print("  python script.py ./input_folder --no-prefix --no-recursive")
-        print()
-        print("参数说明:")
-        print("  输入文件/文件夹: 要转换的CSV文件或包含CSV文件的文件夹路径")
-        print("  输出文件夹: 输出文件夹路径（可选，默认为输入文件夹）")
-        print("  输出后缀: 输出文件名后缀（可选，默认为空）")
-        print("  --no-prefix: (可选标志) 如果使用，将不会在Term前添加文件名前缀")
-        print("  --no-recursive: (可选标志) 如果使用，将不会递归处理子文件夹")
-        print()
-        print("输入格式: Key,Type,Desc,Japanese,English,Chinese (Simplified),Chinese (Traditional)")
-        print("输出格式: Term,Original,Translation")
-        print()
+        print_usage()
         return
     
+    if profile:
+        # 只在当前进程中收集各阶段耗时
+        if jobs != "1":
+            print("注意：--profile 在单个进程中转换，忽略 --jobs。")
+            jobs = "1"
+        start_profile(use_cprofile=profile_output is not None and not profile_output.lower().endswith('.json'))
+    
     input_path = Path(args[1])
     
-    # 判断是文件还是文件夹
-    if input_path.is_file():
+    # 判断是压缩包、文件还是文件夹
+    if input_path.is_file() and is_archive(input_path):
+        # 压缩包批量处理
+        if incremental or watch or merge or zip_file is not None or jobs != "1":
+            print("错误：转换压缩包时不支持 --incremental、--watch、--jobs、--merge 和 --zip")
+            return
+        output_folder = args[2] if len(args) > 2 else None
+        output_suffix = args[3] if len(args) > 3 else ""
+        
+        with progress_output(progress_mode):
+            process_archive(args[1], output_folder, output_suffix, add_prefix=add_prefix, recursive=recursive,
+                            languages=languages)
+    elif input_path.is_file():
         # 单文件处理
         output_file = args[2] if len(args) > 2 else None
-        convert_single_file(args[1], output_file, add_prefix=add_prefix)
+        if zip_file is not None:
+            print("错误：--zip 仅支持转换文件夹")
+            return
+        if watch:
+            print("错误：--watch 仅支持转换文件夹")
+            return
+        with progress_output(progress_mode):
+            convert_single_file(args[1], output_file, add_prefix=add_prefix, languages=languages)
     elif input_path.is_dir():
         # 文件夹批量处理
         output_folder = args[2] if len(args) > 2 else None
@@ -271,42 +2434,24 @@ def main():
         if not recursive:
             print("注意：已设置不递归处理子文件夹。")
         
-        process_folder(args[1], output_folder, output_suffix, add_prefix=add_prefix, recursive=recursive)
+        if watch:
+            watch_folder(args[1], output_folder, output_suffix, add_prefix=add_prefix, recursive=recursive,
+                         jobs=int(jobs), incremental=incremental, languages=languages, progress_mode=progress_mode)
+        else:
+            with progress_output(progress_mode):
+                process_folder(args[1], output_folder, output_suffix, add_prefix=add_prefix, recursive=recursive,
+                               jobs=int(jobs), incremental=incremental, languages=languages, merge=merge,
+                               shard_rows=int(shard_rows), zip_file=zip_file, compression=compression)
     else:
         print(f"错误：路径 {args[1]} 不存在")
 
+    if profile:
+        finish_profile(int(profile_top), profile_output)
+
 
 if __name__ == "__main__":
     # 使用命令行参数
     if len(sys.argv) > 1:
         main()
     else:
-        print("多语言CSV格式转换工具")
-        print("将多语言CSV格式转换为术语对照表格式")
-        print()
-        print("使用方法:")
-        print("  转换单个文件:")
-        print("    python script.py <输入文件> [输出文件] [--no-prefix]")
-        print("  批量转换文件夹:")
-        print("    python script.py <输入文件夹> [输出文件夹] [输出后缀] [--no-prefix] [--no-recursive]")
-        print()
-        print("示例:")
-        print("  python script.py terms.csv")
-        print("  python script.py terms.csv converted_terms.csv")
-        print("  python script.py ./input_folder")
-        print("  python script.py ./input_folder ./output_folder")
-        print("  python script.py ./input_folder ./output_folder _new")
-        print("  python script.py ./input_folder --no-prefix")
-        print("  python script.py ./input_folder --no-recursive")
-        print("  python script.py ./input_folder --no-prefix --no-recursive")
-        print()
-        print("参数说明:")
-        print("  输入文件/文件夹: 要转换的CSV文件或包含CSV文件的文件夹路径")
-        print("  输出文件夹: 输出文件夹路径（可选，默认为输入文件夹）")
-        print("  输出后缀: 输出文件名后缀（可选，默认为空）")
-        print("  --no-prefix: (可选标志) 如果使用，将不会在Term前添加文件名前缀")
-        print("  --no-recursive: (可选标志) 如果使用，将不会递归处理子文件夹")
-        print()
-        print("输入格式: Key,Type,Desc,Japanese,English,Chinese (Simplified),Chinese (Traditional)")
-        print("输出格式: Term,Original,Translation")
-        print()
+        print_usage()
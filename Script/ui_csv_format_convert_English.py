@@ -3,84 +3,1496 @@
 # Function: Convert csv file format extracted from official website or I18nEx to the format used by JustAnotherTranslator
 # Author: claude 4 & 90135
 # Creation date: 2025-07-04
-# Version: 2025-08-02_01
+# Version: 2026-10-17_09
 # License: Bsd-3
 
+import codecs
+import contextlib
+import cProfile
 import csv
+import ctypes
+import errno
+import glob
+import hashlib
+import io
+import itertools
+import json
+import operator
 import os
+import select
+import shutil
+import struct
 import sys
-from pathlib import Path
+import tarfile
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
 
-def convert_single_csv(input_file, output_file, add_prefix=True):
+# Output column order of the terminology table
+OUTPUT_FIELDNAMES = ('Term', 'Original', 'Translation')
+
+# Input column used as Translation when no languages are specified
+DEFAULT_TRANSLATION_COLUMN = 'English'
+
+# Profile of the current run, set by --profile; None keeps timing code out of the conversion path
+PROFILE = None
+
+# Number of slowest files listed in the profile summary
+PROFILE_TOP_FILES = 10
+
+def start_profile(use_cprofile=False):
+    """
+    Start collecting per-stage timing, traced memory and per-file times for this run
+
+    Args:
+        use_cprofile (bool): Also run cProfile, for a dump readable by pstats
+    """
+
+    global PROFILE
+    PROFILE = {'stages': {}, 'nested': [], 'files': [], 'start_time': time.perf_counter(), 'cprofile': None}
+    tracemalloc.start()
+    if use_cprofile:
+        PROFILE['cprofile'] = cProfile.Profile()
+        PROFILE['cprofile'].enable()
+
+@contextlib.contextmanager
+def profile_stage(stage):
+    """
+    Time a block as a stage when profiling, the time of stages nested inside it is not counted twice
+
+    Args:
+        stage (str): Stage name
+    """
+
+    if PROFILE is None:
+        yield
+        return
+    PROFILE['nested'].append(0.0)
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start_time
+        PROFILE['stages'][stage] = PROFILE['stages'].get(stage, 0.0) + elapsed - PROFILE['nested'].pop()
+        if PROFILE['nested']:
+            PROFILE['nested'][-1] += elapsed
+
+def profile_iter(stage, iterable):
+    """
+    Wrap an iterable so the time spent producing each item counts towards a stage
+
+    Args:
+        stage (str): Stage name
+        iterable (iterable): Wrapped iterable
+
+    Yields:
+        Items of the iterable
+    """
+
+    iterator = iter(iterable)
+    while True:
+        with profile_stage(stage):
+            item = next(iterator, iterator)
+        if item is iterator:
+            return
+        yield item
+
+def profile_file(file_name, convert, stage='write'):
+    """
+    Convert one file, recording its time and row count when profiling
+
+    Time not spent in the stages entered by the conversion is counted towards stage.
+
+    Args:
+        file_name (str): File name shown in the summary
+        convert (callable): Conversion, returns a record count
+        stage (str): Stage name for the remaining time (defaults to write)
+
+    Returns:
+        Result of convert
+    """
+
+    if PROFILE is None:
+        return convert()
+
+    result = -1
+    start_time = time.perf_counter()
+    try:
+        with profile_stage(stage):
+            result = convert()
+    finally:
+        PROFILE['files'].append((str(file_name), time.perf_counter() - start_time,
+                                 result if result is not None else -1))
+    return result
+
+def finish_profile(top_files=PROFILE_TOP_FILES, output_file=None):
+    """
+    Stop profiling, print the summary and optionally write it to a file
+
+    Args:
+        top_files (int): Number of slowest files to list
+        output_file (str): Write a JSON summary (.json) or a cProfile dump (any other extension) (optional)
+    """
+
+    global PROFILE
+    profile, PROFILE = PROFILE, None
+    if profile['cprofile'] is not None:
+        profile['cprofile'].disable()
+    total_time = time.perf_counter() - profile['start_time']
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stages = dict(profile['stages'])
+    stages['other'] = max(0.0, total_time - sum(stages.values()))
+    slowest_files = sorted(profile['files'], key=lambda file: file[1], reverse=True)[:top_files]
+
+    print()
+    print("=" * 50)
+    print("Profile summary")
+    print(f"  Total time: {total_time:.3f} s, files: {len(profile['files'])}")
+    print(f"  {'Stage':<12}{'Time (s)':>12}{'Share':>9}")
+    for stage, stage_time in stages.items():
+        share = stage_time / total_time if total_time else 0
+        print(f"  {stage:<12}{stage_time:>12.3f}{share:>9.1%}")
+    print(f"  Peak traced memory: {peak_memory / (1024 * 1024):.1f} MB (tracemalloc)")
+    if slowest_files:
+        print(f"  Slowest {len(slowest_files)} files:")
+        for file_name, file_time, rows in slowest_files:
+            rows_text = f"{rows:>10,} rows" if rows >= 0 else f"{'failed':>15}"
+            print(f"    {file_time:>9.3f} s {rows_text}  {file_name}")
+    print("  Note: Timing includes profiling overhead, compare stages rather than absolute times")
+
+    if output_file is None:
+        return
+
+    if output_file.lower().endswith('.json'):
+        with open(output_file, 'w', encoding='utf-8') as outfile:
+            json.dump({
+                'total_time': total_time,
+                'stages': stages,
+                'peak_traced_memory': peak_memory,
+                'slowest_files': [{'file': file_name, 'time': file_time, 'rows': rows}
+                                  for file_name, file_time, rows in slowest_files]
+            }, outfile, ensure_ascii=False, indent=2)
+    elif profile['cprofile'] is not None:
+        profile['cprofile'].dump_stats(output_file)
+    print(f"  Profile written to {output_file}")
+
+# Progress output of the current run, set by --quiet or --progress=jsonl; None prints the usual console text
+PROGRESS = None
+
+# Progress output modes selected with --progress, "text" is the usual console text
+PROGRESS_MODES = ('text', 'jsonl')
+
+# Minimum seconds between throughput events in JSON lines progress mode
+PROGRESS_INTERVAL = 1.0
+
+# Buffer size of the progress writer in bytes
+PROGRESS_BUFFER_SIZE = 64 * 1024
+
+@contextlib.contextmanager
+def progress_output(mode=None):
+    """
+    Write progress through a buffered writer instead of printing console text line by line
+
+    Other console text of the run is kept in memory, and written to stderr if the run ends
+    before its summary so errors are not lost.
+
+    Args:
+        mode (str): "jsonl" writes one JSON event per line, "quiet" writes only the final summary,
+            None prints the usual console text
+    """
+
+    global PROGRESS
+    if mode is None:
+        yield
+        return
+
+    sys.stdout.flush()
+    writer = open(sys.stdout.fileno(), 'w', encoding='utf-8', buffering=PROGRESS_BUFFER_SIZE, closefd=False)
+    start_time = time.perf_counter()
+    PROGRESS = {'mode': mode, 'writer': writer, 'start_time': start_time, 'last_event_time': start_time,
+                'total_files': 0, 'done_files': 0, 'rows': 0, 'summary': False}
+    console_output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(console_output):
+            yield
+    finally:
+        progress, PROGRESS = PROGRESS, None
+        progress['writer'].close()
+        if not progress['summary']:
+            sys.stderr.write(console_output.getvalue())
+
+def write_progress_event(event):
+    """
+    Write one JSON lines event
+
+    Args:
+        event (dict): Event fields
+    """
+
+    PROGRESS['writer'].write(json.dumps(event, ensure_ascii=False) + '\n')
+
+def run_file(file_name, convert, stage='write'):
+    """
+    Convert one file, capturing its console output when progress output is on
+
+    Args:
+        file_name (str): File name shown in the profile summary
+        convert (callable): Conversion, returns a record count
+        stage (str): Profile stage for the time not spent in other stages (defaults to write)
+
+    Returns:
+        tuple: (result of convert, captured console output or None if printed, duration in seconds)
+    """
+
+    start_time = time.perf_counter()
+    if PROGRESS is None:
+        return profile_file(file_name, convert, stage), None, time.perf_counter() - start_time
+
+    console_output = io.StringIO()
+    with contextlib.redirect_stdout(console_output):
+        result = profile_file(file_name, convert, stage)
+    return result, console_output.getvalue(), time.perf_counter() - start_time
+
+def report_file(file_name, record_count, console_output=None, **fields):
+    """
+    Report one converted file in progress mode
+
+    Failed files keep their console output, as the message of the event in JSON lines mode
+    and on stderr in quiet mode.
+
+    Args:
+        file_name (str): File name relative to the input folder
+        record_count (int): Number of converted records, 0 if no valid data, -1 on error, None if skipped
+        console_output (str): Console output of the conversion (optional)
+        **fields: Other event fields such as format, bytes and duration, None values are left out
+    """
+
+    status = ('skipped' if record_count is None else 'ok' if record_count > 0
+              else 'empty' if record_count == 0 else 'failed')
+    PROGRESS['done_files'] += 1
+    PROGRESS['rows'] += max(record_count or 0, 0)
+
+    if PROGRESS['mode'] == 'quiet':
+        if status == 'failed' and console_output:
+            sys.stderr.write(console_output)
+        return
+
+    event = {'event': 'file', 'path': Path(file_name).as_posix(), 'status': status, 'rows': record_count, **fields}
+    event = {key: round(value, 6) if isinstance(value, float) else value
+             for key, value in event.items() if value is not None}
+    if status == 'failed' and console_output:
+        event['message'] = console_output.strip()
+    write_progress_event(event)
+
+    now = time.perf_counter()
+    if now - PROGRESS['last_event_time'] < PROGRESS_INTERVAL:
+        return
+    PROGRESS['last_event_time'] = now
+    elapsed = now - PROGRESS['start_time']
+    done_files, total_files = PROGRESS['done_files'], PROGRESS['total_files']
+    write_progress_event({
+        'event': 'progress',
+        'done_files': done_files,
+        'total_files': total_files,
+        'rows': PROGRESS['rows'],
+        'elapsed': round(elapsed, 3),
+        'files_per_second': round(done_files / elapsed, 1),
+        'rows_per_second': round(PROGRESS['rows'] / elapsed, 1),
+        'eta': round(max(total_files - done_files, 0) * elapsed / done_files, 1) if total_files else None
+    })
+
+def print_summary(successful_files, total_files, total_processed, skipped_files=None):
+    """
+    Print the final summary of a batch, as console text or as a summary event
+
+    Args:
+        successful_files (int): Number of files with converted records
+        total_files (int): Number of input files
+        total_processed (int): Total number of converted records
+        skipped_files (int): Number of unchanged files skipped in incremental mode (optional)
+    """
+
+    lines = [
+        "Batch processing completed!",
+        f"Successfully processed files: {successful_files}/{total_files}",
+        f"Total converted records: {total_processed}"
+    ]
+    if skipped_files is not None:
+        lines.append(f"Skipped unchanged files: {skipped_files}")
+
+    if PROGRESS is None:
+        for line in lines:
+            print(line)
+        return
+
+    PROGRESS['summary'] = True
+    if PROGRESS['mode'] == 'quiet':
+        PROGRESS['writer'].write('\n'.join(lines) + '\n')
+        return
+
+    event = {'event': 'summary', 'successful_files': successful_files, 'total_files': total_files,
+             'records': total_processed, 'elapsed': round(time.perf_counter() - PROGRESS['start_time'], 3)}
+    if skipped_files is not None:
+        event['skipped_files'] = skipped_files
+    write_progress_event(event)
+
+# Encoding of every input file, set by --force-encoding; None detects the encoding of each file
+FORCE_ENCODING = None
+
+# Encodings recognized by their byte order mark
+BOM_ENCODINGS = ((codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF16_LE, 'utf-16'), (codecs.BOM_UTF16_BE, 'utf-16'))
+
+# Encodings tried in order on files without a byte order mark, cp932 is Shift_JIS with the Windows extensions
+DETECT_ENCODINGS = ('utf-8', 'cp932')
+
+# Bytes read from the start of a file to detect its encoding
+ENCODING_SAMPLE_SIZE = 256 * 1024
+
+def set_force_encoding(encoding):
+    """
+    Set the encoding of every input file, also the initializer of worker processes
+
+    Args:
+        encoding (str): Codec name, None detects the encoding of each file
+    """
+
+    global FORCE_ENCODING
+    FORCE_ENCODING = encoding
+
+def detect_encoding(input_stream):
+    """
+    Detect the encoding of a binary stream from its byte order mark or the start of its content
+
+    Without a byte order mark, the sample is fed to an incremental decoder of each encoding of
+    DETECT_ENCODINGS, so a character cut at the end of the sample is not an error.
+
+    Args:
+        input_stream (file): Binary stream, ENCODING_SAMPLE_SIZE bytes are read from its current position
+
+    Returns:
+        str: Codec name, None if no encoding decodes the sample
+    """
+
+    sample = input_stream.read(ENCODING_SAMPLE_SIZE)
+    for bom, encoding in BOM_ENCODINGS:
+        if sample.startswith(bom):
+            return encoding
+
+    for encoding in DETECT_ENCODINGS:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(sample, final=len(sample) < ENCODING_SAMPLE_SIZE)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    return None
+
+def open_input(input_file, input_stream=None):
+    """
+    Open an input CSV file as text, or wrap an already open binary stream such as an archive member
+
+    The encoding is FORCE_ENCODING or detected by detect_encoding, the text is decoded in chunks
+    while it is read, so the file is never loaded whole.
+
+    Args:
+        input_file (str): Input CSV file path
+        input_stream (file): Seekable binary stream of the input file (optional)
+
+    Returns:
+        file: Text stream
+
+    Raises:
+        ValueError: The encoding cannot be detected
+    """
+
+    binary_stream = open(input_file, 'rb') if input_stream is None else input_stream
+    try:
+        encoding = FORCE_ENCODING
+        if encoding is None:
+            with profile_stage('encoding'):
+                start = binary_stream.tell()
+                encoding = detect_encoding(binary_stream)
+                binary_stream.seek(start)
+            if encoding is None:
+                raise ValueError(f"Cannot detect the encoding (tried {', '.join(DETECT_ENCODINGS)}), "
+                                 f"set it with --force-encoding")
+            if encoding not in ('utf-8', 'utf-8-sig'):
+                print(f"  Detected encoding: {encoding}")
+        return io.TextIOWrapper(binary_stream, encoding=encoding)
+    except BaseException:
+        if input_stream is None:
+            binary_stream.close()
+        raise
+
+def iter_csv_records(lines):
+    """
+    Split CSV lines into records, the same records as csv.reader without the blank lines csv.DictReader skips
+
+    A line without quotes is split on commas directly. A line with a quote is handed to the csv
+    module, which reads further lines from the same iterator when a quoted field spans lines.
+    Both paths reject a field longer than csv.field_size_limit() with the same csv.Error.
+
+    Args:
+        lines (iterator): Lines of text ending in '\n', as read from a text file with universal newlines
+
+    Yields:
+        list: Fields of one record
+    """
+
+    field_limit = csv.field_size_limit()
+    for line in lines:
+        if '"' in line:
+            yield next(csv.reader(itertools.chain((line,), lines)))
+        elif line != '\n':
+            fields = line.rstrip('\n').split(',')
+            if len(line) > field_limit and any(len(field) > field_limit for field in fields):
+                raise csv.Error(f"field larger than field limit ({field_limit})")
+            yield fields
+
+def read_term_rows(input_file, add_prefix=True, translation_columns=(DEFAULT_TRANSLATION_COLUMN,), input_stream=None):
+    """
+    Read and transform multilingual CSV rows one at a time
+
+    Rows are the same as reading the file with csv.DictReader, but column indexes are looked up once
+    from the header and no dict is built per row.
+
+    Args:
+        input_file (str): Input CSV file path
+        add_prefix (bool): Whether to add filename prefix to Term field
+        translation_columns (tuple): Input columns used as Translation, one per output table
+        input_stream (file): Binary stream to read instead of opening input_file (optional)
+
+    Yields:
+        tuple: (Term, Original, Translation...) with one Translation per translation column
+    """
+
+    # Get filename (without extension) for prefix, Term format depends on add_prefix parameter
+    file_prefix = Path(input_file).stem
+    term_prefix = f"{file_prefix}/" if add_prefix else ""
+
+    with open_input(input_file, input_stream) as infile:
+        lines = infile if PROFILE is None else profile_iter('decode', infile)
+        fieldnames = next(csv.reader(lines), None)
+        if fieldnames is None:
+            return
+
+        # A repeated column name takes the value of its last column, like csv.DictReader
+        width = len(fieldnames)
+        column_indexes = {}
+        for index, column in enumerate(fieldnames):
+            column_indexes[column] = index
+
+        # Extract key information, handle possible BOM characters
+        key_field = 'Key'
+        if key_field not in column_indexes:
+            # Find column name containing 'Key' (may have BOM prefix)
+            key_field = next((column for column in column_indexes if column.endswith('Key')), None)
+
+        # Columns missing from the header point after the last column, at an empty value
+        key_index = column_indexes.get(key_field, width)
+        value_indexes = [column_indexes.get(column, width) for column in ('Japanese', *translation_columns)]
+        get_values = operator.itemgetter(*value_indexes)
+        complete = key_index < width and width not in value_indexes
+        missing_values = [None] * width
+
+        records = iter_csv_records(lines)
+        if PROFILE is not None:
+            records = profile_iter('parse', records)
+
+        for record in records:
+            if not complete or len(record) < width:
+                # Fields missing from a short row are None, like csv.DictReader
+                record = record[:width] + missing_values[len(record):] + ['']
+
+            key = record[key_index]
+
+            # Skip empty rows or invalid data
+            if not key:
+                continue
+
+            yield (term_prefix + key, *get_values(record))
+
+def write_csv_rows(output_file, fieldnames, rows):
+    """
+    Write rows to output file as soon as they are produced
+
+    Rows go to a temporary file next to the output file, which replaces the output
+    file only after the input has been fully read. Converting in place (output file
+    is the input file) therefore stays safe, and a failed run leaves no half-written output.
+
+    Args:
+        output_file (str): Output CSV file path
+        fieldnames (tuple): Header row, only written when there is at least one row
+        rows (iterable): Row tuples
+
+    Returns:
+        int: Number of rows written
+    """
+
+    output_file = Path(output_file)
+    temp_file = output_file.with_name(output_file.name + '.tmp')
+    row_count = 0
+
+    try:
+        with open(temp_file, 'w', encoding='utf-8-sig', newline='') as outfile:
+            writer = csv.writer(outfile)
+            for row in rows:
+                if row_count == 0:
+                    writer.writerow(fieldnames)
+                writer.writerow(row)
+                row_count += 1
+        os.replace(temp_file, output_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+    return row_count
+
+def write_term_tables(output_files, rows):
+    """
+    Write one terminology table per translation column in a single pass over the rows
+
+    Like write_csv_rows, each table goes to a temporary file that replaces the output file at the end.
+
+    Args:
+        output_files (list): Output CSV file path per translation column
+        rows (iterable): (Term, Original, Translation...) tuples, one Translation per output file
+
+    Returns:
+        int: Number of rows written to each file
+    """
+
+    output_files = [Path(output_file) for output_file in output_files]
+    temp_files = [output_file.with_name(output_file.name + '.tmp') for output_file in output_files]
+    row_count = 0
+
+    try:
+        with contextlib.ExitStack() as stack:
+            writers = [csv.writer(stack.enter_context(open(temp_file, 'w', encoding='utf-8-sig', newline='')))
+                       for temp_file in temp_files]
+            for term, original, *translations in rows:
+                for writer, translation in zip(writers, translations):
+                    if row_count == 0:
+                        writer.writerow(OUTPUT_FIELDNAMES)
+                    writer.writerow((term, original, translation))
+                row_count += 1
+        for temp_file, output_file in zip(temp_files, output_files):
+            os.replace(temp_file, output_file)
+    except BaseException:
+        for temp_file in temp_files:
+            temp_file.unlink(missing_ok=True)
+        raise
+
+    return row_count
+
+def convert_single_csv(input_file, output_file, add_prefix=True, input_stream=None):
+    """
+    Convert single multilingual CSV format to simplified terminology table format
+    
+    Input format: Key,Type,Desc,Japanese,English,Chinese (Simplified),Chinese (Traditional)
+    or: Key,Type,Desc,Japanese,English
+    Output format: Term,Original,Translation
+    
+    Args:
+        input_file (str): Input CSV file path
+        output_file (str): Output CSV file path
+        add_prefix (bool): Whether to add filename prefix to Term field
+        input_stream (file): Binary stream to read instead of opening input_file (optional)
+
+    Returns:
+        int: Number of converted records, 0 if no valid data, -1 on error
+    """
+    
+    try:
+        # Rows are streamed from input to output, memory use does not grow with file size
+        rows = read_term_rows(input_file, add_prefix=add_prefix, input_stream=input_stream)
+        if PROFILE is not None:
+            rows = profile_iter('transform', rows)
+        return write_csv_rows(output_file, OUTPUT_FIELDNAMES, rows)
+                
+    except UnicodeDecodeError as e:
+        print(f"Error processing file {input_file}: not valid {e.encoding} ({e.reason}), set the encoding with --force-encoding")
+        return -1
+
+    except Exception as e:
+        print(f"Error processing file {input_file}: {e}")
+        return -1
+
+def convert_multilingual_csv(input_file, output_files, languages, add_prefix=True, input_stream=None):
+    """
+    Convert single multilingual CSV to one terminology table per target language in one read
+
+    Each table is the same as converting the file with that language column as Translation.
+
+    Args:
+        input_file (str): Input CSV file path
+        output_files (list): Output CSV file path per language
+        languages (list): Input column names used as Translation, e.g. 'Chinese (Simplified)'
+        add_prefix (bool): Whether to add filename prefix to Term field
+        input_stream (file): Binary stream to read instead of opening input_file (optional)
+
+    Returns:
+        int: Number of converted records per table, 0 if no valid data, -1 on error
+    """
+
+    try:
+        rows = read_term_rows(input_file, add_prefix=add_prefix, translation_columns=tuple(languages),
+                              input_stream=input_stream)
+        if PROFILE is not None:
+            rows = profile_iter('transform', rows)
+        return write_term_tables(output_files, rows)
+
+    except UnicodeDecodeError as e:
+        print(f"Error processing file {input_file}: not valid {e.encoding} ({e.reason}), set the encoding with --force-encoding")
+        return -1
+
+    except Exception as e:
+        print(f"Error processing file {input_file}: {e}")
+        return -1
+
+def convert_file(input_file, output_files, add_prefix=True, languages=None, input_stream=None):
+    """
+    Convert single file to one output file, or to one output file per language
+
+    Args:
+        input_file (str): Input CSV file path
+        output_files (list): Output CSV file paths, one per language or a single file
+        add_prefix (bool): Whether to add filename prefix to Term field
+        languages (list): Input column names used as Translation (optional, defaults to English only)
+        input_stream (file): Binary stream to read instead of opening input_file (optional)
+
+    Returns:
+        int: Number of converted records, 0 if no valid data, -1 on error
+    """
+
+    if languages:
+        return convert_multilingual_csv(input_file, output_files, languages, add_prefix=add_prefix,
+                                        input_stream=input_stream)
+    return convert_single_csv(input_file, output_files[0], add_prefix=add_prefix, input_stream=input_stream)
+
+# Archive types accepted as input in place of a folder
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+
+def is_archive(input_path):
+    """
+    Check whether a path names a supported zip or tar archive
+
+    Args:
+        input_path (Path): Input path
+
+    Returns:
+        bool: True for .zip and .tar(.gz/.bz2/.xz) files
+    """
+
+    return input_path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+def is_member_path_unsafe(member_name):
+    """
+    Check an archive member name the same way as FileTool.IsZipPathUnsafe in the plugin
+
+    Rejects empty names, parent folder references and absolute or rooted paths.
+
+    Args:
+        member_name (str): Member name in the archive
+
+    Returns:
+        bool: True if the member must not be used
+    """
+
+    if not member_name:
+        return True
+
+    # Unify path separators
+    normalized_path = member_name.replace('\\', '/')
+
+    # Reject "../"
+    if '../' in normalized_path:
+        return True
+
+    # Reject absolute paths, including Windows drive paths
+    if normalized_path.startswith('/') or normalized_path[1:2] == ':':
+        return True
+
+    return False
+
+def iter_archive_csv_files(input_archive, recursive=True):
+    """
+    Iterate over the CSV members of a zip or tar archive without extracting it
+
+    Members are opened one at a time in archive order, so compressed tar archives are
+    decompressed in a single forward pass.
+
+    Args:
+        input_archive (Path): Archive path
+        recursive (bool): Whether to include members in subfolders
+
+    Yields:
+        tuple: (relative path of the member, binary stream of the member)
+    """
+
+    def get_relative_path(member_name):
+        if is_member_path_unsafe(member_name):
+            print(f"Skipping unsafe archive member: {member_name}")
+            return None
+        relative_path = PurePosixPath(member_name.replace('\\', '/'))
+        if relative_path.suffix != '.csv' or (not recursive and len(relative_path.parts) > 1):
+            return None
+        return relative_path
+
+    if zipfile.is_zipfile(input_archive):
+        with zipfile.ZipFile(input_archive) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                relative_path = get_relative_path(info.filename)
+                if relative_path is not None:
+                    with archive.open(info) as member_file:
+                        yield relative_path, member_file
+    else:
+        with tarfile.open(input_archive, 'r:*') as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                relative_path = get_relative_path(member.name)
+                if relative_path is not None:
+                    with archive.extractfile(member) as member_file:
+                        yield relative_path, member_file
+
+# Manifest file name for incremental conversion, stored in the output folder
+MANIFEST_FILENAME = ".convert_manifest.jsonl"
+
+def hash_file(input_file):
+    """
+    Calculate SHA-256 hash of file content
+
+    Args:
+        input_file (str): File path
+
+    Returns:
+        str: Hex digest
+    """
+
+    digest = hashlib.sha256()
+    with open(input_file, 'rb') as infile:
+        for chunk in iter(lambda: infile.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def get_file_state(input_file, entry=None):
+    """
+    Get size, mtime and content hash of input file
+
+    The hash is taken from the manifest entry when size and mtime are unchanged,
+    so unchanged files are never read.
+
+    Args:
+        input_file (str): Input file path
+        entry (dict): Manifest entry of the file (optional)
+
+    Returns:
+        dict: {'size', 'mtime_ns', 'sha256'}
+    """
+
+    stat = os.stat(input_file)
+    if entry is not None and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+        sha256 = entry.get('sha256')
+    else:
+        sha256 = hash_file(input_file)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+
+def load_manifest(manifest_file):
+    """
+    Load conversion manifest
+
+    The manifest is a JSON lines journal, later lines override earlier ones for the same path.
+    A line cut off by an interrupted run is ignored.
+
+    Args:
+        manifest_file (Path): Manifest file path
+
+    Returns:
+        dict: Relative input path -> manifest entry
+    """
+
+    manifest = {}
+    if not manifest_file.exists():
+        return manifest
+
+    with open(manifest_file, 'r', encoding='utf-8') as infile:
+        for line in infile:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and 'path' in entry:
+                manifest[entry['path']] = entry
+    return manifest
+
+def append_manifest_entry(manifest_file, manifest, entry):
+    """
+    Record a completed file in the manifest
+
+    The entry is appended to the file immediately, so an interrupted run resumes after the last completed file.
+
+    Args:
+        manifest_file (Path): Manifest file path
+        manifest (dict): Loaded manifest, updated in place
+        entry (dict): Manifest entry
+    """
+
+    manifest[entry['path']] = entry
+    with open(manifest_file, 'a', encoding='utf-8', newline='\n') as outfile:
+        outfile.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+def save_manifest(manifest_file, manifest, input_path):
+    """
+    Rewrite manifest with one line per input file, dropping entries of deleted inputs
+
+    Args:
+        manifest_file (Path): Manifest file path
+        manifest (dict): Loaded manifest
+        input_path (Path): Input folder path
+    """
+
+    temp_file = manifest_file.with_name(manifest_file.name + '.tmp')
+    with open(temp_file, 'w', encoding='utf-8', newline='\n') as outfile:
+        for path in sorted(manifest):
+            if (input_path / path).exists():
+                outfile.write(json.dumps(manifest[path], ensure_ascii=False) + '\n')
+    os.replace(temp_file, manifest_file)
+
+def is_unchanged(entry, state, options, output_files):
+    """
+    Check whether a file can be skipped in incremental mode
+
+    Args:
+        entry (dict): Manifest entry of the file, None if not converted before
+        state (dict): Current file state from get_file_state
+        options (dict): Conversion options of this run
+        output_files (list): Output file paths
+
+    Returns:
+        bool: True if content and options are unchanged and all outputs still exist
+    """
+
+    return (entry is not None and
+            entry.get('sha256') == state['sha256'] and
+            entry.get('options') == options and
+            all(output_file.exists() for output_file in output_files))
+
+def convert_file_task(input_file, output_files, add_prefix=True, languages=None):
+    """
+    Worker process entry, convert one file and capture its console output
+
+    Args:
+        input_file (str): Input CSV file path
+        output_files (list): Output CSV file paths
+        add_prefix (bool): Whether to add filename prefix to Term field
+        languages (list): Input column names used as Translation (optional)
+
+    Returns:
+        tuple: (record_count, console output of the conversion, duration in seconds)
+    """
+
+    start_time = time.perf_counter()
+    console_output = io.StringIO()
+    with contextlib.redirect_stdout(console_output):
+        record_count = convert_file(input_file, output_files, add_prefix=add_prefix, languages=languages)
+    return record_count, console_output.getvalue(), time.perf_counter() - start_time
+
+def convert_files_parallel(tasks, jobs, add_prefix=True, languages=None):
+    """
+    Convert files in a process pool
+
+    Args:
+        tasks (list): (input_file, relative_path, output_files, state) tuples
+        jobs (int): Number of worker processes
+        add_prefix (bool): Whether to add filename prefix to Term field
+        languages (list): Input column names used as Translation (optional)
+
+    Yields:
+        tuple: (record_count, console output of the conversion, duration in seconds), in the same order as tasks
+    """
+
+    executor = ProcessPoolExecutor(max_workers=jobs, initializer=set_force_encoding, initargs=(FORCE_ENCODING,))
+    try:
+        futures = [executor.submit(convert_file_task, csv_file, output_files, add_prefix, languages)
+                   for csv_file, _, output_files, _ in tasks]
+
+        for (csv_file, _, _, _), future in zip(tasks, futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker process itself failed, report it like a conversion error
+                yield -1, f"Error processing file {csv_file}: {e}\n", None
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+# Name of the merged terminology table, shards get a _001, _002... suffix
+MERGED_FILENAME = "merged"
+
+def ordinal_key(text):
+    """
+    Sort key matching .NET StringComparer.Ordinal, which compares UTF-16 code units
+
+    Args:
+        text (str): Text to sort
+
+    Returns:
+        bytes: UTF-16 big-endian encoding of the text
+    """
+
+    return text.encode('utf-16-be', 'surrogatepass')
+
+def loader_order_key(relative_path):
+    """
+    Sort key for the order in which the plugin loads translation files
+
+    The plugin loads the files in the root of the translation folder first, then the files of
+    every subfolder, with folders and files each sorted by ordinal path (FileTool.GetAllTranslationFiles).
+
+    Args:
+        relative_path (Path): File path relative to the translation folder
+
+    Returns:
+        tuple: Sort key
+    """
+
+    folder = relative_path.parent.parts
+    return len(folder) > 0, ordinal_key('\\'.join(folder)), ordinal_key(relative_path.name)
+
+def read_term_file(input_file, add_prefix=True, translation_columns=(DEFAULT_TRANSLATION_COLUMN,), consume=list,
+                   rows=None):
+    """
+    Pass the converted rows of one file to consume as they are read
+
+    consume undoes its work when the rows raise, so a file that fails halfway contributes no rows.
+
+    Args:
+        input_file (str): Input CSV file path
+        add_prefix (bool): Whether to add filename prefix to Term field
+        translation_columns (tuple): Input columns used as Translation
+        consume (callable): Called with an iterator of (Term, Original, Translation...) tuples, returns
+            its result (defaults to list, which collects the rows)
+        rows (list): Rows already read by a worker process, consumed instead of reading input_file (optional)
+
+    Returns:
+        Result of consume, None on error
+    """
+
+    try:
+        if rows is None:
+            rows = read_term_rows(input_file, add_prefix=add_prefix, translation_columns=translation_columns)
+            if PROFILE is not None:
+                rows = profile_iter('transform', rows)
+        return consume(iter(rows))
+
+    except UnicodeDecodeError as e:
+        print(f"Error processing file {input_file}: not valid {e.encoding} ({e.reason}), set the encoding with --force-encoding")
+        return None
+
+    except Exception as e:
+        print(f"Error processing file {input_file}: {e}")
+        return None
+
+def read_file_task(input_file, add_prefix=True, translation_columns=(DEFAULT_TRANSLATION_COLUMN,)):
+    """
+    Worker process entry, read one file and capture its console output
+
+    Args:
+        input_file (str): Input CSV file path
+        add_prefix (bool): Whether to add filename prefix to Term field
+        translation_columns (tuple): Input columns used as Translation
+
+    Returns:
+        tuple: (rows or None on error, console output of the read, duration in seconds)
+    """
+
+    start_time = time.perf_counter()
+    console_output = io.StringIO()
+    with contextlib.redirect_stdout(console_output):
+        rows = read_term_file(input_file, add_prefix=add_prefix, translation_columns=translation_columns)
+    return rows, console_output.getvalue(), time.perf_counter() - start_time
+
+def read_files_parallel(csv_files, jobs, add_prefix=True, translation_columns=(DEFAULT_TRANSLATION_COLUMN,)):
+    """
+    Read files in a process pool
+
+    Args:
+        csv_files (list): Input CSV file paths
+        jobs (int): Number of worker processes
+        add_prefix (bool): Whether to add filename prefix to Term field
+        translation_columns (tuple): Input columns used as Translation
+
+    Yields:
+        tuple: (rows or None on error, console output of the read, duration in seconds), in the same order as csv_files
+    """
+
+    executor = ProcessPoolExecutor(max_workers=jobs, initializer=set_force_encoding, initargs=(FORCE_ENCODING,))
+    try:
+        futures = [executor.submit(read_file_task, csv_file, add_prefix, translation_columns)
+                   for csv_file in csv_files]
+
+        for csv_file, future in zip(csv_files, futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker process itself failed, report it like a read error
+                yield None, f"Error processing file {csv_file}: {e}\n", None
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+def read_term_files(csv_files, input_path, consume, jobs=1, add_prefix=True,
+                    translation_columns=(DEFAULT_TRANSLATION_COLUMN,)):
+    """
+    Stream converted rows of files into consume one file at a time, printing progress
+
+    In a single process each file is consumed as it is read. Worker processes hand back the rows
+    of a whole file, which are consumed in the main process.
+
+    Args:
+        csv_files (list): Input CSV file paths, in the order they are yielded
+        input_path (Path): Input folder path
+        consume (callable): Called with an iterator of the rows of each file, undoes its work if the
+            iterator raises and returns the number of rows it took
+        jobs (int): Number of worker processes, 0 uses all CPU cores
+        add_prefix (bool): Whether to add filename prefix to Term field
+        translation_columns (tuple): Input columns used as Translation
+
+    Yields:
+        tuple: (input file, number of rows or None on error)
+    """
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(csv_files))
+    if jobs > 1:
+        print(f"Note: Using {jobs} worker processes.")
+    print("-" * 50)
+
+    # In parallel mode, workers read files and results come back in input order
+    results = read_files_parallel(csv_files, jobs, add_prefix=add_prefix,
+                                  translation_columns=translation_columns) if jobs > 1 else None
+
+    if PROGRESS is not None:
+        PROGRESS['total_files'] = len(csv_files)
+    for csv_file in csv_files:
+        relative_path = csv_file.relative_to(input_path)
+        if PROGRESS is None:
+            print(f"Processing file: {relative_path}")
+            input_bytes = None
+        else:
+            input_bytes = csv_file.stat().st_size
+
+        if results is None:
+            record_count, console_output, duration = run_file(relative_path, lambda: read_term_file(
+                csv_file, add_prefix=add_prefix, translation_columns=translation_columns, consume=consume),
+                stage='transform')
+        else:
+            rows, console_output, duration = next(results)
+            record_count = None
+            if rows is not None:
+                # An error of consume is reported like a read error of the worker
+                consume_output = io.StringIO()
+                with contextlib.redirect_stdout(consume_output):
+                    record_count = read_term_file(csv_file, consume=consume, rows=rows)
+                console_output += consume_output.getvalue()
+            if PROGRESS is None:
+                print(console_output, end='')
+
+        if PROGRESS is not None:
+            report_file(relative_path, record_count if record_count is not None else -1, console_output,
+                        bytes=input_bytes, duration=duration)
+
+        yield csv_file, record_count
+
+def get_merged_shards(output_filename, terms, shard_rows=0):
+    """
+    Sort merged terms by Term and split them into shards
+
+    Args:
+        output_filename (str): Merged table file name, shards are named <name>_001.csv, <name>_002.csv...
+        terms (dict): Term -> (Original, Translation)
+        shard_rows (int): Maximum number of rows per shard, 0 gives a single table
+
+    Returns:
+        list: (file name, Terms of the shard) tuples
+    """
+
+    sorted_terms = sorted(terms, key=ordinal_key)
+    if shard_rows <= 0:
+        return [(output_filename, sorted_terms)]
+
+    stem, suffix = os.path.splitext(output_filename)
+    shard_count = max(1, -(-len(sorted_terms) // shard_rows))
+    return [(f"{stem}_{index + 1:03d}{suffix}", sorted_terms[index * shard_rows:(index + 1) * shard_rows])
+            for index in range(shard_count)]
+
+def write_merged_table(output_file, terms, shard_rows=0):
+    """
+    Write merged terms sorted by Term, optionally split into shards
+
+    Merged tables left over from an earlier run with a different shard count are removed,
+    so the plugin does not load stale terms.
+
+    Args:
+        output_file (Path): Merged table path
+        terms (dict): Term -> (Original, Translation)
+        shard_rows (int): Maximum number of rows per shard, 0 writes a single table
+
+    Returns:
+        list: Paths of the written tables
+    """
+
+    written_files = []
+    for shard_filename, shard_terms in get_merged_shards(output_file.name, terms, shard_rows):
+        shard_file = output_file.with_name(shard_filename)
+        write_csv_rows(shard_file, OUTPUT_FIELDNAMES, ((term, *terms[term]) for term in shard_terms))
+        written_files.append(shard_file)
+
+    shard_prefix = output_file.stem + "_"
+    stale_files = [output_file] + [
+        shard_file for shard_file in output_file.parent.glob(glob.escape(shard_prefix) + "*" + output_file.suffix)
+        if shard_file.stem[len(shard_prefix):].isdigit()]
+    for stale_file in stale_files:
+        if stale_file not in written_files:
+            stale_file.unlink(missing_ok=True)
+
+    return written_files
+
+# Zip compression choices, "stored" or a deflate level
+ZIP_COMPRESSION_LEVELS = ('stored',) + tuple(str(level) for level in range(10))
+DEFAULT_ZIP_COMPRESSION = '6'
+
+def get_zip_files(zip_file, languages=None):
+    """
+    Get the archive path per translation column
+
+    Args:
+        zip_file (str): Archive path
+        languages (list): Input column names used as Translation, each written to its own
+            archive named <archive>_<language>.zip (optional)
+
+    Returns:
+        list: Archive paths
+    """
+
+    zip_file = Path(zip_file)
+    if not languages:
+        return [zip_file]
+    return [zip_file.with_name(f"{zip_file.stem}_{language}{zip_file.suffix}") for language in languages]
+
+@contextlib.contextmanager
+def open_zip_archive(zip_file, compression=DEFAULT_ZIP_COMPRESSION):
+    """
+    Open a zip archive for writing entries
+
+    The archive is written next to its final path and replaces it only when complete,
+    so the plugin never loads a half-written archive.
+
+    Args:
+        zip_file (Path): Archive path
+        compression (str): "stored" or a deflate level from 0 to 9
+
+    Yields:
+        zipfile.ZipFile: Archive open for writing
+    """
+
+    temp_file = zip_file.with_name(zip_file.name + '.tmp')
+    if compression == 'stored':
+        compress_type, compress_level = zipfile.ZIP_STORED, None
+    else:
+        compress_type, compress_level = zipfile.ZIP_DEFLATED, int(compression)
+
+    try:
+        with zipfile.ZipFile(temp_file, 'w', compression=compress_type, compresslevel=compress_level) as archive:
+            yield archive
+        os.replace(temp_file, zip_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+def write_zip_entry(archive, entry_name, fieldnames, rows):
+    """
+    Write rows as a CSV entry of a zip archive as soon as they are produced
+
+    Args:
+        archive (zipfile.ZipFile): Archive open for writing
+        entry_name (str): Entry name
+        fieldnames (tuple): Header row
+        rows (iterable): Row tuples
+
+    Returns:
+        int: Number of rows written
+    """
+
+    row_count = 0
+    with archive.open(entry_name, 'w') as entry_file:
+        with io.TextIOWrapper(entry_file, encoding='utf-8-sig', newline='') as outfile:
+            writer = csv.writer(outfile)
+            writer.writerow(fieldnames)
+            for row in rows:
+                writer.writerow(row)
+                row_count += 1
+    return row_count
+
+def copy_zip_entry(archive, entry_name, spool):
+    """
+    Copy a spooled CSV file into a zip archive as an entry
+
+    Args:
+        archive (zipfile.ZipFile): Archive open for writing
+        entry_name (str): Entry name
+        spool (io.TextIOWrapper): Text file over a binary temporary file, holding the whole entry
+    """
+
+    spool.flush()
+    spool.buffer.seek(0)
+    with archive.open(entry_name, 'w') as entry_file:
+        shutil.copyfileobj(spool.buffer, entry_file)
+
+def print_zip_report(zip_file, compression=DEFAULT_ZIP_COMPRESSION):
+    """
+    Print size and compression ratio of every entry in a zip archive
+
+    Args:
+        zip_file (Path): Archive path
+        compression (str): Compression used for the archive
+    """
+
+    with zipfile.ZipFile(zip_file) as archive:
+        entries = archive.infolist()
+
+    print(f"Archive: {zip_file} (compression: {compression})")
+    for info in entries:
+        ratio = info.compress_size / info.file_size if info.file_size else 1
+        print(f"  {info.file_size:>12,} -> {info.compress_size:>12,} bytes ({ratio:6.1%})  {info.filename}")
+    total_size = sum(info.file_size for info in entries)
+    total_compressed = sum(info.compress_size for info in entries)
+    total_ratio = total_compressed / total_size if total_size else 1
+    print(f"  {total_size:>12,} -> {total_compressed:>12,} bytes ({total_ratio:6.1%})  "
+          f"Total of {len(entries)} entries, archive size {zip_file.stat().st_size:,} bytes")
+
+def zip_csv_files(csv_files, input_path, zip_file, output_suffix="", add_prefix=True, jobs=1, languages=None,
+                  compression=DEFAULT_ZIP_COMPRESSION):
+    """
+    Convert CSV files straight into zip archive entries, one archive per language
+
+    Entries keep the folder structure of the input folder and are added in ordinal
+    name order, the order AsyncTranslationLoader.ProcessZipFileInOrder loads them in,
+    so both zip loading modes load them the same way.
+
+    Args:
+        csv_files (list): Input CSV file paths
+        input_path (Path): Input folder path
+        zip_file (str): Archive path
+        output_suffix (str): Output filename suffix
+        add_prefix (bool): Whether to add filename prefix to Term field
+        jobs (int): Number of worker processes, 0 uses all CPU cores
+        languages (list): Input column names used as Translation, each written to its own
+            archive named <archive>_<language>.zip (optional, defaults to English only)
+        compression (str): "stored" or a deflate level from 0 to 9
+    """
+
+    translation_columns = tuple(languages) if languages else (DEFAULT_TRANSLATION_COLUMN,)
+    zip_files = get_zip_files(zip_file, languages)
+
+    def entry_name(csv_file):
+        return csv_file.relative_to(input_path).with_name(csv_file.stem + output_suffix + ".csv").as_posix()
+
+    csv_files = sorted(csv_files, key=lambda csv_file: ordinal_key(entry_name(csv_file)))
+
+    total_processed = 0
+    successful_files = 0
+    spools = []
+
+    def spool_rows(rows):
+        # An entry cannot be taken back out of an archive, so the entries of a file are spooled to
+        # temporary files and only added once the whole file has been read
+        spools.extend(io.TextIOWrapper(tempfile.TemporaryFile(), encoding='utf-8-sig', newline='')
+                      for _ in translation_columns)
+        writers = [csv.writer(spool) for spool in spools]
+        record_count = 0
+        with profile_stage('write'):
+            for writer in writers:
+                writer.writerow(OUTPUT_FIELDNAMES)
+            for term, original, *translations in rows:
+                for writer, translation in zip(writers, translations):
+                    writer.writerow((term, original, translation))
+                record_count += 1
+        return record_count
+
+    try:
+        with contextlib.ExitStack() as stack:
+            archives = [stack.enter_context(open_zip_archive(zip_file, compression)) for zip_file in zip_files]
+
+            for csv_file, record_count in read_term_files(csv_files, input_path, spool_rows, jobs,
+                                                          add_prefix=add_prefix,
+                                                          translation_columns=translation_columns):
+                try:
+                    if record_count:
+                        with profile_stage('write'):
+                            for archive, spool in zip(archives, spools):
+                                copy_zip_entry(archive, entry_name(csv_file), spool)
+                        total_processed += record_count
+                        successful_files += 1
+                finally:
+                    for spool in spools:
+                        spool.close()
+                    spools.clear()
+
+                if PROGRESS is not None:
+                    continue
+                if record_count:
+                    print(f"  ✓ Successfully converted {record_count} records")
+                    print(f"  ✓ Output entry: {entry_name(csv_file)}")
+                elif record_count is not None:
+                    print(f"  ⚠ No valid data in file")
+                else:
+                    print(f"  ✗ Processing failed")
+
+                print()
+    except Exception as e:
+        print(f"Error writing archive {zip_file}: {e}")
+        return
+
+    print("-" * 50)
+    for written_file in zip_files:
+        print_zip_report(written_file, compression)
+    print_summary(successful_files, len(csv_files), total_processed)
+
+def merge_csv_files(csv_files, input_path, output_path, output_suffix="", add_prefix=True, jobs=1, languages=None,
+                    shard_rows=0, zip_file=None, compression=DEFAULT_ZIP_COMPRESSION):
+    """
+    Convert CSV files into one merged, deduplicated terminology table per language
+
+    Files are merged in the order the plugin would load their separately converted outputs,
+    and a later row replaces an earlier row with the same Term, so the merged table loads to
+    the same translations. Rows with an empty Translation are dropped, since the plugin skips
+    them instead of letting them replace an earlier row.
+
+    Args:
+        csv_files (list): Input CSV file paths
+        input_path (Path): Input folder path
+        output_path (Path): Output folder path
+        output_suffix (str): Output filename suffix
+        add_prefix (bool): Whether to add filename prefix to Term field
+        jobs (int): Number of worker processes, 0 uses all CPU cores
+        languages (list): Input column names used as Translation, each merged into its own subfolder
+            of the output folder (optional, defaults to English only)
+        shard_rows (int): Maximum number of rows per merged table, 0 writes a single table
+        zip_file (str): Write the merged tables into this archive instead of the output folder (optional)
+        compression (str): "stored" or a deflate level from 0 to 9, used with zip_file
+    """
+
+    translation_columns = tuple(languages) if languages else (DEFAULT_TRANSLATION_COLUMN,)
+    output_filename = MERGED_FILENAME + output_suffix + ".csv"
+    if zip_file is not None:
+        output_files = get_zip_files(zip_file, languages)
+    elif languages:
+        output_files = [output_path / language / output_filename for language in languages]
+    else:
+        output_files = [output_path / output_filename]
+
+    # Merge in the plugin's load order of the files that would otherwise be written
+    csv_files = sorted(csv_files, key=lambda csv_file: loader_order_key(
+        csv_file.relative_to(input_path).with_name(csv_file.stem + output_suffix + ".csv")))
+
+    merged_terms = [{} for _ in translation_columns]
+    total_processed = 0
+    successful_files = 0
+
+    def merge_rows(rows):
+        # Later files and rows win, like the plugin loading the separate files in order. Rows are
+        # deduplicated per file first, so a file that fails halfway leaves the merged terms untouched
+        file_terms = [{} for _ in translation_columns]
+        record_count = 0
+        with profile_stage('merge'):
+            for term, original, *translations in rows:
+                for terms, translation in zip(file_terms, translations):
+                    if translation:
+                        terms[term] = (original, translation)
+                record_count += 1
+            for terms, new_terms in zip(merged_terms, file_terms):
+                terms.update(new_terms)
+        return record_count
+
+    for csv_file, record_count in read_term_files(csv_files, input_path, merge_rows, jobs, add_prefix=add_prefix,
+                                                  translation_columns=translation_columns):
+        if record_count:
+            total_processed += record_count
+            successful_files += 1
+
+        if PROGRESS is not None:
+            continue
+        if record_count:
+            print(f"  ✓ Successfully converted {record_count} records")
+        elif record_count is not None:
+            print(f"  ⚠ No valid data in file")
+        else:
+            print(f"  ✗ Processing failed")
+
+        print()
+
+    print("-" * 50)
+    for output_file, terms in zip(output_files, merged_terms):
+        try:
+            with profile_stage('write'):
+                if zip_file is not None:
+                    with open_zip_archive(output_file, compression) as archive:
+                        for shard_filename, shard_terms in get_merged_shards(output_filename, terms, shard_rows):
+                            write_zip_entry(archive, shard_filename, OUTPUT_FIELDNAMES,
+                                            ((term, *terms[term]) for term in shard_terms))
+                    written_files = [output_file]
+                else:
+                    output_file.parent.mkdir(parents=True, exist_ok=True)
+                    written_files = write_merged_table(output_file, terms, shard_rows=shard_rows)
+        except Exception as e:
+            print(f"Error writing merged table {output_file}: {e}")
+            continue
+
+        print(f"✓ Merged {len(terms)} unique terms")
+        for written_file in written_files:
+            print(f"  ✓ Output file: {written_file.relative_to(Path.cwd()) if written_file.is_relative_to(Path.cwd()) else written_file}")
+        if zip_file is not None:
+            print_zip_report(output_file, compression)
+
+    print_summary(successful_files, len(csv_files), total_processed)
+
+def get_output_files(csv_file, input_path, output_path=None, output_suffix="", languages=None):
     """
-    Convert single multilingual CSV format to simplified terminology table format
-    
-    Input format: Key,Type,Desc,Japanese,English,Chinese (Simplified),Chinese (Traditional)
-    or: Key,Type,Desc,Japanese,English
-    Output format: Term,Original,Translation
-    
+    Get the output file paths of one input file, maintaining the folder structure of the input folder
+
     Args:
-        input_file (str): Input CSV file path
-        output_file (str): Output CSV file path
-        add_prefix (bool): Whether to add filename prefix to Term field
+        csv_file (Path): Input CSV file path
+        input_path (Path): Input folder path
+        output_path (Path): Output folder path, None writes next to the input file
+        output_suffix (str): Output filename suffix (defaults to empty)
+        languages (list): Input column names used as Translation, each written to its own subfolder (optional)
+
+    Returns:
+        list: Output file paths, one per language
     """
-    
-    try:
-        # Get filename (without extension) for prefix
-        file_prefix = Path(input_file).stem
-        
-        # Use utf-8-sig encoding to handle BOM
-        with open(input_file, 'r', encoding='utf-8-sig') as infile:
-            reader = csv.DictReader(infile)
-            
-            # Prepare output data
-            output_data = []
-            
-            for row_num, row in enumerate(reader, 1):
-                # Extract key information, handle possible BOM characters
-                key_field = 'Key'
-                if key_field not in row:
-                    # Find column name containing 'Key' (may have BOM prefix)
-                    for col_name in row.keys():
-                        if col_name.endswith('Key'):
-                            key_field = col_name
-                            break
-                
-                key = row.get(key_field, '')
-                japanese = row.get('Japanese', '')
-                english = row.get('English', '')
-                
-                # Skip empty rows or invalid data
-                if not key:
-                    continue
-                
-                # Determine Term format based on add_prefix parameter
-                term_value = f"{file_prefix}/{key}" if add_prefix else key
-                
-                # Create new row data
-                new_row = {
-                    'Term': term_value,
-                    'Original': japanese,
-                    'Translation': english
-                }
-                
-                output_data.append(new_row)
-    
-        # Write output file
-        with open(output_file, 'w', encoding='utf-8-sig', newline='') as outfile:
-            if output_data:
-                writer = csv.DictWriter(outfile, fieldnames=['Term', 'Original', 'Translation'])
-                writer.writeheader()
-                writer.writerows(output_data)
-                return len(output_data)
-            else:
-                return 0
-                
-    except Exception as e:
-        print(f"Error processing file {input_file}: {e}")
-        return -1
 
-def process_folder(input_folder, output_folder=None, output_suffix="", add_prefix=True, recursive=True):
+    relative_path = csv_file.relative_to(input_path)
+    output_filename = csv_file.stem + output_suffix + ".csv"
+    if languages:
+        # One output tree per language in specified output folder
+        return [output_path / language / relative_path.parent / output_filename for language in languages]
+    if output_path is None:
+        # Generate file in original location
+        return [csv_file.parent / output_filename]
+    # Maintain same folder structure in specified output folder
+    return [output_path / relative_path.parent / output_filename]
+
+def process_folder(input_folder, output_folder=None, output_suffix="", add_prefix=True, recursive=True, jobs=1,
+                   incremental=False, languages=None, merge=False, shard_rows=0, zip_file=None,
+                   compression=DEFAULT_ZIP_COMPRESSION, csv_files=None):
     """
     Batch process all CSV files in folder (including subfolders)
     
@@ -90,10 +1502,36 @@ def process_folder(input_folder, output_folder=None, output_suffix="", add_prefi
         output_suffix (str): Output filename suffix (defaults to empty)
         add_prefix (bool): Whether to add filename prefix to Term field
         recursive (bool): Whether to recursively process subfolders (defaults to True)
+        jobs (int): Number of worker processes, 0 uses all CPU cores (defaults to 1)
+        incremental (bool): Skip files unchanged since the last run, tracked by a manifest in the output folder
+        languages (list): Input column names used as Translation, each written to its own subfolder
+            of the output folder (optional, defaults to English only)
+        merge (bool): Merge all files into one Term-sorted, deduplicated table instead of one table per file
+        shard_rows (int): Maximum number of rows per merged table, 0 writes a single table
+        zip_file (str): Write the converted tables as entries of this archive instead of loose files,
+            one archive per language (optional)
+        compression (str): "stored" or a deflate level from 0 to 9, used with zip_file
+        csv_files (list): Input CSV files to convert instead of searching the input folder, used by --watch (optional)
     """
     
     input_path = Path(input_folder)
     
+    if languages and output_folder is None and zip_file is None:
+        print("Error: An output folder is required when using --languages")
+        return
+    
+    if merge and output_folder is None and zip_file is None:
+        print("Error: An output folder is required when using --merge")
+        return
+    
+    if merge and incremental:
+        print("Error: --merge cannot be combined with --incremental")
+        return
+    
+    if zip_file is not None and incremental:
+        print("Error: --zip cannot be combined with --incremental")
+        return
+    
     # Check if input folder exists
     if not input_path.exists():
         print(f"Error: Input folder {input_folder} does not exist")
@@ -111,13 +1549,17 @@ def process_folder(input_folder, output_folder=None, output_suffix="", add_prefi
         # Create output folder if it doesn't exist
         output_path.mkdir(parents=True, exist_ok=True)
     
-    # Find all CSV files (recursive or non-recursive)
-    if recursive:
-        csv_files = list(input_path.rglob("*.csv"))  # Recursively search all subfolders
-        print(f"Recursively searching folder {input_folder} and its subfolders...")
-    else:
-        csv_files = list(input_path.glob("*.csv"))   # Only search current folder
-        print(f"Searching folder {input_folder}...")
+    # Find all CSV files (recursive or non-recursive), unless the files to convert are given
+    if csv_files is None:
+        with profile_stage('discover'):
+            if recursive:
+                csv_files = list(input_path.rglob("*.csv"))  # Recursively search all subfolders
+            else:
+                csv_files = list(input_path.glob("*.csv"))   # Only search current folder
+        if recursive:
+            print(f"Recursively searching folder {input_folder} and its subfolders...")
+        else:
+            print(f"Searching folder {input_folder}...")
     
     if not csv_files:
         search_type = "and its subfolders" if recursive else ""
@@ -127,52 +1569,601 @@ def process_folder(input_folder, output_folder=None, output_suffix="", add_prefi
     print(f"Found {len(csv_files)} CSV files, starting processing...")
     if not add_prefix:
         print("Note: Set to not add filename prefix to Term.")
-    print("-" * 50)
+    if languages:
+        print(f"Note: Writing one output folder per language: {', '.join(languages)}")
+    
+    if merge:
+        print("Note: Merging all files into one deduplicated table.")
+        merge_csv_files(csv_files, input_path, output_path, output_suffix, add_prefix=add_prefix, jobs=jobs,
+                        languages=languages, shard_rows=shard_rows, zip_file=zip_file, compression=compression)
+        return
+    
+    if zip_file is not None:
+        print(f"Note: Writing converted files into zip archive {zip_file}.")
+        zip_csv_files(csv_files, input_path, zip_file, output_suffix, add_prefix=add_prefix, jobs=jobs,
+                      languages=languages, compression=compression)
+        return
     
     total_processed = 0
     successful_files = 0
+    tasks = []
+    
+    # Load manifest of previous runs in incremental mode
+    manifest = None
+    if incremental:
+        manifest_file = output_path / MANIFEST_FILENAME
+        manifest = load_manifest(manifest_file)
+        options = {'add_prefix': add_prefix, 'output_suffix': output_suffix, 'languages': languages}
+        if FORCE_ENCODING is not None:
+            options['encoding'] = FORCE_ENCODING
+        skipped_files = 0
     
     for csv_file in csv_files:
         # Calculate relative path to maintain folder structure
         relative_path = csv_file.relative_to(input_path)
         
         # Generate output file path, maintaining original folder structure
-        if output_folder is None:
-            # Generate file in original location
-            output_filename = csv_file.stem + output_suffix + ".csv"
-            output_file = csv_file.parent / output_filename
-        else:
-            # Maintain same folder structure in specified output folder
-            output_filename = csv_file.stem + output_suffix + ".csv"
-            output_file = output_path / relative_path.parent / output_filename
-            
-            # Ensure output folder exists
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_files = get_output_files(csv_file, input_path, None if output_folder is None else output_path,
+                                        output_suffix, languages)
+        
+        # Ensure output folder exists
+        if output_folder is not None:
+            for output_file in output_files:
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Skip files unchanged since the last run, they still count towards the totals
+        state = None
+        if manifest is not None:
+            entry = manifest.get(relative_path.as_posix())
+            with profile_stage('manifest'):
+                state = get_file_state(csv_file, entry)
+            if is_unchanged(entry, state, options, output_files):
+                if entry.get('size') != state['size'] or entry.get('mtime_ns') != state['mtime_ns']:
+                    append_manifest_entry(manifest_file, manifest, {**entry, **state})
+                if entry.get('records', 0) > 0:
+                    total_processed += entry['records']
+                    successful_files += 1
+                skipped_files += 1
+                if PROGRESS is not None:
+                    report_file(relative_path, None)
+                continue
         
-        # Display relative path for easier understanding of file location
-        print(f"Processing file: {relative_path}")
+        tasks.append((csv_file, relative_path, output_files, state))
+    
+    if manifest is not None:
+        print(f"Note: Skipping {skipped_files} unchanged files.")
+    
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(tasks))
+    if jobs > 1:
+        print(f"Note: Using {jobs} worker processes.")
+    print("-" * 50)
+    
+    # In parallel mode, workers convert files and results come back in input order
+    results = convert_files_parallel(tasks, jobs, add_prefix=add_prefix, languages=languages) if jobs > 1 else None
+    
+    if PROGRESS is not None:
+        PROGRESS['total_files'] = len(csv_files)
+    for csv_file, relative_path, output_files, state in tasks:
+        if PROGRESS is None:
+            # Display relative path for easier understanding of file location
+            print(f"Processing file: {relative_path}")
+            input_bytes = None
+        else:
+            input_bytes = csv_file.stat().st_size
         
         # Convert file, pass add_prefix parameter
-        record_count = convert_single_csv(csv_file, output_file, add_prefix=add_prefix)
+        if results is None:
+            record_count, console_output, duration = run_file(relative_path, lambda: convert_file(
+                csv_file, output_files, add_prefix=add_prefix, languages=languages))
+        else:
+            record_count, console_output, duration = next(results)
+            if PROGRESS is None:
+                print(console_output, end='')
         
         if record_count > 0:
-            print(f"  ✓ Successfully converted {record_count} records")
-            print(f"  ✓ Output file: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
             total_processed += record_count
             successful_files += 1
+        
+        if PROGRESS is not None:
+            report_file(relative_path, record_count, console_output, bytes=input_bytes, duration=duration)
+        elif record_count > 0:
+            print(f"  ✓ Successfully converted {record_count} records")
+            for output_file in output_files:
+                print(f"  ✓ Output file: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
         elif record_count == 0:
             print(f"  ⚠ No valid data in file")
         else:
             print(f"  ✗ Processing failed")
         
-        print()
+        # Record converted file in manifest, failed files are retried on the next run
+        if manifest is not None and record_count >= 0:
+            if csv_file in output_files:
+                # Converted in place, record the converted content so it is not converted again
+                with profile_stage('manifest'):
+                    state = get_file_state(csv_file)
+            append_manifest_entry(manifest_file, manifest, {
+                'path': relative_path.as_posix(),
+                **state,
+                'options': options,
+                'outputs': [output_file.relative_to(output_path).as_posix() for output_file in output_files],
+                'records': record_count
+            })
+        
+        if PROGRESS is None:
+            print()
+    
+    if manifest is not None:
+        save_manifest(manifest_file, manifest, input_path)
+    
+    print("-" * 50)
+    print_summary(successful_files, len(csv_files), total_processed, skipped_files if manifest is not None else None)
+
+# Seconds without new changes before a burst of saves is converted
+WATCH_DEBOUNCE = 0.1
+
+# Seconds between scans of the input folder when inotify is not available
+WATCH_POLL_INTERVAL = 0.25
+
+# Folders modified less than this many seconds before they were listed are listed again by the next
+# poll, a change in the same clock tick as the listing would not change their modification time
+WATCH_MTIME_GRACE = 2.0
+
+# inotify event flags (linux/inotify.h)
+IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x8, 0x40, 0x80, 0x100, 0x200
+IN_Q_OVERFLOW, IN_IGNORED, IN_ONLYDIR, IN_ISDIR = 0x4000, 0x8000, 0x1000000, 0x40000000
+
+# Events watched on every folder, new files are converted when closed after writing
+INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+
+# Header of an inotify event: watch descriptor, mask, cookie and name length
+INOTIFY_EVENT = struct.Struct('iIII')
+
+def is_csv_name(name):
+    """
+    Check whether a file name is matched by *.csv, case-insensitively where the file system is
+
+    Args:
+        name (str): File name
+
+    Returns:
+        bool: True for CSV files
+    """
+
+    return os.path.normcase(name).endswith('.csv')
+
+def refresh_folder(snapshot, folder, recursive, changes):
+    """
+    List one folder again and record the CSV files that were added, changed or removed
+
+    Subfolders new to the snapshot are scanned completely, known subfolders are not listed again.
+
+    Args:
+        snapshot (dict): Folder path -> {'mtime_ns', 'files': {name: (mtime_ns, size)}, 'folders': set of names},
+            updated in place
+        folder (Path): Folder path
+        recursive (bool): Whether subfolders are watched
+        changes (set): Receives the paths of changed CSV files
+
+    Returns:
+        int: Number of changed CSV files
+    """
+
+    old = snapshot.get(folder)
+    try:
+        folder_mtime = os.stat(folder).st_mtime_ns
+        with os.scandir(folder) as entries:
+            files = {}
+            folders = set()
+            for entry in entries:
+                if entry.is_dir():
+                    if recursive:
+                        folders.add(entry.name)
+                elif is_csv_name(entry.name) and entry.is_file():
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    except (FileNotFoundError, NotADirectoryError):
+        return forget_folder(snapshot, folder, changes)
+
+    count = 0
+    old_files = old['files'] if old is not None else {}
+    for name in files.keys() | old_files.keys():
+        if files.get(name) != old_files.get(name):
+            changes.add(folder / name)
+            count += 1
+    # Listed again by the next poll, see WATCH_MTIME_GRACE
+    if time.time_ns() - folder_mtime < WATCH_MTIME_GRACE * 1e9:
+        folder_mtime = None
+    snapshot[folder] = {'mtime_ns': folder_mtime, 'files': files, 'folders': folders}
+
+    old_folders = old['folders'] if old is not None else set()
+    for name in old_folders - folders:
+        count += forget_folder(snapshot, folder / name, changes)
+    for name in folders - old_folders:
+        count += refresh_folder(snapshot, folder / name, recursive, changes)
+    return count
+
+def forget_folder(snapshot, folder, changes):
+    """
+    Remove a deleted folder and its subfolders from the snapshot, recording their CSV files as changed
+
+    Args:
+        snapshot (dict): Snapshot from refresh_folder, updated in place
+        folder (Path): Folder path
+        changes (set): Receives the paths of removed CSV files
+
+    Returns:
+        int: Number of removed CSV files
+    """
+
+    old = snapshot.pop(folder, None)
+    if old is None:
+        return 0
+    changes.update(folder / name for name in old['files'])
+    return len(old['files']) + sum(forget_folder(snapshot, folder / name, changes) for name in old['folders'])
+
+def refresh_file(snapshot, csv_file, changes):
+    """
+    Stat one file of a watched folder again and record it if it was added, changed or removed
+
+    Args:
+        snapshot (dict): Snapshot from refresh_folder, updated in place
+        csv_file (Path): File path
+        changes (set): Receives the path if the file changed
+
+    Returns:
+        int: 1 if the file changed, 0 otherwise
+    """
+
+    folder = snapshot.get(csv_file.parent)
+    if folder is None or not is_csv_name(csv_file.name):
+        return 0
+    try:
+        stat = os.stat(csv_file)
+        state = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        state = None
+    if state == folder['files'].get(csv_file.name):
+        return 0
+    if state is None:
+        del folder['files'][csv_file.name]
+    else:
+        folder['files'][csv_file.name] = state
+    changes.add(csv_file)
+    return 1
+
+def poll_snapshot(snapshot, recursive, changes):
+    """
+    Check the watched folders again, the polling fallback where inotify is not available
+
+    Only the folders whose modification time changed are listed again, which finds added, removed and
+    renamed files and folders. A file written in place does not change the modification time of its
+    folder, so the CSV files of the other folders are checked with one stat each.
+
+    Args:
+        snapshot (dict): Snapshot from refresh_folder, updated in place
+        recursive (bool): Whether subfolders are watched
+        changes (set): Receives the paths of changed CSV files
+
+    Returns:
+        int: Number of changed CSV files
+    """
+
+    count = 0
+    for folder in list(snapshot):
+        entry = snapshot.get(folder)
+        if entry is None:
+            # Forgotten with its parent folder during this poll
+            continue
+        try:
+            folder_mtime = os.stat(folder).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            count += forget_folder(snapshot, folder, changes)
+            continue
+        if folder_mtime != entry['mtime_ns']:
+            count += refresh_folder(snapshot, folder, recursive, changes)
+        else:
+            for name, state in list(entry['files'].items()):
+                try:
+                    stat = os.stat(os.path.join(folder, name))
+                except FileNotFoundError:
+                    stat = None
+                if stat is None or (stat.st_mtime_ns, stat.st_size) != state:
+                    count += refresh_file(snapshot, folder / name, changes)
+    return count
+
+def open_inotify():
+    """
+    Open an inotify instance through the C library
+
+    Returns:
+        dict: {'libc', 'fd', 'folders': watch descriptor -> folder path}, None where inotify is not available
+    """
+
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    return {'libc': libc, 'fd': fd, 'folders': {}}
+
+def update_inotify_watches(watcher, snapshot):
+    """
+    Watch the folders of the snapshot, and stop watching folders that were removed or moved away
+
+    Args:
+        watcher (dict): inotify instance from open_inotify
+        snapshot (dict): Snapshot from refresh_folder
+
+    Raises:
+        OSError: A watch cannot be added, e.g. when the inotify watch limit is reached
+    """
+
+    for wd, folder in list(watcher['folders'].items()):
+        if folder not in snapshot:
+            watcher['libc'].inotify_rm_watch(watcher['fd'], wd)
+            del watcher['folders'][wd]
+
+    watched = set(watcher['folders'].values())
+    for folder in snapshot:
+        if folder in watched:
+            continue
+        wd = watcher['libc'].inotify_add_watch(watcher['fd'], os.fsencode(folder), INOTIFY_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOENT:
+                # Removed since it was listed, its parent reports the removal
+                continue
+            raise OSError(error, os.strerror(error), str(folder))
+        watcher['folders'][wd] = folder
+
+def read_inotify(watcher, snapshot, recursive, timeout, changes):
+    """
+    Wait for inotify events and update the snapshot for the files and folders they name
+
+    Args:
+        watcher (dict): inotify instance from open_inotify
+        snapshot (dict): Snapshot from refresh_folder, updated in place
+        recursive (bool): Whether subfolders are watched
+        timeout (float): Seconds to wait for the first event
+        changes (set): Receives the paths of changed CSV files
+
+    Returns:
+        int: Number of changed CSV files
+    """
+
+    if not select.select([watcher['fd']], [], [], timeout)[0]:
+        return 0
+
+    data = b''
+    while True:
+        try:
+            data += os.read(watcher['fd'], 64 * 1024)
+        except BlockingIOError:
+            break
+
+    count = 0
+    offset = 0
+    while offset < len(data):
+        wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+        name = os.fsdecode(data[offset + INOTIFY_EVENT.size:offset + INOTIFY_EVENT.size + length].rstrip(b'\0'))
+        offset += INOTIFY_EVENT.size + length
+        folder = watcher['folders'].get(wd)
+        if mask & IN_Q_OVERFLOW:
+            # Events were dropped, compare every folder instead
+            count += poll_snapshot(snapshot, recursive, changes)
+        elif mask & IN_IGNORED:
+            watcher['folders'].pop(wd, None)
+        elif folder is None:
+            continue
+        elif mask & IN_ISDIR:
+            count += refresh_folder(snapshot, folder, recursive, changes)
+        elif not mask & IN_CREATE:
+            # A new file is converted when it is closed after writing, not when it is created
+            count += refresh_file(snapshot, folder / name, changes)
+
+    update_inotify_watches(watcher, snapshot)
+    return count
+
+def watch_folder(input_folder, output_folder, output_suffix="", add_prefix=True, recursive=True, jobs=1,
+                 incremental=False, languages=None, progress_mode=None):
+    """
+    Convert a folder, then keep converting the CSV files that are added, changed or removed until interrupted
+
+    The folder tree is kept in memory and updated from inotify events where available, otherwise by
+    listing the watched folders every WATCH_POLL_INTERVAL seconds. Changes are converted once no new
+    change came in for WATCH_DEBOUNCE seconds, and the output files of removed inputs are deleted.
+
+    Args:
+        input_folder (str): Input folder path
+        output_folder (str): Output folder path, outside the input folder
+        output_suffix (str): Output filename suffix (defaults to empty)
+        add_prefix (bool): Whether to add filename prefix to Term field
+        recursive (bool): Whether to recursively process subfolders (defaults to True)
+        jobs (int): Number of worker processes, 0 uses all CPU cores (defaults to 1)
+        incremental (bool): Skip files unchanged since the last run, tracked by a manifest in the output folder
+        languages (list): Input column names used as Translation, each written to its own subfolder
+            of the output folder (optional, defaults to English only)
+        progress_mode (str): "quiet" prints only the summary of each conversion, None prints the usual console text
+    """
+
+    input_path = Path(input_folder)
+    if not input_path.is_dir():
+        print(f"Error: {input_folder} is not a folder")
+        return
+
+    # Output files inside the input folder would be picked up as changed inputs
+    if output_folder is None or Path(output_folder).resolve().is_relative_to(input_path.resolve()):
+        print("Error: --watch requires an output folder outside the input folder")
+        return
+    output_path = Path(output_folder)
+
+    snapshot = {}
+    refresh_folder(snapshot, input_path, recursive, set())
+    watcher = open_inotify()
+    if watcher is not None:
+        try:
+            update_inotify_watches(watcher, snapshot)
+        except OSError as e:
+            print(f"⚠ Cannot watch with inotify ({e}), polling instead")
+            os.close(watcher['fd'])
+            watcher = None
+
+    with progress_output(progress_mode):
+        process_folder(input_folder, output_folder, output_suffix, add_prefix=add_prefix, recursive=recursive,
+                       jobs=jobs, incremental=incremental, languages=languages)
+    print()
+    if watcher is None:
+        print(f"Watching folder {input_folder} by polling every {WATCH_POLL_INTERVAL} seconds, press Ctrl+C to stop...")
+    else:
+        print(f"Watching folder {input_folder} with inotify, press Ctrl+C to stop...")
+
+    changes = set()
+    last_change_time = None
+    try:
+        while True:
+            timeout = WATCH_POLL_INTERVAL if last_change_time is None else WATCH_DEBOUNCE
+            try:
+                if watcher is None:
+                    time.sleep(timeout)
+                    change_count = poll_snapshot(snapshot, recursive, changes)
+                else:
+                    change_count = read_inotify(watcher, snapshot, recursive, timeout, changes)
+            except OSError as e:
+                if watcher is None:
+                    raise
+                print(f"⚠ inotify failed ({e}), polling instead")
+                os.close(watcher['fd'])
+                watcher = None
+                change_count = poll_snapshot(snapshot, recursive, changes)
+
+            if change_count:
+                last_change_time = time.perf_counter()
+                continue
+            if not changes or time.perf_counter() - last_change_time < WATCH_DEBOUNCE:
+                continue
+
+            # Convert the files that still exist, remove the outputs of the others
+            start_time = time.perf_counter()
+            csv_files = sorted(path for path in changes if path.name in snapshot.get(path.parent, {}).get('files', ()))
+            removed_files = 0
+            print()
+            for csv_file in sorted(changes.difference(csv_files)):
+                for output_file in get_output_files(csv_file, input_path, output_path, output_suffix, languages):
+                    if output_file.exists():
+                        output_file.unlink()
+                        removed_files += 1
+                        if progress_mode is None:
+                            print(f"  ✓ Removed output file: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
+            if csv_files:
+                with progress_output(progress_mode):
+                    process_folder(input_folder, output_folder, output_suffix, add_prefix=add_prefix,
+                                   recursive=recursive, jobs=jobs, incremental=incremental, languages=languages,
+                                   csv_files=csv_files)
+            print(f"Converted {len(csv_files)} changed files and removed {removed_files} output files "
+                  f"in {time.perf_counter() - start_time:.3f} seconds")
+            changes = set()
+            last_change_time = None
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    finally:
+        if watcher is not None:
+            os.close(watcher['fd'])
+
+def process_archive(input_archive, output_folder, output_suffix="", add_prefix=True, recursive=True, languages=None):
+    """
+    Batch process all CSV files in a zip or tar archive without extracting it to disk
+
+    Members are converted while the archive is read, output files keep the folder structure
+    of the archive like process_folder does for a folder.
+
+    Args:
+        input_archive (str): Input archive path (.zip, .tar, .tar.gz, .tgz, .tar.bz2, .tar.xz)
+        output_folder (str): Output folder path
+        output_suffix (str): Output filename suffix (defaults to empty)
+        add_prefix (bool): Whether to add filename prefix to Term field
+        recursive (bool): Whether to process members in subfolders (defaults to True)
+        languages (list): Input column names used as Translation, each written to its own subfolder
+            of the output folder (optional, defaults to English only)
+    """
+    
+    input_path = Path(input_archive)
+    
+    if output_folder is None:
+        print("Error: An output folder is required when converting an archive")
+        return
+    
+    output_path = Path(output_folder)
+    output_path.mkdir(parents=True, exist_ok=True)
+    
+    if recursive:
+        print(f"Recursively reading archive {input_archive} and its subfolders...")
+    else:
+        print(f"Reading archive {input_archive}...")
+    if not add_prefix:
+        print("Note: Set to not add filename prefix to Term.")
+    if languages:
+        print(f"Note: Writing one output folder per language: {', '.join(languages)}")
+    print("-" * 50)
+    
+    total_files = 0
+    total_processed = 0
+    successful_files = 0
+    
+    try:
+        for relative_path, member_file in iter_archive_csv_files(input_path, recursive):
+            total_files += 1
+            
+            # Generate output file path, maintaining the folder structure of the archive
+            output_filename = relative_path.stem + output_suffix + ".csv"
+            if languages:
+                output_files = [output_path / language / relative_path.parent / output_filename for language in languages]
+            else:
+                output_files = [output_path / relative_path.parent / output_filename]
+            for output_file in output_files:
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            if PROGRESS is None:
+                print(f"Processing file: {relative_path}")
+            record_count, console_output, duration = run_file(relative_path, lambda: convert_file(
+                input_path / relative_path, output_files, add_prefix=add_prefix, languages=languages,
+                input_stream=member_file))
+            
+            if record_count > 0:
+                total_processed += record_count
+                successful_files += 1
+            
+            if PROGRESS is not None:
+                report_file(relative_path, record_count, console_output, duration=duration)
+                continue
+            if record_count > 0:
+                print(f"  ✓ Successfully converted {record_count} records")
+                for output_file in output_files:
+                    print(f"  ✓ Output file: {output_file.relative_to(Path.cwd()) if output_file.is_relative_to(Path.cwd()) else output_file}")
+            elif record_count == 0:
+                print(f"  ⚠ No valid data in file")
+            else:
+                print(f"  ✗ Processing failed")
+            
+            print()
+    except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+        print(f"Error reading archive {input_archive}: {e}")
+        return
+    
+    if total_files == 0:
+        search_type = "and its subfolders" if recursive else ""
+        print(f"No CSV files found in archive {input_archive} {search_type}")
+        return
     
     print("-" * 50)
-    print(f"Batch processing completed!")
-    print(f"Successfully processed files: {successful_files}/{len(csv_files)}")
-    print(f"Total converted records: {total_processed}")
+    print_summary(successful_files, total_files, total_processed)
 
-def convert_single_file(input_file, output_file=None, add_prefix=True):
+def convert_single_file(input_file, output_file=None, add_prefix=True, languages=None):
     """
     Convert single file
     
@@ -180,6 +2171,8 @@ def convert_single_file(input_file, output_file=None, add_prefix=True):
         input_file (str): Input file path
         output_file (str): Output file path (optional)
         add_prefix (bool): Whether to add filename prefix to Term field
+        languages (list): Input column names used as Translation, each written to its own file
+            named <output file>_<language>.csv (optional, defaults to English only)
     """
     
     input_path = Path(input_file)
@@ -193,21 +2186,123 @@ def convert_single_file(input_file, output_file=None, add_prefix=True):
     if output_file is None:
         output_file = input_path.parent / f"{input_path.stem}_converted.csv"
     
+    output_file = Path(output_file)
+    if languages:
+        output_files = [output_file.with_name(f"{output_file.stem}_{language}{output_file.suffix}") for language in languages]
+    else:
+        output_files = [output_file]
+    
     print(f"Converting file: {input_file}")
-    print(f"Output file: {output_file}")
+    for output_file in output_files:
+        print(f"Output file: {output_file}")
     if not add_prefix:
         print("Note: Set to not add filename prefix to Term.")
     
     # Convert file
-    record_count = convert_single_csv(input_file, output_file, add_prefix=add_prefix)
+    input_bytes = input_path.stat().st_size
+    record_count, console_output, duration = run_file(input_file, lambda: convert_file(
+        input_file, output_files, add_prefix=add_prefix, languages=languages))
     
-    if record_count > 0:
+    if PROGRESS is not None:
+        report_file(input_path.name, record_count, console_output, bytes=input_bytes, duration=duration)
+        print_summary(1 if record_count > 0 else 0, 1, max(record_count, 0))
+    elif record_count > 0:
         print(f"✓ Successfully converted {record_count} records")
     elif record_count == 0:
         print(f"⚠ No valid data in file")
     else:
         print(f"✗ Processing failed")
 
+def pop_option(args, name, default=None):
+    """
+    Remove an option with a value from the argument list
+
+    Supports both "--name value" and "--name=value"
+
+    Args:
+        args (list): Argument list, modified in place
+        name (str): Option name
+        default (str): Value returned when the option is not present
+
+    Returns:
+        str: Option value, None if the option has no value
+    """
+
+    for index, arg in enumerate(args):
+        if arg == name:
+            value = args[index + 1] if index + 1 < len(args) else None
+            del args[index:index + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[index]
+            return arg[len(name) + 1:]
+    return default
+
+def print_usage():
+    """Print command line usage"""
+
+    print("Multilingual CSV Format Converter")
+    print("Convert multilingual CSV format to terminology table format")
+    print()
+    print("Usage:")
+    print("  Convert single file:")
+    print("    python script.py <input_file> [output_file] [--no-prefix] [--languages LIST] [--force-encoding NAME] [--profile] [--quiet] [--progress MODE]")
+    print("  Batch convert folder or zip/tar archive (archives require output_folder):")
+    print("    python script.py <input_folder> [output_folder] [output_suffix] [--no-prefix] [--no-recursive] [--jobs N] [--incremental] [--watch] [--languages LIST] [--merge] [--shard-rows N] [--zip ARCHIVE] [--compression LEVEL] [--force-encoding NAME] [--profile] [--quiet] [--progress MODE]")
+    print()
+    print("Examples:")
+    print("  python script.py terms.csv")
+    print("  python script.py terms.csv converted_terms.csv")
+    print("  python script.py ./input_folder")
+    print("  python script.py ./input_folder ./output_folder")
+    print("  python script.py ./input_folder ./output_folder _new")
+    print("  python script.py ./dump.tar.gz ./output_folder")
+    print("  python script.py ./input_folder --no-prefix")
+    print("  python script.py ./input_folder --no-recursive")
+    print("  python script.py ./input_folder --no-prefix --no-recursive")
+    print("  python script.py ./input_folder ./output_folder --jobs 8")
+    print("  python script.py ./input_folder ./output_folder --watch")
+    print("  python script.py ./input_folder ./output_folder --incremental")
+    print("  python script.py ./input_folder ./output_folder --languages \"English,Chinese (Simplified),Chinese (Traditional)\"")
+    print("  python script.py ./input_folder ./output_folder --merge --shard-rows 50000")
+    print("  python script.py ./input_folder --zip translations.zip --compression stored")
+    print("  python script.py ./input_folder ./output_folder --profile --profile-output profile.json")
+    print("  python script.py ./input_folder ./output_folder --progress=jsonl > progress.jsonl")
+    print()
+    print("Parameters:")
+    print("  input_file/folder: CSV file, or folder or .zip/.tar(.gz/.bz2/.xz) archive containing CSV files to convert")
+    print("  output_folder: Output folder path (optional, defaults to input folder)")
+    print("  output_suffix: Output filename suffix (optional, defaults to empty)")
+    print("  --no-prefix: (optional flag) If used, will not add filename prefix to Term")
+    print("  --no-recursive: (optional flag) If used, will not recursively process subfolders")
+    print("  --jobs N: (optional) Convert files in N worker processes, 0 uses all CPU cores (defaults to 1)")
+    print("  --incremental: (optional flag) If used, will skip files unchanged since the last run, tracked in .convert_manifest.jsonl in the output folder")
+    print("  --watch: (optional flag) If used, will keep converting added, changed and removed CSV files after the first run")
+    print("           until Ctrl+C, requires an output folder outside the input folder")
+    print("  --languages LIST: (optional) Comma separated input columns to use as Translation, each language is")
+    print("                    written to its own subfolder of the output folder from a single read (defaults to English)")
+    print("  --merge: (optional flag) If used, will write all files into one Term-sorted, deduplicated merged.csv in the")
+    print("           output folder, later files (in the plugin's load order) win")
+    print("  --shard-rows N: (optional) With --merge, split the merged table into merged_001.csv, merged_002.csv... of")
+    print("                  at most N rows (defaults to 0, a single table)")
+    print("  --zip ARCHIVE: (optional) Write converted files as entries of ARCHIVE in ordinal name order instead of loose")
+    print("                 files, with --languages one ARCHIVE_<language>.zip per language")
+    print("  --compression LEVEL: (optional) With --zip, \"stored\" or a deflate level from 0 to 9 (defaults to 6)")
+    print("  --force-encoding NAME: (optional) Decode every input file with this encoding, such as cp932 or utf-16,")
+    print("                         instead of detecting it per file from the byte order mark and the first 256 KiB")
+    print("  --profile: (optional flag) If used, will print time per stage (discover, decode, parse, transform, write...),")
+    print("             peak traced memory and the slowest files, converting in a single process")
+    print("  --profile-top N: (optional) Number of slowest files listed by --profile (defaults to 10)")
+    print("  --profile-output FILE: (optional) Implies --profile, also write the summary to FILE.json, or a cProfile")
+    print("                         dump readable by pstats/snakeviz for any other extension such as FILE.prof")
+    print("  --quiet: (optional flag) If used, will print only the final summary, errors of failed files go to stderr")
+    print("  --progress MODE: (optional) \"text\" prints the usual console text, \"jsonl\" prints one JSON event per file")
+    print("                   (path, rows, bytes, duration, status), throughput/ETA events and a summary event (defaults to text)")
+    print()
+    print("Input format: Key,Type,Desc,Japanese,English,Chinese (Simplified),Chinese (Traditional)")
+    print("Output format: Term,Original,Translation")
+    print()
+
 def main():
     """Main function to handle command line arguments"""
     
@@ -224,45 +2319,133 @@ def main():
         recursive = False
         args.remove("--no-recursive")
 
+    incremental = False
+    if "--incremental" in args:
+        incremental = True
+        args.remove("--incremental")
+
+    jobs = pop_option(args, "--jobs", "1")
+    if jobs is None or not jobs.isdigit():
+        print("Error: --jobs requires a non-negative integer")
+        return
+
+    force_encoding = pop_option(args, "--force-encoding", "")
+    if force_encoding is None:
+        print("Error: --force-encoding requires an encoding name")
+        return
+    if force_encoding:
+        try:
+            set_force_encoding(codecs.lookup(force_encoding).name)
+        except LookupError:
+            print(f"Error: Unknown encoding: {force_encoding}")
+            return
+
+    languages = pop_option(args, "--languages", "")
+    if languages is None:
+        print("Error: --languages requires a comma separated list of column names")
+        return
+    languages = [language.strip() for language in languages.split(",") if language.strip()] or None
+
+    merge = False
+    if "--merge" in args:
+        merge = True
+        args.remove("--merge")
+
+    shard_rows = pop_option(args, "--shard-rows", "0")
+    if shard_rows is None or not shard_rows.isdigit():
+        print("Error: --shard-rows requires a non-negative integer")
+        return
+    if int(shard_rows) > 0 and not merge:
+        print("Error: --shard-rows requires --merge")
+        return
+
+    zip_file = pop_option(args, "--zip", "")
+    if zip_file is None:
+        print("Error: --zip requires an archive path")
+        return
+    zip_file = zip_file or None
+
+    compression = pop_option(args, "--compression", DEFAULT_ZIP_COMPRESSION)
+    if compression not in ZIP_COMPRESSION_LEVELS:
+        print("Error: --compression requires \"stored\" or a deflate level from 0 to 9")
+        return
+
+    profile = False
+    if "--profile" in args:
+        profile = True
+        args.remove("--profile")
+
+    profile_output = pop_option(args, "--profile-output", "")
+    if profile_output is None:
+        print("Error: --profile-output requires a file path")
+        return
+    profile_output = profile_output or None
+    if profile_output is not None:
+        profile = True
+
+    profile_top = pop_option(args, "--profile-top", str(PROFILE_TOP_FILES))
+    if profile_top is None or not profile_top.isdigit():
+        print("Error: --profile-top requires a non-negative integer")
+        return
+
+    quiet = False
+    if "--quiet" in args:
+        quiet = True
+        args.remove("--quiet")
+
+    progress = pop_option(args, "--progress", "text")
+    if progress not in PROGRESS_MODES:
+        print("Error: --progress requires \"text\" or \"jsonl\"")
+        return
+    if quiet and progress != "text":
+        print("Error: --quiet and --progress=jsonl cannot be used together")
+        return
+    progress_mode = "quiet" if quiet else None if progress == "text" else progress
+
+    watch = False
+    if "--watch" in args:
+        watch = True
+        args.remove("--watch")
+    if watch and (merge or zip_file is not None or profile or progress == "jsonl"):
+        print("Error: --watch cannot be combined with --merge, --zip, --profile or --progress=jsonl")
+        return
+
     if len(args) < 2:
-        print("Multilingual CSV Format Converter")
-        print("Convert multilingual CSV format to terminology table format")
-        print()
-        print("Usage:")
-        print("  Convert single file:")
-        print("    python script.py <input_file> [output_file] [--no-prefix]")
-        print("  Batch convert folder:")
-        print("    python script.py <input_folder> [output_folder] [output_suffix] [--no-prefix] [--no-recursive]")
-        print()
-        print("Examples:")
-        print("  python script.py terms.csv")
-        print("  python script.py terms.csv converted_terms.csv")
-        print("  python script.py ./input_folder")
-        print("  python script.py ./input_folder ./output_folder")
-        print("  python script.py ./input_folder ./output_folder _new")
-        print("  python script.py ./input_folder --no-prefix")
-        print("  python script.py ./input_folder --no-recursive")
-        print("  python script.py ./input_folder --no-prefix --no-recursive")
-        print()
-        print("Parameters:")
-        print("  input_file/folder: CSV file or folder containing CSV files to convert")
-        print("  output_folder: Output folder path (optional, defaults to input folder)")
-        print("  output_suffix: Output filename suffix (optional, defaults to empty)")
-        print("  --no-prefix: (optional flag) If used, will not add filename prefix to Term")
-        print("  --no-recursive: (optional flag) If used, will not recursively process subfolders")
-        print()
-        print("Input format: Key,Type,Desc,Japanese,English,Chinese (Simplified),Chinese (Traditional)")
-        print("Output format: Term,Original,Translation")
-        print()
+        print_usage()
         return
     
+    if profile:
+        # Stage timing is only collected in this process
+        if jobs != "1":
+            print("Note: --profile converts in a single process, --jobs is ignored.")
+            jobs = "1"
+        start_profile(use_cprofile=profile_output is not None and not profile_output.lower().endswith('.json'))
+    
     input_path = Path(args[1])
     
-    # Determine if it's a file or folder
-    if input_path.is_file():
+    # Determine if it's an archive, a file or a folder
+    if input_path.is_file() and is_archive(input_path):
+        # Archive batch processing
+        if incremental or watch or merge or zip_file is not None or jobs != "1":
+            print("Error: --incremental, --watch, --jobs, --merge and --zip are not supported when converting an archive")
+            return
+        output_folder = args[2] if len(args) > 2 else None
+        output_suffix = args[3] if len(args) > 3 else ""
+        
+        with progress_output(progress_mode):
+            process_archive(args[1], output_folder, output_suffix, add_prefix=add_prefix, recursive=recursive,
+                            languages=languages)
+    elif input_path.is_file():
         # Single file processing
         output_file = args[2] if len(args) > 2 else None
-        convert_single_file(args[1], output_file, add_prefix=add_prefix)
+        if zip_file is not None:
+            print("Error: --zip is only supported when converting a folder")
+            return
+        if watch:
+            print("Error: --watch is only supported when converting a folder")
+            return
+        with progress_output(progress_mode):
+            convert_single_file(args[1], output_file, add_prefix=add_prefix, languages=languages)
     elif input_path.is_dir():
         # Folder batch processing
         output_folder = args[2] if len(args) > 2 else None
@@ -271,42 +2454,24 @@ def main():
         if not recursive:
             print("Note: Set to not recursively process subfolders.")
         
-        process_folder(args[1], output_folder, output_suffix, add_prefix=add_prefix, recursive=recursive)
+        if watch:
+            watch_folder(args[1], output_folder, output_suffix, add_prefix=add_prefix, recursive=recursive,
+                         jobs=int(jobs), incremental=incremental, languages=languages, progress_mode=progress_mode)
+        else:
+            with progress_output(progress_mode):
+                process_folder(args[1], output_folder, output_suffix, add_prefix=add_prefix, recursive=recursive,
+                               jobs=int(jobs), incremental=incremental, languages=languages, merge=merge,
+                               shard_rows=int(shard_rows), zip_file=zip_file, compression=compression)
     else:
         print(f"Error: Path {args[1]} does not exist")
 
+    if profile:
+        finish_profile(int(profile_top), profile_output)
+
 
 if __name__ == "__main__":
     # Use command line arguments
     if len(sys.argv) > 1:
         main()
     else:
-        print("Multilingual CSV Format Converter")
-        print("Convert multilingual CSV format to terminology table format")
-        print()
-        print("Usage:")
-        print("  Convert single file:")
-        print("    python script.py <input_file> [output_file] [--no-prefix]")
-        print("  Batch convert folder:")
-        print("    python script.py <input_folder> [output_folder] [output_suffix] [--no-prefix] [--no-recursive]")
-        print()
-        print("Examples:")
-        print("  python script.py terms.csv")
-        print("  python script.py terms.csv converted_terms.csv")
-        print("  python script.py ./input_folder")
-        print("  python script.py ./input_folder ./output_folder")
-        print("  python script.py ./input_folder ./output_folder _new")
-        print("  python script.py ./input_folder --no-prefix")
-        print("  python script.py ./input_folder --no-recursive")
-        print("  python script.py ./input_folder --no-prefix --no-recursive")
-        print()
-        print("Parameters:")
-        print("  input_file/folder: CSV file or folder containing CSV files to convert")
-        print("  output_folder: Output folder path (optional, defaults to input folder)")
-        print("  output_suffix: Output filename suffix (optional, defaults to empty)")
-        print("  --no-prefix: (optional flag) If used, will not add filename prefix to Term")
-        print("  --no-recursive: (optional flag) If used, will not recursively process subfolders")
-        print()
-        print("Input format: Key,Type,Desc,Japanese,English,Chinese (Simplified),Chinese (Traditional)")
-        print("Output format: Term,Original,Translation")
-        print()
\ No newline at end of file
+        print_usage()